@@ -2,9 +2,10 @@ import logging
 import os
 from datetime import datetime
 
-from template import file_template, player_row_template
+from template import file_template
 
 from nba_api.stats.endpoints.commonallplayers import CommonAllPlayers
+from nba_api.stats.library.packed import pack_players
 from nba_api.stats.library.parameters import LeagueID, Season, WnbaSeason
 
 # Configure logging
@@ -79,38 +80,24 @@ def create_players_list(
     return sorted_list
 
 
-def format_player_string(players_list):
-    log.info(f"Formatting {len(players_list)} players into string")
-    players_string = ""
-
-    for player in players_list:
-        player_string = player_row_template.format(
-            id=player[0],
-            last_name=player[1][0],
-            first_name=player[1][1],
-            full_name=player[1][2],
-            is_active=player[1][3],
-        )
-        players_string += player_string + ",\n"
-
-    result = players_string.rstrip(",\n")
-    log.info(f"Generated player string with {len(result)} characters")
-    return result
+def format_player_rows(players_list):
+    log.info(f"Formatting {len(players_list)} players into rows")
+    return [[player_id] + player_data for player_id, player_data in players_list]
 
 
-def write_static_data_file(directory, file_contents) -> str:
+def write_static_data_file(directory, file_contents, file_name="data.py") -> str:
     log.info(f"Writing static data file to directory: {directory}")
 
     if not os.path.exists(directory):
         log.info(f"Creating directory: {directory}")
         os.makedirs(directory)
 
-    file_name = "data.py"
     file_path = os.path.join(os.getcwd(), directory, file_name)
 
     log.info(f"Writing {len(file_contents)} characters to {file_path}")
+    mode = "wb" if isinstance(file_contents, bytes) else "w"
     try:
-        with open(file_path, "w") as f:
+        with open(file_path, mode) as f:
             f.write(file_contents)
         log.info(f"Successfully wrote static data file: {file_path}")
     except Exception as e:
@@ -136,20 +123,19 @@ def generate_static_data_file(directory="static_files"):
             player_adjustments=wnba_player_adjustments,
         )
 
-        log.info("Formatting NBA players string...")
-        players_string = format_player_string(players_list)
-
-        log.info("Formatting WNBA players string...")
-        wnba_players_string = format_player_string(wnba_players_list)
+        log.info("Packing NBA and WNBA players...")
+        players_contents = pack_players(
+            {
+                "players": format_player_rows(players_list),
+                "wnba_players": format_player_rows(wnba_players_list),
+            }
+        )
+        write_static_data_file(directory, players_contents, file_name="players.bin")
 
         date_updated = datetime.now().strftime("%b, %d %Y")
         log.info(f"Generating file with date: {date_updated}")
 
-        file_contents = file_template.format(
-            players_list=players_string,
-            wnba_players_list=wnba_players_string,
-            date_updated=date_updated,
-        )
+        file_contents = file_template.format(date_updated=date_updated)
 
         file_path = write_static_data_file(directory, file_contents)
 
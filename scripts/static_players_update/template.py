@@ -1,4 +1,12 @@
-file_template = """player_index_id = 0
+file_template = """\"\"\"Static player and team data.
+
+``players`` and ``wnba_players`` are stored in the packed ``players.bin`` file
+(see ``nba_api.stats.library.packed``) and decoded on first access.
+\"\"\"
+
+from nba_api.stats.library.packed import load_players
+
+player_index_id = 0
 player_index_last_name = 1
 player_index_first_name = 2
 player_index_full_name = 3
@@ -6,13 +14,79 @@ player_index_is_active = 4
 
 # Data last updated: {date_updated}
 
-players = [
-{players_list}
-]
 
-wnba_players = [
-{wnba_players_list}
-]
+def __getattr__(name):
+    if name in ("players", "wnba_players"):
+        tables = load_players()
+        globals().update(tables)
+        return tables[name]
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+# Common nicknames by player ID, searched by players.search().
+player_nicknames = {{
+    2544: ["King James", "Bron"],
+    203507: ["Greek Freak"],
+    203999: ["Joker"],
+    1628983: ["SGA"],
+    201142: ["KD", "Slim Reaper"],
+    101108: ["CP3"],
+    201939: ["Steph", "Chef Curry"],
+    203076: ["AD", "The Brow"],
+    201935: ["The Beard"],
+    203081: ["Dame", "Dame Time"],
+    406: ["Shaq", "Diesel"],
+    893: ["MJ", "Air Jordan"],
+    977: ["Black Mamba"],
+    1495: ["Big Fundamental"],
+    947: ["The Answer", "AI"],
+    2548: ["D-Wade", "Flash"],
+    202695: ["The Claw"],
+    1629029: ["Luka Magic"],
+    1641705: ["Wemby"],
+    76003: ["Kareem"],
+    76375: ["Wilt the Stilt", "The Big Dipper"],
+    76681: ["Dr. J"],
+    252: ["The Mailman"],
+    165: ["The Dream"],
+    787: ["Sir Charles", "Round Mound of Rebound"],
+    201566: ["Russ", "Brodie"],
+    202681: ["Uncle Drew"],
+    1630162: ["Ant", "Ant-Man"],
+    1626157: ["KAT"],
+    202331: ["PG13"],
+    203954: ["The Process"],
+    1628378: ["Spida"],
+    1717: ["Dirk"],
+    1449: ["Larry Legend"],
+    77142: ["Earvin Johnson"],
+    708: ["KG", "The Big Ticket"],
+    1718: ["The Truth"],
+    1713: ["Vinsanity", "Air Canada"],
+    1503: ["T-Mac"],
+    358: ["Penny"],
+    1897: ["Ron Artest"],
+    77459: ["Pistol Pete"],
+    17: ["Clyde the Glide"],
+    76750: ["Clyde"],
+    76804: ["The Iceman"],
+    1122: ["Human Highlight Film"],
+    56: ["The Glove"],
+    1497: ["Mr. Big Shot"],
+    2730: ["Superman"],
+    2546: ["Melo"],
+    1628991: ["Triple J"],
+    1629630: ["Ja"],
+}}
+
+# Common nicknames by player ID, searched by players.search_wnba().
+wnba_player_nicknames = {{
+    100940: ["DT", "White Mamba"],
+    1627668: ["Stewie"],
+    1628932: ["A'ja"],
+    1642286: ["CC"],
+}}
+
 
 team_index_id = 0
 team_index_abbreviation = 1
@@ -71,8 +145,33 @@ wnba_teams = [
     [1611661330, "ATL", "Dream", 2008, "Atlanta", "Atlanta Dream", "Georgia", []],
     [1611661331, "GSV", "Valkyries", 2025, "Golden State", "Golden State Valkyries", "California", []],
 ]
-"""
 
-player_row_template = (
-    """    [{id}, "{last_name}", "{first_name}", "{full_name}", {is_active}]"""
-)
+# Common nicknames by team ID, searched by teams.search().
+team_nicknames = {{
+    1610612738: ["Celts", "C's"],
+    1610612739: ["Cavs"],
+    1610612740: ["Pels", "NOLA"],
+    1610612742: ["Mavs"],
+    1610612743: ["Nugs"],
+    1610612744: ["Golden State", "Dubs"],
+    1610612745: ["H-Town"],
+    1610612746: ["Clips", "LA Clippers"],
+    1610612747: ["LA Lakers", "Lakeshow"],
+    1610612750: ["Wolves", "T-Wolves"],
+    1610612752: ["Knickerbockers"],
+    1610612755: ["Sixers", "Philly"],
+    1610612757: ["Blazers", "Rip City"],
+    1610612760: ["OKC"],
+    1610612761: ["Raps", "Dinos"],
+    1610612763: ["Grizz"],
+    1610612764: ["Wiz"],
+    1610612766: ["Buzz City"],
+}}
+
+# Common nicknames by team ID, searched by teams.search_wnba().
+wnba_team_nicknames = {{
+    1611661313: ["Libs"],
+    1611661320: ["LA Sparks"],
+    1611661331: ["Valks"],
+}}
+"""
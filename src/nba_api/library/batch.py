@@ -0,0 +1,109 @@
+"""Concurrent fetching of many requests to the same endpoint class.
+
+```python
+from nba_api.library.batch import fetch_many
+from nba_api.stats.endpoints import BoxScoreTraditionalV3
+
+results = fetch_many(
+    BoxScoreTraditionalV3, [{"game_id": g} for g in game_ids], max_workers=8
+)
+for result in results:
+    if result.error is None:
+        frames = result.endpoint.get_data_frames()
+```
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from nba_api.library.http import NBAHTTP
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class BatchResult:
+    """Outcome of one item of a batch.
+
+    Attributes:
+        index: Position of the item in the input.
+        kwargs: Keyword arguments the endpoint was created with.
+        endpoint: The loaded endpoint, or ``None`` if the request failed.
+        error: The exception raised by the request, or ``None``.
+    """
+
+    __slots__ = ("index", "kwargs", "endpoint", "error")
+
+    def __init__(self, index, kwargs, endpoint=None, error=None):
+        self.index = index
+        self.kwargs = kwargs
+        self.endpoint = endpoint
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, kwargs={self.kwargs!r}, {status})"
+
+
+def _fetch_one(endpoint_class, index, kwargs):
+    try:
+        endpoint = endpoint_class(**kwargs)
+    except Exception as e:
+        return BatchResult(index, kwargs, error=e)
+    return BatchResult(index, kwargs, endpoint=endpoint)
+
+
+def iter_fetch_many(
+    endpoint_class, kwargs_list, max_workers=DEFAULT_MAX_WORKERS, ordered=False
+):
+    """Fetch ``endpoint_class(**kwargs)`` for every item on a thread pool.
+
+    Yields a ``BatchResult`` per item as soon as it finishes, or in input order
+    when ``ordered`` is true. At most ``2 * max_workers`` items are in flight,
+    so ``kwargs_list`` may be a lazy iterable. Errors are reported on the
+    result of the item that raised them and do not stop the batch.
+    """
+    http = getattr(endpoint_class, "nba_http", NBAHTTP)
+    http.ensure_pool_size(max_workers)
+
+    items = enumerate(kwargs_list)
+    window = 2 * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(_fetch_one, endpoint_class, index, kwargs)
+            for index, kwargs in islice(items, window)
+        )
+
+        def refill(count):
+            for index, kwargs in islice(items, count):
+                pending.append(
+                    executor.submit(_fetch_one, endpoint_class, index, kwargs)
+                )
+
+        if ordered:
+            while pending:
+                result = pending.popleft().result()
+                refill(1)
+                yield result
+            return
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+            refill(len(done))
+            for future in done:
+                yield future.result()
+
+
+def fetch_many(endpoint_class, kwargs_list, max_workers=DEFAULT_MAX_WORKERS):
+    """Fetch ``endpoint_class(**kwargs)`` for every item on a thread pool.
+
+    Returns:
+        A list of ``BatchResult`` in the order of ``kwargs_list``.
+    """
+    return list(iter_fetch_many(endpoint_class, kwargs_list, max_workers, ordered=True))
@@ -0,0 +1,762 @@
+"""Response caching for NBA API requests.
+
+A cache is attached to an HTTP client with ``NBAHTTP.set_cache`` (or to a
+specific client such as ``NBAStatsHTTP``). ``send_api_request`` then serves
+repeated requests for the same endpoint and parameters from the cache until
+their time-to-live expires. Three backends are available:
+
+* ``MemoryCache`` - per-process dictionary.
+* ``FileSystemCache`` - one file per response in a directory.
+* ``SQLiteCache`` - a single SQLite database file.
+
+Every backend evicts the least recently used responses once the stored
+contents exceed ``max_bytes``.
+
+``FinalGameCache`` wraps one of these backends and moves responses of
+finished games into a ``GameStore``, where they never expire.
+"""
+
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+DEFAULT_TTL = 600
+
+_DEFAULT = object()
+
+# Endpoints whose payload for a finished game never changes.
+FINAL_GAME_ENDPOINTS = frozenset(
+    {
+        "boxscoreadvancedv2",
+        "boxscoreadvancedv3",
+        "boxscoredefensivev2",
+        "boxscorefourfactorsv2",
+        "boxscorefourfactorsv3",
+        "boxscorehustlev2",
+        "boxscorematchupsv3",
+        "boxscoremiscv2",
+        "boxscoremiscv3",
+        "boxscoreplayertrackv3",
+        "boxscorescoringv2",
+        "boxscorescoringv3",
+        "boxscoresummaryv2",
+        "boxscoresummaryv3",
+        "boxscoretraditionalv2",
+        "boxscoretraditionalv3",
+        "boxscoreusagev2",
+        "boxscoreusagev3",
+        "gamerotation",
+        "hustlestatsboxscore",
+        "playbyplay",
+        "playbyplayv2",
+        "playbyplayv3",
+        "winprobabilitypbp",
+        # Live endpoints are matched on the first segment of their path.
+        "boxscore",
+    }
+)
+
+# Time-to-live of endpoints that change while games are played, applied
+# unless ``endpoint_ttls`` overrides them.
+VOLATILE_ENDPOINT_TTLS = {
+    "scoreboardv2": 15,
+    "scoreboardv3": 15,
+    "scoreboard": 10,
+    "odds": 30,
+}
+
+GAME_STATUS_FINAL = 3
+
+# A final game is considered settled this long after tip-off, regardless of
+# when it was first seen as final.
+SETTLED_AFTER_TIP_OFF = 24 * 60 * 60
+
+_live_game_id_pattern = re.compile(r"_(\d{10})\.json$")
+_game_id_pattern = re.compile(r"[0-9]{10}")
+
+
+def make_cache_key(url, parameters):
+    """Return a canonical cache key for a request.
+
+    Parameters are sorted by name and ``None`` values are encoded as empty
+    strings, so the key does not depend on the order the parameters were
+    supplied in.
+    """
+    if isinstance(parameters, dict):
+        parameters = parameters.items()
+    canonical = sorted(
+        (str(key), "" if value is None else str(value)) for key, value in parameters
+    )
+    if not canonical:
+        return url
+    return f"{url}?{urlencode(canonical)}"
+
+
+class CachedResponse:
+    """A cached response body along with the request metadata.
+
+    ``size`` is the UTF-8 length of ``contents``, computed unless the backend
+    stored it.
+    """
+
+    __slots__ = ("contents", "status_code", "url", "expires_at", "size")
+
+    def __init__(self, contents, status_code, url, expires_at=None, size=None):
+        self.contents = contents
+        self.status_code = status_code
+        self.url = url
+        self.expires_at = expires_at
+        self.size = len(contents.encode("utf-8")) if size is None else size
+
+    def is_expired(self, now=None):
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) >= self.expires_at
+
+
+class ResponseCache(abc.ABC):
+    """Base class for response cache backends.
+
+    Backends implement ``_get``, ``_set``, ``delete`` and ``clear``.
+
+    Args:
+        ttl: Default time-to-live in seconds. ``None`` never expires.
+        endpoint_ttls: Per-endpoint time-to-live overrides keyed by endpoint
+            name (e.g. ``{"scoreboardv3": 15}``), applied on top of
+            ``VOLATILE_ENDPOINT_TTLS``. Live endpoints may be keyed by their
+            full path or by its first segment (e.g. ``"playbyplay"``).
+        max_bytes: Size budget for stored contents. The least recently used
+            responses are evicted once it is exceeded. ``None`` disables
+            eviction.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, endpoint_ttls=None, max_bytes=None):
+        self.ttl = ttl
+        self.endpoint_ttls = dict(VOLATILE_ENDPOINT_TTLS)
+        self.endpoint_ttls.update(
+            (key.lower(), value) for key, value in (endpoint_ttls or {}).items()
+        )
+        self.max_bytes = max_bytes
+
+    def get_ttl(self, endpoint):
+        endpoint = endpoint.lower()
+        if endpoint in self.endpoint_ttls:
+            return self.endpoint_ttls[endpoint]
+        prefix = endpoint.split("/", 1)[0]
+        return self.endpoint_ttls.get(prefix, self.ttl)
+
+    def get(self, key):
+        """Return the ``CachedResponse`` stored under ``key`` or ``None``."""
+        entry = self._get(key)
+        if entry is None:
+            return None
+        if entry.is_expired():
+            self.delete(key)
+            return None
+        return entry
+
+    def set_response(self, key, endpoint, data):
+        """Store an ``NBAResponse`` received for ``endpoint``.
+
+        Only valid ``json`` responses with a ``200`` status code are stored,
+        using the time-to-live configured for the endpoint.
+        """
+        if data.get_status_code() != 200 or not data.valid_json():
+            return
+        self.set(
+            key,
+            data.get_response(),
+            data.get_status_code(),
+            data.get_url(),
+            ttl=self.get_ttl(endpoint),
+        )
+
+    def set(self, key, contents, status_code, url, ttl=_DEFAULT):
+        """Store a response under ``key`` for ``ttl`` seconds.
+
+        ``ttl`` defaults to the cache's ``ttl``; ``None`` never expires.
+        """
+        if ttl is _DEFAULT:
+            ttl = self.ttl
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = None if ttl is None else time.time() + ttl
+        entry = CachedResponse(contents, status_code, url, expires_at)
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+        self._set(key, entry)
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """Remove the response stored under ``key``, if any."""
+
+    @abc.abstractmethod
+    def clear(self):
+        """Remove every stored response."""
+
+    @abc.abstractmethod
+    def _get(self, key):
+        """Return the ``CachedResponse`` stored under ``key``, expired or
+        not, or ``None``."""
+
+    @abc.abstractmethod
+    def _set(self, key, entry):
+        """Store the ``CachedResponse`` ``entry`` under ``key``."""
+
+
+class MemoryCache(ResponseCache):
+    """In-process cache backed by an ordered dictionary."""
+
+    def __init__(self, ttl=DEFAULT_TTL, endpoint_ttls=None, max_bytes=None):
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls, max_bytes=max_bytes)
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key, entry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            if self.max_bytes is not None:
+                while self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= evicted.size
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class FileSystemCache(ResponseCache):
+    """Cache storing one JSON file per response in ``directory``.
+
+    Recency is tracked with the file modification time, so several processes
+    can share the directory. The size budget is enforced by the process that
+    writes a response.
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_TTL, endpoint_ttls=None, max_bytes=None):
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls, max_bytes=max_bytes)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _get_path(self, key):
+        file_name = hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.directory, file_name)
+
+    def _touch(self, path):
+        now = time.time()
+        with contextlib.suppress(OSError):
+            os.utime(path, (now, now))
+
+    def _get(self, key):
+        path = self._get_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stored.get("key") != key:
+            return None
+        self._touch(path)
+        return CachedResponse(
+            stored["contents"],
+            stored["status_code"],
+            stored["url"],
+            stored["expires_at"],
+            stored.get("size"),
+        )
+
+    def _set(self, key, entry):
+        path = self._get_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "key": key,
+                    "contents": entry.contents,
+                    "status_code": entry.status_code,
+                    "url": entry.url,
+                    "expires_at": entry.expires_at,
+                    "size": entry.size,
+                },
+                f,
+            )
+        os.replace(temp_path, path)
+        self._touch(path)
+        if self.max_bytes is not None:
+            self._evict()
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+            files.sort()
+            for _, size, path in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+    def delete(self, key):
+        with contextlib.suppress(OSError):
+            os.remove(self._get_path(key))
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+
+
+class SQLiteCache(ResponseCache):
+    """Cache storing responses in a single SQLite database file."""
+
+    def __init__(self, path, ttl=DEFAULT_TTL, endpoint_ttls=None, max_bytes=None):
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls, max_bytes=max_bytes)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "contents TEXT NOT NULL, "
+                "status_code INTEGER, "
+                "url TEXT, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def _get(self, key):
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT contents, status_code, url, expires_at, size "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return CachedResponse(*row)
+
+    def _set(self, key, entry):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, contents, status_code, url, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.contents,
+                    entry.status_code,
+                    entry.url,
+                    entry.size,
+                    entry.expires_at,
+                    time.time(),
+                ),
+            )
+            if self.max_bytes is not None:
+                self._evict()
+
+    def _evict(self):
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        self._connection.close()
+
+
+def _endpoint_name(endpoint):
+    return endpoint.lower().split("/", 1)[0]
+
+
+def get_game_id_from_key(key):
+    """Return the game id a cache key refers to, or ``None``."""
+    split_key = urlsplit(key)
+    match = _live_game_id_pattern.search(split_key.path)
+    if match:
+        return match.group(1)
+    game_ids = parse_qs(split_key.query).get("GameID")
+    if game_ids and _game_id_pattern.fullmatch(game_ids[0]):
+        return game_ids[0]
+    return None
+
+
+def get_season_end(game_id):
+    """Return a timestamp by which every game of the season of ``game_id`` is
+    over, from the season year in the 4th and 5th digits of the game id."""
+    year = int(game_id[3:5])
+    year += 1900 if year >= 46 else 2000
+    # Seasons end in June; the 2019-20 season ended in October 2020.
+    return datetime(year + 1, 11, 1, tzinfo=timezone.utc).timestamp()
+
+
+def _parse_tip_off(game):
+    value = game.get("gameTimeUTC") or game.get("gameDateTimeUTC")
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def find_game_statuses(payload):
+    """Return ``{game_id: (game_status, tip_off_timestamp)}`` found in a payload.
+
+    Games are looked up in nested objects that carry both ``gameId`` and
+    ``gameStatus`` (live endpoints, ``ScoreboardV3``, ``BoxScoreSummaryV3``,
+    ``ScheduleLeagueV2``) and in result sets with ``GAME_ID`` and
+    ``GAME_STATUS_ID`` columns (``ScoreboardV2``). Lists are only searched when
+    they contain games, so large play-by-play action lists are skipped.
+    """
+    statuses = {}
+
+    def visit(value):
+        if isinstance(value, dict):
+            if "gameId" in value and "gameStatus" in value:
+                statuses[str(value["gameId"])] = (
+                    value["gameStatus"],
+                    _parse_tip_off(value),
+                )
+            for child in value.values():
+                if isinstance(child, (dict, list)):
+                    visit(child)
+        elif value and isinstance(value[0], dict):
+            first = value[0]
+            if "gameId" in first or "games" in first:
+                for child in value:
+                    visit(child)
+
+    if not isinstance(payload, dict):
+        return statuses
+
+    result_sets = payload.get("resultSets")
+    if isinstance(result_sets, list):
+        for result_set in result_sets:
+            headers = result_set.get("headers") or []
+            if "GAME_ID" in headers and "GAME_STATUS_ID" in headers:
+                game_id_index = headers.index("GAME_ID")
+                status_index = headers.index("GAME_STATUS_ID")
+                for row in result_set.get("rowSet") or []:
+                    statuses[str(row[game_id_index])] = (row[status_index], None)
+        return statuses
+
+    visit(payload)
+    return statuses
+
+
+class GameStore:
+    """Never-expiring, content-addressed storage of finished-game responses.
+
+    Response bodies are written once to ``objects/`` under the SHA-256 digest of
+    their contents. ``games/<GameID>.json`` maps every cache key of a game to
+    its digest, so identical payloads are only stored once. ``settled.json``
+    holds the times from which final games are settled, see ``FinalGameCache``.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._objects_directory = os.path.join(directory, "objects")
+        self._games_directory = os.path.join(directory, "games")
+        os.makedirs(self._objects_directory, exist_ok=True)
+        os.makedirs(self._games_directory, exist_ok=True)
+        self._settled_path = os.path.join(directory, "settled.json")
+        self._games = {}
+        self._settled = None
+        self._lock = threading.Lock()
+
+    def _get_object_path(self, digest):
+        return os.path.join(self._objects_directory, digest[:2], digest)
+
+    def _get_game_path(self, game_id):
+        if not isinstance(game_id, str) or not _game_id_pattern.fullmatch(game_id):
+            raise Exception(f"Invalid game id: {game_id!r}.")
+        return os.path.join(self._games_directory, f"{game_id}.json")
+
+    def _load_game(self, game_id):
+        game = self._games.get(game_id)
+        if game is None:
+            try:
+                with open(self._get_game_path(game_id), encoding="utf-8") as f:
+                    game = json.load(f)
+            except (OSError, ValueError):
+                game = {}
+            self._games[game_id] = game
+        return game
+
+    def _load_settled(self):
+        if self._settled is None:
+            try:
+                with open(self._settled_path, encoding="utf-8") as f:
+                    self._settled = json.load(f)
+            except (OSError, ValueError):
+                self._settled = {}
+        return self._settled
+
+    def get_settled(self):
+        """Return ``{game_id: settled_at}`` of the games recorded as final."""
+        with self._lock:
+            return dict(self._load_settled())
+
+    def set_settled(self, settled):
+        """Record ``{game_id: settled_at}``, keeping earlier times."""
+        with self._lock:
+            current = self._load_settled()
+            changed = False
+            for game_id, settled_at in settled.items():
+                previous = current.get(game_id)
+                if previous is None or settled_at < previous:
+                    current[game_id] = settled_at
+                    changed = True
+            if changed:
+                self._write(self._settled_path, json.dumps(current))
+
+    def get_game_ids(self):
+        return sorted(
+            name[: -len(".json")]
+            for name in os.listdir(self._games_directory)
+            if name.endswith(".json")
+        )
+
+    def get(self, game_id, key):
+        """Return the ``CachedResponse`` stored for ``key`` or ``None``."""
+        with self._lock:
+            reference = self._load_game(game_id).get(key)
+        if reference is None:
+            return None
+        digest, status_code, url = reference
+        try:
+            with open(self._get_object_path(digest), encoding="utf-8") as f:
+                contents = f.read()
+        except OSError:
+            return None
+        return CachedResponse(contents, status_code, url)
+
+    def set(self, game_id, key, contents, status_code, url):
+        game_path = self._get_game_path(game_id)
+        digest = hashlib.sha256(contents.encode("utf-8")).hexdigest()
+        object_path = self._get_object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            self._write(object_path, contents)
+        with self._lock:
+            game = self._load_game(game_id)
+            game[key] = [digest, status_code, url]
+            self._write(game_path, json.dumps(game))
+
+    def _write(self, path, contents):
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(contents)
+        os.replace(temp_path, path)
+
+    def delete_game(self, game_id):
+        with self._lock:
+            self._games.pop(game_id, None)
+            with contextlib.suppress(OSError):
+                os.remove(self._get_game_path(game_id))
+
+
+class FinalGameCache(ResponseCache):
+    """Cache promoting responses of finished games to a permanent ``GameStore``.
+
+    Every response passing through the cache is inspected for game statuses
+    (see ``find_game_statuses``), so a ``ScoreboardV3`` or live ``ScoreBoard``
+    request marks the games it lists as final. Responses of
+    ``FINAL_GAME_ENDPOINTS`` for a settled final game are then kept in ``store``
+    forever. All other responses go to ``cache`` with its usual time-to-live.
+
+    Settle times are persisted in ``store``, and games of past seasons are
+    settled without being seen as final, so a backfill of old games is
+    promoted without requesting their scoreboards.
+
+    Args:
+        cache: The ``ResponseCache`` used for every other response.
+        store: The ``GameStore`` holding finished-game responses.
+        settle_seconds: How long a game must have been final before its
+            responses are treated as immutable. Games that tipped off more than
+            a day ago are settled as soon as they are seen as final.
+        endpoints: Endpoint names eligible for promotion.
+    """
+
+    def __init__(
+        self, cache, store, settle_seconds=3600, endpoints=FINAL_GAME_ENDPOINTS
+    ):
+        super().__init__(
+            ttl=cache.ttl, endpoint_ttls=cache.endpoint_ttls, max_bytes=cache.max_bytes
+        )
+        self.cache = cache
+        self.store = store
+        self.settle_seconds = settle_seconds
+        self.endpoints = frozenset(endpoint.lower() for endpoint in endpoints)
+        self._settled_at = store.get_settled()
+        self._lock = threading.Lock()
+
+    def get_ttl(self, endpoint):
+        return self.cache.get_ttl(endpoint)
+
+    def _get_settled_at(self, tip_off=None, settled=False):
+        now = time.time()
+        if settled:
+            return now
+        settled_at = now + self.settle_seconds
+        if tip_off is not None:
+            settled_at = min(settled_at, tip_off + SETTLED_AFTER_TIP_OFF)
+        return settled_at
+
+    def _set_settled_at(self, settled):
+        with self._lock:
+            changed = {}
+            for game_id, settled_at in settled.items():
+                previous = self._settled_at.get(game_id)
+                if previous is None or settled_at < previous:
+                    self._settled_at[game_id] = changed[game_id] = settled_at
+        if changed:
+            self.store.set_settled(changed)
+
+    def mark_final(self, game_id, tip_off=None, settled=False):
+        """Record that ``game_id`` is final, as seen now.
+
+        ``settled=True`` settles the game right away, for games known to be
+        over, such as those of a backfill.
+        """
+        self._set_settled_at({game_id: self._get_settled_at(tip_off, settled)})
+
+    def is_settled(self, game_id):
+        settled_at = self._settled_at.get(game_id)
+        if settled_at is None:
+            if not _game_id_pattern.fullmatch(game_id):
+                return False
+            settled_at = get_season_end(game_id)
+        return time.time() >= settled_at
+
+    def observe(self, payload):
+        """Record the final games found in a parsed response payload."""
+        self._set_settled_at(
+            {
+                game_id: self._get_settled_at(tip_off)
+                for game_id, (status, tip_off) in find_game_statuses(payload).items()
+                if status == GAME_STATUS_FINAL
+            }
+        )
+
+    def get(self, key):
+        game_id = get_game_id_from_key(key)
+        if game_id is not None:
+            entry = self.store.get(game_id, key)
+            if entry is not None:
+                return entry
+        return self.cache.get(key)
+
+    def set_response(self, key, endpoint, data):
+        if data.get_status_code() != 200 or not data.valid_json():
+            return
+        self.observe(data.get_dict())
+        game_id = get_game_id_from_key(key)
+        if (
+            game_id is not None
+            and _endpoint_name(endpoint) in self.endpoints
+            and self.is_settled(game_id)
+        ):
+            self.store.set(
+                game_id,
+                key,
+                data.get_response(),
+                data.get_status_code(),
+                data.get_url(),
+            )
+            self.cache.delete(key)
+            return
+        self.cache.set_response(key, endpoint, data)
+
+    def set(self, key, contents, status_code, url, ttl=_DEFAULT):
+        self.cache.set(key, contents, status_code, url, ttl=ttl)
+
+    def _get(self, key):
+        return self.cache._get(key)
+
+    def _set(self, key, entry):
+        self.cache._set(key, entry)
+
+    def delete(self, key):
+        self.cache.delete(key)
+
+    def clear(self):
+        self.cache.clear()
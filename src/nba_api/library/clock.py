@@ -0,0 +1,224 @@
+"""Vectorized decoding of game clocks and minutes played.
+
+Clocks and minutes come as strings, in two formats:
+
+- ISO 8601 durations, in the live endpoints and ``PlayByPlayV3``:
+  ``"PT11M58.00S"``, ``"PT240M00.00S"``, ``"PT25M"``.
+- ``"MM:SS"``, in the V2 endpoints and V3 box scores: ``"11:58"``,
+  ``"265:00"``. Some older box scores have ``"36.000000:45"``, whose
+  minutes fraction is ignored.
+
+Some box scores and dashboards have numeric ``MIN`` columns instead, such as
+``35`` or ``12.5``; numbers are minutes.
+
+``to_seconds`` and ``to_tenths`` decode a whole column at once instead of
+matching a pattern row by row. The strings are viewed as a matrix of
+character codes, and the layout of each row (``"PT99M99.99S"``, ``"9:99"``)
+is packed into an integer. A column only has a few distinct layouts; each is
+checked once against the grammar, and the digits of all rows sharing it are
+read from fixed positions of the matrix.
+
+```python
+from nba_api.library.clock import to_seconds, to_tenths
+
+to_seconds(["PT11M58.00S", "11:58", None])  # array([718., 718., nan])
+to_seconds([35, 12.5, None])  # array([2100., 750., nan])
+to_tenths(["PT00M04.70S", "0:04.7"])  # array([47, 47])
+```
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+_CLOCK = re.compile(
+    r"^PT(\d+)M(?:(\d+)(?:\.(\d*))?S)?$|^(\d+)(?:\.\d*)?:(\d+)(?:\.(\d*))?$"
+)
+
+# Character classes of layouts, 4 bits per character.
+_LAYOUT_CHARACTERS = ("", "9", ":", ".", "M", "P", "S", "T", "?")
+_CLASS_BITS = 4
+_MAX_LAYOUT_LENGTH = 63 // _CLASS_BITS
+
+_CLASSES = np.full(129, _LAYOUT_CHARACTERS.index("?"), dtype=np.int64)
+_CLASSES[0] = 0
+_CLASSES[ord("0") : ord("9") + 1] = 1
+for _index, _character in enumerate(_LAYOUT_CHARACTERS[2:-1], start=2):
+    _CLASSES[ord(_character)] = _index
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+def _decode_minutes(array: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return the seconds and missing mask of numeric minutes, or ``None``
+    if ``array`` holds anything but numbers and ``None``."""
+    if array.dtype.kind in "iuf":
+        minutes = array.astype(np.float64)
+    elif (
+        array.dtype.kind == "O"
+        and len(array)
+        and all(value is None or _is_number(value) for value in array)
+    ):
+        minutes = np.array(
+            [np.nan if value is None else value for value in array],
+            dtype=np.float64,
+        )
+    else:
+        return None
+    missing = np.isnan(minutes)
+    seconds = minutes * 60
+    seconds[missing] = 0
+    return seconds, missing
+
+
+def _to_characters(array: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the values as an array of strings, and their character codes
+    as a ``(rows, characters)`` matrix, right-padded with 0s."""
+    if array.dtype.kind == "O":
+        # None for missing values, e.g. the minutes of inactive players.
+        array = np.where(np.equal(array, None), "", array).astype(str)
+    elif not len(array):
+        array = array.astype(str)
+    if array.dtype.kind not in "US":
+        raise Exception(f"Invalid game clock: {array[0].item()!r}")
+    code = np.uint32 if array.dtype.kind == "U" else np.uint8
+    width = array.dtype.itemsize // np.dtype(code).itemsize
+    if width == 0:
+        return array, np.zeros((len(array), 1), dtype=code)
+    array = np.ascontiguousarray(array)
+    return array, array.view(code).reshape(len(array), width)
+
+
+def _read_digits(characters, rows, start, end):
+    """Return the number written at columns ``start:end`` of ``rows`` (of
+    every row if ``rows`` is ``None``)."""
+    number = np.zeros(len(characters) if rows is None else len(rows))
+    for position in range(start, end):
+        column = characters[:, position] if rows is None else characters[rows, position]
+        number = number * 10 + (column.astype(np.int64) - ord("0"))
+    return number
+
+
+def _decode(values: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Return the seconds of every value and a mask of the missing ones.
+
+    Raises:
+        Exception: If a value is neither missing nor a valid clock.
+    """
+    array = np.asarray(values)
+    if array.ndim != 1:
+        array = array.reshape(-1)
+    minutes = _decode_minutes(array)
+    if minutes is not None:
+        return minutes
+    array, characters = _to_characters(array)
+    seconds = np.zeros(len(array))
+    missing = characters[:, 0] == 0
+    width = min(characters.shape[1], _MAX_LAYOUT_LENGTH)
+
+    layouts = np.zeros(len(array), dtype=np.int64)
+    for position in range(width):
+        classes = _CLASSES[np.minimum(characters[:, position], 128)]
+        layouts |= classes << (position * _CLASS_BITS)
+    if characters.shape[1] > width:
+        # Rows too long to pack are decoded one by one.
+        long_rows = np.flatnonzero(characters[:, width:].any(axis=1))
+        layouts[long_rows] = -1
+    else:
+        long_rows = ()
+
+    invalid = []
+    if not len(layouts):
+        groups = []
+    elif (layouts == layouts[0]).all():
+        groups = [(layouts[0], None)]
+    else:
+        keys, inverse = np.unique(layouts, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.cumsum(np.bincount(inverse, minlength=len(keys)))
+        groups = zip(keys, np.split(order, bounds[:-1]), strict=True)
+
+    for layout, rows in groups:
+        if layout <= 0:
+            # Missing values, and rows too long to pack.
+            continue
+        text = "".join(
+            _LAYOUT_CHARACTERS[(layout >> (position * _CLASS_BITS)) & 0xF]
+            for position in range(width)
+        )
+        match = _CLOCK.match(text)
+        if match is None:
+            invalid.append(0 if rows is None else rows[0])
+            continue
+        minutes = match.span(1) if match.group(1) else match.span(4)
+        whole = match.span(2) if match.group(1) else match.span(5)
+        fraction = match.span(3) if match.group(1) else match.span(6)
+        value = _read_digits(characters, rows, *minutes) * 60
+        if whole[0] >= 0:
+            value += _read_digits(characters, rows, *whole)
+        if fraction[0] >= 0 and fraction[1] > fraction[0]:
+            digits = fraction[1] - fraction[0]
+            value += _read_digits(characters, rows, *fraction) / 10**digits
+        if rows is None:
+            seconds = value
+        else:
+            seconds[rows] = value
+
+    for row in long_rows:
+        match = _CLOCK.match(str(array[row].item()))
+        if match is None:
+            invalid.append(row)
+            continue
+        minutes, whole, fraction = (
+            match.group(1, 2, 3) if match.group(1) else match.group(4, 5, 6)
+        )
+        seconds[row] = int(minutes) * 60 + float(f"{whole or 0}.{fraction or 0}")
+
+    if invalid:
+        raise Exception(f"Invalid game clock: {array[min(invalid)].item()!r}")
+    return seconds, missing
+
+
+def to_seconds(values: Iterable[Any]) -> np.ndarray:
+    """Return clocks or minutes as float seconds.
+
+    Args:
+        values: ``"PT11M58.00S"`` or ``"11:58"`` strings, or numbers of
+            minutes. ``None``, ``NaN`` and empty strings are missing.
+
+    Returns:
+        A ``float64`` array, ``NaN`` where values are missing.
+
+    Raises:
+        Exception: If a value is neither missing nor a valid clock.
+    """
+    seconds, missing = _decode(values)
+    seconds[missing] = np.nan
+    return seconds
+
+
+def to_tenths(values: Iterable[Any], missing: int = 0) -> np.ndarray:
+    """Return clocks or minutes as integer tenths of a second, the unit of the
+    ``IN_TIME_REAL`` / ``OUT_TIME_REAL`` columns of ``GameRotation``.
+
+    Args:
+        values: ``"PT11M58.00S"`` or ``"11:58"`` strings, or numbers of
+            minutes. ``None``, ``NaN`` and empty strings are missing.
+        missing: Value of missing values.
+
+    Returns:
+        An ``int64`` array.
+
+    Raises:
+        Exception: If a value is neither missing nor a valid clock.
+    """
+    seconds, is_missing = _decode(values)
+    tenths = np.rint(seconds * 10).astype(np.int64)
+    tenths[is_missing] = missing
+    return tenths
@@ -0,0 +1,76 @@
+"""JSON codec used to decode responses.
+
+Responses are decoded with the fastest installed backend: ``orjson``, then
+``msgspec``, then the standard library ``json`` module. Payloads that a fast
+backend rejects (for example ``NaN`` literals or integers wider than 64 bits)
+are decoded again with ``json`` before giving up, so every backend accepts
+the same input and invalid JSON always raises ``ValueError``.
+
+``dumps`` always uses ``json`` so that ``get_json`` and
+``get_normalized_json`` keep their exact output format.
+
+```python
+from nba_api.library import codec
+
+codec.get_backend()  # "orjson"
+codec.set_backend("json")  # force the standard library
+```
+"""
+
+import json
+
+try:
+    import orjson
+
+    ORJSON = True
+except ImportError:
+    ORJSON = False
+
+try:
+    import msgspec
+
+    MSGSPEC = True
+except ImportError:
+    MSGSPEC = False
+
+
+BACKENDS = {"json": json.loads}
+if MSGSPEC:
+    BACKENDS["msgspec"] = msgspec.json.decode
+if ORJSON:
+    BACKENDS["orjson"] = orjson.loads
+
+_backend = "orjson" if ORJSON else "msgspec" if MSGSPEC else "json"
+_loads = BACKENDS[_backend]
+
+
+def get_backend():
+    """Return the name of the backend used by ``loads``."""
+    return _backend
+
+
+def set_backend(name):
+    """Use backend ``name`` (``"orjson"``, ``"msgspec"`` or ``"json"``)."""
+    global _backend, _loads
+    if name not in BACKENDS:
+        raise Exception(
+            f"Import Missing - JSON backend {name!r} is not installed. "
+            f"Available backends: {', '.join(sorted(BACKENDS))}."
+        )
+    _backend = name
+    _loads = BACKENDS[name]
+
+
+def loads(data):
+    """Decode a JSON document given as ``str`` or ``bytes``."""
+    if _loads is json.loads:
+        return json.loads(data)
+    try:
+        return _loads(data)
+    except Exception:
+        return json.loads(data)
+
+
+def dumps(obj):
+    """Encode ``obj`` as a JSON ``str`` formatted like ``json.dumps``."""
+    return json.dumps(obj)
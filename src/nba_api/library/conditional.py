@@ -0,0 +1,98 @@
+"""Conditional requests for feeds served with validators.
+
+With a ``ValidatorStore`` attached through ``NBAHTTP.set_validator_store``,
+``send_api_request`` remembers the ``ETag`` and ``Last-Modified`` headers of
+each successful response along with the response itself. The next request for
+the same url and parameters sends them back as ``If-None-Match`` and
+``If-Modified-Since``; when the server answers ``304 Not Modified`` the stored
+response object is returned, so its decoded data is reused without receiving
+or decoding the body again.
+
+No client has a store by default. Each entry keeps its decoded response
+alive, so a store holds up to ``max_entries`` responses in memory. The
+``cdn.nba.com`` live feeds are polled repeatedly and change only between
+possessions, which makes them worth it:
+
+```python
+from nba_api.library.conditional import ValidatorStore
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+NBALiveHTTP.set_validator_store(ValidatorStore())
+```
+"""
+
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 128
+
+
+class Validators:
+    """Validators of a response along with the response itself."""
+
+    __slots__ = ("etag", "last_modified", "response")
+
+    def __init__(self, etag, last_modified, response):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.response = response
+
+    def request_headers(self):
+        """Return the conditional request headers for these validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """In-process store of response validators, keyed by url and parameters.
+
+    Every entry references its response, decoded data included. The least
+    recently used entries are evicted once the store holds more than
+    ``max_entries`` responses.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the ``Validators`` stored for ``key``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set_response(self, key, headers, response):
+        """Store ``response`` under ``key`` if ``headers`` carry validators.
+
+        ``headers`` are the response headers. A response without validators
+        replaces nothing but drops a previous entry, whose validators no
+        longer describe the current body.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = Validators(etag, last_modified, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,9 +1,19 @@
+import asyncio
 import json
 import os
 import random
+from importlib.util import find_spec
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from nba_api.library import codec
+from nba_api.library.cache import MemoryCache, make_cache_key
+
+# aiohttp is only imported by the async client, so that importing the
+# synchronous clients stays fast.
+AIOHTTP = find_spec("aiohttp") is not None
 
 try:
     from nba_api.library.debug.debug import DEBUG
@@ -30,26 +40,51 @@ if DEBUG:
 
 
 class NBAResponse:
+    # Set to False to drop the raw response text once it has been decoded,
+    # roughly halving the memory held by large responses. ``get_response``
+    # then re-serializes the decoded data.
+    keep_response = True
+
     def __init__(self, response, status_code, url):
         self._response = response
         self._status_code = status_code
         self._url = url
+        self._dict = None
+        self._valid_json = None
 
     def get_response(self):
+        if self._response is None and self._dict is not None:
+            return json.dumps(self._dict)
+        if isinstance(self._response, bytes):
+            self._response = self._response.decode("utf-8")
         return self._response
 
     def get_dict(self):
-        return json.loads(self._response)
+        # Decoded once and memoized; callers must not modify the returned dict.
+        if self._dict is None:
+            try:
+                self._dict = codec.loads(self._response)
+            except ValueError:
+                self._valid_json = False
+                raise
+            self._valid_json = True
+            if not self.keep_response:
+                self._response = None
+        return self._dict
 
     def get_json(self):
         return json.dumps(self.get_dict())
 
     def valid_json(self):
-        try:
-            self.get_dict()
-        except ValueError:
-            return False
-        return True
+        if self._valid_json is None:
+            try:
+                self.get_dict()
+            except ValueError:
+                return False
+        return self._valid_json
+
+    def get_status_code(self):
+        return self._status_code
 
     def get_url(self):
         return self._url
@@ -66,11 +101,27 @@ class NBAHTTP:
 
     _session = None
 
+    _cache = None
+
+    _rate_limiter = None
+
+    _retry_policy = None
+
+    _single_flight = None
+
+    _validator_store = None
+
+    # Asyncio counterpart of the client, see ``get_async_http``.
+    async_http = None
+
+    pool_maxsize = 10
+
     @classmethod
     def get_session(cls):
         session = cls._session
         if session is None:
             session = requests.Session()
+            cls._mount_adapters(session, cls.pool_maxsize)
             cls._session = session
         return session
 
@@ -78,23 +129,103 @@ class NBAHTTP:
     def set_session(cls, session) -> None:
         cls._session = session
 
+    @classmethod
+    def ensure_pool_size(cls, maxsize) -> None:
+        """Grow the connection pools of the session to hold ``maxsize`` connections.
+
+        Without this, threads beyond the pool size open throwaway connections
+        instead of reusing kept-alive ones.
+        """
+        if maxsize > cls.pool_maxsize:
+            cls.pool_maxsize = maxsize
+        if cls._session is not None:
+            cls._mount_adapters(cls._session, maxsize)
+
+    @staticmethod
+    def _mount_adapters(session, maxsize):
+        adapters = getattr(session, "adapters", None)
+        if not isinstance(adapters, dict):
+            return
+        for prefix in ("https://", "http://"):
+            adapter = adapters.get(prefix)
+            if adapter is None:
+                session.mount(prefix, HTTPAdapter(pool_maxsize=maxsize))
+            elif (
+                isinstance(adapter, HTTPAdapter)
+                and getattr(adapter, "_pool_maxsize", maxsize) < maxsize
+            ):
+                session.mount(
+                    prefix,
+                    HTTPAdapter(
+                        pool_connections=adapter._pool_connections,
+                        pool_maxsize=maxsize,
+                        max_retries=adapter.max_retries,
+                        pool_block=adapter._pool_block,
+                    ),
+                )
+
+    @classmethod
+    def get_cache(cls):
+        return cls._cache
+
+    @classmethod
+    def set_cache(cls, cache) -> None:
+        cls._cache = cache
+
+    @classmethod
+    def get_rate_limiter(cls):
+        return cls._rate_limiter
+
+    @classmethod
+    def set_rate_limiter(cls, rate_limiter) -> None:
+        cls._rate_limiter = rate_limiter
+
+    @classmethod
+    def get_retry_policy(cls):
+        return cls._retry_policy
+
+    @classmethod
+    def set_retry_policy(cls, retry_policy) -> None:
+        cls._retry_policy = retry_policy
+
+    @classmethod
+    def get_single_flight(cls):
+        return cls._single_flight
+
+    @classmethod
+    def set_single_flight(cls, single_flight) -> None:
+        cls._single_flight = single_flight
+
+    @classmethod
+    def get_validator_store(cls):
+        return cls._validator_store
+
+    @classmethod
+    def set_validator_store(cls, validator_store) -> None:
+        cls._validator_store = validator_store
+
+    @classmethod
+    def get_async_http(cls):
+        """Return the asyncio client sharing this client's base url, headers,
+        ``clean_contents`` and response class.
+
+        Clients without a declared ``async_http`` get one derived from them.
+        """
+        if issubclass(cls, AsyncNBAHTTP):
+            return cls
+        async_http = cls.__dict__.get("async_http")
+        if async_http is None:
+            async_http = type(f"Async{cls.__name__}", (AsyncNBAHTTP, cls), {})
+            cls.async_http = async_http
+        return async_http
+
     def clean_contents(self, contents):
         return contents
 
-    def send_api_request(
-        self,
-        endpoint,
-        parameters,
-        referer=None,
-        proxy=None,
-        headers=None,
-        timeout=None,
-        raise_exception_on_error=False,
-    ):
+    def _prepare_request(self, endpoint, parameters, referer, proxy, headers):
         if not self.base_url:
             raise Exception("Cannot use send_api_request from _HTTP class.")
         base_url = self.base_url.format(endpoint=endpoint)
-        endpoint = endpoint.lower()
         self.parameters = parameters
 
         request_headers = self.headers if headers is None else headers
@@ -114,6 +245,125 @@ class NBAHTTP:
             if DEBUG:
                 print(request_proxy)
 
+        # Sort parameters by key... for some reason this matters for some requests...
+        parameters = sorted(parameters.items(), key=lambda kv: kv[0])
+
+        return base_url, parameters, request_headers, request_proxy or None
+
+    def _get_debug_file_path(self, base_url, endpoint, parameters):
+        print(endpoint, parameters)
+        directory_name = "debug_storage"
+        parameter_string = "&".join(
+            "{}={}".format(key, "" if val is None else quote_plus(str(val)))
+            for key, val in parameters
+        )
+        url = f"{base_url}?{parameter_string}"
+        print(url)
+        file_name = "{}-{}.txt".format(
+            endpoint, md5(parameter_string.encode("utf-8")).hexdigest()
+        )
+        file_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "debug", directory_name
+        )
+        if not os.path.exists(file_path):
+            os.makedirs(file_path)
+        file_path = os.path.join(file_path, file_name)
+        return url, file_path
+
+    def _load_debug_file(self, file_path):
+        print(os.path.basename(file_path), os.path.isfile(file_path))
+        if os.path.isfile(file_path):
+            with open(file_path) as f:
+                contents = f.read()
+            print("loading from file...")
+            return contents
+        return None
+
+    def _save_debug_file(self, file_path, contents, url):
+        if isinstance(contents, bytes):
+            contents = contents.decode("utf-8")
+        with open(file_path, "w") as f:
+            f.write(contents)
+        print(url)
+
+    def _load_response(self, contents, status_code, url, raise_exception_on_error):
+        data = self.nba_response(response=contents, status_code=status_code, url=url)
+        return self._check_response(data, raise_exception_on_error)
+
+    def _check_response(self, data, raise_exception_on_error):
+        if raise_exception_on_error and not data.valid_json():
+            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+
+        return data
+
+    def _get_validators(self, validator_store, cache_key):
+        return None if validator_store is None else validator_store.get(cache_key)
+
+    def _get_conditional_headers(self, request_headers, validators):
+        if validators is None:
+            return request_headers
+        # Conditional headers passed by the caller take precedence.
+        conditional_headers = dict(request_headers or {})
+        for key, value in validators.request_headers().items():
+            conditional_headers.setdefault(key, value)
+        return conditional_headers
+
+    def _load_validated_response(
+        self,
+        validator_store,
+        cache_key,
+        validators,
+        url,
+        status_code,
+        contents,
+        response_headers,
+    ):
+        # The stored response is still current: skip decoding the empty body.
+        if status_code == 304 and validators is not None:
+            return validators.response
+        data = self._load_response(contents, status_code, url, False)
+        if validator_store is not None and status_code == 200:
+            validator_store.set_response(cache_key, response_headers, data)
+        return data
+
+    def _request(self, base_url, parameters, request_headers, proxies, timeout):
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            rate_limiter.acquire(base_url)
+        response = self.get_session().get(
+            url=base_url,
+            params=parameters,
+            headers=request_headers,
+            proxies=proxies,
+            timeout=timeout,
+        )
+        # Keep the raw bytes: the JSON backends decode them directly, which
+        # skips building an intermediate str of the whole payload.
+        return (
+            response.url,
+            response.status_code,
+            self.clean_contents(response.content),
+            response.headers,
+        )
+
+    def send_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+        validator_store=None,
+    ):
+        base_url, parameters, request_headers, request_proxy = self._prepare_request(
+            endpoint, parameters, referer, proxy, headers
+        )
+        endpoint = endpoint.lower()
+        if validator_store is None:
+            validator_store = self.get_validator_store()
+
         proxies = None
         if request_proxy:
             proxies = {
@@ -121,59 +371,240 @@ class NBAHTTP:
                 "https": request_proxy,
             }
 
-        url = None
-        status_code = None
-        contents = None
-        file_path = None
+        cache_key = make_cache_key(base_url, parameters)
+        cache = self.get_cache()
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return self._load_response(
+                    cached.contents,
+                    cached.status_code,
+                    cached.url,
+                    raise_exception_on_error,
+                )
+
+        def fetch():
+            url = None
+            status_code = None
+            contents = None
+            response_headers = None
+            file_path = None
+            validators = None
+
+            if DEBUG and DEBUG_STORAGE:
+                url, file_path = self._get_debug_file_path(
+                    base_url, endpoint, parameters
+                )
+                contents = self._load_debug_file(file_path)
+
+            if contents:
+                contents = self.clean_contents(contents)
+            else:
+                validators = self._get_validators(validator_store, cache_key)
+                conditional_headers = self._get_conditional_headers(
+                    request_headers, validators
+                )
+
+                def send(attempt_timeout):
+                    return self._request(
+                        base_url,
+                        parameters,
+                        conditional_headers,
+                        proxies,
+                        attempt_timeout,
+                    )
+
+                retry_policy = self.get_retry_policy()
+                if retry_policy is None:
+                    url, status_code, contents, response_headers = send(timeout)
+                else:
+                    (
+                        url,
+                        status_code,
+                        contents,
+                        response_headers,
+                    ) = retry_policy.call(send, key=base_url, timeout=timeout)
+
+            data = self._load_validated_response(
+                validator_store,
+                cache_key,
+                validators,
+                url,
+                status_code,
+                contents,
+                response_headers,
+            )
 
-        # Sort parameters by key... for some reason this matters for some requests...
-        parameters = sorted(parameters.items(), key=lambda kv: kv[0])
+            if DEBUG and DEBUG_STORAGE:
+                self._save_debug_file(file_path, data.get_response(), url)
+            if cache is not None:
+                cache.set_response(cache_key, endpoint, data)
+            return data
 
-        if DEBUG and DEBUG_STORAGE:
-            print(endpoint, parameters)
-            directory_name = "debug_storage"
-            parameter_string = "&".join(
-                "{}={}".format(key, "" if val is None else quote_plus(str(val)))
-                for key, val in parameters
-            )
-            url = f"{base_url}?{parameter_string}"
-            print(url)
-            file_name = "{}-{}.txt".format(
-                endpoint, md5(parameter_string.encode("utf-8")).hexdigest()
-            )
-            file_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "debug", directory_name
-            )
-            if not os.path.exists(file_path):
-                os.makedirs(file_path)
-            file_path = os.path.join(file_path, file_name)
-            print(file_name, os.path.isfile(file_path))
-            if os.path.isfile(file_path):
-                with open(file_path) as f:
-                    contents = f.read()
-                print("loading from file...")
-
-        if not contents:
-            response = self.get_session().get(
-                url=base_url,
-                params=parameters,
-                headers=request_headers,
-                proxies=proxies,
-                timeout=timeout,
-            )
-            url = response.url
-            status_code = response.status_code
-            contents = response.text
+        single_flight = self.get_single_flight()
+        data = fetch() if single_flight is None else single_flight.do(cache_key, fetch)
+        return self._check_response(data, raise_exception_on_error)
 
-        contents = self.clean_contents(contents)
-        if DEBUG and DEBUG_STORAGE:
-            with open(file_path, "w") as f:
-                f.write(contents)
-            print(url)
 
-        data = self.nba_response(response=contents, status_code=status_code, url=url)
+class AsyncNBAHTTP(NBAHTTP):
+    """Asyncio counterpart of :class:`NBAHTTP` backed by an ``aiohttp`` session.
 
-        if raise_exception_on_error and not data.valid_json():
-            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+    Subclasses combine this class with a concrete synchronous client (for
+    example ``class AsyncNBAStatsHTTP(AsyncNBAHTTP, NBAStatsHTTP)``) so that the
+    base url, headers, ``clean_contents`` and response class are shared and
+    only the transport differs.
+    """
 
-        return data
+    _session = None
+
+    _session_loop = None
+
+    @classmethod
+    def get_session(cls):
+        if not AIOHTTP:
+            raise Exception(
+                "Import Missing - Failed to import aiohttp. "
+                "Install it with `pip install nba_api[async]`."
+            )
+        loop = asyncio.get_running_loop()
+        session = cls._session
+        # aiohttp sessions are bound to the loop that created them, so a session
+        # created by a previous ``asyncio.run`` cannot be reused.
+        if (
+            session is None
+            or session.closed
+            or (cls._session_loop is not None and cls._session_loop is not loop)
+        ):
+            import aiohttp
+
+            session = aiohttp.ClientSession()
+            cls._session = session
+            cls._session_loop = loop
+        return session
+
+    @classmethod
+    def set_session(cls, session) -> None:
+        cls._session = session
+        cls._session_loop = None
+
+    @classmethod
+    async def close_session(cls) -> None:
+        session = cls._session
+        cls._session = None
+        cls._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _request(self, base_url, parameters, request_headers, proxy, timeout):
+        request_timeout = None
+        if timeout is not None:
+            import aiohttp
+
+            request_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(base_url)
+
+        async with self.get_session().get(
+            base_url,
+            params=parameters,
+            headers=request_headers,
+            proxy=proxy,
+            timeout=request_timeout,
+        ) as response:
+            url = str(response.url)
+            status_code = response.status
+            response_headers = response.headers
+            contents = await response.read()
+
+        return url, status_code, self.clean_contents(contents), response_headers
+
+    async def _call_cache(self, cache, method, *args):
+        # File system and SQLite caches block on disk, so they run in a thread
+        # rather than on the event loop.
+        if isinstance(cache, MemoryCache):
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def send_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+        validator_store=None,
+    ):
+        base_url, parameters, request_headers, request_proxy = self._prepare_request(
+            endpoint, parameters, referer, proxy, headers
+        )
+        endpoint = endpoint.lower()
+        if validator_store is None:
+            validator_store = self.get_validator_store()
+
+        cache_key = make_cache_key(base_url, parameters)
+        cache = self.get_cache()
+        if cache is not None:
+            cached = await self._call_cache(cache, cache.get, cache_key)
+            if cached is not None:
+                return self._load_response(
+                    cached.contents,
+                    cached.status_code,
+                    cached.url,
+                    raise_exception_on_error,
+                )
+
+        # aiohttp does not drop None values or stringify them the way requests
+        # does, so match the query string requests would have sent.
+        parameters = [(key, str(val)) for key, val in parameters if val is not None]
+
+        async def fetch():
+            validators = self._get_validators(validator_store, cache_key)
+            conditional_headers = self._get_conditional_headers(
+                request_headers, validators
+            )
+
+            async def send(attempt_timeout):
+                return await self._request(
+                    base_url,
+                    parameters,
+                    conditional_headers,
+                    request_proxy,
+                    attempt_timeout,
+                )
+
+            retry_policy = self.get_retry_policy()
+            if retry_policy is None:
+                url, status_code, contents, response_headers = await send(timeout)
+            else:
+                (
+                    url,
+                    status_code,
+                    contents,
+                    response_headers,
+                ) = await retry_policy.call_async(send, key=base_url, timeout=timeout)
+
+            data = self._load_validated_response(
+                validator_store,
+                cache_key,
+                validators,
+                url,
+                status_code,
+                contents,
+                response_headers,
+            )
+            if cache is not None:
+                await self._call_cache(
+                    cache, cache.set_response, cache_key, endpoint, data
+                )
+            return data
+
+        single_flight = self.get_single_flight()
+        if single_flight is None:
+            data = await fetch()
+        else:
+            data = await single_flight.do_async(cache_key, fetch)
+        return self._check_response(data, raise_exception_on_error)
@@ -0,0 +1,161 @@
+"""Client-side rate limiting of requests per host.
+
+stats.nba.com drops connections once an undocumented request rate is
+exceeded. A ``RateLimiter`` attached with ``NBAHTTP.set_rate_limiter`` delays
+requests so each host stays within its own budget:
+
+```python
+from nba_api.library.http import NBAHTTP
+from nba_api.library.ratelimit import RateLimiter, TokenBucket
+
+NBAHTTP.set_rate_limiter(
+    RateLimiter(
+        {
+            "stats.nba.com": TokenBucket(rate=1.5, capacity=3),
+            "cdn.nba.com": TokenBucket(rate=10, capacity=20),
+        }
+    )
+)
+```
+
+Buckets are safe to share between threads and asyncio tasks. Use
+``FileTokenBucket`` to share a budget between processes.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class TokenBucket:
+    """Token bucket refilled with ``rate`` tokens per second.
+
+    Args:
+        rate: Sustained number of requests per second.
+        capacity: Largest burst of requests allowed after an idle period.
+            Defaults to ``max(1, rate)``.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = max(1.0, rate) if capacity is None else capacity
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens):
+        """Take ``tokens`` and return how long the caller must wait for them.
+
+        The bucket may go negative, which queues callers fairly: each one waits
+        for the tokens reserved before it to be refilled.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """Block the calling thread until ``tokens`` are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens=1):
+        """Wait on the running event loop until ``tokens`` are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared between processes through a file.
+
+    The bucket state is stored in ``path`` and updated under an exclusive
+    ``fcntl`` lock, so every process using the same path draws from one budget.
+    Only available on POSIX systems.
+    """
+
+    def __init__(self, rate, path, capacity=None):
+        if fcntl is None:
+            raise Exception("FileTokenBucket requires fcntl (POSIX systems only).")
+        super().__init__(rate, capacity)
+        self.path = path
+
+    def _reserve(self, tokens):
+        with self._lock, open(self.path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                    available = state["tokens"]
+                    updated_at = state["updated_at"]
+                except (ValueError, KeyError, TypeError):
+                    available = self.capacity
+                    updated_at = time.time()
+
+                now = time.time()
+                available = min(
+                    self.capacity, available + max(0.0, now - updated_at) * self.rate
+                )
+                available -= tokens
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": available, "updated_at": now}))
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
+
+
+class RateLimiter:
+    """Route requests to the token bucket of their host.
+
+    Args:
+        limits: Mapping of host name (e.g. ``"stats.nba.com"``) to the
+            ``TokenBucket`` limiting it. Hosts without a bucket are not limited.
+    """
+
+    def __init__(self, limits=None):
+        self.limits = {host.lower(): bucket for host, bucket in (limits or {}).items()}
+
+    def get_bucket(self, url):
+        host = urlsplit(url).hostname
+        if host is None:
+            return None
+        return self.limits.get(host.lower())
+
+    def acquire(self, url):
+        bucket = self.get_bucket(url)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
+
+    async def acquire_async(self, url):
+        bucket = self.get_bucket(url)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire_async()
@@ -0,0 +1,246 @@
+"""Retries with backoff and circuit breaking for HTTP requests.
+
+A ``RetryPolicy`` attached with ``NBAHTTP.set_retry_policy`` retries requests
+that time out, fail to connect, or come back with a retryable status code or
+an error body instead of JSON:
+
+```python
+from nba_api.library.http import NBAHTTP
+from nba_api.library.retry import CircuitBreaker, RetryPolicy
+
+NBAHTTP.set_retry_policy(
+    RetryPolicy(max_attempts=4, deadline=60, circuit_breaker=CircuitBreaker())
+)
+```
+
+Delays grow exponentially with full jitter, so that many clients retrying at
+once do not hit the server in lockstep. The optional ``CircuitBreaker`` stops
+sending requests to an endpoint after repeated failures and raises
+``CircuitOpenError`` right away until the endpoint has had time to recover.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import requests
+
+try:
+    import aiohttp
+
+    RETRYABLE_EXCEPTIONS = (
+        requests.Timeout,
+        requests.ConnectionError,
+        aiohttp.ClientError,
+        asyncio.TimeoutError,
+    )
+except ImportError:
+    RETRYABLE_EXCEPTIONS = (
+        requests.Timeout,
+        requests.ConnectionError,
+        asyncio.TimeoutError,
+    )
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# First character of a JSON object or array, as text or bytes.
+_JSON_STARTS = frozenset({"{", "[", b"{", b"["})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an endpoint whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive failed requests to an endpoint, the
+    circuit opens and requests to it raise ``CircuitOpenError`` without being
+    sent. Once ``recovery_timeout`` seconds have passed, a single trial request
+    is let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = {}
+        self._opened_at = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, key):
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            return (
+                opened_at is not None
+                and time.monotonic() - opened_at < self.recovery_timeout
+            )
+
+    def before_request(self, key):
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return
+            now = time.monotonic()
+            remaining = self.recovery_timeout - (now - opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"CircuitOpen: {key} failed {self._failures[key]} times in a "
+                    f"row; retry in {remaining:.1f}s."
+                )
+            # Let this request through as the trial and keep failing fast
+            # until it reports back, or until another recovery period passes.
+            self._opened_at[key] = now
+
+    def record_success(self, key):
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+
+    def record_failure(self, key):
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if key in self._opened_at or failures >= self.failure_threshold:
+                self._opened_at[key] = time.monotonic()
+
+    def reset(self):
+        with self._lock:
+            self._failures.clear()
+            self._opened_at.clear()
+
+
+class RetryPolicy:
+    """Retry failed requests with exponential backoff and full jitter.
+
+    Args:
+        max_attempts: Total number of attempts per request, including the first.
+        backoff_base: Upper bound of the first delay, in seconds. The bound
+            doubles after every attempt and the delay is drawn uniformly below it.
+        backoff_max: Largest upper bound of a delay, in seconds.
+        deadline: Total time in seconds a request may take across all attempts,
+            or ``None`` for no limit. Per-attempt timeouts are shortened to fit.
+        retry_status_codes: HTTP status codes that are retried.
+        circuit_breaker: Optional ``CircuitBreaker`` shared by all requests.
+    """
+
+    def __init__(
+        self,
+        max_attempts=4,
+        backoff_base=0.5,
+        backoff_max=10.0,
+        deadline=60.0,
+        retry_status_codes=RETRYABLE_STATUS_CODES,
+        circuit_breaker=None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.circuit_breaker = circuit_breaker
+
+    def get_backoff(self, attempt):
+        """Return the delay before retry number ``attempt`` (starting at 1)."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        )
+
+    def is_retryable_exception(self, exception):
+        return isinstance(exception, RETRYABLE_EXCEPTIONS)
+
+    def is_retryable_response(self, status_code, contents):
+        if status_code in self.retry_status_codes:
+            return True
+        if status_code is not None and 400 <= status_code < 500:
+            return False
+        # Answers to conditional requests have no body.
+        if status_code == 304:
+            return False
+        # stats.nba.com answers some transient failures with an error body
+        # (rewritten to XML by clean_contents) instead of JSON. The payloads
+        # are JSON objects or arrays, so the first character tells them apart
+        # without decoding every body twice.
+        if not contents:
+            return True
+        return contents.lstrip()[:1] not in _JSON_STARTS
+
+    def _get_attempt_timeout(self, started_at, timeout):
+        if self.deadline is None:
+            return timeout
+        remaining = max(0.0, self.deadline - (time.monotonic() - started_at))
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def _get_retry_delay(self, started_at, attempt):
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.get_backoff(attempt)
+        if (
+            self.deadline is not None
+            and time.monotonic() - started_at + delay >= self.deadline
+        ):
+            return None
+        return delay
+
+    def _check_result(self, key, result, error):
+        """Record the outcome of an attempt and return whether to retry it."""
+        breaker = self.circuit_breaker
+        if error is not None:
+            if not self.is_retryable_exception(error):
+                raise error
+        elif not self.is_retryable_response(result[1], result[2]):
+            if breaker is not None:
+                breaker.record_success(key)
+            return False
+        if breaker is not None:
+            breaker.record_failure(key)
+        return True
+
+    def call(self, send, key, timeout=None):
+        """Call ``send(timeout)`` until it succeeds or retries run out.
+
+        ``send`` returns a ``(url, status_code, contents, headers)`` tuple. When
+        retries run out the last response is returned, or the last exception
+        re-raised.
+        """
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(key)
+            result = error = None
+            try:
+                result = send(self._get_attempt_timeout(started_at, timeout))
+            except Exception as e:
+                error = e
+            if not self._check_result(key, result, error):
+                return result
+            attempt += 1
+            delay = self._get_retry_delay(started_at, attempt)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return result
+            time.sleep(delay)
+
+    async def call_async(self, send, key, timeout=None):
+        """Awaitable version of ``call`` for a coroutine function ``send``."""
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(key)
+            result = error = None
+            try:
+                result = await send(self._get_attempt_timeout(started_at, timeout))
+            except Exception as e:
+                error = e
+            if not self._check_result(key, result, error):
+                return result
+            attempt += 1
+            delay = self._get_retry_delay(started_at, attempt)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return result
+            await asyncio.sleep(delay)
@@ -0,0 +1,98 @@
+"""Coalescing of identical concurrent requests.
+
+With a ``SingleFlight`` attached through ``NBAHTTP.set_single_flight``,
+callers that ask for the same url and parameters while a request for them is
+already in flight wait for that request instead of sending their own, and all
+receive the same response object:
+
+```python
+from nba_api.library.http import NBAHTTP
+from nba_api.library.singleflight import SingleFlight
+
+NBAHTTP.set_single_flight(SingleFlight())
+```
+
+Threads are coalesced with threads and asyncio tasks with tasks running on the
+same event loop.
+"""
+
+import asyncio
+import threading
+import weakref
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = weakref.WeakKeyDictionary()
+
+    def do(self, key, fn):
+        """Return ``fn()``, or the result of the call already running for ``key``.
+
+        Exceptions raised by ``fn`` are raised in every caller sharing the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key, fn):
+        """Awaitable version of ``do`` for a coroutine function ``fn``.
+
+        The shared call runs in its own task, so cancelling one caller does not
+        cancel the request for the others.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = self._tasks.setdefault(loop, {})
+        task = tasks.get(key)
+        if task is None:
+            task = loop.create_task(fn())
+            tasks[key] = task
+
+            def done(finished):
+                if tasks.get(key) is finished:
+                    del tasks[key]
+                # Avoid "exception was never retrieved" when every caller
+                # was cancelled before the task finished.
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(done)
+        return await asyncio.shield(task)
+
+    def in_flight(self):
+        """Return the number of calls currently running."""
+        with self._lock:
+            count = len(self._calls)
+        return count + sum(len(tasks) for tasks in list(self._tasks.values()))
@@ -1,5 +1,7 @@
 import json
 
+from nba_api.live.nba.library.http import NBALiveHTTP
+
 
 class Endpoint:
     class DataSet:
@@ -17,6 +19,53 @@ class Endpoint:
         def get_dict(self):
             return self.data
 
+        def get_seconds(self, key):
+            """Return a clock or minutes field of every row as float seconds.
+
+            ``key`` is a field of the rows (``"clock"`` of play-by-play
+            actions) or a dotted path (``"statistics.minutes"`` of box score
+            players). ``"PT11M58.00S"`` values are decoded for all rows at
+            once by ``nba_api.library.clock``; missing values are ``NaN``.
+            """
+            from nba_api.library.clock import to_seconds
+
+            return to_seconds(self._get_values(key))
+
+        def get_tenths(self, key, missing=0):
+            """Return a clock or minutes field of every row as integer tenths
+            of a second, as ``get_seconds``. Missing values are ``missing``."""
+            from nba_api.library.clock import to_tenths
+
+            return to_tenths(self._get_values(key), missing=missing)
+
+        def _get_values(self, key):
+            rows = self.data if isinstance(self.data, list) else [self.data]
+            *path, name = key.split(".")
+            values = []
+            for row in rows:
+                for part in path:
+                    row = row.get(part) or {}
+                values.append(row.get(name))
+            return values
+
+    nba_http = NBALiveHTTP
+
+    async def fetch(self):
+        """Send the request on the running event loop and load the response.
+
+        Create the endpoint with ``get_request=False`` and await this method
+        instead of ``get_request()`` to issue many requests concurrently.
+        """
+        self.nba_response = await self.nba_http.get_async_http()().send_api_request(
+            endpoint=self.endpoint_url.format(game_id=getattr(self, "game_id", None)),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+        return self
+
     def get_request_url(self):
         return self.nba_response.get_url()
 
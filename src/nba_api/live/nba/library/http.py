@@ -20,6 +20,16 @@ class NBALiveHTTP(http.NBAHTTP):
     headers = STATS_HEADERS
 
     def clean_contents(self, contents):
-        if '{"Message":"An error has occurred."}' in contents:
+        message = '{"Message":"An error has occurred."}'
+        if isinstance(contents, bytes):
+            message = message.encode()
+        if message in contents:
             return "<Error><Message>An error has occurred.</Message></Error>"
         return contents
+
+
+class AsyncNBALiveHTTP(http.AsyncNBAHTTP, NBALiveHTTP):
+    pass
+
+
+NBALiveHTTP.async_http = AsyncNBALiveHTTP
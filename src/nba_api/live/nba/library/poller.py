@@ -0,0 +1,241 @@
+"""Incremental polling of live play-by-play.
+
+``live.nba.endpoints.PlayByPlay`` downloads and wraps the whole
+``game.actions`` list every time it is created. ``PlayByPlayPoller`` keeps,
+per game, the last response and the ``edited`` timestamp of every action
+seen, and returns only the actions that are new or edited since the previous
+poll:
+
+- Requests go through ``NBALiveHTTP.send_api_request``, with its session,
+  rate limiter, retry policy, cache and single-flight. They are conditional
+  (see ``nba_api.library.conditional``): the poller keeps a
+  ``ValidatorStore`` with one entry per game, so an unchanged game costs a
+  ``304 Not Modified`` without a body, and the previous response is returned
+  as is.
+- A body identical to the previous one, from a server that ignores the
+  conditional headers or from the cache, is not decoded again.
+- Otherwise the actions are compared with the previous ones by
+  ``actionNumber`` and ``edited``, without building ``DataSet`` objects.
+
+```python
+import time
+
+from nba_api.live.nba.library.poller import PlayByPlayPoller
+
+poller = PlayByPlayPoller(["0022000180", "0022000181"])
+while True:
+    for game_id, action in poller.poll():
+        print(game_id, action["actionNumber"], action["description"])
+    time.sleep(5)
+```
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from nba_api.library.cache import make_cache_key
+from nba_api.library.conditional import ValidatorStore
+from nba_api.library.http import NBAResponse
+from nba_api.live.nba.endpoints.playbyplay import PlayByPlay
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+# Status codes of games whose play-by-play is not published yet.
+NOT_PUBLISHED_STATUS_CODES = frozenset({403, 404})
+
+
+class GameState:
+    """What a ``PlayByPlayPoller`` has seen of one game.
+
+    Attributes:
+        game_id: Game ID.
+        action_number: Highest ``actionNumber`` seen, or ``None``.
+        order_number: Highest ``orderNumber`` seen, or ``None``.
+        edited: Latest ``edited`` timestamp seen, or ``None``.
+        last_action: Last action of the feed, or ``None``.
+        polls: Number of polls.
+        not_modified: Number of polls answered with an unchanged feed.
+    """
+
+    __slots__ = (
+        "game_id",
+        "action_number",
+        "order_number",
+        "edited",
+        "last_action",
+        "polls",
+        "not_modified",
+        "_response",
+        "_contents",
+        "_editions",
+    )
+
+    def __init__(self, game_id: str) -> None:
+        self.game_id = game_id
+        self.action_number = None
+        self.order_number = None
+        self.edited = None
+        self.last_action = None
+        self.polls = 0
+        self.not_modified = 0
+        self._response = None
+        self._contents = None
+        # actionNumber -> edited timestamp of every action of the last poll.
+        self._editions = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"GameState(game_id={self.game_id!r}, "
+            f"action_number={self.action_number!r}, "
+            f"order_number={self.order_number!r}, edited={self.edited!r})"
+        )
+
+    def update(self, actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Record ``actions``, the full list of a game's actions, and return
+        those that are new or edited since the previous call."""
+        previous = self._editions
+        editions = {}
+        changed = []
+        for action in actions:
+            number = action.get("actionNumber")
+            edited = action.get("edited")
+            editions[number] = edited
+            if number not in previous or previous[number] != edited:
+                changed.append(action)
+        # Actions removed from the feed are forgotten, so that they are
+        # returned again if they come back.
+        self._editions = editions
+        self.last_action = actions[-1] if actions else None
+
+        for action in changed:
+            number = action.get("actionNumber")
+            order = action.get("orderNumber")
+            edited = action.get("edited")
+            if number is not None and (
+                self.action_number is None or number > self.action_number
+            ):
+                self.action_number = number
+            if order is not None and (
+                self.order_number is None or order > self.order_number
+            ):
+                self.order_number = order
+            if edited is not None and (self.edited is None or edited > self.edited):
+                self.edited = edited
+        return changed
+
+    def update_response(self, response: NBAResponse) -> list[dict[str, Any]]:
+        """Record a successful play-by-play ``response`` and return the
+        actions that are new or edited since the previous one.
+
+        The previous response, as returned for ``304 Not Modified``, or a body
+        identical to it is counted in ``not_modified`` and not decoded.
+
+        Raises:
+            Exception: If the body is not JSON, such as the error body of the
+                CDN.
+        """
+        if response is self._response:
+            self.not_modified += 1
+            return []
+        contents = response.get_response()
+        if contents == self._contents:
+            self._response = response
+            self.not_modified += 1
+            return []
+        if not response.valid_json():
+            raise Exception(
+                f"Failed to poll the play-by-play of game {self.game_id}: "
+                "invalid response."
+            )
+        self._response = response
+        self._contents = contents
+        game = response.get_dict().get("game") or {}
+        return self.update(game.get("actions") or [])
+
+
+class PlayByPlayPoller:
+    """Polls the live play-by-play of games, returning only the actions that
+    are new or edited since the previous poll of each game.
+
+    The first poll of a game returns all of its actions.
+
+    Attributes:
+        validator_store: ``ValidatorStore`` of the play-by-play requests,
+            bounded to one entry per polled game.
+
+    Args:
+        game_ids: Games to poll.
+        proxy: Proxy, as for the endpoints.
+        headers: Request headers; defaults to ``NBALiveHTTP.headers``.
+        timeout: Request timeout in seconds.
+    """
+
+    endpoint_url = PlayByPlay.endpoint_url
+
+    def __init__(
+        self,
+        game_ids: Iterable[str] = (),
+        proxy: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = 30,
+    ) -> None:
+        self.proxy = proxy
+        self.headers = headers
+        self.timeout = timeout
+        self.games: dict[str, GameState] = {}
+        self.validator_store = ValidatorStore(max_entries=1)
+        for game_id in game_ids:
+            self.add_game(game_id)
+
+    def add_game(self, game_id: str) -> GameState:
+        """Start polling ``game_id``; returns its state."""
+        state = self.games.get(game_id)
+        if state is None:
+            state = self.games[game_id] = GameState(game_id)
+            self.validator_store.max_entries = len(self.games)
+        return state
+
+    def remove_game(self, game_id: str) -> None:
+        """Stop polling ``game_id`` and forget its state."""
+        if self.games.pop(game_id, None) is None:
+            return
+        endpoint = self.endpoint_url.format(game_id=game_id)
+        self.validator_store.delete(
+            make_cache_key(NBALiveHTTP.base_url.format(endpoint=endpoint), {})
+        )
+        self.validator_store.max_entries = max(len(self.games), 1)
+
+    def poll(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Poll every game once and yield ``(game_id, action)`` for each new
+        or edited action, in feed order within each game."""
+        for game_id in list(self.games):
+            for action in self.poll_game(game_id):
+                yield game_id, action
+
+    def poll_game(self, game_id: str) -> list[dict[str, Any]]:
+        """Poll one game and return its new or edited actions.
+
+        Games whose play-by-play is not published yet (before tip-off) have
+        no actions.
+
+        Raises:
+            Exception: If the request fails with another status code.
+        """
+        state = self.add_game(game_id)
+        state.polls += 1
+        response = NBALiveHTTP().send_api_request(
+            endpoint=self.endpoint_url.format(game_id=game_id),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+            validator_store=self.validator_store,
+        )
+        status_code = response.get_status_code()
+        if status_code in NOT_PUBLISHED_STATUS_CODES:
+            return []
+        if status_code != 200:
+            raise Exception(
+                f"Failed to poll the play-by-play of game {game_id}: "
+                f"status code {status_code}."
+            )
+        return state.update_response(response)
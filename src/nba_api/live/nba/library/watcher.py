@@ -0,0 +1,409 @@
+"""Watching the live play-by-play of a day's games on one event loop.
+
+``LiveWatcher`` polls the scoreboard and, for each game, the play-by-play at
+an interval that depends on the state of the game:
+
+- Scheduled games are not polled. The scoreboard itself is polled slowly
+  until the earliest ``gameTimeUTC``, then at ``PollSchedule.scoreboard``
+  until the games start.
+- Live games are polled every ``PollSchedule.live`` seconds, and more slowly
+  after a timeout, at the end of a period and at halftime, as told by the
+  last action of the feed and ``gameStatusText``.
+- Final games are polled once more, for the last edits, then no longer. The
+  watch ends when every game is final.
+- Games missing from the scoreboard are not polled: a game never listed is
+  dropped, and a game that left it, as the scoreboard turns to the next day,
+  is polled a last time as a final game.
+- A play-by-play poll that fails is retried at the interval of the game's
+  phase, without stopping the other games.
+
+Every request goes through ``AsyncNBALiveHTTP``: games that are due are
+polled concurrently, and the watcher's ``ValidatorStore``, with one entry per
+feed, makes the requests conditional, so an unchanged feed costs a
+``304 Not Modified``.
+
+```python
+import asyncio
+
+from nba_api.live.nba.library.watcher import LiveWatcher
+
+
+async def main():
+    async for game_id, action in LiveWatcher().watch():
+        print(game_id, action["actionNumber"], action["description"])
+
+
+asyncio.run(main())
+```
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+from typing import Any
+
+from nba_api.library.cache import GAME_STATUS_FINAL
+from nba_api.library.conditional import ValidatorStore
+from nba_api.live.nba.endpoints.playbyplay import PlayByPlay
+from nba_api.live.nba.endpoints.scoreboard import ScoreBoard
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP
+from nba_api.live.nba.library.poller import NOT_PUBLISHED_STATUS_CODES, GameState
+
+GAME_STATUS_LIVE = 2
+
+# Phases of a game, from the scoreboard and the last action of its feed.
+SCHEDULED = "scheduled"
+LIVE = "live"
+TIMEOUT = "timeout"
+PERIOD_BREAK = "period_break"
+HALFTIME = "halftime"
+FINAL = "final"
+
+
+def get_phase(
+    game_status: int | None,
+    game_status_text: str | None = None,
+    last_action: dict[str, Any] | None = None,
+    period: int | None = None,
+) -> str:
+    """Return the phase of a game.
+
+    Args:
+        game_status: ``gameStatus`` of the scoreboard: 1 scheduled, 2 live,
+            3 final. Unknown games are scheduled.
+        game_status_text: ``gameStatusText`` of the scoreboard, such as
+            ``"Q3 5:12"``, ``"Half"`` or ``"End Q1"``.
+        last_action: Last action of the play-by-play feed.
+        period: ``period`` of the scoreboard. A last action of an earlier
+            period is stale and ignored.
+    """
+    if game_status == GAME_STATUS_FINAL:
+        return FINAL
+    if game_status != GAME_STATUS_LIVE:
+        return SCHEDULED
+    text = (game_status_text or "").strip().lower()
+    if text.startswith("half"):
+        return HALFTIME
+    if last_action and (period is None or last_action.get("period", period) >= period):
+        action_type = last_action.get("actionType")
+        if action_type == "timeout":
+            return TIMEOUT
+        if action_type == "period" and last_action.get("subType") == "end":
+            return HALFTIME if last_action.get("period") == 2 else PERIOD_BREAK
+    if text.startswith("end"):
+        return PERIOD_BREAK
+    return LIVE
+
+
+class PollSchedule:
+    """Polling intervals of a ``LiveWatcher``, in seconds.
+
+    Args:
+        live: Play-by-play of games in play.
+        timeout: Play-by-play of games stopped for a timeout.
+        period_break: Play-by-play of games between periods.
+        halftime: Play-by-play of games at halftime.
+        scoreboard: Scoreboard, while games are live or due to start.
+        idle: Longest wait for the scoreboard before games are due to start.
+    """
+
+    def __init__(
+        self,
+        live: float = 3,
+        timeout: float = 15,
+        period_break: float = 30,
+        halftime: float = 60,
+        scoreboard: float = 15,
+        idle: float = 600,
+    ) -> None:
+        self.live = live
+        self.timeout = timeout
+        self.period_break = period_break
+        self.halftime = halftime
+        self.scoreboard = scoreboard
+        self.idle = idle
+
+    def get_interval(self, phase: str) -> float | None:
+        """Return the play-by-play interval of ``phase``, or ``None`` for
+        games that are not polled."""
+        return {
+            LIVE: self.live,
+            TIMEOUT: self.timeout,
+            PERIOD_BREAK: self.period_break,
+            HALFTIME: self.halftime,
+        }.get(phase)
+
+
+class WatchedGame:
+    """What a ``LiveWatcher`` knows of one game.
+
+    Attributes:
+        game_id: Game ID.
+        game_status: ``gameStatus`` of the scoreboard, or ``None``.
+        game_status_text: ``gameStatusText`` of the scoreboard.
+        game_time_utc: ``gameTimeUTC`` of the scoreboard.
+        period: ``period`` of the scoreboard.
+        phase: Phase of the game, see ``get_phase``.
+        last_action: Last action of the play-by-play feed, or ``None``.
+        play_by_play: ``GameState`` of the play-by-play.
+        next_poll: Event loop time of the next play-by-play poll, or
+            ``None`` if the game is not polled.
+        done: Whether the final play-by-play has been polled, or the game
+            is not on the scoreboard.
+        error: Exception of the last play-by-play poll, or ``None`` if it
+            succeeded.
+    """
+
+    __slots__ = (
+        "game_id",
+        "game_status",
+        "game_status_text",
+        "game_time_utc",
+        "period",
+        "phase",
+        "last_action",
+        "play_by_play",
+        "next_poll",
+        "done",
+        "error",
+    )
+
+    def __init__(self, game_id: str) -> None:
+        self.game_id = game_id
+        self.game_status = None
+        self.game_status_text = None
+        self.game_time_utc = None
+        self.period = None
+        self.phase = SCHEDULED
+        self.last_action = None
+        self.play_by_play = GameState(game_id)
+        self.next_poll = None
+        self.done = False
+        self.error = None
+
+    def __repr__(self) -> str:
+        return (
+            f"WatchedGame(game_id={self.game_id!r}, phase={self.phase!r}, "
+            f"game_status_text={self.game_status_text!r})"
+        )
+
+    def get_tip_off(self) -> float | None:
+        """Return ``gameTimeUTC`` as a timestamp, or ``None``."""
+        if not self.game_time_utc:
+            return None
+        try:
+            return datetime.fromisoformat(
+                self.game_time_utc.replace("Z", "+00:00")
+            ).timestamp()
+        except ValueError:
+            return None
+
+
+class LiveWatcher:
+    """Watches the live play-by-play of the games of the scoreboard.
+
+    Attributes:
+        validator_store: ``ValidatorStore`` of the requests, bounded to one
+            entry per watched game and one for the scoreboard.
+
+    Args:
+        game_ids: Games to watch; defaults to every game of the scoreboard.
+        schedule: Polling intervals; defaults to ``PollSchedule()``.
+        proxy: Proxy, as for the endpoints.
+        headers: Request headers; defaults to ``NBALiveHTTP.headers``.
+        timeout: Request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        game_ids: Iterable[str] | None = None,
+        schedule: PollSchedule | None = None,
+        proxy: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = 30,
+    ) -> None:
+        self.game_ids = None if game_ids is None else dict.fromkeys(game_ids)
+        self.schedule = PollSchedule() if schedule is None else schedule
+        self.proxy = proxy
+        self.headers = headers
+        self.timeout = timeout
+        self.games: dict[str, WatchedGame] = {}
+        for game_id in self.game_ids or ():
+            self.games[game_id] = WatchedGame(game_id)
+        self.validator_store = ValidatorStore(max_entries=len(self.games) + 1)
+        self.scoreboard_polls = 0
+        self.next_scoreboard_poll = 0.0
+
+    def is_done(self) -> bool:
+        """Return whether every watched game is over."""
+        return all(game.done for game in self.games.values())
+
+    async def watch(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Watch the games until they are all final, yielding
+        ``(game_id, action)`` for each new or edited action.
+
+        The first poll of a game yields all of its actions. A game whose
+        poll fails is polled again later, see ``WatchedGame.error``.
+
+        Raises:
+            Exception: If the scoreboard request fails.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            if loop.time() >= self.next_scoreboard_poll:
+                await self.poll_scoreboard()
+                self.next_scoreboard_poll = loop.time() + self.get_scoreboard_interval()
+
+            now = loop.time()
+            due = [
+                game
+                for game in self.games.values()
+                if game.next_poll is not None and game.next_poll <= now
+            ]
+            results = await asyncio.gather(
+                *(self.poll_game(game.game_id) for game in due),
+                return_exceptions=True,
+            )
+            for game, result in zip(due, results, strict=True):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    self._retry_later(game, result)
+                    continue
+                for action in result:
+                    yield game.game_id, action
+
+            if self.is_done():
+                return
+            wake_up = min(
+                [self.next_scoreboard_poll]
+                + [
+                    game.next_poll
+                    for game in self.games.values()
+                    if game.next_poll is not None
+                ]
+            )
+            await asyncio.sleep(max(wake_up - loop.time(), 0))
+
+    def get_scoreboard_interval(self) -> float:
+        """Return the time until the next scoreboard poll."""
+        schedule = self.schedule
+        waiting = [game for game in self.games.values() if not game.done]
+        if any(game.phase != SCHEDULED for game in waiting):
+            return schedule.scoreboard
+        tip_offs = [game.get_tip_off() for game in waiting]
+        tip_offs = [tip_off for tip_off in tip_offs if tip_off is not None]
+        if not tip_offs:
+            return schedule.idle
+        # Games rarely start before their tip-off time, often after it.
+        wait = min(tip_offs) - time.time()
+        return min(max(wait, schedule.scoreboard), schedule.idle)
+
+    async def poll_scoreboard(self) -> list[WatchedGame]:
+        """Poll the scoreboard and update the watched games; returns them.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        response = await self._send(ScoreBoard.endpoint_url)
+        self.scoreboard_polls += 1
+        status_code = response.get_status_code()
+        if status_code != 200:
+            raise Exception(
+                f"Failed to poll the scoreboard: status code {status_code}."
+            )
+        scoreboard = response.get_dict().get("scoreboard") or {}
+        now = asyncio.get_running_loop().time()
+        listed = set()
+        for data in scoreboard.get("games") or []:
+            game_id = data.get("gameId")
+            if self.game_ids is not None and game_id not in self.game_ids:
+                continue
+            listed.add(game_id)
+            game = self.games.get(game_id)
+            if game is None:
+                game = self.games[game_id] = WatchedGame(game_id)
+                self.validator_store.max_entries = len(self.games) + 1
+            if game.done:
+                continue
+            game.game_status = data.get("gameStatus")
+            game.game_status_text = data.get("gameStatusText")
+            game.game_time_utc = data.get("gameTimeUTC")
+            game.period = data.get("period")
+            previous = game.phase
+            game.phase = get_phase(
+                game.game_status, game.game_status_text, game.last_action, game.period
+            )
+            if game.phase != previous:
+                # Started, or became final: poll the play-by-play now.
+                game.next_poll = None if game.phase == SCHEDULED else now
+
+        for game in self.games.values():
+            if game.done or game.game_id in listed:
+                continue
+            if game.game_status is None:
+                # Never listed: not a game of the day.
+                game.done = True
+                game.next_poll = None
+            elif game.phase != FINAL:
+                # Left the scoreboard of the next day: poll it a last time.
+                game.phase = FINAL
+                game.next_poll = now
+        return list(self.games.values())
+
+    async def poll_game(self, game_id: str) -> list[dict[str, Any]]:
+        """Poll the play-by-play of one game, schedule its next poll and
+        return its new or edited actions.
+
+        Raises:
+            Exception: If the request fails with an unexpected status code.
+        """
+        game = self.games[game_id]
+        state = game.play_by_play
+        response = await self._send(PlayByPlay.endpoint_url.format(game_id=game_id))
+        state.polls += 1
+        status_code = response.get_status_code()
+        actions = []
+        if status_code == 200:
+            actions = state.update_response(response)
+            game.last_action = state.last_action
+        elif status_code not in NOT_PUBLISHED_STATUS_CODES:
+            raise Exception(
+                f"Failed to poll the play-by-play of game {game_id}: "
+                f"status code {status_code}."
+            )
+        game.error = None
+
+        if game.phase == FINAL:
+            game.done = True
+            game.next_poll = None
+        else:
+            game.phase = get_phase(
+                game.game_status, game.game_status_text, game.last_action, game.period
+            )
+            interval = self.schedule.get_interval(game.phase)
+            game.next_poll = (
+                None
+                if interval is None
+                else asyncio.get_running_loop().time() + interval
+            )
+        return actions
+
+    def _retry_later(self, game, error):
+        game.error = error
+        interval = self.schedule.get_interval(game.phase)
+        if interval is None:
+            # A final game is polled a last time, as if it were live.
+            interval = self.schedule.live
+        game.next_poll = asyncio.get_running_loop().time() + interval
+
+    async def _send(self, endpoint):
+        return await AsyncNBALiveHTTP().send_api_request(
+            endpoint=endpoint,
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+            validator_store=self.validator_store,
+        )
@@ -1,19 +1,67 @@
 import json
-from typing import Any
+from collections.abc import Iterator
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
+from nba_api.stats.library.http import NBAStatsHTTP
+from nba_api.stats.library.schema import build_data_frame, get_schema
 
-try:
-    from pandas import DataFrame, MultiIndex
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+    from pandas import DataFrame
 
-    PANDAS = True
-except ImportError:
-    PANDAS = False
-    DataFrame = Any
-    MultiIndex = Any
+# pandas, pyarrow and polars are only imported once a frame or table is
+# requested, so that importing endpoints stays fast.
+PANDAS = find_spec("pandas") is not None
+PYARROW = find_spec("pyarrow") is not None
+POLARS = find_spec("polars") is not None
+
+
+class _LazyDataSetList:
+    """``Endpoint.data_sets``, created on first access and cached on the
+    instance. Endpoints that assign ``self.data_sets`` themselves bypass it."""
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if instance._data_sets is None:
+            return None
+        data_sets = [instance.get_data_set(name) for name in instance._data_sets]
+        instance.__dict__["data_sets"] = data_sets
+        return data_sets
 
 
 class Endpoint:
+    class LazyDataSet:
+        """Named data set attribute of an endpoint, created on first access.
+
+        Declared on generated endpoints, e.g.
+        ``league_game_log = Endpoint.LazyDataSet("LeagueGameLog")``. Is
+        ``None`` until a response is loaded, and raises ``AttributeError`` if
+        the loaded response has no such data set.
+        """
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def __set_name__(self, owner: type, attribute: str) -> None:
+            self.attribute = attribute
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            if instance._data_sets is None:
+                return None
+            try:
+                return instance.get_data_set(self.name)
+            except KeyError:
+                raise AttributeError(
+                    f"'{type(instance).__name__}' object has no attribute "
+                    f"'{self.attribute}': data set '{self.name}' is not loaded"
+                ) from None
+
     class DataSet:
         key: str | None = None
         data: dict[str, Any] = {}
@@ -29,9 +77,19 @@ class Endpoint:
             """Return the data as a dictionary."""
             return self.data
 
-        def get_data_frame(self) -> DataFrame:
+        def get_data_frame(
+            self, typed: bool = False, column_types: dict[str, str] | None = None
+        ) -> "DataFrame":
             """Return the data as a pandas DataFrame.
 
+            Args:
+                typed: Build the frame column by column with the types of
+                    ``nba_api.stats.library.schema`` (``int64`` IDs,
+                    ``float32`` percentages, ``Int16`` counts, ``category``
+                    abbreviations) instead of letting pandas infer them.
+                column_types: Types overriding the type map, by column name.
+                    Only used when ``typed`` is true.
+
             Raises:
                 Exception: If pandas is not installed.
             """
@@ -39,42 +97,208 @@ class Endpoint:
                 raise Exception(
                     "Import Missing - Failed to import DataFrame from pandas."
                 )
+            from pandas import DataFrame, MultiIndex
 
             if "headers" not in self.data or not self.data["headers"]:
                 return DataFrame()
 
             if isinstance(self.data["headers"][0], str):
+                if typed:
+                    return build_data_frame(
+                        self.data["headers"], self.data["data"], column_types
+                    )
                 return DataFrame(self.data["data"], columns=self.data["headers"])
 
             else:  # Multiple levels of column names
-                levels = []
-                level_names = []
-                for i in range(
-                    len(self.data["headers"])
-                ):  # Extend column names for level to full length
-                    level = self.data["headers"][i]
-                    level_names.append(
-                        level["name"] if "name" in level else "LEVEL_" + str(i)
-                    )
-                    column_names = (
-                        [""] * level["columnsToSkip"]
-                        if "columnsToSkip" in level
-                        else []
-                    )
-                    column_names += list(
-                        np.repeat(
-                            np.array(level["columnNames"]),
-                            level.get("columnSpan", 1),
-                        )
-                    )
-                    levels.append(column_names)
+                level_names, levels = self._get_header_levels()
                 midx = MultiIndex.from_arrays(
                     levels, names=level_names
                 )  # Use MultiIndex for dataframe columns
                 return DataFrame(self.data["data"], columns=midx)
 
+        def get_arrow_table(self) -> "pa.Table":
+            """Return the data as a pyarrow Table.
+
+            Columns are built straight from the rows, without going through
+            pandas. Multi-level headers are flattened by joining the names
+            of each level with ``_`` (``Restricted Area_FGM``).
+
+            Raises:
+                Exception: If pyarrow is not installed.
+            """
+            if not PYARROW:
+                raise Exception("Import Missing - Failed to import pyarrow.")
+            import pyarrow as pa
+
+            names, columns = self._get_columns()
+            return pa.Table.from_arrays(
+                [_to_arrow_array(values) for values in columns], names=names
+            )
+
+        def get_polars(self) -> "pl.DataFrame":
+            """Return the data as a polars DataFrame.
+
+            Columns are built straight from the rows, without going through
+            pandas. Multi-level headers are flattened as in
+            ``get_arrow_table``.
+
+            Raises:
+                Exception: If polars is not installed.
+            """
+            if not POLARS:
+                raise Exception("Import Missing - Failed to import polars.")
+            import polars as pl
+
+            names, columns = self._get_columns()
+            return pl.DataFrame(
+                [
+                    pl.Series(name, values, strict=False)
+                    for name, values in zip(names, columns, strict=True)
+                ]
+            )
+
+        def get_seconds(self, column: str) -> "np.ndarray":
+            """Return a clock or minutes column (``clock``, ``PCTIMESTRING``,
+            ``MIN``, ``minutes``) as float seconds.
+
+            ``"PT11M58.00S"`` and ``"11:58"`` values are decoded for the whole
+            column at once by ``nba_api.library.clock``; numeric values are
+            minutes. Missing values are ``NaN``.
+
+            Raises:
+                KeyError: If the data set has no column ``column``.
+            """
+            from nba_api.library.clock import to_seconds
+
+            return to_seconds(self._get_column(column))
+
+        def get_tenths(self, column: str, missing: int = 0) -> "np.ndarray":
+            """Return a clock or minutes column as integer tenths of a
+            second, as ``get_seconds``. Missing values are ``missing``.
+
+            Raises:
+                KeyError: If the data set has no column ``column``.
+            """
+            from nba_api.library.clock import to_tenths
+
+            return to_tenths(self._get_column(column), missing=missing)
+
+        def _get_column(self, name: str) -> list[Any]:
+            """Return the values of column ``name``."""
+            headers = self.data.get("headers") or []
+            if name not in headers:
+                raise KeyError(name)
+            index = headers.index(name)
+            return [row[index] for row in self.data.get("data") or []]
+
+        def _get_header_levels(self) -> tuple[list[str], list[list[str]]]:
+            """Return the level names and the full-length column names of
+            each level of multi-level headers."""
+            levels = []
+            level_names = []
+            for i in range(
+                len(self.data["headers"])
+            ):  # Extend column names for level to full length
+                level = self.data["headers"][i]
+                level_names.append(
+                    level["name"] if "name" in level else "LEVEL_" + str(i)
+                )
+                column_names = (
+                    [""] * level["columnsToSkip"] if "columnsToSkip" in level else []
+                )
+                column_span = level.get("columnSpan", 1)
+                column_names += [
+                    column_name
+                    for column_name in level["columnNames"]
+                    for _ in range(column_span)
+                ]
+                levels.append(column_names)
+            return level_names, levels
+
+        def _get_columns(self) -> tuple[list[str], list[list[Any]]]:
+            """Return the flat column names and the column-major data."""
+            headers = self.data.get("headers") or []
+            if headers and not isinstance(headers[0], str):
+                _, levels = self._get_header_levels()
+                headers = [
+                    "_".join(str(name) for name in names if name)
+                    for names in zip(*levels, strict=True)
+                ]
+            rows = self.data.get("data") or []
+            if rows:
+                columns = [list(values) for values in zip(*rows, strict=True)]
+            else:
+                columns = [[] for _ in headers]
+            return headers, columns
+
+    nba_http: type[NBAStatsHTTP] = NBAStatsHTTP
     nba_response: Any = None
-    data_sets: list[DataSet] = []
+    data_sets: list[DataSet] | None = _LazyDataSetList()
+    _data_sets: dict[str, dict[str, Any]] | None = None
+    _data_set_cache: dict[str, DataSet] = {}
+    expected_data: dict[str, list[str]] = {}
+    # Per-endpoint overrides of the column type map used by typed DataFrames.
+    column_types: dict[str, str] = {}
+
+    @classmethod
+    def get_schema(cls) -> dict[str, dict[str, str]]:
+        """Return the column types of each expected data set.
+
+        Derived from ``expected_data`` with the type map of
+        ``nba_api.stats.library.schema`` and the endpoint's ``column_types``.
+        """
+        return {
+            name: get_schema(columns, cls.column_types)
+            for name, columns in cls.expected_data.items()
+        }
+
+    def load_data_sets(self, data_sets: dict[str, dict[str, Any]]) -> None:
+        """Store the data sets of a response.
+
+        ``DataSet`` objects for ``data_sets`` and the ``LazyDataSet``
+        attributes are only created when they are first accessed.
+
+        Args:
+            data_sets: Data sets by name, as returned by
+                ``NBAStatsResponse.get_data_sets()``.
+        """
+        self._data_sets = data_sets
+        self._data_set_cache = {}
+        self.__dict__.pop("data_sets", None)
+
+    def get_data_set(self, name: str) -> DataSet:
+        """Return the ``DataSet`` for the data set ``name``.
+
+        Raises:
+            KeyError: If the loaded response has no data set ``name``.
+        """
+        data_set = self._data_set_cache.get(name)
+        if data_set is None:
+            if self._data_sets is None:
+                raise KeyError(name)
+            data_set = Endpoint.DataSet(data=self._data_sets[name])
+            data_set.key = name
+            self._data_set_cache[name] = data_set
+        return data_set
+
+    async def fetch(self) -> "Endpoint":
+        """Send the request on the running event loop and load the response.
+
+        Create the endpoint with ``get_request=False`` and await this method
+        instead of ``get_request()`` to issue many requests concurrently.
+
+        Returns:
+            The endpoint itself, with its data sets loaded.
+        """
+        self.nba_response = await self.nba_http.get_async_http()().send_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+        return self
 
     def get_request_url(self) -> str:
         """Return the URL of the request."""
@@ -96,14 +320,49 @@ class Endpoint:
         """Return the response as a JSON string."""
         return self.nba_response.get_json()
 
-    def get_normalized_dict(self) -> dict[str, Any]:
-        """Return the response as a normalized dictionary."""
-        return self.nba_response.get_normalized_dict()
+    def get_normalized_dict(self, columnar: bool = False) -> dict[str, Any]:
+        """Return the response as a normalized dictionary.
 
-    def get_normalized_json(self) -> str:
+        Args:
+            columnar: Return each data set as ``{column: [values]}`` instead of
+                a list of row dictionaries.
+        """
+        return self.nba_response.get_normalized_dict(columnar=columnar)
+
+    def iter_normalized_rows(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield ``(data set name, row dictionary)`` for every row."""
+        return self.nba_response.iter_normalized_rows()
+
+    def get_normalized_json(self, columnar: bool = False) -> str:
         """Return the response as a normalized JSON string."""
-        return self.nba_response.get_normalized_json()
+        return self.nba_response.get_normalized_json(columnar=columnar)
+
+    def get_arrow_tables(self) -> list["pa.Table"]:
+        """Return a list of pyarrow Tables for all data sets."""
+        return [data_set.get_arrow_table() for data_set in self.data_sets]
+
+    def get_data_frames(self, typed: bool = False) -> list["DataFrame"]:
+        """Return a list of pandas DataFrames for all data sets.
+
+        Args:
+            typed: Build typed frames; see ``DataSet.get_data_frame``.
+        """
+        if not typed:
+            return [data_set.get_data_frame() for data_set in self.data_sets]
+        return [
+            data_set.get_data_frame(typed=True, column_types=self.column_types)
+            for data_set in self.data_sets
+        ]
+
+
+def _to_arrow_array(values: list[Any]) -> "pa.Array":
+    import pyarrow as pa
 
-    def get_data_frames(self) -> list[DataFrame]:
-        """Return a list of pandas DataFrames for all data sets."""
-        return [data_set.get_data_frame() for data_set in self.data_sets]
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Columns mixing numbers and strings are kept as strings.
+        return pa.array(
+            [None if value is None else str(value) for value in values],
+            type=pa.string(),
+        )
@@ -28,11 +28,30 @@ class AllTimeLeadersGrids(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    ast_leaders = Endpoint.LazyDataSet("ASTLeaders")
+    blk_leaders = Endpoint.LazyDataSet("BLKLeaders")
+    dreb_leaders = Endpoint.LazyDataSet("DREBLeaders")
+    fg3_a_leaders = Endpoint.LazyDataSet("FG3ALeaders")
+    fg3_m_leaders = Endpoint.LazyDataSet("FG3MLeaders")
+    fg3_pct_leaders = Endpoint.LazyDataSet("FG3_PCTLeaders")
+    fga_leaders = Endpoint.LazyDataSet("FGALeaders")
+    fgm_leaders = Endpoint.LazyDataSet("FGMLeaders")
+    fg_pct_leaders = Endpoint.LazyDataSet("FG_PCTLeaders")
+    fta_leaders = Endpoint.LazyDataSet("FTALeaders")
+    ftm_leaders = Endpoint.LazyDataSet("FTMLeaders")
+    ft_pct_leaders = Endpoint.LazyDataSet("FT_PCTLeaders")
+    g_p_leaders = Endpoint.LazyDataSet("GPLeaders")
+    oreb_leaders = Endpoint.LazyDataSet("OREBLeaders")
+    pf_leaders = Endpoint.LazyDataSet("PFLeaders")
+    pts_leaders = Endpoint.LazyDataSet("PTSLeaders")
+    reb_leaders = Endpoint.LazyDataSet("REBLeaders")
+    stl_leaders = Endpoint.LazyDataSet("STLLeaders")
+    tov_leaders = Endpoint.LazyDataSet("TOVLeaders")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -68,27 +87,4 @@ class AllTimeLeadersGrids(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.ast_leaders = Endpoint.DataSet(data=data_sets["ASTLeaders"])
-        self.blk_leaders = Endpoint.DataSet(data=data_sets["BLKLeaders"])
-        self.dreb_leaders = Endpoint.DataSet(data=data_sets["DREBLeaders"])
-        self.fg3_a_leaders = Endpoint.DataSet(data=data_sets["FG3ALeaders"])
-        self.fg3_m_leaders = Endpoint.DataSet(data=data_sets["FG3MLeaders"])
-        self.fg3_pct_leaders = Endpoint.DataSet(data=data_sets["FG3_PCTLeaders"])
-        self.fga_leaders = Endpoint.DataSet(data=data_sets["FGALeaders"])
-        self.fgm_leaders = Endpoint.DataSet(data=data_sets["FGMLeaders"])
-        self.fg_pct_leaders = Endpoint.DataSet(data=data_sets["FG_PCTLeaders"])
-        self.fta_leaders = Endpoint.DataSet(data=data_sets["FTALeaders"])
-        self.ftm_leaders = Endpoint.DataSet(data=data_sets["FTMLeaders"])
-        self.ft_pct_leaders = Endpoint.DataSet(data=data_sets["FT_PCTLeaders"])
-        self.g_p_leaders = Endpoint.DataSet(data=data_sets["GPLeaders"])
-        self.oreb_leaders = Endpoint.DataSet(data=data_sets["OREBLeaders"])
-        self.pf_leaders = Endpoint.DataSet(data=data_sets["PFLeaders"])
-        self.pts_leaders = Endpoint.DataSet(data=data_sets["PTSLeaders"])
-        self.reb_leaders = Endpoint.DataSet(data=data_sets["REBLeaders"])
-        self.stl_leaders = Endpoint.DataSet(data=data_sets["STLLeaders"])
-        self.tov_leaders = Endpoint.DataSet(data=data_sets["TOVLeaders"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -16,11 +16,12 @@ class AssistLeaders(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assist_leaders = Endpoint.LazyDataSet("AssistLeaders")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -58,9 +59,4 @@ class AssistLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assist_leaders = Endpoint.DataSet(data=data_sets["AssistLeaders"])
+        self.load_data_sets(self.nba_response.get_data_sets())
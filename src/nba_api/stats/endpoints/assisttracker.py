@@ -25,11 +25,12 @@ class AssistTracker(Endpoint):
     expected_data = {"AssistTracker": ["ASSISTS"]}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assist_tracker = Endpoint.LazyDataSet("AssistTracker")
+
     def __init__(
         self,
         college_nullable="",
@@ -113,9 +114,4 @@ class AssistTracker(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assist_tracker = Endpoint.DataSet(data=data_sets["AssistTracker"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -48,11 +48,11 @@ class BoxScoreDefensiveV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
-    player_stats = None
-    team_stats = None
     headers = None
 
+    player_stats = Endpoint.LazyDataSet("PlayerStats")
+    team_stats = Endpoint.LazyDataSet("TeamStats")
+
     def __init__(self, game_id, proxy=None, headers=None, timeout=30, get_request=True):
         self.proxy = proxy
         if headers is not None:
@@ -73,10 +73,4 @@ class BoxScoreDefensiveV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        self.load_data_sets(self.nba_response.get_data_sets(self.endpoint))
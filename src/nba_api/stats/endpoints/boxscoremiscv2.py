@@ -58,11 +58,13 @@ class BoxScoreMiscV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    sql_players_misc = Endpoint.LazyDataSet("sqlPlayersMisc")
+    sql_teams_misc = Endpoint.LazyDataSet("sqlTeamsMisc")
+
     def __init__(
         self,
         game_id,
@@ -102,10 +104,4 @@ class BoxScoreMiscV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_misc = Endpoint.DataSet(data=data_sets["sqlPlayersMisc"])
-        self.sql_teams_misc = Endpoint.DataSet(data=data_sets["sqlTeamsMisc"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -64,11 +64,13 @@ class BoxScoreScoringV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    sql_players_scoring = Endpoint.LazyDataSet("sqlPlayersScoring")
+    sql_teams_scoring = Endpoint.LazyDataSet("sqlTeamsScoring")
+
     def __init__(
         self,
         game_id,
@@ -108,10 +110,4 @@ class BoxScoreScoringV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_scoring = Endpoint.DataSet(data=data_sets["sqlPlayersScoring"])
-        self.sql_teams_scoring = Endpoint.DataSet(data=data_sets["sqlTeamsScoring"])
+        self.load_data_sets(self.nba_response.get_data_sets())
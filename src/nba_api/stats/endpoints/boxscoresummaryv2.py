@@ -121,11 +121,20 @@ class BoxScoreSummaryV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available_video = Endpoint.LazyDataSet("AvailableVideo")
+    game_info = Endpoint.LazyDataSet("GameInfo")
+    game_summary = Endpoint.LazyDataSet("GameSummary")
+    inactive_players = Endpoint.LazyDataSet("InactivePlayers")
+    last_meeting = Endpoint.LazyDataSet("LastMeeting")
+    line_score = Endpoint.LazyDataSet("LineScore")
+    officials = Endpoint.LazyDataSet("Officials")
+    other_stats = Endpoint.LazyDataSet("OtherStats")
+    season_series = Endpoint.LazyDataSet("SeasonSeries")
+
     def __init__(self, game_id, proxy=None, headers=None, timeout=30, get_request=True):
         warnings.warn(
             "BoxScoreSummaryV2 has known data availability issues. Data may be "
@@ -154,17 +163,4 @@ class BoxScoreSummaryV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.game_summary = Endpoint.DataSet(data=data_sets["GameSummary"])
-        self.inactive_players = Endpoint.DataSet(data=data_sets["InactivePlayers"])
-        self.last_meeting = Endpoint.DataSet(data=data_sets["LastMeeting"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.officials = Endpoint.DataSet(data=data_sets["Officials"])
-        self.other_stats = Endpoint.DataSet(data=data_sets["OtherStats"])
-        self.season_series = Endpoint.DataSet(data=data_sets["SeasonSeries"])
+        self.load_data_sets(self.nba_response.get_data_sets())
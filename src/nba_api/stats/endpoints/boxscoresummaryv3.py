@@ -71,11 +71,20 @@ class BoxScoreSummaryV3(Endpoint):
     expected_data = _EXPECTED_DATA
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    game_summary = Endpoint.LazyDataSet("GameSummary")
+    game_info = Endpoint.LazyDataSet("GameInfo")
+    arena_info = Endpoint.LazyDataSet("ArenaInfo")
+    officials = Endpoint.LazyDataSet("Officials")
+    line_score = Endpoint.LazyDataSet("LineScore")
+    inactive_players = Endpoint.LazyDataSet("InactivePlayers")
+    last_five_meetings = Endpoint.LazyDataSet("LastFiveMeetings")
+    other_stats = Endpoint.LazyDataSet("OtherStats")
+    available_video = Endpoint.LazyDataSet("AvailableVideo")
+
     def __init__(self, game_id, proxy=None, headers=None, timeout=30, get_request=True):
         """
         Initialize BoxScoreSummaryV3 endpoint.
@@ -94,17 +103,6 @@ class BoxScoreSummaryV3(Endpoint):
         self.timeout = timeout
         self.parameters = {"GameID": game_id}
 
-        # Initialize dataset attributes (populated in load_response)
-        self.game_summary = None
-        self.game_info = None
-        self.arena_info = None
-        self.officials = None
-        self.line_score = None
-        self.inactive_players = None
-        self.last_five_meetings = None
-        self.other_stats = None
-        self.available_video = None
-
         if get_request:
             self.get_request()
 
@@ -140,17 +138,4 @@ class BoxScoreSummaryV3(Endpoint):
         - OtherStats: Advanced game statistics
         - AvailableVideo: Video availability flags
         """
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_summary = Endpoint.DataSet(data=data_sets["GameSummary"])
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.arena_info = Endpoint.DataSet(data=data_sets["ArenaInfo"])
-        self.officials = Endpoint.DataSet(data=data_sets["Officials"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.inactive_players = Endpoint.DataSet(data=data_sets["InactivePlayers"])
-        self.last_five_meetings = Endpoint.DataSet(data=data_sets["LastFiveMeetings"])
-        self.other_stats = Endpoint.DataSet(data=data_sets["OtherStats"])
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
+        self.load_data_sets(self.nba_response.get_data_sets(self.endpoint))
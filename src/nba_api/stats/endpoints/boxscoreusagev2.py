@@ -70,11 +70,13 @@ class BoxScoreUsageV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    sql_players_usage = Endpoint.LazyDataSet("sqlPlayersUsage")
+    sql_teams_usage = Endpoint.LazyDataSet("sqlTeamsUsage")
+
     def __init__(
         self,
         game_id,
@@ -114,10 +116,4 @@ class BoxScoreUsageV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_usage = Endpoint.DataSet(data=data_sets["sqlPlayersUsage"])
-        self.sql_teams_usage = Endpoint.DataSet(data=data_sets["sqlTeamsUsage"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -27,11 +27,12 @@ class CommonAllPlayers(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    common_all_players = Endpoint.LazyDataSet("CommonAllPlayers")
+
     def __init__(
         self,
         is_only_current_season=0,
@@ -65,9 +66,4 @@ class CommonAllPlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.common_all_players = Endpoint.DataSet(data=data_sets["CommonAllPlayers"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -52,11 +52,14 @@ class CommonPlayerInfo(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available_seasons = Endpoint.LazyDataSet("AvailableSeasons")
+    common_player_info = Endpoint.LazyDataSet("CommonPlayerInfo")
+    player_headline_stats = Endpoint.LazyDataSet("PlayerHeadlineStats")
+
     def __init__(
         self,
         player_id,
@@ -85,13 +88,4 @@ class CommonPlayerInfo(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
-        self.common_player_info = Endpoint.DataSet(data=data_sets["CommonPlayerInfo"])
-        self.player_headline_stats = Endpoint.DataSet(
-            data=data_sets["PlayerHeadlineStats"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
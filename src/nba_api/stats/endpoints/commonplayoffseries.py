@@ -16,11 +16,12 @@ class CommonPlayoffSeries(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    playoff_series = Endpoint.LazyDataSet("PlayoffSeries")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -54,9 +55,4 @@ class CommonPlayoffSeries(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.playoff_series = Endpoint.DataSet(data=data_sets["PlayoffSeries"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -36,11 +36,12 @@ class CommonTeamRoster(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    common_team_roster = Endpoint.LazyDataSet("CommonTeamRoster")
+
     def __init__(
         self,
         team_id,
@@ -75,14 +76,10 @@ class CommonTeamRoster(Endpoint):
 
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
+        self.load_data_sets(data_sets)
         # Handle cases where Coaches dataset may not be present (#553)
         self.coaches = Endpoint.DataSet(
             data=data_sets.get(
                 "Coaches", {"headers": self.expected_data["Coaches"], "data": []}
             )
         )
-        self.common_team_roster = Endpoint.DataSet(data=data_sets["CommonTeamRoster"])
@@ -10,11 +10,12 @@ class CommonTeamYears(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_years = Endpoint.LazyDataSet("TeamYears")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -42,9 +43,4 @@ class CommonTeamYears(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_years = Endpoint.DataSet(data=data_sets["TeamYears"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -89,11 +89,13 @@ class CumeStatsPlayer(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    game_by_game_stats = Endpoint.LazyDataSet("GameByGameStats")
+    total_player_stats = Endpoint.LazyDataSet("TotalPlayerStats")
+
     def __init__(
         self,
         player_id,
@@ -131,10 +133,4 @@ class CumeStatsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_by_game_stats = Endpoint.DataSet(data=data_sets["GameByGameStats"])
-        self.total_player_stats = Endpoint.DataSet(data=data_sets["TotalPlayerStats"])
+        self.load_data_sets(self.nba_response.get_data_sets())
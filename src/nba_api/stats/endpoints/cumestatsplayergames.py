@@ -16,11 +16,12 @@ class CumeStatsPlayerGames(Endpoint):
     expected_data = {"CumeStatsPlayerGames": ["MATCHUP", "GAME_ID"]}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    cume_stats_player_games = Endpoint.LazyDataSet("CumeStatsPlayerGames")
+
     def __init__(
         self,
         player_id,
@@ -66,11 +67,4 @@ class CumeStatsPlayerGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.cume_stats_player_games = Endpoint.DataSet(
-            data=data_sets["CumeStatsPlayerGames"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
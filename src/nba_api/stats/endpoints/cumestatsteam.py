@@ -98,11 +98,13 @@ class CumeStatsTeam(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    game_by_game_stats = Endpoint.LazyDataSet("GameByGameStats")
+    total_team_stats = Endpoint.LazyDataSet("TotalTeamStats")
+
     def __init__(
         self,
         team_id,
@@ -140,10 +142,4 @@ class CumeStatsTeam(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_by_game_stats = Endpoint.DataSet(data=data_sets["GameByGameStats"])
-        self.total_team_stats = Endpoint.DataSet(data=data_sets["TotalTeamStats"])
+        self.load_data_sets(self.nba_response.get_data_sets())
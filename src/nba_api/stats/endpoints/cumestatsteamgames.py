@@ -16,11 +16,12 @@ class CumeStatsTeamGames(Endpoint):
     expected_data = {"CumeStatsTeamGames": ["MATCHUP", "GAME_ID"]}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    cume_stats_team_games = Endpoint.LazyDataSet("CumeStatsTeamGames")
+
     def __init__(
         self,
         team_id,
@@ -68,11 +69,4 @@ class CumeStatsTeamGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.cume_stats_team_games = Endpoint.DataSet(
-            data=data_sets["CumeStatsTeamGames"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
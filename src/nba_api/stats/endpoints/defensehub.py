@@ -68,11 +68,21 @@ class DefenseHub(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    defense_hub_stat1 = Endpoint.LazyDataSet("DefenseHubStat1")
+    defense_hub_stat10 = Endpoint.LazyDataSet("DefenseHubStat10")
+    defense_hub_stat2 = Endpoint.LazyDataSet("DefenseHubStat2")
+    defense_hub_stat3 = Endpoint.LazyDataSet("DefenseHubStat3")
+    defense_hub_stat4 = Endpoint.LazyDataSet("DefenseHubStat4")
+    defense_hub_stat5 = Endpoint.LazyDataSet("DefenseHubStat5")
+    defense_hub_stat6 = Endpoint.LazyDataSet("DefenseHubStat6")
+    defense_hub_stat7 = Endpoint.LazyDataSet("DefenseHubStat7")
+    defense_hub_stat8 = Endpoint.LazyDataSet("DefenseHubStat8")
+    defense_hub_stat9 = Endpoint.LazyDataSet("DefenseHubStat9")
+
     def __init__(
         self,
         game_scope_detailed=GameScopeDetailed.default,
@@ -112,18 +122,4 @@ class DefenseHub(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defense_hub_stat1 = Endpoint.DataSet(data=data_sets["DefenseHubStat1"])
-        self.defense_hub_stat10 = Endpoint.DataSet(data=data_sets["DefenseHubStat10"])
-        self.defense_hub_stat2 = Endpoint.DataSet(data=data_sets["DefenseHubStat2"])
-        self.defense_hub_stat3 = Endpoint.DataSet(data=data_sets["DefenseHubStat3"])
-        self.defense_hub_stat4 = Endpoint.DataSet(data=data_sets["DefenseHubStat4"])
-        self.defense_hub_stat5 = Endpoint.DataSet(data=data_sets["DefenseHubStat5"])
-        self.defense_hub_stat6 = Endpoint.DataSet(data=data_sets["DefenseHubStat6"])
-        self.defense_hub_stat7 = Endpoint.DataSet(data=data_sets["DefenseHubStat7"])
-        self.defense_hub_stat8 = Endpoint.DataSet(data=data_sets["DefenseHubStat8"])
-        self.defense_hub_stat9 = Endpoint.DataSet(data=data_sets["DefenseHubStat9"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -29,11 +29,12 @@ class DraftBoard(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    draft_board = Endpoint.LazyDataSet("DraftBoard")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -77,9 +78,4 @@ class DraftBoard(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_board = Endpoint.DataSet(data=data_sets["DraftBoard"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -41,11 +41,12 @@ class DraftCombineNonStationaryShooting(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    results = Endpoint.LazyDataSet("Results")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -74,9 +75,4 @@ class DraftCombineNonStationaryShooting(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -29,11 +29,12 @@ class DraftCombinePlayerAnthro(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    results = Endpoint.LazyDataSet("Results")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -62,9 +63,4 @@ class DraftCombinePlayerAnthro(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        self.load_data_sets(self.nba_response.get_data_sets())
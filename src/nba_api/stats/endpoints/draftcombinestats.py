@@ -58,11 +58,12 @@ class DraftCombineStats(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    draft_combine_stats = Endpoint.LazyDataSet("DraftCombineStats")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -91,9 +92,4 @@ class DraftCombineStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_combine_stats = Endpoint.DataSet(data=data_sets["DraftCombineStats"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -24,11 +24,12 @@ class DraftHistory(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    draft_history = Endpoint.LazyDataSet("DraftHistory")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -72,9 +73,4 @@ class DraftHistory(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_history = Endpoint.DataSet(data=data_sets["DraftHistory"])
+        self.load_data_sets(self.nba_response.get_data_sets())
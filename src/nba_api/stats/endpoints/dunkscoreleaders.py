@@ -63,11 +63,12 @@ class DunkScoreLeaders(Endpoint):
     expected_data = _EXPECTED_DATA
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    dunks = Endpoint.LazyDataSet("DunkScoreLeaders")
+
     def __init__(
         self,
         league_id_nullable=LeagueIDNullable.default,
@@ -109,9 +110,6 @@ class DunkScoreLeaders(Endpoint):
             "GameID": game_id_nullable,
         }
 
-        # Initialize dataset attributes (prevents pylint warnings)
-        self.dunks = None
-
         if get_request:
             self.get_request()
 
@@ -139,9 +137,4 @@ class DunkScoreLeaders(Endpoint):
         accessible DataSet object containing all dunk records with detailed
         biomechanics and scoring information.
         """
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.dunks = Endpoint.DataSet(data=data_sets["DunkScoreLeaders"])
+        self.load_data_sets(self.nba_response.get_data_sets(self.endpoint))
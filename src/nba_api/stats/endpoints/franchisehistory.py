@@ -43,11 +43,13 @@ class FranchiseHistory(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    defunct_teams = Endpoint.LazyDataSet("DefunctTeams")
+    franchise_history = Endpoint.LazyDataSet("FranchiseHistory")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -75,10 +77,4 @@ class FranchiseHistory(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defunct_teams = Endpoint.DataSet(data=data_sets["DefunctTeams"])
-        self.franchise_history = Endpoint.DataSet(data=data_sets["FranchiseHistory"])
+        self.load_data_sets(self.nba_response.get_data_sets())
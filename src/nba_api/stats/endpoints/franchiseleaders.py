@@ -27,11 +27,12 @@ class FranchiseLeaders(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    franchise_leaders = Endpoint.LazyDataSet("FranchiseLeaders")
+
     def __init__(
         self,
         team_id,
@@ -60,9 +61,4 @@ class FranchiseLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.franchise_leaders = Endpoint.DataSet(data=data_sets["FranchiseLeaders"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -41,11 +41,12 @@ class FranchisePlayers(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    franchise_players = Endpoint.LazyDataSet("FranchisePlayers")
+
     def __init__(
         self,
         team_id,
@@ -81,9 +82,4 @@ class FranchisePlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.franchise_players = Endpoint.DataSet(data=data_sets["FranchisePlayers"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -37,11 +37,13 @@ class GameRotation(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    away_team = Endpoint.LazyDataSet("AwayTeam")
+    home_team = Endpoint.LazyDataSet("HomeTeam")
+
     def __init__(
         self,
         game_id,
@@ -70,10 +72,4 @@ class GameRotation(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.away_team = Endpoint.DataSet(data=data_sets["AwayTeam"])
-        self.home_team = Endpoint.DataSet(data=data_sets["HomeTeam"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -15,11 +15,14 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    g_league_alum_box_score_similarity_scores = Endpoint.LazyDataSet(
+        "GLeagueAlumBoxScoreSimilarityScores"
+    )
+
     def __init__(
         self,
         person2_id,
@@ -63,11 +66,4 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.g_league_alum_box_score_similarity_scores = Endpoint.DataSet(
-            data=data_sets["GLeagueAlumBoxScoreSimilarityScores"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
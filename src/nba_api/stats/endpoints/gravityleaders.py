@@ -19,9 +19,10 @@ class GravityLeaders(Endpoint):
     expected_data = {"leaders": list(NBAStatsGravityLeadersParser.LEADER_FIELDS)}
 
     nba_response = None
-    data_sets = None
     headers = None
 
+    leaders = Endpoint.LazyDataSet("leaders")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -56,10 +57,4 @@ class GravityLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.leaders = Endpoint.DataSet(data=data_sets["leaders"])
+        self.load_data_sets(self.nba_response.get_data_sets(self.endpoint))
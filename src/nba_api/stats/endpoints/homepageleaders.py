@@ -48,11 +48,14 @@ class HomePageLeaders(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    home_page_leaders = Endpoint.LazyDataSet("HomePageLeaders")
+    league_average = Endpoint.LazyDataSet("LeagueAverage")
+    league_max = Endpoint.LazyDataSet("LeagueMax")
+
     def __init__(
         self,
         game_scope_detailed=GameScopeDetailed.default,
@@ -94,11 +97,4 @@ class HomePageLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.home_page_leaders = Endpoint.DataSet(data=data_sets["HomePageLeaders"])
-        self.league_average = Endpoint.DataSet(data=data_sets["LeagueAverage"])
-        self.league_max = Endpoint.DataSet(data=data_sets["LeagueMax"])
+        self.load_data_sets(self.nba_response.get_data_sets())
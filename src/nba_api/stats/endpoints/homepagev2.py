@@ -43,11 +43,19 @@ class HomePageV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    home_page_stat1 = Endpoint.LazyDataSet("HomePageStat1")
+    home_page_stat2 = Endpoint.LazyDataSet("HomePageStat2")
+    home_page_stat3 = Endpoint.LazyDataSet("HomePageStat3")
+    home_page_stat4 = Endpoint.LazyDataSet("HomePageStat4")
+    home_page_stat5 = Endpoint.LazyDataSet("HomePageStat5")
+    home_page_stat6 = Endpoint.LazyDataSet("HomePageStat6")
+    home_page_stat7 = Endpoint.LazyDataSet("HomePageStat7")
+    home_page_stat8 = Endpoint.LazyDataSet("HomePageStat8")
+
     def __init__(
         self,
         game_scope_detailed=GameScopeDetailed.default,
@@ -89,16 +97,4 @@ class HomePageV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.home_page_stat1 = Endpoint.DataSet(data=data_sets["HomePageStat1"])
-        self.home_page_stat2 = Endpoint.DataSet(data=data_sets["HomePageStat2"])
-        self.home_page_stat3 = Endpoint.DataSet(data=data_sets["HomePageStat3"])
-        self.home_page_stat4 = Endpoint.DataSet(data=data_sets["HomePageStat4"])
-        self.home_page_stat5 = Endpoint.DataSet(data=data_sets["HomePageStat5"])
-        self.home_page_stat6 = Endpoint.DataSet(data=data_sets["HomePageStat6"])
-        self.home_page_stat7 = Endpoint.DataSet(data=data_sets["HomePageStat7"])
-        self.home_page_stat8 = Endpoint.DataSet(data=data_sets["HomePageStat8"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -33,11 +33,15 @@ class LeadersTiles(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    all_time_season_high = Endpoint.LazyDataSet("AllTimeSeasonHigh")
+    last_season_high = Endpoint.LazyDataSet("LastSeasonHigh")
+    leaders_tiles = Endpoint.LazyDataSet("LeadersTiles")
+    low_season_high = Endpoint.LazyDataSet("LowSeasonHigh")
+
     def __init__(
         self,
         game_scope_detailed=GameScopeDetailed.default,
@@ -79,14 +83,4 @@ class LeadersTiles(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.all_time_season_high = Endpoint.DataSet(
-            data=data_sets["AllTimeSeasonHigh"]
-        )
-        self.last_season_high = Endpoint.DataSet(data=data_sets["LastSeasonHigh"])
-        self.leaders_tiles = Endpoint.DataSet(data=data_sets["LeadersTiles"])
-        self.low_season_high = Endpoint.DataSet(data=data_sets["LowSeasonHigh"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -89,11 +89,12 @@ class LeagueDashLineups(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    lineups = Endpoint.LazyDataSet("Lineups")
+
     def __init__(
         self,
         group_quantity=GroupQuantity.default,
@@ -173,9 +174,4 @@ class LeagueDashLineups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.lineups = Endpoint.DataSet(data=data_sets["Lineups"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -54,11 +54,12 @@ class LeagueDashPlayerBioStats(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_player_bio_stats = Endpoint.LazyDataSet("LeagueDashPlayerBioStats")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -148,11 +149,4 @@ class LeagueDashPlayerBioStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_bio_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerBioStats"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
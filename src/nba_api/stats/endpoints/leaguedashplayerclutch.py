@@ -104,11 +104,12 @@ class LeagueDashPlayerClutch(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_player_clutch = Endpoint.LazyDataSet("LeagueDashPlayerClutch")
+
     def __init__(
         self,
         ahead_behind=AheadBehind.default,
@@ -212,11 +213,4 @@ class LeagueDashPlayerClutch(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_clutch = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerClutch"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -100,11 +100,12 @@ class LeagueDashPlayerStats(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_player_stats = Endpoint.LazyDataSet("LeagueDashPlayerStats")
+
     def __init__(
         self,
         last_n_games=LastNGames.default,
@@ -204,11 +205,4 @@ class LeagueDashPlayerStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerStats"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -43,11 +43,12 @@ class LeagueDashPtDefend(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_p_tdefend = Endpoint.LazyDataSet("LeagueDashPTDefend")
+
     def __init__(
         self,
         defense_category=DefenseCategory.default,
@@ -137,11 +138,4 @@ class LeagueDashPtDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_p_tdefend = Endpoint.DataSet(
-            data=data_sets["LeagueDashPTDefend"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -44,11 +44,12 @@ class LeagueDashPtStats(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_pt_stats = Endpoint.LazyDataSet("LeagueDashPtStats")
+
     def __init__(
         self,
         last_n_games=LastNGames.default,
@@ -136,11 +137,4 @@ class LeagueDashPtStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_pt_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPtStats"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
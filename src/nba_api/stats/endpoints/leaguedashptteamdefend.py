@@ -37,11 +37,12 @@ class LeagueDashPtTeamDefend(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_pt_team_defend = Endpoint.LazyDataSet("LeagueDashPtTeamDefend")
+
     def __init__(
         self,
         defense_category=DefenseCategory.default,
@@ -111,11 +112,4 @@ class LeagueDashPtTeamDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_pt_team_defend = Endpoint.DataSet(
-            data=data_sets["LeagueDashPtTeamDefend"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -44,11 +44,12 @@ class LeagueDashTeamPtShot(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_dash_ptshots = Endpoint.LazyDataSet("LeagueDashPTShots")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -128,9 +129,4 @@ class LeagueDashTeamPtShot(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_ptshots = Endpoint.DataSet(data=data_sets["LeagueDashPTShots"])
+        self.load_data_sets(self.nba_response.get_data_sets())
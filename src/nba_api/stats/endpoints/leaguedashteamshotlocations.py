@@ -79,11 +79,12 @@ class LeagueDashTeamShotLocations(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    shot_locations = Endpoint.LazyDataSet("ShotLocations")
+
     def __init__(
         self,
         distance_range=DistanceRange.default,
@@ -171,9 +172,4 @@ class LeagueDashTeamShotLocations(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.shot_locations = Endpoint.DataSet(data=data_sets["ShotLocations"])
+        self.load_data_sets(self.nba_response.get_data_sets())
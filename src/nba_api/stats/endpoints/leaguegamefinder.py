@@ -101,11 +101,12 @@ class LeagueGameFinder(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_game_finder_results = Endpoint.LazyDataSet("LeagueGameFinderResults")
+
     def __init__(
         self,
         player_or_team_abbreviation=PlayerOrTeamAbbreviation.default,
@@ -320,11 +321,4 @@ class LeagueGameFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_game_finder_results = Endpoint.DataSet(
-            data=data_sets["LeagueGameFinderResults"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
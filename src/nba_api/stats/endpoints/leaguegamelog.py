@@ -47,11 +47,12 @@ class LeagueGameLog(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_game_log = Endpoint.LazyDataSet("LeagueGameLog")
+
     def __init__(
         self,
         counter=0,
@@ -97,9 +98,4 @@ class LeagueGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_game_log = Endpoint.DataSet(data=data_sets["LeagueGameLog"])
+        self.load_data_sets(self.nba_response.get_data_sets())
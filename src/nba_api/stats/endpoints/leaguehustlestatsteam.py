@@ -45,11 +45,12 @@ class LeagueHustleStatsTeam(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    hustle_stats_team = Endpoint.LazyDataSet("HustleStatsTeam")
+
     def __init__(
         self,
         per_mode_time=PerModeTime.default,
@@ -127,9 +128,4 @@ class LeagueHustleStatsTeam(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.hustle_stats_team = Endpoint.DataSet(data=data_sets["HustleStatsTeam"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -45,11 +45,12 @@ class LeagueLeaders(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    league_leaders = Endpoint.LazyDataSet("LeagueLeaders")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -91,9 +92,4 @@ class LeagueLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_leaders = Endpoint.DataSet(data=data_sets["LeagueLeaders"])
+        self.load_data_sets(self.nba_response.get_data_sets())
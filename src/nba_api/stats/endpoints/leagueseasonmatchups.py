@@ -37,11 +37,12 @@ class LeagueSeasonMatchups(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    season_matchups = Endpoint.LazyDataSet("SeasonMatchups")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -85,9 +86,4 @@ class LeagueSeasonMatchups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.season_matchups = Endpoint.DataSet(data=data_sets["SeasonMatchups"])
+        self.load_data_sets(self.nba_response.get_data_sets())
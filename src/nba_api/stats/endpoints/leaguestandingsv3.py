@@ -131,11 +131,12 @@ class LeagueStandingsV3(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    standings = Endpoint.LazyDataSet("Standings")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -171,9 +172,4 @@ class LeagueStandingsV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.standings = Endpoint.DataSet(data=data_sets["Standings"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -33,11 +33,12 @@ class MatchupsRollup(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    matchups_rollup = Endpoint.LazyDataSet("MatchupsRollup")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -81,9 +82,4 @@ class MatchupsRollup(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.matchups_rollup = Endpoint.DataSet(data=data_sets["MatchupsRollup"])
+        self.load_data_sets(self.nba_response.get_data_sets())
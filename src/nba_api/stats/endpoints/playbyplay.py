@@ -24,11 +24,13 @@ class PlayByPlay(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available_video = Endpoint.LazyDataSet("AvailableVideo")
+    play_by_play = Endpoint.LazyDataSet("PlayByPlay")
+
     def __init__(
         self,
         game_id,
@@ -62,10 +64,4 @@ class PlayByPlay(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.play_by_play = Endpoint.DataSet(data=data_sets["PlayByPlay"])
+        self.load_data_sets(self.nba_response.get_data_sets())
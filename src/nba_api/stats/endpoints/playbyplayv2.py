@@ -74,11 +74,13 @@ class PlayByPlayV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available_video = Endpoint.LazyDataSet("AvailableVideo")
+    play_by_play = Endpoint.LazyDataSet("PlayByPlay")
+
     def __init__(
         self,
         game_id,
@@ -120,10 +122,4 @@ class PlayByPlayV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.play_by_play = Endpoint.DataSet(data=data_sets["PlayByPlay"])
+        self.load_data_sets(self.nba_response.get_data_sets())
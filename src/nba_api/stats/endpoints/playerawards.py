@@ -24,11 +24,12 @@ class PlayerAwards(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_awards = Endpoint.LazyDataSet("PlayerAwards")
+
     def __init__(
         self, player_id, proxy=None, headers=None, timeout=30, get_request=True
     ):
@@ -51,9 +52,4 @@ class PlayerAwards(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_awards = Endpoint.DataSet(data=data_sets["PlayerAwards"])
+        self.load_data_sets(self.nba_response.get_data_sets())
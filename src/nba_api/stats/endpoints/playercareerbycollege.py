@@ -39,11 +39,12 @@ class PlayerCareerByCollege(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_career_by_college = Endpoint.LazyDataSet("PlayerCareerByCollege")
+
     def __init__(
         self,
         college,
@@ -81,11 +82,4 @@ class PlayerCareerByCollege(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_career_by_college = Endpoint.DataSet(
-            data=data_sets["PlayerCareerByCollege"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
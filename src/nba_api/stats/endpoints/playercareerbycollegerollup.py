@@ -118,11 +118,15 @@ class PlayerCareerByCollegeRollup(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    east = Endpoint.LazyDataSet("East")
+    midwest = Endpoint.LazyDataSet("Midwest")
+    south = Endpoint.LazyDataSet("South")
+    west = Endpoint.LazyDataSet("West")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -158,12 +162,4 @@ class PlayerCareerByCollegeRollup(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.east = Endpoint.DataSet(data=data_sets["East"])
-        self.midwest = Endpoint.DataSet(data=data_sets["Midwest"])
-        self.south = Endpoint.DataSet(data=data_sets["South"])
-        self.west = Endpoint.DataSet(data=data_sets["West"])
+        self.load_data_sets(self.nba_response.get_data_sets())
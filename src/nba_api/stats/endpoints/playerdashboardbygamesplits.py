@@ -348,11 +348,20 @@ class PlayerDashboardByGameSplits(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    by_actual_margin_player_dashboard = Endpoint.LazyDataSet(
+        "ByActualMarginPlayerDashboard"
+    )
+    by_half_player_dashboard = Endpoint.LazyDataSet("ByHalfPlayerDashboard")
+    by_period_player_dashboard = Endpoint.LazyDataSet("ByPeriodPlayerDashboard")
+    by_score_margin_player_dashboard = Endpoint.LazyDataSet(
+        "ByScoreMarginPlayerDashboard"
+    )
+    overall_player_dashboard = Endpoint.LazyDataSet("OverallPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -426,23 +435,4 @@ class PlayerDashboardByGameSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.by_actual_margin_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ByActualMarginPlayerDashboard"]
-        )
-        self.by_half_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ByHalfPlayerDashboard"]
-        )
-        self.by_period_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ByPeriodPlayerDashboard"]
-        )
-        self.by_score_margin_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ByScoreMarginPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -412,11 +412,17 @@ class PlayerDashboardByLastNGames(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    game_number_player_dashboard = Endpoint.LazyDataSet("GameNumberPlayerDashboard")
+    last10_player_dashboard = Endpoint.LazyDataSet("Last10PlayerDashboard")
+    last15_player_dashboard = Endpoint.LazyDataSet("Last15PlayerDashboard")
+    last20_player_dashboard = Endpoint.LazyDataSet("Last20PlayerDashboard")
+    last5_player_dashboard = Endpoint.LazyDataSet("Last5PlayerDashboard")
+    overall_player_dashboard = Endpoint.LazyDataSet("OverallPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -490,26 +496,4 @@ class PlayerDashboardByLastNGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_number_player_dashboard = Endpoint.DataSet(
-            data=data_sets["GameNumberPlayerDashboard"]
-        )
-        self.last10_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last10PlayerDashboard"]
-        )
-        self.last15_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last15PlayerDashboard"]
-        )
-        self.last20_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last20PlayerDashboard"]
-        )
-        self.last5_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last5PlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -287,11 +287,21 @@ class PlayerDashboardByShootingSplits(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assisted_by = Endpoint.LazyDataSet("AssistedBy")
+    assited_shot_player_dashboard = Endpoint.LazyDataSet("AssitedShotPlayerDashboard")
+    overall_player_dashboard = Endpoint.LazyDataSet("OverallPlayerDashboard")
+    shot5_ft_player_dashboard = Endpoint.LazyDataSet("Shot5FTPlayerDashboard")
+    shot8_ft_player_dashboard = Endpoint.LazyDataSet("Shot8FTPlayerDashboard")
+    shot_area_player_dashboard = Endpoint.LazyDataSet("ShotAreaPlayerDashboard")
+    shot_type_player_dashboard = Endpoint.LazyDataSet("ShotTypePlayerDashboard")
+    shot_type_summary_player_dashboard = Endpoint.LazyDataSet(
+        "ShotTypeSummaryPlayerDashboard"
+    )
+
     def __init__(
         self,
         player_id,
@@ -365,30 +375,4 @@ class PlayerDashboardByShootingSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assisted_by = Endpoint.DataSet(data=data_sets["AssistedBy"])
-        self.assited_shot_player_dashboard = Endpoint.DataSet(
-            data=data_sets["AssitedShotPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
-        self.shot5_ft_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot5FTPlayerDashboard"]
-        )
-        self.shot8_ft_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot8FTPlayerDashboard"]
-        )
-        self.shot_area_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotAreaPlayerDashboard"]
-        )
-        self.shot_type_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotTypePlayerDashboard"]
-        )
-        self.shot_type_summary_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotTypeSummaryPlayerDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
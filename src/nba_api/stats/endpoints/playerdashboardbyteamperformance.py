@@ -290,11 +290,17 @@ class PlayerDashboardByTeamPerformance(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    overall_player_dashboard = Endpoint.LazyDataSet("OverallPlayerDashboard")
+    points_scored_player_dashboard = Endpoint.LazyDataSet("PointsScoredPlayerDashboard")
+    ponts_against_player_dashboard = Endpoint.LazyDataSet("PontsAgainstPlayerDashboard")
+    score_differential_player_dashboard = Endpoint.LazyDataSet(
+        "ScoreDifferentialPlayerDashboard"
+    )
+
     def __init__(
         self,
         player_id,
@@ -368,20 +374,4 @@ class PlayerDashboardByTeamPerformance(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
-        self.points_scored_player_dashboard = Endpoint.DataSet(
-            data=data_sets["PointsScoredPlayerDashboard"]
-        )
-        self.ponts_against_player_dashboard = Endpoint.DataSet(
-            data=data_sets["PontsAgainstPlayerDashboard"]
-        )
-        self.score_differential_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ScoreDifferentialPlayerDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
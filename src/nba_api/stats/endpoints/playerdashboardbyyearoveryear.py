@@ -162,11 +162,13 @@ class PlayerDashboardByYearOverYear(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    by_year_player_dashboard = Endpoint.LazyDataSet("ByYearPlayerDashboard")
+    overall_player_dashboard = Endpoint.LazyDataSet("OverallPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -240,14 +242,4 @@ class PlayerDashboardByYearOverYear(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.by_year_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ByYearPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
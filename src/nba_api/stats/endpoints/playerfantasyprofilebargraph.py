@@ -47,11 +47,13 @@ class PlayerFantasyProfileBarGraph(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    last_five_games_avg = Endpoint.LazyDataSet("LastFiveGamesAvg")
+    season_avg = Endpoint.LazyDataSet("SeasonAvg")
+
     def __init__(
         self,
         player_id,
@@ -87,10 +89,4 @@ class PlayerFantasyProfileBarGraph(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.last_five_games_avg = Endpoint.DataSet(data=data_sets["LastFiveGamesAvg"])
-        self.season_avg = Endpoint.DataSet(data=data_sets["SeasonAvg"])
+        self.load_data_sets(self.nba_response.get_data_sets())
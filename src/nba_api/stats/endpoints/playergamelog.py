@@ -38,11 +38,12 @@ class PlayerGameLog(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_game_log = Endpoint.LazyDataSet("PlayerGameLog")
+
     def __init__(
         self,
         player_id,
@@ -82,9 +83,4 @@ class PlayerGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_log = Endpoint.DataSet(data=data_sets["PlayerGameLog"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -90,11 +90,12 @@ class PlayerGameLogs(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_game_logs = Endpoint.LazyDataSet("PlayerGameLogs")
+
     def __init__(
         self,
         date_from_nullable="",
@@ -164,9 +165,4 @@ class PlayerGameLogs(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_logs = Endpoint.DataSet(data=data_sets["PlayerGameLogs"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -31,11 +31,14 @@ class PlayerGameStreakFinder(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_game_streak_finder_results = Endpoint.LazyDataSet(
+        "PlayerGameStreakFinderResults"
+    )
+
     def __init__(
         self,
         active_streaks_only_nullable="",
@@ -241,11 +244,4 @@ class PlayerGameStreakFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_streak_finder_results = Endpoint.DataSet(
-            data=data_sets["PlayerGameStreakFinderResults"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
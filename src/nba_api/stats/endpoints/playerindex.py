@@ -44,11 +44,12 @@ class PlayerIndex(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    player_index = Endpoint.LazyDataSet("PlayerIndex")
+
     def __init__(
         self,
         active_nullable=ActiveNullable.default,
@@ -102,9 +103,4 @@ class PlayerIndex(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_index = Endpoint.DataSet(data=data_sets["PlayerIndex"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -29,11 +29,12 @@ class PlayerNextNGames(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    next_n_games = Endpoint.LazyDataSet("NextNGames")
+
     def __init__(
         self,
         player_id,
@@ -71,9 +72,4 @@ class PlayerNextNGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.next_n_games = Endpoint.DataSet(data=data_sets["NextNGames"])
+        self.load_data_sets(self.nba_response.get_data_sets())
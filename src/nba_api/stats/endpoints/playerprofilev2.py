@@ -381,11 +381,26 @@ class PlayerProfileV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    career_highs = Endpoint.LazyDataSet("CareerHighs")
+    career_totals_all_star_season = Endpoint.LazyDataSet("CareerTotalsAllStarSeason")
+    career_totals_college_season = Endpoint.LazyDataSet("CareerTotalsCollegeSeason")
+    career_totals_post_season = Endpoint.LazyDataSet("CareerTotalsPostSeason")
+    career_totals_preseason = Endpoint.LazyDataSet("CareerTotalsPreseason")
+    career_totals_regular_season = Endpoint.LazyDataSet("CareerTotalsRegularSeason")
+    next_game = Endpoint.LazyDataSet("NextGame")
+    season_highs = Endpoint.LazyDataSet("SeasonHighs")
+    season_rankings_post_season = Endpoint.LazyDataSet("SeasonRankingsPostSeason")
+    season_rankings_regular_season = Endpoint.LazyDataSet("SeasonRankingsRegularSeason")
+    season_totals_all_star_season = Endpoint.LazyDataSet("SeasonTotalsAllStarSeason")
+    season_totals_college_season = Endpoint.LazyDataSet("SeasonTotalsCollegeSeason")
+    season_totals_post_season = Endpoint.LazyDataSet("SeasonTotalsPostSeason")
+    season_totals_preseason = Endpoint.LazyDataSet("SeasonTotalsPreseason")
+    season_totals_regular_season = Endpoint.LazyDataSet("SeasonTotalsRegularSeason")
+
     def __init__(
         self,
         player_id,
@@ -419,47 +434,4 @@ class PlayerProfileV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_highs = Endpoint.DataSet(data=data_sets["CareerHighs"])
-        self.career_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsAllStarSeason"]
-        )
-        self.career_totals_college_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsCollegeSeason"]
-        )
-        self.career_totals_post_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsPostSeason"]
-        )
-        self.career_totals_preseason = Endpoint.DataSet(
-            data=data_sets["CareerTotalsPreseason"]
-        )
-        self.career_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsRegularSeason"]
-        )
-        self.next_game = Endpoint.DataSet(data=data_sets["NextGame"])
-        self.season_highs = Endpoint.DataSet(data=data_sets["SeasonHighs"])
-        self.season_rankings_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsPostSeason"]
-        )
-        self.season_rankings_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsRegularSeason"]
-        )
-        self.season_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsAllStarSeason"]
-        )
-        self.season_totals_college_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsCollegeSeason"]
-        )
-        self.season_totals_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsPostSeason"]
-        )
-        self.season_totals_preseason = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsPreseason"]
-        )
-        self.season_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsRegularSeason"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
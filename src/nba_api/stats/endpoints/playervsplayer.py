@@ -201,11 +201,21 @@ class PlayerVsPlayer(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    on_off_court = Endpoint.LazyDataSet("OnOffCourt")
+    overall = Endpoint.LazyDataSet("Overall")
+    player_info = Endpoint.LazyDataSet("PlayerInfo")
+    shot_area_off_court = Endpoint.LazyDataSet("ShotAreaOffCourt")
+    shot_area_on_court = Endpoint.LazyDataSet("ShotAreaOnCourt")
+    shot_area_overall = Endpoint.LazyDataSet("ShotAreaOverall")
+    shot_distance_off_court = Endpoint.LazyDataSet("ShotDistanceOffCourt")
+    shot_distance_on_court = Endpoint.LazyDataSet("ShotDistanceOnCourt")
+    shot_distance_overall = Endpoint.LazyDataSet("ShotDistanceOverall")
+    vs_player_info = Endpoint.LazyDataSet("VsPlayerInfo")
+
     def __init__(
         self,
         vs_player_id,
@@ -277,24 +287,4 @@ class PlayerVsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.on_off_court = Endpoint.DataSet(data=data_sets["OnOffCourt"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
-        self.player_info = Endpoint.DataSet(data=data_sets["PlayerInfo"])
-        self.shot_area_off_court = Endpoint.DataSet(data=data_sets["ShotAreaOffCourt"])
-        self.shot_area_on_court = Endpoint.DataSet(data=data_sets["ShotAreaOnCourt"])
-        self.shot_area_overall = Endpoint.DataSet(data=data_sets["ShotAreaOverall"])
-        self.shot_distance_off_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOffCourt"]
-        )
-        self.shot_distance_on_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOnCourt"]
-        )
-        self.shot_distance_overall = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOverall"]
-        )
-        self.vs_player_info = Endpoint.DataSet(data=data_sets["VsPlayerInfo"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -175,11 +175,17 @@ class PlayoffPicture(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    east_conf_playoff_picture = Endpoint.LazyDataSet("EastConfPlayoffPicture")
+    east_conf_remaining_games = Endpoint.LazyDataSet("EastConfRemainingGames")
+    east_conf_standings = Endpoint.LazyDataSet("EastConfStandings")
+    west_conf_playoff_picture = Endpoint.LazyDataSet("WestConfPlayoffPicture")
+    west_conf_remaining_games = Endpoint.LazyDataSet("WestConfRemainingGames")
+    west_conf_standings = Endpoint.LazyDataSet("WestConfStandings")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -208,22 +214,4 @@ class PlayoffPicture(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.east_conf_playoff_picture = Endpoint.DataSet(
-            data=data_sets["EastConfPlayoffPicture"]
-        )
-        self.east_conf_remaining_games = Endpoint.DataSet(
-            data=data_sets["EastConfRemainingGames"]
-        )
-        self.east_conf_standings = Endpoint.DataSet(data=data_sets["EastConfStandings"])
-        self.west_conf_playoff_picture = Endpoint.DataSet(
-            data=data_sets["WestConfPlayoffPicture"]
-        )
-        self.west_conf_remaining_games = Endpoint.DataSet(
-            data=data_sets["WestConfRemainingGames"]
-        )
-        self.west_conf_standings = Endpoint.DataSet(data=data_sets["WestConfStandings"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -174,11 +174,21 @@ class ScoreboardV2(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available = Endpoint.LazyDataSet("Available")
+    east_conf_standings_by_day = Endpoint.LazyDataSet("EastConfStandingsByDay")
+    game_header = Endpoint.LazyDataSet("GameHeader")
+    last_meeting = Endpoint.LazyDataSet("LastMeeting")
+    line_score = Endpoint.LazyDataSet("LineScore")
+    series_standings = Endpoint.LazyDataSet("SeriesStandings")
+    team_leaders = Endpoint.LazyDataSet("TeamLeaders")
+    ticket_links = Endpoint.LazyDataSet("TicketLinks")
+    west_conf_standings_by_day = Endpoint.LazyDataSet("WestConfStandingsByDay")
+    win_probability = Endpoint.LazyDataSet("WinProbability")
+
     def __init__(
         self,
         day_offset=DayOffset.default,
@@ -220,23 +230,4 @@ class ScoreboardV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available = Endpoint.DataSet(data=data_sets["Available"])
-        self.east_conf_standings_by_day = Endpoint.DataSet(
-            data=data_sets["EastConfStandingsByDay"]
-        )
-        self.game_header = Endpoint.DataSet(data=data_sets["GameHeader"])
-        self.last_meeting = Endpoint.DataSet(data=data_sets["LastMeeting"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.series_standings = Endpoint.DataSet(data=data_sets["SeriesStandings"])
-        self.team_leaders = Endpoint.DataSet(data=data_sets["TeamLeaders"])
-        self.ticket_links = Endpoint.DataSet(data=data_sets["TicketLinks"])
-        self.west_conf_standings_by_day = Endpoint.DataSet(
-            data=data_sets["WestConfStandingsByDay"]
-        )
-        if "WinProbability" in data_sets:
-            self.win_probability = Endpoint.DataSet(data=data_sets["WinProbability"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -64,11 +64,17 @@ class ScoreboardV3(Endpoint):
     expected_data = _EXPECTED_DATA
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    scoreboard_info = Endpoint.LazyDataSet("ScoreboardInfo")
+    game_header = Endpoint.LazyDataSet("GameHeader")
+    line_score = Endpoint.LazyDataSet("LineScore")
+    game_leaders = Endpoint.LazyDataSet("GameLeaders")
+    team_leaders = Endpoint.LazyDataSet("TeamLeaders")
+    broadcasters = Endpoint.LazyDataSet("Broadcasters")
+
     def __init__(
         self,
         game_date,
@@ -99,14 +105,6 @@ class ScoreboardV3(Endpoint):
             "LeagueID": league_id,
         }
 
-        # Initialize dataset attributes (populated in load_response)
-        self.scoreboard_info = None
-        self.game_header = None
-        self.line_score = None
-        self.game_leaders = None
-        self.team_leaders = None
-        self.broadcasters = None
-
         if get_request:
             self.get_request()
 
@@ -139,14 +137,4 @@ class ScoreboardV3(Endpoint):
         - TeamLeaders: Season leader statistics
         - Broadcasters: Broadcaster information
         """
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.scoreboard_info = Endpoint.DataSet(data=data_sets["ScoreboardInfo"])
-        self.game_header = Endpoint.DataSet(data=data_sets["GameHeader"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.game_leaders = Endpoint.DataSet(data=data_sets["GameLeaders"])
-        self.team_leaders = Endpoint.DataSet(data=data_sets["TeamLeaders"])
-        self.broadcasters = Endpoint.DataSet(data=data_sets["Broadcasters"])
+        self.load_data_sets(self.nba_response.get_data_sets(self.endpoint))
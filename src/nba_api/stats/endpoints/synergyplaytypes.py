@@ -41,11 +41,12 @@ class SynergyPlayTypes(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    synergy_play_type = Endpoint.LazyDataSet("SynergyPlayType")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -87,9 +88,4 @@ class SynergyPlayTypes(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.synergy_play_type = Endpoint.DataSet(data=data_sets["SynergyPlayType"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -166,11 +166,16 @@ class TeamAndPlayersVsPlayers(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    players_vs_players = Endpoint.LazyDataSet("PlayersVsPlayers")
+    team_players_vs_players_off = Endpoint.LazyDataSet("TeamPlayersVsPlayersOff")
+    team_players_vs_players_on = Endpoint.LazyDataSet("TeamPlayersVsPlayersOn")
+    team_vs_players = Endpoint.LazyDataSet("TeamVsPlayers")
+    team_vs_players_off = Endpoint.LazyDataSet("TeamVsPlayersOff")
+
     def __init__(
         self,
         vs_team_id,
@@ -268,17 +273,4 @@ class TeamAndPlayersVsPlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.players_vs_players = Endpoint.DataSet(data=data_sets["PlayersVsPlayers"])
-        self.team_players_vs_players_off = Endpoint.DataSet(
-            data=data_sets["TeamPlayersVsPlayersOff"]
-        )
-        self.team_players_vs_players_on = Endpoint.DataSet(
-            data=data_sets["TeamPlayersVsPlayersOn"]
-        )
-        self.team_vs_players = Endpoint.DataSet(data=data_sets["TeamVsPlayers"])
-        self.team_vs_players_off = Endpoint.DataSet(data=data_sets["TeamVsPlayersOff"])
+        self.load_data_sets(self.nba_response.get_data_sets())
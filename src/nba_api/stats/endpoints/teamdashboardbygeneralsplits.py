@@ -422,11 +422,19 @@ class TeamDashboardByGeneralSplits(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    days_rest_team_dashboard = Endpoint.LazyDataSet("DaysRestTeamDashboard")
+    location_team_dashboard = Endpoint.LazyDataSet("LocationTeamDashboard")
+    month_team_dashboard = Endpoint.LazyDataSet("MonthTeamDashboard")
+    overall_team_dashboard = Endpoint.LazyDataSet("OverallTeamDashboard")
+    pre_post_all_star_team_dashboard = Endpoint.LazyDataSet(
+        "PrePostAllStarTeamDashboard"
+    )
+    wins_losses_team_dashboard = Endpoint.LazyDataSet("WinsLossesTeamDashboard")
+
     def __init__(
         self,
         team_id,
@@ -511,26 +519,4 @@ class TeamDashboardByGeneralSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.days_rest_team_dashboard = Endpoint.DataSet(
-            data=data_sets["DaysRestTeamDashboard"]
-        )
-        self.location_team_dashboard = Endpoint.DataSet(
-            data=data_sets["LocationTeamDashboard"]
-        )
-        self.month_team_dashboard = Endpoint.DataSet(
-            data=data_sets["MonthTeamDashboard"]
-        )
-        self.overall_team_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallTeamDashboard"]
-        )
-        self.pre_post_all_star_team_dashboard = Endpoint.DataSet(
-            data=data_sets["PrePostAllStarTeamDashboard"]
-        )
-        self.wins_losses_team_dashboard = Endpoint.DataSet(
-            data=data_sets["WinsLossesTeamDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -267,11 +267,18 @@ class TeamDashboardByShootingSplits(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    assisted_by = Endpoint.LazyDataSet("AssistedBy")
+    assited_shot_team_dashboard = Endpoint.LazyDataSet("AssitedShotTeamDashboard")
+    overall_team_dashboard = Endpoint.LazyDataSet("OverallTeamDashboard")
+    shot5_ft_team_dashboard = Endpoint.LazyDataSet("Shot5FTTeamDashboard")
+    shot8_ft_team_dashboard = Endpoint.LazyDataSet("Shot8FTTeamDashboard")
+    shot_area_team_dashboard = Endpoint.LazyDataSet("ShotAreaTeamDashboard")
+    shot_type_team_dashboard = Endpoint.LazyDataSet("ShotTypeTeamDashboard")
+
     def __init__(
         self,
         team_id,
@@ -345,27 +352,4 @@ class TeamDashboardByShootingSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assisted_by = Endpoint.DataSet(data=data_sets["AssistedBy"])
-        self.assited_shot_team_dashboard = Endpoint.DataSet(
-            data=data_sets["AssitedShotTeamDashboard"]
-        )
-        self.overall_team_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallTeamDashboard"]
-        )
-        self.shot5_ft_team_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot5FTTeamDashboard"]
-        )
-        self.shot8_ft_team_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot8FTTeamDashboard"]
-        )
-        self.shot_area_team_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotAreaTeamDashboard"]
-        )
-        self.shot_type_team_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotTypeTeamDashboard"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
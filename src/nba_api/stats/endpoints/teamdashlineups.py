@@ -145,11 +145,13 @@ class TeamDashLineups(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    lineups = Endpoint.LazyDataSet("Lineups")
+    overall = Endpoint.LazyDataSet("Overall")
+
     def __init__(
         self,
         team_id,
@@ -227,10 +229,4 @@ class TeamDashLineups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.lineups = Endpoint.DataSet(data=data_sets["Lineups"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
+        self.load_data_sets(self.nba_response.get_data_sets())
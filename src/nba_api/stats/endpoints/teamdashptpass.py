@@ -61,11 +61,13 @@ class TeamDashPtPass(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    passes_made = Endpoint.LazyDataSet("PassesMade")
+    passes_received = Endpoint.LazyDataSet("PassesReceived")
+
     def __init__(
         self,
         team_id,
@@ -123,10 +125,4 @@ class TeamDashPtPass(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.passes_made = Endpoint.DataSet(data=data_sets["PassesMade"])
-        self.passes_received = Endpoint.DataSet(data=data_sets["PassesReceived"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -117,11 +117,16 @@ class TeamDashPtReb(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    num_contested_rebounding = Endpoint.LazyDataSet("NumContestedRebounding")
+    overall_rebounding = Endpoint.LazyDataSet("OverallRebounding")
+    reb_distance_rebounding = Endpoint.LazyDataSet("RebDistanceRebounding")
+    shot_distance_rebounding = Endpoint.LazyDataSet("ShotDistanceRebounding")
+    shot_type_rebounding = Endpoint.LazyDataSet("ShotTypeRebounding")
+
     def __init__(
         self,
         team_id,
@@ -183,21 +188,4 @@ class TeamDashPtReb(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.num_contested_rebounding = Endpoint.DataSet(
-            data=data_sets["NumContestedRebounding"]
-        )
-        self.overall_rebounding = Endpoint.DataSet(data=data_sets["OverallRebounding"])
-        self.reb_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["RebDistanceRebounding"]
-        )
-        self.shot_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotDistanceRebounding"]
-        )
-        self.shot_type_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotTypeRebounding"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -143,11 +143,19 @@ class TeamDashPtShots(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    closest_defender10ft_plus_shooting = Endpoint.LazyDataSet(
+        "ClosestDefender10ftPlusShooting"
+    )
+    closest_defender_shooting = Endpoint.LazyDataSet("ClosestDefenderShooting")
+    dribble_shooting = Endpoint.LazyDataSet("DribbleShooting")
+    general_shooting = Endpoint.LazyDataSet("GeneralShooting")
+    shot_clock_shooting = Endpoint.LazyDataSet("ShotClockShooting")
+    touch_time_shooting = Endpoint.LazyDataSet("TouchTimeShooting")
+
     def __init__(
         self,
         team_id,
@@ -209,18 +217,4 @@ class TeamDashPtShots(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.closest_defender10ft_plus_shooting = Endpoint.DataSet(
-            data=data_sets["ClosestDefender10ftPlusShooting"]
-        )
-        self.closest_defender_shooting = Endpoint.DataSet(
-            data=data_sets["ClosestDefenderShooting"]
-        )
-        self.dribble_shooting = Endpoint.DataSet(data=data_sets["DribbleShooting"])
-        self.general_shooting = Endpoint.DataSet(data=data_sets["GeneralShooting"])
-        self.shot_clock_shooting = Endpoint.DataSet(data=data_sets["ShotClockShooting"])
-        self.touch_time_shooting = Endpoint.DataSet(data=data_sets["TouchTimeShooting"])
+        self.load_data_sets(self.nba_response.get_data_sets())
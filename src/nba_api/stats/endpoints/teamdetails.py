@@ -42,11 +42,19 @@ class TeamDetails(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_awards_championships = Endpoint.LazyDataSet("TeamAwardsChampionships")
+    team_awards_conf = Endpoint.LazyDataSet("TeamAwardsConf")
+    team_awards_div = Endpoint.LazyDataSet("TeamAwardsDiv")
+    team_background = Endpoint.LazyDataSet("TeamBackground")
+    team_history = Endpoint.LazyDataSet("TeamHistory")
+    team_hof = Endpoint.LazyDataSet("TeamHof")
+    team_retired = Endpoint.LazyDataSet("TeamRetired")
+    team_social_sites = Endpoint.LazyDataSet("TeamSocialSites")
+
     def __init__(self, team_id, proxy=None, headers=None, timeout=30, get_request=True):
         self.proxy = proxy
         if headers is not None:
@@ -67,18 +75,4 @@ class TeamDetails(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_awards_championships = Endpoint.DataSet(
-            data=data_sets["TeamAwardsChampionships"]
-        )
-        self.team_awards_conf = Endpoint.DataSet(data=data_sets["TeamAwardsConf"])
-        self.team_awards_div = Endpoint.DataSet(data=data_sets["TeamAwardsDiv"])
-        self.team_background = Endpoint.DataSet(data=data_sets["TeamBackground"])
-        self.team_history = Endpoint.DataSet(data=data_sets["TeamHistory"])
-        self.team_hof = Endpoint.DataSet(data=data_sets["TeamHof"])
-        self.team_retired = Endpoint.DataSet(data=data_sets["TeamRetired"])
-        self.team_social_sites = Endpoint.DataSet(data=data_sets["TeamSocialSites"])
+        self.load_data_sets(self.nba_response.get_data_sets())
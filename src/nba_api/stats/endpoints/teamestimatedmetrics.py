@@ -41,11 +41,12 @@ class TeamEstimatedMetrics(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_estimated_metrics = Endpoint.LazyDataSet("TeamEstimatedMetrics")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -79,11 +80,4 @@ class TeamEstimatedMetrics(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_estimated_metrics = Endpoint.DataSet(
-            data=data_sets["TeamEstimatedMetrics"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -38,11 +38,12 @@ class TeamGameLog(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_game_log = Endpoint.LazyDataSet("TeamGameLog")
+
     def __init__(
         self,
         team_id,
@@ -69,9 +70,6 @@ class TeamGameLog(Endpoint):
             "LeagueID": league_id_nullable,
         }
 
-        # Initialize dataset attributes
-        self.team_game_log = None
-
         if get_request:
             self.get_request()
 
@@ -86,9 +84,4 @@ class TeamGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_log = Endpoint.DataSet(data=data_sets["TeamGameLog"])
+        self.load_data_sets(self.nba_response.get_data_sets())
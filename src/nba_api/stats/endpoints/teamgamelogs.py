@@ -82,11 +82,12 @@ class TeamGameLogs(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_game_logs = Endpoint.LazyDataSet("TeamGameLogs")
+
     def __init__(
         self,
         date_from_nullable="",
@@ -143,9 +144,6 @@ class TeamGameLogs(Endpoint):
             "VsDivision": vs_division_nullable,
         }
 
-        # Initialize dataset attributes
-        self.team_game_logs = None
-
         if get_request:
             self.get_request()
 
@@ -160,9 +158,4 @@ class TeamGameLogs(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_logs = Endpoint.DataSet(data=data_sets["TeamGameLogs"])
+        self.load_data_sets(self.nba_response.get_data_sets())
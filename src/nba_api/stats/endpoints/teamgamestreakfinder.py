@@ -31,11 +31,14 @@ class TeamGameStreakFinder(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    team_game_streak_finder_parameters_results = Endpoint.LazyDataSet(
+        "TeamGameStreakFinderParametersResults"
+    )
+
     def __init__(
         self,
         active_streaks_only_nullable="",
@@ -439,11 +442,4 @@ class TeamGameStreakFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_streak_finder_parameters_results = Endpoint.DataSet(
-            data=data_sets["TeamGameStreakFinderParametersResults"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -28,11 +28,12 @@ class TeamHistoricalLeaders(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    career_leaders_by_team = Endpoint.LazyDataSet("CareerLeadersByTeam")
+
     def __init__(
         self,
         team_id,
@@ -66,11 +67,4 @@ class TeamHistoricalLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_leaders_by_team = Endpoint.DataSet(
-            data=data_sets["CareerLeadersByTeam"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -44,11 +44,14 @@ class TeamInfoCommon(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    available_seasons = Endpoint.LazyDataSet("AvailableSeasons")
+    team_info_common = Endpoint.LazyDataSet("TeamInfoCommon")
+    team_season_ranks = Endpoint.LazyDataSet("TeamSeasonRanks")
+
     def __init__(
         self,
         team_id,
@@ -84,11 +87,4 @@ class TeamInfoCommon(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
-        self.team_info_common = Endpoint.DataSet(data=data_sets["TeamInfoCommon"])
-        self.team_season_ranks = Endpoint.DataSet(data=data_sets["TeamSeasonRanks"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -149,11 +149,13 @@ class TeamPlayerDashboard(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    players_season_totals = Endpoint.LazyDataSet("PlayersSeasonTotals")
+    team_overall = Endpoint.LazyDataSet("TeamOverall")
+
     def __init__(
         self,
         team_id,
@@ -227,12 +229,4 @@ class TeamPlayerDashboard(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.players_season_totals = Endpoint.DataSet(
-            data=data_sets["PlayersSeasonTotals"]
-        )
-        self.team_overall = Endpoint.DataSet(data=data_sets["TeamOverall"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -208,11 +208,20 @@ class TeamPlayerOnOffDetails(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    overall_team_player_on_off_details = Endpoint.LazyDataSet(
+        "OverallTeamPlayerOnOffDetails"
+    )
+    players_off_court_team_player_on_off_details = Endpoint.LazyDataSet(
+        "PlayersOffCourtTeamPlayerOnOffDetails"
+    )
+    players_on_court_team_player_on_off_details = Endpoint.LazyDataSet(
+        "PlayersOnCourtTeamPlayerOnOffDetails"
+    )
+
     def __init__(
         self,
         team_id,
@@ -282,17 +291,4 @@ class TeamPlayerOnOffDetails(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.overall_team_player_on_off_details = Endpoint.DataSet(
-            data=data_sets["OverallTeamPlayerOnOffDetails"]
-        )
-        self.players_off_court_team_player_on_off_details = Endpoint.DataSet(
-            data=data_sets["PlayersOffCourtTeamPlayerOnOffDetails"]
-        )
-        self.players_on_court_team_player_on_off_details = Endpoint.DataSet(
-            data=data_sets["PlayersOnCourtTeamPlayerOnOffDetails"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
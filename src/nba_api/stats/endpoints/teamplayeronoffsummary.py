@@ -116,11 +116,20 @@ class TeamPlayerOnOffSummary(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    overall_team_player_on_off_summary = Endpoint.LazyDataSet(
+        "OverallTeamPlayerOnOffSummary"
+    )
+    players_off_court_team_player_on_off_summary = Endpoint.LazyDataSet(
+        "PlayersOffCourtTeamPlayerOnOffSummary"
+    )
+    players_on_court_team_player_on_off_summary = Endpoint.LazyDataSet(
+        "PlayersOnCourtTeamPlayerOnOffSummary"
+    )
+
     def __init__(
         self,
         team_id,
@@ -190,17 +199,4 @@ class TeamPlayerOnOffSummary(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.overall_team_player_on_off_summary = Endpoint.DataSet(
-            data=data_sets["OverallTeamPlayerOnOffSummary"]
-        )
-        self.players_off_court_team_player_on_off_summary = Endpoint.DataSet(
-            data=data_sets["PlayersOffCourtTeamPlayerOnOffSummary"]
-        )
-        self.players_on_court_team_player_on_off_summary = Endpoint.DataSet(
-            data=data_sets["PlayersOnCourtTeamPlayerOnOffSummary"]
-        )
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -32,7 +32,6 @@ class VideoDetails(Endpoint):
     expected_data = {}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
@@ -124,8 +123,4 @@ class VideoDetails(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
+        self.load_data_sets(self.nba_response.get_data_sets())
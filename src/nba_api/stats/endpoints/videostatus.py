@@ -25,11 +25,12 @@ class VideoStatus(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    video_status = Endpoint.LazyDataSet("VideoStatus")
+
     def __init__(
         self,
         game_date=GameDate.default,
@@ -58,9 +59,4 @@ class VideoStatus(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.video_status = Endpoint.DataSet(data=data_sets["VideoStatus"])
+        self.load_data_sets(self.nba_response.get_data_sets())
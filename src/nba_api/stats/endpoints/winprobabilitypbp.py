@@ -36,11 +36,13 @@ class WinProbabilityPBP(Endpoint):
     }
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+    game_info = Endpoint.LazyDataSet("GameInfo")
+    win_prob_p_bp = Endpoint.LazyDataSet("WinProbPBP")
+
     def __init__(
         self,
         game_id,
@@ -69,10 +71,4 @@ class WinProbabilityPBP(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.win_prob_p_bp = Endpoint.DataSet(data=data_sets["WinProbPBP"])
+        self.load_data_sets(self.nba_response.get_data_sets())
@@ -1,3 +1,11 @@
+"""Static player and team data.
+
+``players`` and ``wnba_players`` are stored in the packed ``players.bin`` file
+(see ``nba_api.stats.library.packed``) and decoded on first access.
+"""
+
+from nba_api.stats.library.packed import load_players
+
 player_index_id = 0
 player_index_last_name = 1
 player_index_first_name = 2
@@ -6,6261 +14,79 @@ player_index_is_active = 4
 
 # Data last updated: Nov, 13 2025
 
-players = [
-    [76001, "Abdelnaby", "Alaa", "Alaa Abdelnaby", False],
-    [76002, "Abdul-Aziz", "Zaid", "Zaid Abdul-Aziz", False],
-    [76003, "Abdul-Jabbar", "Kareem", "Kareem Abdul-Jabbar", False],
-    [51, "Abdul-Rauf", "Mahmoud", "Mahmoud Abdul-Rauf", False],
-    [1505, "Abdul-Wahad", "Tariq", "Tariq Abdul-Wahad", False],
-    [949, "Abdur-Rahim", "Shareef", "Shareef Abdur-Rahim", False],
-    [76005, "Abernethy", "Tom", "Tom Abernethy", False],
-    [76006, "Able", "Forest", "Forest Able", False],
-    [76007, "Abramovic", "John", "John Abramovic", False],
-    [203518, "Abrines", "Alex", "Alex Abrines", False],
-    [1630173, "Achiuwa", "Precious", "Precious Achiuwa", True],
-    [101165, "Acker", "Alex", "Alex Acker", False],
-    [76008, "Ackerman", "Donald", "Donald Ackerman", False],
-    [76009, "Acres", "Mark", "Mark Acres", False],
-    [76010, "Acton", "Charles", "Charles Acton", False],
-    [203112, "Acy", "Quincy", "Quincy Acy", False],
-    [76011, "Adams", "Alvan", "Alvan Adams", False],
-    [76012, "Adams", "Don", "Don Adams", False],
-    [200801, "Adams", "Hassan", "Hassan Adams", False],
-    [1629121, "Adams", "Jaylen", "Jaylen Adams", False],
-    [203919, "Adams", "Jordan", "Jordan Adams", False],
-    [149, "Adams", "Michael", "Michael Adams", False],
-    [203500, "Adams", "Steven", "Steven Adams", True],
-    [912, "Addison", "Rafael", "Rafael Addison", False],
-    [1628389, "Adebayo", "Bam", "Bam Adebayo", True],
-    [1629061, "Adel", "Deng", "Deng Adel", False],
-    [76015, "Adelman", "Rick", "Rick Adelman", False],
-    [202399, "Adrien", "Jeff", "Jeff Adrien", False],
-    [201167, "Afflalo", "Arron", "Arron Afflalo", False],
-    [1630534, "Agbaji", "Ochai", "Ochai Agbaji", True],
-    [200772, "Ager", "Maurice", "Maurice Ager", False],
-    [76016, "Aguirre", "Mark", "Mark Aguirre", False],
-    [201336, "Ahearn", "Blake", "Blake Ahearn", False],
-    [76017, "Ainge", "Danny", "Danny Ainge", False],
-    [201582, "Ajinca", "Alexis", "Alexis Ajinca", False],
-    [76018, "Akin", "Henry", "Henry Akin", False],
-    [203006, "Akognon", "Josh", "Josh Akognon", False],
-    [1629152, "Akoon-Purcell", "DeVaughn", "DeVaughn Akoon-Purcell", False],
-    [202374, "Alabi", "Solomon", "Solomon Alabi", False],
-    [76019, "Alarie", "Mark", "Mark Alarie", False],
-    [76020, "Alcorn", "Gary", "Gary Alcorn", False],
-    [1630583, "Aldama", "Santi", "Santi Aldama", True],
-    [203128, "Aldemir", "Furkan", "Furkan Aldemir", False],
-    [202332, "Aldrich", "Cole", "Cole Aldrich", False],
-    [200746, "Aldridge", "LaMarcus", "LaMarcus Aldridge", False],
-    [76021, "Aleksinas", "Chuck", "Chuck Aleksinas", False],
-    [1626146, "Alexander", "Cliff", "Cliff Alexander", False],
-    [724, "Alexander", "Cory", "Cory Alexander", False],
-    [2042, "Alexander", "Courtney", "Courtney Alexander", False],
-    [76022, "Alexander", "Gary", "Gary Alexander", False],
-    [201570, "Alexander", "Joe", "Joe Alexander", False],
-    [1629734, "Alexander", "Kyle", "Kyle Alexander", False],
-    [1641725, "Alexander", "Trey", "Trey Alexander", True],
-    [1630234, "Alexander", "Ty-Shon", "Ty-Shon Alexander", False],
-    [2349, "Alexander", "Victor", "Victor Alexander", False],
-    [1629638, "Alexander-Walker", "Nickeil", "Nickeil Alexander-Walker", True],
-    [76024, "Alford", "Steve", "Steve Alford", False],
-    [1628959, "Alkins", "Rawle", "Rawle Alkins", False],
-    [76028, "Allen", "Bob", "Bob Allen", False],
-    [1628960, "Allen", "Grayson", "Grayson Allen", True],
-    [1628386, "Allen", "Jarrett", "Jarrett Allen", True],
-    [706, "Allen", "Jerome", "Jerome Allen", False],
-    [1628443, "Allen", "Kadeem", "Kadeem Allen", False],
-    [202730, "Allen", "Lavoy", "Lavoy Allen", False],
-    [76027, "Allen", "Lucius", "Lucius Allen", False],
-    [2124, "Allen", "Malik", "Malik Allen", False],
-    [76025, "Allen", "Randy", "Randy Allen", False],
-    [951, "Allen", "Ray", "Ray Allen", False],
-    [1641851, "Allen", "Timmy", "Timmy Allen", False],
-    [2754, "Allen", "Tony", "Tony Allen", False],
-    [76029, "Allison", "Odis", "Odis Allison", False],
-    [200984, "Allred", "Lance", "Lance Allred", False],
-    [76030, "Allums", "Darrell", "Darrell Allums", False],
-    [201165, "Almond", "Morris", "Morris Almond", False],
-    [308, "Alston", "Derrick", "Derrick Alston", False],
-    [1747, "Alston", "Rafer", "Rafer Alston", False],
-    [1824, "Aluma", "Peter", "Peter Aluma", False],
-    [1630631, "Alvarado", "Jose", "Jose Alvarado", True],
-    [680, "Amaechi", "John", "John Amaechi", False],
-    [732, "Amaya", "Ashraf", "Ashraf Amaya", False],
-    [202329, "Aminu", "Al-Farouq", "Al-Farouq Aminu", False],
-    [200811, "Amundson", "Lou", "Lou Amundson", False],
-    [76034, "Anderegg", "Bob", "Bob Anderegg", False],
-    [2365, "Andersen", "Chris", "Chris Andersen", False],
-    [2431, "Andersen", "David", "David Andersen", False],
-    [101187, "Anderson", "Alan", "Alan Anderson", False],
-    [202079, "Anderson", "Antonio", "Antonio Anderson", False],
-    [76035, "Anderson", "Cliff", "Cliff Anderson", False],
-    [76036, "Anderson", "Daniel", "Daniel Anderson", False],
-    [1507, "Anderson", "Derek", "Derek Anderson", False],
-    [76037, "Anderson", "Dwight", "Dwight Anderson", False],
-    [944, "Anderson", "Eric", "Eric Anderson", False],
-    [246, "Anderson", "Greg", "Greg Anderson", False],
-    [202341, "Anderson", "James", "James Anderson", False],
-    [76040, "Anderson", "Jerome", "Jerome Anderson", False],
-    [1626147, "Anderson", "Justin", "Justin Anderson", False],
-    [72, "Anderson", "Kenny", "Kenny Anderson", False],
-    [76041, "Anderson", "Kim", "Kim Anderson", False],
-    [203937, "Anderson", "Kyle", "Kyle Anderson", True],
-    [76042, "Anderson", "Michael", "Michael Anderson", False],
-    [76043, "Anderson", "Mitchell", "Mitchell Anderson", False],
-    [98, "Anderson", "Nick", "Nick Anderson", False],
-    [76045, "Anderson", "Richard", "Richard Anderson", False],
-    [76046, "Anderson", "Ron", "Ron Anderson", False],
-    [201583, "Anderson", "Ryan", "Ryan Anderson", False],
-    [1000, "Anderson", "Shandon", "Shandon Anderson", False],
-    [335, "Anderson", "Willie", "Willie Anderson", False],
-    [76048, "Anderzunas", "Wally", "Wally Anderzunas", False],
-    [101149, "Andriuskevicius", "Martynas", "Martynas Andriuskevicius", False],
-    [76049, "Anielak", "Don", "Don Anielak", False],
-    [1628387, "Anigbogu", "Ike", "Ike Anigbogu", False],
-    [76050, "Ansley", "Michael", "Michael Ansley", False],
-    [1512, "Anstey", "Chris", "Chris Anstey", False],
-    [1630828, "Antetokounmpo", "Alex", "Alex Antetokounmpo", True],
-    [203507, "Antetokounmpo", "Giannis", "Giannis Antetokounmpo", True],
-    [1628961, "Antetokounmpo", "Kostas", "Kostas Antetokounmpo", False],
-    [203648, "Antetokounmpo", "Thanasis", "Thanasis Antetokounmpo", True],
-    [2546, "Anthony", "Carmelo", "Carmelo Anthony", False],
-    [1630175, "Anthony", "Cole", "Cole Anthony", True],
-    [21, "Anthony", "Greg", "Greg Anthony", False],
-    [201202, "Anthony", "Joel", "Joel Anthony", False],
-    [203544, "Antic", "Pero", "Pero Antic", False],
-    [1628384, "Anunoby", "OG", "OG Anunoby", True],
-    [203951, "Appling", "Keith", "Keith Appling", False],
-    [2737, "Araujo", "Rafael", "Rafael Araujo", False],
-    [76053, "Arceneaux", "Stacey", "Stacey Arceneaux", False],
-    [76054, "Archibald", "Nate", "Nate Archibald", False],
-    [2425, "Archibald", "Robert", "Robert Archibald", False],
-    [1627853, "Arcidiacono", "Ryan", "Ryan Arcidiacono", False],
-    [76055, "Ard", "Jim", "Jim Ard", False],
-    [2240, "Arenas", "Gilbert", "Gilbert Arenas", False],
-    [2772, "Ariza", "Trevor", "Trevor Ariza", False],
-    [76056, "Arizin", "Paul", "Paul Arizin", False],
-    [76057, "Arlauckas", "Joe", "Joe Arlauckas", False],
-    [769, "Armstrong", "B.J.", "B.J. Armstrong", False],
-    [76061, "Armstrong", "Bob", "Bob Armstrong", False],
-    [2220, "Armstrong", "Brandon", "Brandon Armstrong", False],
-    [353, "Armstrong", "Darrell", "Darrell Armstrong", False],
-    [200756, "Armstrong", "Hilton", "Hilton Armstrong", False],
-    [76060, "Armstrong", "Paul", "Paul Armstrong", False],
-    [1642379, "Armstrong", "Taran", "Taran Armstrong", False],
-    [76059, "Armstrong", "Tate", "Tate Armstrong", False],
-    [76062, "Arnelle", "Jesse", "Jesse Arnelle", False],
-    [76063, "Arnette", "Jay", "Jay Arnette", False],
-    [76064, "Arnzen", "Bob", "Bob Arnzen", False],
-    [2306, "Arroyo", "Carlos", "Carlos Arroyo", False],
-    [201589, "Arthur", "Darrell", "Darrell Arthur", False],
-    [76065, "Arthurs", "John", "John Arthurs", False],
-    [1628503, "Artis", "Jamel", "Jamel Artis", False],
-    [201600, "Asik", "Omer", "Omer Asik", False],
-    [355, "Askew", "Vincent", "Vincent Askew", False],
-    [173, "Askins", "Keith", "Keith Askins", False],
-    [76068, "Asmonga", "Don", "Don Asmonga", False],
-    [76069, "Atha", "Richard", "Richard Atha", False],
-    [1088, "Atkins", "Chucky", "Chucky Atkins", False],
-    [76070, "Attles", "Alvin", "Alvin Attles", False],
-    [76071, "Aubuchon", "Chet", "Chet Aubuchon", False],
-    [278, "Augmon", "Stacey", "Stacey Augmon", False],
-    [201571, "Augustin", "D.J.", "D.J. Augustin", False],
-    [200788, "Augustine", "James", "James Augustine", False],
-    [1134, "Austin", "Ike", "Ike Austin", False],
-    [76073, "Austin", "John", "John Austin", False],
-    [76074, "Austin", "Ken", "Ken Austin", False],
-    [1630166, "Avdija", "Deni", "Deni Avdija", True],
-    [138, "Avent", "Anthony", "Anthony Avent", False],
-    [76076, "Averitt", "William", "William Averitt", False],
-    [1895, "Avery", "William", "William Avery", False],
-    [76078, "Awtrey", "Dennis", "Dennis Awtrey", False],
-    [1630555, "Ayayi", "Joel", "Joel Ayayi", False],
-    [202970, "Ayon", "Gustavo", "Gustavo Ayon", False],
-    [201965, "Ayres", "Jeff", "Jeff Ayres", False],
-    [1629028, "Ayton", "Deandre", "Deandre Ayton", True],
-    [101235, "Azubuike", "Kelenna", "Kelenna Azubuike", False],
-    [1628962, "Azubuike", "Udoka", "Udoka Azubuike", False],
-    [203569, "Babb", "Chris", "Chris Babb", False],
-    [202337, "Babbitt", "Luke", "Luke Babbitt", False],
-    [76079, "Babic", "Milos", "Milos Babic", False],
-    [76080, "Bach", "Johnny", "Johnny Bach", False],
-    [1628407, "Bacon", "Dwayne", "Dwayne Bacon", False],
-    [1630641, "Badji", "Ibou", "Ibou Badji", False],
-    [76081, "Baechtold", "Jim", "Jim Baechtold", False],
-    [2053, "Bagaric", "Dalibor", "Dalibor Bagaric", False],
-    [76082, "Bagley", "John", "John Bagley", False],
-    [1630542, "Bagley", "Marcus", "Marcus Bagley", False],
-    [1628963, "Bagley III", "Marvin", "Marvin Bagley III", True],
-    [1642846, "Bailey", "Ace", "Ace Bailey", True],
-    [1641735, "Bailey", "Amari", "Amari Bailey", False],
-    [76084, "Bailey", "Carl", "Carl Bailey", False],
-    [76083, "Bailey", "Gus", "Gus Bailey", False],
-    [76085, "Bailey", "James", "James Bailey", False],
-    [1847, "Bailey", "Thurl", "Thurl Bailey", False],
-    [1753, "Bailey", "Toby", "Toby Bailey", False],
-    [203946, "Bairstow", "Cameron", "Cameron Bairstow", False],
-    [1858, "Baker", "Mark", "Mark Baker", False],
-    [2486, "Baker", "Maurice", "Maurice Baker", False],
-    [76089, "Baker", "Norm", "Norm Baker", False],
-    [1627758, "Baker", "Ron", "Ron Baker", False],
-    [452, "Baker", "Vin", "Vin Baker", False],
-    [1627735, "Baldwin IV", "Wade", "Wade Baldwin IV", False],
-    [1631116, "Baldwin Jr.", "Patrick", "Patrick Baldwin Jr.", False],
-    [200764, "Balkman", "Renaldo", "Renaldo Balkman", False],
-    [76090, "Ball", "Cedric", "Cedric Ball", False],
-    [1630163, "Ball", "LaMelo", "LaMelo Ball", True],
-    [1628366, "Ball", "Lonzo", "Lonzo Ball", True],
-    [76091, "Ballard", "Greg", "Greg Ballard", False],
-    [76092, "Baltimore", "Herschel", "Herschel Baltimore", False],
-    [1628964, "Bamba", "Mo", "Mo Bamba", False],
-    [1631094, "Banchero", "Paolo", "Paolo Banchero", True],
-    [1630217, "Bane", "Desmond", "Desmond Bane", True],
-    [76093, "Banks", "Gene", "Gene Banks", False],
-    [2556, "Banks", "Marcus", "Marcus Banks", False],
-    [76094, "Bannister", "Ken", "Ken Bannister", False],
-    [76095, "Bantom", "Mike", "Mike Bantom", False],
-    [1630625, "Banton", "Dalano", "Dalano Banton", False],
-    [1627760, "Barber", "Cat", "Cat Barber", False],
-    [76096, "Barber", "John", "John Barber", False],
-    [2571, "Barbosa", "Leandro", "Leandro Barbosa", False],
-    [76097, "Bardo", "Stephen", "Stephen Bardo", False],
-    [200826, "Barea", "J.J.", "J.J. Barea", False],
-    [200745, "Bargnani", "Andrea", "Andrea Bargnani", False],
-    [76098, "Barker", "Cliff", "Cliff Barker", False],
-    [76099, "Barker", "Tom", "Tom Barker", False],
-    [787, "Barkley", "Charles", "Charles Barkley", False],
-    [2057, "Barkley", "Erick", "Erick Barkley", False],
-    [76102, "Barksdale", "Don", "Don Barksdale", False],
-    [1631230, "Barlow", "Dominick", "Dominick Barlow", True],
-    [203084, "Barnes", "Harrison", "Harrison Barnes", True],
-    [76103, "Barnes", "Harry", "Harry Barnes", False],
-    [76105, "Barnes", "Jim", "Jim Barnes", False],
-    [76104, "Barnes", "Marvin", "Marvin Barnes", False],
-    [2440, "Barnes", "Matt", "Matt Barnes", False],
-    [1630567, "Barnes", "Scottie", "Scottie Barnes", True],
-    [76107, "Barnett", "Dick", "Dick Barnett", False],
-    [76106, "Barnett", "Jim", "Jim Barnett", False],
-    [76108, "Barnhill", "John", "John Barnhill", False],
-    [76109, "Barnhill", "Norton", "Norton Barnhill", False],
-    [1642964, "Barnhizer", "Brooks", "Brooks Barnhizer", True],
-    [76110, "Barnhorst", "Leo", "Leo Barnhorst", False],
-    [76111, "Barr", "John", "John Barr", False],
-    [76112, "Barr", "Mike", "Mike Barr", False],
-    [76113, "Barr", "Thomas", "Thomas Barr", False],
-    [2857, "Barrett", "Andre", "Andre Barrett", False],
-    [76114, "Barrett", "Ernie", "Ernie Barrett", False],
-    [1629628, "Barrett", "RJ", "RJ Barrett", True],
-    [2853, "Barron", "Earl", "Earl Barron", False],
-    [344, "Barros", "Dana", "Dana Barros", False],
-    [699, "Barry", "Brent", "Brent Barry", False],
-    [1003, "Barry", "Drew", "Drew Barry", False],
-    [468, "Barry", "Jon", "Jon Barry", False],
-    [600013, "Barry", "Rick", "Rick Barry", False],
-    [76117, "Bartels", "Ed", "Ed Bartels", False],
-    [76118, "Bartolome", "Vic", "Vic Bartolome", False],
-    [203115, "Barton", "Will", "Will Barton", False],
-    [101188, "Basden", "Eddie", "Eddie Basden", False],
-    [76119, "Baskerville", "Jerry", "Jerry Baskerville", False],
-    [101138, "Bass", "Brandon", "Brandon Bass", False],
-    [1628238, "Bass", "Paris", "Paris Bass", False],
-    [76120, "Bassett", "Tim", "Tim Bassett", False],
-    [1629646, "Bassey", "Charles", "Charles Bassey", True],
-    [1766, "Baston", "Maceo", "Maceo Baston", False],
-    [2370, "Bateer", "Mengke", "Mengke Bateer", False],
-    [76121, "Bates", "Billyray", "Billyray Bates", False],
-    [1641734, "Bates", "Emoni", "Emoni Bates", False],
-    [1642926, "Bates", "Tamar", "Tamar Bates", True],
-    [1628966, "Bates-Diop", "Keita", "Keita Bates-Diop", False],
-    [101212, "Batista", "Esteban", "Esteban Batista", False],
-    [2471, "Batiste", "Mike", "Mike Batiste", False],
-    [1499, "Battie", "Tony", "Tony Battie", False],
-    [2203, "Battier", "Shane", "Shane Battier", False],
-    [1642419, "Battle", "Jamison", "Jamison Battle", True],
-    [174, "Battle", "John", "John Battle", False],
-    [76123, "Battle", "Kenny", "Kenny Battle", False],
-    [76124, "Batton", "Dave", "Dave Batton", False],
-    [201587, "Batum", "Nicolas", "Nicolas Batum", True],
-    [1641878, "Baugh", "Damion", "Damion Baugh", False],
-    [76125, "Baum", "Johnny", "Johnny Baum", False],
-    [76126, "Baumholtz", "Frankie", "Frankie Baumholtz", False],
-    [2437, "Baxter", "Lonny", "Lonny Baxter", False],
-    [201573, "Bayless", "Jerryd", "Jerryd Bayless", False],
-    [76127, "Baylor", "Elgin", "Elgin Baylor", False],
-    [203382, "Baynes", "Aron", "Aron Baynes", False],
-    [76128, "Bazarevich", "Sergei", "Sergei Bazarevich", False],
-    [203145, "Bazemore", "Kent", "Kent Bazemore", False],
-    [1629647, "Bazley", "Darius", "Darius Bazley", False],
-    [76129, "Beach", "Ed", "Ed Beach", False],
-    [203078, "Beal", "Bradley", "Bradley Beal", True],
-    [76130, "Beard", "Butch", "Butch Beard", False],
-    [76131, "Beard", "Ralph", "Ralph Beard", False],
-    [2602, "Beasley", "Jerome", "Jerome Beasley", False],
-    [1627736, "Beasley", "Malik", "Malik Beasley", False],
-    [201563, "Beasley", "Michael", "Michael Beasley", False],
-    [76133, "Beaty", "Zelmo", "Zelmo Beaty", False],
-    [201958, "Beaubois", "Rodrigue", "Rodrigue Beaubois", False],
-    [1630699, "Beauchamp", "MarJon", "MarJon Beauchamp", False],
-    [76134, "Beck", "Byron", "Byron Beck", False],
-    [1133, "Beck", "Corey", "Corey Beck", False],
-    [76136, "Beck", "Ernie", "Ernie Beck", False],
-    [76137, "Becker", "Moe", "Moe Becker", False],
-    [76138, "Bedford", "William", "William Bedford", False],
-    [1641736, "Beekman", "Reece", "Reece Beekman", False],
-    [76139, "Beenders", "Hank", "Hank Beenders", False],
-    [76140, "Behagen", "Ron", "Ron Behagen", False],
-    [76141, "Behnke", "Elmer", "Elmer Behnke", False],
-    [201158, "Belinelli", "Marco", "Marco Belinelli", False],
-    [2294, "Bell", "Charlie", "Charlie Bell", False],
-    [76142, "Bell", "Dennis", "Dennis Bell", False],
-    [1628395, "Bell", "Jordan", "Jordan Bell", False],
-    [1952, "Bell", "Raja", "Raja Bell", False],
-    [2559, "Bell", "Troy", "Troy Bell", False],
-    [76143, "Bell", "William", "William Bell", False],
-    [76144, "Bellamy", "Walt", "Walt Bellamy", False],
-    [1627761, "Bembry", "DeAndre'", "DeAndre' Bembry", False],
-    [76145, "Bemoras", "Irv", "Irv Bemoras", False],
-    [76146, "Benbow", "Leon", "Leon Benbow", False],
-    [1627733, "Bender", "Dragan", "Dragan Bender", False],
-    [1886, "Bender", "Jonathan", "Jonathan Bender", False],
-    [203968, "Benimon", "Jerrelle", "Jerrelle Benimon", False],
-    [104, "Benjamin", "Benoit", "Benoit Benjamin", False],
-    [1736, "Benjamin", "Corey", "Corey Benjamin", False],
-    [203461, "Bennett", "Anthony", "Anthony Bennett", False],
-    [1120, "Bennett", "Elmer", "Elmer Bennett", False],
-    [712, "Bennett", "Mario", "Mario Bennett", False],
-    [76151, "Bennett", "Mel", "Mel Bennett", False],
-    [76148, "Bennett", "Tony", "Tony Bennett", False],
-    [76152, "Bennett", "Winston", "Winston Bennett", False],
-    [128, "Benoit", "David", "David Benoit", False],
-    [202728, "Benson", "Keith", "Keith Benson", False],
-    [76154, "Benson", "Kent", "Kent Benson", False],
-    [1627791, "Bentil", "Ben", "Ben Bentil", False],
-    [76155, "Berce", "Gene", "Gene Berce", False],
-    [76156, "Bergen", "Gary", "Gary Bergen", False],
-    [1642866, "Beringer", "Joan", "Joan Beringer", True],
-    [1631262, "Bernard", "Jules", "Jules Bernard", False],
-    [76157, "Berry", "Ricky", "Ricky Berry", False],
-    [76158, "Berry", "Walter", "Walter Berry", False],
-    [1629541, "Bertans", "Dairis", "Dairis Bertans", False],
-    [202722, "Bertans", "Davis", "Davis Bertans", False],
-    [76159, "Beshore", "Del", "Del Beshore", False],
-    [696, "Best", "Travis", "Travis Best", False],
-    [201976, "Beverley", "Patrick", "Patrick Beverley", False],
-    [1630180, "Bey", "Saddiq", "Saddiq Bey", True],
-    [1630189, "Bey", "Tyler", "Tyler Bey", False],
-    [204021, "Bhullar", "Sim", "Sim Bhullar", False],
-    [76160, "Bianchi", "Al", "Al Bianchi", False],
-    [76161, "Biasatti", "Hank", "Hank Biasatti", False],
-    [76162, "Bibby", "Henry", "Henry Bibby", False],
-    [1710, "Bibby", "Mike", "Mike Bibby", False],
-    [76163, "Biedenbach", "Ed", "Ed Biedenbach", False],
-    [2740, "Biedrins", "Andris", "Andris Biedrins", False],
-    [76164, "Bielke", "Don", "Don Bielke", False],
-    [76165, "Bigelow", "Bob", "Bob Bigelow", False],
-    [1497, "Billups", "Chauncey", "Chauncey Billups", False],
-    [76166, "Bing", "Dave", "Dave Bing", False],
-    [76167, "Binion", "Joe", "Joe Binion", False],
-    [203920, "Birch", "Khem", "Khem Birch", False],
-    [1628444, "Bird", "Jabari", "Jabari Bird", False],
-    [76168, "Bird", "Jerry", "Jerry Bird", False],
-    [1449, "Bird", "Larry", "Larry Bird", False],
-    [76170, "Birdsong", "Otis", "Otis Birdsong", False],
-    [76171, "Bishop", "Gale", "Gale Bishop", False],
-    [1629048, "Bitadze", "Goga", "Goga Bitadze", True],
-    [1641931, "Bitim", "Onuralp", "Onuralp Bitim", False],
-    [202687, "Biyombo", "Bismack", "Bismack Biyombo", True],
-    [202357, "Bjelica", "Nemanja", "Nemanja Bjelica", False],
-    [76172, "Blab", "Uwe", "Uwe Blab", False],
-    [1641710, "Black", "Anthony", "Anthony Black", True],
-    [76173, "Black", "Charlie", "Charlie Black", False],
-    [1641778, "Black", "Leaky", "Leaky Black", False],
-    [76174, "Black", "Norman", "Norman Black", False],
-    [204028, "Black", "Tarik", "Tarik Black", False],
-    [76175, "Black", "Tom", "Tom Black", False],
-    [76176, "Blackman", "Rolando", "Rolando Blackman", False],
-    [76180, "Blackwell", "Alex", "Alex Blackwell", False],
-    [76177, "Blackwell", "Cory", "Cory Blackwell", False],
-    [1806, "Blackwell", "James", "James Blackwell", False],
-    [76179, "Blackwell", "Nate", "Nate Blackwell", False],
-    [201971, "Blair", "DeJuan", "DeJuan Blair", False],
-    [2581, "Blake", "Steve", "Steve Blake", False],
-    [202392, "Blakely", "Marqus", "Marqus Blakely", False],
-    [1628469, "Blakeney", "Antonio", "Antonio Blakeney", False],
-    [200807, "Blalock", "Will", "Will Blalock", False],
-    [76182, "Blaney", "George", "George Blaney", False],
-    [76183, "Blanks", "Lance", "Lance Blanks", False],
-    [76184, "Blanton", "Ricky", "Ricky Blanton", False],
-    [101154, "Blatche", "Andray", "Andray Blatche", False],
-    [302, "Blaylock", "Mookie", "Mookie Blaylock", False],
-    [202339, "Bledsoe", "Eric", "Eric Bledsoe", False],
-    [1629833, "Blevins", "Keljin", "Keljin Blevins", False],
-    [76186, "Blevins", "Leon", "Leon Blevins", False],
-    [76187, "Block", "John", "John Block", False],
-    [76188, "Bloom", "Mike", "Mike Bloom", False],
-    [1628417, "Blossomgame", "Jaron", "Jaron Blossomgame", False],
-    [916, "Blount", "Corie", "Corie Blount", False],
-    [1548, "Blount", "Mark", "Mark Blount", False],
-    [203505, "Blue", "Vander", "Vander Blue", False],
-    [1629129, "Bluiett", "Trevon", "Trevon Bluiett", False],
-    [76189, "Blume", "Ray", "Ray Blume", False],
-    [76190, "Bobb", "Nelson", "Nelson Bobb", False],
-    [2800, "Bobbitt", "Tony", "Tony Bobbitt", False],
-    [76191, "Bockhorn", "Arlen", "Arlen Bockhorn", False],
-    [1631205, "Boeheim", "Buddy", "Buddy Boeheim", False],
-    [76192, "Boerwinkle", "Tom", "Tom Boerwinkle", False],
-    [2586, "Bogans", "Keith", "Keith Bogans", False],
-    [202711, "Bogdanovic", "Bojan", "Bojan Bogdanovic", False],
-    [203992, "Bogdanović", "Bogdan", "Bogdan Bogdanović", True],
-    [177, "Bogues", "Muggsy", "Muggsy Bogues", False],
-    [101106, "Bogut", "Andrew", "Andrew Bogut", False],
-    [1564, "Bohannon", "Etdrick", "Etdrick Bohannon", False],
-    [1629626, "Bol", "Bol", "Bol Bol", False],
-    [76195, "Bol", "Manute", "Manute Bol", False],
-    [1628413, "Bolden", "Jonah", "Jonah Bolden", False],
-    [1629716, "Bolden", "Marques", "Marques Bolden", False],
-    [76196, "Bolger", "Bill", "Bill Bolger", False],
-    [1630195, "Bolmaro", "Leandro", "Leandro Bolmaro", False],
-    [1627762, "Bolomboy", "Joel", "Joel Bolomboy", False],
-    [76197, "Bolstorff", "Doug", "Doug Bolstorff", False],
-    [76203, "Bon Salle", "George H.", "George H. Bon Salle", False],
-    [1641737, "Bona", "Adem", "Adem Bona", True],
-    [76198, "Bond", "Phil", "Phil Bond", False],
-    [1603, "Bond", "Walter", "Walter Bond", False],
-    [1629648, "Bone", "Jordan", "Jordan Bone", False],
-    [1121, "Boney", "Dexter", "Dexter Boney", False],
-    [1629067, "Bonga", "Isaac", "Isaac Bonga", False],
-    [76201, "Bonham", "Ron", "Ron Bonham", False],
-    [41, "Bonner", "Anthony", "Anthony Bonner", False],
-    [2588, "Bonner", "Matt", "Matt Bonner", False],
-    [1626164, "Booker", "Devin", "Devin Booker", True],
-    [511, "Booker", "Melvin", "Melvin Booker", False],
-    [202344, "Booker", "Trevor", "Trevor Booker", False],
-    [200767, "Boone", "Josh", "Josh Boone", False],
-    [76204, "Boone", "Ron", "Ron Boone", False],
-    [1916, "Booth", "Calvin", "Calvin Booth", False],
-    [1522, "Booth", "Keith", "Keith Booth", False],
-    [76206, "Boozer", "Bob", "Bob Boozer", False],
-    [2430, "Boozer", "Carlos", "Carlos Boozer", False],
-    [2414, "Borchardt", "Curtis", "Curtis Borchardt", False],
-    [76207, "Bornheimer", "Jake", "Jake Bornheimer", False],
-    [1953, "Borrell", "Lazaro", "Lazaro Borrell", False],
-    [76209, "Borsavage", "Costic", "Costic Borsavage", False],
-    [76210, "Boryla", "Vince", "Vince Boryla", False],
-    [2547, "Bosh", "Chris", "Chris Bosh", False],
-    [76211, "Bostic", "Jim", "Jim Bostic", False],
-    [1630527, "Boston", "Brandon", "Brandon Boston", False],
-    [76212, "Boston", "Lawrence", "Lawrence Boston", False],
-    [76213, "Boswell", "Tom", "Tom Boswell", False],
-    [1628449, "Boucher", "Chris", "Chris Boucher", True],
-    [1630547, "Bouknight", "James", "James Bouknight", False],
-    [2257, "Boumtje-Boumtje", "Ruben", "Ruben Boumtje-Boumtje", False],
-    [1631123, "Bouyea", "Jamaree", "Jamaree Bouyea", False],
-    [76214, "Boven", "Don", "Don Boven", False],
-    [1898, "Bowdler", "Cal", "Cal Bowdler", False],
-    [1477, "Bowen", "Bruce", "Bruce Bowen", False],
-    [1763, "Bowen", "Ryan", "Ryan Bowen", False],
-    [1628968, "Bowen II", "Brian", "Brian Bowen II", False],
-    [194, "Bowie", "Anthony", "Anthony Bowie", False],
-    [76217, "Bowie", "Sam", "Sam Bowie", False],
-    [1085, "Bowman", "Ira", "Ira Bowman", False],
-    [1629065, "Bowman", "Ky", "Ky Bowman", False],
-    [76219, "Bowman", "Nate", "Nate Bowman", False],
-    [671, "Boyce", "Donnie", "Donnie Boyce", False],
-    [76221, "Boyd", "Dennis", "Dennis Boyd", False],
-    [76222, "Boyd", "Fred", "Fred Boyd", False],
-    [76223, "Boyd", "Ken", "Ken Boyd", False],
-    [1863, "Boykins", "Earl", "Earl Boykins", False],
-    [76224, "Boykoff", "Harry", "Harry Boykoff", False],
-    [76225, "Boynes", "Winford", "Winford Boynes", False],
-    [200841, "Bozeman", "Cedric", "Cedric Bozeman", False],
-    [76226, "Bracey", "Steve", "Steve Bracey", False],
-    [202342, "Brackins", "Craig", "Craig Brackins", False],
-    [76227, "Bradds", "Gary", "Gary Bradds", False],
-    [76228, "Bradley", "Alex", "Alex Bradley", False],
-    [76229, "Bradley", "Alonzo", "Alonzo Bradley", False],
-    [202340, "Bradley", "Avery", "Avery Bradley", False],
-    [76233, "Bradley", "Bill", "Bill Bradley", False],
-    [76230, "Bradley", "Charles", "Charles Bradley", False],
-    [76231, "Bradley", "Dudley", "Dudley Bradley", False],
-    [76232, "Bradley", "Joe", "Joe Bradley", False],
-    [2214, "Bradley", "Michael", "Michael Bradley", False],
-    [762, "Bradley", "Shawn", "Shawn Bradley", False],
-    [1628396, "Bradley", "Tony", "Tony Bradley", True],
-    [1361, "Bradtke", "Mark", "Mark Bradtke", False],
-    [66, "Bragg", "Marques", "Marques Bragg", False],
-    [1765, "Braggs", "Torraye", "Torraye Braggs", False],
-    [1920, "Bramlett", "A.J.", "A.J. Bramlett", False],
-    [76237, "Branch", "Adrian", "Adrian Branch", False],
-    [1882, "Brand", "Elton", "Elton Brand", False],
-    [210, "Brandon", "Terrell", "Terrell Brandon", False],
-    [1631103, "Branham", "Malaki", "Malaki Branham", True],
-    [76238, "Brannum", "Bob", "Bob Brannum", False],
-    [76239, "Branson", "Brad", "Brad Branson", False],
-    [76240, "Branson", "Jesse", "Jesse Branson", False],
-    [1629714, "Brantley", "Jarrell", "Jarrell Brantley", False],
-    [76241, "Brasco", "Jim", "Jim Brasco", False],
-    [76242, "Bratz", "Mike", "Mike Bratz", False],
-    [76243, "Braun", "Carl", "Carl Braun", False],
-    [1631128, "Braun", "Christian", "Christian Braun", True],
-    [1629649, "Brazdeikis", "Ignas", "Ignas Brazdeikis", False],
-    [1642886, "Brea", "Koby", "Koby Brea", True],
-    [160, "Breaux", "Tim", "Tim Breaux", False],
-    [2452, "Bremer", "J.R.", "J.R. Bremer", False],
-    [76245, "Brennan", "Pete", "Pete Brennan", False],
-    [76246, "Brennan", "Tom", "Tom Brennan", False],
-    [76247, "Breuer", "Randy", "Randy Breuer", False],
-    [201147, "Brewer", "Corey", "Corey Brewer", False],
-    [2249, "Brewer", "Jamison", "Jamison Brewer", False],
-    [76248, "Brewer", "Jim", "Jim Brewer", False],
-    [76249, "Brewer", "Ron", "Ron Brewer", False],
-    [200758, "Brewer", "Ronnie", "Ronnie Brewer", False],
-    [2056, "Brezec", "Primoz", "Primoz Brezec", False],
-    [76250, "Brian", "Frank", "Frank Brian", False],
-    [783, "Brickowski", "Frank", "Frank Brickowski", False],
-    [76252, "Bridgeman", "Junior", "Junior Bridgeman", False],
-    [76253, "Bridges", "Bill", "Bill Bridges", False],
-    [1641779, "Bridges", "Jalen", "Jalen Bridges", False],
-    [1628969, "Bridges", "Mikal", "Mikal Bridges", True],
-    [1628970, "Bridges", "Miles", "Miles Bridges", True],
-    [76254, "Brightman", "Al", "Al Brightman", False],
-    [1628578, "Brimah", "Amida", "Amida Brimah", False],
-    [76255, "Brindley", "Audley", "Audley Brindley", False],
-    [1628515, "Briscoe", "Isaiah", "Isaiah Briscoe", False],
-    [76256, "Brisker", "John", "John Brisker", False],
-    [1629052, "Brissett", "Oshae", "Oshae Brissett", False],
-    [76257, "Bristow", "Allan", "Allan Bristow", False],
-    [76258, "Britt", "Tyrone", "Tyrone Britt", False],
-    [76259, "Britt", "Wayman", "Wayman Britt", False],
-    [76260, "Brittain", "Mike", "Mike Brittain", False],
-    [76261, "Britton", "David", "David Britton", False],
-    [1631167, "Brockington", "Izaiah", "Izaiah Brockington", False],
-    [201972, "Brockman", "Jon", "Jon Brockman", False],
-    [1629151, "Broekhoff", "Ryan", "Ryan Broekhoff", False],
-    [76262, "Brogan", "Jim", "Jim Brogan", False],
-    [1627763, "Brogdon", "Malcolm", "Malcolm Brogdon", False],
-    [76263, "Brokaw", "Gary", "Gary Brokaw", False],
-    [76264, "Brookfield", "Price", "Price Brookfield", False],
-    [201166, "Brooks", "Aaron", "Aaron Brooks", False],
-    [1629717, "Brooks", "Armoni", "Armoni Brooks", False],
-    [1628415, "Brooks", "Dillon", "Dillon Brooks", True],
-    [76265, "Brooks", "Kevin", "Kevin Brooks", False],
-    [202705, "Brooks", "MarShon", "MarShon Brooks", False],
-    [76266, "Brooks", "Michael", "Michael Brooks", False],
-    [418, "Brooks", "Scott", "Scott Brooks", False],
-    [1631232, "Brooks Jr.", "Keion", "Keion Brooks Jr.", False],
-    [1641780, "Broome", "Johni", "Johni Broome", True],
-    [2810, "Brown", "Andre", "Andre Brown", False],
-    [1626148, "Brown", "Anthony", "Anthony Brown", False],
-    [76284, "Brown", "Bob", "Bob Brown", False],
-    [201628, "Brown", "Bobby", "Bobby Brown", False],
-    [1628971, "Brown", "Bruce", "Bruce Brown", True],
-    [359, "Brown", "Chucky", "Chucky Brown", False],
-    [2245, "Brown", "Damone", "Damone Brown", False],
-    [76270, "Brown", "Darrell", "Darrell Brown", False],
-    [244, "Brown", "Dee", "Dee Brown", False],
-    [200793, "Brown", "Dee", "Dee Brown", False],
-    [201974, "Brown", "Derrick", "Derrick Brown", False],
-    [2484, "Brown", "Devin", "Devin Brown", False],
-    [2081, "Brown", "Ernest", "Ernest Brown", False],
-    [76272, "Brown", "Fred", "Fred Brown", False],
-    [76273, "Brown", "George", "George Brown", False],
-    [1871, "Brown", "Gerald", "Gerald Brown", False],
-    [76275, "Brown", "Harold", "Harold Brown", False],
-    [203913, "Brown", "Jabari", "Jabari Brown", False],
-    [1627759, "Brown", "Jaylen", "Jaylen Brown", True],
-    [76276, "Brown", "John", "John Brown", False],
-    [2208, "Brown", "Kedrick", "Kedrick Brown", False],
-    [1631112, "Brown", "Kendall", "Kendall Brown", False],
-    [1641738, "Brown", "Kobe", "Kobe Brown", True],
-    [2198, "Brown", "Kwame", "Kwame Brown", False],
-    [76278, "Brown", "Leon", "Leon Brown", False],
-    [76279, "Brown", "Lewis", "Lewis Brown", False],
-    [203485, "Brown", "Lorenzo", "Lorenzo Brown", False],
-    [992, "Brown", "Marcus", "Marcus Brown", False],
-    [203900, "Brown", "Markel", "Markel Brown", False],
-    [1479, "Brown", "Mike", "Mike Brown", False],
-    [1629650, "Brown", "Moses", "Moses Brown", False],
-    [76277, "Brown", "Myron", "Myron Brown", False],
-    [136, "Brown", "P.J.", "P.J. Brown", False],
-    [753, "Brown", "Randy", "Randy Brown", False],
-    [76282, "Brown", "Raymond", "Raymond Brown", False],
-    [76283, "Brown", "Rickey", "Rickey Brown", False],
-    [76286, "Brown", "Roger", "Roger Brown", False],
-    [200769, "Brown", "Shannon", "Shannon Brown", False],
-    [76285, "Brown", "Stan", "Stan Brown", False],
-    [1628425, "Brown", "Sterling", "Sterling Brown", False],
-    [2357, "Brown", "Tierre", "Tierre Brown", False],
-    [76268, "Brown", "Tony", "Tony Brown", False],
-    [1630535, "Brown III", "Greg", "Greg Brown III", False],
-    [1629718, "Brown Jr.", "Charlie", "Charlie Brown Jr.", False],
-    [1630602, "Brown Jr.", "Chaundee", "Chaundee Brown Jr.", False],
-    [1628972, "Brown Jr.", "Troy", "Troy Brown Jr.", False],
-    [76287, "Browne", "Jim", "Jim Browne", False],
-    [76288, "Brundy", "Stanley", "Stanley Brundy", False],
-    [1628973, "Brunson", "Jalen", "Jalen Brunson", True],
-    [1594, "Brunson", "Rick", "Rick Brunson", False],
-    [1627852, "Brussino", "Nicolas", "Nicolas Brussino", False],
-    [1642868, "Bryant", "Carter", "Carter Bryant", True],
-    [1629091, "Bryant", "Elijah", "Elijah Bryant", False],
-    [76289, "Bryant", "Emmette", "Emmette Bryant", False],
-    [76290, "Bryant", "Joe", "Joe Bryant", False],
-    [977, "Bryant", "Kobe", "Kobe Bryant", False],
-    [95, "Bryant", "Mark", "Mark Bryant", False],
-    [1628418, "Bryant", "Thomas", "Thomas Bryant", True],
-    [76291, "Bryant", "Wallace", "Wallace Bryant", False],
-    [76292, "Bryn", "Torgeir", "Torgeir Bryn", False],
-    [1629783, "Buchanan", "Shaq", "Shaq Buchanan", False],
-    [76293, "Buckhalter", "Joe", "Joe Buckhalter", False],
-    [76294, "Bucknall", "Steve", "Steve Bucknall", False],
-    [76295, "Buckner", "Cleveland", "Cleveland Buckner", False],
-    [1761, "Buckner", "Greg", "Greg Buckner", False],
-    [76296, "Buckner", "Quinn", "Quinn Buckner", False],
-    [76297, "Budd", "Dave", "Dave Budd", False],
-    [201978, "Budinger", "Chase", "Chase Budinger", False],
-    [76298, "Budko", "Walter", "Walter Budko", False],
-    [146, "Buechler", "Jud", "Jud Buechler", False],
-    [1641723, "Bufkin", "Kobe", "Kobe Bufkin", False],
-    [1934, "Buford", "Rodney", "Rodney Buford", False],
-    [672, "Bullard", "Matt", "Matt Bullard", False],
-    [203493, "Bullock Jr.", "Reggie", "Reggie Bullock Jr.", False],
-    [76300, "Bunch", "Greg", "Greg Bunch", False],
-    [76301, "Bunt", "Dick", "Dick Bunt", False],
-    [76302, "Buntin", "Bill", "Bill Buntin", False],
-    [76303, "Burden", "Luther", "Luther Burden", False],
-    [2469, "Burke", "Pat", "Pat Burke", False],
-    [203504, "Burke", "Trey", "Trey Burke", False],
-    [76304, "Burkman", "Roger", "Roger Burkman", False],
-    [202692, "Burks", "Alec", "Alec Burks", False],
-    [2766, "Burks", "Antonio", "Antonio Burks", False],
-    [101207, "Burleson", "Kevin", "Kevin Burleson", False],
-    [76305, "Burleson", "Tom", "Tom Burleson", False],
-    [76306, "Burmaster", "Jack", "Jack Burmaster", False],
-    [76307, "Burns", "David", "David Burns", False],
-    [76308, "Burns", "Evers", "Evers Burns", False],
-    [76309, "Burns", "Jim", "Jim Burns", False],
-    [197, "Burrell", "Scott", "Scott Burrell", False],
-    [76311, "Burris", "Art", "Art Burris", False],
-    [675, "Burrough", "Junior", "Junior Burrough", False],
-    [76313, "Burrow", "Bob", "Bob Burrow", False],
-    [1629126, "Burton", "Deonte", "Deonte Burton", False],
-    [76314, "Burton", "Ed", "Ed Burton", False],
-    [416, "Burton", "Willie", "Willie Burton", False],
-    [76316, "Burtt", "Steve", "Steve Burtt", False],
-    [76317, "Buse", "Don", "Don Buse", False],
-    [202221, "Butch", "Brian", "Brian Butch", False],
-    [76318, "Butcher", "Donnie", "Donnie Butcher", False],
-    [76319, "Butler", "Al", "Al Butler", False],
-    [2406, "Butler", "Caron", "Caron Butler", False],
-    [202364, "Butler", "Da'Sean", "Da'Sean Butler", False],
-    [76320, "Butler", "Greg", "Greg Butler", False],
-    [2866, "Butler", "Jackie", "Jackie Butler", False],
-    [1630215, "Butler", "Jared", "Jared Butler", False],
-    [348, "Butler", "Mitchell", "Mitchell Butler", False],
-    [2446, "Butler", "Rasual", "Rasual Butler", False],
-    [202710, "Butler III", "Jimmy", "Jimmy Butler III", True],
-    [1631219, "Butler Jr.", "John", "John Butler Jr.", False],
-    [202779, "Buycks", "Dwight", "Dwight Buycks", False],
-    [1641824, "Buzelis", "Matas", "Matas Buzelis", True],
-    [201182, "Byars", "Derrick", "Derrick Byars", False],
-    [101115, "Bynum", "Andrew", "Andrew Bynum", False],
-    [101198, "Bynum", "Will", "Will Bynum", False],
-    [76321, "Byrnes", "Marty", "Marty Byrnes", False],
-    [76322, "Byrnes", "Tommy", "Tommy Byrnes", False],
-    [76323, "Bytzura", "Mike", "Mike Bytzura", False],
-    [2560, "Cabarkapa", "Zarko", "Zarko Cabarkapa", False],
-    [76324, "Cable", "Barney", "Barney Cable", False],
-    [203998, "Caboclo", "Bruno", "Bruno Caboclo", False],
-    [1629719, "Cacok", "Devontae", "Devontae Cacok", False],
-    [679, "Caffey", "Jason", "Jason Caffey", False],
-    [262, "Cage", "Michael", "Michael Cage", False],
-    [1631288, "Cain", "Jamal", "Jamal Cain", True],
-    [76326, "Calabrese", "Gerry", "Gerry Calabrese", False],
-    [201979, "Calathes", "Nick", "Nick Calathes", False],
-    [101181, "Calderon", "Jose", "Jose Calderon", False],
-    [154, "Caldwell", "Adrian", "Adrian Caldwell", False],
-    [76328, "Caldwell", "Jim", "Jim Caldwell", False],
-    [76329, "Caldwell", "Joe", "Joe Caldwell", False],
-    [203484, "Caldwell-Pope", "Kentavious", "Kentavious Caldwell-Pope", True],
-    [76331, "Calhoun", "Bill", "Bill Calhoun", False],
-    [76330, "Calhoun", "Corky", "Corky Calhoun", False],
-    [76332, "Calip", "Demetrius", "Demetrius Calip", False],
-    [76333, "Callahan", "Tom", "Tom Callahan", False],
-    [76334, "Calloway", "Rick", "Rick Calloway", False],
-    [76335, "Calverley", "Ernie", "Ernie Calverley", False],
-    [76336, "Calvin", "Mack", "Mack Calvin", False],
-    [1641739, "Camara", "Toumani", "Toumani Camara", True],
-    [76337, "Cambridge", "Dexter", "Dexter Cambridge", False],
-    [948, "Camby", "Marcus", "Marcus Camby", False],
-    [1630267, "Campazzo", "Facundo", "Facundo Campazzo", False],
-    [922, "Campbell", "Elden", "Elden Campbell", False],
-    [76338, "Campbell", "Tony", "Tony Campbell", False],
-    [203477, "Canaan", "Isaiah", "Isaiah Canaan", False],
-    [1629962, "Cannady", "Devin", "Devin Cannady", False],
-    [76339, "Cannon", "Larry", "Larry Cannon", False],
-    [203991, "Capela", "Clint", "Clint Capela", True],
-    [202382, "Caracter", "Derrick", "Derrick Caracter", False],
-    [2073, "Cardinal", "Brian", "Brian Cardinal", False],
-    [1642928, "Cardwell", "Dylan", "Dylan Cardwell", True],
-    [1630176, "Carey Jr.", "Vernon", "Vernon Carey Jr.", False],
-    [76340, "Carl", "Howie", "Howie Carl", False],
-    [76341, "Carlisle", "Chet", "Chet Carlisle", False],
-    [2367, "Carlisle", "Geno", "Geno Carlisle", False],
-    [76342, "Carlisle", "Rick", "Rick Carlisle", False],
-    [76343, "Carlson", "Al", "Al Carlson", False],
-    [1642382, "Carlson", "Branden", "Branden Carlson", True],
-    [76344, "Carlson", "Don", "Don Carlson", False],
-    [76345, "Carney", "Bob", "Bob Carney", False],
-    [200760, "Carney", "Rodney", "Rodney Carney", False],
-    [76346, "Carpenter", "Bob", "Bob Carpenter", False],
-    [156, "Carr", "Antoine", "Antoine Carr", False],
-    [76348, "Carr", "Austin", "Austin Carr", False],
-    [713, "Carr", "Chris", "Chris Carr", False],
-    [1757, "Carr", "Cory", "Cory Carr", False],
-    [76350, "Carr", "Kenny", "Kenny Carr", False],
-    [76351, "Carr", "M.L.", "M.L. Carr", False],
-    [76352, "Carrington", "Bob", "Bob Carrington", False],
-    [1642267, "Carrington", "Bub", "Bub Carrington", True],
-    [201960, "Carroll", "DeMarre", "DeMarre Carroll", False],
-    [76353, "Carroll", "Joe Barry", "Joe Barry Carroll", False],
-    [2679, "Carroll", "Matt", "Matt Carroll", False],
-    [1131, "Carruth", "Jimmy", "Jimmy Carruth", False],
-    [1853, "Carter", "Anthony", "Anthony Carter", False],
-    [76355, "Carter", "Butch", "Butch Carter", False],
-    [1642269, "Carter", "Devin", "Devin Carter", True],
-    [76356, "Carter", "Fred", "Fred Carter", False],
-    [76357, "Carter", "George", "George Carter", False],
-    [76358, "Carter", "Howard", "Howard Carter", False],
-    [76359, "Carter", "Jake", "Jake Carter", False],
-    [1628975, "Carter", "Jevon", "Jevon Carter", True],
-    [2466, "Carter", "Maurice", "Maurice Carter", False],
-    [76360, "Carter", "Reggie", "Reggie Carter", False],
-    [76361, "Carter", "Ron", "Ron Carter", False],
-    [1713, "Carter", "Vince", "Vince Carter", False],
-    [1628976, "Carter Jr.", "Wendell", "Wendell Carter Jr.", True],
-    [203487, "Carter-Williams", "Michael", "Michael Carter-Williams", False],
-    [1630618, "Carton", "D.J.", "D.J. Carton", False],
-    [76362, "Cartwright", "Bill", "Bill Cartwright", False],
-    [76363, "Carty", "Jay", "Jay Carty", False],
-    [1627936, "Caruso", "Alex", "Alex Caruso", True],
-    [76364, "Cash", "Cornelius", "Cornelius Cash", False],
-    [208, "Cassell", "Sam", "Sam Cassell", False],
-    [201956, "Casspi", "Omri", "Omri Casspi", False],
-    [1642264, "Castle", "Stephon", "Stephon Castle", True],
-    [1630658, "Castleton", "Colin", "Colin Castleton", True],
-    [76365, "Catchings", "Harvey", "Harvey Catchings", False],
-    [767, "Catledge", "Terry", "Terry Catledge", False],
-    [76367, "Catlett", "Sid", "Sid Catlett", False],
-    [1509, "Cato", "Kelvin", "Kelvin Cato", False],
-    [76368, "Cattage", "Bobby", "Bobby Cattage", False],
-    [1626161, "Cauley-Stein", "Willie", "Willie Cauley-Stein", False],
-    [1628505, "Caupain", "Troy", "Troy Caupain", False],
-    [190, "Causwell", "Duane", "Duane Causwell", False],
-    [1628463, "Cavanaugh", "Tyler", "Tyler Cavanaugh", False],
-    [76370, "Cavenall", "Ron", "Ron Cavenall", False],
-    [1629958, "Caver", "Ahmad", "Ahmad Caver", False],
-    [1630608, "Cazalon", "Malcolm", "Malcolm Cazalon", False],
-    [76, "Ceballos", "Cedric", "Cedric Ceballos", False],
-    [1911, "Celestand", "John", "John Celestand", False],
-    [76373, "Cervi", "Al", "Al Cervi", False],
-    [2763, "Chalmers", "Lionel", "Lionel Chalmers", False],
-    [201596, "Chalmers", "Mario", "Mario Chalmers", False],
-    [76374, "Chamberlain", "Bill", "Bill Chamberlain", False],
-    [76375, "Chamberlain", "Wilt", "Wilt Chamberlain", False],
-    [76376, "Chambers", "Jerry", "Jerry Chambers", False],
-    [1472, "Chambers", "Tom", "Tom Chambers", False],
-    [1630577, "Champagnie", "Julian", "Julian Champagnie", True],
-    [1630551, "Champagnie", "Justin", "Justin Champagnie", True],
-    [76378, "Champion", "Mike", "Mike Champion", False],
-    [1631113, "Chandler", "Kennedy", "Kennedy Chandler", False],
-    [2199, "Chandler", "Tyson", "Tyson Chandler", False],
-    [201163, "Chandler", "Wilson", "Wilson Chandler", False],
-    [76379, "Chaney", "Don", "Don Chaney", False],
-    [76380, "Chaney", "John", "John Chaney", False],
-    [364, "Chapman", "Rex", "Rex Chapman", False],
-    [76382, "Chappell", "Len", "Len Chappell", False],
-    [76383, "Charles", "Ken", "Ken Charles", False],
-    [76384, "Charles", "Lorenzo", "Lorenzo Charles", False],
-    [1629147, "Chealey", "Joe", "Joe Chealey", False],
-    [384, "Cheaney", "Calbert", "Calbert Cheaney", False],
-    [1629597, "Cheatham", "Zylan", "Zylan Cheatham", False],
-    [76385, "Cheeks", "Maurice", "Maurice Cheeks", False],
-    [76386, "Chenier", "Phil", "Phil Chenier", False],
-    [203805, "Cherry", "Will", "Will Cherry", False],
-    [76387, "Chievous", "Derrick", "Derrick Chievous", False],
-    [432, "Chilcutt", "Pete", "Pete Chilcutt", False],
-    [2735, "Childress", "Josh", "Josh Childress", False],
-    [719, "Childress", "Randolph", "Randolph Childress", False],
-    [164, "Childs", "Chris", "Chris Childs", False],
-    [1629185, "Chiozza", "Chris", "Chris Chiozza", False],
-    [76391, "Chollet", "Leroy", "Leroy Chollet", False],
-    [1642279, "Chomche", "Ulrich", "Ulrich Chomche", False],
-    [76392, "Chones", "Jim", "Jim Chones", False],
-    [1627737, "Chriss", "Marquese", "Marquese Chriss", False],
-    [76393, "Christ", "Fred", "Fred Christ", False],
-    [76394, "Christensen", "Cal", "Cal Christensen", False],
-    [76395, "Christian", "Bob", "Bob Christian", False],
-    [1642353, "Christie", "Cam", "Cam Christie", True],
-    [57, "Christie", "Doug", "Doug Christie", False],
-    [1631108, "Christie", "Max", "Max Christie", True],
-    [202091, "Christmas", "Dionte", "Dionte Christmas", False],
-    [1626176, "Christmas", "Rakeem", "Rakeem Christmas", False],
-    [203902, "Christon", "Semaj", "Semaj Christon", False],
-    [1630528, "Christopher", "Josh", "Josh Christopher", False],
-    [203565, "Christopher", "Patrick", "Patrick Christopher", False],
-    [928, "Churchwell", "Robert", "Robert Churchwell", False],
-    [1630619, "Cisse", "Moussa", "Moussa Cisse", True],
-    [1631321, "Cissoko", "Sidy", "Sidy Cissoko", True],
-    [76397, "Clark", "Archie", "Archie Clark", False],
-    [76398, "Clark", "Carlos", "Carlos Clark", False],
-    [201947, "Clark", "Earl", "Earl Clark", False],
-    [1629109, "Clark", "Gary", "Gary Clark", False],
-    [203546, "Clark", "Ian", "Ian Clark", False],
-    [1641740, "Clark", "Jaylen", "Jaylen Clark", True],
-    [1721, "Clark", "Keon", "Keon Clark", False],
-    [1629634, "Clarke", "Brandon", "Brandon Clarke", True],
-    [1626262, "Clarke", "Coty", "Coty Clarke", False],
-    [203903, "Clarkson", "Jordan", "Jordan Clarkson", True],
-    [1628492, "Clavell", "Gian", "Gian Clavell", False],
-    [201964, "Claver", "Victor", "Victor Claver", False],
-    [1127, "Claxton", "Charles", "Charles Claxton", False],
-    [1629651, "Claxton", "Nic", "Nic Claxton", True],
-    [2049, "Claxton", "Speedy", "Speedy Claxton", False],
-    [1642383, "Clayton Jr.", "Walter", "Walter Clayton Jr.", True],
-    [76402, "Cleamons", "Jim", "Jim Cleamons", False],
-    [2043, "Cleaves", "Mateen", "Mateen Cleaves", False],
-    [76403, "Clemens", "John", "John Clemens", False],
-    [1629598, "Clemons", "Chris", "Chris Clemons", False],
-    [1628499, "Cleveland", "Antonius", "Antonius Cleveland", False],
-    [1642363, "Clifford", "Nique", "Nique Clifford", True],
-    [76404, "Clifton", "Nat", "Nat Clifton", False],
-    [1642270, "Clingan", "Donovan", "Donovan Clingan", True],
-    [76406, "Closs", "Bill", "Bill Closs", False],
-    [1569, "Closs", "Keith", "Keith Closs", False],
-    [1641730, "Clowney", "Noah", "Noah Clowney", True],
-    [76407, "Cloyd", "Paul", "Paul Cloyd", False],
-    [76408, "Cluggish", "Marion", "Marion Cluggish", False],
-    [76409, "Clyde", "Ben", "Ben Clyde", False],
-    [1629599, "Coffey", "Amir", "Amir Coffey", True],
-    [76410, "Coffey", "Richard", "Richard Coffey", False],
-    [76411, "Cofield", "Fred", "Fred Cofield", False],
-    [715, "Coker", "John", "John Coker", False],
-    [202708, "Cole", "Norris", "Norris Cole", False],
-    [76412, "Coleman", "Ben", "Ben Coleman", False],
-    [934, "Coleman", "Derrick", "Derrick Coleman", False],
-    [76413, "Coleman", "E.C.", "E.C. Coleman", False],
-    [76414, "Coleman", "Jack", "Jack Coleman", False],
-    [76415, "Coleman", "Norris", "Norris Coleman", False],
-    [902, "Coles", "Bimbo", "Bimbo Coles", False],
-    [1642268, "Collier", "Isaiah", "Isaiah Collier", True],
-    [2044, "Collier", "Jason", "Jason Collier", False],
-    [76416, "Collins", "Art", "Art Collins", False],
-    [76418, "Collins", "Don", "Don Collins", False],
-    [76421, "Collins", "Doug", "Doug Collins", False],
-    [1530, "Collins", "James", "James Collins", False],
-    [2260, "Collins", "Jarron", "Jarron Collins", False],
-    [2215, "Collins", "Jason", "Jason Collins", False],
-    [76419, "Collins", "Jimmy", "Jimmy Collins", False],
-    [1628381, "Collins", "John", "John Collins", True],
-    [200776, "Collins", "Mardy", "Mardy Collins", False],
-    [202395, "Collins", "Sherron", "Sherron Collins", False],
-    [1641879, "Collins", "Yuri", "Yuri Collins", False],
-    [1628380, "Collins", "Zach", "Zach Collins", True],
-    [1627858, "Collinsworth", "Kyle", "Kyle Collinsworth", False],
-    [201954, "Collison", "Darren", "Darren Collison", False],
-    [2555, "Collison", "Nick", "Nick Collison", False],
-    [76422, "Colone", "Joe", "Joe Colone", False],
-    [1629045, "Colson", "Bonzie", "Bonzie Colson", False],
-    [2173, "Colson", "Sean", "Sean Colson", False],
-    [306, "Colter", "Steve", "Steve Colter", False],
-    [1628435, "Comanche", "Chance", "Chance Comanche", False],
-    [76425, "Combs", "Leroy", "Leroy Combs", False],
-    [76426, "Comegys", "Dallas", "Dallas Comegys", False],
-    [76427, "Comley", "Larry", "Larry Comley", False],
-    [76428, "Conley", "Gene", "Gene Conley", False],
-    [201144, "Conley", "Mike", "Mike Conley", True],
-    [76429, "Conlin", "Ed", "Ed Conlin", False],
-    [55, "Conlon", "Marty", "Marty Conlon", False],
-    [1626192, "Connaughton", "Pat", "Pat Connaughton", True],
-    [76431, "Conner", "Lester", "Lester Conner", False],
-    [76432, "Connors", "Chuck", "Chuck Connors", False],
-    [101215, "Conroy", "Will", "Will Conroy", False],
-    [76433, "Cook", "Anthony", "Anthony Cook", False],
-    [76434, "Cook", "Bert", "Bert Cook", False],
-    [76438, "Cook", "Bobby", "Bobby Cook", False],
-    [2567, "Cook", "Brian", "Brian Cook", False],
-    [201161, "Cook", "Daequan", "Daequan Cook", False],
-    [76435, "Cook", "Darwin", "Darwin Cook", False],
-    [76436, "Cook", "Jeff", "Jeff Cook", False],
-    [76437, "Cook", "Norm", "Norm Cook", False],
-    [2241, "Cook", "Omar", "Omar Cook", False],
-    [1626188, "Cook", "Quinn", "Quinn Cook", False],
-    [1629076, "Cook", "Tyler", "Tyler Cook", False],
-    [1628429, "Cooke", "Charles", "Charles Cooke", False],
-    [76439, "Cooke", "David", "David Cooke", False],
-    [1631451, "Cooke", "Javonte", "Javonte Cooke", True],
-    [76440, "Cooke", "Joe", "Joe Cooke", False],
-    [1641645, "Cooks", "Xavier", "Xavier Cooks", False],
-    [204022, "Cooley", "Jack", "Jack Cooley", False],
-    [76442, "Cooper", "Chuck", "Chuck Cooper", False],
-    [1030, "Cooper", "Duane", "Duane Cooper", False],
-    [76443, "Cooper", "Joe", "Joe Cooper", False],
-    [76444, "Cooper", "Michael", "Michael Cooper", False],
-    [1630536, "Cooper", "Sharife", "Sharife Cooper", True],
-    [76441, "Cooper", "Wayne", "Wayne Cooper", False],
-    [76446, "Copa", "Tom", "Tom Copa", False],
-    [203142, "Copeland", "Chris", "Chris Copeland", False],
-    [76447, "Copeland", "Hollis", "Hollis Copeland", False],
-    [76448, "Copeland", "Lanard", "Lanard Copeland", False],
-    [895, "Corbin", "Tyrone", "Tyrone Corbin", False],
-    [76450, "Corchiani", "Chris", "Chris Corchiani", False],
-    [76451, "Corley", "Ken", "Ken Corley", False],
-    [76452, "Corley", "Ray", "Ray Corley", False],
-    [1627822, "Cornelie", "Petr", "Petr Cornelie", False],
-    [76453, "Corzine", "Dave", "Dave Corzine", False],
-    [76454, "Costello", "Larry", "Larry Costello", False],
-    [1627856, "Costello", "Matt", "Matt Costello", False],
-    [203955, "Cotton", "Bryce", "Bryce Cotton", False],
-    [76456, "Cotton", "Jack", "Jack Cotton", False],
-    [1526, "Cotton", "James", "James Cotton", False],
-    [76457, "Coughran", "John", "John Coughran", False],
-    [1641731, "Coulibaly", "Bilal", "Bilal Coulibaly", True],
-    [1641741, "Council IV", "Ricky", "Ricky Council IV", False],
-    [76458, "Counts", "Mel", "Mel Counts", False],
-    [76459, "Courtin", "Steve", "Steve Courtin", False],
-    [1432, "Courtney", "Joe", "Joe Courtney", False],
-    [202408, "Cousin", "Marcus", "Marcus Cousin", False],
-    [202326, "Cousins", "DeMarcus", "DeMarcus Cousins", False],
-    [600003, "Cousy", "Bob", "Bob Cousy", False],
-    [203496, "Covington", "Robert", "Robert Covington", False],
-    [1642907, "Coward", "Cedric", "Cedric Coward", True],
-    [76462, "Cowens", "Dave", "Dave Cowens", False],
-    [76463, "Cox", "John", "John Cox", False],
-    [76464, "Cox", "Johnny", "Johnny Cox", False],
-    [76465, "Cox", "Wesley", "Wesley Cox", False],
-    [203459, "Crabbe", "Allen", "Allen Crabbe", False],
-    [1628470, "Craig", "Torrey", "Torrey Craig", False],
-    [1544, "Crawford", "Chris", "Chris Crawford", False],
-    [76466, "Crawford", "Freddie", "Freddie Crawford", False],
-    [1642384, "Crawford", "Isaiah", "Isaiah Crawford", True],
-    [2037, "Crawford", "Jamal", "Jamal Crawford", False],
-    [201621, "Crawford", "Joe", "Joe Crawford", False],
-    [202348, "Crawford", "Jordan", "Jordan Crawford", False],
-    [1628249, "Creek", "Mitchell", "Mitchell Creek", False],
-    [76468, "Creighton", "Jim", "Jim Creighton", False],
-    [76469, "Crevier", "Ron", "Ron Crevier", False],
-    [76470, "Crisler", "Hal", "Hal Crisler", False],
-    [2343, "Crispin", "Joe", "Joe Crispin", False],
-    [76471, "Criss", "Charlie", "Charlie Criss", False],
-    [76472, "Crite", "Winston", "Winston Crite", False],
-    [201159, "Crittenton", "Javaris", "Javaris Crittenton", False],
-    [76473, "Crocker", "Dillard", "Dillard Crocker", False],
-    [76474, "Crompton", "Jeffrey", "Jeffrey Crompton", False],
-    [76475, "Crosby", "Terry", "Terry Crosby", False],
-    [1506, "Croshere", "Austin", "Austin Croshere", False],
-    [76476, "Cross", "Jeff", "Jeff Cross", False],
-    [76477, "Cross", "Pete", "Pete Cross", False],
-    [76478, "Cross", "Russell", "Russell Cross", False],
-    [76479, "Crossin", "Francis", "Francis Crossin", False],
-    [180, "Crotty", "John", "John Crotty", False],
-    [76481, "Crow", "Mark", "Mark Crow", False],
-    [76482, "Crowder", "Corey", "Corey Crowder", False],
-    [203109, "Crowder", "Jae", "Jae Crowder", False],
-    [1630622, "Crutcher", "Jalen", "Jalen Crutcher", False],
-    [1642385, "Cui", "Cui", "Cui Cui", False],
-    [1629633, "Culver", "Jarrett", "Jarrett Culver", False],
-    [1629600, "Cumberland", "Jarron", "Jarron Cumberland", False],
-    [76483, "Cummings", "Pat", "Pat Cummings", False],
-    [187, "Cummings", "Terry", "Terry Cummings", False],
-    [1907, "Cummings", "Vonteego", "Vonteego Cummings", False],
-    [76487, "Cunningham", "Billy", "Billy Cunningham", False],
-    [1630595, "Cunningham", "Cade", "Cade Cunningham", True],
-    [201967, "Cunningham", "Dante", "Dante Cunningham", False],
-    [76485, "Cunningham", "Dick", "Dick Cunningham", False],
-    [203099, "Cunningham", "Jared", "Jared Cunningham", False],
-    [1061, "Cunningham", "William", "William Cunningham", False],
-    [76488, "Curcic", "Radisav", "Radisav Curcic", False],
-    [76489, "Cure", "Armand", "Armand Cure", False],
-    [940, "Cureton", "Earl", "Earl Cureton", False],
-    [223, "Curley", "Bill", "Bill Curley", False],
-    [76492, "Curran", "Fran", "Fran Curran", False],
-    [209, "Curry", "Dell", "Dell Curry", False],
-    [2201, "Curry", "Eddy", "Eddy Curry", False],
-    [201191, "Curry", "JamesOn", "JamesOn Curry", False],
-    [688, "Curry", "Michael", "Michael Curry", False],
-    [203552, "Curry", "Seth", "Seth Curry", False],
-    [201939, "Curry", "Stephen", "Stephen Curry", True],
-    [687, "Cvetkovic", "Rastko", "Rastko Cvetkovic", False],
-    [76505, "D'Antoni", "Mike", "Mike D'Antoni", False],
-    [1642359, "Dadiet", "Pacôme", "Pacôme Dadiet", True],
-    [76496, "Dahler", "Ed", "Ed Dahler", False],
-    [76497, "Dailey", "Quintin", "Quintin Dailey", False],
-    [2223, "Dalembert", "Samuel", "Samuel Dalembert", False],
-    [76498, "Dallmar", "Howie", "Howie Dallmar", False],
-    [956, "Dampier", "Erick", "Erick Dampier", False],
-    [76499, "Dampier", "Lou", "Lou Dampier", False],
-    [76500, "Dandridge", "Bob", "Bob Dandridge", False],
-    [1498, "Daniels", "Antonio", "Antonio Daniels", False],
-    [1630700, "Daniels", "Dyson", "Dyson Daniels", True],
-    [2845, "Daniels", "Erik", "Erik Daniels", False],
-    [1380, "Daniels", "Lloyd", "Lloyd Daniels", False],
-    [2605, "Daniels", "Marquis", "Marquis Daniels", False],
-    [76502, "Daniels", "Mel", "Mel Daniels", False],
-    [203584, "Daniels", "Troy", "Troy Daniels", False],
-    [390, "Danilovic", "Sasha", "Sasha Danilovic", False],
-    [1642368, "Dante", "N'Faly", "N'Faly Dante", True],
-    [76504, "Dantley", "Adrian", "Adrian Dantley", False],
-    [76506, "Darcey", "Henry", "Henry Darcey", False],
-    [76507, "Darden", "Jimmy", "Jimmy Darden", False],
-    [212, "Dare", "Yinka", "Yinka Dare", False],
-    [76509, "Dark", "Jesse", "Jesse Dark", False],
-    [1630268, "Darling", "Nate", "Nate Darling", False],
-    [76511, "Darrow", "Jimmy", "Jimmy Darrow", False],
-    [203540, "Datome", "Gigi", "Gigi Datome", False],
-    [921, "Daugherty", "Brad", "Brad Daugherty", False],
-    [1600, "David", "Kornel", "Kornel David", False],
-    [201176, "Davidson", "Jermareo", "Jermareo Davidson", False],
-    [76514, "Davies", "Bob", "Bob Davies", False],
-    [203561, "Davies", "Brandon", "Brandon Davies", False],
-    [203076, "Davis", "Anthony", "Anthony Davis", True],
-    [213, "Davis", "Antonio", "Antonio Davis", False],
-    [76515, "Davis", "Aubrey", "Aubrey Davis", False],
-    [1884, "Davis", "Baron", "Baron Davis", False],
-    [989, "Davis", "Ben", "Ben Davis", False],
-    [76538, "Davis", "Bill", "Bill Davis", False],
-    [76533, "Davis", "Bob", "Bob Davis", False],
-    [76516, "Davis", "Brad", "Brad Davis", False],
-    [76517, "Davis", "Brian", "Brian Davis", False],
-    [76518, "Davis", "Charlie", "Charlie Davis", False],
-    [76519, "Davis", "Charlie", "Charlie Davis", False],
-    [905, "Davis", "Dale", "Dale Davis", False],
-    [1627738, "Davis", "Deyonta", "Deyonta Davis", False],
-    [76521, "Davis", "Double D", "Double D Davis", False],
-    [202334, "Davis", "Ed", "Ed Davis", False],
-    [76522, "Davis", "Edward", "Edward Davis", False],
-    [1023, "Davis", "Emanual", "Emanual Davis", False],
-    [201175, "Davis", "Glen", "Glen Davis", False],
-    [76523, "Davis", "Harry", "Harry Davis", False],
-    [93, "Davis", "Hubert", "Hubert Davis", False],
-    [76524, "Davis", "James", "James Davis", False],
-    [76525, "Davis", "Jim", "Jim Davis", False],
-    [76526, "Davis", "Johnny", "Johnny Davis", False],
-    [1631098, "Davis", "Johnny", "Johnny Davis", False],
-    [2668, "Davis", "Josh", "Josh Davis", False],
-    [707, "Davis", "Mark", "Mark Davis", False],
-    [76528, "Davis", "Mark", "Mark Davis", False],
-    [76529, "Davis", "Mel", "Mel Davis", False],
-    [76530, "Davis", "Michael", "Michael Davis", False],
-    [76531, "Davis", "Mike", "Mike Davis", False],
-    [76520, "Davis", "Monti", "Monti Davis", False],
-    [200781, "Davis", "Paul", "Paul Davis", False],
-    [76532, "Davis", "Ralph", "Ralph Davis", False],
-    [1729, "Davis", "Ricky", "Ricky Davis", False],
-    [76534, "Davis", "Ron", "Ron Davis", False],
-    [1629056, "Davis", "Terence", "Terence Davis", False],
-    [426, "Davis", "Terry", "Terry Davis", False],
-    [1629093, "Davis", "Tyler", "Tyler Davis", False],
-    [76536, "Davis", "Walt", "Walt Davis", False],
-    [1453, "Davis", "Walter", "Walter Davis", False],
-    [1631120, "Davison", "JD", "JD Davison", True],
-    [203958, "Dawkins", "Andre", "Andre Dawkins", False],
-    [76539, "Dawkins", "Darryl", "Darryl Dawkins", False],
-    [1008, "Dawkins", "Johnny", "Johnny Dawkins", False],
-    [76541, "Dawkins", "Paul", "Paul Dawkins", False],
-    [1626183, "Dawson", "Branden", "Branden Dawson", False],
-    [201286, "Dawson", "Eric", "Eric Dawson", False],
-    [76542, "Dawson", "Tony", "Tony Dawson", False],
-    [103, "Day", "Todd", "Todd Day", False],
-    [201948, "Daye", "Austin", "Austin Daye", False],
-    [76543, "Daye", "Darren", "Darren Daye", False],
-    [1630620, "Days", "Darius", "Darius Days", False],
-    [201986, "De Colo", "Nando", "Nando De Colo", False],
-    [76545, "DeBusschere", "Dave", "Dave DeBusschere", False],
-    [692, "DeClercq", "Andrew", "Andrew DeClercq", False],
-    [1629602, "DeLaurier", "Javin", "Javin DeLaurier", False],
-    [76551, "DeLong", "Nate", "Nate DeLong", False],
-    [201942, "DeRozan", "DeMar", "DeMar DeRozan", True],
-    [76562, "DeZonie", "Hank", "Hank DeZonie", False],
-    [76544, "Deane", "Greg", "Greg Deane", False],
-    [1630466, "Deck", "Gabriel", "Gabriel Deck", False],
-    [203473, "Dedmon", "Dewayne", "Dewayne Dedmon", False],
-    [76546, "Dees", "Archie", "Archie Dees", False],
-    [143, "Dehere", "Terry", "Terry Dehere", False],
-    [76548, "Dehnert", "Red", "Red Dehnert", False],
-    [1626214, "Dejean-Jones", "Bryce", "Bryce Dejean-Jones", False],
-    [1626155, "Dekker", "Sam", "Sam Dekker", False],
-    [219, "Del Negro", "Vinny", "Vinny Del Negro", False],
-    [1627098, "Delaney", "Malcolm", "Malcolm Delaney", False],
-    [183, "Dele", "Bison", "Bison Dele", False],
-    [2568, "Delfino", "Carlos", "Carlos Delfino", False],
-    [1629116, "Delgado", "Angel", "Angel Delgado", False],
-    [960, "Delk", "Tony", "Tony Delk", False],
-    [203521, "Dellavedova", "Matthew", "Matthew Dellavedova", False],
-    [76552, "Dembo", "Fennis", "Fennis Dembo", False],
-    [76553, "Demic", "Larry", "Larry Demic", False],
-    [725, "Demps", "Dell", "Dell Demps", False],
-    [76555, "Dempsey", "George", "George Dempsey", False],
-    [2736, "Deng", "Luol", "Luol Deng", False],
-    [76556, "Dennard", "Kenny", "Kenny Dennard", False],
-    [76557, "Denning", "Blaine", "Blaine Denning", False],
-    [1641926, "Dennis", "Dexter", "Dexter Dennis", False],
-    [1642484, "Dennis", "RayJ", "RayJ Dennis", True],
-    [202458, "Dentmon", "Justin", "Justin Dentmon", False],
-    [76558, "Denton", "Randy", "Randy Denton", False],
-    [76559, "Derline", "Rod", "Rod Derline", False],
-    [1629094, "Derrickson", "Marcus", "Marcus Derrickson", False],
-    [76560, "Deutsch", "Dave", "Dave Deutsch", False],
-    [76561, "Devlin", "Walter", "Walter Devlin", False],
-    [76568, "DiGregorio", "Ernie", "Ernie DiGregorio", False],
-    [1628978, "DiVincenzo", "Donte", "Donte DiVincenzo", True],
-    [1631217, "Diabaté", "Moussa", "Moussa Diabaté", True],
-    [1629603, "Diakite", "Mamadi", "Mamadi Diakite", False],
-    [1760, "Dial", "Derrick", "Derrick Dial", False],
-    [1627767, "Diallo", "Cheick", "Cheick Diallo", False],
-    [1628977, "Diallo", "Hamidou", "Hamidou Diallo", False],
-    [2564, "Diaw", "Boris", "Boris Diaw", False],
-    [1642885, "Diawara", "Mohamed", "Mohamed Diawara", True],
-    [200821, "Diawara", "Yakhouba", "Yakhouba Diawara", False],
-    [200799, "Diaz", "Guillermo", "Guillermo Diaz", False],
-    [1641711, "Dick", "Gradey", "Gradey Dick", True],
-    [2424, "Dickau", "Dan", "Dan Dickau", False],
-    [2079, "Dickens", "Kaniel", "Kaniel Dickens", False],
-    [76563, "Dickerson", "Henry", "Henry Dickerson", False],
-    [1722, "Dickerson", "Michael", "Michael Dickerson", False],
-    [76564, "Dickey", "Derrek", "Derrek Dickey", False],
-    [76565, "Dickey", "Dick", "Dick Dickey", False],
-    [1630621, "Dickinson", "Hunter", "Hunter Dickinson", True],
-    [101143, "Diener", "Travis", "Travis Diener", False],
-    [203476, "Dieng", "Gorgui", "Gorgui Dieng", False],
-    [1631172, "Dieng", "Ousmane", "Ousmane Dieng", True],
-    [76566, "Dierking", "Connie", "Connie Dierking", False],
-    [76567, "Dietrick", "Coby", "Coby Dietrick", False],
-    [76569, "Dillard", "Mickey", "Mickey Dillard", False],
-    [76570, "Dille", "Bob", "Bob Dille", False],
-    [1642265, "Dillingham", "Rob", "Rob Dillingham", True],
-    [76571, "Dillon", "John", "John Dillon", False],
-    [76574, "Dinkins", "Byron", "Byron Dinkins", False],
-    [76575, "Dinkins", "Jackie", "Jackie Dinkins", False],
-    [76576, "Dinwiddie", "Bill", "Bill Dinwiddie", False],
-    [203915, "Dinwiddie", "Spencer", "Spencer Dinwiddie", False],
-    [101113, "Diogu", "Ike", "Ike Diogu", False],
-    [2205, "Diop", "DeSagana", "DeSagana Diop", False],
-    [76577, "Dischinger", "Terry", "Terry Dischinger", False],
-    [76578, "Diute", "Fred", "Fred Diute", False],
-    [124, "Divac", "Vlade", "Vlade Divac", False],
-    [2413, "Dixon", "Juan", "Juan Dixon", False],
-    [1059, "Djordjevic", "Aleksandar", "Aleksandar Djordjevic", False],
-    [76580, "Dodd", "Earl", "Earl Dodd", False],
-    [1720, "Doleac", "Michael", "Michael Doleac", False],
-    [76581, "Dolhon", "Joe", "Joe Dolhon", False],
-    [76582, "Doll", "Bob", "Bob Doll", False],
-    [76583, "Donaldson", "James", "James Donaldson", False],
-    [76584, "Donham", "Bob", "Bob Donham", False],
-    [76586, "Donovan", "Billy", "Billy Donovan", False],
-    [76585, "Donovan", "Harry", "Harry Donovan", False],
-    [1629029, "Dončić", "Luka", "Luka Dončić", True],
-    [2039, "Dooling", "Keyon", "Keyon Dooling", False],
-    [76587, "Dorsey", "Jacky", "Jacky Dorsey", False],
-    [201595, "Dorsey", "Joey", "Joey Dorsey", False],
-    [1628416, "Dorsey", "Tyler", "Tyler Dorsey", False],
-    [1629652, "Dort", "Luguentz", "Luguentz Dort", True],
-    [1630245, "Dosunmu", "Ayo", "Ayo Dosunmu", True],
-    [1628422, "Dotson", "Damyean", "Damyean Dotson", False],
-    [1629653, "Dotson", "Devon", "Devon Dotson", False],
-    [200763, "Douby", "Quincy", "Quincy Douby", False],
-    [76588, "Douglas", "Bruce", "Bruce Douglas", False],
-    [76589, "Douglas", "John", "John Douglas", False],
-    [76590, "Douglas", "Leon", "Leon Douglas", False],
-    [428, "Douglas", "Sherman", "Sherman Douglas", False],
-    [201962, "Douglas", "Toney", "Toney Douglas", False],
-    [201604, "Douglas-Roberts", "Chris", "Chris Douglas-Roberts", False],
-    [1629635, "Doumbouya", "Sekou", "Sekou Doumbouya", False],
-    [76592, "Dove", "Lloyd", "Lloyd Dove", False],
-    [202220, "Dowdell", "Zabian", "Zabian Dowdell", False],
-    [76593, "Downey", "Bill", "Bill Downey", False],
-    [76594, "Downing", "Steve", "Steve Downing", False],
-    [1630288, "Dowtin Jr.", "Jeff", "Jeff Dowtin Jr.", False],
-    [76595, "Doyle", "Danny", "Danny Doyle", False],
-    [1628495, "Doyle", "Milton", "Milton Doyle", False],
-    [1628408, "Dozier", "PJ", "PJ Dozier", False],
-    [76596, "Dozier", "Terry", "Terry Dozier", False],
-    [201609, "Dragic", "Goran", "Goran Dragic", False],
-    [204054, "Dragic", "Zoran", "Zoran Dragic", False],
-    [1068, "Dreiling", "Greg", "Greg Dreiling", False],
-    [1630929, "Drell", "Henri", "Henri Drell", False],
-    [1724, "Drew", "Bryce", "Bryce Drew", False],
-    [76598, "Drew", "John", "John Drew", False],
-    [76599, "Drew", "Larry", "Larry Drew", False],
-    [203580, "Drew II", "Larry", "Larry Drew II", False],
-    [17, "Drexler", "Clyde", "Clyde Drexler", False],
-    [1041, "Driggers", "Nate", "Nate Driggers", False],
-    [76603, "Driscoll", "Terry", "Terry Driscoll", False],
-    [1542, "Drobnjak", "Predrag", "Predrag Drobnjak", False],
-    [76604, "Drollinger", "Ralph", "Ralph Drollinger", False],
-    [203083, "Drummond", "Andre", "Andre Drummond", True],
-    [76623, "DuVal", "Dennis", "Dennis DuVal", False],
-    [1630537, "Duarte", "Chris", "Chris Duarte", False],
-    [1642505, "Ducas", "Alex", "Alex Ducas", False],
-    [76605, "Duckett", "Dick", "Dick Duckett", False],
-    [404, "Duckworth", "Kevin", "Kevin Duckworth", False],
-    [76607, "Dudley", "Charles", "Charles Dudley", False],
-    [201, "Dudley", "Chris", "Chris Dudley", False],
-    [201162, "Dudley", "Jared", "Jared Dudley", False],
-    [76608, "Duerod", "Terry", "Terry Duerod", False],
-    [76609, "Duffy", "Bob", "Bob Duffy", False],
-    [76610, "Duffy", "Bob", "Bob Duffy", False],
-    [2768, "Duhon", "Chris", "Chris Duhon", False],
-    [1626251, "Dukan", "Duje", "Duje Dukan", False],
-    [1630561, "Duke Jr.", "David", "David Duke Jr.", False],
-    [76611, "Dukes", "Walter", "Walter Dukes", False],
-    [247, "Dumars", "Joe", "Joe Dumars", False],
-    [30, "Dumas", "Richard", "Richard Dumas", False],
-    [434, "Dumas", "Tony", "Tony Dumas", False],
-    [76615, "Duncan", "Andy", "Andy Duncan", False],
-    [1495, "Duncan", "Tim", "Tim Duncan", False],
-    [2399, "Dunleavy", "Mike", "Mike Dunleavy", False],
-    [76616, "Dunleavy", "Mike", "Mike Dunleavy", False],
-    [1627739, "Dunn", "Kris", "Kris Dunn", True],
-    [76617, "Dunn", "Pat", "Pat Dunn", False],
-    [1642346, "Dunn", "Ryan", "Ryan Dunn", True],
-    [76618, "Dunn", "T.R.", "T.R. Dunn", False],
-    [2648, "Dupree", "Ronald", "Ronald Dupree", False],
-    [201142, "Durant", "Kevin", "Kevin Durant", True],
-    [1631105, "Duren", "Jalen", "Jalen Duren", True],
-    [76619, "Duren", "John", "John Duren", False],
-    [1090, "Durham", "Pat", "Pat Durham", False],
-    [76621, "Durrant", "Devin", "Devin Durrant", False],
-    [76622, "Durrett", "Ken", "Ken Durrett", False],
-    [1628979, "Duval", "Trevon", "Trevon Duval", False],
-    [76624, "Dwan", "Jack", "Jack Dwan", False],
-    [76625, "Dykema", "Craig", "Craig Dykema", False],
-    [76626, "Dyker", "Gene", "Gene Dyker", False],
-    [202406, "Dyson", "Jerome", "Jerome Dyson", False],
-    [1642856, "Dëmin", "Egor", "Egor Dëmin", True],
-    [289, "Eackles", "Ledell", "Ledell Eackles", False],
-    [76628, "Eakins", "Jim", "Jim Eakins", False],
-    [768, "Earl", "Acie", "Acie Earl", False],
-    [76630, "Earle", "Ed", "Ed Earle", False],
-    [203921, "Early", "Cleanthony", "Cleanthony Early", False],
-    [1631106, "Eason", "Tari", "Tari Eason", True],
-    [76631, "Eaton", "Mark", "Mark Eaton", False],
-    [76632, "Eaves", "Jerry", "Jerry Eaves", False],
-    [202365, "Ebanks", "Devin", "Devin Ebanks", False],
-    [76633, "Ebben", "Bill", "Bill Ebben", False],
-    [76634, "Eberhard", "Al", "Al Eberhard", False],
-    [2569, "Ebi", "Ndudi", "Ndudi Ebi", False],
-    [1630693, "Echenique", "Jaime", "Jaime Echenique", False],
-    [204067, "Eddie", "Jarell", "Jarell Eddie", False],
-    [76635, "Eddie", "Patrick", "Patrick Eddie", False],
-    [76636, "Eddleman", "Thomas", "Thomas Eddleman", False],
-    [76637, "Edelin", "Kent", "Kent Edelin", False],
-    [1641744, "Edey", "Zach", "Zach Edey", True],
-    [1642845, "Edgecombe", "VJ", "VJ Edgecombe", True],
-    [76638, "Edmonson", "Keith", "Keith Edmonson", False],
-    [721, "Edney", "Tyus", "Tyus Edney", False],
-    [1630162, "Edwards", "Anthony", "Anthony Edwards", True],
-    [76646, "Edwards", "Bill", "Bill Edwards", False],
-    [898, "Edwards", "Blue", "Blue Edwards", False],
-    [1629035, "Edwards", "Carsen", "Carsen Edwards", False],
-    [2451, "Edwards", "Corsley", "Corsley Edwards", False],
-    [346, "Edwards", "Doug", "Doug Edwards", False],
-    [76641, "Edwards", "Franklin", "Franklin Edwards", False],
-    [229, "Edwards", "James", "James Edwards", False],
-    [76643, "Edwards", "Jay", "Jay Edwards", False],
-    [1642399, "Edwards", "Jesse", "Jesse Edwards", False],
-    [2823, "Edwards", "John", "John Edwards", False],
-    [1642348, "Edwards", "Justin", "Justin Edwards", True],
-    [1630556, "Edwards", "Kessler", "Kessler Edwards", False],
-    [236, "Edwards", "Kevin", "Kevin Edwards", False],
-    [1630306, "Edwards", "Rob", "Rob Edwards", False],
-    [202197, "Edwards", "Shane", "Shane Edwards", False],
-    [1629053, "Edwards", "Vincent", "Vincent Edwards", False],
-    [76647, "Egan", "Johnny", "Johnny Egan", False],
-    [76648, "Eggleston", "Lonnie", "Lonnie Eggleston", False],
-    [76649, "Ehlers", "Eddie", "Eddie Ehlers", False],
-    [378, "Ehlo", "Craig", "Craig Ehlo", False],
-    [76651, "Eichhorst", "Dick", "Dick Eichhorst", False],
-    [458, "Eisley", "Howard", "Howard Eisley", False],
-    [1918, "Ekezie", "Obinna", "Obinna Ekezie", False],
-    [2064, "El-Amin", "Khalid", "Khalid El-Amin", False],
-    [76653, "Eliason", "Don", "Don Eliason", False],
-    [53, "Elie", "Mario", "Mario Elie", False],
-    [1629604, "Elleby", "CJ", "CJ Elleby", False],
-    [76655, "Ellefson", "Ray", "Ray Ellefson", False],
-    [1627740, "Ellenson", "Henry", "Henry Ellenson", False],
-    [201961, "Ellington", "Wayne", "Wayne Ellington", False],
-    [76656, "Elliott", "Bob", "Bob Elliott", False],
-    [251, "Elliott", "Sean", "Sean Elliott", False],
-    [76658, "Ellis", "Alexander", "Alexander Ellis", False],
-    [76664, "Ellis", "Bo", "Bo Ellis", False],
-    [107, "Ellis", "Dale", "Dale Ellis", False],
-    [1677, "Ellis", "Harold", "Harold Ellis", False],
-    [76661, "Ellis", "Joe", "Joe Ellis", False],
-    [1631165, "Ellis", "Keon", "Keon Ellis", True],
-    [111, "Ellis", "LaPhonso", "LaPhonso Ellis", False],
-    [1034, "Ellis", "LeRon", "LeRon Ellis", False],
-    [76663, "Ellis", "Leroy", "Leroy Ellis", False],
-    [101145, "Ellis", "Monta", "Monta Ellis", False],
-    [442, "Ellison", "Pervis", "Pervis Ellison", False],
-    [600010, "Elmore", "Len", "Len Elmore", False],
-    [1922, "Elson", "Francisco", "Francisco Elson", False],
-    [76667, "Elston", "Darrell", "Darrell Elston", False],
-    [2408, "Ely", "Melvin", "Melvin Ely", False],
-    [203954, "Embiid", "Joel", "Joel Embiid", True],
-    [76668, "Embry", "Wayne", "Wayne Embry", False],
-    [2765, "Emmett", "Andre", "Andre Emmett", False],
-    [76669, "Endress", "Ned", "Ned Endress", False],
-    [76670, "Engler", "Chris", "Chris Engler", False],
-    [76671, "Englestad", "Wayne", "Wayne Englestad", False],
-    [76672, "English", "A.J.", "A.J. English", False],
-    [76673, "English", "Alex", "Alex English", False],
-    [76674, "English", "Claude", "Claude English", False],
-    [76676, "English", "Jojo", "Jojo English", False],
-    [203119, "English", "Kim", "Kim English", False],
-    [76675, "English", "Scott", "Scott English", False],
-    [76677, "Englund", "Gene", "Gene Englund", False],
-    [203898, "Ennis", "Tyler", "Tyler Ennis", False],
-    [203516, "Ennis III", "James", "James Ennis III", False],
-    [76678, "Epps", "Ray", "Ray Epps", False],
-    [201623, "Erden", "Semih", "Semih Erden", False],
-    [76679, "Erias", "Bo", "Bo Erias", False],
-    [76680, "Erickson", "Keith", "Keith Erickson", False],
-    [76681, "Erving", "Julius", "Julius Erving", False],
-    [1915, "Eschmeyer", "Evan", "Evan Eschmeyer", False],
-    [76682, "Eskridge", "Jack", "Jack Eskridge", False],
-    [76683, "Esposito", "Vincenzo", "Vincenzo Esposito", False],
-    [1642855, "Essengue", "Noa", "Noa Essengue", True],
-    [1630623, "Etienne", "Tyson", "Tyson Etienne", True],
-    [1629234, "Eubanks", "Drew", "Drew Eubanks", True],
-    [76687, "Evans", "Bob", "Bob Evans", False],
-    [967, "Evans", "Brian", "Brian Evans", False],
-    [76685, "Evans", "Earl", "Earl Evans", False],
-    [1628980, "Evans", "Jacob", "Jacob Evans", False],
-    [1628393, "Evans", "Jawun", "Jawun Evans", False],
-    [202379, "Evans", "Jeremy", "Jeremy Evans", False],
-    [2230, "Evans", "Maurice", "Maurice Evans", False],
-    [76686, "Evans", "Mike", "Mike Evans", False],
-    [2501, "Evans", "Reggie", "Reggie Evans", False],
-    [201936, "Evans", "Tyreke", "Tyreke Evans", False],
-    [1641787, "Evbuomwan", "Tosan", "Tosan Evbuomwan", True],
-    [101137, "Ewing", "Daniel", "Daniel Ewing", False],
-    [121, "Ewing", "Patrick", "Patrick Ewing", False],
-    [201607, "Ewing", "Patrick", "Patrick Ewing", False],
-    [203957, "Exum", "Danté", "Danté Exum", True],
-    [201963, "Eyenga", "Christian", "Christian Eyenga", False],
-    [203105, "Ezeli", "Festus", "Festus Ezeli", False],
-    [76689, "Ezersky", "Johnny", "Johnny Ezersky", False],
-    [76690, "Fabel", "Joe", "Joe Fabel", False],
-    [76691, "Fairchild", "John", "John Fairchild", False],
-    [1629605, "Fall", "Tacko", "Tacko Fall", False],
-    [76692, "Farbman", "Phil", "Phil Farbman", False],
-    [202702, "Faried", "Kenneth", "Kenneth Faried", False],
-    [76693, "Farley", "Dick", "Dick Farley", False],
-    [200770, "Farmar", "Jordan", "Jordan Farmar", False],
-    [2824, "Farmer", "Desmon", "Desmon Farmer", False],
-    [76695, "Farmer", "Jim", "Jim Farmer", False],
-    [76694, "Farmer", "Mike", "Mike Farmer", False],
-    [1108, "Farmer", "Tony", "Tony Farmer", False],
-    [76696, "Faught", "Bob", "Bob Faught", False],
-    [203543, "Faverani", "Vitor", "Vitor Faverani", False],
-    [202324, "Favors", "Derrick", "Derrick Favors", False],
-    [201174, "Fazekas", "Nick", "Nick Fazekas", False],
-    [1642847, "Fears", "Jeremiah", "Jeremiah Fears", True],
-    [76697, "Fedor", "Dave", "Dave Fedor", False],
-    [76698, "Feerick", "Bob", "Bob Feerick", False],
-    [76699, "Feher", "Butch", "Butch Feher", False],
-    [994, "Feick", "Jamie", "Jamie Feick", False],
-    [76701, "Feiereisel", "Ron", "Ron Feiereisel", False],
-    [76702, "Feigenbaum", "George", "George Feigenbaum", False],
-    [76703, "Feitl", "Dave", "Dave Feitl", False],
-    [1627770, "Felder", "Kay", "Kay Felder", False],
-    [1626245, "Felicio", "Cristiano", "Cristiano Felicio", False],
-    [203467, "Felix", "Carrick", "Carrick Felix", False],
-    [101230, "Felix", "Noel", "Noel Felix", False],
-    [76704, "Felix", "Ray", "Ray Felix", False],
-    [101109, "Felton", "Raymond", "Raymond Felton", False],
-    [76705, "Fendley", "Jake", "Jake Fendley", False],
-    [76706, "Fenley", "Bill", "Bill Fenley", False],
-    [2724, "Ferguson", "Desmond", "Desmond Ferguson", False],
-    [1628390, "Ferguson", "Terrance", "Terrance Ferguson", False],
-    [201164, "Fernandez", "Rudy", "Rudy Fernandez", False],
-    [1628981, "Fernando", "Bruno", "Bruno Fernando", False],
-    [76707, "Fernsten", "Eric", "Eric Fernsten", False],
-    [76708, "Ferrari", "Al", "Al Ferrari", False],
-    [76709, "Ferreira", "Rolando", "Rolando Ferreira", False],
-    [273, "Ferrell", "Duane", "Duane Ferrell", False],
-    [1627812, "Ferrell", "Yogi", "Yogi Ferrell", False],
-    [76711, "Ferrin", "Arnie", "Arnie Ferrin", False],
-    [76712, "Ferry", "Bob", "Bob Ferry", False],
-    [198, "Ferry", "Danny", "Danny Ferry", False],
-    [201178, "Fesenko", "Kyrylo", "Kyrylo Fesenko", False],
-    [76713, "Fields", "Kenny", "Kenny Fields", False],
-    [202361, "Fields", "Landry", "Landry Fields", False],
-    [76714, "Filipek", "Ron", "Ron Filipek", False],
-    [1642271, "Filipowski", "Kyle", "Kyle Filipowski", True],
-    [76715, "Fillmore", "Greg", "Greg Fillmore", False],
-    [76716, "Finkel", "Hank", "Hank Finkel", False],
-    [714, "Finley", "Michael", "Michael Finley", False],
-    [76717, "Finn", "Danny", "Danny Finn", False],
-    [1627827, "Finney-Smith", "Dorian", "Dorian Finney-Smith", True],
-    [900, "Fish", "Matt", "Matt Fish", False],
-    [965, "Fisher", "Derek", "Derek Fisher", False],
-    [2809, "Fitch", "Gerald", "Gerald Fitch", False],
-    [1630238, "Fitts", "Malik", "Malik Fitts", False],
-    [76720, "Fitzgerald", "Bob", "Bob Fitzgerald", False],
-    [76719, "Fitzgerald", "Dick", "Dick Fitzgerald", False],
-    [2033, "Fizer", "Marcus", "Marcus Fizer", False],
-    [1642843, "Flagg", "Cooper", "Cooper Flagg", True],
-    [1641745, "Flagler", "Adam", "Adam Flagler", False],
-    [76721, "Fleishman", "Jerry", "Jerry Fleishman", False],
-    [76722, "Fleming", "Al", "Al Fleming", False],
-    [76723, "Fleming", "Ed", "Ed Fleming", False],
-    [1642853, "Fleming", "Rasheer", "Rasheer Fleming", True],
-    [313, "Fleming", "Vern", "Vern Fleming", False],
-    [2784, "Flores", "Luis", "Luis Flores", False],
-    [76725, "Flowers", "Bruce", "Bruce Flowers", False],
-    [1642280, "Flowers", "Trentyn", "Trentyn Flowers", True],
-    [76726, "Floyd", "Sleepy", "Sleepy Floyd", False],
-    [201938, "Flynn", "Jonny", "Jonny Flynn", False],
-    [1630201, "Flynn", "Malachi", "Malachi Flynn", False],
-    [76727, "Flynn", "Mike", "Mike Flynn", False],
-    [76728, "Fogle", "Larry", "Larry Fogle", False],
-    [76729, "Foley", "Jack", "Jack Foley", False],
-    [1829, "Fontaine", "Ike", "Ike Fontaine", False],
-    [76731, "Fontaine", "Levi", "Levi Fontaine", False],
-    [1631323, "Fontecchio", "Simone", "Simone Fontecchio", True],
-    [202880, "Foote", "Jeff", "Jeff Foote", False],
-    [1627854, "Forbes", "Bryn", "Bryn Forbes", False],
-    [201814, "Forbes", "Gary", "Gary Forbes", False],
-    [1630758, "Ford", "Aleem", "Aleem Ford", False],
-    [76732, "Ford", "Alphonso", "Alphonso Ford", False],
-    [2228, "Ford", "Alton", "Alton Ford", False],
-    [76733, "Ford", "Chris", "Chris Ford", False],
-    [76734, "Ford", "Don", "Don Ford", False],
-    [76735, "Ford", "Jake", "Jake Ford", False],
-    [1630259, "Ford", "Jordan", "Jordan Ford", False],
-    [76736, "Ford", "Phil", "Phil Ford", False],
-    [101213, "Ford", "Sharrod", "Sharrod Ford", False],
-    [726, "Ford", "Sherell", "Sherell Ford", False],
-    [2551, "Ford", "T.J.", "T.J. Ford", False],
-    [76738, "Forman", "Donnie", "Donnie Forman", False],
-    [76739, "Forrest", "Bayard", "Bayard Forrest", False],
-    [1630235, "Forrest", "Trent", "Trent Forrest", False],
-    [2218, "Forte", "Joseph", "Joseph Forte", False],
-    [202622, "Fortson", "Courtney", "Courtney Fortson", False],
-    [1504, "Fortson", "Danny", "Danny Fortson", False],
-    [76740, "Foster", "Fred", "Fred Foster", False],
-    [323, "Foster", "Greg", "Greg Foster", False],
-    [1902, "Foster", "Jeff", "Jeff Foster", False],
-    [76742, "Foster", "Rod", "Rod Foster", False],
-    [1630701, "Foster Jr.", "Michael", "Michael Foster Jr.", False],
-    [2238, "Fotsis", "Antonis", "Antonis Fotsis", False],
-    [203095, "Fournier", "Evan", "Evan Fournier", False],
-    [76744, "Foust", "Larry", "Larry Foust", False],
-    [76745, "Fowler", "Jerry", "Jerry Fowler", False],
-    [1762, "Fowlkes", "Tremaine", "Tremaine Fowlkes", False],
-    [1628368, "Fox", "De'Aaron", "De'Aaron Fox", True],
-    [76746, "Fox", "Harold", "Harold Fox", False],
-    [76747, "Fox", "Jim", "Jim Fox", False],
-    [296, "Fox", "Rick", "Rick Fox", False],
-    [200751, "Foye", "Randy", "Randy Foye", False],
-    [1502, "Foyle", "Adonal", "Adonal Foyle", False],
-    [2499, "Frahm", "Richie", "Richie Frahm", False],
-    [1883, "Francis", "Steve", "Steve Francis", False],
-    [76748, "Frank", "Tellis", "Tellis Frank", False],
-    [76749, "Frankel", "Nat", "Nat Frankel", False],
-    [203479, "Franklin", "Jamaal", "Jamaal Franklin", False],
-    [1629606, "Franks", "Robert", "Robert Franks", False],
-    [204025, "Frazier", "Tim", "Tim Frazier", False],
-    [76750, "Frazier", "Walt", "Walt Frazier", False],
-    [76751, "Frazier", "Will", "Will Frazier", False],
-    [1626187, "Frazier II", "Michael", "Michael Frazier II", False],
-    [1628982, "Frazier Jr.", "Melvin", "Melvin Frazier Jr.", False],
-    [76752, "Frederick", "Anthony", "Anthony Frederick", False],
-    [202690, "Fredette", "Jimmer", "Jimmer Fredette", False],
-    [76753, "Free", "World", "World Free", False],
-    [202683, "Freedom", "Enes", "Enes Freedom", False],
-    [200777, "Freeland", "Joel", "Joel Freeland", False],
-    [76754, "Freeman", "Donnie", "Donnie Freeman", False],
-    [1642402, "Freeman", "Enrique", "Enrique Freeman", True],
-    [76755, "Freeman", "Gary", "Gary Freeman", False],
-    [76756, "Freeman", "Rod", "Rod Freeman", False],
-    [1631241, "Freeman-Liberty", "Javon", "Javon Freeman-Liberty", False],
-    [2782, "Freije", "Matt", "Matt Freije", False],
-    [76757, "Frey", "Frido", "Frido Frey", False],
-    [76758, "Friend", "Larry", "Larry Friend", False],
-    [76759, "Frink", "Pat", "Pat Frink", False],
-    [76760, "Fritsche", "Jim", "Jim Fritsche", False],
-    [101112, "Frye", "Channing", "Channing Frye", False],
-    [76761, "Fryer", "Bernie", "Bernie Fryer", False],
-    [76762, "Fucarino", "Frank", "Frank Fucarino", False],
-    [1641788, "Fudge", "Alex", "Alex Fudge", False],
-    [76763, "Fuetsch", "Herm", "Herm Fuetsch", False],
-    [76764, "Fulks", "Joe", "Joe Fulks", False],
-    [2673, "Fuller", "Hiram", "Hiram Fuller", False],
-    [957, "Fuller", "Todd", "Todd Fuller", False],
-    [76765, "Fuller", "Tony", "Tony Fuller", False],
-    [1628365, "Fultz", "Markelle", "Markelle Fultz", False],
-    [1444, "Funderburke", "Lawrence", "Lawrence Funderburke", False],
-    [1641847, "Funk", "Andrew", "Andrew Funk", False],
-    [76767, "Furlow", "Terry", "Terry Furlow", False],
-    [1642277, "Furphy", "Johnny", "Johnny Furphy", True],
-    [76768, "Gabor", "Billy", "Billy Gabor", False],
-    [1629117, "Gabriel", "Wenyen", "Wenyen Gabriel", False],
-    [2429, "Gadzuric", "Dan", "Dan Gadzuric", False],
-    [202070, "Gaffney", "Tony", "Tony Gaffney", False],
-    [1629655, "Gafford", "Daniel", "Daniel Gafford", True],
-    [101184, "Gai", "Deng", "Deng Gai", False],
-    [76769, "Gainer", "Elmer R.", "Elmer R. Gainer", False],
-    [76770, "Gaines", "Corey", "Corey Gaines", False],
-    [2558, "Gaines", "Reece", "Reece Gaines", False],
-    [202178, "Gaines", "Sundiata", "Sundiata Gaines", False],
-    [76771, "Gale", "Mike", "Mike Gale", False],
-    [76772, "Gallagher", "Chad", "Chad Gallagher", False],
-    [76773, "Gallatin", "Harry", "Harry Gallatin", False],
-    [201568, "Gallinari", "Danilo", "Danilo Gallinari", False],
-    [1641945, "Galloway", "Jaylin", "Jaylin Galloway", False],
-    [204038, "Galloway", "Langston", "Langston Galloway", False],
-    [76774, "Gambee", "Dave", "Dave Gambee", False],
-    [333, "Gamble", "Kevin", "Kevin Gamble", False],
-    [76776, "Gantt", "Bob", "Bob Gantt", False],
-    [200816, "Garbajosa", "Jorge", "Jorge Garbajosa", False],
-    [2092, "Garces", "Ruben", "Ruben Garces", False],
-    [2682, "Garcia", "Alex", "Alex Garcia", False],
-    [101128, "Garcia", "Francisco", "Francisco Garcia", False],
-    [76778, "Gardner", "Earl", "Earl Gardner", False],
-    [1642066, "Gardner", "Myron", "Myron Gardner", True],
-    [201242, "Gardner", "Thomas", "Thomas Gardner", False],
-    [76779, "Gardner", "Vern", "Vern Gardner", False],
-    [76780, "Garfinkel", "Jack", "Jack Garfinkel", False],
-    [1627868, "Garino", "Patricio", "Patricio Garino", False],
-    [1629636, "Garland", "Darius", "Darius Garland", True],
-    [76781, "Garland", "Gary", "Gary Garland", False],
-    [76782, "Garland", "Winston", "Winston Garland", False],
-    [76783, "Garmaker", "Dick", "Dick Garmaker", False],
-    [1612, "Garner", "Chris", "Chris Garner", False],
-    [76785, "Garnett", "Bill", "Bill Garnett", False],
-    [708, "Garnett", "Kevin", "Kevin Garnett", False],
-    [1831, "Garnett", "Marlon", "Marlon Garnett", False],
-    [1628656, "Garrett", "Billy", "Billy Garrett", False],
-    [76786, "Garrett", "Calvin", "Calvin Garrett", False],
-    [1051, "Garrett", "Dean", "Dean Garrett", False],
-    [203197, "Garrett", "Diante", "Diante Garrett", False],
-    [76788, "Garrett", "Eldo", "Eldo Garrett", False],
-    [1630585, "Garrett", "Marcus", "Marcus Garrett", False],
-    [76789, "Garrett", "Rowland", "Rowland Garrett", False],
-    [76790, "Garrick", "Tom", "Tom Garrick", False],
-    [76791, "Garris", "John", "John Garris", False],
-    [1619, "Garris", "Kiwane", "Kiwane Garris", False],
-    [1727, "Garrity", "Pat", "Pat Garrity", False],
-    [1630586, "Garuba", "Usman", "Usman Garuba", False],
-    [76793, "Garvin", "Jim", "Jim Garvin", False],
-    [1630568, "Garza", "Luka", "Luka Garza", True],
-    [201188, "Gasol", "Marc", "Marc Gasol", False],
-    [2200, "Gasol", "Pau", "Pau Gasol", False],
-    [76794, "Gates", "Frank", "Frank Gates", False],
-    [1629232, "Gates", "Kaiser", "Kaiser Gates", False],
-    [423, "Gatling", "Chris", "Chris Gatling", False],
-    [930, "Gattison", "Kenny", "Kenny Gattison", False],
-    [200752, "Gay", "Rudy", "Rudy Gay", False],
-    [76797, "Gayda", "Ed", "Ed Gayda", False],
-    [1845, "Gaze", "Andrew", "Andrew Gaze", False],
-    [1627771, "Gbinije", "Michael", "Michael Gbinije", False],
-    [1002, "Geary", "Reggie", "Reggie Geary", False],
-    [202087, "Gee", "Alonzo", "Alonzo Gee", False],
-    [761, "Geiger", "Matt", "Matt Geiger", False],
-    [101153, "Gelabale", "Mickael", "Mickael Gelabale", False],
-    [1904, "George", "Devean", "Devean George", False],
-    [76800, "George", "Jack", "Jack George", False],
-    [1641718, "George", "Keyonte", "Keyonte George", True],
-    [1642273, "George", "Kyshawn", "Kyshawn George", True],
-    [202331, "George", "Paul", "Paul George", True],
-    [76801, "George", "Tate", "Tate George", False],
-    [1627875, "Georges-Hunt", "Marcus", "Marcus Georges-Hunt", False],
-    [76802, "Gerard", "Gus", "Gus Gerard", False],
-    [76803, "Gervin", "Derrick", "Derrick Gervin", False],
-    [76804, "Gervin", "George", "George Gervin", False],
-    [76805, "Getchell", "Gorham", "Gorham Getchell", False],
-    [76806, "Gianelli", "John", "John Gianelli", False],
-    [76807, "Gibbs", "Dick", "Dick Gibbs", False],
-    [200789, "Gibson", "Daniel", "Daniel Gibson", False],
-    [76808, "Gibson", "Dee", "Dee Gibson", False],
-    [1626780, "Gibson", "Jonathan", "Jonathan Gibson", False],
-    [76809, "Gibson", "Mel", "Mel Gibson", False],
-    [76810, "Gibson", "Mike", "Mike Gibson", False],
-    [201959, "Gibson", "Taj", "Taj Gibson", False],
-    [76811, "Gibson", "Ward", "Ward Gibson", False],
-    [201592, "Giddens", "J.R.", "J.R. Giddens", False],
-    [1630581, "Giddey", "Josh", "Josh Giddey", True],
-    [201821, "Gilder", "Trey", "Trey Gilder", False],
-    [1628385, "Giles III", "Harry", "Harry Giles III", False],
-    [1628983, "Gilgeous-Alexander", "Shai", "Shai Gilgeous-Alexander", True],
-    [1630264, "Gill", "Anthony", "Anthony Gill", True],
-    [2109, "Gill", "Eddie", "Eddie Gill", False],
-    [383, "Gill", "Kendall", "Kendall Gill", False],
-    [76812, "Gillery", "Ben", "Ben Gillery", False],
-    [1631221, "Gillespie", "Collin", "Collin Gillespie", True],
-    [1630273, "Gillespie", "Freddie", "Freddie Gillespie", False],
-    [76813, "Gillette", "Gene", "Gene Gillette", False],
-    [288, "Gilliam", "Armen", "Armen Gilliam", False],
-    [76815, "Gilliam", "Herm", "Herm Gilliam", False],
-    [600014, "Gilmore", "Artis", "Artis Gilmore", False],
-    [76817, "Gilmore", "Walt", "Walt Gilmore", False],
-    [76818, "Gilmur", "Chuck", "Chuck Gilmur", False],
-    [1631367, "Gilyard", "Jacob", "Jacob Gilyard", False],
-    [1938, "Ginobili", "Manu", "Manu Ginobili", False],
-    [1921, "Giricek", "Gordan", "Gordan Giricek", False],
-    [76819, "Givens", "Jack", "Jack Givens", False],
-    [202148, "Gladness", "Mickell", "Mickell Gladness", False],
-    [76820, "Glamack", "George", "George Glamack", False],
-    [76821, "Glass", "Gerald", "Gerald Glass", False],
-    [76822, "Glenn", "Mike", "Mike Glenn", False],
-    [76823, "Glick", "Norman", "Norman Glick", False],
-    [76824, "Glouchkov", "Georgi", "Georgi Glouchkov", False],
-    [76825, "Glover", "Clarence", "Clarence Glover", False],
-    [1901, "Glover", "Dion", "Dion Glover", False],
-    [2601, "Glyniadakis", "Andreas", "Andreas Glyniadakis", False],
-    [76826, "Gminski", "Mike", "Mike Gminski", False],
-    [203497, "Gobert", "Rudy", "Rudy Gobert", True],
-    [76827, "Godfread", "Dan", "Dan Godfread", False],
-    [76828, "Gola", "Tom", "Tom Gola", False],
-    [76829, "Goldfaden", "Ben", "Ben Goldfaden", False],
-    [1642884, "Goldin", "Vladislav", "Vladislav Goldin", True],
-    [924, "Goldwire", "Anthony", "Anthony Goldwire", False],
-    [101155, "Gomes", "Ryan", "Ryan Gomes", False],
-    [76830, "Gondrezick", "Glen", "Glen Gondrezick", False],
-    [76831, "Gondrezick", "Grant", "Grant Gondrezick", False],
-    [1642864, "González", "Hugo", "Hugo González", True],
-    [2400, "Gooden", "Drew", "Drew Gooden", False],
-    [76832, "Goodrich", "Gail", "Gail Goodrich", False],
-    [1864, "Goodrich", "Steve", "Steve Goodrich", False],
-    [203462, "Goodwin", "Archie", "Archie Goodwin", False],
-    [1629164, "Goodwin", "Brandon", "Brandon Goodwin", False],
-    [1630692, "Goodwin", "Jordan", "Jordan Goodwin", True],
-    [76833, "Goodwin", "Wilfred", "Wilfred Goodwin", False],
-    [203932, "Gordon", "Aaron", "Aaron Gordon", True],
-    [2732, "Gordon", "Ben", "Ben Gordon", False],
-    [204079, "Gordon", "Drew", "Drew Gordon", False],
-    [201569, "Gordon", "Eric", "Eric Gordon", True],
-    [76834, "Gordon", "Lancaster", "Lancaster Gordon", False],
-    [76835, "Gordon", "Paul", "Paul Gordon", False],
-    [101162, "Gortat", "Marcin", "Marcin Gortat", False],
-    [1641789, "Gortman", "Jazian", "Jazian Gortman", False],
-    [76836, "Gottlieb", "Leo", "Leo Gottlieb", False],
-    [202726, "Goudelock", "Andrew", "Andrew Goudelock", False],
-    [76837, "Govedarica", "Bato", "Bato Govedarica", False],
-    [76838, "Graboski", "Joe", "Joe Graboski", False],
-    [76839, "Grace", "Ricky", "Ricky Grace", False],
-    [1628984, "Graham", "Devonte'", "Devonte' Graham", False],
-    [37, "Graham", "Greg", "Greg Graham", False],
-    [101121, "Graham", "Joey", "Joey Graham", False],
-    [76843, "Graham", "Mal", "Mal Graham", False],
-    [76841, "Graham", "Orlando", "Orlando Graham", False],
-    [76842, "Graham", "Paul", "Paul Graham", False],
-    [101211, "Graham", "Stephen", "Stephen Graham", False],
-    [1626203, "Graham", "Treveon", "Treveon Graham", False],
-    [76844, "Grandholm", "Jim", "Jim Grandholm", False],
-    [97, "Grandison", "Ronnie", "Ronnie Grandison", False],
-    [101122, "Granger", "Danny", "Danny Granger", False],
-    [76847, "Granger", "Stewart", "Stewart Granger", False],
-    [258, "Grant", "Brian", "Brian Grant", False],
-    [76850, "Grant", "Bud", "Bud Grant", False],
-    [202, "Grant", "Gary", "Gary Grant", False],
-    [285, "Grant", "Greg", "Greg Grant", False],
-    [265, "Grant", "Harvey", "Harvey Grant", False],
-    [270, "Grant", "Horace", "Horace Grant", False],
-    [203924, "Grant", "Jerami", "Jerami Grant", True],
-    [1626170, "Grant", "Jerian", "Jerian Grant", False],
-    [76852, "Grant", "Josh", "Josh Grant", False],
-    [1514, "Grant", "Paul", "Paul Grant", False],
-    [76853, "Grant", "Travis", "Travis Grant", False],
-    [1629055, "Grantham", "Donte", "Donte Grantham", False],
-    [76854, "Grate", "Don", "Don Grate", False],
-    [76855, "Graves", "Butch", "Butch Graves", False],
-    [1629755, "Gravett", "Hassani", "Hassani Gravett", False],
-    [201189, "Gray", "Aaron", "Aaron Gray", False],
-    [1070, "Gray", "Devin", "Devin Gray", False],
-    [1516, "Gray", "Ed", "Ed Gray", False],
-    [1026, "Gray", "Evric", "Evric Gray", False],
-    [76859, "Gray", "Gary", "Gary Gray", False],
-    [1627982, "Gray", "Josh", "Josh Gray", False],
-    [76860, "Gray", "Leonard", "Leonard Gray", False],
-    [1630564, "Gray", "RaiQuan", "RaiQuan Gray", False],
-    [76861, "Gray", "Stuart", "Stuart Gray", False],
-    [76862, "Gray", "Sylvester", "Sylvester Gray", False],
-    [76863, "Gray", "Wyndol", "Wyndol Gray", False],
-    [81, "Grayer", "Jeff", "Jeff Grayer", False],
-    [76865, "Greacen", "Bob", "Bob Greacen", False],
-    [920, "Green", "A.C.", "A.C. Green", False],
-    [1631260, "Green", "AJ", "AJ Green", True],
-    [201980, "Green", "Danny", "Danny Green", False],
-    [101209, "Green", "Devin", "Devin Green", False],
-    [203110, "Green", "Draymond", "Draymond Green", True],
-    [203475, "Green", "Erick", "Erick Green", False],
-    [101123, "Green", "Gerald", "Gerald Green", False],
-    [203210, "Green", "JaMychal", "JaMychal Green", False],
-    [1630224, "Green", "Jalen", "Jalen Green", True],
-    [1629750, "Green", "Javonte", "Javonte Green", True],
-    [201145, "Green", "Jeff", "Jeff Green", True],
-    [76867, "Green", "Johnny", "Johnny Green", False],
-    [1630182, "Green", "Josh", "Josh Green", True],
-    [76868, "Green", "Ken", "Ken Green", False],
-    [76869, "Green", "Kenny", "Kenny Green", False],
-    [600011, "Green", "Lamar", "Lamar Green", False],
-    [1036, "Green", "Litterial", "Litterial Green", False],
-    [76872, "Green", "Luther", "Luther Green", False],
-    [76873, "Green", "Mike", "Mike Green", False],
-    [76874, "Green", "Rickey", "Rickey Green", False],
-    [76875, "Green", "Sean", "Sean Green", False],
-    [76877, "Green", "Si", "Si Green", False],
-    [76876, "Green", "Sidney", "Sidney Green", False],
-    [76878, "Green", "Steve", "Steve Green", False],
-    [201192, "Green", "Taurean", "Taurean Green", False],
-    [76879, "Green", "Tommy", "Tommy Green", False],
-    [2584, "Green", "Willie", "Willie Green", False],
-    [201590, "Greene", "Donte", "Donte Greene", False],
-    [101158, "Greene", "Orien", "Orien Greene", False],
-    [76880, "Greenspan", "Jerry", "Jerry Greenspan", False],
-    [76881, "Greenwood", "David", "David Greenwood", False],
-    [76882, "Greer", "Hal", "Hal Greer", False],
-    [2696, "Greer", "Lynn", "Lynn Greer", False],
-    [76883, "Gregor", "Gary", "Gary Gregor", False],
-    [76884, "Gregory", "Claude", "Claude Gregory", False],
-    [76885, "Greig", "John", "John Greig", False],
-    [76886, "Grekin", "Norm", "Norm Grekin", False],
-    [76887, "Grevey", "Kevin", "Kevin Grevey", False],
-    [1631100, "Griffin", "AJ", "AJ Griffin", False],
-    [1559, "Griffin", "Adrian", "Adrian Griffin", False],
-    [201933, "Griffin", "Blake", "Blake Griffin", False],
-    [2204, "Griffin", "Eddie", "Eddie Griffin", False],
-    [76888, "Griffin", "Greg", "Greg Griffin", False],
-    [76889, "Griffin", "Paul", "Paul Griffin", False],
-    [201981, "Griffin", "Taylor", "Taylor Griffin", False],
-    [76890, "Griffith", "Darrell", "Darrell Griffith", False],
-    [76891, "Grigsby", "Chuck", "Chuck Grigsby", False],
-    [1629656, "Grimes", "Quentin", "Quentin Grimes", True],
-    [1575, "Grimm", "Derek", "Derek Grimm", False],
-    [76893, "Grimshaw", "George", "George Grimshaw", False],
-    [76894, "Groat", "Dick", "Dick Groat", False],
-    [76895, "Gross", "Bob", "Bob Gross", False],
-    [76896, "Grote", "Jerry", "Jerry Grote", False],
-    [76897, "Groza", "Alex", "Alex Groza", False],
-    [101219, "Grundy", "Anthony", "Anthony Grundy", False],
-    [76899, "Grunfeld", "Ernie", "Ernie Grunfeld", False],
-    [76900, "Guarilia", "Gene", "Gene Guarilia", False],
-    [76901, "Gudmundsson", "Petur", "Petur Gudmundsson", False],
-    [1629741, "Guduric", "Marko", "Marko Guduric", False],
-    [76902, "Guerin", "Richie", "Richie Guerin", False],
-    [1631338, "Gueye", "Mouhamadou", "Mouhamadou Gueye", False],
-    [1631243, "Gueye", "Mouhamed", "Mouhamed Gueye", True],
-    [339, "Gugliotta", "Tom", "Tom Gugliotta", False],
-    [76903, "Guibert", "Andres", "Andres Guibert", False],
-    [76904, "Guidinger", "Jay", "Jay Guidinger", False],
-    [76905, "Gunther", "Coulby", "Coulby Gunther", False],
-    [76906, "Gunther", "Dave", "Dave Gunther", False],
-    [76907, "Guokas", "Al", "Al Guokas", False],
-    [76908, "Guokas", "Matt", "Matt Guokas", False],
-    [76909, "Guokas", "Matt", "Matt Guokas", False],
-    [203268, "Gutierrez", "Jorge", "Jorge Gutierrez", False],
-    [1629657, "Guy", "Kyle", "Kyle Guy", False],
-    [2062, "Guyton", "A.J.", "A.J. Guyton", False],
-    [2775, "Ha", "Seung-jin", "Ha Seung-jin", False],
-    [1629060, "Hachimura", "Rui", "Rui Hachimura", True],
-    [76910, "Hackett", "Rudy", "Rudy Hackett", False],
-    [201632, "Haddadi", "Hamed", "Hamed Haddadi", False],
-    [76911, "Haffner", "Scott", "Scott Haffner", False],
-    [76912, "Hagan", "Cliff", "Cliff Hagan", False],
-    [76913, "Hagan", "Glenn", "Glenn Hagan", False],
-    [1630204, "Hagans", "Ashton", "Ashton Hagans", False],
-    [76914, "Hahn", "Bob", "Bob Hahn", False],
-    [76915, "Hairston", "Al", "Al Hairston", False],
-    [76916, "Hairston", "Happy", "Happy Hairston", False],
-    [76917, "Hairston", "Lindsay", "Lindsay Hairston", False],
-    [201612, "Hairston", "Malik", "Malik Hairston", False],
-    [203798, "Hairston", "PJ", "PJ Hairston", False],
-    [2409, "Haislip", "Marcus", "Marcus Haislip", False],
-    [76918, "Halbert", "Chuck", "Chuck Halbert", False],
-    [76919, "Halbrook", "Harvey", "Harvey Halbrook", False],
-    [76920, "Hale", "Bruce", "Bruce Hale", False],
-    [917, "Haley", "Jack", "Jack Haley", False],
-    [1630169, "Haliburton", "Tyrese", "Tyrese Haliburton", True],
-    [76922, "Halimon", "Shaler", "Shaler Halimon", False],
-    [1628985, "Hall", "Devon", "Devon Hall", False],
-    [1629743, "Hall", "Donta", "Donta Hall", False],
-    [1631160, "Hall", "Jordan", "Jordan Hall", False],
-    [1630221, "Hall", "Josh", "Josh Hall", False],
-    [200837, "Hall", "Mike", "Mike Hall", False],
-    [1641790, "Hall", "PJ", "PJ Hall", True],
-    [1629788, "Hall", "Tyler", "Tyler Hall", False],
-    [76923, "Halliburton", "Jeff", "Jeff Halliburton", False],
-    [1032, "Ham", "Darvin", "Darvin Ham", False],
-    [984, "Hamer", "Steve", "Steve Hamer", False],
-    [76925, "Hamilton", "Dale", "Dale Hamilton", False],
-    [1627772, "Hamilton", "Daniel", "Daniel Hamilton", False],
-    [76926, "Hamilton", "Dennis", "Dennis Hamilton", False],
-    [202706, "Hamilton", "Jordan", "Jordan Hamilton", False],
-    [203120, "Hamilton", "Justin", "Justin Hamilton", False],
-    [76927, "Hamilton", "Ralph", "Ralph Hamilton", False],
-    [1888, "Hamilton", "Richard", "Richard Hamilton", False],
-    [76928, "Hamilton", "Roylee", "Roylee Hamilton", False],
-    [76929, "Hamilton", "Steve", "Steve Hamilton", False],
-    [2347, "Hamilton", "Tang", "Tang Hamilton", False],
-    [676, "Hamilton", "Thomas", "Thomas Hamilton", False],
-    [1985, "Hamilton", "Zendon", "Zendon Hamilton", False],
-    [903, "Hammink", "Geert", "Geert Hammink", False],
-    [67, "Hammonds", "Tom", "Tom Hammonds", False],
-    [1627773, "Hammons", "AJ", "AJ Hammons", False],
-    [1630181, "Hampton", "R.J.", "R.J. Hampton", False],
-    [241, "Hancock", "Darrin", "Darrin Hancock", False],
-    [1052, "Handlogten", "Ben", "Ben Handlogten", False],
-    [76935, "Hankins", "Cecil", "Cecil Hankins", False],
-    [76936, "Hankinson", "Phil", "Phil Hankinson", False],
-    [1628605, "Hannahs", "Dusty", "Dusty Hannahs", False],
-    [76937, "Hannum", "Alex", "Alex Hannum", False],
-    [76938, "Hanrahan", "Don", "Don Hanrahan", False],
-    [76939, "Hans", "Rollen", "Rollen Hans", False],
-    [203162, "Hansbrough", "Ben", "Ben Hansbrough", False],
-    [201946, "Hansbrough", "Tyler", "Tyler Hansbrough", False],
-    [76942, "Hansen", "Bob", "Bob Hansen", False],
-    [76940, "Hansen", "Glenn", "Glenn Hansen", False],
-    [76941, "Hansen", "Lars", "Lars Hansen", False],
-    [2580, "Hansen", "Travis", "Travis Hansen", False],
-    [1682, "Hanson", "Reggie", "Reggie Hanson", False],
-    [76944, "Hanzlik", "Bill", "Bill Hanzlik", False],
-    [202376, "Harangody", "Luke", "Luke Harangody", False],
-    [358, "Hardaway", "Anfernee", "Anfernee Hardaway", False],
-    [896, "Hardaway", "Tim", "Tim Hardaway", False],
-    [203501, "Hardaway Jr.", "Tim", "Tim Hardaway Jr.", True],
-    [201935, "Harden", "James", "James Harden", True],
-    [76945, "Harding", "Reggie", "Reggie Harding", False],
-    [76946, "Hardnett", "Charlie", "Charlie Hardnett", False],
-    [76947, "Hardy", "Alan", "Alan Hardy", False],
-    [1630702, "Hardy", "Jaden", "Jaden Hardy", True],
-    [76948, "Hardy", "James", "James Hardy", False],
-    [76949, "Hargis", "John", "John Hargis", False],
-    [1641989, "Harkless", "Elijah", "Elijah Harkless", True],
-    [203090, "Harkless", "Maurice", "Maurice Harkless", False],
-    [76950, "Harkness", "Jerry", "Jerry Harkness", False],
-    [76951, "Harlicka", "Skip", "Skip Harlicka", False],
-    [76952, "Harmon", "Jerome", "Jerome Harmon", False],
-    [157, "Harper", "Derek", "Derek Harper", False],
-    [1642844, "Harper", "Dylan", "Dylan Harper", True],
-    [1629607, "Harper", "Jared", "Jared Harper", False],
-    [202712, "Harper", "Justin", "Justin Harper", False],
-    [76954, "Harper", "Mike", "Mike Harper", False],
-    [166, "Harper", "Ron", "Ron Harper", False],
-    [1631199, "Harper Jr.", "Ron", "Ron Harper Jr.", True],
-    [1723, "Harpring", "Matt", "Matt Harpring", False],
-    [1626149, "Harrell", "Montrezl", "Montrezl Harrell", False],
-    [202725, "Harrellson", "Josh", "Josh Harrellson", False],
-    [2492, "Harrington", "Adam", "Adam Harrington", False],
-    [1733, "Harrington", "Al", "Al Harrington", False],
-    [2454, "Harrington", "Junior", "Junior Harrington", False],
-    [970, "Harrington", "Othella", "Othella Harrington", False],
-    [76956, "Harris", "Art", "Art Harris", False],
-    [76957, "Harris", "Bernie", "Bernie Harris", False],
-    [76959, "Harris", "Bob", "Bob Harris", False],
-    [76958, "Harris", "Chris", "Chris Harris", False],
-    [2734, "Harris", "Devin", "Devin Harris", False],
-    [203548, "Harris", "Elias", "Elias Harris", False],
-    [203914, "Harris", "Gary", "Gary Harris", True],
-    [1630223, "Harris", "Jalen", "Jalen Harris", False],
-    [203925, "Harris", "Joe", "Joe Harris", False],
-    [1630284, "Harris", "Kevon", "Kevon Harris", True],
-    [446, "Harris", "Lucious", "Lucious Harris", False],
-    [202412, "Harris", "Manny", "Manny Harris", False],
-    [200839, "Harris", "Mike", "Mike Harris", False],
-    [76960, "Harris", "Steve", "Steve Harris", False],
-    [202227, "Harris", "Terrel", "Terrel Harris", False],
-    [202699, "Harris", "Tobias", "Tobias Harris", True],
-    [76961, "Harris", "Tony", "Tony Harris", False],
-    [1626151, "Harrison", "Aaron", "Aaron Harrison", False],
-    [1626150, "Harrison", "Andrew", "Andrew Harrison", False],
-    [76962, "Harrison", "Bob", "Bob Harrison", False],
-    [2758, "Harrison", "David", "David Harrison", False],
-    [1627885, "Harrison", "Shaquille", "Shaquille Harrison", False],
-    [2078, "Hart", "Jason", "Jason Hart", False],
-    [1628404, "Hart", "Josh", "Josh Hart", True],
-    [1628392, "Hartenstein", "Isaiah", "Isaiah Hartenstein", True],
-    [176, "Harvey", "Antonio", "Antonio Harvey", False],
-    [2051, "Harvey", "Donnell", "Donnell Harvey", False],
-    [202238, "Hasbrouck", "Kenny", "Kenny Hasbrouck", False],
-    [321, "Haskin", "Scott", "Scott Haskin", False],
-    [76965, "Haskins", "Clem", "Clem Haskins", False],
-    [2617, "Haslem", "Udonis", "Udonis Haslem", False],
-    [2239, "Hassell", "Trenton", "Trenton Hassell", False],
-    [76967, "Hassett", "Billy", "Billy Hassett", False],
-    [76966, "Hassett", "Joey", "Joey Hassett", False],
-    [76968, "Hastings", "Scott", "Scott Hastings", False],
-    [2213, "Haston", "Kirk", "Kirk Haston", False],
-    [76969, "Hatton", "Vern", "Vern Hatton", False],
-    [1630573, "Hauser", "Sam", "Sam Hauser", True],
-    [76970, "Havlicek", "John", "John Havlicek", False],
-    [201150, "Hawes", "Spencer", "Spencer Hawes", False],
-    [76971, "Hawes", "Steve", "Steve Hawes", False],
-    [76972, "Hawkins", "Connie", "Connie Hawkins", False],
-    [765, "Hawkins", "Hersey", "Hersey Hawkins", False],
-    [1641722, "Hawkins", "Jordan", "Jordan Hawkins", True],
-    [1038, "Hawkins", "Juaquin", "Juaquin Hawkins", False],
-    [76974, "Hawkins", "Marshall", "Marshall Hawkins", False],
-    [1138, "Hawkins", "Michael", "Michael Hawkins", False],
-    [76975, "Hawkins", "Robert", "Robert Hawkins", False],
-    [76977, "Hawkins", "Tom", "Tom Hawkins", False],
-    [76978, "Hawthorne", "Nate", "Nate Hawthorne", False],
-    [101236, "Hayes", "Chuck", "Chuck Hayes", False],
-    [76979, "Hayes", "Elvin", "Elvin Hayes", False],
-    [2553, "Hayes", "Jarvis", "Jarvis Hayes", False],
-    [1629637, "Hayes", "Jaxson", "Jaxson Hayes", True],
-    [1630165, "Hayes", "Killian", "Killian Hayes", False],
-    [76980, "Hayes", "Steve", "Steve Hayes", False],
-    [1628502, "Hayes-Davis", "Nigel", "Nigel Hayes-Davis", True],
-    [202330, "Hayward", "Gordon", "Gordon Hayward", False],
-    [202351, "Hayward", "Lazar", "Lazar Hayward", False],
-    [2217, "Haywood", "Brendan", "Brendan Haywood", False],
-    [76981, "Haywood", "Spencer", "Spencer Haywood", False],
-    [76982, "Hazen", "John W.", "John W. Hazen", False],
-    [76983, "Hazzard", "Walt", "Walt Hazzard", False],
-    [101129, "Head", "Luther", "Luther Head", False],
-    [1049, "Heal", "Shane", "Shane Heal", False],
-    [76984, "Heaney", "Brian", "Brian Heaney", False],
-    [76985, "Heard", "Garfield", "Garfield Heard", False],
-    [203687, "Hearn", "Reggie", "Reggie Hearn", False],
-    [76986, "Hedderick", "Herm", "Herm Hedderick", False],
-    [76987, "Heggs", "Alvin", "Alvin Heggs", False],
-    [76988, "Heinsohn", "Tom", "Tom Heinsohn", False],
-    [76989, "Hemric", "Dick", "Dick Hemric", False],
-    [673, "Henderson", "Alan", "Alan Henderson", False],
-    [1538, "Henderson", "Cedric", "Cedric Henderson", False],
-    [76990, "Henderson", "Cedric", "Cedric Henderson", False],
-    [76991, "Henderson", "Dave", "Dave Henderson", False],
-    [76993, "Henderson", "Gerald", "Gerald Henderson", False],
-    [201945, "Henderson", "Gerald", "Gerald Henderson", False],
-    [1764, "Henderson", "J.R.", "J.R. Henderson", False],
-    [76992, "Henderson", "Jerome", "Jerome Henderson", False],
-    [76994, "Henderson", "Kevin", "Kevin Henderson", False],
-    [1630703, "Henderson", "Scoot", "Scoot Henderson", True],
-    [76996, "Henderson", "Tom", "Tom Henderson", False],
-    [1641707, "Hendricks", "Taylor", "Taylor Hendricks", True],
-    [971, "Hendrickson", "Mark", "Mark Hendrickson", False],
-    [76998, "Hennessy", "Larry", "Larry Hennessy", False],
-    [76999, "Henriksen", "Don", "Don Henriksen", False],
-    [1630565, "Henry", "Aaron", "Aaron Henry", False],
-    [77000, "Henry", "Al", "Al Henry", False],
-    [77004, "Henry", "Bill", "Bill Henry", False],
-    [77001, "Henry", "Carl", "Carl Henry", False],
-    [77002, "Henry", "Conner", "Conner Henry", False],
-    [1627988, "Henry", "Myke", "Myke Henry", False],
-    [77003, "Henry", "Skeeter", "Skeeter Henry", False],
-    [202333, "Henry", "Xavier", "Xavier Henry", False],
-    [203089, "Henson", "John", "John Henson", False],
-    [1667, "Henson", "Steve", "Steve Henson", False],
-    [1642935, "Hepburn", "Chucky", "Chucky Hepburn", True],
-    [77006, "Herman", "Bill", "Bill Herman", False],
-    [77007, "Hermsen", "Clarence", "Clarence Hermsen", False],
-    [1629608, "Hernandez", "Dewan", "Dewan Hernandez", False],
-    [1627823, "Hernangomez", "Juancho", "Juancho Hernangomez", False],
-    [1626195, "Hernangomez", "Willy", "Willy Hernangomez", False],
-    [1914, "Herren", "Chris", "Chris Herren", False],
-    [61, "Herrera", "Carl", "Carl Herrera", False],
-    [200835, "Herrmann", "Walter", "Walter Herrmann", False],
-    [1629639, "Herro", "Tyler", "Tyler Herro", True],
-    [77010, "Herron", "Keith", "Keith Herron", False],
-    [77011, "Hertzberg", "Sidney", "Sidney Hertzberg", False],
-    [1628987, "Hervey", "Kevin", "Kevin Hervey", False],
-    [77012, "Hetzel", "Fred", "Fred Hetzel", False],
-    [77013, "Hewitt", "Bill", "Bill Hewitt", False],
-    [77014, "Hewson", "Jack", "Jack Hewson", False],
-    [77015, "Heyman", "Art", "Art Heyman", False],
-    [1626209, "Hezonja", "Mario", "Mario Hezonja", False],
-    [201579, "Hibbert", "Roy", "Roy Hibbert", False],
-    [77016, "Hickey", "Matthew", "Matthew Hickey", False],
-    [1628439, "Hicks", "Isaiah", "Isaiah Hicks", False],
-    [77017, "Hicks", "Phil", "Phil Hicks", False],
-    [201581, "Hickson", "JJ", "JJ Hickson", False],
-    [1627741, "Hield", "Buddy", "Buddy Hield", True],
-    [202809, "Higgins", "Cory", "Cory Higgins", False],
-    [1848, "Higgins", "Mike", "Mike Higgins", False],
-    [77019, "Higgins", "Rod", "Rod Higgins", False],
-    [925, "Higgins", "Sean", "Sean Higgins", False],
-    [77021, "Higgs", "Kenny", "Kenny Higgs", False],
-    [77022, "High", "Johnny", "Johnny High", False],
-    [1629312, "Highsmith", "Haywood", "Haywood Highsmith", True],
-    [77023, "Hightower", "Wayne", "Wayne Hightower", False],
-    [77024, "Hill", "Armond", "Armond Hill", False],
-    [77025, "Hill", "Cleo", "Cleo Hill", False],
-    [77026, "Hill", "Gary", "Gary Hill", False],
-    [201588, "Hill", "George", "George Hill", False],
-    [255, "Hill", "Grant", "Grant Hill", False],
-    [201195, "Hill", "Herbert", "Herbert Hill", False],
-    [201941, "Hill", "Jordan", "Jordan Hill", False],
-    [1630792, "Hill", "Malcolm", "Malcolm Hill", False],
-    [203524, "Hill", "Solomon", "Solomon Hill", False],
-    [201631, "Hill", "Steven", "Steven Hill", False],
-    [238, "Hill", "Tyrone", "Tyrone Hill", False],
-    [77027, "Hillhouse", "Art", "Art Hillhouse", False],
-    [1626199, "Hilliard", "Darrun", "Darrun Hilliard", False],
-    [77028, "Hillman", "Darnell", "Darnell Hillman", False],
-    [77029, "Hilton", "Fred", "Fred Hilton", False],
-    [2550, "Hinrich", "Kirk", "Kirk Hinrich", False],
-    [77030, "Hinson", "Roy", "Roy Hinson", False],
-    [1630207, "Hinton", "Nate", "Nate Hinton", False],
-    [77031, "Hirsch", "Mel", "Mel Hirsch", False],
-    [77032, "Hitch", "Lew", "Lew Hitch", False],
-    [200823, "Hite", "Robert", "Robert Hite", False],
-    [1629658, "Hoard", "Jaylen", "Jaylen Hoard", False],
-    [202359, "Hobson", "Darington", "Darington Hobson", False],
-    [1641793, "Hodge", "D'Moi", "D'Moi Hodge", False],
-    [1106, "Hodge", "Donald", "Donald Hodge", False],
-    [101125, "Hodge", "Julius", "Julius Hodge", False],
-    [77034, "Hodges", "Craig", "Craig Hodges", False],
-    [77035, "Hoefer", "Adolph", "Adolph Hoefer", False],
-    [77036, "Hoffman", "Paul 'The Bear'", "Paul 'The Bear' Hoffman", False],
-    [77037, "Hogsett", "Bob", "Bob Hogsett", False],
-    [77038, "Hogue", "Paul", "Paul Hogue", False],
-    [697, "Hoiberg", "Fred", "Fred Hoiberg", False],
-    [77039, "Holcomb", "Doug", "Doug Holcomb", False],
-    [2450, "Holcomb", "Randy", "Randy Holcomb", False],
-    [1628988, "Holiday", "Aaron", "Aaron Holiday", True],
-    [201950, "Holiday", "Jrue", "Jrue Holiday", True],
-    [203200, "Holiday", "Justin", "Justin Holiday", False],
-    [77040, "Holland", "Brad", "Brad Holland", False],
-    [77041, "Holland", "Joe", "Joe Holland", False],
-    [204066, "Holland", "John", "John Holland", False],
-    [77042, "Holland", "Wilbur", "Wilbur Holland", False],
-    [1641842, "Holland II", "Ronald", "Ronald Holland II", True],
-    [77043, "Hollins", "Lionel", "Lionel Hollins", False],
-    [200797, "Hollins", "Ryan", "Ryan Hollins", False],
-    [77044, "Hollis", "Essie", "Essie Hollis", False],
-    [1626178, "Hollis-Jefferson", "Rondae", "Rondae Hollis-Jefferson", False],
-    [1626158, "Holmes", "Richaun", "Richaun Holmes", False],
-    [1641747, "Holmes II", "DaRon", "DaRon Holmes II", True],
-    [1631096, "Holmgren", "Chet", "Chet Holmgren", True],
-    [77045, "Holstein", "Jim", "Jim Holstein", False],
-    [77046, "Holt", "Alvin", "Alvin Holt", False],
-    [77047, "Holton", "Michael", "Michael Holton", False],
-    [77048, "Holub", "Dick", "Dick Holub", False],
-    [77049, "Holup", "Joe", "Joe Holup", False],
-    [77050, "Holzman", "Red", "Red Holzman", False],
-    [1630258, "Homesley", "Caleb", "Caleb Homesley", False],
-    [1532, "Honeycutt", "Jerald", "Jerald Honeycutt", False],
-    [202715, "Honeycutt", "Tyler", "Tyler Honeycutt", False],
-    [1967, "Hood", "Derek", "Derek Hood", False],
-    [203918, "Hood", "Rodney", "Rodney Hood", False],
-    [1641720, "Hood-Schifino", "Jalen", "Jalen Hood-Schifino", False],
-    [77051, "Hoover", "Tom", "Tom Hoover", False],
-    [77052, "Hopkins", "Bob", "Bob Hopkins", False],
-    [77053, "Hoppen", "Dave", "Dave Hoppen", False],
-    [77054, "Hopson", "Dennis", "Dennis Hopson", False],
-    [203816, "Hopson", "Scotty", "Scotty Hopson", False],
-    [77055, "Horan", "Johnny", "Johnny Horan", False],
-    [77056, "Hordges", "Cedrick", "Cedrick Hordges", False],
-    [201143, "Horford", "Al", "Al Horford", True],
-    [77057, "Horford", "Tito", "Tito Horford", False],
-    [77058, "Horn", "Ron", "Ron Horn", False],
-    [204, "Hornacek", "Jeff", "Jeff Hornacek", False],
-    [202862, "Horner", "Dennis", "Dennis Horner", False],
-    [109, "Horry", "Robert", "Robert Horry", False],
-    [77060, "Horton", "Ed", "Ed Horton", False],
-    [1629659, "Horton-Tucker", "Talen", "Talen Horton-Tucker", False],
-    [77061, "Hosket", "Wilmer", "Wilmer Hosket", False],
-    [77062, "Houbregs", "Bob", "Bob Houbregs", False],
-    [2067, "House", "Eddie", "Eddie House", False],
-    [1627863, "House Jr.", "Danuel", "Danuel House Jr.", False],
-    [1631216, "Houstan", "Caleb", "Caleb Houstan", True],
-    [275, "Houston", "Allan", "Allan Houston", False],
-    [780, "Houston", "Byron", "Byron Houston", False],
-    [77064, "Hovasse", "Tom", "Tom Hovasse", False],
-    [77065, "Howard", "Brian", "Brian Howard", False],
-    [2730, "Howard", "Dwight", "Dwight Howard", False],
-    [77066, "Howard", "Greg", "Greg Howard", False],
-    [1641724, "Howard", "Jett", "Jett Howard", True],
-    [2572, "Howard", "Josh", "Josh Howard", False],
-    [436, "Howard", "Juwan", "Juwan Howard", False],
-    [1630210, "Howard", "Markus", "Markus Howard", False],
-    [77067, "Howard", "Mo", "Mo Howard", False],
-    [77069, "Howard", "Otis", "Otis Howard", False],
-    [1128, "Howard", "Stephen", "Stephen Howard", False],
-    [1629739, "Howard", "William", "William Howard", False],
-    [77070, "Howell", "Bailey", "Bailey Howell", False],
-    [77072, "Hubbard", "Bob", "Bob Hubbard", False],
-    [77071, "Hubbard", "Phil", "Phil Hubbard", False],
-    [1631309, "Hudgins", "Trevor", "Trevor Hudgins", False],
-    [201991, "Hudson", "Lester", "Lester Hudson", False],
-    [77074, "Hudson", "Lou", "Lou Hudson", False],
-    [1607, "Hudson", "Troy", "Troy Hudson", False],
-    [1626273, "Huertas", "Marcelo", "Marcelo Huertas", False],
-    [1628989, "Huerter", "Kevin", "Kevin Huerter", True],
-    [203962, "Huestis", "Josh", "Josh Huestis", False],
-    [1630643, "Huff", "Jay", "Jay Huff", True],
-    [1572, "Huffman", "Nate", "Nate Huffman", False],
-    [77076, "Hughes", "Alfredrick", "Alfredrick Hughes", False],
-    [77077, "Hughes", "Eddie", "Eddie Hughes", False],
-    [1630190, "Hughes", "Elijah", "Elijah Hughes", False],
-    [77078, "Hughes", "Kim", "Kim Hughes", False],
-    [1716, "Hughes", "Larry", "Larry Hughes", False],
-    [1965, "Hughes", "Rick", "Rick Hughes", False],
-    [1630574, "Hukporti", "Ariel", "Ariel Hukporti", True],
-    [203133, "Hummel", "Robbie", "Robbie Hummel", False],
-    [77080, "Hummer", "John", "John Hummer", False],
-    [2415, "Humphrey", "Ryan", "Ryan Humphrey", False],
-    [1629353, "Humphries", "Isaac", "Isaac Humphries", False],
-    [77081, "Humphries", "Jay", "Jay Humphries", False],
-    [2743, "Humphries", "Kris", "Kris Humphries", False],
-    [77082, "Hundley", "Rod", "Rod Hundley", False],
-    [1630624, "Hunt", "Feron", "Feron Hunt", False],
-    [2599, "Hunter", "Brandon", "Brandon Hunter", False],
-    [77083, "Hunter", "Cedric", "Cedric Hunter", False],
-    [201805, "Hunter", "Chris", "Chris Hunter", False],
-    [1629631, "Hunter", "De'Andre", "De'Andre Hunter", True],
-    [77084, "Hunter", "Les", "Les Hunter", False],
-    [283, "Hunter", "Lindsey", "Lindsey Hunter", False],
-    [201629, "Hunter", "Othello", "Othello Hunter", False],
-    [1626154, "Hunter", "RJ", "RJ Hunter", False],
-    [2212, "Hunter", "Steven", "Steven Hunter", False],
-    [1626205, "Hunter", "Vincent", "Vincent Hunter", False],
-    [1643047, "Huntley", "CJ", "CJ Huntley", True],
-    [310, "Hurley", "Bobby", "Bobby Hurley", False],
-    [77086, "Hurley", "Roy", "Roy Hurley", False],
-    [1630562, "Hurt", "Matt", "Matt Hurt", False],
-    [77087, "Huston", "Geoff", "Geoff Huston", False],
-    [77088, "Huston", "Paul", "Paul Huston", False],
-    [77089, "Hutchins", "Mel", "Mel Hutchins", False],
-    [1628990, "Hutchison", "Chandler", "Chandler Hutchison", False],
-    [77090, "Hutton", "Joe", "Joe Hutton", False],
-    [77091, "Hyder", "Greg", "Greg Hyder", False],
-    [1630538, "Hyland", "Bones", "Bones Hyland", True],
-    [77092, "Iavaroni", "Marc", "Marc Iavaroni", False],
-    [201586, "Ibaka", "Serge", "Serge Ibaka", False],
-    [1642345, "Ighodaro", "Oso", "Oso Ighodaro", True],
-    [2738, "Iguodala", "Andre", "Andre Iguodala", False],
-    [980, "Ilgauskas", "Zydrunas", "Zydrunas Ilgauskas", False],
-    [101148, "Ilic", "Mile", "Mile Ilic", False],
-    [101141, "Ilyasova", "Ersan", "Ersan Ilyasova", False],
-    [77093, "Imhoff", "Darrall", "Darrall Imhoff", False],
-    [77094, "Ingelsby", "Tom", "Tom Ingelsby", False],
-    [204060, "Ingles", "Joe", "Joe Ingles", True],
-    [203996, "Inglis", "Damien", "Damien Inglis", False],
-    [201281, "Ingram", "Andre", "Andre Ingram", False],
-    [1627742, "Ingram", "Brandon", "Brandon Ingram", True],
-    [1631127, "Ingram", "Harrison", "Harrison Ingram", True],
-    [77095, "Ingram", "Joel", "Joel Ingram", False],
-    [77096, "Irvin", "Byron", "Byron Irvin", False],
-    [202681, "Irving", "Kyrie", "Kyrie Irving", True],
-    [1628371, "Isaac", "Jonathan", "Jonathan Isaac", True],
-    [77097, "Issel", "Dan", "Dan Issel", False],
-    [77098, "Iuzzolino", "Mike", "Mike Iuzzolino", False],
-    [947, "Iverson", "Allen", "Allen Iverson", False],
-    [1631093, "Ivey", "Jaden", "Jaden Ivey", True],
-    [2767, "Ivey", "Royal", "Royal Ivey", False],
-    [1628411, "Iwundu", "Wes", "Wes Iwundu", False],
-    [101127, "Jack", "Jarrett", "Jarrett Jack", False],
-    [1628935, "Jackson", "Aaron", "Aaron Jackson", False],
-    [77099, "Jackson", "Al", "Al Jackson", False],
-    [1517, "Jackson", "Bobby", "Bobby Jackson", False],
-    [202132, "Jackson", "Cedric", "Cedric Jackson", False],
-    [201616, "Jackson", "Darnell", "Darnell Jackson", False],
-    [1627743, "Jackson", "Demetrius", "Demetrius Jackson", False],
-    [1628402, "Jackson", "Frank", "Frank Jackson", False],
-    [1641713, "Jackson", "GG", "GG Jackson", True],
-    [77101, "Jackson", "Greg", "Greg Jackson", False],
-    [1630543, "Jackson", "Isaiah", "Isaiah Jackson", True],
-    [1114, "Jackson", "Jaren", "Jaren Jackson", False],
-    [1983, "Jackson", "Jermaine", "Jermaine Jackson", False],
-    [754, "Jackson", "Jim", "Jim Jackson", False],
-    [1628367, "Jackson", "Josh", "Josh Jackson", False],
-    [1628382, "Jackson", "Justin", "Justin Jackson", False],
-    [77103, "Jackson", "Lucious", "Lucious Jackson", False],
-    [2739, "Jackson", "Luke", "Luke Jackson", False],
-    [1531, "Jackson", "Marc", "Marc Jackson", False],
-    [349, "Jackson", "Mark", "Mark Jackson", False],
-    [77104, "Jackson", "Michael", "Michael Jackson", False],
-    [77105, "Jackson", "Myron", "Myron Jackson", False],
-    [77106, "Jackson", "Phil", "Phil Jackson", False],
-    [203510, "Jackson", "Pierre", "Pierre Jackson", False],
-    [1631245, "Jackson", "Quenton", "Quenton Jackson", True],
-    [77107, "Jackson", "Ralph", "Ralph Jackson", False],
-    [1872, "Jackson", "Randell", "Randell Jackson", False],
-    [202704, "Jackson", "Reggie", "Reggie Jackson", False],
-    [77109, "Jackson", "Stanley", "Stanley Jackson", False],
-    [1536, "Jackson", "Stephen", "Stephen Jackson", False],
-    [77100, "Jackson", "Tony", "Tony Jackson", False],
-    [77110, "Jackson", "Tracy", "Tracy Jackson", False],
-    [77111, "Jackson", "Wardell", "Wardell Jackson", False],
-    [1641748, "Jackson Jr.", "Andre", "Andre Jackson Jr.", True],
-    [1628991, "Jackson Jr.", "Jaren", "Jaren Jackson Jr.", True],
-    [1631218, "Jackson-Davis", "Trayce", "Trayce Jackson-Davis", True],
-    [77112, "Jacobs", "Winfred", "Winfred Jacobs", False],
-    [2418, "Jacobsen", "Casey", "Casey Jacobsen", False],
-    [1734, "Jacobson", "Sam", "Sam Jacobson", False],
-    [1642857, "Jakučionis", "Kasparas", "Kasparas Jakučionis", True],
-    [77114, "Jamerson", "Dave", "Dave Jamerson", False],
-    [77115, "James", "Aaron", "Aaron James", False],
-    [203108, "James", "Bernard", "Bernard James", False],
-    [1642355, "James", "Bronny", "Bronny James", True],
-    [202345, "James", "Damion", "Damion James", False],
-    [77116, "James", "Gene", "Gene James", False],
-    [1080, "James", "Henry", "Henry James", False],
-    [1744, "James", "Jerome", "Jerome James", False],
-    [1629713, "James", "Justin", "Justin James", False],
-    [2544, "James", "LeBron", "LeBron James", True],
-    [2229, "James", "Mike", "Mike James", False],
-    [1628455, "James", "Mike", "Mike James", False],
-    [1642883, "James", "Sion", "Sion James", True],
-    [1906, "James", "Tim", "Tim James", False],
-    [1712, "Jamison", "Antawn", "Antawn Jamison", False],
-    [1942, "Jamison", "Harold", "Harold Jamison", False],
-    [77120, "Janisch", "John", "John Janisch", False],
-    [77122, "Janotta", "Howie", "Howie Janotta", False],
-    [1631170, "Jaquez Jr.", "Jaime", "Jaime Jaquez Jr.", True],
-    [2060, "Jaric", "Marko", "Marko Jaric", False],
-    [77123, "Jaros", "Tony", "Tony Jaros", False],
-    [1630610, "Jarreau", "DeJon", "DeJon Jarreau", False],
-    [101180, "Jasikevicius", "Sarunas", "Sarunas Jasikevicius", False],
-    [201605, "Jawai", "Nathan", "Nathan Jawai", False],
-    [77125, "Jeannette", "Buddy", "Buddy Jeannette", False],
-    [77126, "Jeelani", "Abdul", "Abdul Jeelani", False],
-    [2423, "Jefferies", "Chris", "Chris Jefferies", False],
-    [201785, "Jeffers", "Othyus", "Othyus Jeffers", False],
-    [2744, "Jefferson", "Al", "Al Jefferson", False],
-    [1628518, "Jefferson", "Amile", "Amile Jefferson", False],
-    [203928, "Jefferson", "Cory", "Cory Jefferson", False],
-    [200971, "Jefferson", "Dontell", "Dontell Jefferson", False],
-    [2210, "Jefferson", "Richard", "Richard Jefferson", False],
-    [1629610, "Jeffries", "DaQuan", "DaQuan Jeffries", False],
-    [2407, "Jeffries", "Jared", "Jared Jeffries", False],
-    [1641998, "Jemison III", "Trey", "Trey Jemison III", True],
-    [202724, "Jenkins", "Charles", "Charles Jenkins", False],
-    [1642450, "Jenkins", "Daniss", "Daniss Jenkins", True],
-    [2798, "Jenkins", "Horace", "Horace Jenkins", False],
-    [203098, "Jenkins", "John", "John Jenkins", False],
-    [201943, "Jennings", "Brandon", "Brandon Jennings", False],
-    [24, "Jennings", "Keith", "Keith Jennings", False],
-    [1137, "Jent", "Chris", "Chris Jent", False],
-    [77129, "Jepsen", "Les", "Les Jepsen", False],
-    [201973, "Jerebko", "Jonas", "Jonas Jerebko", False],
-    [1629660, "Jerome", "Ty", "Ty Jerome", True],
-    [201998, "Jerrells", "Curtis", "Curtis Jerrells", False],
-    [203511, "Jerrett", "Grant", "Grant Jerrett", False],
-    [200817, "Jeter", "Pooh", "Pooh Jeter", False],
-    [1630198, "Joe", "Isaiah", "Isaiah Joe", True],
-    [2639, "Johnsen", "Britton", "Britton Johnsen", False],
-    [1642358, "Johnson", "AJ", "AJ Johnson", True],
-    [200792, "Johnson", "Alexander", "Alexander Johnson", False],
-    [1628993, "Johnson", "Alize", "Alize Johnson", False],
-    [101161, "Johnson", "Amir", "Amir Johnson", False],
-    [77131, "Johnson", "Andy", "Andy Johnson", False],
-    [1533, "Johnson", "Anthony", "Anthony Johnson", False],
-    [202356, "Johnson", "Armon", "Armon Johnson", False],
-    [77132, "Johnson", "Arnie", "Arnie Johnson", False],
-    [422, "Johnson", "Avery", "Avery Johnson", False],
-    [1629168, "Johnson", "BJ", "BJ Johnson", False],
-    [1627744, "Johnson", "Brice", "Brice Johnson", False],
-    [77130, "Johnson", "Buck", "Buck Johnson", False],
-    [1629661, "Johnson", "Cameron", "Cameron Johnson", True],
-    [201291, "Johnson", "Carldell", "Carldell Johnson", False],
-    [77133, "Johnson", "Charlie", "Charlie Johnson", False],
-    [202419, "Johnson", "Chris", "Chris Johnson", False],
-    [203187, "Johnson", "Chris", "Chris Johnson", False],
-    [77135, "Johnson", "Clay", "Clay Johnson", False],
-    [77136, "Johnson", "Clemon", "Clemon Johnson", False],
-    [1626177, "Johnson", "Dakari", "Dakari Johnson", False],
-    [683, "Johnson", "Darryl", "Darryl Johnson", False],
-    [77138, "Johnson", "Dave", "Dave Johnson", False],
-    [77139, "Johnson", "David", "David Johnson", False],
-    [1630525, "Johnson", "David", "David Johnson", False],
-    [1746, "Johnson", "DeMarco", "DeMarco Johnson", False],
-    [77141, "Johnson", "Dennis", "Dennis Johnson", False],
-    [2035, "Johnson", "DerMarr", "DerMarr Johnson", False],
-    [698, "Johnson", "Eddie", "Eddie Johnson", False],
-    [77144, "Johnson", "Eddie", "Eddie Johnson", False],
-    [77145, "Johnson", "Eric", "Eric Johnson", False],
-    [911, "Johnson", "Ervin", "Ervin Johnson", False],
-    [77146, "Johnson", "Frank", "Frank Johnson", False],
-    [77147, "Johnson", "George", "George Johnson", False],
-    [77148, "Johnson", "George", "George Johnson", False],
-    [77149, "Johnson", "George", "George Johnson", False],
-    [77150, "Johnson", "Gus", "Gus Johnson", False],
-    [77151, "Johnson", "Harold", "Harold Johnson", False],
-    [201274, "Johnson", "Ivan", "Ivan Johnson", False],
-    [202707, "Johnson", "JaJuan", "JaJuan Johnson", False],
-    [1630552, "Johnson", "Jalen", "Jalen Johnson", True],
-    [201949, "Johnson", "James", "James Johnson", False],
-    [2207, "Johnson", "Joe", "Joe Johnson", False],
-    [77152, "Johnson", "John", "John Johnson", False],
-    [77153, "Johnson", "Kannard", "Kannard Johnson", False],
-    [1629640, "Johnson", "Keldon", "Keldon Johnson", True],
-    [2256, "Johnson", "Ken", "Ken Johnson", False],
-    [77154, "Johnson", "Ken", "Ken Johnson", False],
-    [1630553, "Johnson", "Keon", "Keon Johnson", False],
-    [1642352, "Johnson", "Keshad", "Keshad Johnson", True],
-    [134, "Johnson", "Kevin", "Kevin Johnson", False],
-    [1641749, "Johnson", "Keyontae", "Keyontae Johnson", False],
-    [913, "Johnson", "Larry", "Larry Johnson", False],
-    [77156, "Johnson", "Larry", "Larry Johnson", False],
-    [77158, "Johnson", "Lee", "Lee Johnson", False],
-    [2669, "Johnson", "Linton", "Linton Johnson", False],
-    [77159, "Johnson", "Lynbert", "Lynbert Johnson", False],
-    [77142, "Johnson", "Magic", "Magic Johnson", False],
-    [77160, "Johnson", "Marques", "Marques Johnson", False],
-    [77168, "Johnson", "Mickey", "Mickey Johnson", False],
-    [77161, "Johnson", "Neil", "Neil Johnson", False],
-    [203910, "Johnson", "Nick", "Nick Johnson", False],
-    [77162, "Johnson", "Ollie", "Ollie Johnson", False],
-    [204179, "Johnson", "Omari", "Omari Johnson", False],
-    [203111, "Johnson", "Orlando", "Orlando Johnson", False],
-    [77163, "Johnson", "Reggie", "Reggie Johnson", False],
-    [77164, "Johnson", "Rich", "Rich Johnson", False],
-    [77165, "Johnson", "Ron", "Ron Johnson", False],
-    [1626169, "Johnson", "Stanley", "Stanley Johnson", False],
-    [77166, "Johnson", "Steffond", "Steffond Johnson", False],
-    [77134, "Johnson", "Steve", "Steve Johnson", False],
-    [1642848, "Johnson", "Tre", "Tre Johnson", True],
-    [201234, "Johnson", "Trey", "Trey Johnson", False],
-    [204020, "Johnson", "Tyler", "Tyler Johnson", False],
-    [77167, "Johnson", "Vinnie", "Vinnie Johnson", False],
-    [202325, "Johnson", "Wesley", "Wesley Johnson", False],
-    [203130, "Johnson-Odom", "Darius", "Darius Johnson-Odom", False],
-    [77170, "Johnston", "Nate", "Nate Johnston", False],
-    [77169, "Johnston", "Neil", "Neil Johnston", False],
-    [77171, "Johnstone", "Jim", "Jim Johnstone", False],
-    [203999, "Jokić", "Nikola", "Nikola Jokić", True],
-    [77172, "Jolliff", "Howie", "Howie Jolliff", False],
-    [2264, "Jones", "Alvin", "Alvin Jones", False],
-    [77173, "Jones", "Anthony", "Anthony Jones", False],
-    [77174, "Jones", "Askia", "Askia Jones", False],
-    [77180, "Jones", "Bill", "Bill Jones", False],
-    [77193, "Jones", "Bobby", "Bobby Jones", False],
-    [200784, "Jones", "Bobby", "Bobby Jones", False],
-    [77175, "Jones", "Caldwell", "Caldwell Jones", False],
-    [1630637, "Jones", "Carlik", "Carlik Jones", False],
-    [279, "Jones", "Charles", "Charles Jones", False],
-    [77178, "Jones", "Charles", "Charles Jones", False],
-    [1869, "Jones", "Charles R.", "Charles R. Jones", False],
-    [1641732, "Jones", "Colby", "Colby Jones", True],
-    [1642938, "Jones", "Curtis", "Curtis Jones", True],
-    [2563, "Jones", "Dahntay", "Dahntay Jones", False],
-    [1627745, "Jones", "Damian", "Damian Jones", False],
-    [1800, "Jones", "Damon", "Damon Jones", False],
-    [203199, "Jones", "DeQuan", "DeQuan Jones", False],
-    [1641794, "Jones", "Dillon", "Dillon Jones", False],
-    [202346, "Jones", "Dominique", "Dominique Jones", False],
-    [963, "Jones", "Dontae'", "Dontae' Jones", False],
-    [101204, "Jones", "Dwayne", "Dwayne Jones", False],
-    [77182, "Jones", "Dwight", "Dwight Jones", False],
-    [77183, "Jones", "Earl", "Earl Jones", False],
-    [224, "Jones", "Eddie", "Eddie Jones", False],
-    [77184, "Jones", "Edgar", "Edgar Jones", False],
-    [2410, "Jones", "Fred", "Fred Jones", False],
-    [1630529, "Jones", "Herbert", "Herbert Jones", True],
-    [1642403, "Jones", "Isaac", "Isaac Jones", True],
-    [77185, "Jones", "Jake", "Jake Jones", False],
-    [1627883, "Jones", "Jalen", "Jalen Jones", False],
-    [2592, "Jones", "James", "James Jones", False],
-    [1629203, "Jones", "Jemerrio", "Jemerrio Jones", False],
-    [77186, "Jones", "Jimmy", "Jimmy Jones", False],
-    [77187, "Jones", "Johnny", "Johnny Jones", False],
-    [1908, "Jones", "Jumaine", "Jumaine Jones", False],
-    [77188, "Jones", "K.C.", "K.C. Jones", False],
-    [1630539, "Jones", "Kai", "Kai Jones", False],
-    [1642880, "Jones", "Kam", "Kam Jones", True],
-    [203158, "Jones", "Kevin", "Kevin Jones", False],
-    [77200, "Jones", "Larry", "Larry Jones", False],
-    [77189, "Jones", "Major", "Major Jones", False],
-    [2891, "Jones", "Mark", "Mark Jones", False],
-    [90000, "Jones", "Mark", "Mark Jones", False],
-    [1630222, "Jones", "Mason", "Mason Jones", False],
-    [77195, "Jones", "Nick", "Nick Jones", False],
-    [77191, "Jones", "Ozell", "Ozell Jones", False],
-    [461, "Jones", "Popeye", "Popeye Jones", False],
-    [77192, "Jones", "Rich", "Rich Jones", False],
-    [77194, "Jones", "Robin", "Robin Jones", False],
-    [77196, "Jones", "Sam", "Sam Jones", False],
-    [2652, "Jones", "Shelton", "Shelton Jones", False],
-    [200780, "Jones", "Solomon", "Solomon Jones", False],
-    [1642461, "Jones", "Spencer", "Spencer Jones", True],
-    [77197, "Jones", "Steve", "Steve Jones", False],
-    [203093, "Jones", "Terrence", "Terrence Jones", False],
-    [1630200, "Jones", "Tre", "Tre Jones", True],
-    [1626145, "Jones", "Tyus", "Tyus Jones", True],
-    [77198, "Jones", "Wali", "Wali Jones", False],
-    [77199, "Jones", "Wallace", "Wallace Jones", False],
-    [77201, "Jones", "Wil", "Wil Jones", False],
-    [77202, "Jones", "Willie", "Willie Jones", False],
-    [77203, "Jones", "Willie", "Willie Jones", False],
-    [1642357, "Jones Garcia", "David", "David Jones Garcia", True],
-    [203103, "Jones III", "Perry", "Perry Jones III", False],
-    [1627884, "Jones Jr.", "Derrick", "Derrick Jones Jr.", True],
-    [1817, "Jordan", "Adonis", "Adonis Jordan", False],
-    [201599, "Jordan", "DeAndre", "DeAndre Jordan", True],
-    [77205, "Jordan", "Eddie", "Eddie Jordan", False],
-    [202366, "Jordan", "Jerome", "Jerome Jordan", False],
-    [893, "Jordan", "Michael", "Michael Jordan", False],
-    [674, "Jordan", "Reggie", "Reggie Jordan", False],
-    [77208, "Jordan", "Thomas", "Thomas Jordan", False],
-    [77209, "Jordan", "Walter", "Walter Jordan", False],
-    [77210, "Jordon", "Phil", "Phil Jordon", False],
-    [77211, "Jorgensen", "Johnny", "Johnny Jorgensen", False],
-    [77212, "Jorgensen", "Noble", "Noble Jorgensen", False],
-    [77213, "Jorgensen", "Roger", "Roger Jorgensen", False],
-    [202709, "Joseph", "Cory", "Cory Joseph", False],
-    [2123, "Joseph", "Garth", "Garth Joseph", False],
-    [203126, "Joseph", "Kris", "Kris Joseph", False],
-    [77214, "Joseph", "Yvon", "Yvon Joseph", False],
-    [1631107, "Jović", "Nikola", "Nikola Jović", True],
-    [77215, "Judkins", "Jeff", "Jeff Judkins", False],
-    [1630548, "Juzang", "Johnny", "Johnny Juzang", True],
-    [1629662, "Kabengele", "Mfiondu", "Mfiondu Kabengele", False],
-    [77217, "Kachan", "Edwin", "Edwin Kachan", False],
-    [77218, "Kaftan", "George", "George Kaftan", False],
-    [77219, "Kalafat", "Ed", "Ed Kalafat", False],
-    [1630686, "Kalaitzakis", "Georgios", "Georgios Kalaitzakis", False],
-    [1641750, "Kalkbrenner", "Ryan", "Ryan Kalkbrenner", True],
-    [2549, "Kaman", "Chris", "Chris Kaman", False],
-    [1626163, "Kaminsky", "Frank", "Frank Kaminsky", False],
-    [77221, "Kaplowitz", "Ralph", "Ralph Kaplowitz", False],
-    [2574, "Kapono", "Jason", "Jason Kapono", False],
-    [77222, "Kappen", "Tony", "Tony Kappen", False],
-    [203508, "Karasev", "Sergey", "Sergey Karasev", False],
-    [201207, "Karl", "Coby", "Coby Karl", False],
-    [77223, "Karl", "George", "George Karl", False],
-    [77225, "Kasid", "Ed", "Ed Kasid", False],
-    [2435, "Kasun", "Mario", "Mario Kasun", False],
-    [77226, "Katkaveck", "Leo", "Leo Katkaveck", False],
-    [77227, "Kauffman", "Bob", "Bob Kauffman", False],
-    [201619, "Kaun", "Sasha", "Sasha Kaun", False],
-    [77228, "Kautz", "Wilbert", "Wilbert Kautz", False],
-    [1642530, "Kawamura", "Yuki", "Yuki Kawamura", False],
-    [77229, "Kea", "Clarence", "Clarence Kea", False],
-    [77230, "Kearns", "Michael", "Michael Kearns", False],
-    [77231, "Kearns", "Tommy", "Tommy Kearns", False],
-    [228, "Keefe", "Adam", "Adam Keefe", False],
-    [77233, "Keeling", "Harold", "Harold Keeling", False],
-    [1631211, "Keels", "Trevor", "Trevor Keels", False],
-    [77234, "Keller", "Ken", "Ken Keller", False],
-    [1630283, "Kelley", "Kylor", "Kylor Kelley", False],
-    [77235, "Kelley", "Rich", "Rich Kelley", False],
-    [77236, "Kellogg", "Clark", "Clark Kellogg", False],
-    [77237, "Kelly", "Gerard", "Gerard Kelly", False],
-    [1642939, "Kelly", "Miles", "Miles Kelly", True],
-    [203527, "Kelly", "Ryan", "Ryan Kelly", False],
-    [77238, "Kelly", "Tom", "Tom Kelly", False],
-    [77239, "Kelser", "Greg", "Greg Kelser", False],
-    [77240, "Kelso", "Ben", "Ben Kelso", False],
-    [431, "Kemp", "Shawn", "Shawn Kemp", False],
-    [1118, "Kempton", "Tim", "Tim Kempton", False],
-    [77242, "Kendrick", "Frank", "Frank Kendrick", False],
-    [1628379, "Kennard", "Luke", "Luke Kennard", True],
-    [202810, "Kennedy", "D.J.", "D.J. Kennedy", False],
-    [77243, "Kennedy", "Eugene", "Eugene Kennedy", False],
-    [77244, "Kennedy", "Joe", "Joe Kennedy", False],
-    [77245, "Kennedy", "William", "William Kennedy", False],
-    [77246, "Kenon", "Larry", "Larry Kenon", False],
-    [77247, "Kenville", "Bill", "Bill Kenville", False],
-    [1801, "Kerner", "Jonathan", "Jonathan Kerner", False],
-    [77248, "Kerr", "Johnny", "Johnny Kerr", False],
-    [70, "Kerr", "Steve", "Steve Kerr", False],
-    [77249, "Kerris", "Jack", "Jack Kerris", False],
-    [760, "Kersey", "Jerome", "Jerome Kersey", False],
-    [77251, "Kessler", "Alec", "Alec Kessler", False],
-    [1631117, "Kessler", "Walker", "Walker Kessler", True],
-    [1930, "Ketner", "Lari", "Lari Ketner", False],
-    [1630296, "Key", "Braxton", "Braxton Key", False],
-    [705, "Keys", "Randolph", "Randolph Keys", False],
-    [2751, "Khryapa", "Viktor", "Viktor Khryapa", False],
-    [467, "Kidd", "Jason", "Jason Kidd", False],
-    [1629742, "Kidd", "Stanton", "Stanton Kidd", False],
-    [77254, "Kidd", "Warren", "Warren Kidd", False],
-    [203077, "Kidd-Gilchrist", "Michael", "Michael Kidd-Gilchrist", False],
-    [77255, "Kiffin", "Irv", "Irv Kiffin", False],
-    [77256, "Kiley", "Jack", "Jack Kiley", False],
-    [77257, "Killum", "Ernie", "Ernie Killum", False],
-    [77258, "Kilpatrick", "Carl", "Carl Kilpatrick", False],
-    [203930, "Kilpatrick", "Sean", "Sean Kilpatrick", False],
-    [77259, "Kimball", "Toby", "Toby Kimball", False],
-    [77260, "Kimble", "Bo", "Bo Kimble", False],
-    [77261, "Kimbrough", "Stan", "Stan Kimbrough", False],
-    [77262, "Kinch", "Chad", "Chad Kinch", False],
-    [77263, "King", "Albert", "Albert King", False],
-    [77264, "King", "Bernard", "Bernard King", False],
-    [12, "King", "Chris", "Chris King", False],
-    [77266, "King", "Dan", "Dan King", False],
-    [701, "King", "Frankie", "Frankie King", False],
-    [77268, "King", "George", "George King", False],
-    [1628994, "King", "George", "George King", False],
-    [1562, "King", "Gerard", "Gerard King", False],
-    [77270, "King", "Jim", "Jim King", False],
-    [728, "King", "Jimmy", "Jimmy King", False],
-    [1629663, "King", "Louis", "Louis King", False],
-    [77272, "King", "Maury", "Maury King", False],
-    [77273, "King", "Reggie", "Reggie King", False],
-    [1101, "King", "Rich", "Rich King", False],
-    [351, "King", "Stacey", "Stacey King", False],
-    [77276, "King", "Tom", "Tom King", False],
-    [77277, "Kinney", "Bob", "Bob Kinney", False],
-    [200814, "Kinsey", "Tarence", "Tarence Kinsey", False],
-    [1905, "Kirilenko", "Andrei", "Andrei Kirilenko", False],
-    [203945, "Kirk", "Alex", "Alex Kirk", False],
-    [77278, "Kirk", "Walt", "Walt Kirk", False],
-    [1630557, "Kispert", "Corey", "Corey Kispert", True],
-    [77279, "Kistler", "Doug", "Doug Kistler", False],
-    [77280, "Kitchen", "Curtis", "Curtis Kitchen", False],
-    [1123, "Kite", "Greg", "Greg Kite", False],
-    [954, "Kittles", "Kerry", "Kerry Kittles", False],
-    [1628467, "Kleber", "Maxi", "Maxi Kleber", True],
-    [170, "Kleine", "Joe", "Joe Kleine", False],
-    [101132, "Kleiza", "Linas", "Linas Kleiza", False],
-    [77283, "Klier", "Leo", "Leo Klier", False],
-    [1641752, "Klintman", "Bobi", "Bobi Klintman", True],
-    [77284, "Klotz", "Herm", "Herm Klotz", False],
-    [77285, "Klueh", "Duane", "Duane Klueh", False],
-    [1642261, "Knecht", "Dalton", "Dalton Knecht", True],
-    [77290, "Knight", "Billy", "Billy Knight", False],
-    [77287, "Knight", "Bob", "Bob Knight", False],
-    [2688, "Knight", "Brandin", "Brandin Knight", False],
-    [202688, "Knight", "Brandon", "Brandon Knight", False],
-    [1510, "Knight", "Brevin", "Brevin Knight", False],
-    [1630233, "Knight", "Nathan", "Nathan Knight", False],
-    [1861, "Knight", "Negele", "Negele Knight", False],
-    [77288, "Knight", "Ron", "Ron Knight", False],
-    [77289, "Knight", "Toby", "Toby Knight", False],
-    [969, "Knight", "Travis", "Travis Knight", False],
-    [77291, "Knorek", "Lee", "Lee Knorek", False],
-    [77292, "Knostman", "Dick", "Dick Knostman", False],
-    [77293, "Knowles", "Rod", "Rod Knowles", False],
-    [1628995, "Knox II", "Kevin", "Kevin Knox II", False],
-    [1642851, "Knueppel", "Kon", "Kon Knueppel", True],
-    [77294, "Kofoed", "Bart", "Bart Kofoed", False],
-    [77295, "Kojis", "Don", "Don Kojis", False],
-    [1642278, "Kolek", "Tyler", "Tyler Kolek", True],
-    [1631132, "Koloko", "Christian", "Christian Koloko", True],
-    [77296, "Komenich", "Milo", "Milo Komenich", False],
-    [77297, "Komives", "Howard", "Howard Komives", False],
-    [402, "Koncak", "Jon", "Jon Koncak", False],
-    [1629723, "Konchar", "John", "John Konchar", True],
-    [77299, "Koper", "Bud", "Bud Koper", False],
-    [77300, "Kopicki", "Joe", "Joe Kopicki", False],
-    [1627788, "Korkmaz", "Furkan", "Furkan Korkmaz", False],
-    [77301, "Kornet", "Frank", "Frank Kornet", False],
-    [1628436, "Kornet", "Luke", "Luke Kornet", True],
-    [101117, "Korolev", "Yaroslav", "Yaroslav Korolev", False],
-    [2594, "Korver", "Kyle", "Kyle Korver", False],
-    [77302, "Kosmalski", "Len", "Len Kosmalski", False],
-    [77303, "Kostecka", "Andy", "Andy Kostecka", False],
-    [77304, "Kottman", "Harold", "Harold Kottman", False],
-    [201585, "Koufos", "Kosta", "Kosta Koufos", False],
-    [77305, "Kozelko", "Tom", "Tom Kozelko", False],
-    [77306, "Kramer", "Arvid", "Arvid Kramer", False],
-    [77307, "Kramer", "Barry", "Barry Kramer", False],
-    [77308, "Kramer", "Joel", "Joel Kramer", False],
-    [77309, "Kraus", "Dan", "Dan Kraus", False],
-    [77310, "Krautblatt", "Herb", "Herb Krautblatt", False],
-    [203139, "Kravtsov", "Viacheslav", "Viacheslav Kravtsov", False],
-    [77311, "Krebs", "Jim", "Jim Krebs", False],
-    [1630249, "Krejčí", "Vít", "Vít Krejčí", True],
-    [77312, "Kreklow", "Wayne", "Wayne Kreklow", False],
-    [77313, "Kron", "Tom", "Tom Kron", False],
-    [77314, "Kropp", "Tom", "Tom Kropp", False],
-    [2420, "Krstic", "Nenad", "Nenad Krstic", False],
-    [1474, "Krystkowiak", "Larry", "Larry Krystkowiak", False],
-    [77316, "Kuberski", "Steve", "Steve Kuberski", False],
-    [77317, "Kubiak", "Leo", "Leo Kubiak", False],
-    [77318, "Kuczenski", "Bruce", "Bruce Kuczenski", False],
-    [77319, "Kudelka", "Frank", "Frank Kudelka", False],
-    [77320, "Kuester", "John", "John Kuester", False],
-    [77322, "Kuka", "Ray", "Ray Kuka", False],
-    [389, "Kukoc", "Toni", "Toni Kukoc", False],
-    [1629083, "Kulboka", "Arnoldas", "Arnoldas Kulboka", False],
-    [1630228, "Kuminga", "Jonathan", "Jonathan Kuminga", True],
-    [77323, "Kunnert", "Kevin", "Kevin Kunnert", False],
-    [77324, "Kupchak", "Mitch", "Mitch Kupchak", False],
-    [77325, "Kupec", "Charles", "Charles Kupec", False],
-    [1629066, "Kurucs", "Rodions", "Rodions Kurucs", False],
-    [201633, "Kurz", "Rob", "Rob Kurz", False],
-    [2825, "Kutluay", "Ibrahim", "Ibrahim Kutluay", False],
-    [1628398, "Kuzma", "Kyle", "Kyle Kuzma", True],
-    [203136, "Kuzmic", "Ognjen", "Ognjen Kuzmic", False],
-    [1627851, "Kuzminskas", "Mindaugas", "Mindaugas Kuzminskas", False],
-    [77327, "LaCour", "Fred", "Fred LaCour", False],
-    [1711, "LaFrentz", "Raef", "Raef LaFrentz", False],
-    [77328, "LaGarde", "Tom", "Tom LaGarde", False],
-    [1631222, "LaRavia", "Jake", "Jake LaRavia", True],
-    [1601, "LaRue", "Rusty", "Rusty LaRue", False],
-    [77340, "LaRusso", "Rudy", "Rudy LaRusso", False],
-    [203897, "LaVine", "Zach", "Zach LaVine", True],
-    [1627746, "Labissiere", "Skal", "Skal Labissiere", False],
-    [77326, "Lacey", "Sam", "Sam Lacey", False],
-    [363, "Laettner", "Christian", "Christian Laettner", False],
-    [201802, "Lafayette", "Oliver", "Oliver Lafayette", False],
-    [100263, "Laimbeer", "Bill", "Bill Laimbeer", False],
-    [77329, "Lalich", "Pete", "Pete Lalich", False],
-    [77330, "Lamar", "Bo", "Bo Lamar", False],
-    [1630237, "Lamb", "Anthony", "Anthony Lamb", False],
-    [203117, "Lamb", "Doron", "Doron Lamb", False],
-    [203087, "Lamb", "Jeremy", "Jeremy Lamb", False],
-    [77331, "Lambert", "John", "John Lambert", False],
-    [77332, "Lamp", "Jeff", "Jeff Lamp", False],
-    [2573, "Lampe", "Maciej", "Maciej Lampe", False],
-    [77333, "Lampley", "Jim", "Jim Lampley", False],
-    [2253, "Lampley", "Sean", "Sean Lampley", False],
-    [1629111, "Landale", "Jock", "Jock Landale", True],
-    [201171, "Landry", "Carl", "Carl Landry", False],
-    [202068, "Landry", "Marcus", "Marcus Landry", False],
-    [77334, "Landsberger", "Mark", "Mark Landsberger", False],
-    [77335, "Lane", "Jerome", "Jerome Lane", False],
-    [457, "Lang", "Andrew", "Andrew Lang", False],
-    [226, "Lang", "Antonio", "Antonio Lang", False],
-    [2591, "Lang", "James", "James Lang", False],
-    [1892, "Langdon", "Trajan", "Trajan Langdon", False],
-    [101247, "Langford", "Keith", "Keith Langford", False],
-    [1629641, "Langford", "Romeo", "Romeo Langford", False],
-    [2061, "Langhi", "Dan", "Dan Langhi", False],
-    [600005, "Lanier", "Bob", "Bob Lanier", False],
-    [1642404, "Lanier", "Chaz", "Chaz Lanier", True],
-    [77338, "Lantz", "Stu", "Stu Lantz", False],
-    [1627879, "Laprovittola", "Nicolas", "Nicolas Laprovittola", False],
-    [77339, "Larese", "York", "York Larese", False],
-    [203499, "Larkin", "Shane", "Shane Larkin", False],
-    [1641796, "Larsson", "Pelle", "Pelle Larsson", True],
-    [77341, "Laskowski", "John", "John Laskowski", False],
-    [201186, "Lasme", "Stephane", "Stephane Lasme", False],
-    [77342, "Lattin", "Dave", "Dave Lattin", False],
-    [968, "Lauderdale", "Priest", "Priest Lauderdale", False],
-    [77344, "Laurel", "Rich", "Rich Laurel", False],
-    [77345, "Lautenbach", "Walt", "Walt Lautenbach", False],
-    [203530, "Lauvergne", "Joffrey", "Joffrey Lauvergne", False],
-    [77346, "Lavelli", "Tony", "Tony Lavelli", False],
-    [77347, "Lavoy", "Bob", "Bob Lavoy", False],
-    [201151, "Law", "Acie", "Acie Law", False],
-    [1629724, "Law", "Vic", "Vic Law", False],
-    [202371, "Lawal", "Gani", "Gani Lawal", False],
-    [77348, "Lawrence", "Ed", "Ed Lawrence", False],
-    [1630639, "Lawson", "A.J.", "A.J. Lawson", True],
-    [1535, "Lawson", "Jason", "Jason Lawson", False],
-    [201951, "Lawson", "Ty", "Ty Lawson", False],
-    [1627774, "Layman", "Jake", "Jake Layman", False],
-    [77350, "Layton", "Dennis", "Dennis Layton", False],
-    [1627747, "LeVert", "Caris", "Caris LeVert", True],
-    [1628388, "Leaf", "T.J.", "T.J. Leaf", False],
-    [77351, "Leaks", "Emanuel", "Emanuel Leaks", False],
-    [77352, "Lear", "Hal", "Hal Lear", False],
-    [77353, "Leavell", "Allen", "Allen Leavell", False],
-    [77354, "Lebo", "Jeff", "Jeff Lebo", False],
-    [287, "Leckner", "Eric", "Eric Leckner", False],
-    [1629665, "Lecque", "Jalen", "Jalen Lecque", False],
-    [203495, "Ledo", "Ricky", "Ricky Ledo", False],
-    [77356, "Lee", "Butch", "Butch Lee", False],
-    [77357, "Lee", "Clyde", "Clyde Lee", False],
-    [201584, "Lee", "Courtney", "Courtney Lee", False],
-    [1627814, "Lee", "Damion", "Damion Lee", False],
-    [101135, "Lee", "David", "David Lee", False],
-    [77358, "Lee", "Doug", "Doug Lee", False],
-    [77359, "Lee", "George", "George Lee", False],
-    [77360, "Lee", "Greg", "Greg Lee", False],
-    [77361, "Lee", "Keith", "Keith Lee", False],
-    [77362, "Lee", "Kurk", "Kurk Lee", False],
-    [202723, "Lee", "Malcolm", "Malcolm Lee", False],
-    [77363, "Lee", "Rock", "Rock Lee", False],
-    [77364, "Lee", "Ron", "Ron Lee", False],
-    [77365, "Lee", "Russell", "Russell Lee", False],
-    [1630240, "Lee", "Saben", "Saben Lee", False],
-    [77366, "Leede", "Ed", "Ed Leede", False],
-    [77367, "Lefkowitz", "Hank", "Hank Lefkowitz", False],
-    [100, "Legler", "Tim", "Tim Legler", False],
-    [77369, "Lehmann", "George", "George Lehmann", False],
-    [1627215, "Lemon Jr.", "Walt", "Walt Lemon Jr.", False],
-    [203458, "Len", "Alex", "Alex Len", False],
-    [702, "Lenard", "Voshon", "Voshon Lenard", False],
-    [77371, "Leonard", "Bob", "Bob Leonard", False],
-    [77370, "Leonard", "Gary", "Gary Leonard", False],
-    [202695, "Leonard", "Kawhi", "Kawhi Leonard", True],
-    [203086, "Leonard", "Meyers", "Meyers Leonard", False],
-    [1642502, "Leons", "Malevy", "Malevy Leons", False],
-    [77372, "Les", "Jim", "Jim Les", False],
-    [202727, "Leslie", "Travis", "Travis Leslie", False],
-    [77373, "Lester", "Ronnie", "Ronnie Lester", False],
-    [77374, "Lett", "Clifford", "Clifford Lett", False],
-    [202720, "Leuer", "Jon", "Jon Leuer", False],
-    [77375, "Levane", "Andrew", "Andrew Levane", False],
-    [77376, "Lever", "Lafayette", "Lafayette Lever", False],
-    [77377, "Levingston", "Cliff", "Cliff Levingston", False],
-    [77385, "Lewis", "Bobby", "Bobby Lewis", False],
-    [736, "Lewis", "Cedric", "Cedric Lewis", False],
-    [77379, "Lewis", "Fred", "Fred Lewis", False],
-    [77380, "Lewis", "Freddie", "Freddie Lewis", False],
-    [77381, "Lewis", "Grady", "Grady Lewis", False],
-    [1631171, "Lewis", "Justin", "Justin Lewis", False],
-    [729, "Lewis", "Martin", "Martin Lewis", False],
-    [1641721, "Lewis", "Maxwell", "Maxwell Lewis", False],
-    [1900, "Lewis", "Quincy", "Quincy Lewis", False],
-    [77383, "Lewis", "Ralph", "Ralph Lewis", False],
-    [1740, "Lewis", "Rashard", "Rashard Lewis", False],
-    [77384, "Lewis", "Reggie", "Reggie Lewis", False],
-    [1630575, "Lewis", "Scottie", "Scottie Lewis", False],
-    [1630184, "Lewis Jr.", "Kira", "Kira Lewis Jr.", False],
-    [77386, "Liberty", "Marcus", "Marcus Liberty", False],
-    [77387, "Lichti", "Todd", "Todd Lichti", False],
-    [1630604, "Liddell", "E.J.", "E.J. Liddell", True],
-    [202732, "Liggins", "DeAndre", "DeAndre Liggins", False],
-    [77388, "Ligon", "Bill", "Bill Ligon", False],
-    [203081, "Lillard", "Damian", "Damian Lillard", True],
-    [202391, "Lin", "Jeremy", "Jeremy Lin", False],
-    [77389, "Lingenfelter", "Steve", "Steve Lingenfelter", False],
-    [175, "Lister", "Alton", "Alton Lister", False],
-    [1629642, "Little", "Nassir", "Nassir Little", False],
-    [1641726, "Lively II", "Dereck", "Dereck Lively II", True],
-    [1630587, "Livers", "Isaiah", "Isaiah Livers", True],
-    [1641753, "Livingston", "Chris", "Chris Livingston", True],
-    [988, "Livingston", "Randy", "Randy Livingston", False],
-    [2733, "Livingston", "Shaun", "Shaun Livingston", False],
-    [77392, "Livingstone", "Ron", "Ron Livingstone", False],
-    [1024, "Llamas", "Horacio", "Horacio Llamas", False],
-    [77394, "Lloyd", "Earl", "Earl Lloyd", False],
-    [77395, "Lloyd", "Lewis", "Lewis Lloyd", False],
-    [77396, "Lloyd", "Scott", "Scott Lloyd", False],
-    [77397, "Lochmueller", "Bob", "Bob Lochmueller", False],
-    [77398, "Lock", "Robert", "Robert Lock", False],
-    [77399, "Lockhart", "Darrell", "Darrell Lockhart", False],
-    [1100, "Lockhart", "Ian", "Ian Lockhart", False],
-    [77401, "Loder", "Kevin", "Kevin Loder", False],
-    [77402, "Lofgran", "Don", "Don Lofgran", False],
-    [1629155, "Lofton", "Zach", "Zach Lofton", False],
-    [1631254, "Lofton Jr.", "Kenneth", "Kenneth Lofton Jr.", False],
-    [77403, "Logan", "Johnny", "Johnny Logan", False],
-    [38, "Lohaus", "Brad", "Brad Lohaus", False],
-    [1609, "Long", "Art", "Art Long", False],
-    [3, "Long", "Grant", "Grant Long", False],
-    [1381, "Long", "John", "John Long", False],
-    [77406, "Long", "Paul", "Paul Long", False],
-    [1627848, "Long", "Shawn", "Shawn Long", False],
-    [26, "Longley", "Luc", "Luc Longley", False],
-    [1626172, "Looney", "Kevon", "Kevon Looney", True],
-    [201572, "Lopez", "Brook", "Brook Lopez", True],
-    [1732, "Lopez", "Felipe", "Felipe Lopez", False],
-    [2221, "Lopez", "Raul", "Raul Lopez", False],
-    [201577, "Lopez", "Robin", "Robin Lopez", False],
-    [943, "Lorthridge", "Ryan", "Ryan Lorthridge", False],
-    [77409, "Loscutoff", "Jim", "Jim Loscutoff", False],
-    [77410, "Lott", "Plummer", "Plummer Lott", False],
-    [77411, "Loughery", "Kevin", "Kevin Loughery", False],
-    [1629712, "Louzada", "Didi", "Didi Louzada", False],
-    [77412, "Love", "Bob", "Bob Love", False],
-    [1631126, "Love", "Caleb", "Caleb Love", True],
-    [201567, "Love", "Kevin", "Kevin Love", True],
-    [77413, "Love", "Stan", "Stan Love", False],
-    [77414, "Lovellette", "Clyde", "Clyde Lovellette", False],
-    [77415, "Lowe", "Sidney", "Sidney Lowe", False],
-    [77416, "Lowery", "Chuck", "Chuck Lowery", False],
-    [200768, "Lowry", "Kyle", "Kyle Lowry", True],
-    [1628070, "Loyd", "Jordan", "Jordan Loyd", False],
-    [77417, "Lucas", "Al", "Al Lucas", False],
-    [77418, "Lucas", "Jerry", "Jerry Lucas", False],
-    [77419, "Lucas", "John", "John Lucas", False],
-    [203564, "Lucas", "Kalin", "Kalin Lucas", False],
-    [77420, "Lucas", "Maurice", "Maurice Lucas", False],
-    [101249, "Lucas III", "John", "John Lucas III", False],
-    [77421, "Luckenbill", "Ted", "Ted Luckenbill", False],
-    [1731, "Lue", "Tyronn", "Tyronn Lue", False],
-    [77422, "Luisi", "Jim", "Jim Luisi", False],
-    [77423, "Lujack", "Al", "Al Lujack", False],
-    [77424, "Lumpkin", "Phil", "Phil Lumpkin", False],
-    [77425, "Lumpp", "Ray", "Ray Lumpp", False],
-    [1630994, "Lundberg", "Gabriel", "Gabriel Lundberg", False],
-    [1641754, "Lundy", "Seth", "Seth Lundy", False],
-    [1627789, "Luwawu-Cabarrot", "Timothe", "Timothe Luwawu-Cabarrot", False],
-    [1628399, "Lydon", "Tyler", "Tyler Lydon", False],
-    [1626168, "Lyles", "Trey", "Trey Lyles", False],
-    [248, "Lynch", "George", "George Lynch", False],
-    [77426, "Lynch", "Kevin", "Kevin Lynch", False],
-    [77427, "Lynn", "Mike", "Mike Lynn", False],
-    [1627815, "Mac", "Sheldon", "Sheldon Mac", False],
-    [1928, "MacCulloch", "Todd", "Todd MacCulloch", False],
-    [77430, "MacGilvray", "Ronnie", "Ronnie MacGilvray", False],
-    [931, "MacLean", "Don", "Don MacLean", False],
-    [77428, "Macaluso", "Mike", "Mike Macaluso", False],
-    [77429, "Macauley", "Ed", "Ed Macauley", False],
-    [203159, "Machado", "Scott", "Scott Machado", False],
-    [101178, "Macijauskas", "Arvydas", "Arvydas Macijauskas", False],
-    [77432, "Mack", "Ollie", "Ollie Mack", False],
-    [694, "Mack", "Sam", "Sam Mack", False],
-    [202714, "Mack", "Shelvin", "Shelvin Mack", False],
-    [1635, "Mackey", "Malcolm", "Malcolm Mackey", False],
-    [77435, "Macklin", "Rudy", "Rudy Macklin", False],
-    [202731, "Macklin", "Vernon", "Vernon Macklin", False],
-    [77436, "Macknowski", "Johnny", "Johnny Macknowski", False],
-    [1629133, "Macon", "Daryl", "Daryl Macon", False],
-    [1855, "Macon", "Mark", "Mark Macon", False],
-    [1629122, "Macura", "J.P.", "J.P. Macura", False],
-    [77438, "Macy", "Kyle", "Kyle Macy", False],
-    [77439, "Maddox", "Jack", "Jack Maddox", False],
-    [2432, "Maddox", "Tito", "Tito Maddox", False],
-    [1666, "Madkins", "Gerald", "Gerald Madkins", False],
-    [2058, "Madsen", "Mark", "Mark Madsen", False],
-    [77441, "Mager", "Norm", "Norm Mager", False],
-    [203705, "Magette", "Josh", "Josh Magette", False],
-    [1894, "Maggette", "Corey", "Corey Maggette", False],
-    [77442, "Magley", "Dave", "Dave Magley", False],
-    [2048, "Magloire", "Jamaal", "Jamaal Magloire", False],
-    [1630266, "Magnay", "Will", "Will Magnay", False],
-    [101133, "Mahinmi", "Ian", "Ian Mahinmi", False],
-    [77443, "Mahnken", "John", "John Mahnken", False],
-    [77444, "Mahoney", "Francis", "Francis Mahoney", False],
-    [328, "Mahorn", "Rick", "Rick Mahorn", False],
-    [105, "Majerle", "Dan", "Dan Majerle", False],
-    [200970, "Major", "Renaldo", "Renaldo Major", False],
-    [1627748, "Maker", "Thon", "Thon Maker", False],
-    [77447, "Malamed", "Lionel", "Lionel Malamed", False],
-    [1630177, "Maledon", "Theo", "Theo Maledon", False],
-    [117, "Malone", "Jeff", "Jeff Malone", False],
-    [252, "Malone", "Karl", "Karl Malone", False],
-    [77449, "Malone", "Moses", "Moses Malone", False],
-    [1074, "Maloney", "Matt", "Matt Maloney", False],
-    [77450, "Malovic", "Steve", "Steve Malovic", False],
-    [1642863, "Maluach", "Khaman", "Khaman Maluach", True],
-    [1630572, "Mamukelashvili", "Sandro", "Sandro Mamukelashvili", True],
-    [77451, "Manakas", "Ted", "Ted Manakas", False],
-    [77452, "Mandic", "John", "John Mandic", False],
-    [1630211, "Mane", "Karim", "Karim Mane", False],
-    [77453, "Mangiapane", "Frank", "Frank Mangiapane", False],
-    [986, "Mann", "Marcus", "Marcus Mann", False],
-    [1629611, "Mann", "Terance", "Terance Mann", True],
-    [1630544, "Mann", "Tre", "Tre Mann", True],
-    [330, "Manning", "Danny", "Danny Manning", False],
-    [77454, "Manning", "Ed", "Ed Manning", False],
-    [316, "Manning", "Richard", "Richard Manning", False],
-    [1630185, "Mannion", "Nico", "Nico Mannion", False],
-    [77456, "Mannion", "Pace", "Pace Mannion", False],
-    [77457, "Mantis", "Nick", "Nick Mantis", False],
-    [77459, "Maravich", "Pete", "Pete Maravich", False],
-    [77458, "Maravich", "Peter", "Peter Maravich", False],
-    [203906, "Marble", "Devyn", "Devyn Marble", False],
-    [77460, "Marble", "Roy", "Roy Marble", False],
-    [950, "Marbury", "Stephon", "Stephon Marbury", False],
-    [36, "Marciulionis", "Sarunas", "Sarunas Marciulionis", False],
-    [77462, "Mariaschin", "Saul", "Saul Mariaschin", False],
-    [77463, "Marin", "Jack", "Jack Marin", False],
-    [1890, "Marion", "Shawn", "Shawn Marion", False],
-    [1626246, "Marjanovic", "Boban", "Boban Marjanovic", False],
-    [1628374, "Markkanen", "Lauri", "Lauri Markkanen", True],
-    [200806, "Markota", "Damir", "Damir Markota", False],
-    [1752, "Marks", "Sean", "Sean Marks", False],
-    [77464, "Marlatt", "Harvey", "Harvey Marlatt", False],
-    [77465, "Marsh", "Eric", "Eric Marsh", False],
-    [77466, "Marsh", "Jim", "Jim Marsh", False],
-    [681, "Marshall", "Donny", "Donny Marshall", False],
-    [923, "Marshall", "Donyell", "Donyell Marshall", False],
-    [203088, "Marshall", "Kendall", "Kendall Marshall", False],
-    [1630230, "Marshall", "Naji", "Naji Marshall", True],
-    [101185, "Marshall", "Rawle", "Rawle Marshall", False],
-    [77467, "Marshall", "Tom", "Tom Marshall", False],
-    [77468, "Marshall", "Vester", "Vester Marshall", False],
-    [1642918, "Martin", "Alijah", "Alijah Martin", True],
-    [77481, "Martin", "Bill", "Bill Martin", False],
-    [77478, "Martin", "Bob", "Bob Martin", False],
-    [77469, "Martin", "Brian", "Brian Martin", False],
-    [1628997, "Martin", "Caleb", "Caleb Martin", True],
-    [201858, "Martin", "Cartier", "Cartier Martin", False],
-    [1628998, "Martin", "Cody", "Cody Martin", True],
-    [733, "Martin", "Cuonzo", "Cuonzo Martin", False],
-    [239, "Martin", "Darrick", "Darrick Martin", False],
-    [77473, "Martin", "Don", "Don Martin", False],
-    [77471, "Martin", "Donald", "Donald Martin", False],
-    [77472, "Martin", "Fernando", "Fernando Martin", False],
-    [1626185, "Martin", "Jarell", "Jarell Martin", False],
-    [1641798, "Martin", "Jaylen", "Jaylen Martin", False],
-    [77474, "Martin", "Jeff", "Jeff Martin", False],
-    [1629725, "Martin", "Jeremiah", "Jeremiah Martin", False],
-    [1630231, "Martin", "KJ", "KJ Martin", False],
-    [1629103, "Martin", "Kelan", "Kelan Martin", False],
-    [2030, "Martin", "Kenyon", "Kenyon Martin", False],
-    [2755, "Martin", "Kevin", "Kevin Martin", False],
-    [77475, "Martin", "Larue", "Larue Martin", False],
-    [77476, "Martin", "Mo", "Mo Martin", False],
-    [77477, "Martin", "Phil", "Phil Martin", False],
-    [77479, "Martin", "Ronald", "Ronald Martin", False],
-    [77480, "Martin", "Slater", "Slater Martin", False],
-    [1631213, "Martin", "Tyrese", "Tyrese Martin", True],
-    [469, "Mashburn", "Jamal", "Jamal Mashburn", False],
-    [77482, "Masino", "Al", "Al Masino", False],
-    [193, "Mason", "Anthony", "Anthony Mason", False],
-    [2046, "Mason", "Desmond", "Desmond Mason", False],
-    [1628412, "Mason III", "Frank", "Frank Mason III", False],
-    [2427, "Mason Jr.", "Roger", "Roger Mason Jr.", False],
-    [763, "Massenburg", "Tony", "Tony Massenburg", False],
-    [77483, "Mast", "Eddie", "Eddie Mast", False],
-    [1628999, "Maten", "Yante", "Yante Maten", False],
-    [1629726, "Mathews", "Garrison", "Garrison Mathews", False],
-    [1628493, "Mathiang", "Mangok", "Mangok Mathiang", False],
-    [1629751, "Mathias", "Dakota", "Dakota Mathias", False],
-    [1631097, "Mathurin", "Bennedict", "Bennedict Mathurin", True],
-    [1631255, "Matković", "Karlo", "Karlo Matković", True],
-    [77484, "Matthews", "Wes", "Wes Matthews", False],
-    [202083, "Matthews", "Wesley", "Wesley Matthews", False],
-    [77485, "Maughan", "Ariel", "Ariel Maughan", False],
-    [77486, "Maxey", "Marlon", "Marlon Maxey", False],
-    [1630178, "Maxey", "Tyrese", "Tyrese Maxey", True],
-    [101131, "Maxiell", "Jason", "Jason Maxiell", False],
-    [77487, "Maxwell", "Cedric", "Cedric Maxwell", False],
-    [137, "Maxwell", "Vernon", "Vernon Maxwell", False],
-    [77489, "May", "Don", "Don May", False],
-    [77490, "May", "Scott", "Scott May", False],
-    [101118, "May", "Sean", "Sean May", False],
-    [195, "Mayberry", "Lee", "Lee Mayberry", False],
-    [77492, "Mayes", "Clyde", "Clyde Mayes", False],
-    [77493, "Mayes", "Tharon", "Tharon Mayes", False],
-    [77495, "Mayfield", "Bill", "Bill Mayfield", False],
-    [77494, "Mayfield", "Ken", "Ken Mayfield", False],
-    [201953, "Maynor", "Eric", "Eric Maynor", False],
-    [201564, "Mayo", "O.J.", "O.J. Mayo", False],
-    [1630219, "Mays", "Skylar", "Skylar Mays", False],
-    [77496, "Mays", "Travis", "Travis Mays", False],
-    [77497, "Mazza", "Matt", "Matt Mazza", False],
-    [1643024, "Mañon", "Chris", "Chris Mañon", True],
-    [201601, "Mbah a Moute", "Luc", "Luc Mbah a Moute", False],
-    [2788, "Mbenga", "DJ", "DJ Mbenga", False],
-    [77498, "McAdoo", "Bob", "Bob McAdoo", False],
-    [203949, "McAdoo", "James Michael", "James Michael McAdoo", False],
-    [77499, "McBride", "Ken", "Ken McBride", False],
-    [1630540, "McBride", "Miles", "Miles McBride", True],
-    [1642272, "McCain", "Jared", "Jared McCain", True],
-    [1628769, "McCall", "Tahjere", "Tahjere McCall", False],
-    [203492, "McCallum", "Ray", "Ray McCallum", False],
-    [737, "McCann", "Bob", "Bob McCann", False],
-    [77500, "McCann", "Brendan", "Brendan McCann", False],
-    [77502, "McCants", "Mel", "Mel McCants", False],
-    [101119, "McCants", "Rashad", "Rashad McCants", False],
-    [77503, "McCarron", "Mike", "Mike McCarron", False],
-    [77504, "McCarter", "Andre", "Andre McCarter", False],
-    [77505, "McCarter", "Willie", "Willie McCarter", False],
-    [77506, "McCarthy", "Johnny", "Johnny McCarthy", False],
-    [77507, "McCarty", "Howie", "Howie McCarty", False],
-    [1820, "McCarty", "Kelly", "Kelly McCarty", False],
-    [962, "McCarty", "Walter", "Walter McCarty", False],
-    [1043, "McCaskill", "Amal", "Amal McCaskill", False],
-    [1627775, "McCaw", "Patrick", "Patrick McCaw", False],
-    [77509, "McClain", "Dwayne", "Dwayne McClain", False],
-    [77510, "McClain", "Ted 'Hound Dog'", "Ted 'Hound Dog' McClain", False],
-    [2082, "McClintock", "Dan", "Dan McClintock", False],
-    [77512, "McCloskey", "Jack", "Jack McCloskey", False],
-    [45, "McCloud", "George", "George McCloud", False],
-    [1630644, "McClung", "Mac", "Mac McClung", True],
-    [203468, "McCollum", "CJ", "CJ McCollum", True],
-    [77513, "McConathy", "John", "John McConathy", False],
-    [77514, "McConnell", "Paul", "Paul McConnell", False],
-    [204456, "McConnell", "T.J.", "T.J. McConnell", True],
-    [77515, "McCord", "Keith", "Keith McCord", False],
-    [77516, "McCormick", "Tim", "Tim McCormick", False],
-    [1741, "McCoy", "Jelani", "Jelani McCoy", False],
-    [77517, "McCracken", "Paul", "Paul McCracken", False],
-    [200840, "McCray", "Chris", "Chris McCray", False],
-    [1622, "McCray", "Rodney", "Rodney McCray", False],
-    [77518, "McCray", "Scooter", "Scooter McCray", False],
-    [1628571, "McCree", "Erik", "Erik McCree", False],
-    [1641755, "McCullar Jr.", "Kevin", "Kevin McCullar Jr.", True],
-    [1626191, "McCullough", "Chris", "Chris McCullough", False],
-    [77520, "McCullough", "John", "John McCullough", False],
-    [723, "McDaniel", "Clint", "Clint McDaniel", False],
-    [1365, "McDaniel", "Xavier", "Xavier McDaniel", False],
-    [1630183, "McDaniels", "Jaden", "Jaden McDaniels", True],
-    [1629667, "McDaniels", "Jalen", "Jalen McDaniels", False],
-    [77523, "McDaniels", "Jim", "Jim McDaniels", False],
-    [203909, "McDaniels", "KJ", "KJ McDaniels", False],
-    [203926, "McDermott", "Doug", "Doug McDermott", True],
-    [1630253, "McDermott", "Sean", "Sean McDermott", False],
-    [77524, "McDonald", "Ben", "Ben McDonald", False],
-    [77525, "McDonald", "Glenn", "Glenn McDonald", False],
-    [1075, "McDonald", "Michael", "Michael McDonald", False],
-    [77527, "McDowell", "Hank", "Hank McDowell", False],
-    [686, "McDyess", "Antonio", "Antonio McDyess", False],
-    [77528, "McElroy", "Jim", "Jim McElroy", False],
-    [200829, "McFarlin", "Ivan", "Ivan McFarlin", False],
-    [77529, "McGaha", "Mel", "Mel McGaha", False],
-    [203956, "McGary", "Mitch", "Mitch McGary", False],
-    [201580, "McGee", "JaVale", "JaVale McGee", False],
-    [77530, "McGee", "Mike", "Mike McGee", False],
-    [77531, "McGill", "Bill", "Bill McGill", False],
-    [77532, "McGinnis", "George", "George McGinnis", False],
-    [77533, "McGlocklin", "Jon", "Jon McGlocklin", False],
-    [1631121, "McGowens", "Bryce", "Bryce McGowens", True],
-    [1503, "McGrady", "Tracy", "Tracy McGrady", False],
-    [77534, "McGregor", "Gil", "Gil McGregor", False],
-    [1630787, "McGriff", "Cameron", "Cameron McGriff", False],
-    [203585, "McGruder", "Rodney", "Rodney McGruder", False],
-    [77536, "McGuire", "Al", "Al McGuire", False],
-    [77535, "McGuire", "Allie", "Allie McGuire", False],
-    [77537, "McGuire", "Dick", "Dick McGuire", False],
-    [201187, "McGuire", "Dominic", "Dominic McGuire", False],
-    [1450, "McHale", "Kevin", "Kevin McHale", False],
-    [29, "McIlvaine", "Jim", "Jim McIlvaine", False],
-    [976, "McInnis", "Jeff", "Jeff McInnis", False],
-    [77540, "McIntosh", "Kenny", "Kenny McIntosh", False],
-    [77541, "McKenna", "Kevin", "Kevin McKenna", False],
-    [77542, "McKenzie", "Forrest", "Forrest McKenzie", False],
-    [77543, "McKenzie", "Stan", "Stan McKenzie", False],
-    [365, "McKey", "Derrick", "Derrick McKey", False],
-    [243, "McKie", "Aaron", "Aaron McKie", False],
-    [77547, "McKinney", "Billy", "Billy McKinney", False],
-    [77545, "McKinney", "Carlton", "Carlton McKinney", False],
-    [77546, "McKinney", "Horace", "Horace McKinney", False],
-    [203590, "McKinney-Jones", "Trey", "Trey McKinney-Jones", False],
-    [1628035, "McKinnie", "Alfonzo", "Alfonzo McKinnie", False],
-    [1630605, "McLaughlin", "JaQuori", "JaQuori McLaughlin", False],
-    [1629162, "McLaughlin", "Jordan", "Jordan McLaughlin", True],
-    [203463, "McLemore", "Ben", "Ben McLemore", False],
-    [77548, "McLemore", "Mccoy", "Mccoy McLemore", False],
-    [77549, "McLeod", "George", "George McLeod", False],
-    [2693, "McLeod", "Keith", "Keith McLeod", False],
-    [1728, "McLeod", "Roshown", "Roshown McLeod", False],
-    [77551, "McMahon", "Jack", "Jack McMahon", False],
-    [203, "McMillan", "Nate", "Nate McMillan", False],
-    [77553, "McMillen", "Tom", "Tom McMillen", False],
-    [77554, "McMillian", "Jim", "Jim McMillian", False],
-    [77555, "McMillon", "Shellie", "Shellie McMillon", False],
-    [77556, "McMullan", "Mal", "Mal McMullan", False],
-    [77557, "McNabb", "Chet", "Chet McNabb", False],
-    [77558, "McNamara", "Mark", "Mark McNamara", False],
-    [77559, "McNamee", "Joe", "Joe McNamee", False],
-    [202077, "McNeal", "Jerel", "Jerel McNeal", False],
-    [77560, "McNealy", "Chris", "Chris McNealy", False],
-    [1642862, "McNeeley", "Liam", "Liam McNeeley", True],
-    [77562, "McNeill", "Bob", "Bob McNeill", False],
-    [77561, "McNeill", "Larry", "Larry McNeill", False],
-    [77563, "McNulty", "Carl", "Carl McNulty", False],
-    [2101, "McPherson", "Paul", "Paul McPherson", False],
-    [77565, "McQueen", "Cozell", "Cozell McQueen", False],
-    [203895, "McRae", "Jordan", "Jordan McRae", False],
-    [77566, "McReynolds", "Thales", "Thales McReynolds", False],
-    [201177, "McRoberts", "Josh", "Josh McRoberts", False],
-    [1629098, "McVeigh", "Jack", "Jack McVeigh", False],
-    [77567, "McWilliams", "Eric", "Eric McWilliams", False],
-    [77568, "Mearns", "George", "George Mearns", False],
-    [2098, "Medvedenko", "Slava", "Slava Medvedenko", False],
-    [1577, "Mee", "Darnell", "Darnell Mee", False],
-    [201975, "Meeks", "Jodie", "Jodie Meeks", False],
-    [77570, "Meely", "Cliff", "Cliff Meely", False],
-    [77571, "Meents", "Scott", "Scott Meents", False],
-    [77572, "Mehen", "Dick", "Dick Mehen", False],
-    [77573, "Meineke", "Don", "Don Meineke", False],
-    [77574, "Meinhold", "Carl", "Carl Meinhold", False],
-    [1626257, "Mejri", "Salah", "Salah Mejri", False],
-    [203539, "Mekel", "Gal", "Gal Mekel", False],
-    [77576, "Melchionni", "Bill", "Bill Melchionni", False],
-    [77575, "Melchionni", "Gary", "Gary Melchionni", False],
-    [1629740, "Melli", "Nicolo", "Nicolo Melli", False],
-    [203097, "Melo", "Fab", "Fab Melo", False],
-    [1629001, "Melton", "De'Anthony", "De'Anthony Melton", True],
-    [77577, "Melvin", "Ed", "Ed Melvin", False],
-    [77578, "Meminger", "Dean", "Dean Meminger", False],
-    [77579, "Mencel", "Chuck", "Chuck Mencel", False],
-    [77580, "Mengelt", "John", "John Mengelt", False],
-    [77581, "Menke", "Ken", "Ken Menke", False],
-    [1641877, "Mensah", "Nathan", "Nathan Mensah", False],
-    [200822, "Mensah-Bonsu", "Pops", "Pops Mensah-Bonsu", False],
-    [1500, "Mercer", "Ron", "Ron Mercer", False],
-    [77582, "Meriweather", "Joe", "Joe Meriweather", False],
-    [77583, "Meriwether", "Porter", "Porter Meriwether", False],
-    [1630241, "Merrill", "Sam", "Sam Merrill", True],
-    [77584, "Meschery", "Tom", "Tom Meschery", False],
-    [1629002, "Metu", "Chimezie", "Chimezie Metu", False],
-    [684, "Meyer", "Loren", "Loren Meyer", False],
-    [77586, "Meyers", "Dave", "Dave Meyers", False],
-    [77587, "Miasek", "Stan", "Stan Miasek", False],
-    [77588, "Micheaux", "Larry", "Larry Micheaux", False],
-    [203995, "Micic", "Vasilije", "Vasilije Micic", False],
-    [1626175, "Mickey", "Jordan", "Jordan Mickey", False],
-    [203114, "Middleton", "Khris", "Khris Middleton", True],
-    [77589, "Mihalik", "Zigmund", "Zigmund Mihalik", False],
-    [2036, "Mihm", "Chris", "Chris Mihm", False],
-    [1628450, "Mika", "Eric", "Eric Mika", False],
-    [77590, "Mikan", "Ed", "Ed Mikan", False],
-    [600012, "Mikan", "George", "George Mikan", False],
-    [77591, "Mikan", "Larry", "Larry Mikan", False],
-    [77593, "Mikkelsen", "Vern", "Vern Mikkelsen", False],
-    [77594, "Miksis", "Al", "Al Miksis", False],
-    [101223, "Miles", "Aaron", "Aaron Miles", False],
-    [101139, "Miles", "CJ", "CJ Miles", False],
-    [2032, "Miles", "Darius", "Darius Miles", False],
-    [77596, "Miles", "Eddie", "Eddie Miles", False],
-    [1527, "Milic", "Marko", "Marko Milic", False],
-    [2545, "Milicic", "Darko", "Darko Milicic", False],
-    [77598, "Militzok", "Nat", "Nat Militzok", False],
-    [1889, "Miller", "Andre", "Andre Miller", False],
-    [292, "Miller", "Anthony", "Anthony Miller", False],
-    [77605, "Miller", "Bill", "Bill Miller", False],
-    [77603, "Miller", "Bob", "Bob Miller", False],
-    [1802, "Miller", "Brad", "Brad Miller", False],
-    [1641706, "Miller", "Brandon", "Brandon Miller", True],
-    [203121, "Miller", "Darius", "Darius Miller", False],
-    [77602, "Miller", "Dick", "Dick Miller", False],
-    [77599, "Miller", "Eddie", "Eddie Miller", False],
-    [1641801, "Miller", "Emanuel", "Emanuel Miller", True],
-    [77600, "Miller", "Harry", "Harry Miller", False],
-    [77601, "Miller", "Jay", "Jay Miller", False],
-    [1641757, "Miller", "Jordan", "Jordan Miller", True],
-    [1631159, "Miller", "Leonard", "Leonard Miller", True],
-    [1626259, "Miller", "Malcolm", "Malcolm Miller", False],
-    [2034, "Miller", "Mike", "Mike Miller", False],
-    [932, "Miller", "Oliver", "Oliver Miller", False],
-    [203113, "Miller", "Quincy", "Quincy Miller", False],
-    [397, "Miller", "Reggie", "Reggie Miller", False],
-    [77604, "Miller", "Walt", "Walt Miller", False],
-    [168, "Mills", "Chris", "Chris Mills", False],
-    [77606, "Mills", "John", "John Mills", False],
-    [201988, "Mills", "Patty", "Patty Mills", False],
-    [371, "Mills", "Terry", "Terry Mills", False],
-    [202407, "Millsap", "Elijah", "Elijah Millsap", False],
-    [200794, "Millsap", "Paul", "Paul Millsap", False],
-    [1629003, "Milton", "Shake", "Shake Milton", False],
-    [1631303, "Minaya", "Justin", "Justin Minaya", False],
-    [114, "Miner", "Harold", "Harold Miner", False],
-    [1642434, "Minix", "Riley", "Riley Minix", True],
-    [77609, "Minniefield", "Dirk", "Dirk Minniefield", False],
-    [77610, "Minor", "Dave", "Dave Minor", False],
-    [65, "Minor", "Greg", "Greg Minor", False],
-    [77612, "Minor", "Mark", "Mark Minor", False],
-    [1631169, "Minott", "Josh", "Josh Minott", True],
-    [202703, "Mirotic", "Nikola", "Nikola Mirotic", False],
-    [77613, "Misaka", "Wat", "Wat Misaka", False],
-    [1954, "Miskiri", "Jason", "Jason Miskiri", False],
-    [1642274, "Missi", "Yves", "Yves Missi", True],
-    [1642349, "Mitchell", "Ajay", "Ajay Mitchell", True],
-    [1630558, "Mitchell", "Davion", "Davion Mitchell", True],
-    [1628378, "Mitchell", "Donovan", "Donovan Mitchell", True],
-    [77615, "Mitchell", "Mike", "Mike Mitchell", False],
-    [77616, "Mitchell", "Murray", "Murray Mitchell", False],
-    [417, "Mitchell", "Sam", "Sam Mitchell", False],
-    [77614, "Mitchell", "Todd", "Todd Mitchell", False],
-    [203183, "Mitchell", "Tony", "Tony Mitchell", False],
-    [203502, "Mitchell", "Tony", "Tony Mitchell", False],
-    [1628513, "Mitrou-Long", "Naz", "Naz Mitrou-Long", False],
-    [77618, "Mix", "Steve", "Steve Mix", False],
-    [77619, "Mlkvy", "Bill", "Bill Mlkvy", False],
-    [1749, "Mobley", "Cuttino", "Cuttino Mobley", False],
-    [211, "Mobley", "Eric", "Eric Mobley", False],
-    [1630596, "Mobley", "Evan", "Evan Mobley", True],
-    [1630600, "Mobley", "Isaiah", "Isaiah Mobley", False],
-    [77621, "Moffett", "Larry", "Larry Moffett", False],
-    [1642367, "Mogbo", "Jonathan", "Jonathan Mogbo", True],
-    [77622, "Mogus", "Leo", "Leo Mogus", False],
-    [1737, "Mohammed", "Nazr", "Nazr Mohammed", False],
-    [2040, "Moiso", "Jerome", "Jerome Moiso", False],
-    [77623, "Mokeski", "Paul", "Paul Mokeski", False],
-    [1629690, "Mokoka", "Adam", "Adam Mokoka", False],
-    [77624, "Molinas", "Jack", "Jack Molinas", False],
-    [77625, "Molis", "Wayne", "Wayne Molis", False],
-    [77626, "Moncrief", "Sidney", "Sidney Moncrief", False],
-    [1631320, "Moneke", "Chima", "Chima Moneke", False],
-    [77627, "Money", "Eric", "Eric Money", False],
-    [2752, "Monia", "Sergei", "Sergei Monia", False],
-    [1628370, "Monk", "Malik", "Malik Monk", True],
-    [600006, "Monroe", "Earl", "Earl Monroe", False],
-    [202328, "Monroe", "Greg", "Greg Monroe", False],
-    [77628, "Monroe", "Rodney", "Rodney Monroe", False],
-    [1626242, "Montero", "Luis", "Luis Montero", False],
-    [77630, "Montgomery", "Howie", "Howie Montgomery", False],
-    [376, "Montross", "Eric", "Eric Montross", False],
-    [1630541, "Moody", "Moses", "Moses Moody", True],
-    [200081, "Moon", "Jamario", "Jamario Moon", False],
-    [1629875, "Moon", "Xavier", "Xavier Moon", False],
-    [77631, "Mooney", "Jim", "Jim Mooney", False],
-    [1629760, "Mooney", "Matt", "Matt Mooney", False],
-    [77632, "Moore", "Andre", "Andre Moore", False],
-    [1628500, "Moore", "Ben", "Ben Moore", False],
-    [202734, "Moore", "E'Twaun", "E'Twaun Moore", False],
-    [77634, "Moore", "Jackie", "Jackie Moore", False],
-    [77633, "Moore", "Johnny", "Johnny Moore", False],
-    [77635, "Moore", "Lowes", "Lowes Moore", False],
-    [1630, "Moore", "Mikki", "Mikki Moore", False],
-    [77636, "Moore", "Otto", "Otto Moore", False],
-    [77637, "Moore", "Ron", "Ron Moore", False],
-    [1631386, "Moore", "Taze", "Taze Moore", False],
-    [929, "Moore", "Tracy", "Tracy Moore", False],
-    [1631111, "Moore Jr.", "Wendell", "Wendell Moore Jr.", True],
-    [1629630, "Morant", "Ja", "Ja Morant", True],
-    [203961, "Moreland", "Eric", "Eric Moreland", False],
-    [77639, "Moreland", "Jackie", "Jackie Moreland", False],
-    [77640, "Morgan", "Guy", "Guy Morgan", False],
-    [1629752, "Morgan", "Juwan", "Juwan Morgan", False],
-    [77641, "Morgan", "Rex", "Rex Morgan", False],
-    [77642, "Morgenthaler", "Elmo", "Elmo Morgenthaler", False],
-    [77644, "Morningstar", "Darren", "Darren Morningstar", False],
-    [356, "Morris", "Chris", "Chris Morris", False],
-    [202721, "Morris", "Darius", "Darius Morris", False],
-    [77647, "Morris", "Isaiah", "Isaiah Morris", False],
-    [1628537, "Morris", "Jaylen", "Jaylen Morris", False],
-    [202693, "Morris", "Markieff", "Markieff Morris", False],
-    [77646, "Morris", "Max", "Max Morris", False],
-    [1628420, "Morris", "Monté", "Monté Morris", True],
-    [201043, "Morris", "Randolph", "Randolph Morris", False],
-    [2242, "Morris", "Terence", "Terence Morris", False],
-    [202694, "Morris Sr.", "Marcus", "Marcus Morris Sr.", False],
-    [200747, "Morrison", "Adam", "Adam Morrison", False],
-    [77648, "Morrison", "Dwight", "Dwight Morrison", False],
-    [77649, "Morrison", "Mike", "Mike Morrison", False],
-    [201627, "Morrow", "Anthony", "Anthony Morrow", False],
-    [132, "Morton", "Dwayne", "Dwayne Morton", False],
-    [1972, "Morton", "John", "John Morton", False],
-    [77652, "Morton", "Richard", "Richard Morton", False],
-    [77653, "Mosley", "Glenn", "Glenn Mosley", False],
-    [77654, "Moss", "Perry", "Perry Moss", False],
-    [734, "Moten", "Lawrence", "Lawrence Moten", False],
-    [202700, "Motiejunas", "Donatas", "Donatas Motiejunas", False],
-    [1628405, "Motley", "Johnathan", "Johnathan Motley", False],
-    [2069, "Mottola", "Hanno", "Hanno Mottola", False],
-    [203102, "Moultrie", "Arnett", "Arnett Moultrie", False],
-    [297, "Mourning", "Alonzo", "Alonzo Mourning", False],
-    [202389, "Mozgov", "Timofey", "Timofey Mozgov", False],
-    [77657, "Mrazovich", "Chuck", "Chuck Mrazovich", False],
-    [1626144, "Mudiay", "Emmanuel", "Emmanuel Mudiay", False],
-    [77658, "Mueller", "Erwin", "Erwin Mueller", False],
-    [203498, "Muhammad", "Shabazz", "Shabazz Muhammad", False],
-    [1628539, "Mulder", "Mychal", "Mychal Mulder", False],
-    [77659, "Mullaney", "Joe", "Joe Mullaney", False],
-    [77660, "Mullens", "Bob", "Bob Mullens", False],
-    [201957, "Mullens", "Byron", "Byron Mullens", False],
-    [904, "Mullin", "Chris", "Chris Mullin", False],
-    [77662, "Mullins", "Jeff", "Jeff Mullins", False],
-    [942, "Mundt", "Todd", "Todd Mundt", False],
-    [204098, "Munford", "Xavier", "Xavier Munford", False],
-    [77664, "Munk", "Chris", "Chris Munk", False],
-    [77665, "Munroe", "George", "George Munroe", False],
-    [785, "Murdock", "Eric", "Eric Murdock", False],
-    [49, "Muresan", "Gheorghe", "Gheorghe Muresan", False],
-    [1630278, "Murkey", "Ade", "Ade Murkey", False],
-    [77668, "Murphy", "Allen", "Allen Murphy", False],
-    [77669, "Murphy", "Calvin", "Calvin Murphy", False],
-    [77672, "Murphy", "Dick", "Dick Murphy", False],
-    [203513, "Murphy", "Erik", "Erik Murphy", False],
-    [77670, "Murphy", "Jay", "Jay Murphy", False],
-    [77671, "Murphy", "John", "John Murphy", False],
-    [203122, "Murphy", "Kevin", "Kevin Murphy", False],
-    [77673, "Murphy", "Ronnie", "Ronnie Murphy", False],
-    [77674, "Murphy", "Tod", "Tod Murphy", False],
-    [2211, "Murphy", "Troy", "Troy Murphy", False],
-    [1630530, "Murphy III", "Trey", "Trey Murphy III", True],
-    [1627749, "Murray", "Dejounte", "Dejounte Murray", True],
-    [2436, "Murray", "Flip", "Flip Murray", False],
-    [1627750, "Murray", "Jamal", "Jamal Murray", True],
-    [1631099, "Murray", "Keegan", "Keegan Murray", True],
-    [77675, "Murray", "Ken", "Ken Murray", False],
-    [1631200, "Murray", "Kris", "Kris Murray", True],
-    [441, "Murray", "Lamond", "Lamond Murray", False],
-    [145, "Murray", "Tracy", "Tracy Murray", False],
-    [1642867, "Murray-Boyles", "Collin", "Collin Murray-Boyles", True],
-    [77676, "Murrey", "Dorie", "Dorie Murrey", False],
-    [203315, "Murry", "Toure'", "Toure' Murry", False],
-    [1629058, "Musa", "Dzanan", "Dzanan Musa", False],
-    [203488, "Muscala", "Mike", "Mike Muscala", False],
-    [77677, "Musi", "Angelo", "Angelo Musi", False],
-    [1054, "Mustaf", "Jerrod", "Jerrod Mustaf", False],
-    [87, "Mutombo", "Dikembe", "Dikembe Mutombo", False],
-    [982, "Muursepp", "Martin", "Martin Muursepp", False],
-    [939, "Myers", "Pete", "Pete Myers", False],
-    [1629004, "Mykhailiuk", "Svi", "Svi Mykhailiuk", True],
-    [1823, "N'diaye", "Makhtar", "Makhtar N'diaye", False],
-    [2055, "N'diaye", "Mamadou", "Mamadou N'diaye", False],
-    [77681, "Naber", "Bob", "Bob Naber", False],
-    [77682, "Nachamkin", "Boris", "Boris Nachamkin", False],
-    [2411, "Nachbar", "Bostjan", "Bostjan Nachbar", False],
-    [1627846, "Nader", "Abdel", "Abdel Nader", False],
-    [77683, "Nagel", "Jerry", "Jerry Nagel", False],
-    [77684, "Nagy", "Fred", "Fred Nagy", False],
-    [1924, "Nailon", "Lee", "Lee Nailon", False],
-    [2059, "Najera", "Eduardo", "Eduardo Najera", False],
-    [77685, "Nance", "Larry", "Larry Nance", False],
-    [1631250, "Nance", "Pete", "Pete Nance", True],
-    [1626204, "Nance Jr.", "Larry", "Larry Nance Jr.", True],
-    [203894, "Napier", "Shabazz", "Shabazz Napier", False],
-    [77686, "Napolitano", "Paul", "Paul Napolitano", False],
-    [77688, "Nash", "Bob", "Bob Nash", False],
-    [77687, "Nash", "Charles", "Charles Nash", False],
-    [959, "Nash", "Steve", "Steve Nash", False],
-    [77689, "Nater", "Swen", "Swen Nater", False],
-    [77690, "Nathan", "Howard", "Howard Nathan", False],
-    [77691, "Natt", "Calvin", "Calvin Natt", False],
-    [77692, "Natt", "Kenny", "Kenny Natt", False],
-    [77693, "Naulls", "Willie", "Willie Naulls", False],
-    [2434, "Navarro", "Juan Carlos", "Juan Carlos Navarro", False],
-    [1642947, "Ndiaye", "Eli John", "Eli John Ndiaye", True],
-    [202380, "Ndiaye", "Hamady", "Hamady Ndiaye", False],
-    [101238, "Ndong", "Boniface", "Boniface Ndong", False],
-    [1626254, "Ndour", "Maurice", "Maurice Ndour", False],
-    [77694, "Neal", "Craig", "Craig Neal", False],
-    [202390, "Neal", "Gary", "Gary Neal", False],
-    [77695, "Neal", "Jim", "Jim Neal", False],
-    [77696, "Neal", "Lloyd", "Lloyd Neal", False],
-    [77697, "Nealy", "Ed", "Ed Nealy", False],
-    [203517, "Nedovic", "Nemanja", "Nemanja Nedovic", False],
-    [77698, "Negratti", "Al", "Al Negratti", False],
-    [77699, "Nelson", "Barry", "Barry Nelson", False],
-    [201634, "Nelson", "DeMarcus", "DeMarcus Nelson", False],
-    [77700, "Nelson", "Don", "Don Nelson", False],
-    [2749, "Nelson", "Jameer", "Jameer Nelson", False],
-    [77701, "Nelson", "Louie", "Louie Nelson", False],
-    [1629614, "Nembhard", "Andrew", "Andrew Nembhard", True],
-    [1129, "Nembhard", "Ruben", "Ruben Nembhard", False],
-    [1642948, "Nembhard", "Ryan", "Ryan Nembhard", True],
-    [1630612, "Nembhard Jr.", "Ruben", "Ruben Nembhard Jr.", False],
-    [2403, "Nene", "", "Nene", False],
-    [1838, "Nesby", "Tyrone", "Tyrone Nesby", False],
-    [1630174, "Nesmith", "Aaron", "Aaron Nesmith", True],
-    [77704, "Nessley", "Martin", "Martin Nessley", False],
-    [1725, "Nesterovic", "Rasho", "Rasho Nesterovic", False],
-    [203526, "Neto", "Raul", "Raul Neto", False],
-    [77705, "Neumann", "Johnny", "Johnny Neumann", False],
-    [77706, "Neumann", "Paul", "Paul Neumann", False],
-    [77707, "Nevitt", "Chuck", "Chuck Nevitt", False],
-    [1116, "Newbern", "Melvin", "Melvin Newbern", False],
-    [1096, "Newbill", "Ivano", "Ivano Newbill", False],
-    [1956, "Newble", "Ira", "Ira Newble", False],
-    [1642854, "Newell", "Asa", "Asa Newell", True],
-    [77710, "Newlin", "Mike", "Mike Newlin", False],
-    [271, "Newman", "Johnny", "Johnny Newman", False],
-    [1629005, "Newman", "Malik", "Malik Newman", False],
-    [77712, "Newmark", "Dave", "Dave Newmark", False],
-    [1641803, "Newton", "Tristen", "Tristen Newton", False],
-    [1627777, "Niang", "Georges", "Georges Niang", True],
-    [201193, "Nichols", "Demetris", "Demetris Nichols", False],
-    [77713, "Nichols", "Jack", "Jack Nichols", False],
-    [203094, "Nicholson", "Andrew", "Andrew Nicholson", False],
-    [1093, "Nickerson", "Gaylon", "Gaylon Nickerson", False],
-    [77715, "Nicks", "Carl", "Carl Nicks", False],
-    [1642949, "Niederhäuser", "Yanic Konan", "Yanic Konan Niederhäuser", True],
-    [77716, "Niemann", "Rich", "Rich Niemann", False],
-    [77717, "Niemiera", "John", "John Niemiera", False],
-    [77718, "Niles", "Mike", "Mike Niles", False],
-    [77719, "Nimphius", "Kurt", "Kurt Nimphius", False],
-    [1630227, "Nix", "Daishen", "Daishen Nix", False],
-    [77720, "Nix", "Dyron", "Dyron Nix", False],
-    [77721, "Nixon", "Norm", "Norm Nixon", False],
-    [1630192, "Nnaji", "Zeke", "Zeke Nnaji", True],
-    [201149, "Noah", "Joakim", "Joakim Noah", False],
-    [77722, "Noble", "Chuck", "Chuck Noble", False],
-    [2804, "Nocioni", "Andres", "Andres Nocioni", False],
-    [200786, "Noel", "David", "David Noel", False],
-    [203457, "Noel", "Nerlens", "Nerlens Noel", False],
-    [77723, "Noel", "Paul", "Paul Noel", False],
-    [203512, "Nogueira", "Lucas", "Lucas Nogueira", False],
-    [77724, "Nolan", "Jim", "Jim Nolan", False],
-    [77725, "Nolen", "Paul", "Paul Nolen", False],
-    [999, "Nordgaard", "Jeff", "Jeff Nordgaard", False],
-    [77727, "Nordmann", "Robert", "Robert Nordmann", False],
-    [77728, "Norlander", "Johnny", "Johnny Norlander", False],
-    [77729, "Norman", "Connie", "Connie Norman", False],
-    [80, "Norman", "Ken", "Ken Norman", False],
-    [77731, "Norris", "Audie", "Audie Norris", False],
-    [1641936, "Norris", "Miles", "Miles Norris", False],
-    [983, "Norris", "Moochie", "Moochie Norris", False],
-    [77732, "Norris", "Sylvester", "Sylvester Norris", False],
-    [1629668, "Norvell Jr.", "Zach", "Zach Norvell Jr.", False],
-    [77733, "Norwood", "Willie", "Willie Norwood", False],
-    [77734, "Nostrand", "George", "George Nostrand", False],
-    [77735, "Noszka", "Stan", "Stan Noszka", False],
-    [77736, "Novak", "Mike", "Mike Novak", False],
-    [200779, "Novak", "Steve", "Steve Novak", False],
-    [1629669, "Nowell", "Jaylen", "Jaylen Nowell", False],
-    [1641806, "Nowell", "Markquis", "Markquis Nowell", False],
-    [77737, "Nowell", "Mel", "Mel Nowell", False],
-    [1717, "Nowitzki", "Dirk", "Dirk Nowitzki", False],
-    [1628373, "Ntilikina", "Frank", "Frank Ntilikina", False],
-    [1629134, "Nunn", "Kendrick", "Kendrick Nunn", False],
-    [203263, "Nunnally", "James", "James Nunnally", False],
-    [203994, "Nurkić", "Jusuf", "Jusuf Nurkić", True],
-    [77738, "Nutt", "Dennis", "Dennis Nutt", False],
-    [1628021, "Nwaba", "David", "David Nwaba", False],
-    [1629670, "Nwora", "Jordan", "Jordan Nwora", False],
-    [1022, "Nwosu", "Julius", "Julius Nwosu", False],
-    [1525, "O'Bannon", "Charles", "Charles O'Bannon", False],
-    [709, "O'Bannon", "Ed", "Ed O'Bannon", False],
-    [77742, "O'Boyle", "John", "John O'Boyle", False],
-    [77744, "O'Brien", "Bob", "Bob O'Brien", False],
-    [77743, "O'Brien", "Buckshot", "Buckshot O'Brien", False],
-    [1626266, "O'Brien", "JJ", "JJ O'Brien", False],
-    [200753, "O'Bryant", "Patrick", "Patrick O'Bryant", False],
-    [203948, "O'Bryant III", "Johnny", "Johnny O'Bryant III", False],
-    [77745, "O'Connell", "Dermie", "Dermie O'Connell", False],
-    [77746, "O'Donnell", "Andy", "Andy O'Donnell", False],
-    [77750, "O'Grady", "Francis", "Francis O'Grady", False],
-    [77752, "O'Keefe", "Dick", "Dick O'Keefe", False],
-    [77753, "O'Keefe", "Tommy", "Tommy O'Keefe", False],
-    [77754, "O'Koren", "Mike", "Mike O'Koren", False],
-    [77766, "O'Malley", "Grady", "Grady O'Malley", False],
-    [979, "O'Neal", "Jermaine", "Jermaine O'Neal", False],
-    [406, "O'Neal", "Shaquille", "Shaquille O'Neal", False],
-    [1626220, "O'Neale", "Royce", "Royce O'Neale", True],
-    [77767, "O'Neill", "Mike", "Mike O'Neill", False],
-    [203124, "O'Quinn", "Kyle", "Kyle O'Quinn", False],
-    [77773, "O'Shea", "Kevin", "Kevin O'Shea", False],
-    [77774, "O'Shields", "Garland", "Garland O'Shields", False],
-    [77776, "O'Sullivan", "Dan", "Dan O'Sullivan", False],
-    [891, "Oakley", "Charles", "Charles Oakley", False],
-    [101177, "Oberto", "Fabricio", "Fabricio Oberto", False],
-    [1627849, "Ochefu", "Daniel", "Daniel Ochefu", False],
-    [201141, "Oden", "Greg", "Greg Oden", False],
-    [1885, "Odom", "Lamar", "Lamar Odom", False],
-    [77747, "Ogden", "Carlos", "Carlos Ogden", False],
-    [77748, "Ogden", "Ralph", "Ralph Ogden", False],
-    [1628, "Ogg", "Alan", "Alan Ogg", False],
-    [77751, "Ohl", "Don", "Don Ohl", False],
-    [203317, "Ohlbrecht", "Tim", "Tim Ohlbrecht", False],
-    [1628400, "Ojeleye", "Semi", "Semi Ojeleye", False],
-    [2731, "Okafor", "Emeka", "Emeka Okafor", False],
-    [1626143, "Okafor", "Jahlil", "Jahlil Okafor", False],
-    [1629643, "Okeke", "Chuma", "Chuma Okeke", False],
-    [1629059, "Okobo", "Elie", "Elie Okobo", False],
-    [1629006, "Okogie", "Josh", "Josh Okogie", True],
-    [1630168, "Okongwu", "Onyeka", "Onyeka Okongwu", True],
-    [1630171, "Okoro", "Isaac", "Isaac Okoro", True],
-    [1629644, "Okpala", "KZ", "KZ Okpala", False],
-    [2246, "Okur", "Mehmet", "Mehmet Okur", False],
-    [203506, "Oladipo", "Victor", "Victor Oladipo", False],
-    [165, "Olajuwon", "Hakeem", "Hakeem Olajuwon", False],
-    [77756, "Olberding", "Mark", "Mark Olberding", False],
-    [1642950, "Olbrich", "Lachlan", "Lachlan Olbrich", True],
-    [77757, "Oldham", "Jawann", "Jawann Oldham", False],
-    [77758, "Oldham", "Johnny", "Johnny Oldham", False],
-    [77759, "Oleynick", "Frank", "Frank Oleynick", False],
-    [1642439, "Olivari", "Quincy", "Quincy Olivari", False],
-    [77760, "Olive", "John", "John Olive", False],
-    [1680, "Oliver", "Brian", "Brian Oliver", False],
-    [1628419, "Oliver", "Cameron", "Cameron Oliver", False],
-    [2352, "Oliver", "Dean", "Dean Oliver", False],
-    [1429, "Oliver", "Jimmy", "Jimmy Oliver", False],
-    [1563, "Ollie", "Kevin", "Kevin Ollie", False],
-    [77764, "Ollrich", "Gene", "Gene Ollrich", False],
-    [1709, "Olowokandi", "Michael", "Michael Olowokandi", False],
-    [77765, "Olsen", "Enoch", "Enoch Olsen", False],
-    [203482, "Olynyk", "Kelly", "Kelly Olynyk", True],
-    [1630647, "Omoruyi", "Eugene", "Eugene Omoruyi", False],
-    [1629671, "Oni", "Miye", "Miye Oni", False],
-    [202620, "Onuaku", "Arinze", "Arinze Onuaku", False],
-    [1627778, "Onuaku", "Chinanu", "Chinanu Onuaku", False],
-    [77768, "Orms", "Barry", "Barry Orms", False],
-    [77769, "Orr", "Johnny", "Johnny Orr", False],
-    [77770, "Orr", "Louis", "Louis Orr", False],
-    [77771, "Ortiz", "Jose", "Jose Ortiz", False],
-    [202350, "Orton", "Daniel", "Daniel Orton", False],
-    [77772, "Osborne", "Chuck", "Chuck Osborne", False],
-    [1626224, "Osman", "Cedi", "Cedi Osman", False],
-    [77775, "Osterkorn", "Wally", "Wally Osterkorn", False],
-    [731, "Ostertag", "Greg", "Greg Ostertag", False],
-    [77777, "Othick", "Matt", "Matt Othick", False],
-    [77778, "Otten", "Don", "Don Otten", False],
-    [77779, "Otten", "Mac", "Mac Otten", False],
-    [1630187, "Oturu", "Daniel", "Daniel Oturu", False],
-    [1626162, "Oubre Jr.", "Kelly", "Kelly Oubre Jr.", True],
-    [448, "Outlaw", "Bo", "Bo Outlaw", False],
-    [2566, "Outlaw", "Travis", "Travis Outlaw", False],
-    [77780, "Overton", "Claude", "Claude Overton", False],
-    [77, "Overton", "Doug", "Doug Overton", False],
-    [101261, "Owens", "Andre", "Andre Owens", False],
-    [182, "Owens", "Billy", "Billy Owens", False],
-    [2442, "Owens", "Chris", "Chris Owens", False],
-    [77782, "Owens", "Eddie", "Eddie Owens", False],
-    [77783, "Owens", "James", "James Owens", False],
-    [77784, "Owens", "Jim", "Jim Owens", False],
-    [77785, "Owens", "Keith", "Keith Owens", False],
-    [202082, "Owens", "Larry", "Larry Owens", False],
-    [1629745, "Owens", "Tariq", "Tariq Owens", False],
-    [77786, "Owens", "Tom", "Tom Owens", False],
-    [1077, "Owes", "Ray", "Ray Owes", False],
-    [2071, "Oyedeji", "Olumide", "Olumide Oyedeji", False],
-    [77788, "Pace", "Joe", "Joe Pace", False],
-    [2585, "Pachulia", "Zaza", "Zaza Pachulia", False],
-    [123, "Pack", "Robert", "Robert Pack", False],
-    [77789, "Paddio", "Gerald", "Gerald Paddio", False],
-    [1909, "Padgett", "Scott", "Scott Padgett", False],
-    [1629873, "Paige", "Jaysean", "Jaysean Paige", False],
-    [1627779, "Paige", "Marcus", "Marcus Paige", False],
-    [77790, "Paine", "Fred", "Fred Paine", False],
-    [1960, "Palacio", "Milt", "Milt Palacio", False],
-    [77791, "Palazzi", "Togo", "Togo Palazzi", False],
-    [77792, "Palmer", "Jim", "Jim Palmer", False],
-    [77793, "Palmer", "John", "John Palmer", False],
-    [1629309, "Palmer", "Trayvon", "Trayvon Palmer", False],
-    [77794, "Palmer", "Walter", "Walter Palmer", False],
-    [1630698, "Pangos", "Kevin", "Kevin Pangos", False],
-    [1950, "Panko", "Andy", "Andy Panko", False],
-    [1627834, "Papagiannis", "Georgios", "Georgios Papagiannis", False],
-    [203123, "Papanikolaou", "Kostas", "Kostas Papanikolaou", False],
-    [2457, "Pargo", "Jannero", "Jannero Pargo", False],
-    [202951, "Pargo", "Jeremy", "Jeremy Pargo", False],
-    [77797, "Parham", "Estes", "Estes Parham", False],
-    [305, "Parish", "Robert", "Robert Parish", False],
-    [77799, "Park", "Medford", "Medford Park", False],
-    [1515, "Parker", "Anthony", "Anthony Parker", False],
-    [203953, "Parker", "Jabari", "Jabari Parker", False],
-    [2470, "Parker", "Smush", "Smush Parker", False],
-    [77800, "Parker", "Sonny", "Sonny Parker", False],
-    [2225, "Parker", "Tony", "Tony Parker", False],
-    [77801, "Parkinson", "Jack", "Jack Parkinson", False],
-    [685, "Parks", "Cherokee", "Cherokee Parks", False],
-    [77802, "Parr", "Jack", "Jack Parr", False],
-    [77803, "Parrack", "Doyle", "Doyle Parrack", False],
-    [77804, "Parsley", "Charlie", "Charlie Parsley", False],
-    [202718, "Parsons", "Chandler", "Chandler Parsons", False],
-    [1629672, "Paschall", "Eric", "Eric Paschall", False],
-    [1628394, "Pasečņiks", "Anžejs", "Anžejs Pasečņiks", False],
-    [1097, "Paspalj", "Zarko", "Zarko Paspalj", False],
-    [77806, "Passaglia", "Marty", "Marty Passaglia", False],
-    [77807, "Pastushok", "George A.", "George A. Pastushok", False],
-    [77808, "Patrick", "Myles", "Myles Patrick", False],
-    [77809, "Patrick", "Stan", "Stan Patrick", False],
-    [1754, "Patterson", "Andrae", "Andrae Patterson", False],
-    [77811, "Patterson", "George", "George Patterson", False],
-    [203934, "Patterson", "Lamar", "Lamar Patterson", False],
-    [202335, "Patterson", "Patrick", "Patrick Patterson", False],
-    [1739, "Patterson", "Ruben", "Ruben Patterson", False],
-    [77812, "Patterson", "Steve", "Steve Patterson", False],
-    [77813, "Patterson", "Tommy", "Tommy Patterson", False],
-    [77814, "Patterson", "Worthy", "Worthy Patterson", False],
-    [1628383, "Patton", "Justin", "Justin Patton", False],
-    [203464, "Paul", "Brandon", "Brandon Paul", False],
-    [101108, "Paul", "Chris", "Chris Paul", True],
-    [77815, "Paulk", "Charlie", "Charlie Paulk", False],
-    [77816, "Paulson", "Jerry", "Jerry Paulson", False],
-    [77817, "Paultz", "Billy", "Billy Paultz", False],
-    [2562, "Pavlovic", "Sasha", "Sasha Pavlovic", False],
-    [77818, "Paxson", "Jim", "Jim Paxson", False],
-    [77819, "Paxson", "Jim", "Jim Paxson", False],
-    [77820, "Paxson", "John", "John Paxson", False],
-    [77821, "Payak", "Johnny", "Johnny Payak", False],
-    [203940, "Payne", "Adreian", "Adreian Payne", False],
-    [1626166, "Payne", "Cameron", "Cameron Payne", False],
-    [77822, "Payne", "Kenny", "Kenny Payne", False],
-    [77823, "Payne", "Tom", "Tom Payne", False],
-    [203901, "Payton", "Elfrid", "Elfrid Payton", False],
-    [56, "Payton", "Gary", "Gary Payton", False],
-    [77824, "Payton", "Mel", "Mel Payton", False],
-    [1627780, "Payton II", "Gary", "Gary Payton II", True],
-    [77825, "Pearcy", "George", "George Pearcy", False],
-    [77826, "Pearcy", "Henry", "Henry Pearcy", False],
-    [1642877, "Peavy", "Micah", "Micah Peavy", True],
-    [200762, "Pecherov", "Oleksiy", "Oleksiy Pecherov", False],
-    [77827, "Peck", "Wiley", "Wiley Peck", False],
-    [324, "Peeler", "Anthony", "Anthony Peeler", False],
-    [201593, "Pekovic", "Nikola", "Nikola Pekovic", False],
-    [77828, "Pelkington", "Jake", "Jake Pelkington", False],
-    [203658, "Pelle", "Norvel", "Norvel Pelle", False],
-    [77829, "Pellom", "Sam", "Sam Pellom", False],
-    [2130, "Penberthy", "Mike", "Mike Penberthy", False],
-    [1642869, "Penda", "Noah", "Noah Penda", True],
-    [2667, "Penigar", "Desmond", "Desmond Penigar", False],
-    [2632, "Penney", "Kirk", "Kirk Penney", False],
-    [46, "Peplowski", "Mike", "Mike Peplowski", False],
-    [781, "Perdue", "Will", "Will Perdue", False],
-    [1641970, "Pereira", "Maozinha", "Maozinha Pereira", False],
-    [2570, "Perkins", "Kendrick", "Kendrick Perkins", False],
-    [64, "Perkins", "Sam", "Sam Perkins", False],
-    [77834, "Perkins", "Warren", "Warren Perkins", False],
-    [200785, "Perovic", "Kosta", "Kosta Perovic", False],
-    [1628506, "Perrantes", "London", "London Perrantes", False],
-    [77835, "Perry", "Curtis", "Curtis Perry", False],
-    [386, "Perry", "Elliot", "Elliot Perry", False],
-    [1629617, "Perry", "Reggie", "Reggie Perry", False],
-    [897, "Perry", "Tim", "Tim Perry", False],
-    [456, "Person", "Chuck", "Chuck Person", False],
-    [445, "Person", "Wesley", "Wesley Person", False],
-    [1643007, "Peter", "Taelon", "Taelon Peter", True],
-    [1628409, "Peters", "Alec", "Alec Peters", False],
-    [77839, "Petersen", "Jim", "Jim Petersen", False],
-    [77840, "Petersen", "Loy", "Loy Petersen", False],
-    [77843, "Peterson", "Bob", "Bob Peterson", False],
-    [1641809, "Peterson", "Drew", "Drew Peterson", True],
-    [77841, "Peterson", "Ed", "Ed Peterson", False],
-    [77842, "Peterson", "Mel", "Mel Peterson", False],
-    [2050, "Peterson", "Morris", "Morris Peterson", False],
-    [77844, "Petrie", "Geoff", "Geoff Petrie", False],
-    [101130, "Petro", "Johan", "Johan Petro", False],
-    [77845, "Petrovic", "Drazen", "Drazen Petrovic", False],
-    [1630196, "Petrusev", "Filip", "Filip Petrusev", False],
-    [77846, "Petruska", "Richard", "Richard Petruska", False],
-    [77847, "Pettit", "Bob", "Bob Pettit", False],
-    [77848, "Phegley", "Roger", "Roger Phegley", False],
-    [77850, "Phelan", "Jack", "Jack Phelan", False],
-    [77849, "Phelan", "Jim", "Jim Phelan", False],
-    [74, "Phelps", "Derrick", "Derrick Phelps", False],
-    [77852, "Phelps", "Mike", "Mike Phelps", False],
-    [77853, "Phillip", "Andy", "Andy Phillip", False],
-    [1629341, "Phillip", "Tarik", "Tarik Phillip", False],
-    [77854, "Phillips", "Eddie", "Eddie Phillips", False],
-    [77855, "Phillips", "Gary", "Gary Phillips", False],
-    [1641763, "Phillips", "Julian", "Julian Phillips", True],
-    [184, "Phills", "Bobby", "Bobby Phills", False],
-    [15, "Piatkowski", "Eric", "Eric Piatkowski", False],
-    [1629618, "Pickett", "Jalen", "Jalen Pickett", True],
-    [1630691, "Pickett", "Jamorko", "Jamorko Pickett", False],
-    [1718, "Pierce", "Paul", "Paul Pierce", False],
-    [894, "Pierce", "Ricky", "Ricky Pierce", False],
-    [77858, "Pietkiewicz", "Stan", "Stan Pietkiewicz", False],
-    [2554, "Pietrus", "Mickael", "Mickael Pietrus", False],
-    [77859, "Pilch", "John", "John Pilch", False],
-    [291, "Pinckney", "Ed", "Ed Pinckney", False],
-    [200838, "Pinkney", "Kevinn", "Kevinn Pinkney", False],
-    [77861, "Pinone", "John", "John Pinone", False],
-    [1629033, "Pinson", "Theo", "Theo Pinson", False],
-    [77862, "Piontek", "Dave", "Dave Piontek", False],
-    [77863, "Piotrowski", "Tom", "Tom Piotrowski", False],
-    [937, "Pippen", "Scottie", "Scottie Pippen", False],
-    [1630590, "Pippen Jr.", "Scotty", "Scotty Pippen Jr.", True],
-    [77864, "Pittman", "Charlie", "Charlie Pittman", False],
-    [202354, "Pittman", "Dexter", "Dexter Pittman", False],
-    [2565, "Planinic", "Zoran", "Zoran Planinic", False],
-    [202353, "Pleiss", "Tibor", "Tibor Pleiss", False],
-    [1631342, "Plowden", "Daeqwon", "Daeqwon Plowden", True],
-    [1627850, "Plumlee", "Marshall", "Marshall Plumlee", False],
-    [203486, "Plumlee", "Mason", "Mason Plumlee", True],
-    [203101, "Plumlee", "Miles", "Miles Plumlee", False],
-    [77865, "Plummer", "Gary", "Gary Plummer", False],
-    [2750, "Podkolzin", "Pavel", "Pavel Podkolzin", False],
-    [1641764, "Podziemski", "Brandin", "Brandin Podziemski", True],
-    [1627751, "Poeltl", "Jakob", "Jakob Poeltl", True],
-    [1629738, "Poirier", "Vincent", "Vincent Poirier", False],
-    [1630197, "Pokusevski", "Aleksej", "Aleksej Pokusevski", False],
-    [77866, "Polee", "Dwayne", "Dwayne Polee", False],
-    [77867, "Pollard", "Jim", "Jim Pollard", False],
-    [1513, "Pollard", "Scot", "Scot Pollard", False],
-    [77868, "Polson", "Ralph", "Ralph Polson", False],
-    [178, "Polynice", "Olden", "Olden Polynice", False],
-    [77869, "Pondexter", "Cliff", "Cliff Pondexter", False],
-    [202347, "Pondexter", "Quincy", "Quincy Pondexter", False],
-    [1629044, "Ponds", "Shamorie", "Shamorie Ponds", False],
-    [1630582, "Pons", "Yves", "Yves Pons", False],
-    [1629673, "Poole", "Jordan", "Jordan Poole", True],
-    [77870, "Pope", "David", "David Pope", False],
-    [998, "Pope", "Mark", "Mark Pope", False],
-    [77872, "Popson", "Dave", "Dave Popson", False],
-    [77873, "Poquette", "Ben", "Ben Poquette", False],
-    [2084, "Porter", "Chris", "Chris Porter", False],
-    [77875, "Porter", "Howard", "Howard Porter", False],
-    [1629007, "Porter", "Jontay", "Jontay Porter", False],
-    [77876, "Porter", "Kevin", "Kevin Porter", False],
-    [345, "Porter", "Terry", "Terry Porter", False],
-    [1641854, "Porter Jr.", "Craig", "Craig Porter Jr.", True],
-    [1629645, "Porter Jr.", "Kevin", "Kevin Porter Jr.", True],
-    [1629008, "Porter Jr.", "Michael", "Michael Porter Jr.", True],
-    [203490, "Porter Jr.", "Otto", "Otto Porter Jr.", False],
-    [1626171, "Portis", "Bobby", "Bobby Portis", True],
-    [77878, "Portman", "Bob", "Bob Portman", False],
-    [204001, "Porziņģis", "Kristaps", "Kristaps Porziņģis", True],
-    [1899, "Posey", "James", "James Posey", False],
-    [1642366, "Post", "Quinten", "Quinten Post", True],
-    [2068, "Postell", "Lavor", "Lavor Postell", False],
-    [958, "Potapenko", "Vitaly", "Vitaly Potapenko", False],
-    [1630695, "Potter", "Micah", "Micah Potter", False],
-    [200796, "Powe", "Leon", "Leon Powe", False],
-    [1642962, "Powell", "Drake", "Drake Powell", True],
-    [203939, "Powell", "Dwight", "Dwight Powell", True],
-    [2694, "Powell", "Josh", "Josh Powell", False],
-    [2867, "Powell", "Kasib", "Kasib Powell", False],
-    [1629619, "Powell", "Myles", "Myles Powell", False],
-    [1626181, "Powell", "Norman", "Norman Powell", True],
-    [101232, "Powell", "Roger", "Roger Powell", False],
-    [1627816, "Poythress", "Alex", "Alex Poythress", False],
-    [77879, "Pressey", "Paul", "Paul Pressey", False],
-    [203515, "Pressey", "Phil", "Phil Pressey", False],
-    [77880, "Pressley", "Dominic", "Dominic Pressley", False],
-    [77881, "Pressley", "Harold", "Harold Pressley", False],
-    [1630554, "Preston", "Jason", "Jason Preston", False],
-    [201985, "Price", "AJ", "AJ Price", False],
-    [85, "Price", "Brent", "Brent Price", False],
-    [77883, "Price", "Jim", "Jim Price", False],
-    [899, "Price", "Mark", "Mark Price", False],
-    [77884, "Price", "Mike", "Mike Price", False],
-    [101179, "Price", "Ronnie", "Ronnie Price", False],
-    [77882, "Price", "Tony", "Tony Price", False],
-    [77886, "Priddy", "Bob", "Bob Priddy", False],
-    [203143, "Prigioni", "Pablo", "Pablo Prigioni", False],
-    [1630563, "Primo", "Joshua", "Joshua Primo", False],
-    [1627752, "Prince", "Taurean", "Taurean Prince", True],
-    [2419, "Prince", "Tayshaun", "Tayshaun Prince", False],
-    [77887, "Pritchard", "John", "John Pritchard", False],
-    [340, "Pritchard", "Kevin", "Kevin Pritchard", False],
-    [1630202, "Pritchard", "Payton", "Payton Pritchard", True],
-    [1642878, "Proctor", "Tyrese", "Tyrese Proctor", True],
-    [1919, "Profit", "Laron", "Laron Profit", False],
-    [1641765, "Prosper", "Olivier-Maxence", "Olivier-Maxence Prosper", True],
-    [201172, "Pruitt", "Gabe", "Gabe Pruitt", False],
-    [2038, "Przybilla", "Joel", "Joel Przybilla", False],
-    [77888, "Pugh", "Les", "Les Pugh", False],
-    [77889, "Pugh", "Roy", "Roy Pugh", False],
-    [77890, "Pullard", "Anthony", "Anthony Pullard", False],
-    [1626643, "Pullen", "Jacob", "Jacob Pullen", False],
-    [1642389, "Pullin", "Zyon", "Zyon Pullin", False],
-    [1628681, "Purvis", "Rodney", "Rodney Purvis", False],
-    [77891, "Putman", "Don", "Don Putman", False],
-    [1627817, "Quarterman", "Tim", "Tim Quarterman", False],
-    [1642852, "Queen", "Derik", "Derik Queen", True],
-    [1630243, "Queen", "Trevelin", "Trevelin Queen", False],
-    [1629674, "Queta", "Neemias", "Neemias Queta", True],
-    [77892, "Quick", "Bob", "Bob Quick", False],
-    [1630193, "Quickley", "Immanuel", "Immanuel Quickley", True],
-    [200809, "Quinn", "Chris", "Chris Quinn", False],
-    [77893, "Quinnett", "Brian", "Brian Quinnett", False],
-    [1631311, "Quinones", "Lester", "Lester Quinones", False],
-    [1628397, "Rabb", "Ivan", "Ivan Rabb", False],
-    [77894, "Rackley", "Luke", "Luke Rackley", False],
-    [77895, "Rader", "Howie", "Howie Rader", False],
-    [77896, "Radford", "Mark", "Mark Radford", False],
-    [77897, "Radford", "Wayne", "Wayne Radford", False],
-    [129, "Radja", "Dino", "Dino Radja", False],
-    [2209, "Radmanovic", "Vladimir", "Vladimir Radmanovic", False],
-    [1893, "Radojevic", "Aleksandar", "Aleksandar Radojevic", False],
-    [77899, "Radovich", "Frank", "Frank Radovich", False],
-    [77900, "Radovich", "Moe", "Moe Radovich", False],
-    [203545, "Raduljica", "Miroslav", "Miroslav Raduljica", False],
-    [77901, "Radziszewski", "Ray", "Ray Radziszewski", False],
-    [77902, "Ragelis", "Ray", "Ray Ragelis", False],
-    [77903, "Raiken", "Sherwin", "Sherwin Raiken", False],
-    [77904, "Rains", "Ed", "Ed Rains", False],
-    [2080, "Rakocevic", "Igor", "Igor Rakocevic", False],
-    [77905, "Rambis", "Kurt", "Kurt Rambis", False],
-    [2762, "Ramos", "Peter John", "Peter John Ramos", False],
-    [77906, "Ramsey", "Cal", "Cal Ramsey", False],
-    [77907, "Ramsey", "Frank", "Frank Ramsey", False],
-    [1630186, "Ramsey", "Jahmi'us", "Jahmi'us Ramsey", False],
-    [77908, "Ramsey", "Ray", "Ray Ramsey", False],
-    [1821, "Randall", "Mark", "Mark Randall", False],
-    [1626184, "Randle", "Chasson", "Chasson Randle", False],
-    [203944, "Randle", "Julius", "Julius Randle", True],
-    [201576, "Randolph", "Anthony", "Anthony Randolph", False],
-    [101183, "Randolph", "Shavlik", "Shavlik Randolph", False],
-    [2216, "Randolph", "Zach", "Zach Randolph", False],
-    [77910, "Rank", "Wally", "Wally Rank", False],
-    [77911, "Ransey", "Kelvin", "Kelvin Ransey", False],
-    [77912, "Ranzino", "Sam", "Sam Ranzino", False],
-    [78656, "Rasmussen", "Blair", "Blair Rasmussen", False],
-    [1628504, "Rathan-Mayes", "Xavier", "Xavier Rathan-Mayes", False],
-    [77913, "Ratkovicz", "George", "George Ratkovicz", False],
-    [77914, "Ratleff", "Ed", "Ed Ratleff", False],
-    [77915, "Ratliff", "Mike", "Mike Ratliff", False],
-    [689, "Ratliff", "Theo", "Theo Ratliff", False],
-    [202360, "Rautins", "Andy", "Andy Rautins", False],
-    [77916, "Rautins", "Leo", "Leo Rautins", False],
-    [200810, "Ray", "Allan", "Allan Ray", False],
-    [77917, "Ray", "Clifford", "Clifford Ray", False],
-    [77918, "Ray", "Don", "Don Ray", False],
-    [77920, "Ray", "Jamesearl", "Jamesearl Ray", False],
-    [77919, "Ray", "Jim", "Jim Ray", False],
-    [77921, "Raymond", "Craig", "Craig Raymond", False],
-    [1642875, "Raynaud", "Maxime", "Maxime Raynaud", True],
-    [77922, "Rea", "Connie", "Connie Rea", False],
-    [1641871, "Reath", "Duop", "Duop Reath", True],
-    [1630559, "Reaves", "Austin", "Austin Reaves", True],
-    [77923, "Reaves", "Joe", "Joe Reaves", False],
-    [1629729, "Reaves", "Josh", "Josh Reaves", False],
-    [1442, "Rebraca", "Zeljko", "Zeljko Rebraca", False],
-    [695, "Recasner", "Eldridge", "Eldridge Recasner", False],
-    [2072, "Redd", "Michael", "Michael Redd", False],
-    [1629629, "Reddish", "Cam", "Cam Reddish", False],
-    [77925, "Reddout", "Frank", "Frank Reddout", False],
-    [200755, "Redick", "JJ", "JJ Redick", False],
-    [77926, "Redmond", "Marlon", "Marlon Redmond", False],
-    [1628432, "Reed", "Davon", "Davon Reed", False],
-    [77927, "Reed", "Hub", "Hub Reed", False],
-    [2770, "Reed", "Justin", "Justin Reed", False],
-    [1630194, "Reed", "Paul", "Paul Reed", True],
-    [77928, "Reed", "Ron", "Ron Reed", False],
-    [203186, "Reed", "Willie", "Willie Reed", False],
-    [77929, "Reed", "Willis", "Willis Reed", False],
-    [1642024, "Reese", "Alex", "Alex Reese", False],
-    [1641810, "Reeves", "Antonio", "Antonio Reeves", True],
-    [735, "Reeves", "Bryant", "Bryant Reeves", False],
-    [234, "Reeves", "Khalid", "Khalid Reeves", False],
-    [77932, "Regan", "Richie", "Richie Regan", False],
-    [77933, "Rehfeldt", "Don", "Don Rehfeldt", False],
-    [77937, "Reid", "Billy", "Billy Reid", False],
-    [690, "Reid", "Don", "Don Reid", False],
-    [462, "Reid", "J.R.", "J.R. Reid", False],
-    [77935, "Reid", "Jim", "Jim Reid", False],
-    [1629675, "Reid", "Naz", "Naz Reid", True],
-    [77936, "Reid", "Robert", "Robert Reid", False],
-    [202385, "Reid", "Ryan", "Ryan Reid", False],
-    [2876, "Reiner", "Jared", "Jared Reiner", False],
-    [77938, "Reiser", "Joseph", "Joseph Reiser", False],
-    [77939, "Rellford", "Richard", "Richard Rellford", False],
-    [720, "Rencher", "Terrence", "Terrence Rencher", False],
-    [77941, "Rennicke", "John", "John Rennicke", False],
-    [77942, "Rensberger", "Rob", "Rob Rensberger", False],
-    [981, "Rentzias", "Efthimios", "Efthimios Rentzias", False],
-    [704, "Respert", "Shawn", "Shawn Respert", False],
-    [77944, "Restani", "Kevin", "Kevin Restani", False],
-    [1629244, "Reynolds", "Cam", "Cam Reynolds", False],
-    [77945, "Reynolds", "George", "George Reynolds", False],
-    [77946, "Reynolds", "Jerry", "Jerry Reynolds", False],
-    [1631197, "Rhoden", "Jared", "Jared Rhoden", False],
-    [77947, "Rhodes", "Gene", "Gene Rhodes", False],
-    [1518, "Rhodes", "Rodrick", "Rodrick Rhodes", False],
-    [779, "Rice", "Glen", "Glen Rice", False],
-    [203318, "Rice", "Glen", "Glen Rice", False],
-    [201181, "Richard", "Chris", "Chris Richard", False],
-    [1642954, "Richard", "Will", "Will Richard", True],
-    [1630208, "Richards", "Nick", "Nick Richards", True],
-    [77950, "Richardson", "Clint", "Clint Richardson", False],
-    [1642859, "Richardson", "Jase", "Jase Richardson", True],
-    [2202, "Richardson", "Jason", "Jason Richardson", False],
-    [200978, "Richardson", "Jeremy", "Jeremy Richardson", False],
-    [1626196, "Richardson", "Josh", "Josh Richardson", False],
-    [1627781, "Richardson", "Malachi", "Malachi Richardson", False],
-    [77952, "Richardson", "Micheal Ray", "Micheal Ray Richardson", False],
-    [2369, "Richardson", "Norman", "Norman Richardson", False],
-    [71, "Richardson", "Pooh", "Pooh Richardson", False],
-    [2047, "Richardson", "Quentin", "Quentin Richardson", False],
-    [782, "Richmond", "Mitch", "Mitch Richmond", False],
-    [77954, "Richter", "John", "John Richter", False],
-    [77955, "Ricketts", "Dick", "Dick Ricketts", False],
-    [375, "Rider", "Isaiah", "Isaiah Rider", False],
-    [77957, "Ridgle", "Jackie", "Jackie Ridgle", False],
-    [2557, "Ridnour", "Luke", "Luke Ridnour", False],
-    [77958, "Riebe", "Mel", "Mel Riebe", False],
-    [77959, "Riffey", "Jim", "Jim Riffey", False],
-    [2541, "Rigaudeau", "Antoine", "Antoine Rigaudeau", False],
-    [77960, "Riker", "Tom", "Tom Riker", False],
-    [77963, "Riley", "Bob", "Bob Riley", False],
-    [35, "Riley", "Eric", "Eric Riley", False],
-    [77962, "Riley", "Pat", "Pat Riley", False],
-    [77964, "Riley", "Ron", "Ron Riley", False],
-    [1642860, "Riley", "Will", "Will Riley", True],
-    [1630203, "Riller", "Grant", "Grant Riller", False],
-    [77965, "Rinaldi", "Rich", "Rich Rinaldi", False],
-    [77966, "Riordan", "Mike", "Mike Riordan", False],
-    [1642258, "Risacher", "Zaccharie", "Zaccharie Risacher", True],
-    [77967, "Risen", "Arnie", "Arnie Risen", False],
-    [77968, "Ritter", "Goebel", "Goebel Ritter", False],
-    [77969, "Rivas", "Ramon", "Ramon Rivas", False],
-    [203085, "Rivers", "Austin", "Austin Rivers", False],
-    [77970, "Rivers", "David", "David Rivers", False],
-    [470, "Rivers", "Doc", "Doc Rivers", False],
-    [77972, "Robbins", "Lee", "Lee Robbins", False],
-    [1641857, "Robbins", "Liam", "Liam Robbins", False],
-    [203460, "Roberson", "Andre", "Andre Roberson", False],
-    [101194, "Roberson", "Anthony", "Anthony Roberson", False],
-    [77973, "Roberson", "Rick", "Rick Roberson", False],
-    [2121, "Roberson", "Terrance", "Terrance Roberson", False],
-    [77975, "Roberts", "Anthony", "Anthony Roberts", False],
-    [77979, "Roberts", "Bill", "Bill Roberts", False],
-    [203148, "Roberts", "Brian", "Brian Roberts", False],
-    [122, "Roberts", "Fred", "Fred Roberts", False],
-    [77977, "Roberts", "Joe", "Joe Roberts", False],
-    [101160, "Roberts", "Lawrence", "Lawrence Roberts", False],
-    [77978, "Roberts", "Marv", "Marv Roberts", False],
-    [914, "Roberts", "Stanley", "Stanley Roberts", False],
-    [926, "Robertson", "Alvin", "Alvin Robertson", False],
-    [600015, "Robertson", "Oscar", "Oscar Robertson", False],
-    [1926, "Robertson", "Ryan", "Ryan Robertson", False],
-    [77983, "Robertson", "Tony", "Tony Robertson", False],
-    [77984, "Robey", "Rick", "Rick Robey", False],
-    [2774, "Robinson", "Bernard", "Bernard Robinson", False],
-    [997, "Robinson", "Chris", "Chris Robinson", False],
-    [77986, "Robinson", "Cliff T.", "Cliff T. Robinson", False],
-    [361, "Robinson", "Clifford", "Clifford Robinson", False],
-    [764, "Robinson", "David", "David Robinson", False],
-    [1628421, "Robinson", "Devin", "Devin Robinson", False],
-    [1629130, "Robinson", "Duncan", "Duncan Robinson", True],
-    [1944, "Robinson", "Eddie", "Eddie Robinson", False],
-    [77988, "Robinson", "Flynn", "Flynn Robinson", False],
-    [299, "Robinson", "Glenn", "Glenn Robinson", False],
-    [77989, "Robinson", "Jackie", "Jackie Robinson", False],
-    [1554, "Robinson", "Jamal", "Jamal Robinson", False],
-    [381, "Robinson", "James", "James Robinson", False],
-    [1629010, "Robinson", "Jerome", "Jerome Robinson", False],
-    [1629620, "Robinson", "Justin", "Justin Robinson", False],
-    [1683, "Robinson", "Larry", "Larry Robinson", False],
-    [1629011, "Robinson", "Mitchell", "Mitchell Robinson", True],
-    [101126, "Robinson", "Nate", "Nate Robinson", False],
-    [77994, "Robinson", "Oliver", "Oliver Robinson", False],
-    [1631115, "Robinson", "Orlando", "Orlando Robinson", True],
-    [716, "Robinson", "Rumeal", "Rumeal Robinson", False],
-    [203080, "Robinson", "Thomas", "Thomas Robinson", False],
-    [77993, "Robinson", "Truck", "Truck Robinson", False],
-    [77996, "Robinson", "Wayne", "Wayne Robinson", False],
-    [203922, "Robinson III", "Glenn", "Glenn Robinson III", False],
-    [1630526, "Robinson-Earl", "Jeremiah", "Jeremiah Robinson-Earl", True],
-    [77997, "Robinzine", "Bill", "Bill Robinzine", False],
-    [77998, "Robisch", "Dave", "Dave Robisch", False],
-    [1629676, "Roby", "Isaiah", "Isaiah Roby", False],
-    [77999, "Rocha", "Red", "Red Rocha", False],
-    [78000, "Roche", "John", "John Roche", False],
-    [78001, "Rock", "Gene", "Gene Rock", False],
-    [78002, "Rocker", "Jack", "Jack Rocker", False],
-    [1631223, "Roddy", "David", "David Roddy", False],
-    [78003, "Rodgers", "Guy", "Guy Rodgers", False],
-    [23, "Rodman", "Dennis", "Dennis Rodman", False],
-    [200771, "Rodriguez", "Sergio", "Sergio Rodriguez", False],
-    [691, "Roe", "Lou", "Lou Roe", False],
-    [435, "Rogers", "Carlos", "Carlos Rogers", False],
-    [78007, "Rogers", "Johnny", "Johnny Rogers", False],
-    [78008, "Rogers", "Marshall", "Marshall Rogers", False],
-    [915, "Rogers", "Rodney", "Rodney Rogers", False],
-    [964, "Rogers", "Roy", "Roy Rogers", False],
-    [78010, "Roges", "Al", "Al Roges", False],
-    [78011, "Rohloff", "Ken", "Ken Rohloff", False],
-    [202375, "Rolle", "Magnum", "Magnum Rolle", False],
-    [78012, "Rollins", "Kenny", "Kenny Rollins", False],
-    [78013, "Rollins", "Phil", "Phil Rollins", False],
-    [1631157, "Rollins", "Ryan", "Ryan Rollins", True],
-    [78014, "Rollins", "Tree", "Tree Rollins", False],
-    [78015, "Romar", "Lorenzo", "Lorenzo Romar", False],
-    [200765, "Rondo", "Rajon", "Rajon Rondo", False],
-    [399, "Rooks", "Sean", "Sean Rooks", False],
-    [201565, "Rose", "Derrick", "Derrick Rose", False],
-    [147, "Rose", "Jalen", "Jalen Rose", False],
-    [990, "Rose", "Malik", "Malik Rose", False],
-    [78016, "Rose", "Robert", "Robert Rose", False],
-    [78017, "Rosenberg", "Alexander", "Alexander Rosenberg", False],
-    [78018, "Rosenbluth", "Lennie", "Lennie Rosenbluth", False],
-    [78019, "Rosenstein", "Hank", "Hank Rosenstein", False],
-    [78020, "Rosenthal", "Dick", "Dick Rosenthal", False],
-    [2624, "Ross", "Quinton", "Quinton Ross", False],
-    [203082, "Ross", "Terrence", "Terrence Ross", False],
-    [78021, "Roth", "Doug", "Doug Roth", False],
-    [78022, "Roth", "Scott", "Scott Roth", False],
-    [78023, "Rothenberg", "Irv", "Irv Rothenberg", False],
-    [78024, "Rottner", "Mickey", "Mickey Rottner", False],
-    [78025, "Roundfield", "Dan", "Dan Roundfield", False],
-    [78026, "Roux", "Giff", "Giff Roux", False],
-    [78027, "Rowan", "Ron", "Ron Rowan", False],
-    [78028, "Rowe", "Curtis", "Curtis Rowe", False],
-    [1642050, "Rowe", "Jackson", "Jackson Rowe", True],
-    [78029, "Rowinski", "Jim", "Jim Rowinski", False],
-    [78030, "Rowland", "Derrick", "Derrick Rowland", False],
-    [78031, "Rowsom", "Brian", "Brian Rowsom", False],
-    [200750, "Roy", "Brandon", "Brandon Roy", False],
-    [140, "Royal", "Donald", "Donald Royal", False],
-    [78033, "Royer", "Bob", "Bob Royer", False],
-    [32, "Rozier", "Clifford", "Clifford Rozier", False],
-    [1626179, "Rozier", "Terry", "Terry Rozier", True],
-    [201937, "Rubio", "Ricky", "Ricky Rubio", False],
-    [2462, "Rucker", "Guy", "Guy Rucker", False],
-    [78035, "Rudd", "Delaney", "Delaney Rudd", False],
-    [78036, "Rudd", "John", "John Rudd", False],
-    [204014, "Rudez", "Damjan", "Damjan Rudez", False],
-    [78037, "Rudometkin", "John", "John Rudometkin", False],
-    [1913, "Ruffin", "Michael", "Michael Ruffin", False],
-    [460, "Ruffin", "Trevor", "Trevor Ruffin", False],
-    [78039, "Ruffner", "Paul", "Paul Ruffner", False],
-    [78040, "Ruklick", "Joe", "Joe Ruklick", False],
-    [78041, "Ruland", "Jeff", "Jeff Ruland", False],
-    [78042, "Rule", "Bob", "Bob Rule", False],
-    [78043, "Rullo", "Jerry", "Jerry Rullo", False],
-    [1641712, "Rupert", "Rayan", "Rayan Rupert", True],
-    [474, "Rusconi", "Stefano", "Stefano Rusconi", False],
-    [201575, "Rush", "Brandon", "Brandon Rush", False],
-    [2416, "Rush", "Kareem", "Kareem Rush", False],
-    [78049, "Russell", "Bill", "Bill Russell", False],
-    [935, "Russell", "Bryon", "Bryon Russell", False],
-    [78047, "Russell", "Campy", "Campy Russell", False],
-    [78045, "Russell", "Cazzie", "Cazzie Russell", False],
-    [1626156, "Russell", "D'Angelo", "D'Angelo Russell", True],
-    [78046, "Russell", "Frank", "Frank Russell", False],
-    [78048, "Russell", "Walker", "Walker Russell", False],
-    [201041, "Russell", "Walker", "Walker Russell", False],
-    [1630346, "Ryan", "Matt", "Matt Ryan", False],
-    [717, "Sabonis", "Arvydas", "Arvydas Sabonis", False],
-    [1627734, "Sabonis", "Domantas", "Domantas Sabonis", True],
-    [203135, "Sacre", "Robert", "Robert Sacre", False],
-    [78050, "Sadowski", "Ed", "Ed Sadowski", False],
-    [78051, "Sailors", "Kenny", "Kenny Sailors", False],
-    [1642275, "Salaün", "Tidjane", "Tidjane Salaün", True],
-    [927, "Salley", "John", "John Salley", False],
-    [1642282, "Sallis", "Hunter", "Hunter Sallis", True],
-    [2422, "Salmons", "John", "John Salmons", False],
-    [1089, "Salvadori", "Kevin", "Kevin Salvadori", False],
-    [2066, "Samake", "Soumaila", "Soumaila Samake", False],
-    [1629677, "Samanic", "Luka", "Luka Samanic", False],
-    [200798, "Samb", "Cheikh", "Cheikh Samb", False],
-    [1629102, "Sampson", "Brandon", "Brandon Sampson", False],
-    [203960, "Sampson", "JaKarr", "JaKarr Sampson", False],
-    [2441, "Sampson", "Jamal", "Jamal Sampson", False],
-    [78055, "Sampson", "Ralph", "Ralph Sampson", False],
-    [202396, "Samuels", "Samardo", "Samardo Samuels", False],
-    [1631257, "Samuels Jr.", "Jermaine", "Jermaine Samuels Jr.", False],
-    [2143, "Sanchez", "Pepe", "Pepe Sanchez", False],
-    [78057, "Sanders", "Frankie", "Frankie Sanders", False],
-    [1874, "Sanders", "Jeff", "Jeff Sanders", False],
-    [1642920, "Sanders", "Kobe", "Kobe Sanders", True],
-    [202336, "Sanders", "Larry", "Larry Sanders", False],
-    [2684, "Sanders", "Melvin", "Melvin Sanders", False],
-    [78059, "Sanders", "Mike", "Mike Sanders", False],
-    [78060, "Sanders", "Thomas", "Thomas Sanders", False],
-    [1641766, "Sanogo", "Adama", "Adama Sanogo", False],
-    [2091, "Santiago", "Daniel", "Daniel Santiago", False],
-    [78061, "Santini", "Bob", "Bob Santini", False],
-    [1630611, "Santos", "Gui", "Gui Santos", True],
-    [78062, "Sappleton", "Wayne", "Wayne Sappleton", False],
-    [1642879, "Saraf", "Ben", "Ben Saraf", True],
-    [1642259, "Sarr", "Alex", "Alex Sarr", True],
-    [1630846, "Sarr", "Olivier", "Olivier Sarr", False],
-    [987, "Sasser", "Jason", "Jason Sasser", False],
-    [2219, "Sasser", "Jeryl", "Jeryl Sasser", False],
-    [1631204, "Sasser", "Marcus", "Marcus Sasser", True],
-    [203107, "Satoransky", "Tomas", "Tomas Satoransky", False],
-    [2261, "Satterfield", "Kenny", "Kenny Satterfield", False],
-    [78063, "Saul", "Frank", "Frank Saul", False],
-    [78064, "Sauldsberry", "Woody", "Woody Sauldsberry", False],
-    [78065, "Saunders", "Fred", "Fred Saunders", False],
-    [78066, "Savage", "Don", "Don Savage", False],
-    [2453, "Savovic", "Predrag", "Predrag Savovic", False],
-    [78067, "Sawyer", "Alan", "Alan Sawyer", False],
-    [2243, "Scalabrine", "Brian", "Brian Scalabrine", False],
-    [2637, "Scales", "Alex", "Alex Scales", False],
-    [78068, "Scales", "Dewayne", "Dewayne Scales", False],
-    [78069, "Schade", "Frank", "Frank Schade", False],
-    [78070, "Schadler", "Ben", "Ben Schadler", False],
-    [78071, "Schaefer", "Herm", "Herm Schaefer", False],
-    [78072, "Schafer", "Bob", "Bob Schafer", False],
-    [1630648, "Schakel", "Jordan", "Jordan Schakel", False],
-    [78073, "Scharnus", "Ben", "Ben Scharnus", False],
-    [78074, "Schatzman", "Marv", "Marv Schatzman", False],
-    [78075, "Schaus", "Fred", "Fred Schaus", False],
-    [7, "Schayes", "Dan", "Dan Schayes", False],
-    [78076, "Schayes", "Dolph", "Dolph Schayes", False],
-    [78078, "Schectman", "Ossie", "Ossie Schectman", False],
-    [88, "Scheffler", "Steve", "Steve Scheffler", False],
-    [78080, "Scheffler", "Tom", "Tom Scheffler", False],
-    [1631248, "Scheierman", "Baylor", "Baylor Scheierman", True],
-    [78081, "Schellhase", "Dave", "Dave Schellhase", False],
-    [101195, "Schenscher", "Luke", "Luke Schenscher", False],
-    [78082, "Scherer", "Herb", "Herb Scherer", False],
-    [368, "Schintzius", "Dwayne", "Dwayne Schintzius", False],
-    [78084, "Schlueter", "Dale", "Dale Schlueter", False],
-    [78085, "Schnellbacher", "Otto", "Otto Schnellbacher", False],
-    [78086, "Schnittker", "Dick", "Dick Schnittker", False],
-    [78087, "Schoene", "Russ", "Russ Schoene", False],
-    [1629678, "Schofield", "Admiral", "Admiral Schofield", False],
-    [78088, "Scholz", "Dave", "Dave Scholz", False],
-    [78089, "Schoon", "Milt", "Milt Schoon", False],
-    [96, "Schrempf", "Detlef", "Detlef Schrempf", False],
-    [203471, "Schröder", "Dennis", "Dennis Schröder", True],
-    [78091, "Schultz", "Howie", "Howie Schultz", False],
-    [78092, "Schulz", "Dick", "Dick Schulz", False],
-    [78093, "Schweitz", "John", "John Schweitz", False],
-    [2449, "Scola", "Luis", "Luis Scola", False],
-    [78094, "Scolari", "Freddie", "Freddie Scolari", False],
-    [78095, "Scott", "Alvin", "Alvin Scott", False],
-    [1064, "Scott", "Brent", "Brent Scott", False],
-    [2, "Scott", "Byron", "Byron Scott", False],
-    [78097, "Scott", "Charlie", "Charlie Scott", False],
-    [192, "Scott", "Dennis", "Dennis Scott", False],
-    [1109, "Scott", "James", "James Scott", False],
-    [203118, "Scott", "Mike", "Mike Scott", False],
-    [78100, "Scott", "Ray", "Ray Scott", False],
-    [1035, "Scott", "Shawnelle", "Shawnelle Scott", False],
-    [1630286, "Scott", "Trevon", "Trevon Scott", False],
-    [1630206, "Scrubb", "Jay", "Jay Scrubb", False],
-    [78102, "Scurry", "Carey", "Carey Scurry", False],
-    [1631220, "Seabron", "Dereon", "Dereon Seabron", False],
-    [78103, "Seals", "Bruce", "Bruce Seals", False],
-    [1578, "Seals", "Shea", "Shea Seals", False],
-    [907, "Sealy", "Malik", "Malik Sealy", False],
-    [78105, "Searcy", "Ed", "Ed Searcy", False],
-    [78106, "Sears", "Ken", "Ken Sears", False],
-    [1641813, "Sears", "Mark", "Mark Sears", True],
-    [78107, "See", "Wayne", "Wayne See", False],
-    [200757, "Sefolosha", "Thabo", "Thabo Sefolosha", False],
-    [938, "Seikaly", "Rony", "Rony Seikaly", False],
-    [78109, "Selbo", "Glen", "Glen Selbo", False],
-    [202729, "Selby", "Josh", "Josh Selby", False],
-    [1627782, "Selden", "Wayne", "Wayne Selden", False],
-    [78110, "Sellers", "Brad", "Brad Sellers", False],
-    [78111, "Sellers", "Phil", "Phil Sellers", False],
-    [78112, "Seltz", "Rollie", "Rollie Seltz", False],
-    [78113, "Selvy", "Frank", "Frank Selvy", False],
-    [78114, "Seminoff", "Jim", "Jim Seminoff", False],
-    [200754, "Sene", "Mouhamed", "Mouhamed Sene", False],
-    [78115, "Senesky", "George", "George Senesky", False],
-    [1630578, "Sengun", "Alperen", "Alperen Sengun", True],
-    [1641729, "Sensabaugh", "Brice", "Brice Sensabaugh", True],
-    [202338, "Seraphin", "Kevin", "Kevin Seraphin", False],
-    [1738, "Sesay", "Ansu", "Ansu Sesay", False],
-    [201196, "Sessions", "Ramon", "Ramon Sessions", False],
-    [78116, "Sewell", "Tom", "Tom Sewell", False],
-    [1629012, "Sexton", "Collin", "Collin Sexton", True],
-    [78117, "Seymour", "Paul", "Paul Seymour", False],
-    [78118, "Shaback", "Nick", "Nick Shaback", False],
-    [1593, "Shackleford", "Charles", "Charles Shackleford", False],
-    [78120, "Shaeffer", "Carl", "Carl Shaeffer", False],
-    [78121, "Shaffer", "Lee", "Lee Shaffer", False],
-    [201203, "Shakur", "Mustafa", "Mustafa Shakur", False],
-    [1629013, "Shamet", "Landry", "Landry Shamet", True],
-    [1539, "Shammgod", "God", "God Shammgod", False],
-    [78123, "Shannon", "Earl", "Earl Shannon", False],
-    [78124, "Shannon", "Howie", "Howie Shannon", False],
-    [1630545, "Shannon Jr.", "Terrence", "Terrence Shannon Jr.", True],
-    [78125, "Share", "Charlie", "Charlie Share", False],
-    [78126, "Sharman", "Bill", "Bill Sharman", False],
-    [1630549, "Sharpe", "Day'Ron", "Day'Ron Sharpe", True],
-    [1631101, "Sharpe", "Shaedon", "Shaedon Sharpe", True],
-    [201594, "Sharpe", "Walter", "Walter Sharpe", False],
-    [1117, "Shasky", "John", "John Shasky", False],
-    [78128, "Shavlik", "Ron", "Ron Shavlik", False],
-    [216, "Shaw", "Brian", "Brian Shaw", False],
-    [1745, "Shaw", "Casey", "Casey Shaw", False],
-    [1629621, "Shayok", "Marial", "Marial Shayok", False],
-    [78130, "Shea", "Bob", "Bob Shea", False],
-    [1642347, "Shead", "Jamal", "Jamal Shead", True],
-    [78131, "Sheffield", "Fred", "Fred Sheffield", False],
-    [78132, "Shelton", "Craig", "Craig Shelton", False],
-    [78133, "Shelton", "Lonnie", "Lonnie Shelton", False],
-    [203129, "Shengelia", "Tornike", "Tornike Shengelia", False],
-    [1641767, "Sheppard", "Ben", "Ben Sheppard", True],
-    [1852, "Sheppard", "Jeff", "Jeff Sheppard", False],
-    [1642263, "Sheppard", "Reed", "Reed Sheppard", True],
-    [78135, "Sheppard", "Steve", "Steve Sheppard", False],
-    [78136, "Sherod", "Edmund", "Edmund Sherod", False],
-    [78653, "Shipp", "Charlie", "Charlie Shipp", False],
-    [2321, "Shirley", "Paul", "Paul Shirley", False],
-    [78138, "Short", "Gene", "Gene Short", False],
-    [78139, "Short", "Purvis", "Purvis Short", False],
-    [78140, "Shouse", "Dexter", "Dexter Shouse", False],
-    [78141, "Shrider", "Dick", "Dick Shrider", False],
-    [78142, "Shue", "Gene", "Gene Shue", False],
-    [1642917, "Shulga", "Max", "Max Shulga", True],
-    [78143, "Shumate", "John", "John Shumate", False],
-    [202697, "Shumpert", "Iman", "Iman Shumpert", False],
-    [203144, "Shved", "Alexey", "Alexey Shved", False],
-    [1627783, "Siakam", "Pascal", "Pascal Siakam", True],
-    [1626296, "Sibert", "Jordan", "Jordan Sibert", False],
-    [78144, "Sibert", "Sam", "Sam Sibert", False],
-    [78145, "Sibley", "Mark", "Mark Sibley", False],
-    [78146, "Sichting", "Jerry", "Jerry Sichting", False],
-    [78147, "Siegfried", "Larry", "Larry Siegfried", False],
-    [78148, "Siewert", "Ralph", "Ralph Siewert", False],
-    [78149, "Sikma", "Jack", "Jack Sikma", False],
-    [78150, "Silas", "James", "James Silas", False],
-    [78151, "Silas", "Paul", "Paul Silas", False],
-    [202918, "Silas", "Xavier", "Xavier Silas", False],
-    [202081, "Siler", "Garret", "Garret Siler", False],
-    [78152, "Silliman", "Mike", "Mike Silliman", False],
-    [1629735, "Silva", "Chris", "Chris Silva", False],
-    [101134, "Simien", "Wayne", "Wayne Simien", False],
-    [1627732, "Simmons", "Ben", "Ben Simmons", False],
-    [2250, "Simmons", "Bobby", "Bobby Simmons", False],
-    [200759, "Simmons", "Cedric", "Cedric Simmons", False],
-    [78153, "Simmons", "Connie", "Connie Simmons", False],
-    [78154, "Simmons", "Johnny", "Johnny Simmons", False],
-    [203613, "Simmons", "Jonathon", "Jonathon Simmons", False],
-    [1628424, "Simmons", "Kobi", "Kobi Simmons", False],
-    [1489, "Simmons", "Lionel", "Lionel Simmons", False],
-    [1750, "Simon", "Miles", "Miles Simon", False],
-    [1630250, "Simonovic", "Marko", "Marko Simonovic", False],
-    [1629014, "Simons", "Anfernee", "Anfernee Simons", True],
-    [54, "Simpkins", "Dickey", "Dickey Simpkins", False],
-    [202067, "Simpson", "Diamon", "Diamon Simpson", False],
-    [1642354, "Simpson", "KJ", "KJ Simpson", True],
-    [78157, "Simpson", "Ralph", "Ralph Simpson", False],
-    [1630285, "Simpson", "Zavier", "Zavier Simpson", False],
-    [1591, "Sims", "Alvin", "Alvin Sims", False],
-    [78160, "Sims", "Bob", "Bob Sims", False],
-    [201235, "Sims", "Courtney", "Courtney Sims", False],
-    [78159, "Sims", "Doug", "Doug Sims", False],
-    [203156, "Sims", "Henry", "Henry Sims", False],
-    [1631301, "Sims", "Jaylen", "Jaylen Sims", False],
-    [1630579, "Sims", "Jericho", "Jericho Sims", True],
-    [78161, "Sims", "Scott", "Scott Sims", False],
-    [202713, "Singler", "Kyle", "Kyle Singler", False],
-    [201606, "Singletary", "Sean", "Sean Singletary", False],
-    [202698, "Singleton", "Chris", "Chris Singleton", False],
-    [101189, "Singleton", "James", "James Singleton", False],
-    [78162, "Singleton", "Mckinley", "Mckinley Singleton", False],
-    [78163, "Sinicola", "Zeke", "Zeke Sinicola", False],
-    [1629686, "Sirvydis", "Deividas", "Deividas Sirvydis", False],
-    [78164, "Sitton", "Charlie", "Charlie Sitton", False],
-    [203491, "Siva", "Peyton", "Peyton Siva", False],
-    [1631376, "Skapintsev", "Dmytro", "Dmytro Skapintsev", False],
-    [101, "Skiles", "Scott", "Scott Skiles", False],
-    [78167, "Skinner", "Al", "Al Skinner", False],
-    [1730, "Skinner", "Brian", "Brian Skinner", False],
-    [78168, "Skinner", "Talvin", "Talvin Skinner", False],
-    [78169, "Skoog", "Whitey", "Whitey Skoog", False],
-    [78170, "Slade", "Jeff", "Jeff Slade", False],
-    [1073, "Slater", "Reggie", "Reggie Slater", False],
-    [78171, "Slaughter", "Jim", "Jim Slaughter", False],
-    [78172, "Slaughter", "Jose", "Jose Slaughter", False],
-    [1641771, "Slawson", "Jalen", "Jalen Slawson", False],
-    [2447, "Slay", "Tamar", "Tamar Slay", False],
-    [202388, "Sloan", "Donald", "Donald Sloan", False],
-    [78173, "Sloan", "Jerry", "Jerry Sloan", False],
-    [101166, "Slokar", "Uros", "Uros Slokar", False],
-    [78174, "Sluby", "Tom", "Tom Sluby", False],
-    [1629346, "Smailagic", "Alen", "Alen Smailagic", False],
-    [1642914, "Small", "Javon", "Javon Small", True],
-    [1630606, "Smart", "Javonte", "Javonte Smart", False],
-    [78175, "Smart", "Keith", "Keith Smart", False],
-    [203935, "Smart", "Marcus", "Marcus Smart", True],
-    [78176, "Smawley", "Belus", "Belus Smawley", False],
-    [78177, "Smiley", "Jack", "Jack Smiley", False],
-    [78178, "Smith", "Adrian", "Adrian Smith", False],
-    [78207, "Smith", "Bill", "Bill Smith", False],
-    [78209, "Smith", "Bill", "Bill Smith", False],
-    [78202, "Smith", "Bingo", "Bingo Smith", False],
-    [78203, "Smith", "Bobby", "Bobby Smith", False],
-    [293, "Smith", "Charles", "Charles Smith", False],
-    [1520, "Smith", "Charles", "Charles Smith", False],
-    [78179, "Smith", "Charles", "Charles Smith", False],
-    [1814, "Smith", "Chris", "Chris Smith", False],
-    [203147, "Smith", "Chris", "Chris Smith", False],
-    [78181, "Smith", "Clinton", "Clinton Smith", False],
-    [200783, "Smith", "Craig", "Craig Smith", False],
-    [78182, "Smith", "Deb", "Deb Smith", False],
-    [78183, "Smith", "Derek", "Derek Smith", False],
-    [78184, "Smith", "Don", "Don Smith", False],
-    [78185, "Smith", "Donald", "Donald Smith", False],
-    [2764, "Smith", "Donta", "Donta Smith", False],
-    [475, "Smith", "Doug", "Doug Smith", False],
-    [1630696, "Smith", "Dru", "Dru Smith", True],
-    [78187, "Smith", "Ed", "Ed Smith", False],
-    [78188, "Smith", "Elmore", "Elmore Smith", False],
-    [78189, "Smith", "Garfield", "Garfield Smith", False],
-    [78190, "Smith", "Greg", "Greg Smith", False],
-    [202962, "Smith", "Greg", "Greg Smith", False],
-    [202397, "Smith", "Ish", "Ish Smith", False],
-    [2747, "Smith", "JR", "JR Smith", False],
-    [2074, "Smith", "Jabari", "Jabari Smith", False],
-    [1630188, "Smith", "Jalen", "Jalen Smith", True],
-    [201160, "Smith", "Jason", "Jason Smith", False],
-    [202536, "Smith", "Jerry", "Jerry Smith", False],
-    [78191, "Smith", "Jim", "Jim Smith", False],
-    [693, "Smith", "Joe", "Joe Smith", False],
-    [2746, "Smith", "Josh", "Josh Smith", False],
-    [78192, "Smith", "Keith", "Keith Smith", False],
-    [181, "Smith", "Kenny", "Kenny Smith", False],
-    [78194, "Smith", "Labradford", "Labradford Smith", False],
-    [78195, "Smith", "Larry", "Larry Smith", False],
-    [1910, "Smith", "Leon", "Leon Smith", False],
-    [63, "Smith", "Michael", "Michael Smith", False],
-    [78197, "Smith", "Michael", "Michael Smith", False],
-    [2065, "Smith", "Mike", "Mike Smith", False],
-    [202701, "Smith", "Nolan", "Nolan Smith", False],
-    [78198, "Smith", "Otis", "Otis Smith", False],
-    [78199, "Smith", "Phil", "Phil Smith", False],
-    [78200, "Smith", "Randy", "Randy Smith", False],
-    [78201, "Smith", "Reggie", "Reggie Smith", False],
-    [78204, "Smith", "Robert", "Robert Smith", False],
-    [203893, "Smith", "Russ", "Russ Smith", False],
-    [78205, "Smith", "Sammy", "Sammy Smith", False],
-    [120, "Smith", "Steven", "Steven Smith", False],
-    [200848, "Smith", "Steven", "Steven Smith", False],
-    [1478, "Smith", "Stevin", "Stevin Smith", False],
-    [1631173, "Smith", "Terquavion", "Terquavion Smith", False],
-    [2604, "Smith", "Theron", "Theron Smith", False],
-    [1642449, "Smith", "Tolu", "Tolu Smith", True],
-    [380, "Smith", "Tony", "Tony Smith", False],
-    [1641890, "Smith", "Tyler", "Tyler Smith", False],
-    [78208, "Smith", "Willie", "Willie Smith", False],
-    [1629015, "Smith", "Zhaire", "Zhaire Smith", False],
-    [1628372, "Smith Jr.", "Dennis", "Dennis Smith Jr.", False],
-    [1631095, "Smith Jr.", "Jabari", "Jabari Smith Jr.", True],
-    [1641733, "Smith Jr.", "Nick", "Nick Smith Jr.", True],
-    [22, "Smits", "Rik", "Rik Smits", False],
-    [1091, "Smrek", "Mike", "Mike Smrek", False],
-    [78212, "Smyth", "Joe", "Joe Smyth", False],
-    [1630270, "Sneed", "Xavier", "Xavier Sneed", False],
-    [203503, "Snell", "Tony", "Tony Snell", False],
-    [727, "Snow", "Eric", "Eric Snow", False],
-    [78213, "Snyder", "Dick", "Dick Snyder", False],
-    [2745, "Snyder", "Kirk", "Kirk Snyder", False],
-    [78214, "Sobek", "George", "George Sobek", False],
-    [78215, "Sobers", "Ricky", "Ricky Sobers", False],
-    [78216, "Sobie", "Ron", "Ron Sobie", False],
-    [1631110, "Sochan", "Jeremy", "Jeremy Sochan", True],
-    [78217, "Sojourner", "Mike", "Mike Sojourner", False],
-    [2226, "Solomon", "Will", "Will Solomon", False],
-    [78219, "Somerset", "Willie", "Willie Somerset", False],
-    [2443, "Songaila", "Darius", "Darius Songaila", False],
-    [1642850, "Sorber", "Thomas", "Thomas Sorber", True],
-    [78220, "Sorenson", "Dave", "Dave Sorenson", False],
-    [203480, "Southerland", "James", "James Southerland", False],
-    [78221, "Sovran", "Gino", "Gino Sovran", False],
-    [2776, "Sow", "Pape", "Pape Sow", False],
-    [1629034, "Spalding", "Ray", "Ray Spalding", False],
-    [78222, "Spanarkel", "Jim", "Jim Spanarkel", False],
-    [2779, "Spanoulis", "Vassilis", "Vassilis Spanoulis", False],
-    [78223, "Sparrow", "Guy", "Guy Sparrow", False],
-    [600009, "Sparrow", "Rory", "Rory Sparrow", False],
-    [78225, "Spears", "Odie", "Odie Spears", False],
-    [78226, "Spector", "Art", "Art Spector", False],
-    [201578, "Speights", "Marreese", "Marreese Speights", False],
-    [1629016, "Spellman", "Omari", "Omari Spellman", False],
-    [78227, "Spencer", "Andre", "Andre Spencer", False],
-    [1642285, "Spencer", "Cam", "Cam Spencer", True],
-    [771, "Spencer", "Elmore", "Elmore Spencer", False],
-    [280, "Spencer", "Felton", "Felton Spencer", False],
-    [1630311, "Spencer", "Pat", "Pat Spencer", True],
-    [78230, "Spicer", "Lou", "Lou Spicer", False],
-    [78231, "Spitzer", "Craig", "Craig Spitzer", False],
-    [201168, "Splitter", "Tiago", "Tiago Splitter", False],
-    [78232, "Spoelstra", "Art", "Art Spoelstra", False],
-    [84, "Sprewell", "Latrell", "Latrell Sprewell", False],
-    [78233, "Spriggs", "Larry", "Larry Spriggs", False],
-    [1630531, "Springer", "Jaden", "Jaden Springer", False],
-    [78234, "Springer", "Jim", "Jim Springer", False],
-    [78235, "Spruill", "Jim", "Jim Spruill", False],
-    [1756, "Stack", "Ryan", "Ryan Stack", False],
-    [711, "Stackhouse", "Jerry", "Jerry Stackhouse", False],
-    [78237, "Stacom", "Kevin", "Kevin Stacom", False],
-    [78238, "Stallworth", "Dave", "Dave Stallworth", False],
-    [78239, "Stallworth", "Isaac", "Isaac Stallworth", False],
-    [78240, "Stanczak", "Ed", "Ed Stanczak", False],
-    [1630199, "Stanley", "Cassius", "Cassius Stanley", False],
-    [78241, "Stansbury", "Terence", "Terence Stansbury", False],
-    [317, "Starks", "John", "John Starks", False],
-    [78243, "Starr", "Keith", "Keith Starr", False],
-    [203917, "Stauskas", "Nik", "Nik Stauskas", False],
-    [78244, "Staverman", "Larry", "Larry Staverman", False],
-    [78245, "Steele", "Larry", "Larry Steele", False],
-    [1099, "Steigenga", "Matt", "Matt Steigenga", False],
-    [1735, "Stepania", "Vladimir", "Vladimir Stepania", False],
-    [203474, "Stephens", "DJ", "DJ Stephens", False],
-    [78247, "Stephens", "Everette", "Everette Stephens", False],
-    [78249, "Stephens", "Jack", "Jack Stephens", False],
-    [1086, "Stephens", "Joe", "Joe Stephens", False],
-    [202362, "Stephenson", "Lance", "Lance Stephenson", False],
-    [1627293, "Stepheson", "Alex", "Alex Stepheson", False],
-    [78250, "Steppe", "Brook", "Brook Steppe", False],
-    [78251, "Stevens", "Barry", "Barry Stevens", False],
-    [1641815, "Stevens", "Isaiah", "Isaiah Stevens", True],
-    [1630205, "Stevens", "Lamar", "Lamar Stevens", False],
-    [78252, "Stevens", "Wayne", "Wayne Stevens", False],
-    [2052, "Stevenson", "DeShawn", "DeShawn Stevenson", False],
-    [1630597, "Stewart", "DJ", "DJ Stewart", False],
-    [78253, "Stewart", "Dennis", "Dennis Stewart", False],
-    [1630191, "Stewart", "Isaiah", "Isaiah Stewart", True],
-    [1529, "Stewart", "Kebu", "Kebu Stewart", False],
-    [1125, "Stewart", "Larry", "Larry Stewart", False],
-    [1565, "Stewart", "Michael", "Michael Stewart", False],
-    [78256, "Stewart", "Norm", "Norm Stewart", False],
-    [201880, "Stiemsma", "Greg", "Greg Stiemsma", False],
-    [78257, "Stipanovich", "Steve", "Steve Stipanovich", False],
-    [179, "Stith", "Bryant", "Bryant Stith", False],
-    [78259, "Stith", "Sam", "Sam Stith", False],
-    [78260, "Stith", "Tom", "Tom Stith", False],
-    [78261, "Stivrins", "Alex", "Alex Stivrins", False],
-    [204065, "Stockton", "David", "David Stockton", False],
-    [304, "Stockton", "John", "John Stockton", False],
-    [978, "Stojakovic", "Peja", "Peja Stojakovic", False],
-    [1055, "Stokes", "Ed", "Ed Stokes", False],
-    [78264, "Stokes", "Greg", "Greg Stokes", False],
-    [203950, "Stokes", "Jarnell", "Jarnell Stokes", False],
-    [600016, "Stokes", "Maurice", "Maurice Stokes", False],
-    [78266, "Stolkey", "Art", "Art Stolkey", False],
-    [1627754, "Stone", "Diamond", "Diamond Stone", False],
-    [202933, "Stone", "Julyan", "Julyan Stone", False],
-    [2852, "Storey", "Awvee", "Awvee Storey", False],
-    [757, "Stoudamire", "Damon", "Damon Stoudamire", False],
-    [101136, "Stoudamire", "Salim", "Salim Stoudamire", False],
-    [2405, "Stoudemire", "Amar'e", "Amar'e Stoudemire", False],
-    [78267, "Stovall", "Paul", "Paul Stovall", False],
-    [201199, "Strawberry", "DJ", "DJ Strawberry", False],
-    [78268, "Strawder", "Joe", "Joe Strawder", False],
-    [1631124, "Strawther", "Julian", "Julian Strawther", True],
-    [78269, "Stricker", "Bill", "Bill Stricker", False],
-    [1065, "Strickland", "Erick", "Erick Strickland", False],
-    [1110, "Strickland", "Mark", "Mark Strickland", False],
-    [393, "Strickland", "Rod", "Rod Strickland", False],
-    [78270, "Strickland", "Roger", "Roger Strickland", False],
-    [78271, "Stroeder", "John", "John Stroeder", False],
-    [400, "Strong", "Derek", "Derek Strong", False],
-    [78273, "Strothers", "Lamont", "Lamont Strothers", False],
-    [78274, "Stroud", "John", "John Stroud", False],
-    [1629622, "Strus", "Max", "Max Strus", True],
-    [201155, "Stuckey", "Rodney", "Rodney Stuckey", False],
-    [78275, "Stump", "Gene", "Gene Stump", False],
-    [78276, "Stutz", "Stan", "Stan Stutz", False],
-    [1630591, "Suggs", "Jalen", "Jalen Suggs", True],
-    [78277, "Suiter", "Gary", "Gary Suiter", False],
-    [203096, "Sullinger", "Jared", "Jared Sullinger", False],
-    [201969, "Summers", "DaJuan", "DaJuan Summers", False],
-    [1628410, "Sumner", "Edmond", "Edmond Sumner", False],
-    [78654, "Sumpter", "Barry", "Barry Sumpter", False],
-    [201180, "Sun", "Yue", "Sun Yue", False],
-    [78278, "Sunderlage", "Don", "Don Sunderlage", False],
-    [1743, "Sundov", "Bruno", "Bruno Sundov", False],
-    [78279, "Sundvold", "Jon", "Jon Sundvold", False],
-    [682, "Sura", "Bob", "Bob Sura", False],
-    [78280, "Surhoff", "Dick", "Dick Surhoff", False],
-    [78281, "Suttle", "Dane", "Dane Suttle", False],
-    [357, "Sutton", "Greg", "Greg Sutton", False],
-    [78283, "Swain", "Bennie", "Bennie Swain", False],
-    [1628403, "Swanigan", "Caleb", "Caleb Swanigan", False],
-    [78284, "Swanson", "Norm", "Norm Swanson", False],
-    [78285, "Swartz", "Dan", "Dan Swartz", False],
-    [2552, "Sweetney", "Michael", "Michael Sweetney", False],
-    [1631306, "Swider", "Cole", "Cole Swider", False],
-    [2741, "Swift", "Robert", "Robert Swift", False],
-    [2031, "Swift", "Stromile", "Stromile Swift", False],
-    [78286, "Swinson", "Aaron", "Aaron Swinson", False],
-    [1628591, "Sword", "Craig", "Craig Sword", False],
-    [202377, "Sy", "Pape", "Pape Sy", False],
-    [78287, "Sydnor", "Wallace", "Wallace Sydnor", False],
-    [1626208, "Sykes", "Keifer", "Keifer Sykes", False],
-    [1132, "Sykes", "Larry", "Larry Sykes", False],
-    [1136, "Szabo", "Brett", "Brett Szabo", False],
-    [1887, "Szczerbiak", "Wally", "Wally Szczerbiak", False],
-    [440, "Tabak", "Zan", "Zan Tabak", False],
-    [2657, "Tabuse", "Yuta", "Yuta Tabuse", False],
-    [101147, "Taft", "Chris", "Chris Taft", False],
-    [78291, "Tannenbaum", "Sid", "Sid Tannenbaum", False],
-    [1434, "Tarlac", "Dragan", "Dragan Tarlac", False],
-    [78293, "Tarpley", "Roy", "Roy Tarpley", False],
-    [1630256, "Tate", "Jae'Sean", "Jae'Sean Tate", True],
-    [78294, "Tatum", "Earl", "Earl Tatum", False],
-    [1628369, "Tatum", "Jayson", "Jayson Tatum", True],
-    [204002, "Tavares", "Edy", "Edy Tavares", False],
-    [78295, "Taylor", "Anthony", "Anthony Taylor", False],
-    [78296, "Taylor", "Brian", "Brian Taylor", False],
-    [101182, "Taylor", "Donell", "Donell Taylor", False],
-    [78298, "Taylor", "Fred", "Fred Taylor", False],
-    [1627819, "Taylor", "Isaiah", "Isaiah Taylor", False],
-    [78297, "Taylor", "Jay", "Jay Taylor", False],
-    [78299, "Taylor", "Jeff", "Jeff Taylor", False],
-    [203106, "Taylor", "Jeffery", "Jeffery Taylor", False],
-    [201966, "Taylor", "Jermaine", "Jermaine Taylor", False],
-    [1511, "Taylor", "Johnny", "Johnny Taylor", False],
-    [78301, "Taylor", "Leonard", "Leonard Taylor", False],
-    [1508, "Taylor", "Maurice", "Maurice Taylor", False],
-    [201446, "Taylor", "Mike", "Mike Taylor", False],
-    [78302, "Taylor", "Roland", "Roland Taylor", False],
-    [1630678, "Taylor", "Terry", "Terry Taylor", False],
-    [203116, "Taylor", "Tyshawn", "Tyshawn Taylor", False],
-    [78303, "Taylor", "Vince", "Vince Taylor", False],
-    [78304, "Teagle", "Terry", "Terry Teagle", False],
-    [201952, "Teague", "Jeff", "Jeff Teague", False],
-    [203104, "Teague", "Marquis", "Marquis Teague", False],
-    [203141, "Teletovic", "Mirza", "Mirza Teletovic", False],
-    [2742, "Telfair", "Sebastian", "Sebastian Telfair", False],
-    [1643141, "Telfort", "Jahmyl", "Jahmyl Telfort", True],
-    [202066, "Temple", "Garrett", "Garrett Temple", True],
-    [1628462, "Teodosic", "Milos", "Milos Teodosic", False],
-    [78305, "Terrell", "Ira", "Ira Terrell", False],
-    [1629123, "Terrell", "Jared", "Jared Terrell", False],
-    [78307, "Terry", "Carlos", "Carlos Terry", False],
-    [78306, "Terry", "Chuck", "Chuck Terry", False],
-    [78308, "Terry", "Claude", "Claude Terry", False],
-    [1631207, "Terry", "Dalen", "Dalen Terry", True],
-    [1629150, "Terry", "Emanuel", "Emanuel Terry", False],
-    [1891, "Terry", "Jason", "Jason Terry", False],
-    [1630179, "Terry", "Tyrell", "Tyrell Terry", False],
-    [1630257, "Teske", "Jon", "Jon Teske", False],
-    [201934, "Thabeet", "Hasheem", "Hasheem Thabeet", False],
-    [78309, "Thacker", "Tom", "Tom Thacker", False],
-    [1628464, "Theis", "Daniel", "Daniel Theis", False],
-    [78310, "Theus", "Reggie", "Reggie Theus", False],
-    [78311, "Thibeaux", "Peter", "Peter Thibeaux", False],
-    [78312, "Thieben", "Bill", "Bill Thieben", False],
-    [1642876, "Thiero", "Adou", "Adou Thiero", True],
-    [78313, "Thigpen", "Justus", "Justus Thigpen", False],
-    [78314, "Thirdkill", "David", "David Thirdkill", False],
-    [203519, "Thomas", "Adonis", "Adonis Thomas", False],
-    [2873, "Thomas", "Billy", "Billy Thomas", False],
-    [1630271, "Thomas", "Brodric", "Brodric Thomas", False],
-    [1630560, "Thomas", "Cam", "Cam Thomas", True],
-    [1063, "Thomas", "Carl", "Carl Thomas", False],
-    [78316, "Thomas", "Charles", "Charles Thomas", False],
-    [2041, "Thomas", "Etan", "Etan Thomas", False],
-    [78317, "Thomas", "Irving", "Irving Thomas", False],
-    [202738, "Thomas", "Isaiah", "Isaiah Thomas", False],
-    [78318, "Thomas", "Isiah", "Isiah Thomas", False],
-    [1975, "Thomas", "Jamel", "Jamel Thomas", False],
-    [2839, "Thomas", "James", "James Thomas", False],
-    [78320, "Thomas", "Jim", "Jim Thomas", False],
-    [78321, "Thomas", "Joe", "Joe Thomas", False],
-    [1519, "Thomas", "John", "John Thomas", False],
-    [1903, "Thomas", "Kenny", "Kenny Thomas", False],
-    [1629017, "Thomas", "Khyri", "Khyri Thomas", False],
-    [703, "Thomas", "Kurt", "Kurt Thomas", False],
-    [202498, "Thomas", "Lance", "Lance Thomas", False],
-    [202952, "Thomas", "Malcolm", "Malcolm Thomas", False],
-    [1629744, "Thomas", "Matt", "Matt Thomas", False],
-    [78322, "Thomas", "Terry", "Terry Thomas", False],
-    [1501, "Thomas", "Tim", "Tim Thomas", False],
-    [200748, "Thomas", "Tyrus", "Tyrus Thomas", False],
-    [202717, "Thompkins", "Trey", "Trey Thompkins", False],
-    [1641708, "Thompson", "Amen", "Amen Thompson", True],
-    [1641709, "Thompson", "Ausar", "Ausar Thompson", True],
-    [78323, "Thompson", "Bernard", "Bernard Thompson", False],
-    [1631, "Thompson", "Billy", "Billy Thompson", False],
-    [240, "Thompson", "Brooks", "Brooks Thompson", False],
-    [78325, "Thompson", "Corny", "Corny Thompson", False],
-    [78326, "Thompson", "David", "David Thompson", False],
-    [101159, "Thompson", "Dijon", "Dijon Thompson", False],
-    [1630679, "Thompson", "Ethan", "Ethan Thompson", False],
-    [78327, "Thompson", "George", "George Thompson", False],
-    [203138, "Thompson", "Hollis", "Hollis Thompson", False],
-    [201574, "Thompson", "Jason", "Jason Thompson", False],
-    [78328, "Thompson", "John", "John Thompson", False],
-    [78329, "Thompson", "Kevin", "Kevin Thompson", False],
-    [202691, "Thompson", "Klay", "Klay Thompson", True],
-    [78, "Thompson", "LaSalle", "LaSalle Thompson", False],
-    [78331, "Thompson", "Mychal", "Mychal Thompson", False],
-    [202814, "Thompson", "Mychel", "Mychel Thompson", False],
-    [78332, "Thompson", "Paul", "Paul Thompson", False],
-    [78333, "Thompson", "Stephen", "Stephen Thompson", False],
-    [202684, "Thompson", "Tristan", "Tristan Thompson", False],
-    [1630550, "Thor", "JT", "JT Thor", False],
-    [78335, "Thorn", "Rod", "Rod Thorn", False],
-    [201154, "Thornton", "Al", "Al Thornton", False],
-    [738, "Thornton", "Bob", "Bob Thornton", False],
-    [201977, "Thornton", "Marcus", "Marcus Thornton", False],
-    [1628414, "Thornwell", "Sindarius", "Sindarius Thornwell", False],
-    [901, "Thorpe", "Otis", "Otis Thorpe", False],
-    [9, "Threatt", "Sedale", "Sedale Threatt", False],
-    [600001, "Thurmond", "Nate", "Nate Thurmond", False],
-    [78340, "Thurston", "Mel", "Mel Thurston", False],
-    [1629680, "Thybulle", "Matisse", "Matisse Thybulle", True],
-    [78341, "Tidrick", "Howard", "Howard Tidrick", False],
-    [78342, "Tieman", "Dan", "Dan Tieman", False],
-    [1629681, "Tillie", "Killian", "Killian Tillie", False],
-    [78343, "Tillis", "Darren", "Darren Tillis", False],
-    [1630214, "Tillman", "Xavier", "Xavier Tillman", True],
-    [1631166, "Timme", "Drew", "Drew Timme", False],
-    [78344, "Tingle", "Jack", "Jack Tingle", False],
-    [2224, "Tinsley", "Jamaal", "Jamaal Tinsley", False],
-    [47, "Tisdale", "Wayman", "Wayman Tisdale", False],
-    [1627861, "Tobey", "Mike", "Mike Tobey", False],
-    [1630225, "Todd", "Isaiah", "Isaiah Todd", False],
-    [78346, "Todorovich", "Marko", "Marko Todorovich", False],
-    [78348, "Tolbert", "Ray", "Ray Tolbert", False],
-    [78347, "Tolbert", "Tom", "Tom Tolbert", False],
-    [201229, "Tolliver", "Anthony", "Anthony Tolliver", False],
-    [78349, "Tolson", "Dean", "Dean Tolson", False],
-    [78350, "Tomjanovich", "Rudy", "Rudy Tomjanovich", False],
-    [1641772, "Tomlin", "Nae'Qwan", "Nae'Qwan Tomlin", True],
-    [78351, "Toney", "Andrew", "Andrew Toney", False],
-    [78352, "Toney", "Sedric", "Sedric Toney", False],
-    [1642910, "Tonje", "John", "John Tonje", True],
-    [78353, "Tonkovich", "Andy", "Andy Tonkovich", False],
-    [1642893, "Toohey", "Alex", "Alex Toohey", True],
-    [342, "Toolson", "Andy", "Andy Toolson", False],
-    [78355, "Toomay", "Jack", "Jack Toomay", False],
-    [78356, "Toone", "Bernard", "Bernard Toone", False],
-    [1642260, "Topić", "Nikola", "Nikola Topić", True],
-    [1631210, "Toppin", "Jacob", "Jacob Toppin", True],
-    [1630167, "Toppin", "Obi", "Obi Toppin", True],
-    [78357, "Torgoff", "Irv", "Irv Torgoff", False],
-    [78358, "Tormohlen", "Gene", "Gene Tormohlen", False],
-    [2351, "Torres", "Oscar", "Oscar Torres", False],
-    [1629308, "Toscano-Anderson", "Juan", "Juan Toscano-Anderson", False],
-    [78359, "Tosheff", "Bill", "Bill Tosheff", False],
-    [78360, "Tough", "Bob", "Bob Tough", False],
-    [1626253, "Toupane", "Axel", "Axel Toupane", False],
-    [78361, "Towe", "Monte", "Monte Towe", False],
-    [700, "Tower", "Keith", "Keith Tower", False],
-    [78363, "Towery", "William", "William Towery", False],
-    [78364, "Townes", "Linton", "Linton Townes", False],
-    [1626157, "Towns", "Karl-Anthony", "Karl-Anthony Towns", True],
-    [78365, "Townsend", "Raymond", "Raymond Townsend", False],
-    [1642422, "Traore", "Armel", "Armel Traore", False],
-    [1642849, "Traore", "Nolan", "Nolan Traore", True],
-    [78366, "Trapp", "George", "George Trapp", False],
-    [78367, "Trapp", "John", "John Trapp", False],
-    [1631247, "Travers", "Luke", "Luke Travers", True],
-    [1714, "Traylor", "Robert", "Robert Traylor", False],
-    [718, "Trent", "Gary", "Gary Trent", False],
-    [1629018, "Trent Jr.", "Gary", "Gary Trent Jr.", True],
-    [2244, "Trepagnier", "Jeff", "Jeff Trepagnier", False],
-    [78651, "Tresvant", "John", "John Tresvant", False],
-    [1629019, "Trier", "Allonzo", "Allonzo Trier", False],
-    [78368, "Triptow", "Dick", "Dick Triptow", False],
-    [78369, "Tripucka", "Kelly", "Kelly Tripucka", False],
-    [2456, "Trybanski", "Cezary", "Cezary Trybanski", False],
-    [2054, "Tsakalidis", "Jake", "Jake Tsakalidis", False],
-    [78370, "Tschogl", "John", "John Tschogl", False],
-    [1631131, "Tshiebwe", "Oscar", "Oscar Tshiebwe", True],
-    [78371, "Tsioropoulos", "Lou", "Lou Tsioropoulos", False],
-    [2401, "Tskitishvili", "Nikoloz", "Nikoloz Tskitishvili", False],
-    [78372, "Tucker", "Al", "Al Tucker", False],
-    [201169, "Tucker", "Alando", "Alando Tucker", False],
-    [141, "Tucker", "Anthony", "Anthony Tucker", False],
-    [78374, "Tucker", "Jim", "Jim Tucker", False],
-    [200782, "Tucker", "P.J.", "P.J. Tucker", False],
-    [1629730, "Tucker", "Rayjon", "Rayjon Tucker", False],
-    [78375, "Tucker", "Trent", "Trent Tucker", False],
-    [101142, "Turiaf", "Ronny", "Ronny Turiaf", False],
-    [1726, "Turkcan", "Mirsad", "Mirsad Turkcan", False],
-    [2045, "Turkoglu", "Hedo", "Hedo Turkoglu", False],
-    [78377, "Turner", "Andre", "Andre Turner", False],
-    [78385, "Turner", "Bill", "Bill Turner", False],
-    [78378, "Turner", "Elston", "Elston Turner", False],
-    [202323, "Turner", "Evan", "Evan Turner", False],
-    [78379, "Turner", "Henry", "Henry Turner", False],
-    [78380, "Turner", "Jack", "Jack Turner", False],
-    [78382, "Turner", "Jack", "Jack Turner", False],
-    [78381, "Turner", "Jeff", "Jeff Turner", False],
-    [1819, "Turner", "John", "John Turner", False],
-    [1626167, "Turner", "Myles", "Myles Turner", True],
-    [1943, "Turner", "Wayne", "Wayne Turner", False],
-    [78386, "Turpin", "Mel", "Mel Turpin", False],
-    [78387, "Twardzik", "Dave", "Dave Twardzik", False],
-    [78388, "Twyman", "Jack", "Jack Twyman", False],
-    [189, "Tyler", "B.J.", "B.J. Tyler", False],
-    [202719, "Tyler", "Jeremy", "Jeremy Tyler", False],
-    [78390, "Tyler", "Terry", "Terry Tyler", False],
-    [78391, "Tyra", "Charlie", "Charlie Tyra", False],
-    [1641816, "Tyson", "Hunter", "Hunter Tyson", True],
-    [1642281, "Tyson", "Jaylon", "Jaylon Tyson", True],
-    [202775, "Ubiles", "Edwin", "Edwin Ubiles", False],
-    [202327, "Udoh", "Ekpe", "Ekpe Udoh", False],
-    [2137, "Udoka", "Ime", "Ime Udoka", False],
-    [2757, "Udrih", "Beno", "Beno Udrih", False],
-    [101146, "Ukic", "Roko", "Roko Ukic", False],
-    [1627755, "Ulis", "Tyler", "Tyler Ulis", False],
-    [1630649, "Umude", "Stanley", "Stanley Umude", False],
-    [78392, "Unseld", "Wes", "Wes Unseld", False],
-    [78393, "Uplinger", "Hal", "Hal Uplinger", False],
-    [78394, "Upshaw", "Kelvin", "Kelvin Upshaw", False],
-    [1627784, "Uthoff", "Jarrod", "Jarrod Uthoff", False],
-    [202386, "Uzoh", "Ben", "Ben Uzoh", False],
-    [201987, "Vaden", "Robert", "Robert Vaden", False],
-    [202685, "Valančiūnas", "Jonas", "Jonas Valančiūnas", True],
-    [78395, "Valentine", "Darnell", "Darnell Valentine", False],
-    [1627756, "Valentine", "Denzel", "Denzel Valentine", False],
-    [78396, "Valentine", "Ron", "Ron Valentine", False],
-    [78397, "Vallely", "John", "John Vallely", False],
-    [78398, "Van Arsdale", "Dick", "Dick Van Arsdale", False],
-    [78399, "Van Arsdale", "Tom", "Tom Van Arsdale", False],
-    [78401, "Van Breda Kolff", "Butch", "Butch Van Breda Kolff", False],
-    [78400, "Van Breda Kolff", "Jan", "Jan Van Breda Kolff", False],
-    [89, "Van Exel", "Nick", "Nick Van Exel", False],
-    [1496, "Van Horn", "Keith", "Keith Van Horn", False],
-    [78406, "Van Lier", "Norm", "Norm Van Lier", False],
-    [1627832, "VanVleet", "Fred", "Fred VanVleet", True],
-    [78402, "Vance", "Gene", "Gene Vance", False],
-    [78403, "Vander Velden", "Log", "Log Vander Velden", False],
-    [1629020, "Vanderbilt", "Jarred", "Jarred Vanderbilt", True],
-    [78405, "Vandeweghe", "Ernie", "Ernie Vandeweghe", False],
-    [78404, "Vandeweghe", "Kiki", "Kiki Vandeweghe", False],
-    [78407, "Vanos", "Nick", "Nick Vanos", False],
-    [2128, "Vanterpool", "David", "David Vanterpool", False],
-    [2237, "Varda", "Ratko", "Ratko Varda", False],
-    [2760, "Varejao", "Anderson", "Anderson Varejao", False],
-    [202363, "Varnado", "Jarvis", "Jarvis Varnado", False],
-    [202349, "Vasquez", "Greivis", "Greivis Vasquez", False],
-    [1630170, "Vassell", "Devin", "Devin Vassell", True],
-    [78409, "Vaughn", "Charles", "Charles Vaughn", False],
-    [710, "Vaughn", "David", "David Vaughn", False],
-    [1521, "Vaughn", "Jacque", "Jacque Vaughn", False],
-    [1626173, "Vaughn", "Rashad", "Rashad Vaughn", False],
-    [78411, "Vaughn", "Virgil", "Virgil Vaughn", False],
-    [919, "Vaught", "Loy", "Loy Vaught", False],
-    [78413, "Verga", "Bob", "Bob Verga", False],
-    [78414, "Verhoeven", "Peter", "Peter Verhoeven", False],
-    [202686, "Vesely", "Jan", "Jan Vesely", False],
-    [78415, "Vetra", "Gundars", "Gundars Vetra", False],
-    [1628426, "Vezenkov", "Sasha", "Sasha Vezenkov", False],
-    [78416, "Vianna", "Joao", "Joao Vianna", False],
-    [1630492, "Vildoza", "Luca", "Luca Vildoza", False],
-    [101111, "Villanueva", "Charlie", "Charlie Villanueva", False],
-    [1629216, "Vincent", "Gabe", "Gabe Vincent", True],
-    [78418, "Vincent", "Jay", "Jay Vincent", False],
-    [78417, "Vincent", "Sam", "Sam Vincent", False],
-    [200790, "Vinicius", "Marcus", "Marcus Vinicius", False],
-    [1844, "Vinson", "Fred", "Fred Vinson", False],
-    [78419, "Voce", "Gary", "Gary Voce", False],
-    [78420, "Volker", "Floyd", "Floyd Volker", False],
-    [78421, "Volkov", "Alexander", "Alexander Volkov", False],
-    [78422, "Von Nieda", "Whitey", "Whitey Von Nieda", False],
-    [203943, "Vonleh", "Noah", "Noah Vonleh", False],
-    [2063, "Voskuhl", "Jake", "Jake Voskuhl", False],
-    [78423, "Vranes", "Danny", "Danny Vranes", False],
-    [2582, "Vranes", "Slavko", "Slavko Vranes", False],
-    [1037, "Vrankovic", "Stojko", "Stojko Vrankovic", False],
-    [78425, "Vroman", "Brett", "Brett Vroman", False],
-    [2761, "Vroman", "Jackson", "Jackson Vroman", False],
-    [2756, "Vujacic", "Sasha", "Sasha Vujacic", False],
-    [1641774, "Vukcevic", "Tristan", "Tristan Vukcevic", True],
-    [202696, "Vučević", "Nikola", "Nikola Vučević", True],
-    [1629731, "Wade", "Dean", "Dean Wade", True],
-    [2548, "Wade", "Dwyane", "Dwyane Wade", False],
-    [78426, "Wade", "Mark", "Mark Wade", False],
-    [101144, "Wafer", "Von", "Von Wafer", False],
-    [78427, "Wager", "Clint", "Clint Wager", False],
-    [2402, "Wagner", "Dajuan", "Dajuan Wagner", False],
-    [78428, "Wagner", "Danny", "Danny Wagner", False],
-    [1630532, "Wagner", "Franz", "Franz Wagner", True],
-    [78429, "Wagner", "Milt", "Milt Wagner", False],
-    [1629021, "Wagner", "Moritz", "Moritz Wagner", True],
-    [1630688, "Wainright", "Ish", "Ish Wainright", False],
-    [203079, "Waiters", "Dion", "Dion Waiters", False],
-    [78430, "Waiters", "Granville", "Granville Waiters", False],
-    [78431, "Wakefield", "Andre", "Andre Wakefield", False],
-    [78432, "Walk", "Neal", "Neal Walk", False],
-    [78433, "Walker", "Andy", "Andy Walker", False],
-    [952, "Walker", "Antoine", "Antoine Walker", False],
-    [78434, "Walker", "Brady", "Brady Walker", False],
-    [78435, "Walker", "Chet", "Chet Walker", False],
-    [78437, "Walker", "Darrell", "Darrell Walker", False],
-    [78436, "Walker", "Foots", "Foots Walker", False],
-    [201611, "Walker", "Henry", "Henry Walker", False],
-    [78438, "Walker", "Horace", "Horace Walker", False],
-    [1631133, "Walker", "Jabari", "Jabari Walker", True],
-    [1641716, "Walker", "Jarace", "Jarace Walker", True],
-    [78439, "Walker", "Jimmy", "Jimmy Walker", False],
-    [202689, "Walker", "Kemba", "Kemba Walker", False],
-    [78440, "Walker", "Kenny", "Kenny Walker", False],
-    [1630640, "Walker", "MJ", "MJ Walker", False],
-    [78441, "Walker", "Phil", "Phil Walker", False],
-    [955, "Walker", "Samaki", "Samaki Walker", False],
-    [78442, "Walker", "Wally", "Wally Walker", False],
-    [1629022, "Walker IV", "Lonnie", "Lonnie Walker IV", False],
-    [202322, "Wall", "John", "John Wall", False],
-    [1112, "Wallace", "Ben", "Ben Wallace", False],
-    [1641717, "Wallace", "Cason", "Cason Wallace", True],
-    [2222, "Wallace", "Gerald", "Gerald Wallace", False],
-    [961, "Wallace", "John", "John Wallace", False],
-    [1630811, "Wallace", "Keaton", "Keaton Wallace", True],
-    [78443, "Wallace", "Michael", "Michael Wallace", False],
-    [739, "Wallace", "Rasheed", "Rasheed Wallace", False],
-    [1627820, "Wallace", "Tyrone", "Tyrone Wallace", False],
-    [78444, "Waller", "Dwight", "Dwight Waller", False],
-    [78445, "Waller", "Jamie", "Jamie Waller", False],
-    [78446, "Walsh", "Jim", "Jim Walsh", False],
-    [1641775, "Walsh", "Jordan", "Jordan Walsh", True],
-    [101190, "Walsh", "Matt", "Matt Walsh", False],
-    [1642266, "Walter", "Ja'Kobe", "Ja'Kobe Walter", True],
-    [777, "Walters", "Rex", "Rex Walters", False],
-    [78447, "Walther", "Paul", "Paul Walther", False],
-    [78448, "Walthour", "Rabbit", "Rabbit Walthour", False],
-    [78450, "Walton", "Bill", "Bill Walton", False],
-    [78449, "Walton", "Lloyd", "Lloyd Walton", False],
-    [2575, "Walton", "Luke", "Luke Walton", False],
-    [1628476, "Walton Jr.", "Derrick", "Derrick Walton Jr.", False],
-    [202954, "Wanamaker", "Brad", "Brad Wanamaker", False],
-    [78453, "Wanzer", "Bobby", "Bobby Wanzer", False],
-    [78454, "Warbington", "Perry", "Perry Warbington", False],
-    [369, "Ward", "Charlie", "Charlie Ward", False],
-    [78455, "Ward", "Gerry", "Gerry Ward", False],
-    [78456, "Ward", "Henry", "Henry Ward", False],
-    [203810, "Ware", "Casper", "Casper Ware", False],
-    [78457, "Ware", "Jim", "Jim Ware", False],
-    [1642276, "Ware", "Kel'el", "Kel'el Ware", True],
-    [78458, "Warley", "Ben", "Ben Warley", False],
-    [78459, "Warlick", "Bob", "Bob Warlick", False],
-    [78460, "Warner", "Cornell", "Cornell Warner", False],
-    [1627866, "Warney", "Jameel", "Jameel Warney", False],
-    [78461, "Warren", "Johnny", "Johnny Warren", False],
-    [203933, "Warren", "T.J.", "T.J. Warren", False],
-    [202378, "Warren", "Willie", "Willie Warren", False],
-    [78462, "Warrick", "Bryan", "Bryan Warrick", False],
-    [101124, "Warrick", "Hakim", "Hakim Warrick", False],
-    [78463, "Washburn", "Chris", "Chris Washburn", False],
-    [1627395, "Washburn", "Julian", "Julian Washburn", False],
-    [78469, "Washington", "Bobby", "Bobby Washington", False],
-    [200827, "Washington", "Darius", "Darius Washington", False],
-    [78464, "Washington", "Duane", "Duane Washington", False],
-    [78465, "Washington", "Dwayne", "Dwayne Washington", False],
-    [1540, "Washington", "Eric", "Eric Washington", False],
-    [78466, "Washington", "Jim", "Jim Washington", False],
-    [78467, "Washington", "Kermit", "Kermit Washington", False],
-    [1629023, "Washington", "P.J.", "P.J. Washington", True],
-    [78468, "Washington", "Richard", "Richard Washington", False],
-    [78470, "Washington", "Stan", "Stan Washington", False],
-    [78471, "Washington", "Wilson", "Wilson Washington", False],
-    [1630613, "Washington Jr.", "Duane", "Duane Washington Jr.", False],
-    [1631102, "Washington Jr.", "TyTy", "TyTy Washington Jr.", False],
-    [1629139, "Watanabe", "Yuta", "Yuta Watanabe", False],
-    [1629682, "Waters", "Tremont", "Tremont Waters", False],
-    [1630322, "Waters III", "Lindy", "Lindy Waters III", True],
-    [1630570, "Watford", "Trendon", "Trendon Watford", True],
-    [201208, "Watkins", "Darryl", "Darryl Watkins", False],
-    [1642364, "Watkins", "Jamir", "Jamir Watkins", True],
-    [1641817, "Watson", "Anton", "Anton Watson", False],
-    [201228, "Watson", "C.J.", "C.J. Watson", False],
-    [2248, "Watson", "Earl", "Earl Watson", False],
-    [320, "Watson", "Jamie", "Jamie Watson", False],
-    [1628778, "Watson", "Paul", "Paul Watson", False],
-    [1631212, "Watson", "Peyton", "Peyton Watson", True],
-    [78474, "Watts", "Ron", "Ron Watts", False],
-    [78473, "Watts", "Slick", "Slick Watts", False],
-    [203146, "Wayns", "Maalik", "Maalik Wayns", False],
-    [204033, "Wear", "David", "David Wear", False],
-    [204037, "Wear", "Travis", "Travis Wear", False],
-    [221, "Weatherspoon", "Clar.", "Clar. Weatherspoon", False],
-    [78475, "Weatherspoon", "Nick", "Nick Weatherspoon", False],
-    [1629683, "Weatherspoon", "Quinndary", "Quinndary Weatherspoon", False],
-    [201602, "Weaver", "Kyle", "Kyle Weaver", False],
-    [78477, "Webb", "Jeff", "Jeff Webb", False],
-    [78478, "Webb", "Marcus", "Marcus Webb", False],
-    [892, "Webb", "Spud", "Spud Webb", False],
-    [1627821, "Webb III", "James", "James Webb III", False],
-    [185, "Webber", "Chris", "Chris Webber", False],
-    [1627362, "Weber", "Briante", "Briante Weber", False],
-    [78479, "Weber", "Forest", "Forest Weber", False],
-    [1067, "Webster", "Jeff", "Jeff Webster", False],
-    [101110, "Webster", "Martell", "Martell Webster", False],
-    [78481, "Webster", "Marvin", "Marvin Webster", False],
-    [78482, "Wedman", "Scott", "Scott Wedman", False],
-    [201603, "Weems", "Sonny", "Sonny Weems", False],
-    [78483, "Wehr", "Dick", "Dick Wehr", False],
-    [78484, "Weidner", "Brant", "Brant Weidner", False],
-    [78485, "Weiss", "Bob", "Bob Weiss", False],
-    [78486, "Weitzman", "Rick", "Rick Weitzman", False],
-    [1719, "Wells", "Bonzi", "Bonzi Wells", False],
-    [1528, "Wells", "Bubba", "Bubba Wells", False],
-    [1642377, "Wells", "Jaylen", "Jaylen Wells", True],
-    [78488, "Wells", "Owen", "Owen Wells", False],
-    [78489, "Wells", "Ralph", "Ralph Wells", False],
-    [1846, "Welp", "Chris", "Chris Welp", False],
-    [2412, "Welsch", "Jiri", "Jiri Welsch", False],
-    [1629118, "Welsh", "Thomas", "Thomas Welsh", False],
-    [1641705, "Wembanyama", "Victor", "Victor Wembanyama", True],
-    [82, "Wennington", "Bill", "Bill Wennington", False],
-    [78492, "Wenstrom", "Matt", "Matt Wenstrom", False],
-    [438, "Werdann", "Robert", "Robert Werdann", False],
-    [78494, "Wertis", "Ray", "Ray Wertis", False],
-    [1631104, "Wesley", "Blake", "Blake Wesley", True],
-    [133, "Wesley", "David", "David Wesley", False],
-    [78495, "Wesley", "Walt", "Walt Wesley", False],
-    [2561, "West", "David", "David West", False],
-    [2753, "West", "Delonte", "Delonte West", False],
-    [28, "West", "Doug", "Doug West", False],
-    [78497, "West", "Jerry", "Jerry West", False],
-    [201238, "West", "Mario", "Mario West", False],
-    [770, "West", "Mark", "Mark West", False],
-    [78499, "West", "Roland", "Roland West", False],
-    [201566, "Westbrook", "Russell", "Russell Westbrook", True],
-    [78500, "Westphal", "Paul", "Paul Westphal", False],
-    [78501, "Wetzel", "John", "John Wetzel", False],
-    [101156, "Whaley", "Robert", "Robert Whaley", False],
-    [941, "Whatley", "Ennis", "Ennis Whatley", False],
-    [1545, "Wheat", "DeJuan", "DeJuan Wheat", False],
-    [78504, "Wheeler", "Clinton", "Clinton Wheeler", False],
-    [1630762, "Wheeler", "Phillip", "Phillip Wheeler", False],
-    [1755, "Wheeler", "Tyson", "Tyson Wheeler", False],
-    [78506, "Whitaker", "Lucian", "Lucian Whitaker", False],
-    [1629632, "White", "Coby", "Coby White", True],
-    [201591, "White", "DJ", "DJ White", False],
-    [1628401, "White", "Derrick", "Derrick White", True],
-    [78507, "White", "Eric", "Eric White", False],
-    [78508, "White", "Herb", "Herb White", False],
-    [78509, "White", "Hubie", "Hubie White", False],
-    [1631298, "White", "Jack", "Jack White", False],
-    [1751, "White", "Jahidi", "Jahidi White", False],
-    [200778, "White", "James", "James White", False],
-    [78510, "White", "Jojo", "Jojo White", False],
-    [1627855, "White", "Okaro", "Okaro White", False],
-    [1839, "White", "Randy", "Randy White", False],
-    [2206, "White", "Rodney", "Rodney White", False],
-    [78512, "White", "Rory", "Rory White", False],
-    [203091, "White", "Royce", "Royce White", False],
-    [78513, "White", "Rudy", "Rudy White", False],
-    [202358, "White", "Terrico", "Terrico White", False],
-    [78514, "White", "Tony", "Tony White", False],
-    [78515, "White", "Willie", "Willie White", False],
-    [1628510, "White III", "Andrew", "Andrew White III", False],
-    [1641727, "Whitehead", "Dariq", "Dariq Whitehead", False],
-    [1627785, "Whitehead", "Isaiah", "Isaiah Whitehead", False],
-    [78516, "Whitehead", "Jerome", "Jerome Whitehead", False],
-    [1126, "Whiteside", "Donald", "Donald Whiteside", False],
-    [202355, "Whiteside", "Hassan", "Hassan Whiteside", False],
-    [730, "Whitfield", "Dwayne", "Dwayne Whitfield", False],
-    [1641715, "Whitmore", "Cam", "Cam Whitmore", True],
-    [78519, "Whitney", "Charles", "Charles Whitney", False],
-    [43, "Whitney", "Chris", "Chris Whitney", False],
-    [204222, "Whittington", "Greg", "Greg Whittington", False],
-    [203963, "Whittington", "Shayne", "Shayne Whittington", False],
-    [78520, "Wicks", "Sidney", "Sidney Wicks", False],
-    [78521, "Wier", "Murray", "Murray Wier", False],
-    [78522, "Wiesenhahn", "Bob", "Bob Wiesenhahn", False],
-    [1630580, "Wieskamp", "Joe", "Joe Wieskamp", False],
-    [1630598, "Wiggins", "Aaron", "Aaron Wiggins", True],
-    [203952, "Wiggins", "Andrew", "Andrew Wiggins", True],
-    [78523, "Wiggins", "Mitchell", "Mitchell Wiggins", False],
-    [1629623, "Wigginton", "Lindell", "Lindell Wigginton", False],
-    [78524, "Wilburn", "Ken", "Ken Wilburn", False],
-    [203912, "Wilcox", "C.J.", "C.J. Wilcox", False],
-    [2404, "Wilcox", "Chris", "Chris Wilcox", False],
-    [78525, "Wilcutt", "D.C.", "D.C. Wilcutt", False],
-    [78526, "Wiley", "Gene", "Gene Wiley", False],
-    [1628451, "Wiley", "Jacob", "Jacob Wiley", False],
-    [78527, "Wiley", "Michael", "Michael Wiley", False],
-    [78528, "Wiley", "Morlon", "Morlon Wiley", False],
-    [78529, "Wilfong", "Win", "Win Wilfong", False],
-    [78530, "Wilkens", "Lenny", "Lenny Wilkens", False],
-    [78531, "Wilkerson", "Bob", "Bob Wilkerson", False],
-    [78532, "Wilkes", "Jamaal", "Jamaal Wilkes", False],
-    [78533, "Wilkes", "James", "James Wilkes", False],
-    [2863, "Wilkins", "Damien", "Damien Wilkins", False],
-    [1122, "Wilkins", "Dominique", "Dominique Wilkins", False],
-    [78534, "Wilkins", "Eddielee", "Eddielee Wilkins", False],
-    [786, "Wilkins", "Gerald", "Gerald Wilkins", False],
-    [78537, "Wilkins", "Jeff", "Jeff Wilkins", False],
-    [78538, "Wilkinson", "Dale", "Dale Wilkinson", False],
-    [2366, "Wilks", "Mike", "Mike Wilks", False],
-    [1425, "Williams", "Aaron", "Aaron Williams", False],
-    [1626210, "Williams", "Alan", "Alan Williams", False],
-    [1631214, "Williams", "Alondes", "Alondes Williams", False],
-    [1541, "Williams", "Alvin", "Alvin Williams", False],
-    [1642873, "Williams", "Amari", "Amari Williams", True],
-    [78539, "Williams", "Arthur", "Arthur Williams", False],
-    [78540, "Williams", "Bernie", "Bernie Williams", False],
-    [78564, "Williams", "Bob", "Bob Williams", False],
-    [1585, "Williams", "Brandon", "Brandon Williams", False],
-    [1630314, "Williams", "Brandon", "Brandon Williams", True],
-    [433, "Williams", "Buck", "Buck Williams", False],
-    [203710, "Williams", "C.J.", "C.J. Williams", False],
-    [78547, "Williams", "Chuck", "Chuck Williams", False],
-    [78541, "Williams", "Chuckie", "Chuckie Williams", False],
-    [78543, "Williams", "Cliff", "Cliff Williams", False],
-    [1642262, "Williams", "Cody", "Cody Williams", True],
-    [101258, "Williams", "Corey", "Corey Williams", False],
-    [101114, "Williams", "Deron", "Deron Williams", False],
-    [202682, "Williams", "Derrick", "Derrick Williams", False],
-    [78545, "Williams", "Don", "Don Williams", False],
-    [1631495, "Williams", "Donovan", "Donovan Williams", False],
-    [78546, "Williams", "Earl", "Earl Williams", False],
-    [202343, "Williams", "Elliot", "Elliot Williams", False],
-    [677, "Williams", "Eric", "Eric Williams", False],
-    [2421, "Williams", "Frank", "Frank Williams", False],
-    [78548, "Williams", "Freeman", "Freeman Williams", False],
-    [1629684, "Williams", "Grant", "Grant Williams", True],
-    [78549, "Williams", "Gus", "Gus Williams", False],
-    [78550, "Williams", "Guy", "Guy Williams", False],
-    [1006, "Williams", "Herb", "Herb Williams", False],
-    [73, "Williams", "Hot Rod", "Hot Rod Williams", False],
-    [1631114, "Williams", "Jalen", "Jalen Williams", True],
-    [1715, "Williams", "Jason", "Jason Williams", False],
-    [101214, "Williams", "Jawad", "Jawad Williams", False],
-    [2398, "Williams", "Jay", "Jay Williams", False],
-    [1631119, "Williams", "Jaylin", "Jaylin Williams", True],
-    [420, "Williams", "Jayson", "Jayson Williams", False],
-    [966, "Williams", "Jerome", "Jerome Williams", False],
-    [78554, "Williams", "John", "John Williams", False],
-    [1629140, "Williams", "Johnathan", "Johnathan Williams", False],
-    [202716, "Williams", "Jordan", "Jordan Williams", False],
-    [200818, "Williams", "Justin", "Justin Williams", False],
-    [78555, "Williams", "Kenny", "Kenny Williams", False],
-    [1629026, "Williams", "Kenrich", "Kenrich Williams", True],
-    [78556, "Williams", "Kevin", "Kevin Williams", False],
-    [31, "Williams", "Lorenzo", "Lorenzo Williams", False],
-    [101150, "Williams", "Lou", "Lou Williams", False],
-    [1642013, "Williams", "Malik", "Malik Williams", False],
-    [200766, "Williams", "Marcus", "Marcus Williams", False],
-    [201173, "Williams", "Marcus", "Marcus Williams", False],
-    [1631109, "Williams", "Mark", "Mark Williams", True],
-    [101107, "Williams", "Marvin", "Marvin Williams", False],
-    [52, "Williams", "Micheal", "Micheal Williams", False],
-    [78558, "Williams", "Mike", "Mike Williams", False],
-    [78560, "Williams", "Milt", "Milt Williams", False],
-    [2590, "Williams", "Mo", "Mo Williams", False],
-    [42, "Williams", "Monty", "Monty Williams", False],
-    [78561, "Williams", "Nate", "Nate Williams", False],
-    [1631466, "Williams", "Nate", "Nate Williams", False],
-    [1630172, "Williams", "Patrick", "Patrick Williams", True],
-    [78566, "Williams", "Pete", "Pete Williams", False],
-    [78571, "Williams", "Ray", "Ray Williams", False],
-    [199, "Williams", "Reggie", "Reggie Williams", False],
-    [202130, "Williams", "Reggie", "Reggie Williams", False],
-    [78563, "Williams", "Rickey", "Rickey Williams", False],
-    [78565, "Williams", "Rob", "Rob Williams", False],
-    [78567, "Williams", "Ron", "Ron Williams", False],
-    [78568, "Williams", "Sam", "Sam Williams", False],
-    [78569, "Williams", "Samuel", "Samuel Williams", False],
-    [281, "Williams", "Scott", "Scott Williams", False],
-    [201157, "Williams", "Sean", "Sean Williams", False],
-    [1742, "Williams", "Shammond", "Shammond Williams", False],
-    [200761, "Williams", "Shawne", "Shawne Williams", False],
-    [200749, "Williams", "Shelden", "Shelden Williams", False],
-    [78570, "Williams", "Sly", "Sly Williams", False],
-    [201944, "Williams", "Terrence", "Terrence Williams", False],
-    [1576, "Williams", "Travis", "Travis Williams", False],
-    [1627786, "Williams", "Troy", "Troy Williams", False],
-    [1005, "Williams", "Walt", "Walt Williams", False],
-    [78573, "Williams", "Ward", "Ward Williams", False],
-    [78574, "Williams", "Willie", "Willie Williams", False],
-    [1630533, "Williams", "Ziaire", "Ziaire Williams", True],
-    [1629057, "Williams III", "Robert", "Robert Williams III", True],
-    [1628475, "Williams Jr.", "Matt", "Matt Williams Jr.", False],
-    [1631246, "Williams Jr.", "Vince", "Vince Williams Jr.", True],
-    [1628430, "Williams-Goss", "Nigel", "Nigel Williams-Goss", False],
-    [722, "Williamson", "Corliss", "Corliss Williamson", False],
-    [78575, "Williamson", "John", "John Williamson", False],
-    [1629627, "Williamson", "Zion", "Zion Williamson", True],
-    [788, "Willis", "Kevin", "Kevin Willis", False],
-    [78577, "Willoughby", "Bill", "Bill Willoughby", False],
-    [2000, "Willoughby", "Dedric", "Dedric Willoughby", False],
-    [78586, "Wilson", "Bob", "Bob Wilson", False],
-    [78585, "Wilson", "Bobby", "Bobby Wilson", False],
-    [1628391, "Wilson", "D.J.", "D.J. Wilson", False],
-    [78579, "Wilson", "George", "George Wilson", False],
-    [78580, "Wilson", "Isaiah", "Isaiah Wilson", False],
-    [1630592, "Wilson", "Jalen", "Jalen Wilson", True],
-    [203966, "Wilson", "Jamil", "Jamil Wilson", False],
-    [78581, "Wilson", "Mike", "Mike Wilson", False],
-    [78582, "Wilson", "Nikita", "Nikita Wilson", False],
-    [78578, "Wilson", "Othell", "Othell Wilson", False],
-    [78583, "Wilson", "Rick", "Rick Wilson", False],
-    [78584, "Wilson", "Ricky", "Ricky Wilson", False],
-    [78587, "Wilson", "Thomas", "Thomas Wilson", False],
-    [1027, "Wilson", "Trevor", "Trevor Wilson", False],
-    [1627787, "Wiltjer", "Kyle", "Kyle Wiltjer", False],
-    [78589, "Winchester", "Kennard", "Kennard Winchester", False],
-    [78590, "Windis", "Tony", "Tony Windis", False],
-    [1629685, "Windler", "Dylan", "Dylan Windler", False],
-    [78591, "Windsor", "John", "John Windsor", False],
-    [78592, "Winfield", "Lee", "Lee Winfield", False],
-    [766, "Wingate", "David", "David Wingate", False],
-    [112, "Wingfield", "Dontonio", "Dontonio Wingfield", False],
-    [78596, "Wingo", "Harthorne", "Harthorne Wingo", False],
-    [78597, "Winkler", "Marv", "Marv Winkler", False],
-    [1626159, "Winslow", "Justise", "Justise Winslow", False],
-    [1984, "Winslow", "Rickie", "Rickie Winslow", False],
-    [1630216, "Winston", "Cassius", "Cassius Winston", False],
-    [1868, "Winter", "Trevor", "Trevor Winter", False],
-    [78600, "Winters", "Brian", "Brian Winters", False],
-    [78601, "Winters", "Voise", "Voise Winters", False],
-    [78602, "Wise", "Willie", "Willie Wise", False],
-    [1630164, "Wiseman", "James", "James Wiseman", True],
-    [203481, "Withey", "Jeff", "Jeff Withey", False],
-    [78603, "Witte", "Luke", "Luke Witte", False],
-    [1456, "Wittman", "Randy", "Randy Wittman", False],
-    [78605, "Witts", "Garry", "Garry Witts", False],
-    [78606, "Wohl", "Dave", "Dave Wohl", False],
-    [1642874, "Wolf", "Danny", "Danny Wolf", True],
-    [341, "Wolf", "Joe", "Joe Wolf", False],
-    [2106, "Wolkowyski", "Ruben", "Ruben Wolkowyski", False],
-    [203489, "Wolters", "Nate", "Nate Wolters", False],
-    [1631209, "Wong", "Isaiah", "Isaiah Wong", False],
-    [78610, "Wood", "Al", "Al Wood", False],
-    [78612, "Wood", "Bob", "Bob Wood", False],
-    [1626174, "Wood", "Christian", "Christian Wood", False],
-    [116, "Wood", "David", "David Wood", False],
-    [78609, "Wood", "Howard", "Howard Wood", False],
-    [78611, "Wood", "Leon", "Leon Wood", False],
-    [1630218, "Woodard II", "Robert", "Robert Woodard II", False],
-    [2254, "Woods", "Loren", "Loren Woods", False],
-    [2417, "Woods", "Qyntel", "Qyntel Woods", False],
-    [1010, "Woods", "Randy", "Randy Woods", False],
-    [78614, "Woodson", "Mike", "Mike Woodson", False],
-    [78615, "Woolridge", "Orlando", "Orlando Woolridge", False],
-    [1629624, "Wooten", "Kenny", "Kenny Wooten", False],
-    [906, "Workman", "Haywoode", "Haywoode Workman", False],
-    [78616, "Workman", "Mark", "Mark Workman", False],
-    [78617, "Workman", "Tom", "Tom Workman", False],
-    [1897, "World Peace", "Metta", "Metta World Peace", False],
-    [78618, "Worthen", "Sam", "Sam Worthen", False],
-    [1460, "Worthy", "James", "James Worthy", False],
-    [101120, "Wright", "Antoine", "Antoine Wright", False],
-    [101152, "Wright", "Bracey", "Bracey Wright", False],
-    [78620, "Wright", "Brad", "Brad Wright", False],
-    [201148, "Wright", "Brandan", "Brandan Wright", False],
-    [202874, "Wright", "Chris", "Chris Wright", False],
-    [203203, "Wright", "Chris", "Chris Wright", False],
-    [1626153, "Wright", "Delon", "Delon Wright", False],
-    [2748, "Wright", "Dorell", "Dorell Wright", False],
-    [78621, "Wright", "Howard", "Howard Wright", False],
-    [78622, "Wright", "Joby", "Joby Wright", False],
-    [201153, "Wright", "Julian", "Julian Wright", False],
-    [78623, "Wright", "Larry", "Larry Wright", False],
-    [953, "Wright", "Lorenzen", "Lorenzen Wright", False],
-    [1007, "Wright", "Luther", "Luther Wright", False],
-    [1630589, "Wright", "Moses", "Moses Wright", False],
-    [412, "Wright", "Sharone", "Sharone Wright", False],
-    [1630593, "Wright IV", "McKinley", "McKinley Wright IV", False],
-    [1629625, "Wright-Foreman", "Justin", "Justin Wright-Foreman", False],
-    [203100, "Wroten", "Tony", "Tony Wroten", False],
-    [78627, "Wynder", "A.J.", "A.J. Wynder", False],
-    [1627824, "Yabusele", "Guerschon", "Guerschon Yabusele", True],
-    [1642905, "Yang Hansen", "", "Yang Hansen", True],
-    [2397, "Yao", "Ming", "Yao Ming", False],
-    [2428, "Yarbrough", "Vincent", "Vincent Yarbrough", False],
-    [78628, "Yardley", "George", "George Yardley", False],
-    [78629, "Yates", "Barry", "Barry Yates", False],
-    [78630, "Yates", "Wayne", "Wayne Yates", False],
-    [78631, "Yelverton", "Charlie", "Charlie Yelverton", False],
-    [201146, "Yi", "Jianlian", "Yi Jianlian", False],
-    [78632, "Yonakor", "Rich", "Rich Yonakor", False],
-    [1628221, "York", "Gabe", "Gabe York", False],
-    [78633, "Young", "Danny", "Danny Young", False],
-    [1642443, "Young", "Jahmir", "Jahmir Young", True],
-    [203923, "Young", "James", "James Young", False],
-    [1626202, "Young", "Joe", "Joe Young", False],
-    [1748, "Young", "Korleone", "Korleone Young", False],
-    [78634, "Young", "Michael", "Michael Young", False],
-    [201156, "Young", "Nick", "Nick Young", False],
-    [78635, "Young", "Perry", "Perry Young", False],
-    [201970, "Young", "Sam", "Sam Young", False],
-    [201152, "Young", "Thaddeus", "Thaddeus Young", False],
-    [1937, "Young", "Tim", "Tim Young", False],
-    [1629027, "Young", "Trae", "Trae Young", True],
-    [1642959, "Youngblood", "Chris", "Chris Youngblood", True],
-    [1630209, "Yurtseven", "Omer", "Omer Yurtseven", False],
-    [78638, "Zaslofsky", "Max", "Max Zaslofsky", False],
-    [78639, "Zawoluk", "Robert", "Robert Zawoluk", False],
-    [203469, "Zeller", "Cody", "Cody Zeller", False],
-    [78640, "Zeller", "Dave", "Dave Zeller", False],
-    [78641, "Zeller", "Gary", "Gary Zeller", False],
-    [78642, "Zeller", "Hank", "Hank Zeller", False],
-    [202545, "Zeller", "Luke", "Luke Zeller", False],
-    [203092, "Zeller", "Tyler", "Tyler Zeller", False],
-    [78643, "Zeno", "Tony", "Tony Zeno", False],
-    [78644, "Zevenbergen", "Phil", "Phil Zevenbergen", False],
-    [1917, "Zhi-zhi", "Wang", "Wang Zhi-zhi", False],
-    [1627753, "Zhou", "Qi", "Zhou Qi", False],
-    [678, "Zidek", "George", "George Zidek", False],
-    [1642911, "Zikarsky", "Rocco", "Rocco Zikarsky", True],
-    [2583, "Zimmerman", "Derrick", "Derrick Zimmerman", False],
-    [1627757, "Zimmerman", "Stephen", "Stephen Zimmerman", False],
-    [1627835, "Zipser", "Paul", "Paul Zipser", False],
-    [1627790, "Zizic", "Ante", "Ante Zizic", False],
-    [78647, "Zoet", "Jim", "Jim Zoet", False],
-    [78648, "Zopf", "Bill", "Bill Zopf", False],
-    [1627826, "Zubac", "Ivica", "Ivica Zubac", True],
-    [78650, "Zunic", "Matt", "Matt Zunic", False],
-    [1641783, "da Silva", "Tristan", "Tristan da Silva", True],
-    [1628427, "Čančar", "Vlatko", "Vlatko Čančar", False],
-    [1642365, "Đurišić", "Nikola", "Nikola Đurišić", True],
-    [203967, "Šarić", "Dario", "Dario Šarić", True],
-]
 
-wnba_players = [
-    [203025, "Abdi", "Farhiya", "Farhiya Abdi", False],
-    [100023, "Abraham", "Tajama", "Tajama Abraham", False],
-    [100658, "Abrosimova", "Svetlana", "Svetlana Abrosimova", False],
-    [203831, "Achonwa", "Natalie", "Natalie Achonwa", False],
-    [201882, "Adair", "Jessica", "Jessica Adair", False],
-    [202634, "Adams", "Danielle", "Danielle Adams", False],
-    [100836, "Adams", "Jordan", "Jordan Adams", False],
-    [1630153, "Agnew", "Jaylyn", "Jaylyn Agnew", False],
-    [100601, "Aguilar", "Elisa", "Elisa Aguilar", False],
-    [201492, "Ajavon", "Matee", "Matee Ajavon", False],
-    [1628262, "Akhator", "Evelyn", "Evelyn Akhator", False],
-    [1642777, "Akoa Makani", "Monique", "Monique Akoa Makani", True],
-    [1630093, "Alarie", "Bella", "Bella Alarie", False],
-    [100158, "Alberts", "Marcie", "Marcie Alberts", False],
-    [100348, "Aldridge", "Markita", "Markita Aldridge", False],
-    [100168, "Alexander", "Erin", "Erin Alexander", False],
-    [203405, "Alexander", "Kayla", "Kayla Alexander", False],
-    [100218, "Alhaleem", "Towana", "Towana Alhaleem", False],
-    [1627700, "Allemand", "Julie", "Julie Allemand", True],
-    [201513, "Allen", "Charel", "Charel Allen", False],
-    [1628263, "Allen", "Lindsay", "Lindsay Allen", True],
-    [204296, "Allen", "Rebecca", "Rebecca Allen", True],
-    [1627687, "Alleyne", "Jillian", "Jillian Alleyne", False],
-    [1627691, "Alston", "Ameryst", "Ameryst Alston", False],
-    [100527, "Amachree", "Mactabene", "Mactabene Amachree", False],
-    [100036, "Ambers", "Monique", "Monique Ambers", False],
-    [1641656, "Amihere", "Laeticia", "Laeticia Amihere", True],
-    [1642781, "Amoore", "Georgia", "Georgia Amoore", True],
-    [200687, "Anderson", "Ambrosia", "Ambrosia Anderson", False],
-    [100873, "Anderson", "Chantelle", "Chantelle Anderson", False],
-    [201485, "Anderson", "Jolene", "Jolene Anderson", False],
-    [100553, "Anderson", "Keisha", "Keisha Anderson", False],
-    [1628304, "Anderson", "Yvonne", "Yvonne Anderson", True],
-    [100428, "Andrade", "Mery", "Mery Andrade", False],
-    [100026, "Angel", "Yvette", "Yvette Angel", False],
-    [1629485, "Anigwe", "Kristine", "Kristine Anigwe", False],
-    [201500, "Anosike", "Nicky", "Nicky Anosike", False],
-    [202251, "Appel Marinelli", "Jayne", "Jayne Appel Marinelli", False],
-    [100075, "Arcain", "Janeth", "Janeth Arcain", False],
-    [203428, "Armstrong", "Anne Marie", "Anne Marie Armstrong", False],
-    [100067, "Artis", "Katasha", "Katasha Artis", False],
-    [100037, "Askamp", "Marlies", "Marlies Askamp", False],
-    [1628878, "Atkins", "Ariel", "Ariel Atkins", True],
-    [200679, "Atkinson", "La'Tangela", "La'Tangela Atkinson", False],
-    [201478, "Atunrase", "Morenike", "Morenike Atunrase", False],
-    [1631056, "Atwell", "Amy", "Amy Atwell", False],
-    [200671, "Augustus", "Seimone", "Seimone Augustus", False],
-    [1631022, "Austin", "Shakira", "Shakira Austin", True],
-    [204468, "Ayayi", "Valeriane", "Valeriane Ayayi", False],
-    [100441, "Aycock", "Angela", "Angela Aycock", False],
-    [202629, "Ayim", "Miranda", "Miranda Ayim", False],
-    [100847, "Aziz", "Leigh", "Leigh Aziz", False],
-    [100382, "Azzi", "Jennifer", "Jennifer Azzi", False],
-    [100237, "Bader Binford", "Tricia", "Tricia Bader Binford", False],
-    [1642763, "Badiane", "Marième", "Marième Badiane", True],
-    [200682, "Baker", "Sherill", "Sherill Baker", False],
-    [201054, "Bales", "Alison", "Alison Bales", False],
-    [100535, "Banchero", "Rhonda", "Rhonda Banchero", False],
-    [1627671, "Banham", "Rachel", "Rachel Banham", True],
-    [100043, "Baranova", "Elena", "Elena Baranova", False],
-    [1642782, "Barker", "Sarah Ashlee", "Sarah Ashlee Barker", True],
-    [100231, "Barnes", "Adia", "Adia Barnes", False],
-    [100230, "Barnes", "Quacy", "Quacy Barnes", False],
-    [200691, "Bass", "Mistie", "Mistie Bass", False],
-    [100878, "Batkovic-Brown", "Suzy", "Suzy Batkovic-Brown", False],
-    [101035, "Batteast", "Jacqueline", "Jacqueline Batteast", False],
-    [101047, "Battle", "Ashley", "Ashley Battle", False],
-    [100294, "Bauer-Bilodeau", "Cass", "Cass Bauer-Bilodeau", False],
-    [203037, "Baugh", "Vicki", "Vicki Baugh", False],
-    [100949, "Beard", "Alana", "Alana Beard", False],
-    [100041, "Becenti", "Ryneldi", "Ryneldi Becenti", False],
-    [201517, "Beck", "Kimberly", "Kimberly Beck", False],
-    [1629495, "Bell", "Kenisha", "Kenisha Bell", False],
-    [1631006, "Bell", "Kierstan", "Kierstan Bell", True],
-    [1627648, "Belyakova", "Evgeniia", "Evgeniia Belyakova", False],
-    [1628868, "Ben Abdelkader", "Hind", "Hind Ben Abdelkader", False],
-    [100921, "Benningfield", "Jenni", "Jenni Benningfield", False],
-    [203410, "Bentley", "Alex", "Alex Bentley", False],
-    [1631081, "Benzan", "Katie", "Katie Benzan", False],
-    [201491, "Berezhynska", "Val", "Val Berezhynska", False],
-    [1641658, "Berger", "Grace", "Grace Berger", True],
-    [100739, "Berthieu", "Lucienne", "Lucienne Berthieu", False],
-    [1629571, "Bertsch", "Morgan", "Morgan Bertsch", False],
-    [100284, "Bevilaqua", "Tully", "Tully Bevilaqua", False],
-    [203839, "Bias", "Tiffany", "Tiffany Bias", False],
-    [1631064, "Bibby", "Chloe", "Chloe Bibby", True],
-    [100508, "Bibby", "Jessica", "Jessica Bibby", False],
-    [100912, "Bibrzycka", "Agnieszka", "Agnieszka Bibrzycka", False],
-    [1641698, "Bickle", "Caitlin", "Caitlin Bickle", False],
-    [1628881, "Billings", "Monique", "Monique Billings", True],
-    [100720, "Bird", "Sue", "Sue Bird", False],
-    [202249, "Bishop", "Abby", "Abby Bishop", False],
-    [100391, "Bjedov", "Nina", "Nina Bjedov", False],
-    [202637, "Bjorklund", "Angie", "Angie Bjorklund", False],
-    [100979, "Bjorklund", "Tera", "Tera Bjorklund", False],
-    [201884, "Black", "Chante", "Chante Black", False],
-    [100359, "Black", "Debbie", "Debbie Black", False],
-    [100108, "Blades", "Rhonda", "Rhonda Blades", False],
-    [100183, "Blodgett", "Cindy", "Cindy Blodgett", False],
-    [200689, "Blue", "Nikki", "Nikki Blue", False],
-    [100169, "Blue", "Octavia", "Octavia Blue", False],
-    [201497, "Bobbitt", "Shannon", "Shannon Bobbitt", False],
-    [201885, "Boddie", "Whitney", "Whitney Boddie", False],
-    [100016, "Bolton", "Ruthie", "Ruthie Bolton", False],
-    [200697, "Bond", "LaToya", "LaToya Bond", False],
-    [203402, "Bone", "Kelsey", "Kelsey Bone", False],
-    [100799, "Bonfiglio", "Susanna", "Susanna Bonfiglio", False],
-    [201886, "Bonner", "DeWanna", "DeWanna Bonner", True],
-    [100053, "Booker", "Karen", "Karen Booker", False],
-    [1641648, "Boston", "Aliyah", "Aliyah Boston", True],
-    [100095, "Boucek", "Jenny", "Jenny Boucek", False],
-    [100177, "Boucher", "Kelly", "Kelly Boucher", False],
-    [200714, "Bowen", "Lindsay", "Lindsay Bowen", False],
-    [100859, "Bowie", "Tamara", "Tamara Bowie", False],
-    [100269, "Boyd", "Carla", "Carla Boyd", False],
-    [204327, "Boyd-Jones", "Brittany", "Brittany Boyd-Jones", False],
-    [204325, "Bradford", "Crystal", "Crystal Bradford", True],
-    [203844, "Brandon", "Gennifer", "Gennifer Brandon", False],
-    [100212, "Branzova", "Albena", "Albena Branzova", False],
-    [100246, "Branzova", "Gergana", "Gergana Branzova", False],
-    [203070, "Bravard", "Cierra", "Cierra Bravard", False],
-    [100087, "Braxton", "Janice", "Janice Braxton", False],
-    [101025, "Braxton", "Kara", "Kara Braxton", False],
-    [100368, "Braziel", "Angie", "Angie Braziel", False],
-    [100253, "Brcaninovic", "Razija", "Razija Brcaninovic", False],
-    [202638, "Breland", "Jessica", "Jessica Breland", False],
-    [1630095, "Brewer", "Brittany", "Brittany Brewer", False],
-    [1642287, "Brink", "Cameron", "Cameron Brink", True],
-    [100629, "Bristol", "Reshea", "Reshea Bristol", False],
-    [100221, "Brogan", "Michelle", "Michelle Brogan", False],
-    [100247, "Brondello", "Sandy", "Sandy Brondello", False],
-    [100248, "Brown", "Cindy", "Cindy Brown", False],
-    [100848, "Brown", "Coretta", "Coretta Brown", False],
-    [100492, "Brown", "Edwina", "Edwina Brown", False],
-    [1642240, "Brown", "Jaelyn", "Jaelyn Brown", True],
-    [1629480, "Brown", "Kalani", "Kalani Brown", True],
-    [100651, "Brown", "Kiesha", "Kiesha Brown", False],
-    [100193, "Brown", "La'Shawn", "La'Shawn Brown", False],
-    [1641665, "Brown", "Leigha", "Leigha Brown", False],
-    [100383, "Brown", "Lesley", "Lesley Brown", False],
-    [1628882, "Brown", "Lexie", "Lexie Brown", True],
-    [100097, "Brown", "Rushia", "Rushia Brown", False],
-    [1642309, "Brown-Turner", "Jakia", "Jakia Brown-Turner", False],
-    [100481, "Brumfield", "Marla", "Marla Brumfield", False],
-    [100916, "Brungo", "Jessica", "Jessica Brungo", False],
-    [1628265, "Brunner", "Sophie", "Sophie Brunner", False],
-    [100944, "Brunson", "Rebekkah", "Rebekkah Brunson", False],
-    [1642784, "Bueckers", "Paige", "Paige Bueckers", True],
-    [1627679, "Bulgak", "Adut", "Adut Bulgak", False],
-    [100058, "Bullett", "Vicky", "Vicky Bullett", False],
-    [204332, "Burdick", "Cierra", "Cierra Burdick", False],
-    [100156, "Burge", "Heidi", "Heidi Burge", False],
-    [100401, "Burgess", "Annie", "Annie Burgess", False],
-    [100011, "Burgess", "Linda", "Linda Burgess", False],
-    [1629568, "Burke", "Kennedy", "Kennedy Burke", True],
-    [100429, "Burras", "Alisa", "Alisa Burras", False],
-    [1630996, "Burrell", "Rae", "Rae Burrell", True],
-    [100660, "Burse", "Janell", "Janell Burse", False],
-    [1631007, "Burton", "Veronica", "Veronica Burton", True],
-    [203046, "Butler", "Briana", "Briana Butler", False],
-    [203874, "Butler", "Heather", "Heather Butler", False],
-    [100934, "Butts", "Tasha", "Tasha Butts", False],
-    [100027, "Byears", "Latasha", "Latasha Byears", False],
-    [203020, "Cain", "Kelley", "Kelley Cain", False],
-    [1630471, "Caldwell", "Maya", "Maya Caldwell", True],
-    [202633, "Cambage", "Liz", "Liz Cambage", False],
-    [100375, "Campbell", "Edna", "Edna Campbell", False],
-    [100360, "Campbell", "Michelle", "Michelle Campbell", False],
-    [202314, "Campbell", "Michelle", "Michelle Campbell", False],
-    [1628886, "Canada", "Jordin", "Jordin Canada", True],
-    [1628242, "Cannon", "Emma", "Emma Cannon", True],
-    [100384, "Canty", "Dominique", "Dominique Canty", False],
-    [1642289, "Cardoso", "Kamilla", "Kamilla Cardoso", True],
-    [101053, "Carey", "Jamie", "Jamie Carey", False],
-    [1629524, "Carleton", "Bridget", "Bridget Carleton", True],
-    [1630096, "Carrington", "DiJonai", "DiJonai Carrington", True],
-    [201502, "Carson", "Essence", "Essence Carson", False],
-    [100938, "Carter", "Amisha", "Amisha Carter", False],
-    [1629573, "Carter", "Arica", "Arica Carter", False],
-    [1630150, "Carter", "Chennedy", "Chennedy Carter", False],
-    [100052, "Carter", "Deborah", "Deborah Carter", False],
-    [1642305, "Carter", "Jessika", "Jessika Carter", False],
-    [203039, "Carter", "Sydney", "Sydney Carter", False],
-    [100721, "Cash", "Swin", "Swin Cash", False],
-    [100451, "Cassidy", "Jamie", "Jamie Cassidy", False],
-    [100796, "Castro Marques", "Iziane", "Iziane Castro Marques", False],
-    [100646, "Catchings", "Tamika", "Tamika Catchings", False],
-    [100733, "Caufield", "LaNeishea", "LaNeishea Caufield", False],
-    [1629569, "Cazorla", "Maite", "Maite Cazorla", False],
-    [100213, "Cebrian", "Elisabeth", "Elisabeth Cebrian", False],
-    [100194, "Chaconas", "Keri", "Keri Chaconas", False],
-    [201087, "Chambers", "Cori", "Cori Chambers", False],
-    [201481, "Chaney", "Quianna", "Quianna Chaney", False],
-    [100741, "Chapman-Daily", "Jill", "Jill Chapman-Daily", False],
-    [100005, "Charles", "Daedra", "Daedra Charles", False],
-    [1630097, "Charles", "Kaila", "Kaila Charles", True],
-    [202250, "Charles", "Tina", "Tina Charles", True],
-    [100178, "Chase", "Sonia", "Sonia Chase", False],
-    [202285, "Cheek", "Joy", "Joy Cheek", False],
-    [1642822, "Chen", "Kaitlyn", "Kaitlyn Chen", True],
-    [202639, "Chester-Wootton", "Felicia", "Felicia Chester-Wootton", False],
-    [100950, "Chones", "Kaayla", "Kaayla Chones", False],
-    [1628267, "Chong", "Saniya", "Saniya Chong", False],
-    [100759, "Christensen", "Kayte", "Kayte Christensen", False],
-    [202640, "Christmas-Kelly", "Karima", "Karima Christmas-Kelly", False],
-    [100937, "Christon", "Shameka", "Shameka Christon", False],
-    [201922, "Cirone", "Kristi", "Kristi Cirone", False],
-    [1642785, "Citron", "Sonia", "Sonia Citron", True],
-    [203406, "Clarendon", "Layshia", "Layshia Clarendon", False],
-    [202252, "Clark", "Alysha", "Alysha Clark", True],
-    [1642286, "Clark", "Caitlin", "Caitlin Clark", True],
-    [100162, "Clark", "Margo", "Margo Clark", False],
-    [100594, "Cleary", "Michelle", "Michelle Cleary", False],
-    [203451, "Clements", "Courtney", "Courtney Clements", False],
-    [100534, "Clinesmith", "Stacy", "Stacy Clinesmith", False],
-    [204333, "Cloud", "Natasha", "Natasha Cloud", True],
-    [1631002, "Clouden", "Nia", "Nia Clouden", False],
-    [1628268, "Coates", "Alaina", "Alaina Coates", False],
-    [1628269, "Coffey", "Nia", "Nia Coffey", True],
-    [201095, "Coggins", "Claire", "Claire Coggins", False],
-    [100958, "Coker", "Monique", "Monique Coker", False],
-    [100827, "Coleman", "Courtney", "Courtney Coleman", False],
-    [201889, "Coleman", "Marissa", "Marissa Coleman", False],
-    [203814, "Colhado", "Nadia", "Nadia Colhado", False],
-    [100009, "Colleton", "Katrina", "Katrina Colleton", False],
-    [1630454, "Collier", "Charli", "Charli Collier", False],
-    [1629483, "Collier", "Napheesa", "Napheesa Collier", True],
-    [202641, "Colson", "Sydney", "Sydney Colson", True],
-    [100051, "Compain", "Megan", "Megan Compain", False],
-    [100065, "Congreaves", "Andrea", "Andrea Congreaves", False],
-    [100688, "Consuegra", "Cara", "Cara Consuegra", False],
-    [1641660, "Cooke", "Zia", "Zia Cooke", True],
-    [100652, "Cooper", "Camille", "Camille Cooper", False],
-    [100073, "Cooper", "Cynthia", "Cynthia Cooper", False],
-    [1630099, "Cooper", "Te'a", "Te'a Cooper", False],
-    [1627674, "Copper", "Kahleah", "Kahleah Copper", True],
-    [1627635, "Cortijo", "Carla", "Carla Cortijo", False],
-    [1630100, "Cox", "Lauren", "Lauren Cox", False],
-    [100529, "Crawley", "Sylvia", "Sylvia Crawley", False],
-    [200692, "Crockett", "Willnett", "Willnett Crockett", False],
-    [100730, "Crockrom", "Danielle", "Danielle Crockrom", False],
-    [100665, "Cronin", "Katie", "Katie Cronin", False],
-    [100110, "Crumpton-Moorer", "Cassandra", "Cassandra Crumpton-Moorer", False],
-    [203813, "Cruz", "Anna", "Anna Cruz", False],
-    [1631032, "Cubaj", "Lorela", "Lorela Cubaj", False],
-    [1631072, "Cunane", "Elissa", "Elissa Cunane", False],
-    [100554, "Cunningham", "Beth", "Beth Cunningham", False],
-    [100743, "Cunningham", "Davalyn", "Davalyn Cunningham", False],
-    [1629482, "Cunningham", "Sophie", "Sophie Cunningham", True],
-    [200673, "Currie", "Monique", "Monique Currie", False],
-    [100760, "Curry", "Edniesha", "Edniesha Curry", False],
-    [204302, "Dabovic", "Ana", "Ana Dabovic", False],
-    [100722, "Dales", "Stacey", "Stacey Dales", False],
-    [100482, "Daley", "Grace", "Grace Daley", False],
-    [1630101, "Dangerfield", "Crystal", "Crystal Dangerfield", False],
-    [203024, "Dantas", "Damiris", "Damiris Dantas", True],
-    [100457, "Darling", "Helen", "Helen Darling", False],
-    [201047, "Davenport", "Jessica", "Jessica Davenport", False],
-    [200725, "Davis", "Brandi", "Brandi Davis", False],
-    [201061, "Davis", "Dee", "Dee Davis", False],
-    [1628273, "Davis", "Kaela", "Kaela Davis", False],
-    [1642301, "Davis", "Marquesha", "Marquesha Davis", True],
-    [1630452, "Davis", "Rennia", "Rennia Davis", False],
-    [201890, "Davis-Cain", "Tenae", "Tenae Davis-Cain", False],
-    [100377, "Davis-Wrightsil", "Clarissa", "Clarissa Davis-Wrightsil", False],
-    [100493, "DeForge", "Anna", "Anna DeForge", False],
-    [1628890, "DeShields", "Diamond", "Diamond DeShields", False],
-    [203399, "Delle Donne", "Elena", "Elena Delle Donne", False],
-    [100975, "Derevjanik", "Jennifer", "Jennifer Derevjanik", False],
-    [1642773, "Diaby", "Kariata", "Kariata Diaby", True],
-    [1628358, "Diarra", "Maimouna", "Maimouna Diarra", False],
-    [100483, "Dickerson", "Keitha", "Keitha Dickerson", False],
-    [1631029, "Dickey", "Jasmine", "Jasmine Dickey", False],
-    [204355, "Dietrick", "Blake", "Blake Dietrick", False],
-    [203400, "Diggins", "Skylar", "Skylar Diggins", True],
-    [100866, "Dillard", "Tai", "Tai Dillard", False],
-    [1627639, "Dimitrakou", "Zoi", "Zoi Dimitrakou", False],
-    [1641700, "Dixon", "Liz", "Liz Dixon", False],
-    [100008, "Dixon", "Tamecka", "Tamecka Dixon", False],
-    [1641602, "Dojkić", "Ivana", "Ivana Dojkić", False],
-    [203828, "Dolson", "Stefanie", "Stefanie Dolson", True],
-    [100214, "Domond", "Nadine", "Nadine Domond", False],
-    [100862, "Donaphin", "Bethany", "Bethany Donaphin", False],
-    [201063, "Doron", "Shay", "Shay Doron", False],
-    [200684, "Dorrell", "Scholanda", "Scholanda Dorrell", False],
-    [204309, "Dos Santos", "Clarissa", "Clarissa Dos Santos", False],
-    [100666, "Douglas", "Katie", "Katie Douglas", False],
-    [1630104, "Doyle", "Kathleen", "Kathleen Doyle", False],
-    [1627644, "Dubljevic", "Jelena", "Jelena Dubljevic", False],
-    [200701, "Duffy", "Megan", "Megan Duffy", False],
-    [203820, "Dumerc", "Celine", "Celine Dumerc", False],
-    [1630440, "Dungee", "Chelsea", "Chelsea Dungee", False],
-    [202643, "Dunlap", "Victoria", "Victoria Dunlap", False],
-    [200676, "Dupree", "Candice", "Candice Dupree", False],
-    [1629476, "Durr", "Asia (AD)", "Asia (AD) Durr", False],
-    [100239, "Dydek", "Margo", "Margo Dydek", False],
-    [1642290, "Edwards", "Aaliyah", "Aaliyah Edwards", True],
-    [100088, "Edwards", "Michelle", "Michelle Edwards", False],
-    [100111, "Edwards", "Simone", "Simone Edwards", False],
-    [100838, "Edwards", "Teresa", "Teresa Edwards", False],
-    [100398, "Edwards", "Tonya", "Tonya Edwards", False],
-    [1631031, "Egbo", "Queen", "Queen Egbo", False],
-    [1627645, "Eldebrink", "Frida", "Frida Eldebrink", False],
-    [203876, "Ellenberg", "Aaryn", "Aaryn Ellenberg", False],
-    [1628327, "Elonu", "Adaora", "Adaora Elonu", False],
-    [101032, "Ely-Gash", "Shyra", "Shyra Ely-Gash", False],
-    [1631083, "Engstler", "Emily", "Emily Engstler", True],
-    [100350, "Enis", "Shalonda", "Shalonda Enis", False],
-    [1628300, "Epps", "Makayla", "Makayla Epps", False],
-    [100446, "Erb", "Summer", "Summer Erb", False],
-    [201486, "Ervin", "Lauren", "Lauren Ervin", False],
-    [1630389, "Evans", "Dana", "Dana Evans", True],
-    [202999, "Evans", "Dawn", "Dawn Evans", False],
-    [1642300, "Fair", "Dyaisha", "Dyaisha Fair", False],
-    [100399, "Fallon", "Trisha", "Trisha Fallon", False],
-    [1641675, "Fankam Mendjiadeu", "Dulcy", "Dulcy Fankam Mendjiadeu", False],
-    [203408, "Faris", "Kelly", "Kelly Faris", False],
-    [100494, "Farris", "Barbara", "Barbara Farris", False],
-    [203857, "Faulkner", "Jamierra", "Jamierra Faulkner", False],
-    [1642790, "Feagin", "Sania", "Sania Feagin", True],
-    [100170, "Feaster", "Allison", "Allison Feaster", False],
-    [100998, "Fei Fei", "Sui", "Sui Fei Fei", False],
-    [100685, "Ferdinand-Harris", "Marie", "Marie Ferdinand-Harris", False],
-    [201037, "Fernandez", "Marta", "Marta Fernandez", False],
-    [100509, "Ferragut", "Marina", "Marina Ferragut", False],
-    [1630142, "Fiebich", "Leonie", "Leonie Fiebich", True],
-    [1627699, "Fields", "Nirra", "Nirra Fields", False],
-    [100392, "Figgs", "Ukari", "Ukari Figgs", False],
-    [100089, "Fijalkowski", "Isabelle", "Isabelle Fijalkowski", False],
-    [100510, "Firsova", "Olga", "Olga Firsova", False],
-    [1628289, "Fitzgerald", "Feyonda", "Feyonda Fitzgerald", False],
-    [100559, "Flores", "Milena", "Milena Flores", False],
-    [200680, "Fluker", "Tye'sha", "Tye'sha Fluker", False],
-    [100400, "Folkl", "Kristin", "Kristin Folkl", False],
-    [100843, "Ford", "Cheryl", "Cheryl Ford", False],
-    [100107, "Ford", "Kisha", "Kisha Ford", False],
-    [100599, "Ford", "Stacey", "Stacey Ford", False],
-    [100033, "Foster", "Toni", "Toni Foster", False],
-    [201480, "Fowles", "Sylvia", "Sylvia Fowles", False],
-    [100511, "Francis", "Desiree", "Desiree Francis", False],
-    [201510, "Franklin", "A'Quonesia", "A'Quonesia Franklin", False],
-    [201892, "Frazee", "Megan", "Megan Frazee", False],
-    [100547, "Frese", "Stacy", "Stacy Frese", False],
-    [100393, "Frett", "La'Keshia", "La'Keshia Frett", False],
-    [100948, "Frierson", "Catrina", "Catrina Frierson", False],
-    [100746, "Frohlich", "Linda", "Linda Frohlich", False],
-    [100918, "Futrell", "Candace", "Candace Futrell", False],
-    [1627701, "Fágbénlé", "Temi", "Temi Fágbénlé", True],
-    [100548, "Gaither", "Katryna", "Katryna Gaither", False],
-    [100010, "Gant", "Travesa", "Travesa Gant", False],
-    [100803, "Garcia", "Begona", "Begona Garcia", False],
-    [200704, "Gardin", "Kerri", "Kerri Gardin", False],
-    [100747, "Gardner", "Andrea", "Andrea Gardner", False],
-    [203822, "Gardner", "Rebekah", "Rebekah Gardner", True],
-    [100503, "Garner", "Andrea", "Andrea Garner", False],
-    [203832, "Gatling", "Markeisha", "Markeisha Gatling", False],
-    [100081, "Gay", "Pietra", "Pietra Gay", False],
-    [100515, "Gayden", "Cornelia", "Cornelia Gayden", False],
-    [201052, "Gearlds", "Katie", "Katie Gearlds", False],
-    [1630143, "Geiselsöder", "Luisa", "Luisa Geiselsöder", True],
-    [203043, "Gemelos", "Jacki", "Jacki Gemelos", False],
-    [204297, "George", "Cayla", "Cayla George", False],
-    [100014, "Gessig", "Kim", "Kim Gessig", False],
-    [100504, "Gibson", "Kelley", "Kelley Gibson", False],
-    [100030, "Gillom", "Jennifer", "Jennifer Gillom", False],
-    [100468, "Gilmore", "Usha", "Usha Gilmore", False],
-    [201551, "Gissendanner", "Kamela", "Kamela Gissendanner", False],
-    [201106, "Givens", "Chrissy", "Chrissy Givens", False],
-    [200648, "Gomis", "Emilie", "Emilie Gomis", False],
-    [1630438, "Gondrezick", "Kysre", "Kysre Gondrezick", False],
-    [203067, "Goodlett", "Sasha", "Sasha Goodlett", False],
-    [1630453, "Goodman", "Aleah", "Aleah Goodman", False],
-    [203426, "Goodrich", "Angel", "Angel Goodrich", False],
-    [100363, "Goodson", "Adrienne", "Adrienne Goodson", False],
-    [100017, "Gordon", "Bridgette", "Bridgette Gordon", False],
-    [1630110, "Gorecki", "Haley", "Haley Gorecki", False],
-    [1627643, "Goree", "Cyesha", "Cyesha Goree", False],
-    [201107, "Goring", "Gillian", "Gillian Goring", False],
-    [100728, "Gortman", "Shaunzinski", "Shaunzinski Gortman", False],
-    [100289, "Graham", "Margo", "Margo Graham", False],
-    [200709, "Grant", "Erin", "Erin Grant", False],
-    [1627689, "Graves", "Bashaara", "Bashaara Graves", False],
-    [100021, "Graves", "Denique", "Denique Graves", False],
-    [1628277, "Gray", "Allisha", "Allisha Gray", True],
-    [203833, "Gray", "Chelsea", "Chelsea Gray", True],
-    [204334, "Gray", "Reshanda", "Reshanda Gray", False],
-    [202280, "Gray-Lawson", "Alexis", "Alexis Gray-Lawson", False],
-    [100881, "Greco", "Michelle", "Michelle Greco", False],
-    [202253, "Greene", "Kalana", "Kalana Greene", False],
-    [203423, "Greene", "Nikki", "Nikki Greene", False],
-    [101057, "Greenwalt", "Cisti", "Cisti Greenwalt", False],
-    [100476, "Grgin Fonseca", "Vedrana", "Vedrana Grgin Fonseca", False],
-    [202254, "Griffin", "Kelsey", "Kelsey Griffin", False],
-    [100419, "Griffith", "Yolanda", "Yolanda Griffith", False],
-    [203398, "Griner", "Brittney", "Brittney Griner", True],
-    [100044, "Grooms", "Lady", "Lady Grooms", False],
-    [100394, "Grubin", "Gordana", "Gordana Grubin", False],
-    [201058, "Gruda", "Sandrine", "Sandrine Gruda", False],
-    [1630441, "Guirantes", "Arella", "Arella Guirantes", False],
-    [1629484, "Gustafson", "Megan", "Megan Gustafson", True],
-    [100074, "Guyton", "Wanda", "Wanda Guyton", False],
-    [1627681, "Gwathmey", "Jazmon", "Jazmon Gwathmey", False],
-    [1628895, "Gülich", "Marie", "Marie Gülich", False],
-    [100019, "Hagiwara", "Mikiko", "Mikiko Hagiwara", False],
-    [201057, "Hairston", "Kamesha", "Kamesha Hairston", False],
-    [100516, "Hall", "Amber", "Amber Hall", False],
-    [1642788, "Hall", "Bree", "Bree Hall", True],
-    [100458, "Hall", "Vicki", "Vicki Hall", False],
-    [100270, "Hamblin", "Angela", "Angela Hamblin", False],
-    [1627685, "Hamblin", "Ruth", "Ruth Hamblin", False],
-    [204324, "Hamby", "Dearica", "Dearica Hamby", True],
-    [100342, "Hammon", "Becky", "Becky Hammon", False],
-    [203034, "Hampton", "Keisha", "Keisha Hampton", False],
-    [100102, "Hampton", "Kym", "Kym Hampton", False],
-    [203845, "Hamson", "Jennifer", "Jennifer Hamson", False],
-    [100517, "Hamzova", "Romana", "Romana Hamzova", False],
-    [1629566, "Han Xu", "", "Han Xu", False],
-    [204336, "Harden", "Alex", "Alex Harden", False],
-    [201046, "Harding", "Lindsey", "Lindsey Harding", False],
-    [201509, "Harper", "Laura", "Laura Harper", False],
-    [1628897, "Harper", "Linnae", "Linnae Harper", False],
-    [100096, "Harrington", "Donna", "Donna Harrington", False],
-    [202644, "Harris", "Amber", "Amber Harris", False],
-    [100084, "Harris", "Fran", "Fran Harris", False],
-    [1630112, "Harris", "Tyasha", "Tyasha Harris", True],
-    [204330, "Harrison", "Isabelle", "Isabelle Harrison", True],
-    [100378, "Harrison", "Lisa", "Lisa Harrison", False],
-    [100222, "Harrower", "Kristi", "Kristi Harrower", False],
-    [203829, "Hartley", "Bria", "Bria Hartley", True],
-    [203418, "Hassell", "Jasmine", "Jasmine Hassell", False],
-    [1630043, "Határ", "Bernadett", "Bernadett Határ", False],
-    [203403, "Hawkins", "Tianna", "Tianna Hawkins", False],
-    [100933, "Hayden", "Vanessa", "Vanessa Hayden", False],
-    [203026, "Hayes", "Tiffany", "Tiffany Hayes", True],
-    [101027, "Haynie", "Kristin", "Kristin Haynie", False],
-    [100045, "Head", "Dena", "Dena Head", False],
-    [1630385, "Heal", "Shyla", "Shyla Heal", False],
-    [1630113, "Hebard", "Ruthy", "Ruthy Hebard", False],
-    [1631118, "Held", "Lexi", "Lexi Held", True],
-    [1631089, "Henderson", "Destanni", "Destanni Henderson", False],
-    [100082, "Henderson", "Nekeshia", "Nekeshia Henderson", False],
-    [100430, "Henderson", "Tracy", "Tracy Henderson", False],
-    [100336, "Henning", "Sonja", "Sonja Henning", False],
-    [1630114, "Herbert Harrigan", "Mikiah", "Mikiah Herbert Harrigan", False],
-    [100549, "Herrig", "Amy", "Amy Herrig", False],
-    [201048, "Herrington", "Armintie", "Armintie Herrington", False],
-    [100538, "Hibbert", "Katrina", "Katrina Hibbert", False],
-    [100048, "Hicks", "Jessie", "Jessie Hicks", False],
-    [1629567, "Hiedeman", "Natisha", "Natisha Hiedeman", True],
-    [202255, "Hightower", "Allison", "Allison Hightower", False],
-    [100452, "Hill", "E.C.", "E.C. Hill", False],
-    [203401, "Hill", "Tayler", "Tayler Hill", False],
-    [1631044, "Hillmon", "Naz", "Naz Hillmon", True],
-    [1628949, "Hillsman", "Khaalia", "Khaalia Hillsman", False],
-    [1628899, "Hines-Allen", "Myisha", "Myisha Hines-Allen", True],
-    [100250, "Hlede", "Korie", "Korie Hlede", False],
-    [100908, "Hlede", "Korie", "Korie Hlede", False],
-    [101033, "Hodges", "Roneeka", "Roneeka Hodges", False],
-    [100928, "Hoffman", "Ebony", "Ebony Hoffman", False],
-    [100356, "Holdsclaw", "Chamique", "Chamique Holdsclaw", False],
-    [100421, "Holland-Corn", "Kedra", "Kedra Holland-Corn", False],
-    [201895, "Hollingsworth", "Quanitra", "Quanitra Hollingsworth", False],
-    [1627680, "Hollivay", "Rachel", "Rachel Hollivay", False],
-    [1627678, "Holmes", "Bria", "Bria Holmes", False],
-    [100351, "Holmes", "Joy", "Joy Holmes", False],
-    [1630115, "Holmes", "Joyner", "Joyner Holmes", True],
-    [1642307, "Holmes", "Mackenzie", "Mackenzie Holmes", True],
-    [201530, "Holmes", "Sequoia", "Sequoia Holmes", False],
-    [201483, "Holt", "Amber", "Amber Holt", False],
-    [203835, "Hooper", "Jordan", "Jordan Hooper", False],
-    [204348, "Hoover", "Andrea", "Andrea Hoover", False],
-    [100408, "Hope", "Kym", "Kym Hope", False],
-    [203563, "Hopkins", "Chelsea", "Chelsea Hopkins", False],
-    [100071, "Hopson-Shelton", "Susie", "Susie Hopson-Shelton", False],
-    [201487, "Hornbuckle", "Alexis", "Alexis Hornbuckle", False],
-    [1641651, "Horston", "Jordan", "Jordan Horston", False],
-    [201501, "Houston", "Charde", "Charde Houston", False],
-    [202262, "Houts", "Ashley", "Ashley Houts", False],
-    [1629500, "Howard", "Anriel", "Anriel Howard", False],
-    [100431, "Howard", "Jennifer", "Jennifer Howard", False],
-    [203827, "Howard", "Natasha", "Natasha Howard", True],
-    [1631009, "Howard", "Rhyne", "Rhyne Howard", True],
-    [204337, "Hrynko", "Brittany", "Brittany Hrynko", False],
-    [1629570, "Huff", "Megan", "Megan Huff", False],
-    [1631086, "Hull", "Lexie", "Lexie Hull", True],
-    [201488, "Humphrey", "Tasha", "Tasha Humphrey", False],
-    [202645, "Ibekwe", "Ify", "Ify Ibekwe", False],
-    [1629477, "Ionescu", "Sabrina", "Sabrina Ionescu", True],
-    [1642792, "Iriafen", "Kiki", "Kiki Iriafen", True],
-    [101021, "Irvin", "Sandora", "Sandora Irvin", False],
-    [100364, "Ivanyi", "Dalma", "Dalma Ivanyi", False],
-    [100650, "Ivey", "Niele", "Niele Ivey", False],
-    [100197, "Jackson", "Angela", "Angela Jackson", False],
-    [1629505, "Jackson", "Chloe", "Chloe Jackson", False],
-    [100727, "Jackson", "Deanna", "Deanna Jackson", False],
-    [100867, "Jackson", "Gwen", "Gwen Jackson", False],
-    [100682, "Jackson", "Lauren", "Lauren Jackson", False],
-    [1642288, "Jackson", "Rickea", "Rickea Jackson", True],
-    [100496, "Jackson", "Tamicha", "Tamicha Jackson", False],
-    [100077, "Jackson", "Tammy", "Tammy Jackson", False],
-    [100034, "Jackson", "Tia", "Tia Jackson", False],
-    [201050, "Jackson", "Tiffany", "Tiffany Jackson", False],
-    [100935, "Jacobs", "Amber", "Amber Jacobs", False],
-    [1642793, "James", "Aziaha", "Aziaha James", True],
-    [203427, "James", "Jasmine", "Jasmine James", False],
-    [200678, "James", "Tamara", "Tamara James", False],
-    [201896, "January", "Briann", "Briann January", False],
-    [202647, "Jarry", "Rachel", "Rachel Jarry", False],
-    [1627669, "Jefferson", "Moriah", "Moriah Jefferson", True],
-    [203421, "Jeffery", "Chucky", "Chucky Jeffery", False],
-    [201869, "Jekabsone-Zogota", "Anete", "Anete Jekabsone-Zogota", False],
-    [1627704, "Jenkins", "Alisia", "Alisia Jenkins", False],
-    [1641653, "Joens", "Ashley", "Ashley Joens", False],
-    [100939, "Joens", "Cathy", "Cathy Joens", False],
-    [1629546, "Johannès", "Marine", "Marine Johannès", True],
-    [100180, "Johns Kimbrough", "Pollyanna", "Pollyanna Johns Kimbrough", False],
-    [100100, "Johnson", "Adrienne", "Adrienne Johnson", False],
-    [100870, "Johnson", "Chandra", "Chandra Johnson", False],
-    [203017, "Johnson", "Glory", "Glory Johnson", False],
-    [100668, "Johnson", "Jaclyn", "Jaclyn Johnson", False],
-    [100242, "Johnson", "LaTonya", "LaTonya Johnson", False],
-    [100290, "Johnson", "Leslie", "Leslie Johnson", False],
-    [100369, "Johnson", "Niesa", "Niesa Johnson", False],
-    [100410, "Johnson", "Shannon", "Shannon Johnson", False],
-    [203018, "Johnson", "Shenise", "Shenise Johnson", False],
-    [1630118, "Johnson", "Stella", "Stella Johnson", False],
-    [101024, "Johnson", "Temeka", "Temeka Johnson", False],
-    [100233, "Johnson", "Tiffani", "Tiffani Johnson", False],
-    [100103, "Johnson", "Vickie", "Vickie Johnson", False],
-    [100432, "Jolly Harper", "Kellie", "Kellie Jolly Harper", False],
-    [1628283, "Jones", "Alexis", "Alexis Jones", False],
-    [100723, "Jones", "Asjha", "Asjha Jones", False],
-    [1628280, "Jones", "Brionna", "Brionna Jones", True],
-    [100941, "Jones", "Chandi", "Chandi Jones", False],
-    [1641650, "Jones", "Haley", "Haley Jones", True],
-    [100558, "Jones", "Jameka", "Jameka Jones", False],
-    [1630119, "Jones", "Jazmine", "Jazmine Jones", False],
-    [1627673, "Jones", "Jonquel", "Jonquel Jones", True],
-    [100454, "Jones", "Larecha", "Larecha Jones", False],
-    [100887, "Jones", "Marion", "Marion Jones", False],
-    [100092, "Jones", "Merlakia", "Merlakia Jones", False],
-    [1630120, "Jones", "Stephanie", "Stephanie Jones", False],
-    [100223, "Jordan", "Pauline", "Pauline Jordan", False],
-    [1641657, "Juhász", "Dorka", "Dorka Juhász", False],
-    [1642534, "Kalu", "Ezinne", "Ezinne Kalu", False],
-    [100251, "Kausaite", "Aneta", "Aneta Kausaite", False],
-    [1629502, "Kea", "Paris", "Paris Kea", False],
-    [204352, "Kelley", "Shae", "Shae Kelley", False],
-    [201494, "Kelly", "Crystal", "Crystal Kelly", False],
-    [204331, "Kiesel", "Brianna", "Brianna Kiesel", False],
-    [1642820, "King", "Liatu", "Liatu King", True],
-    [101078, "King-Borchardt", "Susan", "Susan King-Borchardt", False],
-    [100626, "Kingi-Cross", "Jae", "Jae Kingi-Cross", False],
-    [1642295, "Kitley", "Elizabeth", "Elizabeth Kitley", True],
-    [203041, "Kizer", "Lynetta", "Lynetta Kizer", False],
-    [100737, "Klimesova", "Zuzana", "Zuzana Klimesova", False],
-    [1628926, "Kliundikova", "Maria", "Maria Kliundikova", True],
-    [1627682, "Knight", "Whitney", "Whitney Knight", False],
-    [202318, "Kobryn", "Ewelina", "Ewelina Kobryn", False],
-    [101084, "Koehn", "Laurie", "Laurie Koehn", False],
-    [1631021, "Koné", "Sika", "Sika Koné", True],
-    [100671, "Korstine", "Ilona", "Ilona Korstine", False],
-    [100055, "Koss", "Greta", "Greta Koss", False],
-    [100786, "Kostaki", "Anastasia", "Anastasia Kostaki", False],
-    [100186, "Kostic", "Tanja", "Tanja Kostic", False],
-    [1642797, "Kosu", "Anastasiia Olairi", "Anastasiia Olairi Kosu", True],
-    [101049, "Kraayeveld", "Cathrine", "Cathrine Kraayeveld", False],
-    [1630961, "Krajisnik", "Tina", "Tina Krajisnik", False],
-    [100477, "Kubik", "Nicole", "Nicole Kubik", False],
-    [1630386, "Kuier", "Awak", "Awak Kuier", False],
-    [100224, "Kuklova", "Andrea", "Andrea Kuklova", False],
-    [1642303, "Lacan", "Leïla", "Leïla Lacan", True],
-    [202256, "Lacey", "Alison", "Alison Lacey", False],
-    [101080, "Lacy", "Jennifer", "Jennifer Lacy", False],
-    [201490, "Lacy", "Natasha", "Natasha Lacy", False],
-    [100425, "Lacy", "Venus", "Venus Lacy", False],
-    [1629490, "Laksa", "Kitija", "Kitija Laksa", True],
-    [100207, "Lamb", "Monica", "Monica Lamb", False],
-    [1643154, "Lambert", "Kyra", "Kyra Lambert", True],
-    [100726, "Lambert", "Sheila", "Sheila Lambert", False],
-    [204335, "Laney-Hamilton", "Betnijah", "Betnijah Laney-Hamilton", False],
-    [100379, "Lang-Harris", "Merlelynn", "Merlelynn Lang-Harris", False],
-    [201518, "Langhorne", "Crystal", "Crystal Langhorne", False],
-    [100365, "Lara", "Krystyna", "Krystyna Lara", False],
-    [201503, "Larkins", "Erlana", "Erlana Larkins", False],
-    [100642, "Lassiter", "Amanda", "Amanda Lassiter", False],
-    [201056, "Latta", "Ivory", "Ivory Latta", False],
-    [202650, "Lavender", "Jantel", "Jantel Lavender", False],
-    [100874, "Lawson", "Kara", "Kara Lawson", False],
-    [101018, "Lawson-Wade", "Edwige", "Edwige Lawson-Wade", False],
-    [100663, "Lazic", "Katarina", "Katarina Lazic", False],
-    [201898, "Lehning", "Shalee", "Shalee Lehning", False],
-    [1642304, "Leite", "Carla", "Carla Leite", True],
-    [100484, "Lennox", "Betty", "Betty Lennox", False],
-    [1629506, "Leslie", "Kiara", "Kiara Leslie", False],
-    [100003, "Leslie", "Lisa", "Lisa Leslie", False],
-    [200715, "Leuchanka", "Yelena", "Yelena Leuchanka", False],
-    [100653, "Levandusky", "Nicole", "Nicole Levandusky", False],
-    [100155, "Levesque", "Nicole", "Nicole Levesque", False],
-    [1628292, "Lewis", "Breanna", "Breanna Lewis", False],
-    [100931, "Lewis", "Doneeka", "Doneeka Lewis", False],
-    [100754, "Lewis", "TaKeisha", "TaKeisha Lewis", False],
-    [100643, "Lewis", "Tynesha", "Tynesha Lewis", False],
-    [101000, "Li jie", "Miao", "Miao Li jie", False],
-    [100032, "Lieberman", "Nancy", "Nancy Lieberman", False],
-    [202316, "Lilley", "Taylor", "Taylor Lilley", False],
-    [1642768, "Linskens", "Kyara", "Kyara Linskens", True],
-    [203870, "Lister", "Jasmine", "Jasmine Lister", False],
-    [203834, "Liston", "Tricia", "Tricia Liston", False],
-    [100402, "Lloyd-Curry", "Andrea", "Andrea Lloyd-Curry", False],
-    [100002, "Lobo", "Rebecca", "Rebecca Lobo", False],
-    [204328, "Logic", "Samantha", "Samantha Logic", False],
-    [1641661, "Lopez Sénéchal", "Lou", "Lou Lopez Sénéchal", False],
-    [1628905, "Louis", "Raigyne", "Raigyne Louis", False],
-    [100470, "Lovelace", "Stacey", "Stacey Lovelace", False],
-    [204319, "Loyd", "Jewell", "Jewell Loyd", True],
-    [203843, "Lucas", "Maggie", "Maggie Lucas", False],
-    [100675, "Luckey", "Pat", "Pat Luckey", False],
-    [100694, "Luz", "Helen", "Helen Luz", False],
-    [101023, "Lyttle", "Sancho", "Sancho Lyttle", False],
-    [100012, "Mabika", "Mwadi", "Mwadi Mabika", False],
-    [1629497, "Mabrey", "Marina", "Marina Mabrey", True],
-    [203887, "Macaulay", "Victoria", "Victoria Macaulay", False],
-    [100987, "Macchi", "Laura", "Laura Macchi", False],
-    [100395, "Machanguana", "Clarisse", "Clarisse Machanguana", False],
-    [1630957, "Machida", "Rui", "Rui Machida", False],
-    [1630442, "Mack", "Natasha", "Natasha Mack", True],
-    [204298, "Madgen", "Tess", "Tess Madgen", False],
-    [1629496, "Magbegor", "Ezi", "Ezi Magbegor", True],
-    [101056, "Mahoney", "Megan", "Megan Mahoney", False],
-    [100512, "Mahoney", "Shea", "Shea Mahoney", False],
-    [100731, "Maiga-Ba", "Hamchetou", "Hamchetou Maiga-Ba", False],
-    [100518, "Malcolm", "Nadine", "Nadine Malcolm", False],
-    [1630993, "Maley", "Anneli", "Anneli Maley", False],
-    [100833, "Mallory", "Sonja", "Sonja Mallory", False],
-    [1642798, "Malonga", "Dominique", "Dominique Malonga", True],
-    [204326, "Malott", "Ally", "Ally Malott", False],
-    [201140, "Maltsi", "Evanthia", "Evanthia Maltsi", False],
-    [101029, "Mann", "Kristen", "Kristen Mann", False],
-    [100063, "Manning", "Sharon", "Sharon Manning", False],
-    [100060, "Mapp", "Rhonda", "Rhonda Mapp", False],
-    [100570, "Marciniak", "Michelle", "Michelle Marciniak", False],
-    [202276, "Marginean", "Gabriela", "Gabriela Marginean", False],
-    [1642796, "Marshall", "Rayah", "Rayah Marshall", True],
-    [1642324, "Martin", "Kate", "Kate Martin", True],
-    [100485, "Martin", "Maylana", "Maylana Martin", False],
-    [100945, "Martinez", "Nuria", "Nuria Martinez", False],
-    [100988, "Masciadri", "Raffaella", "Raffaella Masciadri", False],
-    [100557, "Massaline", "Tonya", "Tonya Massaline", False],
-    [203407, "Mathies", "A'dia", "A'dia Mathies", False],
-    [101064, "Matter", "Caity", "Caity Matter", False],
-    [101026, "Mattera", "Katie", "Katie Mattera", False],
-    [1628906, "Mavunga", "Stephanie", "Stephanie Mavunga", False],
-    [100094, "Maxwell", "Anita", "Anita Maxwell", False],
-    [100357, "Maxwell", "Monica", "Monica Maxwell", False],
-    [100920, "Mazzante", "Kelly", "Kelly Mazzante", False],
-    [203825, "McBride", "Kayla", "Kayla McBride", True],
-    [100744, "McCain", "Brandi", "Brandi McCain", False],
-    [100521, "McCain", "Tiffany", "Tiffany McCain", False],
-    [1628286, "McCall", "Erica", "Erica McCall", False],
-    [201901, "McCants", "Rashanda", "Rashanda McCants", False],
-    [1628907, "McCarty-Williams", "Brooke", "Brooke McCarty-Williams", False],
-    [101019, "McCarville", "Janel", "Janel McCarville", False],
-    [1642799, "McConnell", "Megan", "Megan McConnell", True],
-    [100187, "McConnell Serio", "Suzie", "Suzie McConnell Serio", False],
-    [201881, "McCoughtry", "Angel", "Angel McCoughtry", False],
-    [1629479, "McCowan", "Teaira", "Teaira McCowan", True],
-    [202263, "McCray", "Danielle", "Danielle McCray", False],
-    [100198, "McCray", "Nikki", "Nikki McCray", False],
-    [100069, "McCray, Nikki (, Penny", "", "Penny McCray, Nikki (", False],
-    [100478, "McCrimmon", "Nicky", "Nicky McCrimmon", False],
-    [100471, "McCulley", "Danielle", "Danielle McCulley", False],
-    [1630462, "McDonald", "Aari", "Aari McDonald", True],
-    [100020, "McGee", "Pam", "Pam McGee", False],
-    [1627677, "McGee-Stafford", "Imani", "Imani McGee-Stafford", False],
-    [100411, "McGhee", "Carla", "Carla McGhee", False],
-    [203414, "McKenith", "Nadirah", "Nadirah McKenith", False],
-    [203881, "McKinney", "Shanece", "Shanece McKinney", False],
-    [100412, "McWilliams-Franklin", "Taj", "Taj McWilliams-Franklin", False],
-    [203416, "Meesseman", "Emma", "Emma Meesseman", True],
-    [1631141, "Melbourne", "Jade", "Jade Melbourne", True],
-    [100433, "Melvin", "Chasity", "Chasity Melvin", False],
-    [100984, "Mendiola", "Giuliana", "Giuliana Mendiola", False],
-    [1641642, "Meng", "Li", "Li Meng", False],
-    [1629470, "Mestdagh", "Kim", "Kim Mestdagh", False],
-    [1641671, "Meyers", "Abby", "Abby Meyers", False],
-    [1641659, "Mikesell", "Taylor", "Taylor Mikesell", False],
-    [1631263, "Milić", "Nikolina", "Nikolina Milić", False],
-    [201902, "Miller", "Britany", "Britany Miller", False],
-    [100690, "Miller", "Coco", "Coco Miller", False],
-    [1641649, "Miller", "Diamond", "Diamond Miller", True],
-    [100627, "Miller", "Kelly", "Kelly Miller", False],
-    [100851, "Miller", "Teana", "Teana Miller", False],
-    [100555, "Mills", "Tausha", "Tausha Mills", False],
-    [201903, "Milovanovic", "Jelena", "Jelena Milovanovic", False],
-    [100396, "Milton-Jones", "DeLisha", "DeLisha Milton-Jones", False],
-    [100876, "Min Jung", "Sun", "Sun Min Jung", False],
-    [1628909, "Mitchell", "Kelsey", "Kelsey Mitchell", True],
-    [201507, "Mitchell", "Leilani", "Leilani Mitchell", False],
-    [1627676, "Mitchell", "Tiffany", "Tiffany Mitchell", True],
-    [1628866, "Miyem", "Endy", "Endy Miyem", False],
-    [200688, "Moeggenberg", "Liz", "Liz Moeggenberg", False],
-    [100718, "Moises Pinto", "Adriana", "Adriana Moises Pinto", False],
-    [202264, "Mokango", "Chanel", "Chanel Mokango", False],
-    [1629492, "Mompremier", "Beatrice", "Beatrice Mompremier", False],
-    [202261, "Monroe", "Jacinta", "Jacinta Monroe", False],
-    [101065, "Montanana", "Anna", "Anna Montanana", False],
-    [202652, "Montgomery", "Alex", "Alex Montgomery", False],
-    [1628298, "Montgomery", "Lanay", "Lanay Montgomery", False],
-    [201904, "Montgomery", "Renee", "Renee Montgomery", False],
-    [100680, "Moore", "Jackie", "Jackie Moore", False],
-    [101042, "Moore", "Jessica", "Jessica Moore", False],
-    [203409, "Moore", "Lindsey", "Lindsey Moore", False],
-    [101028, "Moore", "Loree", "Loree Moore", False],
-    [202632, "Moore", "Maya", "Maya Moore", False],
-    [201077, "Moore", "Navonda", "Navonda Moore", False],
-    [100374, "Moore", "Penny", "Penny Moore", False],
-    [100734, "Moore", "Tamara", "Tamara Moore", False],
-    [100085, "Moore", "Yolanda", "Yolanda Moore", False],
-    [100674, "Moos", "Carolyn", "Carolyn Moos", False],
-    [202623, "Morello", "Aneika", "Aneika Morello", False],
-    [202680, "Morris", "Darxia", "Darxia Morris", False],
-    [202265, "Morris", "Jene", "Jene Morris", False],
-    [203001, "Morrison", "Ziomara", "Ziomara Morrison", False],
-    [1642800, "Morrow", "Aneesah", "Aneesah Morrow", True],
-    [201051, "Mosby", "Bernice", "Bernice Mosby", False],
-    [1627688, "Moseley", "Brene", "Brene Moseley", False],
-    [100018, "Mosley-McAfee", "Judy", "Judy Mosley-McAfee", False],
-    [204321, "Mosqueda-Lewis", "Kaleena", "Kaleena Mosqueda-Lewis", False],
-    [100678, "Mowe", "Jenny", "Jenny Mowe", False],
-    [1628911, "Muldrow", "Teana", "Teana Muldrow", False],
-    [100551, "Mulitauaopele", "Naomi", "Naomi Mulitauaopele", False],
-    [201062, "Murphy", "Shay", "Shay Murphy", False],
-    [1642774, "Musa", "Murjanatu", "Murjanatu Musa", True],
-    [1642299, "Mühl", "Nika", "Nika Mühl", False],
-    [200707, "N'Garsanet", "Christelle", "Christelle N'Garsanet", False],
-    [100353, "Nagy", "Andrea", "Andrea Nagy", False],
-    [101075, "Nan", "Chen", "Chen Nan", False],
-    [1628913, "Nared", "Jaime", "Jaime Nared", False],
-    [100387, "Ndiaye-Diatta", "Astou", "Astou Ndiaye-Diatta", False],
-    [200670, "Ndongue", "Emmeline", "Emmeline Ndongue", False],
-    [203838, "Ndour-Fall", "Astou", "Astou Ndour-Fall", False],
-    [1631135, "Nelson-Ododa", "Olivia", "Olivia Nelson-Ododa", True],
-    [100091, "Nemcova", "Eva", "Eva Nemcova", False],
-    [100386, "Neves", "Claudia", "Claudia Neves", False],
-    [100797, "Neves", "Claudia", "Claudia Neves", False],
-    [101040, "Newton", "Chelsea", "Chelsea Newton", False],
-    [100807, "Ngoyisa", "Bernadette", "Bernadette Ngoyisa", False],
-    [100093, "Nicholson", "Tina", "Tina Nicholson", False],
-    [101004, "Nieuwveen", "Marlous", "Marlous Nieuwveen", False],
-    [100439, "Nikolich", "Mila", "Mila Nikolich", False],
-    [201514, "Nnamaka", "Chioma", "Chioma Nnamaka", False],
-    [100639, "Nolan", "Deanna", "Deanna Nolan", False],
-    [203021, "Novosel", "Natalie", "Natalie Novosel", False],
-    [1628915, "Nurse", "Kia", "Kia Nurse", True],
-    [1642801, "Nye", "Aaliyah", "Aaliyah Nye", True],
-    [100215, "Nygaard", "Vanessa", "Vanessa Nygaard", False],
-    [202626, "O'Hea", "Jenna", "Jenna O'Hea", False],
-    [204362, "O'Neill", "Jennifer", "Jennifer O'Neill", False],
-    [201475, "O'Neill", "Kristen", "Kristen O'Neill", False],
-    [1630127, "Odom", "Leaonna", "Leaonna Odom", False],
-    [201544, "Oga", "Yuko", "Yuko Oga", False],
-    [1629481, "Ogunbowale", "Arike", "Arike Ogunbowale", True],
-    [203823, "Ogwumike", "Chiney", "Chiney Ogwumike", False],
-    [203014, "Ogwumike", "Nneka", "Nneka Ogwumike", True],
-    [100932, "Ohlde", "Nicole", "Nicole Ohlde", False],
-    [1629539, "Okonkwo", "Amy", "Amy Okonkwo", True],
-    [202278, "Olajuwon", "Abi", "Abi Olajuwon", False],
-    [1642802, "Olsen", "Lucy", "Lucy Olsen", True],
-    [1630446, "Onyenwere", "Michaela", "Michaela Onyenwere", True],
-    [203840, "Orekhova", "Inga", "Inga Orekhova", False],
-    [1642294, "Osborne", "Charisma", "Charisma Osborne", False],
-    [100997, "Osipova", "Irina", "Irina Osipova", False],
-    [100354, "Owen", "Heather", "Heather Owen", False],
-    [100560, "Owens", "Shantia", "Shantia Owens", False],
-    [201535, "Page", "Danielle", "Danielle Page", False],
-    [100199, "Page", "Murriel", "Murriel Page", False],
-    [101034, "Paige", "Yolanda", "Yolanda Paige", False],
-    [200740, "Palie", "Sabrina", "Sabrina Palie", False],
-    [100046, "Palmer", "Wendy", "Wendy Palmer", False],
-    [1642804, "Paopao", "Te-Hina", "Te-Hina Paopao", True],
-    [201907, "Paris", "Courtney", "Courtney Paris", False],
-    [1628917, "Park", "JiSu", "JiSu Park", False],
-    [201496, "Parker", "Candace", "Candace Parker", False],
-    [204323, "Parker-Tyus", "Cheyenne", "Cheyenne Parker-Tyus", True],
-    [1641641, "Parks", "Robyn", "Robyn Parks", True],
-    [201558, "Pascalau", "Florina", "Florina Pascalau", False],
-    [100070, "Paschal", "Tia", "Tia Paschal", False],
-    [100686, "Pavlickova", "Michaela", "Michaela Pavlickova", False],
-    [100487, "Paye", "Kate", "Kate Paye", False],
-    [203035, "Peddy", "Shey", "Shey Peddy", True],
-    [202653, "Pedersen", "Kayla", "Kayla Pedersen", False],
-    [100234, "Penicheiro", "Ticha", "Ticha Penicheiro", False],
-    [100852, "Penn", "Jocelyn", "Jocelyn Penn", False],
-    [100109, "Perazic-Gipe", "Jasmina", "Jasmina Perazic-Gipe", False],
-    [1631073, "Perez", "Raina", "Raina Perez", False],
-    [100952, "Perkins", "Jia", "Jia Perkins", False],
-    [100659, "Perperoglou", "Erin", "Erin Perperoglou", False],
-    [100083, "Perrot", "Kim", "Kim Perrot", False],
-    [1630437, "Perry", "Chelsey", "Chelsey Perry", False],
-    [203016, "Peters", "Devereaux", "Devereaux Peters", False],
-    [203863, "Peters", "Haley", "Haley Peters", True],
-    [1628284, "Peterson", "Alexis", "Alexis Peterson", False],
-    [201909, "Petrovic", "Sonja", "Sonja Petrovic", False],
-    [100031, "Pettis", "Bridget", "Bridget Pettis", False],
-    [1642828, "Petty", "Ajae", "Ajae Petty", True],
-    [101039, "Phillips", "Erin", "Erin Phillips", False],
-    [202654, "Phillips", "Porsha", "Porsha Phillips", False],
-    [202655, "Phillips", "Ta'Shia", "Ta'Shia Phillips", False],
-    [100413, "Phillips", "Tari", "Tari Phillips", False],
-    [100888, "Pierson", "Plenette", "Plenette Pierson", False],
-    [1642293, "Pili", "Alissa", "Alissa Pili", True],
-    [203849, "Plaisance", "Theresa", "Theresa Plaisance", False],
-    [1628276, "Plum", "Kelsey", "Kelsey Plum", True],
-    [202656, "Pohlen-Mavunga", "Jeanette", "Jeanette Pohlen-Mavunga", False],
-    [1631062, "Pointer", "Khayla", "Khayla Pointer", False],
-    [100079, "Pollini", "Catarina", "Catarina Pollini", False],
-    [200665, "Pondexter", "Cappie", "Cappie Pondexter", False],
-    [203415, "Poppens", "Chelsea", "Chelsea Poppens", False],
-    [100403, "Potthoff", "Angie", "Angie Potthoff", False],
-    [100414, "Powell", "Elaine", "Elaine Powell", False],
-    [100919, "Powell", "Nicole", "Nicole Powell", False],
-    [1627672, "Powers", "Aerial", "Aerial Powers", True],
-    [203019, "Prahalis", "Samantha", "Samantha Prahalis", False],
-    [100235, "Price", "Franthea", "Franthea Price", False],
-    [100530, "Pride", "Lynn", "Lynn Pride", False],
-    [1628297, "Prince", "Alexis", "Alexis Prince", True],
-    [202259, "Prince", "Epiphanny", "Epiphanny Prince", False],
-    [200693, "Queenan", "Brooke", "Brooke Queenan", False],
-    [100417, "Quella", "Heather", "Heather Quella", False],
-    [100677, "Quick", "LaQuanda", "LaQuanda Quick", False],
-    [201516, "Quigley", "Allie", "Allie Quigley", False],
-    [1642808, "Quinerly", "JJ", "JJ Quinerly", True],
-    [201049, "Quinn", "Noelle", "Noelle Quinn", False],
-    [100472, "Quinney", "Texlin", "Texlin Quinney", False],
-    [100664, "Radunovic", "Hajdana", "Hajdana Radunovic", False],
-    [100748, "Ragland", "Felicia", "Felicia Ragland", False],
-    [1628248, "Raincock-Ekunwe", "Nayo", "Nayo Raincock-Ekunwe", False],
-    [100683, "Randall", "Semeka", "Semeka Randall", False],
-    [100552, "Rasmussen", "Kristen", "Kristen Rasmussen", False],
-    [202283, "Raven", "Brittainey", "Brittainey Raven", False],
-    [201070, "Raymond", "Stephanie", "Stephanie Raymond", False],
-    [100725, "Raymond", "Tamika", "Tamika Raymond", False],
-    [100541, "Redd", "Jamie", "Jamie Redd", False],
-    [203047, "Redmon", "Katelan", "Katelan Redmon", False],
-    [100225, "Reed", "Brandy", "Brandy Reed", False],
-    [202665, "Reed", "Chastity", "Chastity Reed", False],
-    [100286, "Reed", "Michelle", "Michelle Reed", False],
-    [1642291, "Reese", "Angel", "Angel Reese", True],
-    [100182, "Reid", "Tracy", "Tracy Reid", False],
-    [100047, "Reiss", "Tammi", "Tammi Reiss", False],
-    [201085, "Ress", "Kathrin", "Kathrin Ress", False],
-    [1630459, "Richards", "DiDi", "DiDi Richards", False],
-    [202315, "Riley", "Andrea", "Andrea Riley", False],
-    [100656, "Riley", "Ruth", "Ruth Riley", False],
-    [1642809, "Rivers", "Saniya", "Saniya Rivers", True],
-    [100338, "Rizzotti", "Jennifer", "Jennifer Rizzotti", False],
-    [100208, "Roberts", "Nyree", "Nyree Roberts", False],
-    [202657, "Robinson", "Angel", "Angel Robinson", False],
-    [100942, "Robinson", "Ashley", "Ashley Robinson", False],
-    [100345, "Robinson", "Crystal", "Crystal Robinson", False],
-    [202658, "Robinson", "Danielle", "Danielle Robinson", False],
-    [100506, "Robinson", "Renee", "Renee Robinson", False],
-    [203411, "Rodgers", "Sugar", "Sugar Rodgers", False],
-    [100519, "Roland", "Jannon", "Jannon Roland", False],
-    [203432, "Rolle", "Waltiea", "Waltiea Rolle", False],
-    [1628285, "Romero", "Leticia", "Leticia Romero", False],
-    [201529, "Ross", "Adrianne", "Adrianne Ross", False],
-    [203437, "Ruffin-Pratt", "Tierra", "Tierra Ruffin-Pratt", False],
-    [1630387, "Rupert", "Iliana", "Iliana Rupert", True],
-    [201103, "Rush", "Leah", "Leah Rush", False],
-    [1628920, "Russell", "Mercedes", "Mercedes Russell", True],
-    [100174, "Rycraw", "Eugenia", "Eugenia Rycraw", False],
-    [1631055, "Sabally", "Nyara", "Nyara Sabally", True],
-    [1630149, "Sabally", "Satou", "Satou Sabally", True],
-    [1642767, "Salaün", "Janelle", "Janelle Salaün", True],
-    [100415, "Sales", "Nykesha", "Nykesha Sales", False],
-    [100416, "Sam", "Sheri", "Sheri Sam", False],
-    [100542, "Sampson", "Charisse", "Charisse Sampson", False],
-    [1628317, "Samuelson", "Karlie", "Karlie Samuelson", True],
-    [1629478, "Samuelson", "Katie Lou", "Katie Lou Samuelson", True],
-    [100913, "Sanchez", "Isabel", "Isabel Sanchez", False],
-    [201115, "Sanders", "Amy", "Amy Sanders", False],
-    [201506, "Sanders", "LaToya", "LaToya Sanders", False],
-    [100556, "Sanford", "Nakia", "Nakia Sanford", False],
-    [201489, "Sanni", "Olayinka", "Olayinka Sanni", False],
-    [100640, "Santos", "Kelly", "Kelly Santos", False],
-    [100201, "Santos de Olive", "Alessandra", "Alessandra Santos de Olive", False],
-    [100525, "Sarenac", "Rankica", "Rankica Sarenac", False],
-    [100479, "Sauer", "Paige", "Paige Sauer", False],
-    [100635, "Saunders", "Jaynetta", "Jaynetta Saunders", False],
-    [100695, "Sauret", "Audrey", "Audrey Sauret", False],
-    [100161, "Savasta", "Laure", "Laure Savasta", False],
-    [1641687, "Saxton", "Victaria", "Victaria Saxton", False],
-    [203830, "Schimmel", "Shoni", "Shoni Schimmel", False],
-    [100648, "Schumacher", "Kelly", "Kelly Schumacher", False],
-    [100707, "Schweitzer", "Georgia", "Georgia Schweitzer", False],
-    [1642810, "Scott", "Madison", "Madison Scott", True],
-    [100243, "Scott", "Olympia", "Olympia Scott", False],
-    [100049, "Scott", "Raegan", "Raegan Scott", False],
-    [100500, "Shakirova", "Elena", "Elena Shakirova", False],
-    [100834, "Sharp", "K.B.", "K.B. Sharp", False],
-    [203033, "Shegog", "Chay", "Chay Shegog", False],
-    [1642292, "Sheldon", "Jacy", "Jacy Sheldon", True],
-    [1629491, "Shepard", "Jessica", "Jessica Shepard", True],
-    [1631013, "Sheppard", "Aisha", "Aisha Sheppard", False],
-    [1642320, "Sherrod", "Jaylyn", "Jaylyn Sherrod", True],
-    [201053, "Shields", "Ashley", "Ashley Shields", False],
-    [1630131, "Shook", "Kylee", "Kylee Shook", False],
-    [100202, "Shuler", "Adrienne", "Adrienne Shuler", False],
-    [1641652, "Siegrist", "Maddy", "Maddy Siegrist", True],
-    [203848, "Simmons", "Meighan", "Meighan Simmons", False],
-    [1628287, "Simms", "Jennie", "Jennie Simms", False],
-    [203013, "Simon", "Dymond", "Dymond Simon", False],
-    [203824, "Sims", "Odyssey", "Odyssey Sims", True],
-    [1641690, "Sissoko", "Kadi", "Kadi Sissoko", False],
-    [1631046, "Sjerven", "Hannah", "Hannah Sjerven", False],
-    [100497, "Slaise", "Madinah", "Madinah Slaise", False],
-    [100840, "Slaughter", "Gwen", "Gwen Slaughter", False],
-    [100736, "Slavtcheva", "Gergana", "Gergana Slavtcheva", False],
-    [1630435, "Slocum", "Destiny", "Destiny Slocum", False],
-    [1630154, "Smalls", "Kamiah", "Kamiah Smalls", True],
-    [100860, "Smith", "Aiysha", "Aiysha Smith", False],
-    [1629501, "Smith", "Alanna", "Alanna Smith", True],
-    [201084, "Smith", "Brooke", "Brooke Smith", False],
-    [201067, "Smith", "Camille", "Camille Smith", False],
-    [100371, "Smith", "Charlotte", "Charlotte Smith", False],
-    [100179, "Smith", "Charmin", "Charmin Smith", False],
-    [100181, "Smith", "Christy", "Christy Smith", False],
-    [200702, "Smith", "Crystal", "Crystal Smith", False],
-    [100925, "Smith", "Jennifer", "Jennifer Smith", False],
-    [100404, "Smith", "Katie", "Katie Smith", False],
-    [1631147, "Smith", "Kianna", "Kianna Smith", False],
-    [200683, "Smith", "Kim", "Kim Smith", False],
-    [100339, "Smith", "LaCharlotte", "LaCharlotte Smith", False],
-    [1631019, "Smith", "NaLyssa", "NaLyssa Smith", True],
-    [100236, "Smith", "Tangela", "Tangela Smith", False],
-    [201068, "Smith", "Tyresa", "Tyresa Smith", False],
-    [201504, "Smith", "Wanisha", "Wanisha Smith", False],
-    [100696, "Snell", "Belinda", "Belinda Snell", False],
-    [100729, "Snow", "Michelle", "Michelle Snow", False],
-    [1641654, "Soares", "Stephanie", "Stephanie Soares", False],
-    [1641667, "Soule", "Taylor", "Taylor Soule", False],
-    [201086, "Spencer", "Sidney", "Sidney Spencer", False],
-    [100255, "Sporn", "Rachael", "Rachael Sporn", False],
-    [100427, "Stafford-Odom", "Trisha", "Trisha Stafford-Odom", False],
-    [100372, "Staley", "Dawn", "Dawn Staley", False],
-    [200699, "Stansbury", "Tiffany", "Tiffany Stansbury", False],
-    [100422, "Starbird", "Kate", "Kate Starbird", False],
-    [100536, "Steding", "Katy", "Katy Steding", False],
-    [100227, "Stepanova", "Maria", "Maria Stepanova", False],
-    [100175, "Stephens", "Rehema", "Rehema Stephens", False],
-    [100927, "Stephens", "Stacy", "Stacy Stephens", False],
-    [1628922, "Stevens", "Azurá", "Azurá Stevens", True],
-    [100967, "Stevenson", "Mandisa", "Mandisa Stevenson", False],
-    [1627668, "Stewart", "Breanna", "Breanna Stewart", True],
-    [100676, "Stiles", "Jackie", "Jackie Stiles", False],
-    [100437, "Still", "Valerie", "Valerie Still", False],
-    [100059, "Stinson", "Andrea", "Andrea Stinson", False],
-    [100490, "Stires", "Shanele", "Shanele Stires", False],
-    [100691, "Stocks", "Tamara", "Tamara Stocks", False],
-    [204329, "Stokes", "Kiah", "Kiah Stokes", True],
-    [101006, "Streimikyte", "Jurgita", "Jurgita Streimikyte", False],
-    [203015, "Stricklen", "Shekinna", "Shekinna Stricklen", False],
-    [200685, "Strother", "Ann", "Ann Strother", False],
-    [100062, "Suber", "Tora", "Tora Suber", False],
-    [101012, "Summerton", "Laura", "Laura Summerton", False],
-    [1642813, "Sundell", "Serena", "Serena Sundell", True],
-    [1630134, "Sutton", "Sug", "Sug Sutton", True],
-    [100628, "Sutton-Brown", "Tammy", "Tammy Sutton-Brown", False],
-    [201484, "Swanier", "Ketia", "Ketia Swanier", False],
-    [100072, "Swoopes", "Sheryl", "Sheryl Swoopes", False],
-    [202670, "Swords", "Carolyn", "Carolyn Swords", False],
-    [203040, "Sykes", "April", "April Sykes", False],
-    [1628279, "Sykes", "Brittney", "Brittney Sykes", True],
-    [203855, "Talbot", "Stephanie", "Stephanie Talbot", True],
-    [200705, "Tamane", "Zane", "Zane Tamane", False],
-    [100406, "Tate", "Sonja", "Sonja Tate", False],
-    [100940, "Taurasi", "Diana", "Diana Taurasi", False],
-    [203859, "Taylor", "Asia", "Asia Taylor", False],
-    [1642344, "Taylor", "Camryn", "Camryn Taylor", True],
-    [1642298, "Taylor", "Celeste", "Celeste Taylor", False],
-    [100926, "Taylor", "Lindsay", "Lindsay Taylor", False],
-    [100634, "Taylor", "Penny", "Penny Taylor", False],
-    [1630479, "Taylor", "Sparkle", "Sparkle Taylor", False],
-    [100724, "Teasley", "Nikki", "Nikki Teasley", False],
-    [200696, "Terry", "Kasha", "Kasha Terry", False],
-    [1642814, "Thierry", "Taylor", "Taylor Thierry", True],
-    [203826, "Thomas", "Alyssa", "Alyssa Thomas", True],
-    [201055, "Thomas", "Carla", "Carla Thomas", False],
-    [100930, "Thomas", "Christi", "Christi Thomas", False],
-    [202662, "Thomas", "Jasmine", "Jasmine Thomas", False],
-    [202663, "Thomas", "Krystal", "Krystal Thomas", False],
-    [100883, "Thomas", "LaToya", "LaToya Thomas", False],
-    [1631068, "Thomas", "Sam", "Sam Thomas", False],
-    [100532, "Thomas", "Stacey", "Stacey Thomas", False],
-    [100216, "Thompson", "Alicia", "Alicia Thompson", False],
-    [202269, "Thompson", "Amanda", "Amanda Thompson", False],
-    [100076, "Thompson", "Tina", "Tina Thompson", False],
-    [200677, "Thorburn", "Shona", "Shona Thorburn", False],
-    [100835, "Thorn", "Erin", "Erin Thorn", False],
-    [203866, "Thornton", "Kayla", "Kayla Thornton", True],
-    [100543, "Threatt-Elliott", "Robin", "Robin Threatt-Elliott", False],
-    [100922, "Tillis", "Iciss", "Iciss Tillis", False],
-    [100029, "Timms", "Michele", "Michele Timms", False],
-    [1642815, "Timpson", "Makayla", "Makayla Timpson", True],
-    [1628261, "Ting", "Shao", "Shao Ting", False],
-    [203555, "Tinkle", "Joslyn", "Joslyn Tinkle", False],
-    [204317, "Tokashiki", "Ramu", "Ramu Tokashiki", False],
-    [100004, "Toler", "Penny", "Penny Toler", False],
-    [201911, "Toliver", "Kristi", "Kristi Toliver", False],
-    [204299, "Tolo", "Marianna", "Marianna Tolo", False],
-    [100388, "Tornikidou", "Elena", "Elena Tornikidou", False],
-    [100657, "Torres", "Levys", "Levys Torres", False],
-    [1642841, "Touré", "Mamignan", "Mamignan Touré", True],
-    [100447, "Travis", "Tiffany", "Tiffany Travis", False],
-    [1641672, "Traylor", "Kayana", "Kayana Traylor", False],
-    [100022, "Tremitiere", "Chantel", "Chantel Tremitiere", False],
-    [100106, "Trice-Hill", "Trena", "Trena Trice-Hill", False],
-    [1627670, "Tuck", "Morgan", "Morgan Tuck", False],
-    [200681, "Turner", "Barbara", "Barbara Turner", False],
-    [1629488, "Turner", "Brianna", "Brianna Turner", True],
-    [203389, "Turner", "Yvonne", "Yvonne Turner", False],
-    [100057, "Tuter", "Molly", "Molly Tuter", False],
-    [100713, "Tuvic", "Slobodanka", "Slobodanka Tuvic", False],
-    [100210, "Tzekova", "Polina", "Polina Tzekova", False],
-    [100257, "Udoka", "Mfon", "Mfon Udoka", False],
-    [100856, "Ujhelyi", "Petra", "Petra Ujhelyi", False],
-    [100373, "Umoh-Coleman", "Itoro", "Itoro Umoh-Coleman", False],
-    [1642244, "Uzun", "Sevgi", "Sevgi Uzun", True],
-    [100211, "Valdemoro", "Amaya", "Amaya Valdemoro", False],
-    [100346, "Van Gorp", "Michele", "Michele Van Gorp", False],
-    [1642817, "Van Lith", "Hailey", "Hailey Van Lith", True],
-    [100176, "VanEmbricqs", "Sandra", "Sandra VanEmbricqs", False],
-    [202664, "Vandersloot", "Courtney", "Courtney Vandersloot", True],
-    [1642210, "Vanloo", "Julie", "Julie Vanloo", True],
-    [201913, "Vaughn", "Kia", "Kia Vaughn", False],
-    [201520, "Vaughn", "Krystal", "Krystal Vaughn", False],
-    [100670, "Veal", "Kristen", "Kristen Veal", False],
-    [202239, "Vesela", "Jana", "Jana Vesela", False],
-    [100028, "Viglione", "Danielle", "Danielle Viglione", False],
-    [100712, "Vilipic", "Dalivorka", "Dalivorka Vilipic", False],
-    [1628927, "Vivians", "Victoria", "Victoria Vivians", False],
-    [100544, "Vodichkova", "Kamila", "Kamila Vodichkova", False],
-    [101062, "Vodopyanova", "Natalia", "Natalia Vodopyanova", False],
-    [100066, "Vukadinovic", "Milica", "Milica Vukadinovic", False],
-    [201914, "Walker", "Ashley", "Ashley Walker", False],
-    [100740, "Walker", "Ayana", "Ayana Walker", False],
-    [100533, "Walker", "DeMya", "DeMya Walker", False],
-    [1630444, "Walker", "Jasmine", "Jasmine Walker", False],
-    [201531, "Walker", "Marcedes", "Marcedes Walker", False],
-    [1630136, "Walker", "Megan", "Megan Walker", False],
-    [1628278, "Walker-Kimbrough", "Shatori", "Shatori Walker-Kimbrough", True],
-    [1628929, "Wallace", "Kristy", "Kristy Wallace", False],
-    [100681, "Walseth", "Maren", "Maren Walseth", False],
-    [203069, "Warley-Talbert", "Avery", "Avery Warley-Talbert", False],
-    [100217, "Washington", "Coquese", "Coquese Washington", False],
-    [1630137, "Watts", "Stephanie", "Stephanie Watts", False],
-    [100445, "Wauters", "Ann", "Ann Wauters", False],
-    [100101, "Weatherspoon", "Teresa", "Teresa Weatherspoon", False],
-    [100035, "Webb", "Umeki", "Umeki Webb", False],
-    [201104, "Weber", "Martina", "Martina Weber", False],
-    [101022, "Wecker", "Kendra", "Kendra Wecker", False],
-    [1627684, "Weisner", "Jamie", "Jamie Weisner", False],
-    [1628957, "Westbeld", "Kathryn", "Kathryn Westbeld", True],
-    [1642818, "Westbeld", "Maddy", "Maddy Westbeld", True],
-    [1631091, "Westbrook", "Evina", "Evina Westbrook", False],
-    [100915, "Whalen", "Lindsay", "Lindsay Whalen", False],
-    [204365, "Wheeler", "Erica", "Erica Wheeler", True],
-    [1628244, "Whitcomb", "Sami", "Sami Whitcomb", True],
-    [100849, "White", "DeTrina", "DeTrina White", False],
-    [201493, "White", "Erica", "Erica White", False],
-    [100370, "White", "Stephanie", "Stephanie White", False],
-    [101020, "White", "Tan", "Tan White", False],
-    [100389, "Whiting", "Val", "Val Whiting", False],
-    [100347, "Whitmore", "Tamika", "Tamika Whitmore", False],
-    [201495, "Whittington", "Khadijah", "Khadijah Whittington", False],
-    [100355, "Whittle", "Jennifer", "Jennifer Whittle", False],
-    [203413, "Whyte", "Davellyn", "Davellyn Whyte", False],
-    [100104, "Wicks", "Sue", "Sue Wicks", False],
-    [100007, "Wideman", "Jamila", "Jamila Wideman", False],
-    [1628282, "Wiese", "Sydney", "Sydney Wiese", False],
-    [201499, "Wiggins", "Candice", "Candice Wiggins", False],
-    [200720, "Wilkins", "Brittany", "Brittany Wilkins", False],
-    [101036, "Williams", "Angelina", "Angelina Williams", False],
-    [100464, "Williams", "Beverly", "Beverly Williams", False],
-    [1631090, "Williams", "Christyn", "Christyn Williams", True],
-    [1627675, "Williams", "Courtney", "Courtney Williams", True],
-    [100064, "Williams", "Debra", "Debra Williams", False],
-    [204322, "Williams", "Elizabeth", "Elizabeth Williams", True],
-    [1628931, "Williams", "Gabby", "Gabby Williams", True],
-    [203412, "Williams", "Kamiko", "Kamiko Williams", False],
-    [1630461, "Williams", "Kiana", "Kiana Williams", True],
-    [100050, "Williams", "Kim", "Kim Williams", False],
-    [100738, "Williams", "Lenae", "Lenae Williams", False],
-    [1641670, "Williams", "Madi", "Madi Williams", False],
-    [100366, "Williams", "Natalie", "Natalie Williams", False],
-    [203029, "Williams", "Riquna", "Riquna Williams", False],
-    [100204, "Williams", "Rita", "Rita Williams", False],
-    [100885, "Williams", "Shaquala", "Shaquala Williams", False],
-    [100038, "Williams", "Tara", "Tara Williams", False],
-    [100947, "Williams", "Toccara", "Toccara Williams", False],
-    [100526, "Williams-Strong", "Adrian", "Adrian Williams-Strong", False],
-    [100973, "Willingham", "Le'coe", "Le'coe Willingham", False],
-    [200675, "Willis", "Lisa", "Lisa Willis", False],
-    [100655, "Willits", "Wendi", "Wendi Willits", False],
-    [1630139, "Willoughby", "Jocelyn", "Jocelyn Willoughby", False],
-    [1628932, "Wilson", "A'ja", "A'ja Wilson", True],
-    [1630458, "Wilson", "Aaliyah", "Aaliyah Wilson", False],
-    [100380, "Wilson", "Amanda", "Amanda Wilson", False],
-    [201917, "Wirth", "Christina", "Christina Wirth", False],
-    [201918, "Wisdom-Hylton", "Lindsay", "Lindsay Wisdom-Hylton", False],
-    [100105, "Witherspoon", "Sophia", "Sophia Witherspoon", False],
-    [203030, "Wojta", "Julie", "Julie Wojta", False],
-    [100340, "Wolters", "Kara", "Kara Wolters", False],
-    [100636, "Wolvert", "Angelina", "Angelina Wolvert", False],
-    [100090, "Woodard", "Lynette", "Lynette Woodard", False],
-    [100086, "Woosley", "Tiffany", "Tiffany Woosley", False],
-    [1628933, "Wright", "Imani", "Imani Wright", False],
-    [202257, "Wright", "Monica", "Monica Wright", False],
-    [100923, "Wright", "Shereka", "Shereka Wright", False],
-    [101030, "Wright", "Tanisha", "Tanisha Wright", False],
-    [100667, "Wyckoff", "Brooke", "Brooke Wyckoff", False],
-    [100545, "Wynne", "Dana", "Dana Wynne", False],
-    [204300, "Xargay", "Marta", "Marta Xargay", False],
-    [100749, "Yamasaki", "Lindsey", "Lindsey Yamasaki", False],
-    [100024, "Yasen", "Corissa", "Corissa Yasen", False],
-    [100424, "Yilmaz", "Nevriye", "Nevriye Yilmaz", False],
-    [100344, "Young", "Carolyn", "Carolyn Young", False],
-    [1629498, "Young", "Jackie", "Jackie Young", True],
-    [201477, "Young", "Tamera", "Tamera Young", False],
-    [203404, "Young", "Toni", "Toni Young", False],
-    [200674, "Young-Malcolm", "Sophia", "Sophia Young-Malcolm", False],
-    [1629574, "Yueru", "Li", "Li Yueru", True],
-    [204320, "Zahui B", "Amanda", "Amanda Zahui B", False],
-    [100390, "Zakaluzhnaya", "Oksana", "Oksana Zakaluzhnaya", False],
-    [1628508, "Zandalasini", "Cecilia", "Cecilia Zandalasini", True],
-    [101103, "Zara", "Francesca", "Francesca Zara", False],
-    [201919, "Zellous", "Shavonte", "Shavonte Zellous", False],
-    [100006, "Zheng", "Haixia", "Haixia Zheng", False],
-    [100861, "Zirkova", "Zuzana", "Zuzana Zirkova", False],
-    [201498, "Zoll-Norman", "Sharnee", "Sharnee Zoll-Norman", False],
-    [200686, "Zolman", "Shanna", "Shanna Zolman", False],
-    [100812, "de Souza", "Erika", "Erika de Souza", False],
-    [100283, "de Souza Sobral", "Leila", "Leila de Souza Sobral", False],
-    [100514, "dos Santos", "Cintia", "Cintia dos Santos", False],
-    [1630151, "Époupa", "Olivia", "Olivia Époupa", False],
-]
+def __getattr__(name):
+    if name in ("players", "wnba_players"):
+        tables = load_players()
+        globals().update(tables)
+        return tables[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Common nicknames by player ID, searched by players.search().
+player_nicknames = {
+    2544: ["King James", "Bron"],
+    203507: ["Greek Freak"],
+    203999: ["Joker"],
+    1628983: ["SGA"],
+    201142: ["KD", "Slim Reaper"],
+    101108: ["CP3"],
+    201939: ["Steph", "Chef Curry"],
+    203076: ["AD", "The Brow"],
+    201935: ["The Beard"],
+    203081: ["Dame", "Dame Time"],
+    406: ["Shaq", "Diesel"],
+    893: ["MJ", "Air Jordan"],
+    977: ["Black Mamba"],
+    1495: ["Big Fundamental"],
+    947: ["The Answer", "AI"],
+    2548: ["D-Wade", "Flash"],
+    202695: ["The Claw"],
+    1629029: ["Luka Magic"],
+    1641705: ["Wemby"],
+    76003: ["Kareem"],
+    76375: ["Wilt the Stilt", "The Big Dipper"],
+    76681: ["Dr. J"],
+    252: ["The Mailman"],
+    165: ["The Dream"],
+    787: ["Sir Charles", "Round Mound of Rebound"],
+    201566: ["Russ", "Brodie"],
+    202681: ["Uncle Drew"],
+    1630162: ["Ant", "Ant-Man"],
+    1626157: ["KAT"],
+    202331: ["PG13"],
+    203954: ["The Process"],
+    1628378: ["Spida"],
+    1717: ["Dirk"],
+    1449: ["Larry Legend"],
+    77142: ["Earvin Johnson"],
+    708: ["KG", "The Big Ticket"],
+    1718: ["The Truth"],
+    1713: ["Vinsanity", "Air Canada"],
+    1503: ["T-Mac"],
+    358: ["Penny"],
+    1897: ["Ron Artest"],
+    77459: ["Pistol Pete"],
+    17: ["Clyde the Glide"],
+    76750: ["Clyde"],
+    76804: ["The Iceman"],
+    1122: ["Human Highlight Film"],
+    56: ["The Glove"],
+    1497: ["Mr. Big Shot"],
+    2730: ["Superman"],
+    2546: ["Melo"],
+    1628991: ["Triple J"],
+    1629630: ["Ja"],
+}
+
+# Common nicknames by player ID, searched by players.search_wnba().
+wnba_player_nicknames = {
+    100940: ["DT", "White Mamba"],
+    1627668: ["Stewie"],
+    1628932: ["A'ja"],
+    1642286: ["CC"],
+}
+
 
 team_index_id = 0
 team_index_abbreviation = 1
@@ -6661,3 +487,32 @@ wnba_teams = [
         [],
     ],
 ]
+
+# Common nicknames by team ID, searched by teams.search().
+team_nicknames = {
+    1610612738: ["Celts", "C's"],
+    1610612739: ["Cavs"],
+    1610612740: ["Pels", "NOLA"],
+    1610612742: ["Mavs"],
+    1610612743: ["Nugs"],
+    1610612744: ["Golden State", "Dubs"],
+    1610612745: ["H-Town"],
+    1610612746: ["Clips", "LA Clippers"],
+    1610612747: ["LA Lakers", "Lakeshow"],
+    1610612750: ["Wolves", "T-Wolves"],
+    1610612752: ["Knickerbockers"],
+    1610612755: ["Sixers", "Philly"],
+    1610612757: ["Blazers", "Rip City"],
+    1610612760: ["OKC"],
+    1610612761: ["Raps", "Dinos"],
+    1610612763: ["Grizz"],
+    1610612764: ["Wiz"],
+    1610612766: ["Buzz City"],
+}
+
+# Common nicknames by team ID, searched by teams.search_wnba().
+wnba_team_nicknames = {
+    1611661313: ["Libs"],
+    1611661320: ["LA Sparks"],
+    1611661331: ["Valks"],
+}
@@ -0,0 +1,240 @@
+"""Fuzzy name search over the static player and team tables.
+
+Names are folded (accents stripped, lower case, punctuation removed) and split
+into trigrams: every word is padded with a space on each side, so ``jokic``
+gives `` jo``, ``jok``, ``oki``, ``kic`` and ``ic ``. A query is scored
+against each indexed name with the Dice coefficient of their trigram sets,
+``2 * shared / (query trigrams + name trigrams)``, which is 1.0 for the same
+words in any order and degrades gracefully with misspellings.
+
+An inverted index from trigram to names means a query only looks at names
+sharing at least one trigram with it. ``NameIndex`` resolves exact names,
+for batch lookups of names from other sources.
+"""
+
+import unicodedata
+from collections import Counter
+from collections.abc import Container, Iterable
+from heapq import nlargest
+from itertools import chain
+
+# Characters dropped from names rather than treated as word separators, so
+# that "O'Neal" matches "oneal" and "J.J." matches "jj".
+_DROPPED_CHARACTERS = frozenset("'.’")
+
+# Name suffixes ignored by loose name matching ("Jaren Jackson Jr.").
+_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+
+def fold_name(name: str) -> str:
+    """Return ``name`` without accents and punctuation, in lower case.
+
+    >>> fold_name("Nikola Jokić")
+    'nikola jokic'
+    >>> fold_name("Shaquille O'Neal")
+    'shaquille oneal'
+    """
+    if not name.isascii():
+        name = "".join(
+            character
+            for character in unicodedata.normalize("NFD", name)
+            if unicodedata.category(character) != "Mn"
+        )
+    characters = []
+    for character in name.lower():
+        if character.isalnum():
+            characters.append(character)
+        elif character not in _DROPPED_CHARACTERS:
+            characters.append(" ")
+    return " ".join("".join(characters).split())
+
+
+def get_loose_key(folded_name: str) -> str:
+    """Return the words of a folded name in sorted order, without suffixes.
+
+    Names in another order ("doncic luka", from "Dončić, Luka") or with or
+    without a suffix share the same loose key.
+    """
+    words = folded_name.split()
+    kept = [word for word in words if word not in _SUFFIXES]
+    return " ".join(sorted(kept or words))
+
+
+def get_trigrams(folded_name: str) -> set[str]:
+    """Return the trigrams of the words of a folded name."""
+    trigrams = set()
+    for word in folded_name.split():
+        padded = f" {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class TrigramIndex:
+    """Trigram index over the names of a table.
+
+    Each entry (a row number of the table) can be indexed under several names,
+    e.g. a full name, a last name and nicknames. A search ranks entries by the
+    score of their best matching name.
+
+    Args:
+        names: ``(entry, name)`` pairs.
+        priorities: Optional ``{entry: priority}``. Among equal scores, entries
+            with a higher priority (e.g. active players) rank first.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[tuple[int, str]],
+        priorities: dict[int, int] | None = None,
+    ) -> None:
+        self.priorities = priorities or {}
+        self.entries = []
+        self.names = []
+        self.sizes = []
+        self.postings = {}
+        seen = set()
+        for entry, name in names:
+            folded = fold_name(name)
+            if not folded or (entry, folded) in seen:
+                continue
+            seen.add((entry, folded))
+            trigrams = get_trigrams(folded)
+            key = len(self.entries)
+            self.entries.append(entry)
+            self.names.append(folded)
+            self.sizes.append(len(trigrams))
+            for trigram in trigrams:
+                self.postings.setdefault(trigram, []).append(key)
+
+    def search(
+        self, query: str, limit: int = 5, min_score: float = 0.3
+    ) -> list[tuple[int, float]]:
+        """Return up to ``limit`` ``(entry, score)`` pairs, best match first.
+
+        Args:
+            query: Name to look up, in any case, with or without accents.
+            limit: Maximum number of results.
+            min_score: Minimum score (0 to 1) of a result.
+        """
+        folded = fold_name(query)
+        trigrams = get_trigrams(folded)
+        if not trigrams or limit <= 0:
+            return []
+        query_size = len(trigrams)
+        shared = Counter(
+            chain.from_iterable(
+                self.postings[trigram]
+                for trigram in trigrams
+                if trigram in self.postings
+            )
+        )
+        # A name sharing `count` trigrams scores at most 2 * count /
+        # (query_size + count); skip names that cannot reach min_score.
+        least_shared = min_score * query_size / (2 - min_score)
+
+        best = {}
+        sizes = self.sizes
+        for key, count in shared.items():
+            if count < least_shared:
+                continue
+            score = 2 * count / (query_size + sizes[key])
+            if score < min_score:
+                continue
+            entry = self.entries[key]
+            exact = self.names[key] == folded
+            rank = (score, exact)
+            if rank > best.get(entry, (0.0, False)):
+                best[entry] = rank
+
+        priorities = self.priorities
+        ranked = nlargest(
+            limit,
+            best.items(),
+            key=lambda item: (*item[1], priorities.get(item[0], 0), -item[0]),
+        )
+        return [(entry, round(score, 4)) for entry, (score, _) in ranked]
+
+
+class NameIndex:
+    """Exact name lookups for a table.
+
+    Names are matched once folded, so case, accents and punctuation do not
+    matter. Names without an exact match are looked up by their loose key,
+    ignoring word order and suffixes.
+
+    Args:
+        names: ``(entry, name)`` pairs.
+    """
+
+    def __init__(self, names: Iterable[tuple[int, str]]) -> None:
+        self.exact = {}
+        self.loose = {}
+        for entry, name in names:
+            folded = fold_name(name)
+            if not folded:
+                continue
+            for index, key in (
+                (self.exact, folded),
+                (self.loose, get_loose_key(folded)),
+            ):
+                entries = index.setdefault(key, [])
+                if entry not in entries:
+                    entries.append(entry)
+
+    def get(self, name: str) -> list[int]:
+        """Return the entries named ``name``, in table order."""
+        folded = fold_name(name)
+        entries = self.exact.get(folded)
+        if entries is None:
+            entries = self.loose.get(get_loose_key(folded), [])
+        return sorted(entries)
+
+
+def resolve_names(
+    names: Iterable[str],
+    name_index: NameIndex,
+    search_index: TrigramIndex | None = None,
+    min_score: float = 0.75,
+    margin: float = 0.05,
+    preferred: Container[int] = (),
+) -> list[list[int]]:
+    """Return the candidate entries of each name, in input order.
+
+    A name resolves to a single entry unless it is ambiguous or unknown. Each
+    distinct name is looked up once, so the cost scales with the number of
+    names rather than the size of the table.
+
+    Args:
+        names: Names to resolve. Values other than strings (e.g. ``None``)
+            have no candidates.
+        name_index: Index of the exact names of the table.
+        search_index: If given, names without an exact match are searched.
+            The best result scoring at least ``min_score`` is the candidate,
+            along with the results scoring within ``margin`` of it.
+        min_score: Minimum score (0 to 1) of a fuzzy match.
+        margin: Score difference under which fuzzy matches are ambiguous.
+        preferred: Entries chosen among several candidates when exactly one of
+            them is preferred, e.g. the active player among namesakes.
+    """
+    resolved = {}
+    candidates_list = []
+    for name in names:
+        candidates = resolved.get(name)
+        if candidates is None and not isinstance(name, str):
+            candidates = []
+        elif candidates is None:
+            candidates = name_index.get(name)
+            if not candidates and search_index is not None:
+                results = search_index.search(name, min_score=min_score)
+                candidates = sorted(
+                    entry for entry, score in results if score >= results[0][1] - margin
+                )
+            if len(candidates) > 1:
+                preferred_candidates = [
+                    entry for entry in candidates if entry in preferred
+                ]
+                if len(preferred_candidates) == 1:
+                    candidates = preferred_candidates
+            resolved[name] = candidates
+        candidates_list.append(candidates)
+    return candidates_list
@@ -1,6 +1,7 @@
 """NBA Stats HTTP client and response handling."""
 
 import json
+from itertools import repeat
 
 from nba_api.library import http
 
@@ -26,7 +27,23 @@ except ImportError:
 class NBAStatsResponse(http.NBAResponse):
     """Response handler for NBA Stats API requests."""
 
-    def get_normalized_dict(self):
+    def _get_result_sets(self, raw_data):
+        if "resultSets" in raw_data:
+            results = raw_data["resultSets"]
+        else:
+            results = raw_data["resultSet"]
+        if isinstance(results, dict):
+            results = [results]
+        return results
+
+    def get_normalized_dict(self, columnar=False):
+        """Return every result set keyed by name.
+
+        Args:
+            columnar: When true, each result set is a ``{column: [values]}``
+                dict instead of a list of ``{column: value}`` row dicts, which
+                avoids building one dict per row for large result sets.
+        """
         raw_data = self.get_dict()
 
         data = {}
@@ -35,42 +52,57 @@ class NBAStatsResponse(http.NBAResponse):
         is_legacy = set(legacy_headers) & set(raw_data.keys())
 
         if is_legacy:
-            if "resultSets" in raw_data:
-                results = raw_data["resultSets"]
-                if "Meta" in results:
-                    return results
-            else:
-                results = raw_data["resultSet"]
-            if isinstance(results, dict):
-                results = [results]
-            for result in results:
+            if "Meta" in raw_data.get("resultSets", ()):
+                return raw_data["resultSets"]
+            for result in self._get_result_sets(raw_data):
                 name = result["name"]
                 headers = result["headers"]
                 row_set = result["rowSet"]
 
-                rows = []
-                for raw_row in row_set:
-                    row = {}
-                    for i in range(len(headers)):
-                        row[headers[i]] = raw_row[i]
-                    rows.append(row)
-                data[name] = rows
+                if columnar:
+                    columns = (
+                        zip(*row_set, strict=False)
+                        if row_set
+                        else ([] for _ in headers)
+                    )
+                    data[name] = dict(zip(headers, map(list, columns), strict=False))
+                else:
+                    data[name] = list(map(dict, map(zip, repeat(headers), row_set)))
 
         return data
 
-    def get_normalized_json(self):
-        return json.dumps(self.get_normalized_dict())
+    def iter_normalized_rows(self):
+        """Yield ``(name, row)`` for every row of every result set.
+
+        Rows are ``{column: value}`` dicts built one at a time, so that
+        streaming consumers never hold all of them in memory.
+        """
+        raw_data = self.get_dict()
+        if not {"resultSets", "resultSet"} & set(raw_data.keys()):
+            return
+        if "Meta" in raw_data.get("resultSets", ()):
+            return
+        for result in self._get_result_sets(raw_data):
+            name = result["name"]
+            headers = result["headers"]
+            for raw_row in result["rowSet"]:
+                yield name, dict(zip(headers, raw_row, strict=False))
+
+    def get_normalized_json(self, columnar=False):
+        return json.dumps(self.get_normalized_dict(columnar=columnar))
 
     def get_parameters(self):
-        if not self.valid_json() or "parameters" not in self.get_dict():
+        if not self.valid_json():
             return None
 
-        parameters = self.get_dict()["parameters"]
-        if isinstance(parameters, dict):
-            return parameters
+        raw_parameters = self.get_dict().get("parameters")
+        if raw_parameters is None:
+            return None
+        if isinstance(raw_parameters, dict):
+            return raw_parameters
 
         parameters = {}
-        for parameter in self.get_dict()["parameters"]:
+        for parameter in raw_parameters:
             for key, value in parameter.items():
                 parameters.update({key: value})
         return parameters
@@ -137,6 +169,16 @@ class NBAStatsHTTP(http.NBAHTTP):
     headers = STATS_HEADERS
 
     def clean_contents(self, contents):
-        if '{"Message":"An error has occurred."}' in contents:
+        message = '{"Message":"An error has occurred."}'
+        if isinstance(contents, bytes):
+            message = message.encode()
+        if message in contents:
             return "<Error><Message>An error has occurred.</Message></Error>"
         return contents
+
+
+class AsyncNBAStatsHTTP(http.AsyncNBAHTTP, NBAStatsHTTP):
+    """Asyncio HTTP client for NBA Stats API sharing NBAStatsHTTP behavior."""
+
+
+NBAStatsHTTP.async_http = AsyncNBAStatsHTTP
@@ -0,0 +1,121 @@
+"""Packed storage of the static player tables.
+
+The player rows of ``nba_api.stats.library.data`` are stored in
+``players.bin`` rather than as Python literals, so that they are only decoded
+when they are first needed. The file holds, for each table:
+
+- a header with the number of rows and the size of the string table,
+- a string table: every distinct name once, UTF-8 encoded and NUL-separated,
+- four ``uint32`` arrays (IDs, and the string table positions of the last,
+  first and full names),
+- one byte per row for the active flag.
+
+Decoding builds each distinct string once, so repeated names (first names in
+particular) share a single object across rows.
+"""
+
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+PLAYERS_FILE = Path(__file__).with_name("players.bin")
+
+MAGIC = b"NBAP"
+VERSION = 1
+TABLES = ("players", "wnba_players")
+
+_FILE_HEADER = struct.Struct("<4sHH")
+_TABLE_HEADER = struct.Struct("<III")
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data: bytes) -> array:
+    values = array("I")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def pack_players(tables: dict[str, list[list]]) -> bytes:
+    """Pack player tables into the ``players.bin`` format.
+
+    Args:
+        tables: ``{"players": rows, "wnba_players": rows}``, with rows of
+            ``[id, last_name, first_name, full_name, is_active]``.
+    """
+    chunks = [_FILE_HEADER.pack(MAGIC, VERSION, len(TABLES))]
+    for name in TABLES:
+        rows = tables[name]
+        strings = {}
+        ids, last_names, first_names, full_names = (array("I") for _ in range(4))
+        for player_id, last_name, first_name, full_name, _ in rows:
+            ids.append(player_id)
+            last_names.append(strings.setdefault(last_name, len(strings)))
+            first_names.append(strings.setdefault(first_name, len(strings)))
+            full_names.append(strings.setdefault(full_name, len(strings)))
+        string_table = "\0".join(strings).encode("utf-8")
+
+        chunks.append(_TABLE_HEADER.pack(len(rows), len(strings), len(string_table)))
+        chunks.append(string_table)
+        for values in (ids, last_names, first_names, full_names):
+            chunks.append(_to_bytes(values))
+        chunks.append(bytes(bool(row[4]) for row in rows))
+    return b"".join(chunks)
+
+
+def unpack_players(data: bytes) -> dict[str, list[list]]:
+    """Unpack ``players.bin`` data into ``{table name: rows}``.
+
+    Raises:
+        Exception: If ``data`` is not in the ``players.bin`` format.
+    """
+    magic, version, table_count = _FILE_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or table_count != len(TABLES):
+        raise Exception("Invalid static player data file.")
+
+    tables = {}
+    view = memoryview(data)
+    offset = _FILE_HEADER.size
+    for name in TABLES:
+        row_count, string_count, string_table_size = _TABLE_HEADER.unpack_from(
+            data, offset
+        )
+        offset += _TABLE_HEADER.size
+        strings = bytes(view[offset : offset + string_table_size]).decode("utf-8")
+        strings = strings.split("\0") if string_count else []
+        offset += string_table_size
+
+        columns = []
+        for _ in range(4):
+            columns.append(_from_bytes(view[offset : offset + 4 * row_count]))
+            offset += 4 * row_count
+        ids, last_names, first_names, full_names = columns
+        active = view[offset : offset + row_count].tolist()
+        offset += row_count
+
+        tables[name] = [
+            [
+                player_id,
+                strings[last_name],
+                strings[first_name],
+                strings[full_name],
+                is_active == 1,
+            ]
+            for player_id, last_name, first_name, full_name, is_active in zip(
+                ids, last_names, first_names, full_names, active, strict=True
+            )
+        ]
+    return tables
+
+
+def load_players(path: Path = PLAYERS_FILE) -> dict[str, list[list]]:
+    """Read and unpack the player tables from ``path``."""
+    return unpack_players(path.read_bytes())
@@ -0,0 +1,434 @@
+"""Single-pass parsing of play-by-play event descriptions.
+
+``parse_descriptions`` classifies every description of a ``PlayByPlayV2``
+game in one call. Events are dispatched on ``EVENTMSGTYPE`` to the patterns
+of ``nba_api.stats.library.playbyplayregex`` in the order of
+``eventmsgtype_to_re``, and each pattern is only tried when cheap checks on
+the description (a prefix such as ``"MISS "`` or ``"SUB: "``, a required
+substring or suffix) allow it to match. The results are the same as trying
+the patterns of ``eventmsgtype_to_re`` in turn.
+
+The player foul, free throw and jump ball patterns backtrack quadratically on
+long descriptions that do not match. They are parsed by locating their
+literal separators (``" Free Throw "``, ``" vs. "``, the ``(P1.T2)`` foul
+counts) from the right and matching the rest of the pattern from there, so
+parsing takes linear time in the length of the description.
+
+```python
+from nba_api.stats.endpoints import PlayByPlayV2
+from nba_api.stats.library.playbyplayparser import parse_descriptions
+
+events = parse_descriptions(PlayByPlayV2(game_id).play_by_play.get_dict())
+shots = [event for event in events if event.action == "field_goal_made"]
+```
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from operator import itemgetter
+from typing import Any
+
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayregex import (
+    re_block,
+    re_ejection,
+    re_field_goal_made,
+    re_field_goal_missed,
+    re_foul_player,
+    re_foul_team,
+    re_free_throw_made,
+    re_free_throw_miss,
+    re_jump_ball,
+    re_rebound_player,
+    re_rebound_team,
+    re_steal,
+    re_substitution,
+    re_timeout,
+    re_turnover_player,
+    re_turnover_team,
+    re_violation,
+    re_violation_team,
+)
+
+# Description columns of PlayByPlayV2 rows, with the side they describe.
+DESCRIPTION_COLUMNS = (
+    ("HOMEDESCRIPTION", "home"),
+    ("NEUTRALDESCRIPTION", "neutral"),
+    ("VISITORDESCRIPTION", "visitor"),
+)
+
+# Captured groups converted to ``int``; all others are strings.
+INTEGER_FIELDS = frozenset(
+    {
+        "assists",
+        "blocks",
+        "defensive",
+        "distance",
+        "full",
+        "offensive",
+        "personal",
+        "points",
+        "short",
+        "steals",
+        "turnovers",
+    }
+)
+
+# The parts of the quadratic patterns that follow their literal separators.
+_re_foul_player_tail = re.compile(
+    r"\(\w+(?P<personal>\d+)(\.\w+(?P<team>[\d|\w]+))?\)( \((?P<referee>.*)\))?$"
+)
+# Linear-time check of the foul counts, e.g. "(P1.T2)", before the tail.
+_re_foul_counts = re.compile(r"\(\w*\d(\.\w[\w|]+)?\)")
+_re_free_throw_made_tail = re.compile(
+    r"(?P<free_throw_type>(.* )?(\d of \d)|\w+) \((?P<points>\d+) PTS\)$"
+)
+_re_free_throw_miss_tail = re.compile(r"(?P<free_throw_type>(.* )?(\d of \d)|\w+)$")
+
+_FREE_THROW = " Free Throw "
+_JUMP_BALL = "Jump Ball "
+_TIP_TO = ": Tip to"
+
+
+class DescriptionEvent:
+    """A parsed play-by-play description.
+
+    Attributes:
+        event_num: ``EVENTNUM`` of the event, if given.
+        event_msg_type: ``EVENTMSGTYPE`` of the event.
+        side: ``"home"``, ``"neutral"`` or ``"visitor"``: the description
+            column.
+        action: Name of the matching pattern (``"field_goal_made"``,
+            ``"block"``, ``"foul_player"``, ...), or ``None`` if no pattern
+            of the event type matches.
+        description: The description.
+        fields: The named groups of the pattern. Counts, distances and points
+            are ``int``; missing groups are ``None``.
+    """
+
+    __slots__ = (
+        "event_num",
+        "event_msg_type",
+        "side",
+        "action",
+        "description",
+        "fields",
+    )
+
+    def __init__(self, event_num, event_msg_type, side, action, description, fields):
+        self.event_num = event_num
+        self.event_msg_type = event_msg_type
+        self.side = side
+        self.action = action
+        self.description = description
+        self.fields = fields
+
+    def __eq__(self, other):
+        if not isinstance(other, DescriptionEvent):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        return (
+            f"DescriptionEvent(event_num={self.event_num!r}, "
+            f"event_msg_type={self.event_msg_type!r}, side={self.side!r}, "
+            f"action={self.action!r}, description={self.description!r}, "
+            f"fields={self.fields!r})"
+        )
+
+
+def _parse_foul_player(description):
+    if not description.endswith(")"):
+        return None
+    # The foul counts start at the last "(" after whitespace from which the
+    # rest of the pattern matches.
+    position = description.rfind("(")
+    while position > 0:
+        if (
+            description[position - 1].isspace()
+            and _re_foul_counts.match(description, position)
+            and (tail := _re_foul_player_tail.match(description, position))
+        ):
+            break
+        position = description.rfind("(", 0, position)
+    else:
+        return None
+    # The player is followed by the last space before the foul type.
+    split = description.rfind(" ", 0, position - 1)
+    if split < 1:
+        return None
+    return {
+        "player": description[:split],
+        "foul_type": description[split + 1 : position - 1],
+        **tail.groupdict(),
+    }
+
+
+def _parse_free_throw(description, start, tail_regex):
+    # Only the last " Free Throw " can be followed by a match of the rest of
+    # the pattern: earlier ones are followed by words, not a free throw type.
+    split = description.rfind(_FREE_THROW)
+    if split <= start:
+        return None
+    tail = tail_regex.match(description, split + len(_FREE_THROW))
+    if tail is None:
+        return None
+    return {"player": description[start:split], **tail.groupdict()}
+
+
+def _parse_free_throw_made(description):
+    return _parse_free_throw(description, 0, _re_free_throw_made_tail)
+
+
+def _parse_free_throw_miss(description):
+    return _parse_free_throw(description, len("MISS "), _re_free_throw_miss_tail)
+
+
+def _parse_jump_ball(description):
+    if not description.startswith(_JUMP_BALL):
+        if not description.strip():
+            return {"player_home": None, "player_away": None, "player_tip": None}
+        return None
+    tip = description.rfind(_TIP_TO)
+    if tip == -1:
+        return None
+    # The home player ends at the last " vs" + any character + " " that
+    # leaves room for an away player before ": Tip to".
+    start = len(_JUMP_BALL) + 1
+    end = tip - 3
+    while True:
+        split = description.rfind(" vs", start, end)
+        if split == -1:
+            return None
+        if description[split + 4] == " ":
+            break
+        end = split + 2
+    player_tip = description[tip + len(_TIP_TO) :]
+    return {
+        "player_home": description[len(_JUMP_BALL) : split],
+        "player_away": description[split + 5 : tip],
+        "player_tip": player_tip[1:]
+        if player_tip[:1] == " " and player_tip[1:]
+        else None,
+    }
+
+
+def _parse_foul_team(description):
+    if not "A" <= description[:1] <= "Z":
+        return None
+    match = re_foul_team.match(description)
+    return match.groupdict() if match else None
+
+
+# Patterns of each event type, in the order of ``eventmsgtype_to_re``:
+# ``(action, regex, prefix, suffix, substring, parse)``. A description is only
+# matched if it starts with ``prefix``, ends with ``suffix`` and contains
+# ``substring``, and is then matched by ``regex``, or by ``parse`` for the
+# patterns that backtrack.
+_PARSERS = {
+    EventMsgType.FIELD_GOAL_MADE: [
+        ("field_goal_made", re_field_goal_made, "", ")", " PTS)", None),
+    ],
+    EventMsgType.FIELD_GOAL_MISSED: [
+        ("field_goal_missed", re_field_goal_missed, "MISS ", "", "", None),
+        ("block", re_block, "", " BLK)", " BLOCK (", None),
+    ],
+    EventMsgType.FREE_THROW: [
+        (
+            "free_throw_made",
+            re_free_throw_made,
+            "",
+            " PTS)",
+            _FREE_THROW,
+            _parse_free_throw_made,
+        ),
+        (
+            "free_throw_miss",
+            re_free_throw_miss,
+            "MISS ",
+            "",
+            _FREE_THROW,
+            _parse_free_throw_miss,
+        ),
+    ],
+    EventMsgType.REBOUND: [
+        ("rebound_player", re_rebound_player, "", ")", " REBOUND (Off:", None),
+        ("rebound_team", re_rebound_team, "", " Rebound", "", None),
+    ],
+    EventMsgType.TURNOVER: [
+        ("turnover_player", re_turnover_player, "", ")", " Turnover", None),
+        ("steal", re_steal, "", " STL)", " STEAL (", None),
+        ("turnover_team", re_turnover_team, "", ")", " Turnover: ", None),
+    ],
+    EventMsgType.FOUL: [
+        ("foul_player", re_foul_player, "", ")", "", _parse_foul_player),
+        ("foul_team", re_foul_team, "", "", " ", _parse_foul_team),
+    ],
+    EventMsgType.VIOLATION: [
+        ("violation", re_violation, "", "", " Violation:", None),
+        ("violation_team", re_violation_team, "", " Violation", " Violation: ", None),
+    ],
+    EventMsgType.SUBSTITUTION: [
+        ("substitution", re_substitution, "SUB: ", "", " FOR ", None),
+    ],
+    EventMsgType.TIMEOUT: [
+        ("timeout", re_timeout, "", ")", " Timeout: ", None),
+    ],
+    EventMsgType.JUMP_BALL: [
+        ("jump_ball", re_jump_ball, "", "", "", _parse_jump_ball),
+    ],
+    EventMsgType.EJECTION: [
+        ("ejection", re_ejection, "", "", " Ejection:", None),
+    ],
+}
+# Keyed by ``EVENTMSGTYPE`` value, with the captured groups of each pattern
+# converted to ``int`` appended.
+_PARSERS = {
+    event_msg_type.value: [
+        (
+            *parser,
+            tuple(name for name in parser[1].groupindex if name in INTEGER_FIELDS),
+        )
+        for parser in parsers
+    ]
+    for event_msg_type, parsers in _PARSERS.items()
+}
+
+
+def _get_event_msg_type(event_msg_type):
+    if isinstance(event_msg_type, EventMsgType):
+        return event_msg_type.value
+    return int(event_msg_type)
+
+
+def _to_fields(integers, groups):
+    for name in integers:
+        value = groups[name]
+        if value is not None:
+            groups[name] = int(value)
+    return groups
+
+
+def _parse(parsers, description):
+    if "\n" in description:
+        # The shortcuts assume single-line descriptions.
+        for action, regex, *_, integers in parsers:
+            match = regex.match(description)
+            if match:
+                return action, _to_fields(integers, match.groupdict())
+        return None, {}
+    # Empty checks are skipped without a method call.
+    for action, regex, prefix, suffix, substring, parse, integers in parsers:
+        if (
+            (prefix and not description.startswith(prefix))
+            or (suffix and not description.endswith(suffix))
+            or (substring and substring not in description)
+        ):
+            continue
+        if parse is not None:
+            groups = parse(description)
+            if groups is None:
+                continue
+        else:
+            match = regex.match(description)
+            if match is None:
+                continue
+            groups = match.groupdict()
+        return action, _to_fields(integers, groups) if integers else groups
+    return None, {}
+
+
+def parse_description(
+    event_msg_type: int | EventMsgType, description: str
+) -> tuple[str | None, dict[str, Any]]:
+    """Return the action and fields of one description.
+
+    Args:
+        event_msg_type: ``EVENTMSGTYPE`` of the event, as an ``int`` or an
+            ``EventMsgType``.
+        description: One of its descriptions.
+
+    Returns:
+        ``(action, fields)``: the name of the first matching pattern of the
+        event type and its named groups, or ``(None, {})``.
+    """
+    parsers = _PARSERS.get(_get_event_msg_type(event_msg_type), ())
+    return _parse(parsers, description)
+
+
+_EVENT_COLUMNS = ("EVENTMSGTYPE", "EVENTNUM") + tuple(
+    column for column, _ in DESCRIPTION_COLUMNS
+)
+_SIDES = tuple(side for _, side in DESCRIPTION_COLUMNS)
+
+
+def _iter_events(events):
+    """Yield ``(EVENTMSGTYPE, EVENTNUM, descriptions)`` of every event."""
+    if isinstance(events, Mapping) and "headers" in events:
+        headers = events["headers"]
+        if not set(_EVENT_COLUMNS[2:]).issubset(headers):
+            events = (dict(zip(headers, row, strict=True)) for row in events["data"])
+            yield from _iter_events(events)
+            return
+        # Columns are read by index, without a dictionary per row.
+        get_type = itemgetter(headers.index("EVENTMSGTYPE"))
+        get_num = (
+            itemgetter(headers.index("EVENTNUM"))
+            if "EVENTNUM" in headers
+            else lambda row: None
+        )
+        get_descriptions = itemgetter(
+            *(headers.index(column) for column in _EVENT_COLUMNS[2:])
+        )
+        for row in events["data"]:
+            yield get_type(row), get_num(row), get_descriptions(row)
+    else:
+        for row in events:
+            get = row.get
+            yield (
+                row["EVENTMSGTYPE"],
+                get("EVENTNUM"),
+                (
+                    get("HOMEDESCRIPTION"),
+                    get("NEUTRALDESCRIPTION"),
+                    get("VISITORDESCRIPTION"),
+                ),
+            )
+
+
+def parse_descriptions(
+    events: Iterable[Mapping[str, Any]] | Mapping[str, Any],
+) -> list[DescriptionEvent]:
+    """Parse the descriptions of a game's play-by-play events.
+
+    Args:
+        events: ``PlayByPlayV2`` events, as row dictionaries (the
+            ``PlayByPlay`` data set of ``get_normalized_dict()``) or as the
+            data set itself (``{"headers": [...], "data": [...]}``). Rows need
+            ``EVENTMSGTYPE`` and the ``HOMEDESCRIPTION``,
+            ``NEUTRALDESCRIPTION`` and ``VISITORDESCRIPTION`` columns;
+            ``EVENTNUM`` is optional.
+
+    Returns:
+        A ``DescriptionEvent`` for every description, in event order and, for
+        each event, in home, neutral, visitor order.
+    """
+    parsed = []
+    append = parsed.append
+    parsers_by_type = _PARSERS
+    for event_msg_type, event_num, descriptions in _iter_events(events):
+        if type(event_msg_type) is not int:
+            event_msg_type = _get_event_msg_type(event_msg_type)
+        parsers = parsers_by_type.get(event_msg_type, ())
+        for side, description in zip(_SIDES, descriptions, strict=True):
+            if not description:
+                continue
+            action, fields = _parse(parsers, description)
+            append(
+                DescriptionEvent(
+                    event_num, event_msg_type, side, action, description, fields
+                )
+            )
+    return parsed
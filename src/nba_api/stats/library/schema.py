@@ -0,0 +1,280 @@
+"""Column types for building typed DataFrames from stats data sets.
+
+Column types are derived from column names with a curated type map, so a
+schema can be built for any endpoint from its ``expected_data``:
+
+- Player, team and other IDs: ``int64``
+- Percentages, ratings, rates and frequencies: ``float32``
+- Counting stats and ranks: ``Int16``, widened when values do not fit
+- Team names and abbreviations, seasons, positions and win/loss flags:
+  ``category``
+
+Game IDs, which are strings with leading zeros, and columns not covered by
+the map keep the inferred type.
+"""
+
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# numpy and pandas are imported by the functions building columns, so that
+# importing endpoints (which only need the type map) stays cheap.
+
+INT64 = "int64"
+FLOAT32 = "float32"
+INT16 = "Int16"
+CATEGORY = "category"
+
+# Columns ending in "ID" that hold zero-padded strings rather than numbers.
+STRING_ID_COLUMNS = frozenset({"GAME_ID", "CFID"})
+
+ID_COLUMNS = frozenset({"PLAYERID", "TEAMID", "PERSONID", "LEAGUEID"})
+
+COUNT_COLUMNS = frozenset(
+    {
+        "AST",
+        "ASSISTS",
+        "BLK",
+        "BLKA",
+        "BLOCKS",
+        "BLOCKS_AGAINST",
+        "DD2",
+        "DREB",
+        "FG2A",
+        "FG2M",
+        "FG3A",
+        "FG3M",
+        "FGA",
+        "FGM",
+        "FOULS_DRAWN",
+        "FOULS_PERSONAL",
+        "FTA",
+        "FTM",
+        "G",
+        "GP",
+        "GS",
+        "L",
+        "LOSSES",
+        "OREB",
+        "PF",
+        "PFD",
+        "PLUS_MINUS",
+        "PLUS_MINUS_POINTS",
+        "POINTS",
+        "POSS",
+        "PTS",
+        "RANK",
+        "REB",
+        "STEALS",
+        "STL",
+        "TD3",
+        "TOV",
+        "TURNOVERS",
+        "W",
+        "WINS",
+    }
+)
+COUNT_PREFIXES = ("RANK_", "REBOUNDS_", "PTS_", "POINTS_")
+COUNT_SUFFIXES = ("_RANK", "_MADE", "_ATTEMPTED")
+
+FLOAT_COLUMNS = frozenset({"PIE", "PACE", "FREQ", "AST_TOV", "PCT"})
+FLOAT_PREFIXES = ("PCT_", "E_PACE", "PACE_")
+FLOAT_SUFFIXES = (
+    "_PCT",
+    "PERCENTAGE",
+    "RATING",
+    "_RATE",
+    "_RATIO",
+    "_FREQUENCY",
+    "_PACE",
+    "_TO_TURNOVER",
+)
+
+# Low-cardinality strings repeated on every row.
+CATEGORY_COLUMNS = frozenset(
+    {
+        "CONFERENCE",
+        "DIVISION",
+        "GROUP_SET",
+        "LEAGUE_ID",
+        "PLAYER_POSITION",
+        "POSITION",
+        "SEASON",
+        "SEASON_ID",
+        "SEASON_TYPE",
+        "SEASON_YEAR",
+        "START_POSITION",
+        "TEAM_CITY",
+        "TEAM_CODE",
+        "TEAM_NAME",
+        "TEAM_SLUG",
+        "WL",
+    }
+)
+CATEGORY_SUFFIXES = ("ABBREVIATION", "TRICODE")
+
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def normalize_column_name(column: str) -> str:
+    """Return ``column`` in upper snake case (``teamTricode`` -> ``TEAM_TRICODE``).
+
+    Names without lowercase letters are already upper case and kept as they
+    are, so ``FG3M`` is not split after its digit.
+    """
+    if column.isupper():
+        return column
+    return _CAMEL_CASE_BOUNDARY.sub("_", column).upper()
+
+
+def get_column_type(column: str) -> str | None:
+    """Return the type of ``column`` from the type map, or ``None`` to infer it."""
+    name = normalize_column_name(column)
+    if name in CATEGORY_COLUMNS:
+        return CATEGORY
+    if name in STRING_ID_COLUMNS or (name.endswith("_ID") and "GAME" in name):
+        return None
+    # Checked before rates, so that ranks of rate stats (FG_PCT_RANK) are counts.
+    if (
+        name in COUNT_COLUMNS
+        or name.startswith(COUNT_PREFIXES)
+        or name.endswith(COUNT_SUFFIXES)
+    ):
+        return INT16
+    if name == "ID" or name.endswith("_ID") or name in ID_COLUMNS:
+        return INT64
+    if (
+        name in FLOAT_COLUMNS
+        or name.startswith(FLOAT_PREFIXES)
+        or name.endswith(FLOAT_SUFFIXES)
+    ):
+        return FLOAT32
+    if name.endswith(CATEGORY_SUFFIXES):
+        return CATEGORY
+    return None
+
+
+def get_schema(
+    columns: list[str], column_types: dict[str, str] | None = None
+) -> dict[str, str]:
+    """Return ``{column: type}`` for the typed columns among ``columns``.
+
+    Args:
+        columns: Column names of a data set.
+        column_types: Types overriding the type map, by column name. A type of
+            ``None`` leaves the column untyped.
+    """
+    schema = {}
+    for column in columns:
+        if column_types and column in column_types:
+            column_type = column_types[column]
+        else:
+            column_type = get_column_type(column)
+        if column_type is not None:
+            schema[column] = column_type
+    return schema
+
+
+def _get_numeric_kind(column_type):
+    import numpy as np
+
+    try:
+        kind = np.dtype(column_type.lower()).kind
+    except TypeError:
+        return None
+    return kind if kind in ("i", "f") else None
+
+
+def _to_float_array(values):
+    import numpy as np
+
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_integer_array(numbers, column_type):
+    import numpy as np
+    from pandas.arrays import IntegerArray
+
+    missing = np.isnan(numbers)
+    present = numbers[~missing]
+    if not np.array_equal(present, np.trunc(present)):
+        # Per-game averages of counting stats are fractional.
+        return numbers.astype(np.float32)
+
+    # Widen to the smallest integer type holding every value, e.g. career
+    # point totals that overflow Int16.
+    requested = np.dtype(column_type.lower())
+    low = present.min() if len(present) else 0
+    high = present.max() if len(present) else 0
+    for integer_type in (np.int16, np.int32, np.int64):
+        info = np.iinfo(integer_type)
+        if info.bits >= requested.itemsize * 8 and info.min <= low and high <= info.max:
+            break
+    integers = np.where(missing, 0, numbers).astype(integer_type)
+    # Capitalized types ("Int16") are pandas nullable integers; numpy integers
+    # cannot hold missing values, so those fall back to nullable too.
+    if column_type[0].isupper() or missing.any():
+        return IntegerArray(integers, missing)
+    return integers
+
+
+def build_column(values: list[Any], column_type: str | None) -> Any:
+    """Convert the ``values`` of one column to ``column_type``.
+
+    Columns that cannot be converted, for example minutes given as
+    ``"39:51"`` strings, are returned unchanged.
+    """
+    from pandas import Categorical
+    from pandas import array as pandas_array
+
+    if column_type is None:
+        return values
+    if column_type == CATEGORY:
+        return Categorical(values)
+    kind = _get_numeric_kind(column_type)
+    if kind is None:
+        return pandas_array(values, dtype=column_type)
+    numbers = _to_float_array(values)
+    if numbers is None:
+        return values
+    if kind == "f":
+        return numbers.astype(column_type.lower())
+    return _to_integer_array(numbers, column_type)
+
+
+def build_data_frame(
+    headers: list[str],
+    rows: list[list[Any]],
+    column_types: dict[str, str] | None = None,
+) -> "DataFrame":
+    """Build a DataFrame column by column with the types of the type map.
+
+    Args:
+        headers: Column names.
+        rows: Row-major data, as in a ``rowSet``.
+        column_types: Types overriding the type map, by column name.
+    """
+    try:
+        from pandas import DataFrame
+    except ImportError:
+        raise Exception(
+            "Import Missing - Failed to import DataFrame from pandas."
+        ) from None
+
+    schema = get_schema(headers, column_types)
+    columns = zip(*rows, strict=False) if rows else ([] for _ in headers)
+    frame = DataFrame(
+        {
+            index: build_column(list(values), schema.get(header))
+            for index, (header, values) in enumerate(
+                zip(headers, columns, strict=False)
+            )
+        }
+    )
+    frame.columns = headers
+    return frame
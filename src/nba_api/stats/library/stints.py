@@ -0,0 +1,437 @@
+"""Lineup stints reconstructed from rotation and play-by-play data.
+
+A stint is a stretch of a game during which the ten players on the floor do
+not change. ``build_stints`` combines a game's ``GameRotation`` data sets,
+which give each player's time on the floor, with its play-by-play, which
+gives the score, into a ``StintTable``:
+
+- period, and clock (seconds remaining in the period) at the start and end,
+- the five player IDs of each side, sorted,
+- the score of each side at the start and end.
+
+Times are handled in tenths of a second of game time, as in the
+``IN_TIME_REAL`` / ``OUT_TIME_REAL`` columns of ``GameRotation``. Stints end
+at lineup changes and at the end of each period.
+
+Substitutions are made with the clock stopped, so play-by-play events (free
+throws in particular) can share the time of a lineup change. These events
+count for the stint ending at that time, as in the ``PT_DIFF`` column of
+``GameRotation``.
+
+```python
+from nba_api.stats.endpoints import GameRotation, PlayByPlayV3
+from nba_api.stats.library.stints import build_stints
+
+rotation = GameRotation(game_id=game_id)
+play_by_play = PlayByPlayV3(game_id=game_id)
+stints = build_stints(
+    rotation.home_team.get_dict(),
+    rotation.away_team.get_dict(),
+    play_by_play.play_by_play.get_dict(),
+)
+```
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from nba_api.library.clock import to_tenths
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+PLAYERS_PER_SIDE = 5
+
+# Period lengths in tenths of a second.
+PERIOD_LENGTH = 7200
+OVERTIME_LENGTH = 3000
+REGULATION_PERIODS = 4
+
+
+def get_period_start(period: int) -> int:
+    """Return the game time, in tenths of a second, at which ``period``
+    starts."""
+    period = int(period)
+    if period <= REGULATION_PERIODS:
+        return (period - 1) * PERIOD_LENGTH
+    return (
+        REGULATION_PERIODS * PERIOD_LENGTH
+        + (period - REGULATION_PERIODS - 1) * OVERTIME_LENGTH
+    )
+
+
+def get_period_length(period: int) -> int:
+    """Return the length of ``period`` in tenths of a second."""
+    return PERIOD_LENGTH if period <= REGULATION_PERIODS else OVERTIME_LENGTH
+
+
+def _get_periods(times):
+    """Return the period of each game time (in tenths of a second)."""
+    regulation = REGULATION_PERIODS * PERIOD_LENGTH
+    return np.where(
+        times < regulation,
+        times // PERIOD_LENGTH + 1,
+        (times - regulation) // OVERTIME_LENGTH + REGULATION_PERIODS + 1,
+    )
+
+
+def _get_period_ends(periods):
+    """Return the game time at which each period ends."""
+    regulation = REGULATION_PERIODS * PERIOD_LENGTH
+    return np.where(
+        periods <= REGULATION_PERIODS,
+        periods * PERIOD_LENGTH,
+        regulation + (periods - REGULATION_PERIODS) * OVERTIME_LENGTH,
+    )
+
+
+def _get_rows(data_set):
+    headers = data_set["headers"]
+    return [dict(zip(headers, row, strict=True)) for row in data_set["data"]]
+
+
+def _get_column(data_set, name):
+    index = data_set["headers"].index(name)
+    return [row[index] for row in data_set["data"]]
+
+
+def _get_scores(play_by_play):
+    """Return the game time of each event and the home and away scores after
+    it, sorted by game time."""
+    if "actionType" in play_by_play["headers"]:
+        periods = _get_column(play_by_play, "period")
+        clocks = _get_column(play_by_play, "clock")
+        # Scores are empty strings for events that do not change them.
+        home_scores = _get_column(play_by_play, "scoreHome")
+        away_scores = _get_column(play_by_play, "scoreAway")
+    else:
+        periods = _get_column(play_by_play, "PERIOD")
+        clocks = _get_column(play_by_play, "PCTIMESTRING")
+        home_scores = []
+        away_scores = []
+        for score in _get_column(play_by_play, "SCORE"):
+            # "AWAY - HOME", or None for events that do not change it.
+            away, _, home = (score or "").partition(" - ")
+            home_scores.append(home)
+            away_scores.append(away)
+
+    times = _get_period_ends(np.array(periods, dtype=np.int64)) - to_tenths(clocks)
+    scores = []
+    for values in (home_scores, away_scores):
+        score = 0
+        column = []
+        for value in values:
+            if value:
+                score = int(value)
+            column.append(score)
+        scores.append(np.array(column, dtype=np.int64))
+
+    # Events are in play-by-play order; keep that order among equal times.
+    order = np.argsort(times, kind="stable")
+    return times[order], scores[0][order], scores[1][order]
+
+
+def _get_scores_at(times, home_scores, away_scores, at):
+    """Return the home and away scores at each game time of ``at``, counting
+    the events at that time."""
+    counts = np.searchsorted(times, at, side="right")
+    last = np.maximum(counts - 1, 0)
+    started = counts > 0
+    if not len(times):
+        return np.zeros(len(at), dtype=np.int64), np.zeros(len(at), dtype=np.int64)
+    return (
+        np.where(started, home_scores[last], 0),
+        np.where(started, away_scores[last], 0),
+    )
+
+
+def _get_lineups(rows, boundaries):
+    """Return the sorted player IDs on the floor during each stretch between
+    consecutive ``boundaries``, as a ``(stretches, 5)`` array."""
+    ins = np.array([round(row["IN_TIME_REAL"]) for row in rows], dtype=np.int64)
+    outs = np.array([round(row["OUT_TIME_REAL"]) for row in rows], dtype=np.int64)
+    player_ids = np.array([row["PERSON_ID"] for row in rows], dtype=np.int64)
+
+    # Each time on the floor covers the stretches from its in to its out time.
+    firsts = np.searchsorted(boundaries, ins)
+    lasts = np.searchsorted(boundaries, outs)
+    lengths = np.maximum(lasts - firsts, 0)
+    stretches = np.repeat(firsts - np.cumsum(lengths) + lengths, lengths) + np.arange(
+        lengths.sum()
+    )
+    player_ids = np.repeat(player_ids, lengths)
+
+    order = np.lexsort((player_ids, stretches))
+    stretches = stretches[order]
+    player_ids = player_ids[order]
+    count = len(boundaries) - 1
+    counts = np.bincount(stretches, minlength=count)
+    if counts.max(initial=0) > PLAYERS_PER_SIDE:
+        stretch = int(np.argmax(counts))
+        raise Exception(
+            f"More than {PLAYERS_PER_SIDE} players of team {rows[0]['TEAM_ID']} "
+            f"on the floor at {boundaries[stretch] / 10} seconds of game time."
+        )
+    # Lineups missing players (incomplete rotation data) end with 0s.
+    lineups = np.zeros((count, PLAYERS_PER_SIDE), dtype=np.int64)
+    starts = np.cumsum(counts) - counts
+    slots = np.arange(len(stretches)) - starts[stretches]
+    lineups[stretches, slots] = player_ids
+    return lineups
+
+
+class StintTable:
+    """Stints of one or more games, as parallel NumPy arrays.
+
+    Row ``i`` of every column describes stint ``i``. Stints are in game
+    order.
+
+    Attributes:
+        game_id: Game IDs (strings).
+        period: Periods.
+        start_clock: Seconds remaining in the period at the start.
+        end_clock: Seconds remaining in the period at the end.
+        home_team_id: Home team IDs.
+        away_team_id: Away team IDs.
+        home_player_ids: Sorted home player IDs, shape ``(stints, 5)``.
+            Lineups missing players in the rotation data end with 0s.
+        away_player_ids: Sorted away player IDs, shape ``(stints, 5)``.
+        home_score_start: Home score at the start.
+        away_score_start: Away score at the start.
+        home_score_end: Home score at the end.
+        away_score_end: Away score at the end.
+    """
+
+    COLUMNS = (
+        "game_id",
+        "period",
+        "start_clock",
+        "end_clock",
+        "home_team_id",
+        "away_team_id",
+        "home_player_ids",
+        "away_player_ids",
+        "home_score_start",
+        "away_score_start",
+        "home_score_end",
+        "away_score_end",
+    )
+
+    __slots__ = COLUMNS
+
+    def __init__(self, **columns: np.ndarray) -> None:
+        for name in self.COLUMNS:
+            setattr(self, name, columns[name])
+
+    def __len__(self) -> int:
+        return len(self.period)
+
+    def __repr__(self) -> str:
+        games = len(np.unique(self.game_id))
+        return f"StintTable({len(self)} stints, {games} games)"
+
+    @classmethod
+    def concatenate(cls, tables: Iterable["StintTable"]) -> "StintTable":
+        """Return the stints of ``tables`` in one table, e.g. a season."""
+        tables = list(tables)
+        if not tables:
+            return _build_table(
+                game_id="",
+                periods=np.zeros(0, dtype=np.int8),
+                start_clock=np.zeros(0),
+                end_clock=np.zeros(0),
+                home_team_id=0,
+                away_team_id=0,
+                home_player_ids=np.zeros((0, PLAYERS_PER_SIDE), dtype=np.int64),
+                away_player_ids=np.zeros((0, PLAYERS_PER_SIDE), dtype=np.int64),
+                scores=[np.zeros(0, dtype=np.int16)] * 4,
+            )
+        return cls(
+            **{
+                name: np.concatenate([getattr(table, name) for table in tables])
+                for name in cls.COLUMNS
+            }
+        )
+
+    @property
+    def duration(self) -> np.ndarray:
+        """Length of each stint in seconds."""
+        return self.start_clock - self.end_clock
+
+    def get_lineup_stats(self) -> dict[str, np.ndarray]:
+        """Return the time and points of each five-player lineup.
+
+        Returns:
+            Parallel arrays, one row per team and lineup: ``team_id``,
+            ``player_ids`` (shape ``(lineups, 5)``), ``stints``,
+            ``seconds``, ``points_for``, ``points_against`` and
+            ``plus_minus``.
+        """
+        home_points = (self.home_score_end - self.home_score_start).astype(np.int64)
+        away_points = (self.away_score_end - self.away_score_start).astype(np.int64)
+        keys = np.concatenate(
+            [
+                np.column_stack([self.home_team_id, self.home_player_ids]),
+                np.column_stack([self.away_team_id, self.away_player_ids]),
+            ]
+        )
+        points_for = np.concatenate([home_points, away_points])
+        points_against = np.concatenate([away_points, home_points])
+        seconds = np.concatenate([self.duration, self.duration])
+
+        # Group equal rows of keys; faster than np.unique(axis=0).
+        order = np.lexsort(keys.T[::-1])
+        keys = keys[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]).any(axis=1)
+        lineups = keys[first]
+        inverse = np.empty(len(keys), dtype=np.int64)
+        inverse[order] = np.cumsum(first) - 1
+        count = len(lineups)
+        points_for = np.bincount(inverse, weights=points_for, minlength=count)
+        points_against = np.bincount(inverse, weights=points_against, minlength=count)
+        return {
+            "team_id": lineups[:, 0],
+            "player_ids": lineups[:, 1:],
+            "stints": np.bincount(inverse, minlength=count),
+            "seconds": np.bincount(inverse, weights=seconds, minlength=count),
+            "points_for": points_for.astype(np.int64),
+            "points_against": points_against.astype(np.int64),
+            "plus_minus": (points_for - points_against).astype(np.int64),
+        }
+
+    def get_data_frame(self) -> "DataFrame":
+        """Return the stints as a pandas DataFrame, with one column per
+        player (``HOME_PLAYER_1_ID`` ... ``AWAY_PLAYER_5_ID``)."""
+        from pandas import DataFrame
+
+        columns = {
+            "GAME_ID": self.game_id,
+            "PERIOD": self.period,
+            "START_CLOCK": self.start_clock,
+            "END_CLOCK": self.end_clock,
+            "HOME_TEAM_ID": self.home_team_id,
+            "AWAY_TEAM_ID": self.away_team_id,
+        }
+        for side, player_ids in (
+            ("HOME", self.home_player_ids),
+            ("AWAY", self.away_player_ids),
+        ):
+            for slot in range(PLAYERS_PER_SIDE):
+                columns[f"{side}_PLAYER_{slot + 1}_ID"] = player_ids[:, slot]
+        columns.update(
+            {
+                "HOME_SCORE_START": self.home_score_start,
+                "AWAY_SCORE_START": self.away_score_start,
+                "HOME_SCORE_END": self.home_score_end,
+                "AWAY_SCORE_END": self.away_score_end,
+            }
+        )
+        return DataFrame(columns)
+
+
+def _build_table(
+    game_id,
+    periods,
+    start_clock,
+    end_clock,
+    home_team_id,
+    away_team_id,
+    home_player_ids,
+    away_player_ids,
+    scores,
+):
+    count = len(periods)
+    home_score_start, away_score_start, home_score_end, away_score_end = scores
+    return StintTable(
+        game_id=np.full(count, game_id, dtype="<U10"),
+        period=periods.astype(np.int8),
+        start_clock=start_clock,
+        end_clock=end_clock,
+        home_team_id=np.full(count, home_team_id, dtype=np.int64),
+        away_team_id=np.full(count, away_team_id, dtype=np.int64),
+        home_player_ids=home_player_ids,
+        away_player_ids=away_player_ids,
+        home_score_start=home_score_start.astype(np.int16),
+        away_score_start=away_score_start.astype(np.int16),
+        home_score_end=home_score_end.astype(np.int16),
+        away_score_end=away_score_end.astype(np.int16),
+    )
+
+
+def build_stints(
+    home_rotation: dict[str, Any],
+    away_rotation: dict[str, Any],
+    play_by_play: dict[str, Any],
+) -> StintTable:
+    """Return the stints of a game.
+
+    Args:
+        home_rotation: ``HomeTeam`` data set of ``GameRotation``
+            (``{"headers": [...], "data": [...]}``).
+        away_rotation: ``AwayTeam`` data set of ``GameRotation``.
+        play_by_play: ``PlayByPlay`` data set of ``PlayByPlayV3`` or
+            ``PlayByPlayV2``.
+
+    Raises:
+        Exception: If the rotation has more than five players of a team on
+            the floor at once, or a play-by-play clock cannot be parsed.
+    """
+    home_rows = _get_rows(home_rotation)
+    away_rows = _get_rows(away_rotation)
+    rows = home_rows + away_rows
+    if not rows:
+        return StintTable.concatenate([])
+
+    game_end = round(max(row["OUT_TIME_REAL"] for row in rows))
+    period_starts = []
+    period = 1
+    while get_period_start(period) < game_end:
+        period_starts.append(get_period_start(period))
+        period += 1
+    boundaries = np.unique(
+        np.array(
+            [round(row["IN_TIME_REAL"]) for row in rows]
+            + [round(row["OUT_TIME_REAL"]) for row in rows]
+            + period_starts
+            + [game_end],
+            dtype=np.int64,
+        )
+    )
+    boundaries = boundaries[(boundaries >= 0) & (boundaries <= game_end)]
+
+    home_lineups = _get_lineups(home_rows, boundaries)
+    away_lineups = _get_lineups(away_rows, boundaries)
+    starts = boundaries[:-1]
+    periods = _get_periods(starts)
+
+    # Merge consecutive stretches of a period with the same lineups.
+    changed = np.ones(len(starts), dtype=bool)
+    changed[1:] = (
+        (periods[1:] != periods[:-1])
+        | (home_lineups[1:] != home_lineups[:-1]).any(axis=1)
+        | (away_lineups[1:] != away_lineups[:-1]).any(axis=1)
+    )
+    kept = np.flatnonzero(changed)
+    starts = starts[kept]
+    ends = np.append(starts[1:], game_end)
+    periods = periods[kept]
+    period_ends = _get_period_ends(periods)
+
+    scores = _get_scores(play_by_play)
+    home_at_start, away_at_start = _get_scores_at(*scores, starts)
+    home_at_end, away_at_end = _get_scores_at(*scores, ends)
+
+    return _build_table(
+        game_id=home_rows[0]["GAME_ID"] if home_rows else away_rows[0]["GAME_ID"],
+        periods=periods,
+        start_clock=(period_ends - starts) / 10,
+        end_clock=(period_ends - ends) / 10,
+        home_team_id=home_rows[0]["TEAM_ID"] if home_rows else 0,
+        away_team_id=away_rows[0]["TEAM_ID"] if away_rows else 0,
+        home_player_ids=home_lineups[kept],
+        away_player_ids=away_lineups[kept],
+        scores=[home_at_start, away_at_start, home_at_end, away_at_end],
+    )
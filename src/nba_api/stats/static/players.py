@@ -1,27 +1,238 @@
 import re
 import unicodedata
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 
+from nba_api.stats.library import data
 from nba_api.stats.library.data import (
     player_index_first_name,
     player_index_full_name,
     player_index_id,
     player_index_is_active,
     player_index_last_name,
-    players,
-    wnba_players,
 )
+from nba_api.stats.library.fuzzy import NameIndex, TrigramIndex, resolve_names
 
 
-def _find_players(regex_pattern, row_id, players=players):
-    players_found = []
-    for player in players:
-        if re.search(
-            _strip_accents(regex_pattern),
-            _strip_accents(str(player[row_id])),
-            flags=re.I,
-        ):
-            players_found.append(_get_player_dict(player))
-    return players_found
+def __getattr__(name):
+    # The player tables are decoded on first access.
+    if name in ("players", "wnba_players"):
+        return getattr(data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Nicknames given in quotes in official names, e.g. "Paul 'The Bear' Hoffman".
+_QUOTED_NICKNAME = re.compile(r"(?:^|\s)'([^']+)'(?=\s|$)")
+
+# Characters with a special meaning in regular expressions. Patterns without
+# them (apart from ``^`` / ``$`` anchors) are looked up in the indexes.
+_REGEX_CHARACTERS = frozenset(".^$*+?{}[]()|\\")
+
+
+class _PlayerIndex:
+    """Lookup indexes over a players table, built once per table.
+
+    Names are folded (accents stripped, lower case) once, so that lookups do
+    not normalize every row again:
+
+    - ``^exact$`` names and IDs: ``dict`` hits,
+    - ``^prefix`` patterns: binary search over the sorted folded names,
+    - other literal patterns: substring search in one string of all names.
+
+    Real regular expressions are matched against the accent-stripped names.
+    """
+
+    def __init__(self, players):
+        self.players = players
+        self.size = len(players)
+        self._columns = {}
+        self._active_rows = None
+        self._name_index = None
+        self._full_name_search_index = None
+        self._search_index = None
+
+    def get_column(self, row_id):
+        column = self._columns.get(row_id)
+        if column is None:
+            column = _FoldedColumn([player[row_id] for player in self.players])
+            self._columns[row_id] = column
+        return column
+
+    def get_active_rows(self):
+        if self._active_rows is None:
+            self._active_rows = {
+                row: 1
+                for row, player in enumerate(self.players)
+                if player[player_index_is_active]
+            }
+        return self._active_rows
+
+    def get_name_index(self, nicknames):
+        if self._name_index is None:
+            self._name_index = NameIndex(_get_full_names(self.players, nicknames))
+        return self._name_index
+
+    def get_full_name_search_index(self, nicknames):
+        if self._full_name_search_index is None:
+            self._full_name_search_index = TrigramIndex(
+                _get_full_names(self.players, nicknames),
+                priorities=self.get_active_rows(),
+            )
+        return self._full_name_search_index
+
+    def get_search_index(self, nicknames):
+        if self._search_index is None:
+            self._search_index = TrigramIndex(
+                _get_search_names(self.players, nicknames),
+                priorities=self.get_active_rows(),
+            )
+        return self._search_index
+
+    def find(self, regex_pattern, row_id):
+        """Return the rows whose ``row_id`` field matches ``regex_pattern``."""
+        pattern = _strip_accents(regex_pattern)
+        column = self.get_column(row_id)
+        anchored_start = pattern.startswith("^")
+        anchored_end = pattern.endswith("$") and not pattern.endswith("\\$")
+        literal = pattern[int(anchored_start) : len(pattern) - int(anchored_end)]
+        if _REGEX_CHARACTERS.intersection(literal) or "\n" in literal:
+            return column.search(re.compile(pattern, flags=re.I))
+
+        literal = literal.lower()
+        if anchored_start and anchored_end:
+            return column.exact.get(literal, [])
+        if anchored_start:
+            return column.find_prefix(literal)
+        rows = column.find_substring(literal)
+        if anchored_end:
+            rows = [row for row in rows if column.folded[row].endswith(literal)]
+        return rows
+
+
+class _FoldedColumn:
+    def __init__(self, values):
+        # ASCII strings have no accents to strip.
+        self.stripped = [
+            value if value.isascii() else _strip_accents(value)
+            for value in map(str, values)
+        ]
+        self.folded = [value.lower() for value in self.stripped]
+        self.exact = {}
+        for row, value in enumerate(self.folded):
+            self.exact.setdefault(value, []).append(row)
+        self.sorted = sorted(self.folded)
+        self.sorted_rows = sorted(range(len(self.folded)), key=self.folded.__getitem__)
+        # All names in one string, one per line, for substring searches.
+        self.text = "\n".join(self.folded)
+        self.line_starts = list(
+            accumulate((len(value) + 1 for value in self.folded), initial=0)
+        )
+
+    def find_prefix(self, prefix):
+        start = bisect_left(self.sorted, prefix)
+        end = start
+        while end < len(self.sorted) and self.sorted[end].startswith(prefix):
+            end += 1
+        return sorted(self.sorted_rows[start:end])
+
+    def find_substring(self, literal):
+        if not literal:
+            return list(range(len(self.folded)))
+        rows = []
+        position = self.text.find(literal)
+        while position != -1:
+            row = bisect_right(self.line_starts, position) - 1
+            rows.append(row)
+            position = self.text.find(literal, self.line_starts[row + 1])
+        return rows
+
+    def search(self, regex):
+        return [row for row, value in enumerate(self.stripped) if regex.search(value)]
+
+
+_indexes = {}
+
+
+def _get_index(players):
+    index = _indexes.get(id(players))
+    # Rebuilt if the table was replaced or rows were added or removed.
+    if index is None or index.players is not players or index.size != len(players):
+        index = _PlayerIndex(players)
+        _indexes[id(players)] = index
+    return index
+
+
+def _find_players(regex_pattern, row_id, players=None):
+    if players is None:
+        players = data.players
+    rows = _get_index(players).find(regex_pattern, row_id)
+    return [_get_player_dict(players[row]) for row in rows]
+
+
+def _get_full_names(players, nicknames):
+    """Yield the ``(row, name)`` pairs a player is known by: full name and
+    nicknames."""
+    for row, player in enumerate(players):
+        full_name = player[player_index_full_name]
+        yield row, full_name
+        quoted = _QUOTED_NICKNAME.findall(full_name)
+        if quoted:
+            yield row, " ".join(_QUOTED_NICKNAME.sub(" ", full_name).split())
+            for nickname in quoted:
+                yield row, nickname
+        for nickname in nicknames.get(player[player_index_id], ()):
+            yield row, nickname
+
+
+def _get_search_names(players, nicknames):
+    """Yield the ``(row, name)`` pairs a player can be searched by: full,
+    first and last names, and nicknames."""
+    yield from _get_full_names(players, nicknames)
+    for row, player in enumerate(players):
+        yield row, player[player_index_first_name]
+        yield row, player[player_index_last_name]
+
+
+def _search_players(query, limit=5, players=None, nicknames=None):
+    """Return up to ``limit`` ``(player row, score)`` pairs for ``query``,
+    best match first."""
+    if players is None:
+        players = data.players
+        nicknames = data.player_nicknames
+    index = _get_index(players).get_search_index(nicknames or {})
+    return [(players[row], score) for row, score in index.search(query, limit=limit)]
+
+
+def _resolve_players(names, fuzzy=False, ambiguous=None, players=None, nicknames=None):
+    """Return the player ID of each name, or ``None``, in input order.
+
+    Names matching several players resolve to ``None`` (unless exactly one of
+    them is active) and are added to ``ambiguous``, if given, as
+    ``{name: [player IDs]}``.
+    """
+    if players is None:
+        players = data.players
+        nicknames = data.player_nicknames
+    nicknames = nicknames or {}
+    index = _get_index(players)
+    names = list(names)
+    candidates_list = resolve_names(
+        names,
+        index.get_name_index(nicknames),
+        # Names are only matched against full names and nicknames, not
+        # against first or last names alone.
+        search_index=index.get_full_name_search_index(nicknames) if fuzzy else None,
+        preferred=index.get_active_rows(),
+    )
+    player_ids = []
+    for name, rows in zip(names, candidates_list, strict=True):
+        if len(rows) == 1:
+            player_ids.append(players[rows[0]][player_index_id])
+            continue
+        if rows and ambiguous is not None:
+            ambiguous[name] = [players[row][player_index_id] for row in rows]
+        player_ids.append(None)
+    return player_ids
 
 
 def _strip_accents(inputstr: str) -> str:
@@ -36,7 +247,9 @@ def _strip_accents(inputstr: str) -> str:
     )
 
 
-def _find_player_by_id(player_id, players=players):
+def _find_player_by_id(player_id, players=None):
+    if players is None:
+        players = data.players
     regex_pattern = f"^{player_id}$"
     players_list = _find_players(regex_pattern, player_index_id, players=players)
     if len(players_list) > 1:
@@ -47,14 +260,18 @@ def _find_player_by_id(player_id, players=players):
         return players_list[0]
 
 
-def _get_players(players=players):
+def _get_players(players=None):
+    if players is None:
+        players = data.players
     players_list = []
     for player in players:
         players_list.append(_get_player_dict(player))
     return players_list
 
 
-def _get_active_players(players=players):
+def _get_active_players(players=None):
+    if players is None:
+        players = data.players
     players_list = []
     for player in players:
         if player[player_index_is_active]:
@@ -62,7 +279,9 @@ def _get_active_players(players=players):
     return players_list
 
 
-def _get_inactive_players(players=players):
+def _get_inactive_players(players=None):
+    if players is None:
+        players = data.players
     players_list = []
     for player in players:
         if not player[player_index_is_active]:
@@ -96,6 +315,16 @@ def find_player_by_id(player_id):
     return _find_player_by_id(player_id)
 
 
+def search(query, limit=5):
+    return [
+        _get_player_dict(player) for player, _ in _search_players(query, limit=limit)
+    ]
+
+
+def resolve_many(names, fuzzy=False, ambiguous=None):
+    return _resolve_players(names, fuzzy=fuzzy, ambiguous=ambiguous)
+
+
 def get_players():
     return _get_players()
 
@@ -109,28 +338,56 @@ def get_inactive_players():
 
 
 def find_wnba_players_by_full_name(regex_pattern):
-    return _find_players(regex_pattern, player_index_full_name, players=wnba_players)
+    return _find_players(
+        regex_pattern, player_index_full_name, players=data.wnba_players
+    )
 
 
 def find_wnba_players_by_first_name(regex_pattern):
-    return _find_players(regex_pattern, player_index_first_name, players=wnba_players)
+    return _find_players(
+        regex_pattern, player_index_first_name, players=data.wnba_players
+    )
 
 
 def find_wnba_players_by_last_name(regex_pattern):
-    return _find_players(regex_pattern, player_index_last_name, players=wnba_players)
+    return _find_players(
+        regex_pattern, player_index_last_name, players=data.wnba_players
+    )
 
 
 def find_wnba_player_by_id(player_id):
-    return _find_player_by_id(player_id, players=wnba_players)
+    return _find_player_by_id(player_id, players=data.wnba_players)
+
+
+def search_wnba(query, limit=5):
+    return [
+        _get_player_dict(player)
+        for player, _ in _search_players(
+            query,
+            limit=limit,
+            players=data.wnba_players,
+            nicknames=data.wnba_player_nicknames,
+        )
+    ]
+
+
+def resolve_many_wnba(names, fuzzy=False, ambiguous=None):
+    return _resolve_players(
+        names,
+        fuzzy=fuzzy,
+        ambiguous=ambiguous,
+        players=data.wnba_players,
+        nicknames=data.wnba_player_nicknames,
+    )
 
 
 def get_wnba_players():
-    return _get_players(players=wnba_players)
+    return _get_players(players=data.wnba_players)
 
 
 def get_wnba_active_players():
-    return _get_active_players(players=wnba_players)
+    return _get_active_players(players=data.wnba_players)
 
 
 def get_wnba_inactive_players():
-    return _get_inactive_players(players=wnba_players)
+    return _get_inactive_players(players=data.wnba_players)
@@ -9,12 +9,95 @@ from nba_api.stats.library.data import (
     team_index_nickname,
     team_index_state,
     team_index_year_founded,
+    team_nicknames,
     teams,
+    wnba_team_nicknames,
     wnba_teams,
 )
+from nba_api.stats.library.fuzzy import NameIndex, TrigramIndex, resolve_names
+
+# Characters with a special meaning in regular expressions. ``^exact$``
+# patterns without them are looked up in the indexes.
+_REGEX_CHARACTERS = frozenset(".^$*+?{}[]()|\\")
+
+
+class _TeamIndex:
+    """Lookup indexes over a teams table, built once per table.
+
+    Every column is indexed by its lower-cased value, so ``^exact$`` patterns
+    (IDs, abbreviations, cities, ...) are ``dict`` hits, as are years founded
+    and championship years.
+    """
+
+    def __init__(self, teams):
+        self.teams = teams
+        self.size = len(teams)
+        self._columns = {}
+        self._years_founded = None
+        self._championship_years = None
+        self._name_index = None
+        self._search_index = None
+
+    def get_column(self, row_id):
+        column = self._columns.get(row_id)
+        if column is None:
+            column = {}
+            for row, team in enumerate(self.teams):
+                column.setdefault(str(team[row_id]).lower(), []).append(row)
+            self._columns[row_id] = column
+        return column
+
+    def get_years_founded(self):
+        if self._years_founded is None:
+            self._years_founded = {}
+            for row, team in enumerate(self.teams):
+                year = team[team_index_year_founded]
+                self._years_founded.setdefault(year, []).append(row)
+        return self._years_founded
+
+    def get_championship_years(self):
+        if self._championship_years is None:
+            self._championship_years = {}
+            for row, team in enumerate(self.teams):
+                for year in team[team_index_championship_year]:
+                    self._championship_years.setdefault(year, []).append(row)
+        return self._championship_years
+
+    def get_name_index(self, nicknames):
+        if self._name_index is None:
+            self._name_index = NameIndex(_get_search_names(self.teams, nicknames))
+        return self._name_index
+
+    def get_search_index(self, nicknames):
+        if self._search_index is None:
+            self._search_index = TrigramIndex(_get_search_names(self.teams, nicknames))
+        return self._search_index
+
+
+_indexes = {}
+
+
+def _get_index(teams):
+    index = _indexes.get(id(teams))
+    # Rebuilt if the table was replaced or teams were added or removed.
+    if index is None or index.teams is not teams or index.size != len(teams):
+        index = _TeamIndex(teams)
+        _indexes[id(teams)] = index
+    return index
 
 
 def _find_teams(regex_pattern, row_id, teams=teams):
+    pattern = str(regex_pattern)
+    literal = pattern[1:-1]
+    if (
+        pattern.startswith("^")
+        and pattern.endswith("$")
+        and not _REGEX_CHARACTERS.intersection(literal)
+        and "\n" not in literal
+    ):
+        rows = _get_index(teams).get_column(row_id).get(literal.lower(), [])
+        return [_get_team_dict(teams[row]) for row in rows]
+
     teams_found = []
     for team in teams:
         if re.search(regex_pattern, str(team[row_id]), flags=re.I):
@@ -45,18 +128,60 @@ def _find_team_by_abbreviation(abbreviation, teams=teams):
 
 
 def _find_teams_by_championship_year(year, teams=teams):
-    for team in teams:
-        if year in team[team_index_championship_year]:
-            result = team[team_index_full_name]
-    return result
+    rows = _get_index(teams).get_championship_years().get(year, [])
+    return [_get_team_dict(teams[row]) for row in rows]
 
 
 def _find_teams_by_year_founded(year, teams=teams):
-    teams_found = []
-    for team in teams:
-        if team[team_index_year_founded] == year:
-            teams_found.append(_get_team_dict(team))
-    return teams_found
+    rows = _get_index(teams).get_years_founded().get(year, [])
+    return [_get_team_dict(teams[row]) for row in rows]
+
+
+def _get_search_names(teams, nicknames):
+    """Yield the ``(row, name)`` pairs a team can be searched by: full name,
+    nickname, city, abbreviation and nicknames."""
+    for row, team in enumerate(teams):
+        yield row, team[team_index_full_name]
+        yield row, team[team_index_nickname]
+        yield row, team[team_index_city]
+        yield row, team[team_index_abbreviation]
+        for nickname in nicknames.get(team[team_index_id], ()):
+            yield row, nickname
+
+
+def _search_teams(query, limit=5, teams=teams, nicknames=team_nicknames):
+    """Return up to ``limit`` ``(team row, score)`` pairs for ``query``,
+    best match first."""
+    index = _get_index(teams).get_search_index(nicknames)
+    return [(teams[row], score) for row, score in index.search(query, limit=limit)]
+
+
+def _resolve_teams(
+    names, fuzzy=False, ambiguous=None, teams=teams, nicknames=team_nicknames
+):
+    """Return the team ID of each abbreviation or name, or ``None``, in input
+    order.
+
+    Names matching several teams (e.g. a city with two teams) resolve to
+    ``None`` and are added to ``ambiguous``, if given, as
+    ``{name: [team IDs]}``.
+    """
+    index = _get_index(teams)
+    names = list(names)
+    candidates_list = resolve_names(
+        names,
+        index.get_name_index(nicknames),
+        search_index=index.get_search_index(nicknames) if fuzzy else None,
+    )
+    team_ids = []
+    for name, rows in zip(names, candidates_list, strict=True):
+        if len(rows) == 1:
+            team_ids.append(teams[rows[0]][team_index_id])
+            continue
+        if rows and ambiguous is not None:
+            ambiguous[name] = [teams[row][team_index_id] for row in rows]
+        team_ids.append(None)
+    return team_ids
 
 
 def _get_teams(teams=teams):
@@ -110,6 +235,14 @@ def find_team_name_by_id(team_id):
     return _find_team_name_by_id(team_id)
 
 
+def search(query, limit=5):
+    return [_get_team_dict(team) for team, _ in _search_teams(query, limit=limit)]
+
+
+def resolve_many(names, fuzzy=False, ambiguous=None):
+    return _resolve_teams(names, fuzzy=fuzzy, ambiguous=ambiguous)
+
+
 def get_teams():
     return _get_teams()
 
@@ -146,5 +279,24 @@ def find_wnba_team_name_by_id(team_id):
     return _find_team_name_by_id(team_id, teams=wnba_teams)
 
 
+def search_wnba(query, limit=5):
+    return [
+        _get_team_dict(team)
+        for team, _ in _search_teams(
+            query, limit=limit, teams=wnba_teams, nicknames=wnba_team_nicknames
+        )
+    ]
+
+
+def resolve_many_wnba(names, fuzzy=False, ambiguous=None):
+    return _resolve_teams(
+        names,
+        fuzzy=fuzzy,
+        ambiguous=ambiguous,
+        teams=wnba_teams,
+        nicknames=wnba_team_nicknames,
+    )
+
+
 def get_wnba_teams():
     return _get_teams(teams=wnba_teams)
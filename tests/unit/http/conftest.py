@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+
+class FakeAsyncResponse:
+    """Stands in for an ``aiohttp`` response."""
+
+    def __init__(self, url, status, body, delay=0):
+        self.url = url
+        self.status = status
+        self.headers = {}
+        self._body = body
+        self._delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self._body
+
+
+class FakeAsyncSession:
+    """Stands in for an ``aiohttp.ClientSession``.
+
+    Each request gets the next outcome, the last one repeating: a body, a
+    ``(status, body)`` tuple, or an exception to raise.
+    """
+
+    closed = False
+
+    def __init__(self, outcomes, delay=0):
+        self.outcomes = list(outcomes)
+        self.delay = delay
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, body = outcome if isinstance(outcome, tuple) else (200, outcome)
+        return FakeAsyncResponse(url, status, body.encode(), self.delay)
+
+
+@pytest.fixture
+def async_session():
+    """Return a factory of ``FakeAsyncSession`` taking the outcomes."""
+
+    def make(*outcomes, delay=0):
+        return FakeAsyncSession(outcomes, delay)
+
+    return make
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+
+import pytest
+
+from nba_api.library.cache import MemoryCache, SQLiteCache
+from nba_api.library.http import AsyncNBAHTTP
+from nba_api.live.nba.endpoints import ScoreBoard
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP
+from nba_api.stats.endpoints import AssistLeaders
+from nba_api.stats.library.http import (
+    AsyncNBAStatsHTTP,
+    NBAStatsHTTP,
+    NBAStatsResponse,
+)
+
+STATS_RESPONSE_TEXT = '{"resource":"assistleaders","parameters":{},"resultSets":[{"name":"AssistLeaders","headers":["RANK","TEAM_ID","AST"],"rowSet":[[1,1610612737,1760],[2,1610612762,1712]]}]}'
+LIVE_RESPONSE_TEXT = '{"meta":{"version":1,"request":"","time":"","code":200},"scoreboard":{"gameDate":"2025-02-25","leagueId":"00","leagueName":"National Basketball Association","games":[]}}'
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    AsyncNBAStatsHTTP._session = None
+    AsyncNBALiveHTTP._session = None
+
+
+def test_async_stats_request_returns_stats_response(async_session):
+    session = async_session(STATS_RESPONSE_TEXT)
+    AsyncNBAStatsHTTP.set_session(session)
+
+    response = asyncio.run(
+        AsyncNBAStatsHTTP().send_api_request(
+            endpoint="assistleaders",
+            parameters={"Season": "2025-26", "TopX": 5, "Conference": None},
+        )
+    )
+
+    assert isinstance(response, NBAStatsResponse)
+    assert response.get_data_sets()["AssistLeaders"]["data"][0][2] == 1760
+    url, kwargs = session.calls[0]
+    assert url == "https://stats.nba.com/stats/assistleaders"
+    # None values are dropped and values stringified, as requests would do
+    assert kwargs["params"] == [("Season", "2025-26"), ("TopX", "5")]
+
+
+def test_async_client_uses_stats_error_cleaning(async_session):
+    AsyncNBAStatsHTTP.set_session(async_session('{"Message":"An error has occurred."}'))
+
+    with pytest.raises(Exception, match="InvalidResponse"):
+        asyncio.run(
+            AsyncNBAStatsHTTP().send_api_request(
+                endpoint="assistleaders",
+                parameters={},
+                raise_exception_on_error=True,
+            )
+        )
+
+
+def test_stats_endpoint_fetch_loads_response(async_session):
+    session = async_session(STATS_RESPONSE_TEXT)
+    AsyncNBAStatsHTTP.set_session(session)
+
+    async def fetch_all():
+        endpoints = [AssistLeaders(get_request=False) for _ in range(10)]
+        return await asyncio.gather(*(endpoint.fetch() for endpoint in endpoints))
+
+    endpoints = asyncio.run(fetch_all())
+
+    assert len(session.calls) == 10
+    for endpoint in endpoints:
+        assert endpoint.assist_leaders.get_dict()["data"][1][1] == 1610612762
+
+
+def test_live_endpoint_fetch_loads_response(async_session):
+    session = async_session(LIVE_RESPONSE_TEXT)
+    AsyncNBALiveHTTP.set_session(session)
+
+    scoreboard = asyncio.run(ScoreBoard(get_request=False).fetch())
+
+    assert scoreboard.score_board_date == "2025-02-25"
+    assert session.calls[0][0] == (
+        "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+    )
+
+
+def test_base_async_client_requires_base_url():
+    with pytest.raises(Exception, match="Cannot use send_api_request"):
+        asyncio.run(AsyncNBAHTTP().send_api_request(endpoint="x", parameters={}))
+
+
+def test_async_session_is_recreated_for_a_new_event_loop():
+    aiohttp = pytest.importorskip("aiohttp")
+
+    async def get_sessions():
+        first = AsyncNBAStatsHTTP.get_session()
+        second = AsyncNBAStatsHTTP.get_session()
+        await AsyncNBAStatsHTTP.close_session()
+        return first, second
+
+    first, second = asyncio.run(get_sessions())
+    assert isinstance(first, aiohttp.ClientSession)
+    assert first is second
+
+    async def get_session():
+        session = AsyncNBAStatsHTTP.get_session()
+        await AsyncNBAStatsHTTP.close_session()
+        return session
+
+    assert asyncio.run(get_session()) is not first
+
+
+def test_endpoint_fetch_uses_the_endpoint_client(async_session):
+    class MirrorHTTP(NBAStatsHTTP):
+        base_url = "https://mirror.example/stats/{endpoint}"
+
+    class MirrorAssistLeaders(AssistLeaders):
+        nba_http = MirrorHTTP
+
+    session = async_session(STATS_RESPONSE_TEXT)
+    async_http = MirrorHTTP.get_async_http()
+    async_http.set_session(session)
+
+    asyncio.run(MirrorAssistLeaders(get_request=False).fetch())
+
+    assert session.calls[0][0] == "https://mirror.example/stats/assistleaders"
+    assert MirrorHTTP.get_async_http() is async_http
+    assert NBAStatsHTTP.get_async_http() is AsyncNBAStatsHTTP
+    assert AsyncNBAStatsHTTP.get_async_http() is AsyncNBAStatsHTTP
+
+
+def test_async_requests_share_the_endpoint_ttl(async_session, monkeypatch):
+    cache = MemoryCache(endpoint_ttls={"assistleaders": 0})
+    monkeypatch.setattr(AsyncNBAStatsHTTP, "_cache", cache, raising=False)
+    session = async_session(STATS_RESPONSE_TEXT)
+    AsyncNBAStatsHTTP.set_session(session)
+
+    async def request():
+        return await AsyncNBAStatsHTTP().send_api_request(
+            endpoint="AssistLeaders", parameters={}
+        )
+
+    asyncio.run(request())
+    # The TTL of "assistleaders" applies: nothing is cached.
+    assert len(cache) == 0
+
+
+def test_disk_caches_run_off_the_event_loop(async_session, monkeypatch, tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+    threads = []
+    for name in ("get", "set_response"):
+        method = getattr(cache, name)
+
+        def record(*args, method=method):
+            threads.append(threading.get_ident())
+            return method(*args)
+
+        monkeypatch.setattr(cache, name, record)
+    monkeypatch.setattr(AsyncNBAStatsHTTP, "_cache", cache, raising=False)
+    AsyncNBAStatsHTTP.set_session(async_session(STATS_RESPONSE_TEXT))
+
+    async def request():
+        return await AsyncNBAStatsHTTP().send_api_request(
+            endpoint="AssistLeaders", parameters={}
+        )
+
+    first = asyncio.run(request())
+    second = asyncio.run(request())
+    assert second.get_dict() == first.get_dict()
+    # get, set_response, then get served from the cache.
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
@@ -0,0 +1,112 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nba_api.library.batch import fetch_many, iter_fetch_many
+from nba_api.library.http import NBAHTTP
+from nba_api.stats.endpoints import GameRotation
+from nba_api.stats.library.http import NBAStatsHTTP
+
+RESPONSE_TEXT = (
+    '{"resource":"gamerotation","parameters":{"GameID":"%s"},"resultSets":['
+    '{"name":"AwayTeam","headers":["PERSON_ID"],"rowSet":[]},'
+    '{"name":"HomeTeam","headers":["PERSON_ID"],"rowSet":[]}]}'
+)
+
+
+class SlowSession:
+    """Session stub answering with the requested GameID, slower for low ids."""
+
+    def __init__(self, failing_game_id=None):
+        self.failing_game_id = failing_game_id
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, params, **kwargs):
+        game_id = dict(params)["GameID"]
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.02 if int(game_id) % 2 else 0.001)
+            if game_id == self.failing_game_id:
+                raise requests.ConnectionError("connection dropped")
+            response = Mock()
+            response.content = (RESPONSE_TEXT % game_id).encode()
+            response.status_code = 200
+            response.url = url
+            return response
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    NBAHTTP._session = None
+    for attribute in ("_session", "pool_maxsize"):
+        if attribute in vars(NBAStatsHTTP):
+            delattr(NBAStatsHTTP, attribute)
+
+
+def game_ids(count):
+    return [f"{i:010d}" for i in range(count)]
+
+
+def test_fetch_many_returns_results_in_input_order():
+    session = SlowSession(failing_game_id="0000000003")
+    NBAHTTP.set_session(session)
+
+    results = fetch_many(
+        GameRotation,
+        [{"game_id": game_id} for game_id in game_ids(8)],
+        max_workers=4,
+    )
+
+    assert [result.index for result in results] == list(range(8))
+    assert [result.kwargs["game_id"] for result in results] == game_ids(8)
+    assert session.max_active > 1
+    assert not results[3].ok
+    assert isinstance(results[3].error, requests.ConnectionError)
+    assert results[3].endpoint is None
+    for result in results[:3] + results[4:]:
+        assert result.ok
+        game_id = result.endpoint.get_dict()["parameters"]["GameID"]
+        assert game_id == result.kwargs["game_id"]
+
+
+def test_iter_fetch_many_streams_results_as_they_finish():
+    session = SlowSession()
+    NBAHTTP.set_session(session)
+
+    results = list(
+        iter_fetch_many(
+            GameRotation,
+            ({"game_id": game_id} for game_id in game_ids(10)),
+            max_workers=2,
+        )
+    )
+
+    assert sorted(result.index for result in results) == list(range(10))
+    assert session.max_active <= 2
+
+
+def test_ensure_pool_size_grows_session_adapters():
+    session = requests.Session()
+    NBAStatsHTTP.set_session(session)
+
+    NBAStatsHTTP.ensure_pool_size(32)
+
+    assert session.get_adapter("https://stats.nba.com")._pool_maxsize == 32
+    assert NBAStatsHTTP.pool_maxsize == 32
+
+
+def test_new_sessions_use_pool_size():
+    NBAStatsHTTP.ensure_pool_size(16)
+    session = NBAStatsHTTP.get_session()
+    assert session.get_adapter("https://stats.nba.com")._pool_maxsize == 16
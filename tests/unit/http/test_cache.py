@@ -0,0 +1,176 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nba_api.library import cache as cache_module
+from nba_api.library.cache import (
+    FileSystemCache,
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+    make_cache_key,
+)
+from nba_api.library.http import NBAHTTP, NBAResponse
+from nba_api.stats.endpoints import AssistLeaders
+from nba_api.stats.library.http import NBAStatsHTTP
+
+RESPONSE_TEXT = '{"resource":"assistleaders","parameters":{},"resultSets":[{"name":"AssistLeaders","headers":["RANK","AST"],"rowSet":[[1,1760]]}]}'
+
+
+@pytest.fixture(params=["memory", "filesystem", "sqlite"])
+def make_cache(request, tmp_path):
+    def factory(**kwargs):
+        if request.param == "memory":
+            return MemoryCache(**kwargs)
+        if request.param == "filesystem":
+            return FileSystemCache(tmp_path / "cache", **kwargs)
+        return SQLiteCache(str(tmp_path / "cache.sqlite"), **kwargs)
+
+    return factory
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def mock_session():
+    session = Mock(spec=requests.Session)
+    response = Mock()
+    response.content = RESPONSE_TEXT.encode()
+    response.status_code = 200
+    response.url = "https://stats.nba.com/stats/assistleaders"
+    session.get.return_value = response
+    return session
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    NBAHTTP._session = None
+    NBAHTTP._cache = None
+    if "_cache" in vars(NBAStatsHTTP):
+        del NBAStatsHTTP._cache
+
+
+def test_cache_key_is_independent_of_parameter_order():
+    first = make_cache_key("https://x/y", {"b": 2, "a": None})
+    second = make_cache_key("https://x/y", [("a", None), ("b", "2")])
+    assert first == second == "https://x/y?a=&b=2"
+
+
+def test_cache_round_trip(make_cache):
+    cache = make_cache()
+    cache.set("key", "contents é", 200, "https://x/y")
+
+    entry = cache.get("key")
+    assert (entry.contents, entry.status_code, entry.url, entry.size) == (
+        "contents é",
+        200,
+        "https://x/y",
+        11,
+    )
+    assert cache.get("missing") is None
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+
+def test_cache_entries_expire(make_cache, clock):
+    cache = make_cache(ttl=10)
+    cache.set("default", "a", 200, "u")
+    cache.set("forever", "b", 200, "u", ttl=None)
+
+    clock[0] += 11
+
+    assert cache.get("default") is None
+    assert cache.get("forever").contents == "b"
+
+
+def test_cache_evicts_least_recently_used(make_cache, clock):
+    cache = make_cache(max_bytes=2500)
+    cache.set("first", "a" * 1000, 200, "u")
+    clock[0] += 1
+    cache.set("second", "b" * 1000, 200, "u")
+    clock[0] += 1
+    cache.get("first")
+    clock[0] += 1
+    cache.set("third", "c" * 1000, 200, "u")
+
+    assert cache.get("first") is not None
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
+
+
+def test_per_endpoint_ttl():
+    cache = MemoryCache(ttl=60, endpoint_ttls={"ScoreboardV3": 5, "playbyplay": 2})
+    assert cache.get_ttl("scoreboardv3") == 5
+    assert cache.get_ttl("playbyplay/playbyplay_0022000180.json") == 2
+    assert cache.get_ttl("leaguegamelog") == 60
+    # Endpoints that are not overridden keep their short time-to-live.
+    assert cache.get_ttl("odds/odds_todaysGames.json") == 30
+
+
+def test_volatile_endpoints_expire_quickly_by_default(make_cache, clock):
+    cache = make_cache()
+    response = NBAResponse(response=RESPONSE_TEXT, status_code=200, url="u")
+    cache.set_response("stats", "scoreboardv3", response)
+    cache.set_response("live", "scoreboard/todaysScoreboard_00.json", response)
+    cache.set_response("other", "leaguegamelog", response)
+
+    clock[0] += 16
+    assert cache.get("stats") is None
+    assert cache.get("live") is None
+    assert cache.get("other") is not None
+
+
+def test_backends_must_implement_storage():
+    class IncompleteCache(ResponseCache):
+        def _get(self, key):
+            return None
+
+        def _set(self, key, entry):
+            pass
+
+    with pytest.raises(TypeError):
+        ResponseCache()
+    with pytest.raises(TypeError):
+        IncompleteCache()
+
+
+def test_send_api_request_serves_repeated_requests_from_cache(mock_session):
+    NBAHTTP.set_session(mock_session)
+    NBAHTTP.set_cache(MemoryCache())
+
+    first = AssistLeaders(season="2024-25")
+    second = AssistLeaders(season="2024-25")
+    AssistLeaders(season="2023-24")
+
+    assert mock_session.get.call_count == 2
+    assert second.get_dict() == first.get_dict()
+    assert second.get_request_url() == "https://stats.nba.com/stats/assistleaders"
+
+
+def test_invalid_responses_are_not_cached(mock_session):
+    mock_session.get.return_value.content = b'{"Message":"An error has occurred."}'
+    NBAHTTP.set_session(mock_session)
+    cache = MemoryCache()
+    NBAHTTP.set_cache(cache)
+
+    NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+
+    assert len(cache) == 0
+
+
+def test_zero_endpoint_ttl_disables_caching(mock_session):
+    NBAHTTP.set_session(mock_session)
+    NBAStatsHTTP.set_cache(MemoryCache(endpoint_ttls={"assistleaders": 0}))
+
+    AssistLeaders()
+    AssistLeaders()
+
+    assert mock_session.get.call_count == 2
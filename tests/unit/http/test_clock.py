@@ -0,0 +1,117 @@
+import math
+import random
+import re
+
+import numpy as np
+import pytest
+
+from nba_api.library.clock import to_seconds, to_tenths
+
+# The grammar of the decoder, matched row by row.
+CLOCK = re.compile(r"^PT(\d+)M(?:(\d+(?:\.\d*)?)S)?$|^(\d+)(?:\.\d*)?:(\d+(?:\.\d*)?)$")
+
+
+def match_clock(value):
+    if value is None or value == "":
+        return math.nan
+    match = CLOCK.match(value)
+    if match is None:
+        return None
+    if match.group(1):
+        return int(match.group(1)) * 60 + float(match.group(2) or 0)
+    return int(match.group(3)) * 60 + float(match.group(4))
+
+
+@pytest.mark.parametrize(
+    "value, seconds",
+    [
+        ("PT11M58.00S", 718.0),
+        ("PT00M04.70S", 4.7),
+        ("PT240M00.00S", 14400.0),
+        ("PT25M", 1500.0),
+        ("11:58", 718.0),
+        ("0:04.7", 4.7),
+        ("265:00", 15900.0),
+        ("36.000000:45", 2205.0),
+    ],
+)
+def test_to_seconds(value, seconds):
+    assert to_seconds([value])[0] == pytest.approx(seconds)
+    assert to_tenths([value])[0] == round(seconds * 10)
+
+
+def test_mixed_layouts_keep_row_order():
+    values = ["PT11M58.00S", "9:58", None, "10:00", "PT00M04.70S", "", "9:57"]
+    np.testing.assert_allclose(
+        to_seconds(values), [718.0, 598.0, np.nan, 600.0, 4.7, np.nan, 597.0]
+    )
+    assert to_tenths(values).tolist() == [7180, 5980, 0, 6000, 47, 0, 5970]
+    assert to_tenths(values, missing=-1).tolist()[2] == -1
+
+
+def test_array_inputs():
+    assert to_seconds(np.array(["1:00", "PT02M00.00S"])).tolist() == [60.0, 120.0]
+    assert to_seconds(np.array([b"1:00"])).tolist() == [60.0]
+    assert to_seconds([]).dtype == np.float64
+    assert len(to_tenths([])) == 0
+    assert np.isnan(to_seconds([None, ""])).all()
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["12 minutes", "PT11M58", "11:", ":30", "PT11:58", "11M58", "1é:00", "PT.5S"],
+)
+def test_invalid_clock(value):
+    with pytest.raises(Exception, match="Invalid game clock"):
+        to_seconds(["1:00", value])
+
+
+def test_invalid_clock_reports_first_invalid_value():
+    with pytest.raises(Exception, match=re.escape("Invalid game clock: 'b:00'")):
+        to_seconds(["1:00", "b:00", "a:00", "x"])
+    with pytest.raises(Exception, match="Invalid game clock: True"):
+        to_seconds(np.array([True]))
+    with pytest.raises(Exception, match="Invalid game clock: '35'"):
+        to_seconds(["11:58", 35])
+
+
+def test_numbers_are_minutes():
+    np.testing.assert_allclose(to_seconds([35, 12.5, None]), [2100.0, 750.0, np.nan])
+    assert to_tenths([35, 12.5, None]).tolist() == [21000, 7500, 0]
+    np.testing.assert_allclose(
+        to_seconds(np.array([35.0, np.nan, 0.5])), [2100.0, np.nan, 30.0]
+    )
+    assert to_seconds(np.array([48], dtype=np.int64)).tolist() == [2880.0]
+
+
+def test_long_values():
+    values = ["PT" + "0" * 20 + "11M58.00S", "1:00", "PT" + "0" * 20 + "11M58"]
+    assert to_seconds(values[:2]).tolist() == [718.0, 60.0]
+    with pytest.raises(Exception, match="Invalid game clock"):
+        to_seconds(values)
+
+
+def test_matches_pattern():
+    rng = random.Random(0)
+    characters = list("0123456789:.PTMS x")
+    values = []
+    for _ in range(3000):
+        value = rng.choice(["PT11M58.00S", "11:58", "PT25M", "36.000000:45", ""])
+        for _ in range(rng.randint(0, 3)):
+            start = rng.randint(0, len(value))
+            end = start + rng.randint(0, 1)
+            value = value[:start] + rng.choice(characters) + value[end:]
+        values.append(value)
+
+    for value in values:
+        expected = match_clock(value)
+        if expected is None:
+            with pytest.raises(Exception, match="Invalid game clock"):
+                to_seconds([value])
+        else:
+            np.testing.assert_allclose(to_seconds([value]), [expected])
+
+    valid = [value for value in values if match_clock(value) is not None]
+    np.testing.assert_allclose(
+        to_seconds(valid), [match_clock(value) for value in valid]
+    )
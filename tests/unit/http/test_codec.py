@@ -0,0 +1,57 @@
+import json
+import math
+
+import pytest
+
+from nba_api.library import codec
+from nba_api.library.http import NBAResponse
+from nba_api.stats.library.http import NBAStatsHTTP
+
+PAYLOAD = '{"resource":"assistleaders","rowSet":[[1,"Hawks",0.5,null,true]]}'
+
+
+@pytest.fixture(params=sorted(codec.BACKENDS))
+def backend(request):
+    previous = codec.get_backend()
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+def test_loads_accepts_str_and_bytes(backend):
+    expected = json.loads(PAYLOAD)
+    assert codec.loads(PAYLOAD) == expected
+    assert codec.loads(PAYLOAD.encode()) == expected
+
+
+def test_loads_falls_back_for_input_fast_backends_reject(backend):
+    assert math.isnan(codec.loads('{"a": NaN}')["a"])
+    assert codec.loads(b'{"a": 18446744073709551616}') == {"a": 2**64}
+
+
+def test_loads_raises_value_error_on_invalid_json(backend):
+    with pytest.raises(ValueError):
+        codec.loads("<Error><Message>An error has occurred.</Message></Error>")
+
+
+def test_dumps_matches_stdlib_format():
+    data = json.loads(PAYLOAD)
+    assert codec.dumps(data) == json.dumps(data)
+
+
+def test_set_backend_rejects_unknown_backend():
+    with pytest.raises(Exception, match="not installed"):
+        codec.set_backend("simdjson")
+
+
+def test_response_accepts_bytes(backend):
+    response = NBAResponse(PAYLOAD.encode(), 200, "https://stats.nba.com")
+    assert response.get_dict() == json.loads(PAYLOAD)
+    assert response.get_response() == PAYLOAD
+
+
+def test_clean_contents_handles_bytes():
+    http = NBAStatsHTTP()
+    cleaned = http.clean_contents(b'{"Message":"An error has occurred."}')
+    assert cleaned == "<Error><Message>An error has occurred.</Message></Error>"
+    assert http.clean_contents(PAYLOAD.encode()) == PAYLOAD.encode()
@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+
+from nba_api.library.conditional import ValidatorStore
+from nba_api.live.nba.endpoints import ScoreBoard
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP, NBALiveHTTP
+from nba_api.stats.library.http import NBAStatsHTTP
+
+URL = "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+BODY = b'{"meta":{"version":1,"request":"","time":"","code":200},"scoreboard":{"gameDate":"2025-02-25","leagueId":"00","leagueName":"National Basketball Association","games":[]}}'
+
+
+class Response:
+    def __init__(self, url, status_code, content=b"", headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class Session:
+    """Serves ``body``, honoring ``If-None-Match`` and ``If-Modified-Since``."""
+
+    def __init__(self, body=BODY, etag='"1"', last_modified=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.requests = []
+
+    def respond(self, url, headers):
+        self.requests.append(dict(headers))
+        response_headers = {}
+        if self.etag:
+            response_headers["ETag"] = self.etag
+        if self.last_modified:
+            response_headers["Last-Modified"] = self.last_modified
+        if (self.etag and headers.get("If-None-Match") == self.etag) or (
+            self.last_modified
+            and headers.get("If-Modified-Since") == self.last_modified
+        ):
+            return Response(url, 304, b"", response_headers)
+        return Response(url, 200, self.body, response_headers)
+
+    def get(self, url, params=None, headers=None, proxies=None, timeout=None):
+        return self.respond(url, headers)
+
+
+class AsyncResponse:
+    def __init__(self, response):
+        self.url = response.url
+        self.status = response.status_code
+        self.headers = response.headers
+        self._content = response.content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self._content
+
+
+class AsyncSession(Session):
+    closed = False
+
+    def get(self, url, params=None, headers=None, proxy=None, timeout=None):
+        return AsyncResponse(self.respond(url, headers))
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = ValidatorStore()
+    monkeypatch.setattr(NBALiveHTTP, "_validator_store", store)
+    monkeypatch.setattr(NBALiveHTTP, "_retry_policy", None)
+    monkeypatch.setattr(NBALiveHTTP, "_rate_limiter", None)
+    monkeypatch.setattr(NBALiveHTTP, "_cache", None)
+    return store
+
+
+def test_store_evicts_least_recently_used():
+    store = ValidatorStore(max_entries=2)
+    store.set_response("a", {"ETag": '"a"'}, "A")
+    store.set_response("b", {"Last-Modified": "Tue, 25 Feb 2025 00:00:00 GMT"}, "B")
+    assert store.get("a").response == "A"
+    store.set_response("c", {"ETag": '"c"'}, "C")
+    assert store.get("b") is None
+    assert len(store) == 2
+    assert store.get("a").request_headers() == {"If-None-Match": '"a"'}
+
+    # A response without validators replaces the previous entry.
+    store.set_response("a", {}, "A2")
+    assert store.get("a") is None
+    store.clear()
+    assert len(store) == 0
+
+
+def test_not_modified_returns_stored_response(store, monkeypatch):
+    session = Session(last_modified="Tue, 25 Feb 2025 00:00:00 GMT")
+    monkeypatch.setattr(NBALiveHTTP, "_session", session)
+    first = ScoreBoard()
+    assert "If-None-Match" not in session.requests[0]
+
+    def loads(contents):
+        raise AssertionError("decoded a 304 response")
+
+    monkeypatch.setattr("nba_api.library.codec.loads", loads)
+    second = ScoreBoard()
+    assert session.requests[1]["If-None-Match"] == '"1"'
+    assert session.requests[1]["If-Modified-Since"] == "Tue, 25 Feb 2025 00:00:00 GMT"
+    assert second.nba_response is first.nba_response
+    assert second.score_board_date == "2025-02-25"
+    # The class headers are not modified.
+    assert "If-None-Match" not in NBALiveHTTP.headers
+
+
+def test_changed_body_replaces_stored_response(store, monkeypatch):
+    session = Session()
+    monkeypatch.setattr(NBALiveHTTP, "_session", session)
+    first = NBALiveHTTP().send_api_request("scoreboard/todaysScoreboard_00.json", {})
+    session.etag = '"2"'
+    session.body = BODY.replace(b"2025-02-25", b"2025-02-26")
+    second = NBALiveHTTP().send_api_request("scoreboard/todaysScoreboard_00.json", {})
+    assert second is not first
+    assert second.get_dict()["scoreboard"]["gameDate"] == "2025-02-26"
+    assert store.get(URL).etag == '"2"'
+
+
+def test_caller_conditional_headers_take_precedence(store, monkeypatch):
+    session = Session()
+    monkeypatch.setattr(NBALiveHTTP, "_session", session)
+    http = NBALiveHTTP()
+    http.send_api_request("scoreboard/todaysScoreboard_00.json", {})
+    response = http.send_api_request(
+        "scoreboard/todaysScoreboard_00.json",
+        {},
+        headers={"If-None-Match": '"0"'},
+    )
+    assert session.requests[1]["If-None-Match"] == '"0"'
+    assert response.get_status_code() == 200
+
+
+def test_store_passed_per_request(store, monkeypatch):
+    monkeypatch.setattr(NBALiveHTTP, "_validator_store", None)
+    session = Session()
+    monkeypatch.setattr(NBALiveHTTP, "_session", session)
+    http = NBALiveHTTP()
+    first = http.send_api_request(
+        "scoreboard/todaysScoreboard_00.json", {}, validator_store=store
+    )
+    second = http.send_api_request(
+        "scoreboard/todaysScoreboard_00.json", {}, validator_store=store
+    )
+    assert session.requests[1]["If-None-Match"] == '"1"'
+    assert second is first
+    assert store.get(URL).response is first
+
+
+@pytest.mark.parametrize("http", [NBAStatsHTTP, NBALiveHTTP])
+def test_without_store_requests_are_not_conditional(http, monkeypatch):
+    session = Session()
+    monkeypatch.setattr(http, "_session", session)
+    monkeypatch.setattr(http, "_retry_policy", None)
+    monkeypatch.setattr(http, "_rate_limiter", None)
+    monkeypatch.setattr(http, "_cache", None)
+    # Stores are opt-in: they keep their responses in memory.
+    assert http.get_validator_store() is None
+    for _ in range(2):
+        http().send_api_request("assistleaders", {})
+    assert "If-None-Match" not in session.requests[1]
+
+
+def test_async_not_modified_returns_stored_response(store, monkeypatch):
+    session = AsyncSession()
+    monkeypatch.setattr(AsyncNBALiveHTTP, "_session", session)
+    monkeypatch.setattr(AsyncNBALiveHTTP, "_session_loop", None)
+
+    async def fetch():
+        http = AsyncNBALiveHTTP()
+        first = await http.send_api_request("scoreboard/todaysScoreboard_00.json", {})
+        second = await http.send_api_request("scoreboard/todaysScoreboard_00.json", {})
+        return first, second
+
+    first, second = asyncio.run(fetch())
+    assert second is first
+    assert session.requests[1]["If-None-Match"] == '"1"'
@@ -0,0 +1,179 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from nba_api.library import cache as cache_module
+from nba_api.library.cache import (
+    FinalGameCache,
+    GameStore,
+    MemoryCache,
+    find_game_statuses,
+    get_game_id_from_key,
+    make_cache_key,
+)
+from nba_api.library.http import NBAResponse
+from tests.unit.stats.endpoints.data.boxscoresummaryv3 import (
+    BOXSCORESUMMARYV3_SAMPLE,
+)
+from tests.unit.stats.endpoints.data.scoreboardv3 import SCOREBOARDV3_SAMPLE
+
+BOXSCORE_URL = "https://stats.nba.com/stats/boxscoretraditionalv3"
+BOXSCORE_TEXT = '{"meta":{},"boxScoreTraditional":{"gameId":"0022500123"}}'
+
+
+def make_response(payload, url):
+    contents = payload if isinstance(payload, str) else json.dumps(payload)
+    return NBAResponse(response=contents, status_code=200, url=url)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # During the 2025-26 season.
+    now = [1_770_000_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def final_game_cache(tmp_path):
+    return FinalGameCache(
+        MemoryCache(ttl=60, endpoint_ttls={"scoreboardv3": 15}),
+        GameStore(str(tmp_path / "games")),
+        settle_seconds=600,
+    )
+
+
+def test_game_id_from_key():
+    key = make_cache_key(BOXSCORE_URL, {"GameID": "0022500123", "StartPeriod": 0})
+    assert get_game_id_from_key(key) == "0022500123"
+    assert (
+        get_game_id_from_key(
+            "https://cdn.nba.com/static/json/liveData/boxscore/boxscore_0022000180.json"
+        )
+        == "0022000180"
+    )
+    assert get_game_id_from_key(make_cache_key(BOXSCORE_URL, {})) is None
+    key = make_cache_key(BOXSCORE_URL, {"GameID": "../../etc/passwd"})
+    assert get_game_id_from_key(key) is None
+
+
+def test_find_game_statuses_in_v3_and_v2_payloads():
+    statuses = find_game_statuses(SCOREBOARDV3_SAMPLE)
+    game_id = SCOREBOARDV3_SAMPLE["scoreboard"]["games"][0]["gameId"]
+    assert statuses[game_id][0] == 3
+    assert statuses[game_id][1] is not None
+
+    summary = find_game_statuses(BOXSCORESUMMARYV3_SAMPLE)
+    assert list(summary.values())[0][0] == 3
+
+    scoreboard_v2 = {
+        "resultSets": [
+            {
+                "name": "GameHeader",
+                "headers": ["GAME_DATE_EST", "GAME_ID", "GAME_STATUS_ID"],
+                "rowSet": [["2025-11-05", "0022500123", 3], ["x", "0022500124", 2]],
+            }
+        ]
+    }
+    assert find_game_statuses(scoreboard_v2) == {
+        "0022500123": (3, None),
+        "0022500124": (2, None),
+    }
+
+
+def test_final_game_is_promoted_after_settle_window(final_game_cache, clock):
+    key = make_cache_key(BOXSCORE_URL, {"GameID": "0022500123"})
+    response = make_response(BOXSCORE_TEXT, BOXSCORE_URL)
+
+    # Unknown status: volatile tier with the regular time-to-live.
+    final_game_cache.set_response(key, "boxscoretraditionalv3", response)
+    clock[0] += 61
+    assert final_game_cache.get(key) is None
+
+    final_game_cache.mark_final("0022500123")
+    final_game_cache.set_response(key, "boxscoretraditionalv3", response)
+    assert final_game_cache.store.get("0022500123", key) is None
+
+    clock[0] += 601
+    final_game_cache.set_response(key, "boxscoretraditionalv3", response)
+    clock[0] += 10**7
+    entry = final_game_cache.get(key)
+    assert entry.contents == BOXSCORE_TEXT
+    assert entry.url == BOXSCORE_URL
+    assert final_game_cache.store.get_game_ids() == ["0022500123"]
+
+
+def test_scoreboard_marks_old_games_as_settled(final_game_cache, clock):
+    scoreboard_url = "https://stats.nba.com/stats/scoreboardv3"
+    scoreboard_key = make_cache_key(scoreboard_url, {"GameDate": "2025-11-05"})
+    final_game_cache.set_response(
+        scoreboard_key,
+        "scoreboardv3",
+        make_response(SCOREBOARDV3_SAMPLE, scoreboard_url),
+    )
+    game_id = SCOREBOARDV3_SAMPLE["scoreboard"]["games"][0]["gameId"]
+    assert final_game_cache.is_settled(game_id)
+
+    # The scoreboard itself keeps its short time-to-live.
+    clock[0] += 16
+    assert final_game_cache.get(scoreboard_key) is None
+
+
+def test_volatile_endpoints_are_never_promoted(final_game_cache, clock):
+    final_game_cache.mark_final("0022500123", tip_off=0)
+    key = make_cache_key(
+        "https://stats.nba.com/stats/videoevents", {"GameID": "0022500123"}
+    )
+    final_game_cache.set_response(
+        key, "videoevents", make_response(BOXSCORE_TEXT, BOXSCORE_URL)
+    )
+    assert final_game_cache.store.get("0022500123", key) is None
+    assert final_game_cache.get(key) is not None
+
+
+def test_game_store_deduplicates_contents(tmp_path):
+    store = GameStore(str(tmp_path))
+    store.set("0022500123", "a", BOXSCORE_TEXT, 200, BOXSCORE_URL)
+    store.set("0022500123", "b", BOXSCORE_TEXT, 200, BOXSCORE_URL)
+
+    objects = [p for p in (tmp_path / "objects").rglob("*") if p.is_file()]
+    assert len(objects) == 1
+    assert GameStore(str(tmp_path)).get("0022500123", "b").contents == BOXSCORE_TEXT
+
+
+def test_invalid_responses_are_ignored(final_game_cache):
+    response = Mock(spec=NBAResponse)
+    response.get_status_code.return_value = 500
+    final_game_cache.set_response("key", "boxscoretraditionalv3", response)
+    assert final_game_cache.get("key") is None
+
+
+def test_settle_times_are_persisted(tmp_path, clock):
+    directory = str(tmp_path / "games")
+    cache = FinalGameCache(MemoryCache(), GameStore(directory), settle_seconds=600)
+    cache.mark_final("0022500123")
+    cache.mark_final("0022500124", settled=True)
+
+    # A new process sees the games final without requesting a scoreboard.
+    cache = FinalGameCache(MemoryCache(), GameStore(directory), settle_seconds=600)
+    assert cache.is_settled("0022500124")
+    assert not cache.is_settled("0022500123")
+    clock[0] += 601
+    assert cache.is_settled("0022500123")
+
+
+def test_games_of_past_seasons_are_settled(final_game_cache):
+    key = make_cache_key(BOXSCORE_URL, {"GameID": "0022400123"})
+    response = make_response(BOXSCORE_TEXT, BOXSCORE_URL)
+    final_game_cache.set_response(key, "boxscoretraditionalv3", response)
+    assert final_game_cache.store.get("0022400123", key) is not None
+    assert final_game_cache.is_settled("0029600001")
+    assert not final_game_cache.is_settled("0022500123")
+
+
+def test_game_store_rejects_invalid_game_ids(tmp_path):
+    store = GameStore(str(tmp_path))
+    with pytest.raises(Exception, match="Invalid game id"):
+        store.set("../0022500123", "a", BOXSCORE_TEXT, 200, BOXSCORE_URL)
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
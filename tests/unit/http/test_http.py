@@ -14,6 +14,7 @@ def mock_session():
     # Mock the get method to return a response-like object
     mock_response = Mock()
     mock_response.text = '{"resource": "alltimeleadersgrids", "resultSets": {}}'
+    mock_response.content = mock_response.text.encode()
     mock_response.status_code = 200
     mock_response.url = "http://stats.nba.com/stats/alltimeleadersgrids"
     session.get.return_value = mock_response
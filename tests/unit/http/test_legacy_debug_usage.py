@@ -47,6 +47,8 @@ MOCK_RESPONSE = Mock()
 MOCK_RESPONSE.url = "https://nba.com/stats/assistleaders"
 MOCK_RESPONSE.status_code = 200
 MOCK_RESPONSE.text = MOCK_RESPONSE_TEXT
+MOCK_RESPONSE.content = MOCK_RESPONSE_TEXT.encode()
+MOCK_RESPONSE.headers = {}
 
 MOCK_LIVE_RESPONSE = Mock()
 MOCK_LIVE_RESPONSE.url = (
@@ -54,6 +56,8 @@ MOCK_LIVE_RESPONSE.url = (
 )
 MOCK_LIVE_RESPONSE.status_code = 200
 MOCK_LIVE_RESPONSE.text = MOCK_LIVE_RESPONSE_TEXT
+MOCK_LIVE_RESPONSE.content = MOCK_LIVE_RESPONSE_TEXT.encode()
+MOCK_LIVE_RESPONSE.headers = {}
 
 
 def reload_http_modules(reload_debug=True):
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nba_api.library import ratelimit as ratelimit_module
+from nba_api.library.http import NBAHTTP
+from nba_api.library.ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+from nba_api.stats.library.http import NBAStatsHTTP
+
+RESPONSE_TEXT = '{"resource":"assistleaders","parameters":{},"resultSets":[{"name":"AssistLeaders","headers":["RANK","AST"],"rowSet":[[1,1760]]}]}'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic and wall clocks that only advance when slept on."""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(ratelimit_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit_module.time, "time", lambda: now[0])
+    monkeypatch.setattr(ratelimit_module.time, "sleep", sleep)
+    return now, sleeps
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    for cls in (NBAStatsHTTP, NBAHTTP):
+        for attr in ("_session", "_rate_limiter"):
+            if attr in vars(cls):
+                if cls is NBAHTTP:
+                    setattr(cls, attr, None)
+                else:
+                    delattr(cls, attr)
+
+
+def test_bucket_allows_burst_up_to_capacity(clock):
+    _, sleeps = clock
+    bucket = TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        assert bucket.acquire() == 0
+    assert sleeps == []
+
+
+def test_bucket_waits_for_refill_once_empty(clock):
+    _, sleeps = clock
+    bucket = TokenBucket(rate=2, capacity=1)
+    bucket.acquire()
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_bucket_refills_over_time(clock):
+    now, sleeps = clock
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    now[0] += 2
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert sleeps == []
+
+
+def test_bucket_queues_concurrent_callers(clock):
+    bucket = TokenBucket(rate=1, capacity=1)
+    delays = [bucket._reserve(1) for _ in range(4)]
+    assert delays == [0, pytest.approx(1), pytest.approx(2), pytest.approx(3)]
+
+
+def test_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_bucket_is_thread_safe():
+    bucket = TokenBucket(rate=0.001, capacity=50)
+    delays = []
+
+    def worker():
+        delays.append(bucket._reserve(1))
+
+    threads = [threading.Thread(target=worker) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bucket._tokens < 1
+    assert all(delay == 0 for delay in delays)
+
+
+def test_bucket_acquire_async(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(ratelimit_module.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate=4, capacity=1)
+
+    async def main():
+        await bucket.acquire_async()
+        await bucket.acquire_async()
+
+    asyncio.run(main())
+    assert slept == [pytest.approx(0.25)]
+
+
+def test_file_bucket_shares_budget_between_instances(clock, tmp_path):
+    path = str(tmp_path / "bucket.json")
+    first = FileTokenBucket(rate=1, path=path, capacity=2)
+    second = FileTokenBucket(rate=1, path=path, capacity=2)
+    assert first._reserve(1) == 0
+    assert second._reserve(1) == 0
+    assert first._reserve(1) == pytest.approx(1)
+
+
+def test_rate_limiter_routes_by_host(clock):
+    stats = Mock()
+    cdn = Mock()
+    limiter = RateLimiter({"stats.nba.com": stats, "CDN.nba.com": cdn})
+
+    limiter.acquire("https://stats.nba.com/stats/assistleaders")
+    limiter.acquire(
+        "https://cdn.nba.com/static/json/liveData/odds/odds_todaysGames.json"
+    )
+    limiter.acquire(
+        "https://cdn.nba.com/static/json/liveData/odds/odds_todaysGames.json"
+    )
+
+    assert stats.acquire.call_count == 1
+    assert cdn.acquire.call_count == 2
+
+
+def test_rate_limiter_ignores_unknown_hosts():
+    limiter = RateLimiter({"stats.nba.com": TokenBucket(rate=1)})
+    assert limiter.acquire("https://example.com/") == 0
+
+
+def test_send_api_request_acquires_before_network_call():
+    calls = []
+    limiter = Mock()
+    limiter.acquire.side_effect = lambda url: calls.append(("acquire", url))
+
+    session = Mock(spec=requests.Session)
+    response = Mock()
+    response.content = RESPONSE_TEXT.encode()
+    response.status_code = 200
+    response.url = "https://stats.nba.com/stats/assistleaders"
+
+    def get(**kwargs):
+        calls.append(("get", kwargs["url"]))
+        return response
+
+    session.get.side_effect = get
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_rate_limiter(limiter)
+
+    NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+
+    assert calls == [
+        ("acquire", "https://stats.nba.com/stats/assistleaders"),
+        ("get", "https://stats.nba.com/stats/assistleaders"),
+    ]
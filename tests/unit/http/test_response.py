@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from nba_api.library import codec
+from nba_api.library.http import NBAResponse
+from nba_api.stats.library.http import NBAStatsResponse
+
+RESPONSE_TEXT = '{"resource":"assistleaders","parameters":{"Season":"2025-26"},"resultSets":[{"name":"AssistLeaders","headers":["RANK","AST"],"rowSet":[[1,1760]]}]}'
+
+
+@pytest.fixture
+def count_loads(monkeypatch):
+    calls = []
+    loads = codec.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(1)
+        return loads(*args, **kwargs)
+
+    monkeypatch.setattr(codec, "loads", counting_loads)
+    return calls
+
+
+def test_response_is_decoded_once(count_loads):
+    response = NBAStatsResponse(RESPONSE_TEXT, 200, "https://stats.nba.com")
+
+    assert response.valid_json()
+    response.get_json()
+    assert response.get_parameters() == {"Season": "2025-26"}
+    response.get_normalized_dict()
+    response.get_headers_from_data_sets()
+    response.get_data_sets()
+
+    assert len(count_loads) == 1
+    assert response.get_dict() is response.get_dict()
+
+
+def test_invalid_response_is_not_decoded_again(count_loads):
+    response = NBAResponse("<Error></Error>", 500, "https://stats.nba.com")
+
+    assert not response.valid_json()
+    assert not response.valid_json()
+    assert len(count_loads) == 1
+    with pytest.raises(ValueError):
+        response.get_dict()
+
+
+def test_response_text_can_be_dropped_after_decoding(monkeypatch):
+    monkeypatch.setattr(NBAResponse, "keep_response", False)
+    response = NBAStatsResponse(RESPONSE_TEXT, 200, "https://stats.nba.com")
+
+    assert response.get_response() == RESPONSE_TEXT
+    data = response.get_dict()
+    assert response._response is None
+    assert json.loads(response.get_response()) == data
+    assert response.get_data_sets()["AssistLeaders"]["data"] == [[1, 1760]]
@@ -0,0 +1,231 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nba_api.library import retry as retry_module
+from nba_api.library.http import NBAHTTP
+from nba_api.library.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from nba_api.stats.library.http import AsyncNBAStatsHTTP, NBAStatsHTTP
+
+RESPONSE_TEXT = '{"resource":"assistleaders","parameters":{},"resultSets":[{"name":"AssistLeaders","headers":["RANK","AST"],"rowSet":[[1,1760]]}]}'
+ERROR_TEXT = '{"Message":"An error has occurred."}'
+URL = "https://stats.nba.com/stats/assistleaders"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    async def async_sleep(seconds):
+        sleep(seconds)
+
+    monkeypatch.setattr(retry_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(retry_module.time, "sleep", sleep)
+    monkeypatch.setattr(retry_module.asyncio, "sleep", async_sleep)
+    monkeypatch.setattr(retry_module.random, "uniform", lambda low, high: high)
+    return now, sleeps
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    for cls in (NBAStatsHTTP, AsyncNBAStatsHTTP):
+        for attr in ("_session", "_retry_policy"):
+            if attr in vars(cls):
+                delattr(cls, attr)
+    NBAHTTP._session = None
+    NBAHTTP._retry_policy = None
+    AsyncNBAStatsHTTP._session = None
+
+
+def make_session(*outcomes):
+    session = Mock(spec=requests.Session)
+    responses = []
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            responses.append(outcome)
+            continue
+        status_code, text = outcome
+        response = Mock()
+        response.content = text.encode()
+        response.status_code = status_code
+        response.url = URL
+        responses.append(response)
+    session.get.side_effect = responses
+    return session
+
+
+def test_backoff_uses_full_jitter_with_exponential_cap(monkeypatch):
+    bounds = []
+    monkeypatch.setattr(
+        retry_module.random, "uniform", lambda low, high: bounds.append((low, high))
+    )
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3)
+    for attempt in range(1, 6):
+        policy.get_backoff(attempt)
+    assert bounds == [(0, 0.5), (0, 1.0), (0, 2.0), (0, 3), (0, 3)]
+
+
+@pytest.mark.parametrize(
+    "status_code, contents, expected",
+    [
+        (200, RESPONSE_TEXT, False),
+        (200, b" \n" + RESPONSE_TEXT.encode(), False),
+        (200, "", True),
+        (200, None, True),
+        (200, "<Error><Message>An error has occurred.</Message></Error>", True),
+        (503, RESPONSE_TEXT, True),
+        (429, "", True),
+        (500, "Internal Server Error", True),
+        (400, "Invalid season", False),
+        (404, "", False),
+        (304, b"", False),
+    ],
+)
+def test_response_classification(status_code, contents, expected):
+    assert RetryPolicy().is_retryable_response(status_code, contents) is expected
+
+
+def test_response_classification_does_not_decode_bodies(monkeypatch):
+    def loads(contents):
+        raise AssertionError("decoded a response body")
+
+    monkeypatch.setattr("nba_api.library.codec.loads", loads)
+    assert RetryPolicy().is_retryable_response(200, RESPONSE_TEXT) is False
+
+
+def test_retries_error_body_until_success(clock):
+    _, sleeps = clock
+    session = make_session((200, ERROR_TEXT), (503, ""), (200, RESPONSE_TEXT))
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_retry_policy(RetryPolicy(max_attempts=4, backoff_base=1))
+
+    response = NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+
+    assert response.get_dict()["resource"] == "assistleaders"
+    assert session.get.call_count == 3
+    assert sleeps == [1, 2]
+
+
+def test_retries_timeouts_and_reraises_when_exhausted(clock):
+    session = make_session(requests.Timeout(), requests.ConnectionError())
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_retry_policy(RetryPolicy(max_attempts=2))
+
+    with pytest.raises(requests.ConnectionError):
+        NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+    assert session.get.call_count == 2
+
+
+def test_returns_last_response_when_exhausted(clock):
+    session = make_session((200, ERROR_TEXT), (200, ERROR_TEXT))
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_retry_policy(RetryPolicy(max_attempts=2))
+
+    with pytest.raises(Exception, match="InvalidResponse"):
+        NBAStatsHTTP().send_api_request(
+            endpoint="assistleaders", parameters={}, raise_exception_on_error=True
+        )
+    assert session.get.call_count == 2
+
+
+def test_does_not_retry_client_errors_or_unexpected_exceptions(clock):
+    session = make_session((400, "Invalid season"), ValueError("boom"))
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_retry_policy(RetryPolicy())
+
+    response = NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+    assert response.get_status_code() == 400
+    with pytest.raises(ValueError):
+        NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+    assert session.get.call_count == 2
+
+
+def test_deadline_shortens_timeouts_and_stops_retries(clock):
+    _, sleeps = clock
+    session = make_session(*[requests.Timeout()] * 10)
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_retry_policy(
+        RetryPolicy(max_attempts=10, backoff_base=2, backoff_max=2, deadline=5)
+    )
+
+    with pytest.raises(requests.Timeout):
+        NBAStatsHTTP().send_api_request(
+            endpoint="assistleaders", parameters={}, timeout=30
+        )
+
+    timeouts = [call.kwargs["timeout"] for call in session.get.call_args_list]
+    assert timeouts == [5, 3, 1]
+    assert sleeps == [2, 2]
+
+
+def test_circuit_breaker_opens_and_recovers(clock):
+    now, _ = clock
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+    breaker.record_failure(URL)
+    breaker.before_request(URL)
+    breaker.record_failure(URL)
+    assert breaker.is_open(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    now[0] += 30
+    breaker.before_request(URL)
+    # Only one trial request is let through while it is in flight.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+    breaker.record_success(URL)
+    breaker.before_request(URL)
+    assert not breaker.is_open(URL)
+
+
+def test_circuit_breaker_reopens_when_trial_fails(clock):
+    now, _ = clock
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+    for _ in range(3):
+        breaker.record_failure(URL)
+    now[0] += 10
+    breaker.before_request(URL)
+    breaker.record_failure(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+
+def test_open_circuit_fails_fast_without_request(clock):
+    session = make_session(*[(503, "")] * 4)
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_retry_policy(
+        RetryPolicy(
+            max_attempts=4,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+        )
+    )
+
+    with pytest.raises(CircuitOpenError):
+        NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+    with pytest.raises(CircuitOpenError):
+        NBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+    assert session.get.call_count == 2
+
+
+def test_async_client_retries(clock, async_session):
+    _, sleeps = clock
+    session = async_session(asyncio.TimeoutError(), ERROR_TEXT, RESPONSE_TEXT)
+    AsyncNBAStatsHTTP.set_session(session)
+    AsyncNBAStatsHTTP.set_retry_policy(RetryPolicy(backoff_base=1))
+
+    response = asyncio.run(
+        AsyncNBAStatsHTTP().send_api_request(endpoint="assistleaders", parameters={})
+    )
+
+    assert response.get_dict()["resource"] == "assistleaders"
+    assert len(session.calls) == 3
+    assert sleeps == [1, 2]
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nba_api.library.http import NBAHTTP
+from nba_api.library.singleflight import SingleFlight
+from nba_api.stats.library.http import AsyncNBAStatsHTTP, NBAStatsHTTP
+
+RESPONSE_TEXT = '{"resource":"assistleaders","parameters":{},"resultSets":[{"name":"AssistLeaders","headers":["RANK","AST"],"rowSet":[[1,1760]]}]}'
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    for cls in (NBAStatsHTTP, AsyncNBAStatsHTTP):
+        for attr in ("_session", "_single_flight"):
+            if attr in vars(cls):
+                delattr(cls, attr)
+    NBAHTTP._session = None
+    NBAHTTP._single_flight = None
+    AsyncNBAStatsHTTP._session = None
+
+
+class SlowResponse:
+    status_code = 200
+    url = "https://stats.nba.com/stats/assistleaders"
+    content = RESPONSE_TEXT.encode()
+    headers = {}
+
+
+class SlowSession:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params, **kwargs):
+        with self._lock:
+            self.calls.append(params)
+        time.sleep(self.delay)
+        return SlowResponse()
+
+
+def test_do_shares_result_between_threads():
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return object()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(group.do, "key", fn)
+        started.wait()
+        followers = [executor.submit(group.do, "key", fn) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.in_flight() == 0
+
+
+def test_do_shares_errors_and_forgets_finished_calls():
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(group.do, "key", fail)
+        started.wait()
+        follower = executor.submit(group.do, "key", fail)
+        time.sleep(0.05)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert group.do("key", lambda: 1) == 1
+
+
+def test_do_async_shares_result_between_tasks():
+    group = SingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def main():
+        return await asyncio.gather(*(group.do_async("key", fn) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.in_flight() == 0
+
+
+def test_cancelling_one_async_caller_does_not_cancel_the_call():
+    group = SingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(group.do_async("key", fn))
+        second = asyncio.ensure_future(group.do_async("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_concurrent_identical_requests_share_one_http_call():
+    session = SlowSession()
+    NBAStatsHTTP.set_session(session)
+    NBAStatsHTTP.set_single_flight(SingleFlight())
+
+    def request(parameters):
+        return NBAStatsHTTP().send_api_request(
+            endpoint="assistleaders", parameters=parameters
+        )
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        same = [executor.submit(request, {"Season": "2025-26"}) for _ in range(5)]
+        other = executor.submit(request, {"Season": "2024-25"})
+        responses = [future.result() for future in same]
+        other.result()
+
+    assert len(session.calls) == 2
+    assert all(response is responses[0] for response in responses)
+
+
+def test_concurrent_identical_async_requests_share_one_http_call(async_session):
+    session = async_session(RESPONSE_TEXT, delay=0.01)
+    AsyncNBAStatsHTTP.set_session(session)
+    AsyncNBAStatsHTTP.set_single_flight(SingleFlight())
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                AsyncNBAStatsHTTP().send_api_request(
+                    endpoint="assistleaders", parameters={"Season": "2025-26"}
+                )
+                for _ in range(5)
+            )
+        )
+
+    responses = asyncio.run(main())
+    assert len(session.calls) == 1
+    assert all(response is responses[0] for response in responses)
@@ -551,3 +551,10 @@ def test_officials_dict(nba_http_patch):
 
 def test_game_details_dict(nba_http_patch):
     assert boxscore.BoxScore(game_id).game_details.get_dict() == game_details
+
+
+def test_player_minutes_seconds(nba_http_patch):
+    player_stats = boxscore.BoxScore(game_id).home_team_player_stats
+    assert player_stats.get_seconds("statistics.minutes").tolist() == [1501.0]
+    assert player_stats.get_tenths("statistics.minutes").tolist() == [15010]
+    assert player_stats.get_seconds("statistics.minutesCalculated").tolist() == [1500.0]
@@ -129,3 +129,9 @@ def test_get_actions_dict(nba_http_patch):
 
 def test_get_dict(nba_http_patch):
     assert playbyplay.PlayByPlay(game_id).get_dict() == content
+
+
+def test_actions_clock_seconds(nba_http_patch):
+    actions = playbyplay.PlayByPlay(game_id).actions
+    assert actions.get_seconds("clock").tolist() == [718.0]
+    assert actions.get_tenths("clock").tolist() == [7180]
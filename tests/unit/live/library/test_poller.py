@@ -0,0 +1,192 @@
+import json
+
+import pytest
+
+from nba_api.library.cache import MemoryCache
+from nba_api.library.retry import RetryPolicy
+from nba_api.live.nba.library.http import NBALiveHTTP
+from nba_api.live.nba.library.poller import PlayByPlayPoller
+
+GAME_ID = "0022000180"
+URL = "https://cdn.nba.com/static/json/liveData/playbyplay/playbyplay_0022000180.json"
+
+
+def action(number, edited, description="", order=None):
+    return {
+        "actionNumber": number,
+        "orderNumber": order if order is not None else number * 10000,
+        "edited": edited,
+        "description": description,
+    }
+
+
+def payload(*actions):
+    return json.dumps({"game": {"gameId": GAME_ID, "actions": list(actions)}})
+
+
+class Response:
+    def __init__(self, url, status_code, content=b"", headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class Session:
+    """Serves the current body of each URL, honoring ``If-None-Match``."""
+
+    def __init__(self, etags=True):
+        self.bodies = {}
+        self.status_codes = {}
+        self.etags = etags
+        self.requests = []
+
+    def publish(self, url, body):
+        self.bodies[url] = body.encode()
+
+    def get(self, url, params=None, headers=None, proxies=None, timeout=None):
+        self.requests.append(dict(headers))
+        if url in self.status_codes:
+            return Response(url, self.status_codes[url])
+        body = self.bodies[url]
+        etag = f'"{hash(body)}"'
+        if self.etags and headers.get("If-None-Match") == etag:
+            return Response(url, 304)
+        response_headers = {"ETag": etag} if self.etags else {}
+        return Response(url, 200, body, response_headers)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = Session()
+    monkeypatch.setattr(NBALiveHTTP, "_session", session)
+    monkeypatch.setattr(NBALiveHTTP, "_retry_policy", None)
+    monkeypatch.setattr(NBALiveHTTP, "_rate_limiter", None)
+    monkeypatch.setattr(NBALiveHTTP, "_cache", None)
+    monkeypatch.setattr(NBALiveHTTP, "_single_flight", None)
+    monkeypatch.setattr(NBALiveHTTP, "_validator_store", None)
+    return session
+
+
+def test_poll_returns_new_and_edited_actions(session):
+    poller = PlayByPlayPoller([GAME_ID])
+    first = action(2, "2021-01-16T00:40:31Z", "Start of 1st Period")
+    second = action(4, "2021-01-16T00:40:31Z", "Jump Ball")
+    session.publish(URL, payload(first, second))
+    assert list(poller.poll()) == [(GAME_ID, first), (GAME_ID, second)]
+
+    # Unchanged: the conditional request is answered with 304.
+    assert list(poller.poll()) == []
+    validators = poller.validator_store.get(URL)
+    assert session.requests[-1]["If-None-Match"] == validators.etag
+    assert poller.games[GAME_ID].not_modified == 1
+
+    edited = action(4, "2021-01-16T00:41:02Z", "Jump Ball: Tip to Williams")
+    third = action(7, "2021-01-16T00:41:05Z", "MISS Tatum 3PT")
+    session.publish(URL, payload(first, edited, third))
+    assert poller.poll_game(GAME_ID) == [edited, third]
+
+    state = poller.games[GAME_ID]
+    assert state.action_number == 7
+    assert state.order_number == 70000
+    assert state.edited == "2021-01-16T00:41:05Z"
+    assert state.polls == 3
+
+
+def test_inserted_and_removed_actions(session):
+    poller = PlayByPlayPoller()
+    first = action(2, "t1")
+    second = action(4, "t1")
+    session.publish(URL, payload(first, second))
+    assert poller.poll_game(GAME_ID) == [first, second]
+
+    # Inserted before the last action, with a lower orderNumber.
+    inserted = action(6, "t2", order=30000)
+    session.publish(URL, payload(first, inserted, second))
+    assert poller.poll_game(GAME_ID) == [inserted]
+    assert poller.games[GAME_ID].order_number == 40000
+
+    session.publish(URL, payload(first, inserted))
+    assert poller.poll_game(GAME_ID) == []
+    session.publish(URL, payload(first, inserted, second))
+    assert poller.poll_game(GAME_ID) == [second]
+
+
+def test_identical_body_without_etag_is_not_decoded(session, monkeypatch):
+    session.etags = False
+    poller = PlayByPlayPoller([GAME_ID])
+    session.publish(URL, payload(action(2, "t1")))
+    assert len(poller.poll_game(GAME_ID)) == 1
+
+    def loads(contents):
+        raise AssertionError("decoded an unchanged body")
+
+    monkeypatch.setattr("nba_api.library.codec.loads", loads)
+    assert poller.poll_game(GAME_ID) == []
+    assert "If-None-Match" not in session.requests[-1]
+
+
+def test_cached_body_is_not_decoded(session, monkeypatch):
+    monkeypatch.setattr(NBALiveHTTP, "_cache", MemoryCache())
+    poller = PlayByPlayPoller([GAME_ID])
+    session.publish(URL, payload(action(2, "t1")))
+    assert len(poller.poll_game(GAME_ID)) == 1
+
+    def loads(contents):
+        raise AssertionError("decoded a cached body")
+
+    monkeypatch.setattr("nba_api.library.codec.loads", loads)
+    assert poller.poll_game(GAME_ID) == []
+    assert len(session.requests) == 1
+    assert poller.games[GAME_ID].not_modified == 1
+
+
+def test_error_body_is_cleaned(session):
+    poller = PlayByPlayPoller([GAME_ID])
+    session.publish(URL, '{"Message":"An error has occurred."}')
+    with pytest.raises(Exception, match="invalid response"):
+        poller.poll_game(GAME_ID)
+
+
+def test_unpublished_and_failed_games(session):
+    poller = PlayByPlayPoller([GAME_ID])
+    session.status_codes[URL] = 403
+    assert poller.poll_game(GAME_ID) == []
+
+    session.status_codes[URL] = 500
+    with pytest.raises(Exception, match="status code 500"):
+        poller.poll_game(GAME_ID)
+
+
+def test_not_modified_is_not_retried(session, monkeypatch):
+    monkeypatch.setattr(NBALiveHTTP, "_retry_policy", RetryPolicy(max_attempts=3))
+    poller = PlayByPlayPoller([GAME_ID])
+    session.publish(URL, payload(action(2, "t1")))
+    poller.poll_game(GAME_ID)
+    assert poller.poll_game(GAME_ID) == []
+    assert len(session.requests) == 2
+
+
+def test_add_and_remove_games(session):
+    poller = PlayByPlayPoller([GAME_ID, GAME_ID])
+    assert list(poller.games) == [GAME_ID]
+    assert poller.add_game(GAME_ID) is poller.games[GAME_ID]
+    poller.remove_game(GAME_ID)
+    assert list(poller.poll()) == []
+    assert session.requests == []
+
+
+def test_validator_store_is_bounded_to_the_games(session):
+    other_url = URL.replace(GAME_ID, "0022000181")
+    poller = PlayByPlayPoller([GAME_ID, "0022000181"])
+    session.publish(URL, payload(action(2, "t1")))
+    session.publish(other_url, payload(action(2, "t1")))
+    list(poller.poll())
+    assert poller.validator_store.max_entries == 2
+    assert len(poller.validator_store) == 2
+    assert NBALiveHTTP.get_validator_store() is None
+
+    poller.remove_game("0022000181")
+    assert poller.validator_store.max_entries == 1
+    assert poller.validator_store.get(other_url) is None
+    assert poller.validator_store.get(URL) is not None
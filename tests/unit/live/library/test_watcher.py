@@ -0,0 +1,330 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP, NBALiveHTTP
+from nba_api.live.nba.library.watcher import (
+    FINAL,
+    HALFTIME,
+    LIVE,
+    PERIOD_BREAK,
+    SCHEDULED,
+    TIMEOUT,
+    LiveWatcher,
+    PollSchedule,
+    WatchedGame,
+    get_phase,
+)
+
+BASE_URL = "https://cdn.nba.com/static/json/liveData/"
+SCOREBOARD_URL = BASE_URL + "scoreboard/todaysScoreboard_00.json"
+PAST = "2021-01-16T00:30:00Z"
+
+
+def play_by_play_url(game_id):
+    return BASE_URL + f"playbyplay/playbyplay_{game_id}.json"
+
+
+def scoreboard(*games):
+    return {"scoreboard": {"gameDate": "2021-01-15", "games": list(games)}}
+
+
+def game(game_id, status, text="", period=0, time_utc=PAST):
+    return {
+        "gameId": game_id,
+        "gameStatus": status,
+        "gameStatusText": text,
+        "period": period,
+        "gameTimeUTC": time_utc,
+    }
+
+
+def play_by_play(*actions):
+    return {"game": {"actions": list(actions)}}
+
+
+def action(number, action_type="2pt", period=1, edited="t1", sub_type=""):
+    return {
+        "actionNumber": number,
+        "orderNumber": number * 10000,
+        "actionType": action_type,
+        "subType": sub_type,
+        "period": period,
+        "edited": edited,
+    }
+
+
+class Response:
+    def __init__(self, url, status, body, headers):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class Session:
+    """Serves scripted bodies per URL, one per request, repeating the last."""
+
+    closed = False
+
+    def __init__(self, scripts, etags=False):
+        self.scripts = {url: list(bodies) for url, bodies in scripts.items()}
+        self.etags = etags
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, proxy=None, timeout=None):
+        self.requests.append(url)
+        bodies = self.scripts.get(url)
+        if not bodies:
+            return Response(url, 403, b"", {})
+        body = bodies.pop(0) if len(bodies) > 1 else bodies[0]
+        if isinstance(body, int):
+            return Response(url, body, b"", {})
+        content = json.dumps(body).encode()
+        etag = f'"{hash(content)}"'
+        response_headers = {"ETag": etag} if self.etags else {}
+        if self.etags and headers.get("If-None-Match") == etag:
+            return Response(url, 304, b"", response_headers)
+        return Response(url, 200, content, response_headers)
+
+
+@pytest.fixture
+def use_session(monkeypatch):
+    monkeypatch.setattr(NBALiveHTTP, "_validator_store", None)
+    monkeypatch.setattr(NBALiveHTTP, "_retry_policy", None)
+    monkeypatch.setattr(NBALiveHTTP, "_rate_limiter", None)
+    monkeypatch.setattr(NBALiveHTTP, "_cache", None)
+
+    def use_session(session):
+        monkeypatch.setattr(AsyncNBALiveHTTP, "_session", session)
+        monkeypatch.setattr(AsyncNBALiveHTTP, "_session_loop", None)
+        return session
+
+    return use_session
+
+
+def watch(watcher):
+    async def collect():
+        return [event async for event in watcher.watch()]
+
+    return asyncio.run(collect())
+
+
+IMMEDIATE = PollSchedule(
+    live=0, timeout=0, period_break=0, halftime=0, scoreboard=0, idle=0
+)
+
+
+@pytest.mark.parametrize(
+    "status, text, last_action, period, phase",
+    [
+        (1, "7:30 pm ET", None, 0, SCHEDULED),
+        (None, "", None, None, SCHEDULED),
+        (2, "Q1 5:00", action(10), 1, LIVE),
+        (2, "Q1 5:00", action(10, "timeout"), 1, TIMEOUT),
+        (2, "End Q1", None, 1, PERIOD_BREAK),
+        (2, "Q1 0:00", action(10, "period", 1, sub_type="end"), 1, PERIOD_BREAK),
+        (2, "Q2 0:00", action(10, "period", 2, sub_type="end"), 2, HALFTIME),
+        (2, "Half", action(10), 2, HALFTIME),
+        # The end of the 2nd period is stale once the scoreboard is in the 3rd.
+        (2, "Q3 12:00", action(10, "period", 2, sub_type="end"), 3, LIVE),
+        (3, "Final", action(10, "timeout"), 4, FINAL),
+    ],
+)
+def test_get_phase(status, text, last_action, period, phase):
+    assert get_phase(status, text, last_action, period) == phase
+
+
+def test_schedule_intervals():
+    schedule = PollSchedule()
+    assert schedule.get_interval(LIVE) < schedule.get_interval(TIMEOUT)
+    assert schedule.get_interval(TIMEOUT) < schedule.get_interval(HALFTIME)
+    assert schedule.get_interval(SCHEDULED) is None
+    assert schedule.get_interval(FINAL) is None
+
+
+def test_scoreboard_interval_waits_for_tip_off():
+    watcher = LiveWatcher(schedule=PollSchedule(scoreboard=15, idle=600))
+    assert watcher.get_scoreboard_interval() == 600
+
+    game = watcher.games["0022000180"] = WatchedGame("0022000180")
+    tip_off = datetime.fromtimestamp(time.time() + 3600, timezone.utc)
+    game.game_time_utc = tip_off.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert watcher.get_scoreboard_interval() == 600
+
+    tip_off = datetime.fromtimestamp(time.time() + 120, timezone.utc)
+    game.game_time_utc = tip_off.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert 100 < watcher.get_scoreboard_interval() <= 120
+
+    game.game_time_utc = PAST
+    assert watcher.get_scoreboard_interval() == 15
+    game.phase = LIVE
+    game.game_time_utc = None
+    assert watcher.get_scoreboard_interval() == 15
+
+
+def test_watch_polls_games_from_tip_off_to_final(use_session):
+    first = action(1, "period", sub_type="start")
+    second = action(2)
+    edited = action(2, edited="t2")
+    session = use_session(
+        Session(
+            {
+                SCOREBOARD_URL: [
+                    scoreboard(game("A", 1), game("B", 2, "Q1 5:00", 1)),
+                    scoreboard(game("A", 2, "Q1 12:00", 1), game("B", 2, "Q1 4:00", 1)),
+                    scoreboard(game("A", 2, "Q1 11:00", 1), game("B", 3, "Final", 4)),
+                    scoreboard(game("A", 3, "Final", 4), game("B", 3, "Final", 4)),
+                ],
+                play_by_play_url("A"): [play_by_play(first, second)],
+                play_by_play_url("B"): [
+                    play_by_play(first),
+                    play_by_play(first, second),
+                    play_by_play(first, edited),
+                ],
+            }
+        )
+    )
+    watcher = LiveWatcher(schedule=IMMEDIATE)
+    events = watch(watcher)
+
+    assert [event for event in events if event[0] == "A"] == [
+        ("A", first),
+        ("A", second),
+    ]
+    assert [event for event in events if event[0] == "B"] == [
+        ("B", first),
+        ("B", second),
+        ("B", edited),
+    ]
+    # A is not polled before the scoreboard shows it live.
+    assert session.requests.index(play_by_play_url("A")) > 2
+    assert session.requests[:2] == [SCOREBOARD_URL, play_by_play_url("B")]
+    assert watcher.is_done()
+    assert all(game.phase == FINAL for game in watcher.games.values())
+    # Nothing is requested once the games are final.
+    assert session.requests[-1] != SCOREBOARD_URL
+
+
+def test_watch_selected_games(use_session):
+    session = use_session(
+        Session(
+            {
+                SCOREBOARD_URL: [
+                    scoreboard(game("A", 3, "Final", 4), game("B", 2, "Q1 5:00", 1))
+                ],
+                play_by_play_url("A"): [play_by_play(action(1))],
+            }
+        )
+    )
+    watcher = LiveWatcher(["A"], schedule=IMMEDIATE)
+    assert watch(watcher) == [("A", action(1))]
+    assert list(watcher.games) == ["A"]
+    assert play_by_play_url("B") not in session.requests
+
+
+def test_unchanged_feed_is_not_modified(use_session):
+    use_session(
+        Session(
+            {
+                SCOREBOARD_URL: [scoreboard(game("A", 2, "Q1 5:00", 1))],
+                play_by_play_url("A"): [play_by_play(action(1))],
+            },
+            etags=True,
+        )
+    )
+    watcher = LiveWatcher(schedule=IMMEDIATE)
+
+    async def poll():
+        await watcher.poll_scoreboard()
+        return [await watcher.poll_game("A") for _ in range(3)]
+
+    assert asyncio.run(poll()) == [[action(1)], [], []]
+    state = watcher.games["A"].play_by_play
+    assert state.polls == 3
+    assert state.not_modified == 2
+    # Conditional without a store attached to the client, bounded to the
+    # scoreboard and the watched game.
+    assert NBALiveHTTP.get_validator_store() is None
+    assert watcher.validator_store.max_entries == 2
+    assert watcher.validator_store.get(play_by_play_url("A")) is not None
+
+
+def test_unpublished_and_failed_feeds(use_session):
+    use_session(
+        Session(
+            {
+                SCOREBOARD_URL: [scoreboard(game("A", 2, "Q1 12:00", 1))],
+                play_by_play_url("A"): [404, 500],
+            }
+        )
+    )
+    watcher = LiveWatcher(schedule=IMMEDIATE)
+
+    async def poll():
+        await watcher.poll_scoreboard()
+        assert await watcher.poll_game("A") == []
+        await watcher.poll_game("A")
+
+    with pytest.raises(Exception, match="status code 500"):
+        asyncio.run(poll())
+
+
+def test_games_missing_from_the_scoreboard(use_session):
+    session = use_session(
+        Session(
+            {
+                SCOREBOARD_URL: [
+                    scoreboard(game("A", 2, "Q4 0:10", 4)),
+                    # The scoreboard turns to the next day.
+                    scoreboard(game("C", 1)),
+                ],
+                play_by_play_url("A"): [play_by_play(action(1))],
+            }
+        )
+    )
+    watcher = LiveWatcher(["A", "B"], schedule=IMMEDIATE)
+    assert watch(watcher) == [("A", action(1))]
+    # B was never listed: it is dropped without being polled.
+    assert watcher.games["B"].done
+    assert play_by_play_url("B") not in session.requests
+    # A left the scoreboard: it was polled a last time.
+    assert watcher.games["A"].phase == FINAL
+    assert session.requests.count(play_by_play_url("A")) == 2
+
+
+def test_failed_game_is_retried_without_stopping_others(use_session):
+    session = use_session(
+        Session(
+            {
+                SCOREBOARD_URL: [
+                    scoreboard(game("A", 2, "Q1 5:00", 1), game("B", 2, "Q1 5:00", 1)),
+                    scoreboard(game("A", 2, "Q1 5:00", 1), game("B", 2, "Q1 5:00", 1)),
+                    scoreboard(game("A", 3, "Final", 4), game("B", 3, "Final", 4)),
+                ],
+                play_by_play_url("A"): [500, play_by_play(action(1))],
+                play_by_play_url("B"): [play_by_play(action(2))],
+            }
+        )
+    )
+    watcher = LiveWatcher(schedule=IMMEDIATE)
+    events = watch(watcher)
+    assert sorted(events, key=lambda event: event[0]) == [
+        ("A", action(1)),
+        ("B", action(2)),
+    ]
+    assert session.requests.count(play_by_play_url("A")) == 3
+    assert watcher.games["A"].error is None
+    assert watcher.is_done()
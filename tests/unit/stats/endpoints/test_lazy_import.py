@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+import nba_api.stats.endpoints as endpoints
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.split()
+
+
+def test_import_does_not_load_endpoints_or_heavy_dependencies():
+    loaded = run_python(
+        "import sys\n"
+        "from nba_api.stats.endpoints import LeagueGameLog, playercareerstats\n"
+        "print(*sorted(name for name in sys.modules if name.split('.')[0] in "
+        "('numpy', 'pandas', 'pyarrow', 'polars', 'aiohttp') or "
+        "name.startswith('nba_api.stats.endpoints.')))"
+    )
+    assert loaded == [
+        "nba_api.stats.endpoints._base",
+        "nba_api.stats.endpoints.leaguegamelog",
+        "nba_api.stats.endpoints.playercareerstats",
+    ]
+
+
+def test_endpoint_classes_and_modules_are_resolved_lazily():
+    from nba_api.stats.endpoints import LeagueGameLog, leaguegamelog
+
+    assert LeagueGameLog is leaguegamelog.LeagueGameLog
+    assert endpoints.PlayerCareerStats.endpoint == "playercareerstats"
+    assert "LeagueGameLog" in dir(endpoints)
+    assert "leaguegamelog" in endpoints.__all__
+    for name in endpoints.__all__:
+        assert getattr(endpoints, name).__name__ == f"{endpoints.__name__}.{name}"
+    for name, module in endpoints._ENDPOINTS.items():
+        assert getattr(endpoints, name).__module__.endswith(f".{module}")
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        endpoints.NotAnEndpoint  # noqa: B018
+    with pytest.raises(ImportError):
+        from nba_api.stats.endpoints import NotAnEndpoint  # noqa: F401
+
+
+def test_data_frame_imports_pandas_on_demand():
+    loaded = run_python(
+        "import sys\n"
+        "from nba_api.stats.endpoints._base import Endpoint\n"
+        "data_set = Endpoint.DataSet({'headers': ['A'], 'data': [[1]]})\n"
+        "before = 'pandas' in sys.modules\n"
+        "data_set.get_data_frame()\n"
+        "print(before, 'pandas' in sys.modules)"
+    )
+    assert loaded == ["False", "True"]
@@ -1,6 +1,11 @@
+import json
+
+import numpy as np
+import pytest
 from pandas import DataFrame
 
 from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.library.http import NBAStatsResponse
 
 
 def test_headers_not_present():
@@ -29,3 +34,170 @@ def test_headers_present_and_nonempty():
     assert isinstance(result, DataFrame)
     assert result.empty
     assert list(result.columns) == ["GAME_ID", "LEAG_TIX"]
+
+
+MULTI_LEVEL_DATA = {
+    "headers": [
+        {
+            "name": "SHOT_CATEGORY",
+            "columnsToSkip": 2,
+            "columnSpan": 2,
+            "columnNames": ["Restricted Area", "Mid-Range"],
+        },
+        {
+            "name": "columns",
+            "columnSpan": 1,
+            "columnNames": ["TEAM_ID", "TEAM_NAME", "FGM", "FG_PCT", "FGM", "FG_PCT"],
+        },
+    ],
+    "data": [
+        [1610612737, "Atlanta Hawks", 989, 0.657, 168, 0.419],
+        [1610612738, "Boston Celtics", 901, None, 150, 0.4],
+    ],
+}
+
+
+def test_arrow_table_is_built_from_rows():
+    pa = pytest.importorskip("pyarrow")
+    data = {
+        "headers": ["GAME_ID", "TEAM_ID", "PTS", "FG_PCT", "MIXED"],
+        "data": [
+            ["0022500001", 1610612737, 110, 0.489, 1],
+            ["0022500001", 1610612738, None, 0.5, "x"],
+        ],
+    }
+    table = Endpoint.DataSet(data).get_arrow_table()
+
+    assert table.column_names == data["headers"]
+    assert table.schema.field("GAME_ID").type == pa.string()
+    assert table.schema.field("TEAM_ID").type == pa.int64()
+    assert table.column("PTS").to_pylist() == [110, None]
+    assert table.schema.field("FG_PCT").type == pa.float64()
+    assert table.column("MIXED").to_pylist() == ["1", "x"]
+
+
+def test_arrow_table_flattens_multi_level_headers():
+    pytest.importorskip("pyarrow")
+    table = Endpoint.DataSet(MULTI_LEVEL_DATA).get_arrow_table()
+
+    assert table.column_names == [
+        "TEAM_ID",
+        "TEAM_NAME",
+        "Restricted Area_FGM",
+        "Restricted Area_FG_PCT",
+        "Mid-Range_FGM",
+        "Mid-Range_FG_PCT",
+    ]
+    assert table.column("Restricted Area_FG_PCT").to_pylist() == [0.657, None]
+
+
+def test_arrow_table_of_empty_data_set():
+    pytest.importorskip("pyarrow")
+    table = Endpoint.DataSet({"headers": ["GAME_ID", "PTS"], "data": []})
+    assert table.get_arrow_table().num_rows == 0
+    assert table.get_arrow_table().column_names == ["GAME_ID", "PTS"]
+
+
+def test_polars_frame_matches_arrow_table():
+    pytest.importorskip("polars")
+    frame = Endpoint.DataSet(MULTI_LEVEL_DATA).get_polars()
+
+    assert frame.columns[2] == "Restricted Area_FGM"
+    assert frame.shape == (2, 6)
+    assert frame["TEAM_NAME"].to_list() == ["Atlanta Hawks", "Boston Celtics"]
+    assert frame["Mid-Range_FGM"].to_list() == [168, 150]
+
+
+class LazyEndpoint(Endpoint):
+    endpoint = "lazyendpoint"
+
+    first = Endpoint.LazyDataSet("First")
+    second = Endpoint.LazyDataSet("Second")
+    missing = Endpoint.LazyDataSet("Missing")
+
+    def load_response(self):
+        self.load_data_sets(self.nba_response.get_data_sets())
+
+
+def make_lazy_endpoint(*names):
+    response = NBAStatsResponse(
+        json.dumps(
+            {
+                "resultSets": [
+                    {"name": name, "headers": ["TEAM_ID"], "rowSet": [[index]]}
+                    for index, name in enumerate(names)
+                ]
+            }
+        ),
+        200,
+        "https://stats.nba.com/stats/lazyendpoint",
+    )
+    endpoint = LazyEndpoint()
+    endpoint.nba_response = response
+    endpoint.load_response()
+    return endpoint
+
+
+def test_data_sets_are_created_on_first_access():
+    endpoint = make_lazy_endpoint("First", "Second")
+    assert endpoint._data_set_cache == {}
+
+    assert endpoint.second.get_dict()["data"] == [[1]]
+    assert list(endpoint._data_set_cache) == ["Second"]
+    assert endpoint.second is endpoint.second
+
+    # data_sets shares the named data sets and keeps the response order.
+    assert [data_set.key for data_set in endpoint.data_sets] == ["First", "Second"]
+    assert endpoint.data_sets[1] is endpoint.second
+    assert endpoint.data_sets is endpoint.data_sets
+
+
+def test_reloading_response_resets_data_sets():
+    endpoint = make_lazy_endpoint("First")
+    first, data_sets = endpoint.first, endpoint.data_sets
+
+    endpoint.load_data_sets({"First": {"headers": ["TEAM_ID"], "data": [[7]]}})
+
+    assert endpoint.first is not first
+    assert endpoint.first.get_dict()["data"] == [[7]]
+    assert endpoint.data_sets is not data_sets
+
+
+def test_missing_and_unloaded_data_sets():
+    endpoint = make_lazy_endpoint("First")
+    assert not hasattr(endpoint, "missing")
+    with pytest.raises(KeyError):
+        endpoint.get_data_set("Missing")
+
+    unloaded = LazyEndpoint()
+    assert unloaded.first is None
+    assert unloaded.data_sets is None
+    assert isinstance(LazyEndpoint.first, Endpoint.LazyDataSet)
+
+
+def test_clock_and_minutes_columns():
+    data_set = Endpoint.DataSet(
+        {
+            "headers": ["PLAYER_ID", "MIN", "clock"],
+            "data": [
+                [1, "36:12", "PT11M58.00S"],
+                [2, None, "PT00M04.70S"],
+            ],
+        }
+    )
+    seconds = data_set.get_seconds("MIN")
+    assert seconds[0] == 2172.0
+    assert np.isnan(seconds[1])
+    assert data_set.get_tenths("MIN", missing=-1).tolist() == [21720, -1]
+    assert data_set.get_tenths("clock").tolist() == [7180, 47]
+    with pytest.raises(KeyError):
+        data_set.get_seconds("PCTIMESTRING")
+
+
+def test_numeric_minutes_column():
+    data_set = Endpoint.DataSet(
+        {"headers": ["PLAYER_ID", "MIN"], "data": [[1, 35], [2, 12.5], [3, None]]}
+    )
+    seconds = data_set.get_seconds("MIN")
+    assert seconds[:2].tolist() == [2100.0, 750.0]
+    assert np.isnan(seconds[2])
@@ -0,0 +1,93 @@
+import pytest
+
+from nba_api.stats.library.fuzzy import (
+    NameIndex,
+    TrigramIndex,
+    fold_name,
+    get_loose_key,
+    get_trigrams,
+    resolve_names,
+)
+
+
+@pytest.mark.parametrize(
+    "name, folded",
+    [
+        ("Nikola Jokić", "nikola jokic"),
+        ("Shaquille O'Neal", "shaquille oneal"),
+        ("J.J. Redick", "jj redick"),
+        ("Shai Gilgeous-Alexander", "shai gilgeous alexander"),
+        ("  Dr.  J ", "dr j"),
+        ("", ""),
+    ],
+)
+def test_fold_name(name, folded):
+    assert fold_name(name) == folded
+
+
+def test_get_trigrams():
+    assert get_trigrams("jokic") == {" jo", "jok", "oki", "kic", "ic "}
+    assert get_trigrams("a b") == {" a ", " b "}
+    assert get_trigrams("") == set()
+
+
+def test_search():
+    index = TrigramIndex(
+        [(0, "Nikola Jokić"), (0, "Joker"), (1, "Nikola Jović"), (2, "Jokic")],
+        priorities={2: 1},
+    )
+    # Entries are ranked by the score of their best matching name.
+    assert index.search("nikola jokic") == [(0, 1.0), (1, 0.7273), (2, 0.625)]
+    # Equal scores: exact matches first.
+    assert index.search("jokic")[0] == (2, 1.0)
+    assert index.search("joker", limit=1) == [(0, 1.0)]
+    assert index.search("xyz") == []
+    assert index.search("jokic", min_score=1.0) == [(2, 1.0)]
+
+
+def test_search_priorities():
+    names = [(0, "John Smith"), (0, "John"), (1, "John Stockton"), (1, "John")]
+    assert [entry for entry, _ in TrigramIndex(names).search("john")] == [0, 1]
+    index = TrigramIndex(names, priorities={1: 1})
+    assert [entry for entry, _ in index.search("john")] == [1, 0]
+
+
+@pytest.mark.parametrize(
+    "folded, key",
+    [
+        ("jimmy butler iii", "butler jimmy"),
+        ("doncic luka", "doncic luka"),
+        ("luka doncic", "doncic luka"),
+        ("iii", "iii"),
+    ],
+)
+def test_get_loose_key(folded, key):
+    assert get_loose_key(folded) == key
+
+
+def test_name_index():
+    index = NameIndex(
+        [(0, "Jimmy Butler III"), (1, "Jimmy Butler"), (2, "Luka Dončić")]
+    )
+    assert index.get("JIMMY BUTLER") == [1]
+    assert index.get("Butler, Jimmy") == [0, 1]
+    assert index.get("Dončić, Luka") == [2]
+    assert index.get("Luka") == []
+
+
+def test_resolve_names():
+    names = [(0, "John Smith"), (1, "John Smith"), (2, "Nikola Jokić")]
+    name_index = NameIndex(names)
+    search_index = TrigramIndex(names)
+    assert resolve_names(
+        ["john smith", "Nikola Jokic", "Nikola Jokcic", None], name_index
+    ) == [
+        [0, 1],
+        [2],
+        [],
+        [],
+    ]
+    assert resolve_names(["john smith"], name_index, preferred={1}) == [[1]]
+    assert resolve_names(
+        ["Nikola Jokcic"], name_index, search_index, min_score=0.7
+    ) == [[2]]
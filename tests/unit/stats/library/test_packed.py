@@ -0,0 +1,71 @@
+import subprocess
+import sys
+
+import pytest
+
+from nba_api.stats.library import data
+from nba_api.stats.library.packed import pack_players, unpack_players
+
+TABLES = {
+    "players": [
+        [76001, "Abdelnaby", "Alaa", "Alaa Abdelnaby", False],
+        [203999, "Jokić", "Nikola", "Nikola Jokić", True],
+        [1630173, "Achiuwa", "Precious", "Precious Achiuwa", True],
+        [1628975, "Nance Jr.", "Larry", "Larry Nance Jr.", False],
+    ],
+    "wnba_players": [[1628932, "Wilson", "A'ja", "A'ja Wilson", True]],
+}
+
+
+def test_round_trip():
+    assert unpack_players(pack_players(TABLES)) == TABLES
+
+
+def test_round_trip_of_empty_tables():
+    tables = {"players": [], "wnba_players": []}
+    assert unpack_players(pack_players(tables)) == tables
+
+
+def test_repeated_names_share_one_string():
+    tables = {
+        "players": [
+            [1, "Smith", "John", "John Smith", False],
+            [2, "Stockton", "John", "John Stockton", False],
+        ],
+        "wnba_players": [],
+    }
+    first, second = unpack_players(pack_players(tables))["players"]
+    assert first[2] is second[2]
+    assert first[4] is False
+
+
+def test_rejects_other_files():
+    with pytest.raises(Exception, match="Invalid static player data"):
+        unpack_players(b"XXXX" + bytes(16))
+
+
+def test_shipped_tables():
+    assert len(data.players) > 5000
+    assert len(data.wnba_players) > 1000
+    assert [2544, "James", "LeBron", "LeBron James"] in [
+        row[:4] for row in data.players
+    ]
+    assert all(isinstance(row[4], bool) for row in data.players)
+
+
+def test_player_tables_are_decoded_on_first_access():
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from nba_api.stats.library import data\n"
+            "from nba_api.stats.static import players\n"
+            "print('players' in vars(data))\n"
+            "players.find_player_by_id(2544)\n"
+            "print('players' in vars(data), 'wnba_players' in vars(data))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+    assert output == ["False", "True", "True"]
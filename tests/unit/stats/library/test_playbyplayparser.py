@@ -0,0 +1,212 @@
+import random
+
+import pytest
+
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayparser import (
+    INTEGER_FIELDS,
+    DescriptionEvent,
+    parse_description,
+    parse_descriptions,
+)
+from nba_api.stats.library.playbyplayregex import eventmsgtype_to_re
+
+from .data_playbyplayregex import playbyplay
+
+ACTIONS = {
+    "Block": (EventMsgType.FIELD_GOAL_MISSED, "block"),
+    "Ejection": (EventMsgType.EJECTION, "ejection"),
+    "FieldGoalMade": (EventMsgType.FIELD_GOAL_MADE, "field_goal_made"),
+    "FieldGoalMissed": (EventMsgType.FIELD_GOAL_MISSED, "field_goal_missed"),
+    "FoulPlayer": (EventMsgType.FOUL, "foul_player"),
+    "FoulTeam": (EventMsgType.FOUL, "foul_team"),
+    "FreeThrowMade": (EventMsgType.FREE_THROW, "free_throw_made"),
+    "FreeThrowMissed": (EventMsgType.FREE_THROW, "free_throw_miss"),
+    "JumpBall": (EventMsgType.JUMP_BALL, "jump_ball"),
+    "ReboundPlayer": (EventMsgType.REBOUND, "rebound_player"),
+    "ReboundTeam": (EventMsgType.REBOUND, "rebound_team"),
+    "Steal": (EventMsgType.TURNOVER, "steal"),
+    "Substitution": (EventMsgType.SUBSTITUTION, "substitution"),
+    "Timeout": (EventMsgType.TIMEOUT, "timeout"),
+    "TurnoverPlayer": (EventMsgType.TURNOVER, "turnover_player"),
+    "TurnoverTeam": (EventMsgType.TURNOVER, "turnover_team"),
+    "Violation": (EventMsgType.VIOLATION, "violation"),
+    "ViolationTeam": (EventMsgType.VIOLATION, "violation_team"),
+}
+
+EVENT_MSG_TYPES = [
+    EventMsgType.FIELD_GOAL_MADE,
+    EventMsgType.FIELD_GOAL_MISSED,
+    EventMsgType.FREE_THROW,
+    EventMsgType.REBOUND,
+    EventMsgType.TURNOVER,
+    EventMsgType.FOUL,
+    EventMsgType.VIOLATION,
+    EventMsgType.SUBSTITUTION,
+    EventMsgType.TIMEOUT,
+    EventMsgType.JUMP_BALL,
+    EventMsgType.EJECTION,
+]
+
+DESCRIPTIONS = [play["description"] for plays in playbyplay.values() for play in plays]
+
+# Fragments that the mutated descriptions are built from.
+FRAGMENTS = [
+    " ",
+    "(",
+    ")",
+    ".",
+    ":",
+    "|",
+    "1",
+    "P",
+    "v",
+    "s",
+    "\t",
+    "MISS ",
+    " Free Throw ",
+    "1 of 2",
+    " PTS)",
+    " vs. ",
+    ": Tip to",
+    "Jump Ball ",
+    "(P1.T2)",
+    " (",
+    "SUB: ",
+]
+
+
+def match_patterns(event_msg_type, description):
+    """Return the groups of the first matching pattern of
+    ``eventmsgtype_to_re``, typed as in ``parse_description``."""
+    for regex in eventmsgtype_to_re[event_msg_type]:
+        match = regex.match(description)
+        if match:
+            return {
+                name: int(value)
+                if name in INTEGER_FIELDS and value is not None
+                else value
+                for name, value in match.groupdict().items()
+            }
+    return None
+
+
+@pytest.mark.parametrize(
+    "key, play",
+    [(key, play) for key, plays in playbyplay.items() for play in plays],
+)
+def test_parse_description(key, play):
+    event_msg_type, expected_action = ACTIONS[key]
+    action, fields = parse_description(event_msg_type, play["description"])
+    assert action == expected_action
+    for name, value in play.items():
+        if name == "description":
+            continue
+        if name in INTEGER_FIELDS and value is not None:
+            value = int(value)
+        assert fields[name] == value
+
+
+@pytest.mark.parametrize("event_msg_type", EVENT_MSG_TYPES)
+def test_parse_description_matches_patterns(event_msg_type):
+    rng = random.Random(event_msg_type.value)
+    descriptions = list(DESCRIPTIONS)
+    for _ in range(2000):
+        description = rng.choice(DESCRIPTIONS)
+        for _ in range(rng.randint(1, 4)):
+            start = rng.randint(0, len(description))
+            end = min(len(description), start + rng.randint(0, 3))
+            fragment = rng.choice(FRAGMENTS) if rng.random() < 0.8 else ""
+            description = description[:start] + fragment + description[end:]
+        descriptions.append(description)
+
+    for description in descriptions:
+        action, fields = parse_description(event_msg_type, description)
+        expected = match_patterns(event_msg_type, description)
+        assert (fields if action else None) == expected, description
+
+
+@pytest.mark.parametrize(
+    "event_msg_type, description",
+    [
+        (EventMsgType.FOUL, "a " * 5000 + "(P1.T2"),
+        (EventMsgType.FOUL, "a b (P1.T2)" * 2000 + " x)"),
+        (EventMsgType.FREE_THROW, "A" + " Free Throw 1 of 2" * 2000 + " (1 PTS"),
+        (EventMsgType.FREE_THROW, "MISS A" + " Free Throw x" * 2000 + " y!"),
+        (EventMsgType.JUMP_BALL, "Jump Ball " + "a vs. " * 5000),
+    ],
+    ids=["foul", "foul counts", "free throw made", "free throw miss", "jump ball"],
+)
+def test_parse_description_long_descriptions(event_msg_type, description):
+    # The patterns of eventmsgtype_to_re backtrack quadratically on these.
+    assert parse_description(event_msg_type, description) == (None, {})
+
+
+def test_parse_description_multiline():
+    description = "Smith REBOUND (Off:1 Def:3)\n"
+    assert parse_description(EventMsgType.REBOUND, description) == (
+        "rebound_player",
+        {"player": "Smith", "offensive": 1, "defensive": 3},
+    )
+
+
+def test_parse_description_without_patterns():
+    assert parse_description(EventMsgType.PERIOD_BEGIN, "Start of 1st Period") == (
+        None,
+        {},
+    )
+    assert parse_description(6, "Smith P.FOUL (P1.T2) (J.Doe)")[0] == "foul_player"
+
+
+def test_parse_descriptions():
+    events = [
+        {
+            "EVENTNUM": 7,
+            "EVENTMSGTYPE": 2,
+            "HOMEDESCRIPTION": "MISS Smith 3PT Jump Shot",
+            "NEUTRALDESCRIPTION": None,
+            "VISITORDESCRIPTION": "Jones BLOCK (1 BLK)",
+        },
+        {
+            "EVENTNUM": 8,
+            "EVENTMSGTYPE": 12,
+            "HOMEDESCRIPTION": None,
+            "NEUTRALDESCRIPTION": "Start of 2nd Period",
+            "VISITORDESCRIPTION": "",
+        },
+    ]
+    expected = [
+        DescriptionEvent(
+            7,
+            2,
+            "home",
+            "field_goal_missed",
+            "MISS Smith 3PT Jump Shot",
+            {
+                "player": "Smith",
+                "distance": None,
+                "field_goal_type": "3PT Jump Shot",
+            },
+        ),
+        DescriptionEvent(
+            7,
+            2,
+            "visitor",
+            "block",
+            "Jones BLOCK (1 BLK)",
+            {"player": "Jones", "blocks": 1},
+        ),
+        DescriptionEvent(8, 12, "neutral", None, "Start of 2nd Period", {}),
+    ]
+    parsed = parse_descriptions(events)
+    assert parsed == expected
+    assert parsed[0].fields == match_patterns(
+        EventMsgType.FIELD_GOAL_MISSED, "MISS Smith 3PT Jump Shot"
+    )
+
+    headers = list(events[0])
+    data_set = {
+        "headers": headers,
+        "data": [[event[header] for header in headers] for event in events],
+    }
+    assert parse_descriptions(data_set) == expected
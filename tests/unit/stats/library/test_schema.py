@@ -0,0 +1,120 @@
+import pytest
+
+from nba_api.stats.endpoints import LeagueGameLog
+from nba_api.stats.library.schema import (
+    build_data_frame,
+    get_column_type,
+    get_schema,
+    normalize_column_name,
+)
+
+pd = pytest.importorskip("pandas")
+
+
+@pytest.mark.parametrize(
+    "column, expected",
+    [
+        ("TEAM_ID", "int64"),
+        ("personId", "int64"),
+        ("GAME_ID", None),
+        ("gameId", None),
+        ("SEASON_ID", "category"),
+        ("Seeding_Game_1_ID", None),
+        ("FG_PCT", "float32"),
+        ("fieldGoalsPercentage", "float32"),
+        ("OFF_RATING", "float32"),
+        ("PTS", "Int16"),
+        ("FG3M", "Int16"),
+        ("FG3A", "Int16"),
+        ("FG2M", "Int16"),
+        ("FG_PCT_RANK", "Int16"),
+        ("fieldGoalsMade", "Int16"),
+        ("TEAM_ABBREVIATION", "category"),
+        ("teamTricode", "category"),
+        ("WL", "category"),
+        ("MIN", None),
+        ("PLAYER_NAME", None),
+    ],
+)
+def test_get_column_type(column, expected):
+    assert get_column_type(column) == expected
+
+
+def test_normalize_column_name():
+    assert normalize_column_name("teamTricode") == "TEAM_TRICODE"
+    assert normalize_column_name("Team_ID") == "TEAM_ID"
+    assert normalize_column_name("FG3_PCT") == "FG3_PCT"
+    for column in ("FG3M", "FG3A", "FG2M"):
+        assert normalize_column_name(column) == column
+
+
+def test_get_schema_applies_overrides():
+    schema = get_schema(
+        ["TEAM_ID", "PTS", "MATCHUP"], {"PTS": "float32", "TEAM_ID": None}
+    )
+    assert schema == {"PTS": "float32"}
+
+
+def test_endpoint_schema_is_derived_from_expected_data():
+    schema = LeagueGameLog.get_schema()["LeagueGameLog"]
+    assert schema["TEAM_ID"] == "int64"
+    assert schema["FG_PCT"] == "float32"
+    assert schema["PTS"] == "Int16"
+    assert schema["TEAM_ABBREVIATION"] == "category"
+    assert "GAME_ID" not in schema
+    assert "MATCHUP" not in schema
+
+
+def test_build_data_frame_types_columns():
+    frame = build_data_frame(
+        ["GAME_ID", "TEAM_ID", "TEAM_ABBREVIATION", "MIN", "PTS", "FG_PCT"],
+        [
+            ["0022500001", 1610612737, "ATL", "240:00", 110, 0.489],
+            ["0022500001", 1610612738, "BOS", "240:00", None, None],
+        ],
+    )
+
+    assert list(frame.columns) == [
+        "GAME_ID",
+        "TEAM_ID",
+        "TEAM_ABBREVIATION",
+        "MIN",
+        "PTS",
+        "FG_PCT",
+    ]
+    dtypes = frame.dtypes.astype(str).to_dict()
+    assert dtypes["TEAM_ID"] == "int64"
+    assert dtypes["TEAM_ABBREVIATION"] == "category"
+    assert dtypes["PTS"] == "Int16"
+    assert dtypes["FG_PCT"] == "float32"
+    assert frame["GAME_ID"].tolist() == ["0022500001", "0022500001"]
+    assert frame["MIN"].tolist() == ["240:00", "240:00"]
+    assert frame["PTS"].isna().tolist() == [False, True]
+
+
+def test_build_data_frame_widens_or_falls_back_to_float():
+    frame = build_data_frame(["PTS", "AST"], [[41000, 7.5], [12, 3.0]])
+    assert str(frame.dtypes["PTS"]) == "Int32"
+    assert str(frame.dtypes["AST"]) == "float32"
+    assert frame["PTS"].tolist() == [41000, 12]
+
+
+def test_build_data_frame_without_rows_keeps_columns():
+    frame = build_data_frame(["TEAM_ID", "PTS"], [])
+    assert frame.empty
+    assert list(frame.columns) == ["TEAM_ID", "PTS"]
+
+
+def test_typed_data_frame_matches_untyped_values():
+    from nba_api.stats.endpoints._base import Endpoint
+
+    data_set = Endpoint.DataSet(
+        data={
+            "headers": ["PLAYER_ID", "PLAYER_NAME", "REB", "USG_PCT"],
+            "data": [[2544, "LeBron James", 8, 0.276], [203952, "A", 3, 0.194]],
+        }
+    )
+    typed = data_set.get_data_frame(typed=True)
+    untyped = data_set.get_data_frame()
+    pd.testing.assert_frame_equal(typed, untyped, check_dtype=False, atol=1e-6)
+    assert typed.memory_usage(deep=True).sum() < untyped.memory_usage(deep=True).sum()
@@ -792,6 +792,26 @@ class TestNBAStatsResponse:
             == response["exp_normalized_dict"]
         )
 
+    def test_get_normalized_dict_columnar(self, response):
+        expected = {}
+        for name, rows in response["exp_normalized_dict"].items():
+            headers = response["exp_headers_from_data_sets"].get(name, [])
+            expected[name] = {
+                header: [row[header] for row in rows] for header in headers
+            }
+        assert (
+            self.nbastatsresponse(response).get_normalized_dict(columnar=True)
+            == expected
+        )
+
+    def test_iter_normalized_rows(self, response):
+        expected = [
+            (name, row)
+            for name, rows in response["exp_normalized_dict"].items()
+            for row in rows
+        ]
+        assert list(self.nbastatsresponse(response).iter_normalized_rows()) == expected
+
     def test_get_normalized_json(self, response):
         assert (
             self.nbastatsresponse(response).get_normalized_json()
@@ -809,3 +829,15 @@ class TestNBAStatsResponse:
             self.nbastatsresponse(response).get_data_sets(endpoint=response["endpoint"])
             == response["exp_data_sets"]
         )
+
+
+def test_get_normalized_dict_columnar_keeps_columns_of_empty_result_sets():
+    response = NBAStatsResponse(
+        '{"resultSets":[{"name":"Empty","headers":["GAME_ID","PTS"],"rowSet":[]}]}',
+        200,
+        "https://stats.nba.com/stats/leaguegamelog",
+    )
+    assert response.get_normalized_dict(columnar=True) == {
+        "Empty": {"GAME_ID": [], "PTS": []}
+    }
+    assert response.get_normalized_dict() == {"Empty": []}
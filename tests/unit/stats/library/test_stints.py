@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+
+from nba_api.stats.library.stints import (
+    StintTable,
+    build_stints,
+    get_period_length,
+    get_period_start,
+)
+
+GAME_ID = "0022200001"
+HOME_TEAM_ID = 1610612739
+AWAY_TEAM_ID = 1610612741
+
+ROTATION_HEADERS = [
+    "GAME_ID",
+    "TEAM_ID",
+    "PERSON_ID",
+    "IN_TIME_REAL",
+    "OUT_TIME_REAL",
+]
+
+
+def rotation(team_id, intervals):
+    return {
+        "headers": ROTATION_HEADERS,
+        "data": [
+            [GAME_ID, team_id, person_id, float(in_time), float(out_time)]
+            for person_id, in_time, out_time in intervals
+        ],
+    }
+
+
+# Two periods. Home player 5 is replaced by 6 with 7:00 left in the first
+# period, during free throws; away player 15 by 16 between periods. Home
+# player 1's time on the floor is split at 5000 without leaving the floor.
+HOME_ROTATION = rotation(
+    HOME_TEAM_ID,
+    [
+        (1, 0, 5000),
+        (1, 5000, 14400),
+        (2, 0, 14400),
+        (3, 0, 14400),
+        (4, 0, 14400),
+        (5, 0, 3000),
+        (6, 3000, 14400),
+    ],
+)
+AWAY_ROTATION = rotation(
+    AWAY_TEAM_ID,
+    [
+        (11, 0, 14400),
+        (12, 0, 14400),
+        (13, 0, 14400),
+        (14, 0, 14400),
+        (15, 0, 7200),
+        (16, 7200, 14400),
+    ],
+)
+
+# (period, clock, home score, away score, action type)
+EVENTS = [
+    (1, "PT12M00.00S", "0", "0", "period"),
+    (1, "PT10M00.00S", "2", "0", "Made Shot"),
+    (1, "PT07M00.00S", "", "", "Foul"),
+    (1, "PT07M00.00S", "3", "0", "Free Throw"),
+    (1, "PT07M00.00S", "", "", "Substitution"),
+    (1, "PT07M00.00S", "4", "0", "Free Throw"),
+    (1, "PT00M00.00S", "4", "3", "Made Shot"),
+    (1, "PT00M00.00S", "", "", "period"),
+    (2, "PT12M00.00S", "", "", "period"),
+    (2, "PT05M00.00S", "4", "5", "Made Shot"),
+    (2, "PT00M00.00S", "", "", "period"),
+]
+
+PLAY_BY_PLAY_V3 = {
+    "headers": ["gameId", "period", "clock", "scoreHome", "scoreAway", "actionType"],
+    "data": [
+        [GAME_ID, period, clock, home, away, action_type]
+        for period, clock, home, away, action_type in EVENTS
+    ],
+}
+
+PLAY_BY_PLAY_V2 = {
+    "headers": ["GAME_ID", "EVENTMSGTYPE", "PERIOD", "PCTIMESTRING", "SCORE"],
+    "data": [
+        [
+            GAME_ID,
+            8 if action_type == "Substitution" else 1,
+            period,
+            f"{clock[2:4].lstrip('0') or '0'}:{clock[5:7]}",
+            f"{away} - {home}" if home else None,
+        ]
+        for period, clock, home, away, action_type in EVENTS
+    ],
+}
+
+
+@pytest.mark.parametrize("play_by_play", [PLAY_BY_PLAY_V3, PLAY_BY_PLAY_V2])
+def test_build_stints(play_by_play):
+    stints = build_stints(HOME_ROTATION, AWAY_ROTATION, play_by_play)
+    assert len(stints) == 3
+    assert list(stints.game_id) == [GAME_ID] * 3
+    assert list(stints.period) == [1, 1, 2]
+    assert list(stints.start_clock) == [720.0, 420.0, 720.0]
+    assert list(stints.end_clock) == [420.0, 0.0, 0.0]
+    assert list(stints.duration) == [300.0, 420.0, 720.0]
+    assert list(stints.home_team_id) == [HOME_TEAM_ID] * 3
+    assert list(stints.away_team_id) == [AWAY_TEAM_ID] * 3
+    assert stints.home_player_ids.tolist() == [
+        [1, 2, 3, 4, 5],
+        [1, 2, 3, 4, 6],
+        [1, 2, 3, 4, 6],
+    ]
+    assert stints.away_player_ids.tolist() == [
+        [11, 12, 13, 14, 15],
+        [11, 12, 13, 14, 15],
+        [11, 12, 13, 14, 16],
+    ]
+    # Free throws at the time of a substitution count for the stint ending
+    # then, as in GameRotation's PT_DIFF.
+    assert list(stints.home_score_start) == [0, 4, 4]
+    assert list(stints.away_score_start) == [0, 0, 3]
+    assert list(stints.home_score_end) == [4, 4, 4]
+    assert list(stints.away_score_end) == [0, 3, 5]
+
+
+def test_build_stints_pads_missing_players():
+    home_rotation = rotation(HOME_TEAM_ID, [(1, 0, 7200), (2, 0, 7200)])
+    stints = build_stints(home_rotation, AWAY_ROTATION, PLAY_BY_PLAY_V3)
+    assert stints.home_player_ids[0].tolist() == [1, 2, 0, 0, 0]
+
+
+def test_build_stints_too_many_players():
+    home_rotation = rotation(
+        HOME_TEAM_ID, [(person_id, 0, 7200) for person_id in range(1, 7)]
+    )
+    with pytest.raises(Exception, match="More than 5 players"):
+        build_stints(home_rotation, AWAY_ROTATION, PLAY_BY_PLAY_V3)
+
+
+def test_build_stints_invalid_clock():
+    play_by_play = {
+        "headers": PLAY_BY_PLAY_V3["headers"],
+        "data": [[GAME_ID, 1, "12 minutes", "0", "0", "period"]],
+    }
+    with pytest.raises(Exception, match="Invalid game clock"):
+        build_stints(HOME_ROTATION, AWAY_ROTATION, play_by_play)
+
+
+def test_periods():
+    assert [get_period_start(period) for period in range(1, 7)] == [
+        0,
+        7200,
+        14400,
+        21600,
+        28800,
+        31800,
+    ]
+    assert get_period_length(4) == 7200
+    assert get_period_length(5) == 3000
+
+
+def test_concatenate_and_lineup_stats():
+    stints = build_stints(HOME_ROTATION, AWAY_ROTATION, PLAY_BY_PLAY_V3)
+    season = StintTable.concatenate([stints, stints])
+    assert len(season) == 6
+    assert len(StintTable.concatenate([])) == 0
+
+    stats = season.get_lineup_stats()
+    lineups = {
+        (team_id, tuple(player_ids)): (stints, seconds, plus_minus)
+        for team_id, player_ids, stints, seconds, plus_minus in zip(
+            stats["team_id"],
+            stats["player_ids"].tolist(),
+            stats["stints"],
+            stats["seconds"],
+            stats["plus_minus"],
+            strict=True,
+        )
+    }
+    assert lineups == {
+        (HOME_TEAM_ID, (1, 2, 3, 4, 5)): (2, 600.0, 8),
+        (HOME_TEAM_ID, (1, 2, 3, 4, 6)): (4, 2280.0, -10),
+        (AWAY_TEAM_ID, (11, 12, 13, 14, 15)): (4, 1440.0, -2),
+        (AWAY_TEAM_ID, (11, 12, 13, 14, 16)): (2, 1440.0, 4),
+    }
+    assert stats["points_for"].sum() == stats["points_against"].sum()
+    assert np.all(stats["plus_minus"] == stats["points_for"] - stats["points_against"])
+
+
+def test_get_data_frame():
+    stints = build_stints(HOME_ROTATION, AWAY_ROTATION, PLAY_BY_PLAY_V3)
+    data_frame = stints.get_data_frame()
+    assert len(data_frame) == 3
+    assert list(data_frame.columns[:6]) == [
+        "GAME_ID",
+        "PERIOD",
+        "START_CLOCK",
+        "END_CLOCK",
+        "HOME_TEAM_ID",
+        "AWAY_TEAM_ID",
+    ]
+    assert list(data_frame["HOME_PLAYER_5_ID"]) == [5, 6, 6]
+    assert list(data_frame["AWAY_SCORE_END"]) == [0, 3, 5]
@@ -1,5 +1,13 @@
+import re
+
 import pytest
 
+from nba_api.stats.library import data
+from nba_api.stats.library.data import (
+    player_index_first_name,
+    player_index_full_name,
+    player_index_last_name,
+)
 from nba_api.stats.static import players
 
 testcases_fullname = [
@@ -121,3 +129,148 @@ def test_findbylastname(lastname):
     print(
         f"Result of find_players_by_full_name('{lastname}'), n={len(result)}: {result}"
     )
+
+
+def scan_players(regex_pattern, row_id, table):
+    return [
+        players._get_player_dict(player)
+        for player in table
+        if re.search(
+            players._strip_accents(regex_pattern),
+            players._strip_accents(str(player[row_id])),
+            flags=re.I,
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern, row_id",
+    [(pattern, player_index_full_name) for pattern in testcases_fullname]
+    + [(pattern, player_index_first_name) for pattern in testcases_firstname]
+    + [(pattern, player_index_last_name) for pattern in testcases_lastname]
+    + [
+        ("^LeBron James$", player_index_full_name),
+        ("^le", player_index_full_name),
+        ("James$", player_index_full_name),
+        ("", player_index_last_name),
+    ],
+)
+def test_indexed_lookup_matches_regex_scan(pattern, row_id):
+    for table in (data.players, data.wnba_players):
+        assert players._find_players(pattern, row_id, players=table) == (
+            scan_players(pattern, row_id, table)
+        )
+
+
+def test_find_player_by_id():
+    assert players.find_player_by_id(2544)["full_name"] == "LeBron James"
+    assert players.find_player_by_id("2544")["full_name"] == "LeBron James"
+    assert players.find_player_by_id(254) is None
+    assert players.find_wnba_player_by_id(2544) is None
+
+
+def test_index_is_rebuilt_when_table_changes():
+    table = [[1, "Smith", "John", "John Smith", False]]
+    assert len(players._find_players("^john", player_index_full_name, table)) == 1
+    table.append([2, "Stockton", "John", "John Stockton", False])
+    assert len(players._find_players("^john", player_index_full_name, table)) == 2
+
+
+@pytest.mark.parametrize(
+    "query, full_name",
+    [
+        ("jokic", "Nikola Jokić"),
+        ("Giannis", "Giannis Antetokounmpo"),
+        ("Shai", "Shai Gilgeous-Alexander"),
+        ("jokcic", "Nikola Jokić"),
+        ("Lebron Jmes", "LeBron James"),
+        ("Gianis Antetokounpo", "Giannis Antetokounmpo"),
+        ("steph curry", "Stephen Curry"),
+        ("DONCIC", "Luka Dončić"),
+        # Nicknames
+        ("King James", "LeBron James"),
+        ("the greek freak", "Giannis Antetokounmpo"),
+        ("SGA", "Shai Gilgeous-Alexander"),
+        # Family name first, in either order
+        ("Yao Ming", "Yao Ming"),
+        ("Ming Yao", "Yao Ming"),
+        # Nicknames in official names
+        ("The Bear", "Paul 'The Bear' Hoffman"),
+        ("Paul Hoffman", "Paul 'The Bear' Hoffman"),
+    ],
+)
+def test_search(query, full_name):
+    assert players.search(query)[0]["full_name"] == full_name
+
+
+def test_search_limit_and_ranking():
+    results = players.search("james", limit=3)
+    assert len(results) == 3
+    # Exact matches of equal score rank active players first.
+    assert all(player["is_active"] for player in results)
+    assert players.search("jokic", limit=0) == []
+    assert players.search("") == []
+    assert players.search("zzzzzz") == []
+
+
+def test_search_wnba():
+    assert players.search_wnba("Stewie")[0]["full_name"] == "Breanna Stewart"
+    assert players.search_wnba("caitlin clark")[0]["full_name"] == "Caitlin Clark"
+
+
+def test_resolve_many():
+    ambiguous = {}
+    names = [
+        "LeBron James",
+        "Dončić, Luka",  # Last name first
+        "NIKOLA JOKIC",
+        "Jimmy Butler",  # Without the suffix of "Jimmy Butler III"
+        "Joker",
+        "Patrick Ewing",  # Father and son
+        "Lebron Jmes",
+        None,
+        "LeBron James",
+    ]
+    assert players.resolve_many(names, ambiguous=ambiguous) == [
+        2544,
+        1629029,
+        203999,
+        202710,
+        203999,
+        None,
+        None,
+        None,
+        2544,
+    ]
+    assert ambiguous == {"Patrick Ewing": [121, 201607]}
+
+
+def test_resolve_many_fuzzy():
+    assert players.resolve_many(["Lebron Jmes", "Gianis Antetokounpo"], fuzzy=True) == [
+        2544,
+        203507,
+    ]
+    # Last names alone are not fuzzy matches of full names.
+    assert players.resolve_many(["John Smith"], fuzzy=True) == [None]
+
+
+def test_resolve_many_prefers_single_active_player():
+    table = [
+        [1, "Smith", "John", "John Smith", False],
+        [2, "Smith", "John", "John Smith", True],
+        [3, "Jones", "Bob", "Bob Jones", False],
+        [4, "Jones", "Bob", "Bob Jones", False],
+    ]
+    ambiguous = {}
+    assert players._resolve_players(
+        ["john smith", "bob jones"], ambiguous=ambiguous, players=table
+    ) == [2, None]
+    assert ambiguous == {"bob jones": [3, 4]}
+
+
+def test_resolve_many_wnba():
+    assert players.resolve_many_wnba(["A'ja Wilson", "Stewie", "LeBron James"]) == [
+        1628932,
+        1627668,
+        None,
+    ]
@@ -1,3 +1,16 @@
+import re
+
+import pytest
+
+from nba_api.stats.library.data import (
+    team_index_abbreviation,
+    team_index_city,
+    team_index_full_name,
+    team_index_id,
+    team_index_nickname,
+    team_index_state,
+    team_index_year_founded,
+)
 from nba_api.stats.static import teams
 
 
@@ -7,3 +20,89 @@ def test_nba_teams():
 
 def test_wnba_teams():
     assert len(teams.wnba_teams) == 13
+
+
+def test_search_teams():
+    assert teams.search("sixers")[0]["full_name"] == "Philadelphia 76ers"
+    assert teams.search("golden state")[0]["full_name"] == "Golden State Warriors"
+    assert teams.search("celtcs")[0]["full_name"] == "Boston Celtics"
+    assert teams.search("okc")[0]["full_name"] == "Oklahoma City Thunder"
+    assert {team["nickname"] for team in teams.search("los angeles")} == {
+        "Clippers",
+        "Lakers",
+    }
+    assert teams.search_wnba("aces")[0]["full_name"] == "Las Vegas Aces"
+
+
+def test_resolve_many_teams():
+    ambiguous = {}
+    assert teams.resolve_many(
+        ["LAL", "bos", "Golden State Warriors", "Sixers", "Los Angeles", "XYZ"],
+        ambiguous=ambiguous,
+    ) == [1610612747, 1610612738, 1610612744, 1610612755, None, None]
+    assert ambiguous == {"Los Angeles": [1610612746, 1610612747]}
+    assert teams.resolve_many(["Minnesota Twolves"], fuzzy=True) == [1610612750]
+    assert teams.resolve_many_wnba(["LVA", "Valks"]) == [1611661319, 1611661331]
+
+
+def scan_teams(regex_pattern, row_id, table):
+    return [
+        teams._get_team_dict(team)
+        for team in table
+        if re.search(regex_pattern, str(team[row_id]), flags=re.I)
+    ]
+
+
+@pytest.mark.parametrize(
+    "row_id",
+    [
+        team_index_id,
+        team_index_abbreviation,
+        team_index_nickname,
+        team_index_city,
+        team_index_full_name,
+        team_index_state,
+        team_index_year_founded,
+    ],
+)
+def test_indexed_lookup_matches_regex_scan(row_id):
+    for table in (teams.teams, teams.wnba_teams):
+        for team in table:
+            for pattern in (f"^{team[row_id]}$", f"^{str(team[row_id]).upper()}$"):
+                assert teams._find_teams(pattern, row_id, teams=table) == (
+                    scan_teams(pattern, row_id, table)
+                )
+        for pattern in ("^missing$", "^$", "an", "^(LAL|LAC)$"):
+            assert teams._find_teams(pattern, row_id, teams=table) == (
+                scan_teams(pattern, row_id, table)
+            )
+
+
+def test_find_team_by_id_and_abbreviation():
+    assert teams.find_team_name_by_id(1610612747)["abbreviation"] == "LAL"
+    assert teams.find_team_name_by_id("1610612747")["abbreviation"] == "LAL"
+    assert teams.find_team_name_by_id(1) is None
+    assert teams.find_team_by_abbreviation("lal")["nickname"] == "Lakers"
+    assert teams.find_team_by_abbreviation("XYZ") is None
+    assert teams.find_wnba_team_by_abbreviation("LVA")["nickname"] == "Aces"
+
+
+def test_find_teams_by_year():
+    assert [team["nickname"] for team in teams.find_teams_by_year_founded(1946)] == [
+        "Celtics",
+        "Warriors",
+        "Knicks",
+    ]
+    assert teams.find_teams_by_year_founded(1800) == []
+    champions = teams.find_teams_by_championship_year(2016)
+    assert [team["nickname"] for team in champions] == ["Cavaliers"]
+    assert teams.find_teams_by_championship_year(1800) == []
+    champions = teams.find_wnba_teams_by_championship_year(2023)
+    assert [team["nickname"] for team in champions] == ["Aces"]
+
+
+def test_index_is_rebuilt_when_table_changes():
+    table = [list(teams.teams[0])]
+    assert len(teams._find_teams_by_year_founded(1949, teams=table)) == 1
+    table.append(list(teams.teams[18]))  # Also founded in 1949
+    assert len(teams._find_teams_by_year_founded(1949, teams=table)) == 2
@@ -0,0 +1,68 @@
+"""Benchmark decoding game clocks and minutes played.
+
+Compares matching a pattern row by row with ``nba_api.library.clock`` on a
+season of clocks and minutes: the ``clock`` column of the recorded
+``PlayByPlayV3`` game and the ``MIN`` column of the recorded
+``BoxScoreTraditionalV2`` game of the integration smoke cassettes, repeated
+once per game of a season.
+
+Usage:
+    python -m tools.benchmarks.clock [--games 1230]
+"""
+
+import argparse
+import re
+import timeit
+
+import numpy as np
+
+from nba_api.library.clock import to_seconds
+from tools.benchmarks.stints import load_data_sets
+
+CLOCK = re.compile(r"^PT(\d+)M(\d+(?:\.\d+)?)S$|^(\d+):(\d+(?:\.\d+)?)$")
+
+
+def match_clocks(values):
+    """Decode ``values`` one by one, as consumers did before."""
+    seconds = []
+    for value in values:
+        if not value:
+            seconds.append(float("nan"))
+            continue
+        match = CLOCK.match(value)
+        minutes, rest = match.group(1, 2) if match.group(1) else match.group(3, 4)
+        seconds.append(int(minutes) * 60 + float(rest))
+    return np.array(seconds)
+
+
+def get_column(data_set, name):
+    index = data_set["headers"].index(name)
+    return [row[index] for row in data_set["data"]]
+
+
+def best_time(function):
+    return min(timeit.repeat(function, number=1, repeat=5))
+
+
+def run(games=1230):
+    play_by_play = load_data_sets("PlayByPlayV3", "playbyplayv3")["PlayByPlay"]
+    box_score = load_data_sets("BoxScoreTraditionalV2")["PlayerStats"]
+    columns = {
+        "clock (PlayByPlayV3)": get_column(play_by_play, "clock") * games,
+        "MIN (BoxScoreTraditionalV2)": get_column(box_score, "MIN") * games,
+    }
+    print(f"{games} x recorded game, best of 5")
+    print(f"{'column':<28} {'rows':>8} {'row by row':>11} {'to_seconds':>11}")
+    for label, values in columns.items():
+        expected = match_clocks(values)
+        np.testing.assert_allclose(to_seconds(values), expected)
+        old = best_time(lambda: match_clocks(values))  # noqa: B023
+        new = best_time(lambda: to_seconds(values))  # noqa: B023
+        print(f"{label:<28} {len(values):>8} {old * 1000:8.1f} ms {new * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1230)
+    args = parser.parse_args()
+    run(games=args.games)
@@ -0,0 +1,63 @@
+"""Benchmark the import time of ``nba_api.stats.endpoints``.
+
+Each statement is timed in a fresh interpreter, and the heavy optional
+dependencies it pulled in are listed.
+
+Usage:
+    python -m tools.benchmarks.import_time [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import nba_api.stats.endpoints",
+    "from nba_api.stats.endpoints import LeagueGameLog",
+    "from nba_api.stats.endpoints import *",
+]
+
+HEAVY_MODULES = ["numpy", "pandas", "pyarrow", "polars", "aiohttp"]
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def time_import(statement, repeat):
+    best = None
+    loaded = ""
+    for _ in range(repeat):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                SCRIPT.format(statement=statement, heavy=HEAVY_MODULES),
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split(" ")
+        elapsed = float(output[0])
+        loaded = output[1].strip()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, loaded
+
+
+def run(repeat=5):
+    print(f"best of {repeat}")
+    for statement in STATEMENTS:
+        elapsed, loaded = time_import(statement, repeat)
+        print(f"{statement:<52} {elapsed * 1000:8.1f} ms  {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(repeat=args.repeat)
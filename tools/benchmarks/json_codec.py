@@ -0,0 +1,71 @@
+"""Benchmark response decoding with each installed JSON backend.
+
+Decodes the recorded payloads of the integration smoke cassettes, as ``str``
+(the previous ``response.text`` path) and as ``bytes`` (``response.content``)
+with every backend in ``nba_api.library.codec.BACKENDS``.
+
+Usage:
+    python -m tools.benchmarks.json_codec [--repeat 5] [--min-size 100000]
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import yaml
+
+from nba_api.library import codec
+
+CASSETTE_DIRECTORY = os.path.join("tests", "integration", "smoke", "cassettes")
+
+
+def load_payloads(directory=CASSETTE_DIRECTORY, min_size=0):
+    payloads = []
+    for file_path in sorted(glob.glob(os.path.join(directory, "*.yaml"))):
+        with open(file_path, encoding="utf-8") as f:
+            cassette = yaml.safe_load(f)
+        for interaction in cassette.get("interactions", []):
+            body = interaction["response"]["body"].get("string")
+            if isinstance(body, str) and len(body) >= min_size:
+                payloads.append(body)
+    return payloads
+
+
+def time_decode(loads, payloads, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            loads(payload)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(repeat=5, min_size=0):
+    payloads = load_payloads(min_size=min_size)
+    if not payloads:
+        print(f"No recorded payloads found in {CASSETTE_DIRECTORY}.")
+        return
+    payloads_bytes = [payload.encode("utf-8") for payload in payloads]
+    total_mb = sum(len(payload) for payload in payloads_bytes) / 1e6
+    print(f"{len(payloads)} payloads, {total_mb:.1f} MB, best of {repeat}")
+
+    baseline = time_decode(codec.BACKENDS["json"], payloads, repeat)
+    for name in sorted(codec.BACKENDS):
+        loads = codec.BACKENDS[name]
+        for label, data in (("str", payloads), ("bytes", payloads_bytes)):
+            elapsed = time_decode(loads, data, repeat)
+            print(
+                f"{name:>8} {label:>5}: {elapsed * 1000:8.1f} ms "
+                f"{total_mb / elapsed:7.1f} MB/s {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-size", type=int, default=0)
+    args = parser.parse_args()
+    run(repeat=args.repeat, min_size=args.min_size)
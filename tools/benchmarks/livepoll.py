@@ -0,0 +1,150 @@
+"""Benchmark polling live play-by-play.
+
+Replays games growing action by action, served by an in-process session that
+honors ``If-None-Match``, and polls them either by creating
+``live.nba.endpoints.PlayByPlay`` and diffing its actions, without
+validators (a full download and decode per poll) or with a
+``ValidatorStore`` attached to ``NBALiveHTTP``, or with ``PlayByPlayPoller``
+and its own store. Reports
+the CPU time and the bytes received for the whole replay.
+
+The games are the actions of the recorded ``PlayByPlayV3`` smoke cassette,
+whose ``game.actions`` have the shape of the live feed, renumbered (V3
+repeats ``actionNumber``) and with ``orderNumber`` and ``edited`` added. The
+default 3000 polls are a poll every 3 seconds of a game of two and a half
+hours.
+
+Usage:
+    python -m tools.benchmarks.livepoll [--games 15] [--polls 3000]
+"""
+
+import argparse
+import json
+import os
+import time
+
+import yaml
+
+from nba_api.library.conditional import ValidatorStore
+from nba_api.live.nba.endpoints import PlayByPlay
+from nba_api.live.nba.library.http import NBALiveHTTP
+from nba_api.live.nba.library.poller import PlayByPlayPoller
+from tools.benchmarks.json_codec import CASSETTE_DIRECTORY
+
+CASSETTE = os.path.join(CASSETTE_DIRECTORY, "test_endpoints[PlayByPlayV3].yaml")
+
+
+def load_actions(path=CASSETTE):
+    with open(path, encoding="utf-8") as f:
+        cassette = yaml.safe_load(f)
+    body = json.loads(cassette["interactions"][0]["response"]["body"]["string"])
+    actions = body["game"]["actions"]
+    for index, action in enumerate(actions):
+        action["actionNumber"] = index + 1
+        action["orderNumber"] = index * 10000
+        action["edited"] = f"2021-01-16T00:{index // 60 % 60:02d}:{index % 60:02d}Z"
+    return actions
+
+
+class Response:
+    def __init__(self, url, status_code, content, headers):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+
+class ReplaySession:
+    """Serves each game with ``published`` actions, honoring ``If-None-Match``."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.published = {}
+        self.received = 0
+
+    def get(self, url, params=None, headers=None, proxies=None, timeout=None):
+        count = self.published[url]
+        etag = f'"{count}"'
+        if headers and headers.get("If-None-Match") == etag:
+            return Response(url, 304, b"", {})
+        content = self.bodies[count]
+        self.received += len(content)
+        return Response(url, 200, content, {"ETag": etag})
+
+
+def replay(session, game_ids, actions, polls, poll):
+    urls = [
+        NBALiveHTTP.base_url.format(
+            endpoint=PlayByPlay.endpoint_url.format(game_id=game_id)
+        )
+        for game_id in game_ids
+    ]
+    received = 0
+    start = time.process_time()
+    for index in range(polls):
+        # The games advance together, reaching their last action on the
+        # last poll.
+        published = 1 + (len(actions) - 1) * index // max(polls - 1, 1)
+        for url in urls:
+            session.published[url] = published
+        received += poll()
+    elapsed = time.process_time() - start
+    return elapsed, received
+
+
+def run(games=15, polls=3000):
+    actions = load_actions()
+    bodies = {
+        count: json.dumps(
+            {"game": {"gameId": "0022000180", "actions": actions[:count]}}
+        ).encode()
+        for count in range(1, len(actions) + 1)
+    }
+    game_ids = [f"00220001{index:02d}" for index in range(games)]
+    session = ReplaySession(bodies)
+    NBALiveHTTP.set_session(session)
+
+    seen = {game_id: {} for game_id in game_ids}
+
+    def poll_endpoints():
+        count = 0
+        for game_id in game_ids:
+            for action in PlayByPlay(game_id).actions.get_dict():
+                number = action["actionNumber"]
+                if seen[game_id].get(number) != action["edited"]:
+                    seen[game_id][number] = action["edited"]
+                    count += 1
+        return count
+
+    poller = PlayByPlayPoller(game_ids)
+
+    def poll_poller():
+        return sum(1 for _ in poller.poll())
+
+    variants = (
+        ("PlayByPlay", None, poll_endpoints),
+        ("validators", ValidatorStore(), poll_endpoints),
+        ("poller", None, poll_poller),
+    )
+    validator_store = NBALiveHTTP.get_validator_store()
+    print(f"{games} games x {polls} polls, {len(actions)} actions per game")
+    for label, store, poll in variants:
+        NBALiveHTTP.set_validator_store(store)
+        for game_seen in seen.values():
+            game_seen.clear()
+        session.received = 0
+        elapsed, count = replay(session, game_ids, actions, polls, poll)
+        print(
+            f"{label:<12} {elapsed:6.2f} s CPU  {session.received / 1e6:8.1f} MB "
+            f"received  {count} actions"
+        )
+    NBALiveHTTP.set_session(None)
+    NBALiveHTTP.set_validator_store(validator_store)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--polls", type=int, default=3000)
+    args = parser.parse_args()
+    run(games=args.games, polls=args.polls)
@@ -0,0 +1,302 @@
+"""Benchmark watching a night of live games.
+
+Simulates a slate of games on a virtual clock: each game is published
+action by action from tip-off to final, with timeouts, breaks between
+periods and halftime, and the scoreboard follows their status. The games
+are watched either by polling the scoreboard and the play-by-play of every
+game at a fixed interval, as hand-rolled loops do, or with ``LiveWatcher``.
+Reports the requests sent, the ``304 Not Modified`` among them, and the
+delay between the publication of an action and its detection.
+
+The fixed interval is run twice: at the live interval of the watcher, and
+at the interval that sends as many requests as the watcher.
+
+Usage:
+    python -m tools.benchmarks.livewatch [--games 10] [--seed 0]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import selectors
+import statistics
+import time
+from datetime import datetime, timezone
+
+from nba_api.library.conditional import ValidatorStore
+from nba_api.live.nba.endpoints import PlayByPlay, ScoreBoard
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP, NBALiveHTTP
+from nba_api.live.nba.library.poller import GameState
+from nba_api.live.nba.library.watcher import LiveWatcher, PollSchedule
+
+BASE_URL = NBALiveHTTP.base_url
+SCOREBOARD_URL = BASE_URL.format(endpoint=ScoreBoard.endpoint_url)
+
+# Seconds of real time per period, between periods and at halftime.
+PERIOD = 30 * 60
+PERIOD_BREAK = 130
+HALFTIME = 15 * 60
+TIMEOUT = 90
+
+
+class VirtualSelector(selectors.DefaultSelector):
+    """Advances the clock instead of waiting for the next timer."""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def select(self, timeout=None):
+        ready = super().select(0)
+        if not ready and timeout:
+            self.clock[0] += timeout
+        return ready
+
+
+class VirtualLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        self.clock = [0.0]
+        super().__init__(VirtualSelector(self.clock))
+
+    def time(self):
+        return self.clock[0]
+
+
+class Game:
+    """Timeline of a simulated game."""
+
+    def __init__(self, game_id, tip_off, rng):
+        self.game_id = game_id
+        self.tip_off = tip_off
+        self.actions = []
+        # (start, text) of the scoreboard status text, in order.
+        self.texts = []
+        now = tip_off
+        for period in range(1, 5):
+            self.add(now, period, "period", "start")
+            self.texts.append((now, f"Q{period}"))
+            end = now + PERIOD
+            while now < end:
+                now += rng.expovariate(1 / 20)
+                if rng.random() < 0.04:
+                    self.add(now, period, "timeout", "full")
+                    now += TIMEOUT
+                else:
+                    self.add(now, period, "2pt", "jump-shot")
+            self.add(now, period, "period", "end")
+            if period == 2:
+                self.texts.append((now, "Half"))
+                now += HALFTIME
+            elif period < 4:
+                self.texts.append((now, f"End Q{period}"))
+                now += PERIOD_BREAK
+        self.final = now + 60
+        self.bodies = {}
+
+    def add(self, published, period, action_type, sub_type):
+        number = len(self.actions) + 1
+        self.actions.append(
+            {
+                "actionNumber": number,
+                "orderNumber": number * 10000,
+                "actionType": action_type,
+                "subType": sub_type,
+                "period": period,
+                "edited": f"{published:.3f}",
+                "published": published,
+            }
+        )
+
+    def get_status(self, now):
+        if now < self.tip_off:
+            return 1, "7:30 pm ET", 0
+        if now >= self.final:
+            return 3, "Final", 4
+        text = [text for start, text in self.texts if start <= now][-1]
+        period = max(
+            (a["period"] for a in self.actions if a["published"] <= now), default=1
+        )
+        return 2, text, period
+
+    def get_body(self, now):
+        count = sum(1 for action in self.actions if action["published"] <= now)
+        body = self.bodies.get(count)
+        if body is None:
+            body = self.bodies[count] = json.dumps(
+                {"game": {"gameId": self.game_id, "actions": self.actions[:count]}}
+            ).encode()
+        return count, body
+
+
+class Response:
+    def __init__(self, url, status, body=b"", headers=None):
+        self.url = url
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class SlateSession:
+    """Serves the scoreboard and play-by-play of ``games`` at the time of
+    the loop, honoring ``If-None-Match``."""
+
+    closed = False
+
+    def __init__(self, games, loop):
+        self.games = {
+            BASE_URL.format(
+                endpoint=PlayByPlay.endpoint_url.format(game_id=g.game_id)
+            ): g
+            for g in games
+        }
+        self.loop = loop
+        self.requests = 0
+        self.not_modified = 0
+        # Real time of virtual time 0, for gameTimeUTC.
+        self.epoch = time.time()
+
+    def get(self, url, params=None, headers=None, proxy=None, timeout=None):
+        self.requests += 1
+        now = self.loop.time()
+        if url == SCOREBOARD_URL:
+            etag = None
+            body = json.dumps({"scoreboard": {"games": self.get_games(now)}}).encode()
+        else:
+            game = self.games[url]
+            if now < game.tip_off:
+                return Response(url, 403)
+            count, body = game.get_body(now)
+            etag = f'"{count}"'
+            if headers.get("If-None-Match") == etag:
+                self.not_modified += 1
+                return Response(url, 304, headers={"ETag": etag})
+        return Response(url, 200, body, {"ETag": etag} if etag else {})
+
+    def get_games(self, now):
+        games = []
+        for game in self.games.values():
+            status, text, period = game.get_status(now)
+            tip_off = datetime.fromtimestamp(self.epoch + game.tip_off, timezone.utc)
+            games.append(
+                {
+                    "gameId": game.game_id,
+                    "gameStatus": status,
+                    "gameStatusText": text,
+                    "period": period,
+                    "gameTimeUTC": tip_off.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+            )
+        return games
+
+
+async def watch_fixed(interval, delays):
+    """Poll the scoreboard and every game every ``interval`` seconds."""
+    loop = asyncio.get_running_loop()
+    http = AsyncNBALiveHTTP()
+    # Conditional requests, as with the watcher.
+    store = ValidatorStore()
+    states = {}
+    while True:
+        response = await http.send_api_request(
+            ScoreBoard.endpoint_url, {}, validator_store=store
+        )
+        games = response.get_dict()["scoreboard"]["games"]
+        for game in games:
+            states.setdefault(game["gameId"], GameState(game["gameId"]))
+        game_ids = list(states)
+        responses = await asyncio.gather(
+            *(
+                http.send_api_request(
+                    PlayByPlay.endpoint_url.format(game_id=g),
+                    {},
+                    validator_store=store,
+                )
+                for g in game_ids
+            )
+        )
+        for game_id, response in zip(game_ids, responses, strict=True):
+            if response.get_status_code() != 200:
+                continue
+            for action in states[game_id].update(
+                response.get_dict()["game"]["actions"]
+            ):
+                delays.append(loop.time() - action["published"])
+        if all(game["gameStatus"] == 3 for game in games):
+            return
+        await asyncio.sleep(interval)
+
+
+async def watch_adaptive(schedule, delays):
+    loop = asyncio.get_running_loop()
+    async for _, action in LiveWatcher(schedule=schedule).watch():
+        delays.append(loop.time() - action["published"])
+
+
+def simulate(games, watch, *args):
+    loop = VirtualLoop()
+    session = SlateSession(games, loop)
+    AsyncNBALiveHTTP.set_session(session)
+    delays = []
+    start = time.process_time()
+    try:
+        loop.run_until_complete(watch(*args, delays))
+    finally:
+        loop.close()
+    elapsed = time.process_time() - start
+    return session, delays, elapsed
+
+
+def report(label, games, session, delays, elapsed):
+    actions = sum(len(game.actions) for game in games)
+    assert len(delays) == actions, (len(delays), actions)
+    delays = sorted(delays)
+    p95 = delays[int(len(delays) * 0.95)]
+    print(
+        f"{label:<22} {session.requests:>8} {session.not_modified:>8} "
+        f"{statistics.mean(delays):8.2f} s {p95:7.2f} s {delays[-1]:7.2f} s "
+        f"{elapsed:6.2f} s"
+    )
+
+
+def run(games=10, seed=0):
+    rng = random.Random(seed)
+    # Tip-offs staggered over three hours, starting an hour into the watch.
+    slate = [
+        Game(f"00220001{index:02d}", 3600 + rng.choice(range(0, 3 * 3600, 1800)), rng)
+        for index in range(games)
+    ]
+    schedule = PollSchedule()
+
+    print(f"{games} games, {sum(len(g.actions) for g in slate)} actions")
+    print(
+        f"{'':<22} {'requests':>8} {'304':>8} {'mean delay':>10} "
+        f"{'p95':>9} {'max':>9} {'CPU':>8}"
+    )
+    watcher = simulate(slate, watch_adaptive, schedule)
+    fixed = simulate(slate, watch_fixed, schedule.live)
+    # The interval that sends as many requests as the watcher.
+    same_budget = schedule.live * fixed[0].requests / watcher[0].requests
+    budget = simulate(slate, watch_fixed, same_budget)
+    report(f"fixed {schedule.live:g} s", slate, *fixed)
+    report(f"fixed {same_budget:.1f} s", slate, *budget)
+    report("LiveWatcher", slate, *watcher)
+
+    AsyncNBALiveHTTP.set_session(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(games=args.games, seed=args.seed)
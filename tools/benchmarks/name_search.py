@@ -0,0 +1,74 @@
+"""Benchmark fuzzy player and team name search and batch resolution.
+
+Times building the search indexes, searching typical queries and resolving
+every player name of the static table in one batch.
+
+Usage:
+    python -m tools.benchmarks.name_search [--number 1000]
+"""
+
+import argparse
+import time
+import timeit
+
+from nba_api.stats.library import data
+from nba_api.stats.static import players, teams
+
+PLAYER_QUERIES = [
+    "jokic",
+    "Giannis",
+    "Shai",
+    "Lebron Jmes",
+    "steph curry",
+    "Gianis Antetokounpo",
+    "King James",
+    "james",
+]
+
+TEAM_QUERIES = ["sixers", "golden state", "celtcs", "los angeles"]
+
+
+def run(number=1000):
+    table = data.players  # Decode the player tables outside of the timings.
+    start = time.perf_counter()
+    players.search("")
+    players._get_index(table).get_search_index(data.player_nicknames)
+    print(f"{'player index build':<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    start = time.perf_counter()
+    teams.search("")
+    teams._get_index(teams.teams).get_search_index(data.team_nicknames)
+    print(f"{'team index build':<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    print(f"per query, best of 5 x {number}")
+    for search, queries in (
+        (players.search, PLAYER_QUERIES),
+        (teams.search, TEAM_QUERIES),
+    ):
+        for query in queries:
+            best = min(
+                timeit.repeat(lambda: search(query), number=number, repeat=5)  # noqa: B023
+            )
+            top = search(query, limit=1)
+            name = top[0]["full_name"] if top else "-"
+            print(f"{query!r:<28} {best / number * 1e6:8.1f} us  {name}")
+
+    names = [player[3] for player in table]
+    for fuzzy in (False, True):
+        # Fuzzy matching only runs for names without an exact match.
+        batch = names + [name.upper() + "x" for name in names[:100]]
+        players.resolve_many(batch, fuzzy=fuzzy)
+        start = time.perf_counter()
+        ids = players.resolve_many(batch, fuzzy=fuzzy)
+        elapsed = time.perf_counter() - start
+        resolved = sum(player_id is not None for player_id in ids)
+        print(
+            f"{f'resolve_many(fuzzy={fuzzy})':<28} {elapsed * 1000:8.1f} ms  "
+            f"{len(batch)} names, {resolved} resolved"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+    run(number=args.number)
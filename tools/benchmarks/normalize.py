@@ -0,0 +1,52 @@
+"""Benchmark ``NBAStatsResponse`` normalization modes on recorded payloads.
+
+Usage:
+    python -m tools.benchmarks.normalize [--repeat 5] [--min-size 100000]
+"""
+
+import argparse
+import time
+
+from nba_api.stats.library.http import NBAStatsResponse
+from tools.benchmarks.json_codec import load_payloads
+
+
+def time_normalize(responses, normalize, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for response in responses:
+            normalize(response)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(repeat=5, min_size=0):
+    responses = []
+    for payload in load_payloads(min_size=min_size):
+        response = NBAStatsResponse(payload, 200, None)
+        try:
+            if response.get_normalized_dict():
+                responses.append(response)
+        except (TypeError, ValueError, KeyError):
+            # Not tabular, or multi-level headers which cannot be normalized.
+            continue
+    print(f"{len(responses)} tabular payloads, best of {repeat}")
+
+    modes = {
+        "rows": lambda response: response.get_normalized_dict(),
+        "columnar": lambda response: response.get_normalized_dict(columnar=True),
+        "iter rows": lambda response: sum(1 for _ in response.iter_normalized_rows()),
+    }
+    for label, normalize in modes.items():
+        elapsed = time_normalize(responses, normalize, repeat)
+        print(f"{label:>10}: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-size", type=int, default=0)
+    args = parser.parse_args()
+    run(repeat=args.repeat, min_size=args.min_size)
@@ -0,0 +1,168 @@
+"""Benchmark play-by-play description parsing.
+
+Compares trying the patterns of ``eventmsgtype_to_re`` in turn with
+``parse_descriptions``, given row dictionaries or the data set itself, on a
+recorded game, and on adversarial descriptions of growing length that make
+the player foul, free throw and jump ball patterns backtrack.
+
+``PlayByPlayV2`` no longer returns data, so the game is the recorded
+``PlayByPlayV3`` smoke cassette, whose descriptions have the V2 format,
+converted to V2 rows.
+
+Usage:
+    python -m tools.benchmarks.playbyplay [--number 20] [--games 10]
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+import yaml
+
+from nba_api.stats.library.eventmsgtype import EventMsgType
+from nba_api.stats.library.playbyplayparser import (
+    DESCRIPTION_COLUMNS,
+    INTEGER_FIELDS,
+    parse_description,
+    parse_descriptions,
+)
+from nba_api.stats.library.playbyplayregex import eventmsgtype_to_re
+from tools.benchmarks.json_codec import CASSETTE_DIRECTORY
+
+CASSETTE = os.path.join(CASSETTE_DIRECTORY, "test_endpoints[PlayByPlayV3].yaml")
+
+ACTION_TYPES = {
+    "Made Shot": EventMsgType.FIELD_GOAL_MADE,
+    "Missed Shot": EventMsgType.FIELD_GOAL_MISSED,
+    "Free Throw": EventMsgType.FREE_THROW,
+    "Rebound": EventMsgType.REBOUND,
+    "Turnover": EventMsgType.TURNOVER,
+    "Foul": EventMsgType.FOUL,
+    "Violation": EventMsgType.VIOLATION,
+    "Substitution": EventMsgType.SUBSTITUTION,
+    "Timeout": EventMsgType.TIMEOUT,
+    "Jump Ball": EventMsgType.JUMP_BALL,
+    "Ejection": EventMsgType.EJECTION,
+    "period": EventMsgType.PERIOD_BEGIN,
+}
+
+LOCATIONS = {"h": "HOMEDESCRIPTION", "v": "VISITORDESCRIPTION"}
+
+# Descriptions of ``length`` repetitions that none of the patterns match.
+ADVERSARIAL = {
+    "foul": (EventMsgType.FOUL, lambda length: "A " * length + "(P1.T2"),
+    "free throw made": (
+        EventMsgType.FREE_THROW,
+        lambda length: "A" + " Free Throw 1 of 2" * length + " (1 PTS",
+    ),
+    "free throw miss": (
+        EventMsgType.FREE_THROW,
+        lambda length: "MISS A" + " Free Throw x" * length + " y!",
+    ),
+    "jump ball": (
+        EventMsgType.JUMP_BALL,
+        lambda length: "Jump Ball " + "a vs. " * length,
+    ),
+}
+
+
+def load_game(path=CASSETTE):
+    """Return the recorded game's actions as ``PlayByPlayV2`` rows."""
+    with open(path, encoding="utf-8") as f:
+        cassette = yaml.safe_load(f)
+    body = json.loads(cassette["interactions"][0]["response"]["body"]["string"])
+    rows = []
+    for action in body["game"]["actions"]:
+        event_msg_type = ACTION_TYPES.get(action["actionType"])
+        if event_msg_type is None:
+            # Steals and blocks are separate V3 actions without a type.
+            if "STEAL" in action["description"]:
+                event_msg_type = EventMsgType.TURNOVER
+            elif "BLOCK" in action["description"]:
+                event_msg_type = EventMsgType.FIELD_GOAL_MISSED
+            else:
+                continue
+        row = {"EVENTNUM": action["actionNumber"], "EVENTMSGTYPE": event_msg_type.value}
+        for column, _ in DESCRIPTION_COLUMNS:
+            row[column] = None
+        row[LOCATIONS.get(action["location"], "NEUTRALDESCRIPTION")] = action[
+            "description"
+        ]
+        rows.append(row)
+    return rows
+
+
+def match_patterns(event_msg_type, description, typed=False):
+    """Try the patterns of ``eventmsgtype_to_re`` in turn."""
+    for regex in eventmsgtype_to_re.get(event_msg_type, ()):
+        match = regex.match(description)
+        if match:
+            groups = match.groupdict()
+            if typed:
+                # The fields of parse_descriptions, for the same output.
+                for name, value in groups.items():
+                    if name in INTEGER_FIELDS and value is not None:
+                        groups[name] = int(value)
+            return groups
+    return None
+
+
+def match_game(rows, typed=False):
+    event_msg_types = {
+        event_msg_type.value: event_msg_type for event_msg_type in eventmsgtype_to_re
+    }
+    return [
+        match_patterns(event_msg_types.get(row["EVENTMSGTYPE"]), row[column], typed)
+        for row in rows
+        for column, _ in DESCRIPTION_COLUMNS
+        if row[column]
+    ]
+
+
+def best_time(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def run(number=20, games=10):
+    rows = load_game() * games
+    headers = list(rows[0])
+    data_set = {"headers": headers, "data": [list(row.values()) for row in rows]}
+    descriptions = sum(
+        1 for row in rows for column, _ in DESCRIPTION_COLUMNS if row[column]
+    )
+    print(f"{games} x recorded game, {descriptions} descriptions, best of 5")
+    for label, function in (
+        ("eventmsgtype_to_re", lambda: match_game(rows)),
+        ("  + int fields", lambda: match_game(rows, typed=True)),
+        ("parse_descriptions", lambda: parse_descriptions(rows)),
+        ("  data set", lambda: parse_descriptions(data_set)),
+    ):
+        elapsed = best_time(function, number)
+        print(f"{label:<20} {elapsed * 1000:8.2f} ms")
+
+    print("adversarial descriptions (no match), per description")
+    print(f"{'shape':<16} {'length':>7} {'eventmsgtype_to_re':>20} {'parser':>10}")
+    for label, (event_msg_type, build) in ADVERSARIAL.items():
+        for length in (250, 500, 1000, 2000):
+            description = build(length)
+            old = best_time(
+                lambda: match_patterns(event_msg_type, description),  # noqa: B023
+                1,
+            )
+            new = best_time(
+                lambda: parse_description(event_msg_type, description),  # noqa: B023
+                number,
+            )
+            print(
+                f"{label:<16} {len(description):>7} {old * 1000:17.2f} ms "
+                f"{new * 1e6:7.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--games", type=int, default=10)
+    args = parser.parse_args()
+    run(number=args.number, games=args.games)
@@ -0,0 +1,83 @@
+"""Benchmark building lineup stints for a season of games.
+
+Builds the stints of the recorded ``GameRotation`` / ``PlayByPlayV3`` game
+of the integration smoke cassettes as many times as there are games in a
+season, then aggregates lineup plus-minus over all of them. Also checks the
+stints against the ``PT_DIFF`` of every rotation row.
+
+Usage:
+    python -m tools.benchmarks.stints [--games 1230]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import yaml
+
+from nba_api.stats.library.http import NBAStatsResponse
+from nba_api.stats.library.stints import StintTable, build_stints, get_period_start
+from tools.benchmarks.json_codec import CASSETTE_DIRECTORY
+
+
+def load_data_sets(name, endpoint=None):
+    path = os.path.join(CASSETTE_DIRECTORY, f"test_endpoints[{name}].yaml")
+    with open(path, encoding="utf-8") as f:
+        cassette = yaml.safe_load(f)
+    body = cassette["interactions"][0]["response"]["body"]["string"]
+    response = NBAStatsResponse(body, 200, None)
+    if endpoint is None:
+        return response.get_data_sets()
+    return response.get_data_sets(endpoint)
+
+
+def check_plus_minus(stints, rotation):
+    """Return the number of rotation rows whose ``PT_DIFF`` matches the
+    stints, and the number of rows."""
+    period_ends = np.array([get_period_start(period + 1) for period in stints.period])
+    starts = period_ends - np.round(stints.start_clock * 10)
+    ends = period_ends - np.round(stints.end_clock * 10)
+    home_margin = (stints.home_score_end - stints.home_score_start) - (
+        stints.away_score_end - stints.away_score_start
+    )
+    matches = rows = 0
+    for name, sign in (("HomeTeam", 1), ("AwayTeam", -1)):
+        headers = rotation[name]["headers"]
+        for row in rotation[name]["data"]:
+            row = dict(zip(headers, row, strict=True))
+            covered = (starts >= row["IN_TIME_REAL"]) & (ends <= row["OUT_TIME_REAL"])
+            rows += 1
+            matches += sign * home_margin[covered].sum() == row["PT_DIFF"]
+    return matches, rows
+
+
+def run(games=1230):
+    rotation = load_data_sets("GameRotation")
+    play_by_play = load_data_sets("PlayByPlayV3", "playbyplayv3")["PlayByPlay"]
+    home, away = rotation["HomeTeam"], rotation["AwayTeam"]
+
+    stints = build_stints(home, away, play_by_play)
+    matches, rows = check_plus_minus(stints, rotation)
+    print(f"1 game: {len(stints)} stints, PT_DIFF matches {matches}/{rows} rows")
+
+    start = time.perf_counter()
+    season = StintTable.concatenate(
+        build_stints(home, away, play_by_play) for _ in range(games)
+    )
+    built = time.perf_counter() - start
+    print(f"{games} games: {len(season)} stints in {built:.2f} s")
+
+    start = time.perf_counter()
+    lineups = season.get_lineup_stats()
+    aggregated = time.perf_counter() - start
+    print(
+        f"lineup stats: {len(lineups['team_id'])} lineups in {aggregated * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1230)
+    args = parser.parse_args()
+    run(games=args.games)
@@ -7,11 +7,12 @@ class {endpoint}(Endpoint):
     expected_data = {data_sets}
 
     nba_response = None
-    data_sets = None
     player_stats = None
     team_stats = None
     headers = None
 
+{data_set_variables}
+
     def __init__(self,
 {arguments},
                  proxy=None,
@@ -39,14 +40,10 @@ class {endpoint}(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-{data_set_variables}
+        self.load_data_sets(self.nba_response.get_data_sets())
 """
 
-data_set_template = (
-    """        self.{variable_name} = Endpoint.DataSet(data=data_sets['{key_name}'])"""
-)
+data_set_template = """    {variable_name} = Endpoint.LazyDataSet('{key_name}')"""
 
 imports_template = """\nfrom nba_api.stats.library.parameters import {imports_list}"""
 